@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Measure gobby CLI cold-start import time and fail past a budget.
+
+Runs each case in a fresh interpreter with ``python -X importtime`` and sums
+the cumulative time of top-level imports that a bare interpreter doesn't
+already perform. Exits 1 if any case exceeds its budget, listing the slowest
+imports so the regression is easy to find.
+
+Usage:
+    uv run python scripts/bench_cli_importtime.py [--repeat 5] [--scale 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess  # nosec B404
+import sys
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+# name -> (python code, budget in ms)
+CASES: dict[str, tuple[str, float]] = {
+    "import gobby.cli": ("import gobby.cli", 250.0),
+    "gobby --help": (
+        "import sys; sys.argv = ['gobby', '--help']; from gobby.cli import cli; cli()",
+        250.0,
+    ),
+    "gobby tasks --help": (
+        "import sys; sys.argv = ['gobby', 'tasks', '--help']; from gobby.cli import cli; cli()",
+        1500.0,
+    ),
+}
+
+
+def _imports(code: str) -> dict[str, tuple[int, int]]:
+    """Return {module: (self_us, cumulative_us)} for top-level imports."""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"{code!r} failed:\n{result.stderr[-2000:]}")
+    modules: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match and not match.group(3):
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def measure(code: str, baseline: set[str]) -> tuple[float, list[tuple[str, float]]]:
+    """Return (total ms, [(module, ms), ...] slowest first) for ``code``."""
+    modules = {name: times for name, times in _imports(code).items() if name not in baseline}
+    slowest = sorted(
+        ((name, cumulative / 1000) for name, (_, cumulative) in modules.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return sum(ms for _, ms in slowest), slowest
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (minimum is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget")
+    args = parser.parse_args(argv)
+
+    baseline = set(_imports("pass"))
+    failed = False
+    for name, (code, budget) in CASES.items():
+        runs = [measure(code, baseline) for _ in range(args.repeat)]
+        total, slowest = min(runs, key=lambda run: run[0])
+        limit = budget * args.scale
+        verdict = "ok" if total <= limit else "OVER BUDGET"
+        print(f"{name:<22} {total:8.1f} ms  (budget {limit:.0f} ms)  {verdict}")
+        if total > limit:
+            failed = True
+            for module, ms in slowest[:8]:
+                print(f"    {ms:8.1f} ms  {module}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
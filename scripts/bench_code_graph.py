@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Benchmark call-graph queries: SQLite CSR graph vs recursive SQL vs Neo4j.
+
+Generates a synthetic repository in a temporary database (--files files of
+--functions functions, each making --calls calls to random functions, some
+to unindexed library names) the way gcode writes it, then times:
+
+- load:     LocalCodeGraph cold load of the project
+- callers:  find_callers at depth 1 and --depth
+- callees:  find_callees at --depth
+- blast:    find_blast_radius for a file at --depth
+- refresh:  first query after re-indexing --reindex files (incremental patch)
+- sql:      the callers walk as a recursive CTE over code_calls/code_symbols
+            (before the re-index, so result counts match the graph's)
+
+With --neo4j-url the same fixture is written to Neo4j through
+CodeGraph.add_relationships and the caller/callee/blast queries are timed
+against it too.
+
+Usage:
+    uv run python scripts/bench_code_graph.py [--files 2000] [--functions 20] [--calls 4]
+    uv run python scripts/bench_code_graph.py --files 200 --neo4j-url http://localhost:7474
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from gobby.code_index.graph import CodeGraph
+from gobby.code_index.local_graph import LocalCodeGraph
+from gobby.code_index.models import CallRelation, ImportRelation, IndexedFile, Symbol
+from gobby.code_index.storage import CodeIndexStorage
+from gobby.storage.database import LocalDatabase
+from gobby.storage.migrations import run_migrations
+
+PROJECT = "bench-project"
+LIBRARY_CALLS = ["print", "len", "isinstance", "logger.debug", "json.dumps"]
+
+SQL_CALLERS = """
+WITH RECURSIVE walk(name, distance) AS (
+    SELECT ?, 0
+    UNION
+    SELECT s.name, w.distance + 1
+    FROM walk w
+    JOIN code_calls c ON c.project_id = ? AND c.callee_name = w.name
+    JOIN code_symbols s ON s.id = c.caller_symbol_id
+    WHERE w.distance < ?
+)
+SELECT name, min(distance) AS distance FROM walk WHERE distance > 0 GROUP BY name
+"""
+
+
+def _file_path(i: int) -> str:
+    return f"pkg/mod_{i // 50}/file_{i}.py"
+
+
+def _index_file(
+    storage: CodeIndexStorage,
+    rng: random.Random,
+    file_idx: int,
+    args: argparse.Namespace,
+    revision: str = "v1",
+) -> None:
+    path = _file_path(file_idx)
+    symbols = [
+        Symbol(
+            id=Symbol.make_id(PROJECT, path, f"fn_{file_idx}_{j}", "function", j * 200),
+            project_id=PROJECT,
+            file_path=path,
+            name=f"fn_{file_idx}_{j}",
+            qualified_name=f"fn_{file_idx}_{j}",
+            kind="function",
+            language="python",
+            byte_start=j * 200,
+            byte_end=j * 200 + 150,
+            line_start=j * 10 + 1,
+            line_end=j * 10 + 8,
+        )
+        for j in range(args.functions)
+    ]
+    calls = []
+    for sym in symbols:
+        for k in range(args.calls):
+            if rng.random() < 0.2:
+                callee = rng.choice(LIBRARY_CALLS)
+            else:
+                callee = f"fn_{rng.randrange(args.files)}_{rng.randrange(args.functions)}"
+            calls.append(CallRelation(sym.id, callee, path, sym.line_start + 1 + k))
+    imports = [
+        ImportRelation(path, f"pkg.mod_{rng.randrange(max(1, args.files // 50))}") for _ in range(3)
+    ]
+
+    storage.delete_symbols_for_file(PROJECT, path)
+    storage.upsert_symbols(symbols)
+    storage.upsert_calls(PROJECT, path, calls)
+    storage.upsert_imports(PROJECT, path, imports)
+    storage.upsert_file(
+        IndexedFile(
+            id=IndexedFile.make_id(PROJECT, path),
+            project_id=PROJECT,
+            file_path=path,
+            language="python",
+            content_hash=f"{revision}-{file_idx}",
+        )
+    )
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+async def _time_async(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def _row(label: str, ms: float, count: int | None = None) -> None:
+    suffix = "" if count is None else f"  ({count} results)"
+    print(f"  {label:<28} {ms:10.2f} ms{suffix}")
+
+
+async def _bench_neo4j(
+    url: str, auth: str | None, storage: CodeIndexStorage, args: argparse.Namespace, target: str
+) -> None:
+    from gobby.memory.neo4j_client import Neo4jClient
+
+    client = Neo4jClient(url, auth=auth)
+    graph = CodeGraph(neo4j_client=client)
+    try:
+        await graph.clear_project(PROJECT)
+        start = time.perf_counter()
+        for i in range(args.files):
+            path = _file_path(i)
+            symbols = storage.get_symbols_for_file(PROJECT, path)
+            await graph.add_relationships(
+                project_id=PROJECT,
+                file_path=path,
+                imports=storage.get_imports_for_file(PROJECT, path),
+                calls=storage.get_calls_for_file(PROJECT, path),
+                contains=[
+                    {"id": s.id, "name": s.name, "kind": s.kind, "line_start": s.line_start}
+                    for s in symbols
+                ],
+            )
+        print(f"neo4j ({url})")
+        _row("load (add_relationships)", (time.perf_counter() - start) * 1000)
+
+        ms, res = await _time_async(lambda: graph.find_callers(target, PROJECT), args.repeat)
+        _row("callers depth 1", ms, len(res))
+        ms, res = await _time_async(
+            lambda: graph.find_callers(target, PROJECT, limit=10_000, depth=args.depth),
+            args.repeat,
+        )
+        _row(f"callers depth {args.depth}", ms, len(res))
+        ms, res = await _time_async(
+            lambda: graph.find_callees(target, PROJECT, limit=10_000, depth=args.depth),
+            args.repeat,
+        )
+        _row(f"callees depth {args.depth}", ms, len(res))
+        ms, res = await _time_async(
+            lambda: graph.find_blast_radius(
+                None, _file_path(0), PROJECT, depth=args.depth, limit=10_000
+            ),
+            args.repeat,
+        )
+        _row(f"blast radius file depth {args.depth}", ms, len(res))
+    finally:
+        await graph.clear_project(PROJECT)
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--functions", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--reindex", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--neo4j-url", default=None)
+    parser.add_argument("--neo4j-auth", default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = LocalDatabase(Path(tmp) / "bench.db")
+        run_migrations(db)
+        storage = CodeIndexStorage(db)
+
+        start = time.perf_counter()
+        for i in range(args.files):
+            _index_file(storage, rng, i, args)
+        n_symbols = args.files * args.functions
+        print(
+            f"fixture: {args.files} files, {n_symbols} symbols, "
+            f"{n_symbols * args.calls} calls ({(time.perf_counter() - start):.1f}s to write)"
+        )
+
+        # A well-connected target: the most called function
+        row = db.fetchone(
+            "SELECT callee_name, count(*) AS n FROM code_calls WHERE callee_name LIKE 'fn_%' "
+            "GROUP BY callee_name ORDER BY n DESC LIMIT 1"
+        )
+        target = row["callee_name"]
+        print(f"target: {target} ({row['n']} direct callers)")
+
+        graph = LocalCodeGraph(db)
+        print("sqlite csr graph")
+        start = time.perf_counter()
+        stats = graph.stats(PROJECT)
+        _row("cold load", (time.perf_counter() - start) * 1000, stats["calls"])
+
+        ms, res = _time(lambda: graph.find_callers(target, PROJECT), args.repeat)
+        _row("callers depth 1", ms, len(res))
+        ms, res = _time(
+            lambda: graph.find_callers(target, PROJECT, depth=args.depth, limit=10_000),
+            args.repeat,
+        )
+        _row(f"callers depth {args.depth}", ms, len(res))
+        ms, res = _time(
+            lambda: graph.find_callees(target, PROJECT, depth=args.depth, limit=10_000),
+            args.repeat,
+        )
+        _row(f"callees depth {args.depth}", ms, len(res))
+        ms, res = _time(
+            lambda: graph.find_blast_radius(
+                None, _file_path(0), PROJECT, depth=args.depth, limit=10_000
+            ),
+            args.repeat,
+        )
+        _row(f"blast radius file depth {args.depth}", ms, len(res))
+
+        # code_calls has no callee index, so each hop scans it; run once
+        print("recursive sql")
+        ms, rows = _time(lambda: db.fetchall(SQL_CALLERS, (target, PROJECT, 1)), 1)
+        _row("callers depth 1", ms, len(rows))
+        ms, rows = _time(lambda: db.fetchall(SQL_CALLERS, (target, PROJECT, args.depth)), 1)
+        _row(f"callers depth {args.depth}", ms, len(rows))
+
+        for i in rng.sample(range(args.files), min(args.reindex, args.files)):
+            _index_file(storage, rng, i, args, revision="v2")
+        print("sqlite csr graph, incremental")
+        start = time.perf_counter()
+        graph.find_callers(target, PROJECT)
+        _row(f"refresh after {args.reindex} re-indexed", (time.perf_counter() - start) * 1000)
+        stats = graph.stats(PROJECT)
+        print(f"  overlay={stats['overlay_calls']} tombstones={stats['tombstones']}")
+
+        if args.neo4j_url:
+            asyncio.run(_bench_neo4j(args.neo4j_url, args.neo4j_auth, storage, args, target))
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
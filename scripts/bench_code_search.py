@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Benchmark hybrid code search latency on a large symbol index.
+
+Builds --symbols symbols (spread over files of 50) in a temporary
+database, then runs --searches searches drawn from a small pool of
+queries, the way agents repeat near-identical searches in a session.
+The query embedding is a local stub (sleeping --embed-ms to stand in for
+a local model) and the vector store is an in-memory fake returning
+--semantic-hits symbol IDs, so the numbers measure the searcher and
+SQLite rather than a network.
+
+Runs once with the result cache disabled and once with it enabled, and
+reports p50/p95 per-search latency for each.
+
+Usage:
+    uv run python scripts/bench_code_search.py [--symbols 200000] [--searches 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from gobby.code_index.models import IndexedFile, Symbol
+from gobby.code_index.searcher import CodeSearcher
+from gobby.code_index.storage import CodeIndexStorage
+from gobby.config.code_index import CodeIndexConfig
+from gobby.storage.database import LocalDatabase
+from gobby.storage.migrations import run_migrations
+
+PROJECT = "bench-project"
+VERBS = """
+parse load render validate sync fetch build merge resolve apply emit flush
+index rank score encode decode compile collect dispatch enqueue drain split
+join filter group sort hash sign verify refresh expire evict register lookup
+normalize format serialize migrate rollback commit retry spawn kill watch
+""".split()
+NOUNS = """
+token session config graph symbol task message index cache queue worker batch
+channel adapter webhook thread agent project file path module import call edge
+node vector embedding chunk summary prompt template workflow rule hook event
+schedule job lease lock cursor offset page window budget quota limit metric
+span trace log record entry ledger snapshot checkpoint branch commit diff patch
+""".split()
+
+
+@dataclass
+class _Hit:
+    id: str
+    score: float
+
+
+class StubVectorStore:
+    """Returns a fixed pseudo-random set of symbol IDs per query vector."""
+
+    def __init__(self, ids: list[str], hits: int) -> None:
+        self._ids = ids
+        self._hits = hits
+
+    async def search(
+        self, query_embedding: list[float], collection_name: str, limit: int
+    ) -> list[_Hit]:
+        rng = random.Random(query_embedding[0])
+        picked = rng.sample(self._ids, min(limit, self._hits))
+        return [_Hit(pid, 1.0 - n / 100) for n, pid in enumerate(picked)]
+
+
+def _make_embed(delay: float) -> Any:
+    async def embed(text: str, is_query: bool = False) -> list[float]:
+        if delay:
+            await asyncio.sleep(delay)
+        return [float(sum(map(ord, text))), 1.0]
+
+    return embed
+
+
+def _build_index(storage: CodeIndexStorage, symbols: int, rng: random.Random) -> list[str]:
+    ids: list[str] = []
+    per_file = 50
+    for f in range(0, symbols, per_file):
+        path = f"pkg/mod_{f // 5000}/file_{f // per_file}.py"
+        batch = []
+        for j in range(min(per_file, symbols - f)):
+            name = f"{rng.choice(VERBS)}_{rng.choice(NOUNS)}_{f + j}"
+            batch.append(
+                Symbol(
+                    id=Symbol.make_id(PROJECT, path, name, "function", j * 300),
+                    project_id=PROJECT,
+                    file_path=path,
+                    name=name,
+                    qualified_name=name,
+                    kind="function",
+                    language="python",
+                    byte_start=j * 300,
+                    byte_end=j * 300 + 250,
+                    line_start=j * 12 + 1,
+                    line_end=j * 12 + 10,
+                    signature=f"def {name}(value: str) -> str:",
+                    docstring=f"{rng.choice(VERBS).title()} the {rng.choice(NOUNS)} value.",
+                )
+            )
+        storage.upsert_symbols(batch)
+        storage.upsert_file(
+            IndexedFile(
+                id=IndexedFile.make_id(PROJECT, path),
+                project_id=PROJECT,
+                file_path=path,
+                language="python",
+                content_hash=path,
+                symbol_count=len(batch),
+            )
+        )
+        ids.extend(s.id for s in batch)
+    return ids
+
+
+async def _run(searcher: CodeSearcher, queries: list[str]) -> list[float]:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        await searcher.search(query, PROJECT, limit=20)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<14} p50={statistics.median(ordered) * 1000:6.2f} ms  "
+        f"p95={p95 * 1000:6.2f} ms  max={ordered[-1] * 1000:6.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--symbols", type=int, default=200_000)
+    parser.add_argument("--searches", type=int, default=500)
+    parser.add_argument("--pool", type=int, default=25, help="distinct queries")
+    parser.add_argument("--semantic-hits", type=int, default=40)
+    parser.add_argument("--embed-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--vocab",
+        type=int,
+        default=0,
+        help="limit names to the first N verbs/nouns (0 = all); small values make "
+        "every query match thousands of symbols",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.vocab:
+        VERBS[:] = VERBS[: args.vocab]
+        NOUNS[:] = NOUNS[: args.vocab]
+    with tempfile.TemporaryDirectory() as tmp:
+        db = LocalDatabase(Path(tmp) / "bench.db")
+        run_migrations(db)
+        storage = CodeIndexStorage(db)
+        start = time.perf_counter()
+        ids = _build_index(storage, args.symbols, rng)
+        print(f"fixture: {len(ids)} symbols in {time.perf_counter() - start:.1f}s")
+
+        pool = [f"{rng.choice(VERBS)} {rng.choice(NOUNS)}" for _ in range(args.pool)]
+        queries = [rng.choice(pool) for _ in range(args.searches)]
+        store = StubVectorStore(ids, args.semantic_hits)
+
+        for label, ttl in (("cache off", 0.0), ("cache on", 30.0)):
+            searcher = CodeSearcher(
+                storage,
+                vector_store=store,
+                embed_fn=_make_embed(args.embed_ms / 1000),
+                config=CodeIndexConfig(search_cache_ttl_seconds=ttl),
+            )
+            _report(label, asyncio.run(_run(searcher, queries)))
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Benchmark incremental code index sync against the old per-file rewrite.
+
+Builds a fixture repository (--files files of --functions functions, with
+calls and imports) in a temporary database, runs an initial sync, then
+applies scripted edits to --edited files and syncs again:
+
+- docstring:  rewrite one function's docstring (shifts later symbol IDs)
+- add:        append a new function
+- call:       drop one call edge
+
+Embeddings, Qdrant and Neo4j are in-memory fakes that count requests, so
+the numbers isolate the worker's own work. For the old worker the counts
+follow from what it did per changed file: embed every symbol (one request
+per file), rewrite every point, and delete plus re-MERGE every edge with
+one Neo4j write per edge.
+
+Usage:
+    uv run python scripts/bench_code_sync.py [--files 300] [--functions 60] [--edited 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from gobby.code_index.graph import CodeGraph
+from gobby.code_index.models import (
+    CallRelation,
+    ImportRelation,
+    IndexedFile,
+    IndexedProject,
+    Symbol,
+)
+from gobby.code_index.storage import CodeIndexStorage
+from gobby.code_index.sync_worker import _sync_pass
+from gobby.config.code_index import CodeIndexConfig
+from gobby.storage.database import LocalDatabase
+from gobby.storage.migrations import run_migrations
+
+PROJECT = "bench-project"
+
+
+class CountingEmbedder:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.texts = 0
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        self.texts += len(texts)
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+
+class CountingVectorStore:
+    def __init__(self) -> None:
+        self.points: dict[str, tuple[list[float], dict[str, Any]]] = {}
+        self.written = 0
+
+    async def batch_upsert(self, items: list[Any], collection_name: str | None = None) -> None:
+        self.written += len(items)
+        for point_id, vector, payload in items:
+            self.points[point_id] = (vector, payload)
+
+    async def get_vectors(
+        self, point_ids: list[str], collection_name: str | None = None
+    ) -> dict[str, list[float]]:
+        return {pid: self.points[pid][0] for pid in point_ids if pid in self.points}
+
+    async def delete(self, filters: dict[str, Any], collection_name: str | None = None) -> None:
+        pass  # Only called for files never synced before; the fixture starts empty
+
+    async def delete_many(self, ids: list[str], collection_name: str | None = None) -> None:
+        for pid in ids:
+            self.points.pop(pid, None)
+
+
+class CountingNeo4j:
+    def __init__(self) -> None:
+        self.writes = 0
+
+    async def execute_write(self, query: str, params: dict[str, Any]) -> list[Any]:
+        self.writes += 1
+        return []
+
+
+def _write_file(
+    storage: CodeIndexStorage,
+    root: Path,
+    path: str,
+    functions: dict[str, dict[str, Any]],
+    revision: int,
+) -> None:
+    (root / path).parent.mkdir(parents=True, exist_ok=True)
+    (root / path).touch()
+    symbols, calls = [], []
+    offset = 0
+    for j, (name, fn) in enumerate(functions.items()):
+        sym = Symbol(
+            id=Symbol.make_id(PROJECT, path, name, "function", offset),
+            project_id=PROJECT,
+            file_path=path,
+            name=name,
+            qualified_name=name,
+            kind="function",
+            language="python",
+            byte_start=offset,
+            byte_end=offset + 200,
+            line_start=j * 12 + 1,
+            line_end=j * 12 + 10,
+            signature=f"def {name}(value: int) -> int:",
+            docstring=fn["doc"],
+        )
+        symbols.append(sym)
+        calls += [
+            CallRelation(sym.id, callee, path, sym.line_start + 1 + k)
+            for k, callee in enumerate(fn["calls"])
+        ]
+        offset += 220 + len(fn["doc"])
+    storage.delete_symbols_for_file(PROJECT, path)
+    storage.upsert_symbols(symbols)
+    storage.upsert_calls(PROJECT, path, calls)
+    storage.upsert_imports(PROJECT, path, [ImportRelation(path, m) for m in _imports(path)])
+    storage.upsert_file(
+        IndexedFile(
+            id=IndexedFile.make_id(PROJECT, path),
+            project_id=PROJECT,
+            file_path=path,
+            language="python",
+            content_hash=f"{path}@{revision}",
+        )
+    )
+
+
+def _imports(path: str) -> list[str]:
+    return ["os", "json", f"pkg.{path.split('/')[1]}"]
+
+
+def _legacy_cost(storage: CodeIndexStorage, paths: list[str]) -> dict[str, int]:
+    """Requests the old worker made to sync ``paths``: everything, per file."""
+    symbols = sum(len(storage.get_symbols_for_file(PROJECT, p)) for p in paths)
+    edges = sum(
+        len(storage.get_symbols_for_file(PROJECT, p))
+        + len(storage.get_calls_for_file(PROJECT, p))
+        + len(storage.get_imports_for_file(PROJECT, p))
+        for p in paths
+    )
+    return {
+        "embed_calls": len(paths),
+        "texts": symbols,
+        "points": symbols,
+        "neo4j_writes": 2 * len(paths) + edges,
+    }
+
+
+async def _sync_all(
+    storage: CodeIndexStorage,
+    config: CodeIndexConfig,
+    stores: tuple[CountingEmbedder, CountingVectorStore, CountingNeo4j],
+) -> tuple[float, dict[str, int]]:
+    embedder, vectors, neo4j = stores
+    before = (embedder.calls, embedder.texts, vectors.written, neo4j.writes)
+    totals: dict[str, int] = {}
+    start = time.perf_counter()
+    while True:
+        stats = await _sync_pass(
+            storage=storage,
+            vector_store=vectors,
+            graph=CodeGraph(neo4j_client=neo4j),
+            config=config,
+            embed_model=embedder,
+            batch_size=config.sync_worker_batch_size,
+        )
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+        if not stats["files"]:
+            break
+    elapsed = time.perf_counter() - start
+    totals.update(
+        embed_calls=embedder.calls - before[0],
+        texts=embedder.texts - before[1],
+        points=vectors.written - before[2],
+        neo4j_writes=neo4j.writes - before[3],
+    )
+    return elapsed, totals
+
+
+def _report(label: str, elapsed: float, new: dict[str, int], old: dict[str, int]) -> None:
+    print(f"{label}: {new['files']} files in {elapsed * 1000:.0f} ms")
+    for key in ("embed_calls", "texts", "points", "neo4j_writes"):
+        print(f"  {key:<14} {new[key]:>8}   (old worker: {old[key]})")
+    print(f"  reused={new['reused']} unchanged={new['unchanged']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--functions", type=int, default=60)
+    parser.add_argument("--edited", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    config = CodeIndexConfig(graph_enabled=True, sync_worker_batch_size=100)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        db = LocalDatabase(Path(tmp) / "bench.db")
+        run_migrations(db)
+        storage = CodeIndexStorage(db)
+        storage.upsert_project_stats(IndexedProject(id=PROJECT, root_path=str(root)))
+
+        repo: dict[str, dict[str, dict[str, Any]]] = {}
+        for i in range(args.files):
+            path = f"pkg/mod_{i // 25}/file_{i}.py"
+            repo[path] = {
+                f"fn_{i}_{j}": {
+                    "doc": f"Compute step {j} of stage {i} and return the adjusted value.",
+                    "calls": [
+                        f"fn_{rng.randrange(args.files)}_{rng.randrange(args.functions)}"
+                        for _ in range(3)
+                    ],
+                }
+                for j in range(args.functions)
+            }
+            _write_file(storage, root, path, repo[path], revision=0)
+        print(f"fixture: {args.files} files x {args.functions} functions")
+
+        stores = (CountingEmbedder(), CountingVectorStore(), CountingNeo4j())
+        elapsed, stats = asyncio.run(_sync_all(storage, config, stores))
+        _report("initial sync", elapsed, stats, _legacy_cost(storage, list(repo)))
+
+        edited = rng.sample(sorted(repo), min(args.edited, len(repo)))
+        for n, path in enumerate(edited):
+            functions = repo[path]
+            names = list(functions)
+            edit = ("docstring", "add", "call")[n % 3]
+            if edit == "docstring":
+                functions[names[len(names) // 4]]["doc"] += " Rounds toward zero."
+            elif edit == "add":
+                functions[f"new_{n}"] = {"doc": "Added helper.", "calls": [names[0]]}
+            else:
+                functions[names[len(names) // 2]]["calls"].pop()
+            _write_file(storage, root, path, functions, revision=1)
+
+        elapsed, stats = asyncio.run(_sync_all(storage, config, stores))
+        _report(f"after editing {len(edited)} files", elapsed, stats, _legacy_cost(storage, edited))
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
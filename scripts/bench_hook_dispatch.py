@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark hook dispatch round-trip time: HTTP vs Unix socket.
+
+Starts the real hooks route (uvicorn) and the real HookSocketServer in-process
+on a temporary port / socket, with hook execution stubbed out, and measures the
+transport overhead the hook dispatcher pays per hook event:
+
+- http:   health-check GET + POST /api/hooks/execute on a fresh httpx client
+          (what hook_dispatcher.py did before the socket transport)
+- socket: one framed request via hook_dispatcher.call_hook_socket
+
+Usage:
+    uv run python scripts/bench_hook_dispatch.py [--iterations 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src/gobby/install/shared/hooks"))
+
+import hook_dispatcher  # noqa: E402
+
+from gobby.servers import hook_socket  # noqa: E402
+from gobby.servers.routes.mcp import hooks as hooks_routes  # noqa: E402
+
+PAYLOAD: dict[str, Any] = {
+    "hook_type": "pre-tool-use",
+    "source": "claude",
+    "input_data": {
+        "session_id": "bench-session",
+        "tool_name": "Bash",
+        "tool_input": {"command": "ls -la " + "x" * 512},
+    },
+}
+
+
+async def _stub_execute(payload: dict[str, Any], app_state: Any) -> dict[str, Any]:
+    return {"continue": True, "decision": "approve"}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _percentiles(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50={p50:7.3f} ms  p99={p99:7.3f} ms  mean={statistics.fmean(ordered):7.3f} ms"
+
+
+async def _bench_http(url: str, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            health = await client.get(f"{url}/api/admin/health", timeout=5.0)
+        assert health.status_code == 200
+        async with httpx.AsyncClient() as client:
+            response = await client.post(f"{url}/api/hooks/execute", json=PAYLOAD, timeout=90.0)
+        response.json()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def _bench_socket(path: Path, iterations: int) -> list[float]:
+    def run() -> list[float]:
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = hook_dispatcher.call_hook_socket(dict(PAYLOAD), path)
+            assert response["status"] == 200
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+    # Client runs in a thread, like the blocking dispatcher, so the server loop stays free
+    return await asyncio.to_thread(run)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    app = FastAPI()
+    app.include_router(hooks_routes.create_hooks_router(None))  # type: ignore[arg-type]
+
+    @app.get("/api/admin/health")
+    async def health() -> dict[str, str]:
+        return {"status": "healthy"}
+
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+    )
+
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        patch.object(hooks_routes, "execute_hook_payload", _stub_execute),
+        patch.object(hook_socket, "execute_hook_payload", _stub_execute),
+    ):
+        sock_server = hook_socket.HookSocketServer(app.state, socket_path=Path(tmp) / "h.sock")
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        await sock_server.start()
+
+        try:
+            # Warm up both paths before measuring
+            await _bench_http(f"http://127.0.0.1:{port}", 10)
+            await _bench_socket(sock_server.socket_path, 10)
+
+            http = await _bench_http(f"http://127.0.0.1:{port}", args.iterations)
+            unix = await _bench_socket(sock_server.socket_path, args.iterations)
+        finally:
+            await sock_server.stop()
+            server.should_exit = True
+            await server_task
+
+    print(f"hook round trip, {args.iterations} iterations")
+    print(f"  http (health + POST): {_percentiles(http)}")
+    print(f"  unix socket:          {_percentiles(unix)}")
+    print(f"  p50 speedup: {statistics.median(http) / statistics.median(unix):.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark rule-triggered MCP dispatch: sequential vs concurrent.
+
+Dispatches the blocking calls the bundled before_agent rules emit
+(search_skills, search_memories, get_skill x2, activate_command,
+deliver_pending_messages) against a fake proxy whose call_tool sleeps for
+a per-tool latency, and compares the wall time of awaiting them one by one
+(the previous dispatcher) with the concurrent dispatcher.  A final run with
+one hung tool shows the per-hook deadline returning partial results.
+
+Usage:
+    uv run python scripts/bench_rule_mcp_dispatch.py [--iterations 5] [--deadline 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from gobby.hooks.dispatchers.mcp import dispatch_mcp_calls
+from gobby.hooks.events import HookEvent, HookEventType, SessionSource
+
+LATENCY: dict[str, float] = {
+    "search_skills": 0.12,
+    "search_memories": 0.15,
+    "get_skill": 0.05,
+    "activate_command": 0.03,
+    "deliver_pending_messages": 0.04,
+}
+
+CALLS: list[dict[str, Any]] = [
+    {"server": "gobby-skills", "tool": "search_skills", "inject_result": True},
+    {"server": "gobby-memory", "tool": "search_memories", "inject_result": True},
+    {"server": "gobby-skills", "tool": "get_skill", "arguments": {"name": "a"}},
+    {"server": "gobby-skills", "tool": "get_skill", "arguments": {"name": "b"}},
+    {"server": "gobby-skills", "tool": "activate_command"},
+    {"server": "gobby-agents", "tool": "deliver_pending_messages", "inject_result": True},
+]
+
+
+class FakeSlowProxy:
+    """Stands in for ToolProxyService with fixed per-tool latency."""
+
+    def __init__(self, latency: dict[str, float]) -> None:
+        self.latency = latency
+
+    async def call_tool(self, server: str, tool: str, args: dict[str, Any], **_: Any) -> Any:
+        await asyncio.sleep(self.latency.get(tool, 0))
+        return {"success": True, "server": server, "tool": tool}
+
+
+def _event() -> HookEvent:
+    return HookEvent(
+        event_type=HookEventType.BEFORE_AGENT,
+        session_id="bench",
+        source=SessionSource.CLAUDE,
+        timestamp=datetime.now(UTC),
+        data={"prompt": "fix the flaky test"},
+        metadata={"_platform_session_id": "bench"},
+    )
+
+
+def _sequential(proxy: FakeSlowProxy, event: HookEvent, logger: logging.Logger) -> float:
+    """One dispatch per call, as the dispatcher did before it ran calls concurrently."""
+    start = time.perf_counter()
+    for call in CALLS:
+        dispatch_mcp_calls([call], event, lambda: proxy, None, logger)
+    return (time.perf_counter() - start) * 1000
+
+
+def _concurrent(
+    proxy: FakeSlowProxy, event: HookEvent, logger: logging.Logger, **limits: float
+) -> tuple[float, list[dict[str, Any]]]:
+    start = time.perf_counter()
+    results = dispatch_mcp_calls(CALLS, event, lambda: proxy, None, logger, **limits)
+    return (time.perf_counter() - start) * 1000, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--deadline", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    logger.setLevel(logging.CRITICAL)
+    event = _event()
+    proxy = FakeSlowProxy(LATENCY)
+
+    sequential = [_sequential(proxy, event, logger) for _ in range(args.iterations)]
+    concurrent = [_concurrent(proxy, event, logger)[0] for _ in range(args.iterations)]
+
+    hung = FakeSlowProxy({**LATENCY, "search_memories": 60.0})
+    hung_ms, hung_results = _concurrent(hung, event, logger, deadline=args.deadline)
+    timed_out = [r["tool"] for r in hung_results if r.get("timed_out")]
+
+    print(f"{len(CALLS)} blocking rule MCP calls, {args.iterations} iterations")
+    print(f"  sequential: median {statistics.median(sequential):7.1f} ms")
+    print(f"  concurrent: median {statistics.median(concurrent):7.1f} ms")
+    print(f"  speedup:    {statistics.median(sequential) / statistics.median(concurrent):.1f}x")
+    print(
+        f"  hung search_memories, {args.deadline}s deadline: {hung_ms:7.1f} ms, "
+        f"{len(hung_results) - len(timed_out)}/{len(hung_results)} results, timed out: {timed_out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Benchmark trace-list queries on a large spans table.
+
+Fills a temporary database with --spans spans (about 8 per trace, spread over
+--sessions sessions and a handful of projects), then times:
+
+- json:    the previous GROUP BY + ROW_NUMBER() queries over json_extract()
+- indexed: SpanStorage on the promoted session_id/project_id columns
+
+and the export path (SpanStorage.save_spans per batch vs submit_spans through
+the database writer queue).
+
+Usage:
+    uv run python scripts/bench_span_queries.py [--spans 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from gobby.storage.database import LocalDatabase
+from gobby.storage.migrations import run_migrations
+from gobby.storage.spans import SpanStorage, _span_row
+
+_JSON_RECENT = """
+WITH TraceLastActivity AS (
+    SELECT trace_id, MAX(start_time_ns) as last_activity
+    FROM spans
+    {where}
+    GROUP BY trace_id
+    ORDER BY last_activity DESC
+    LIMIT ? OFFSET ?
+),
+RootSpans AS (
+    SELECT *,
+           ROW_NUMBER() OVER(PARTITION BY trace_id ORDER BY start_time_ns ASC) as rn
+    FROM spans
+    WHERE trace_id IN (SELECT trace_id FROM TraceLastActivity)
+)
+SELECT r.*
+FROM RootSpans r
+JOIN TraceLastActivity tla ON r.trace_id = tla.trace_id
+WHERE r.rn = 1
+ORDER BY tla.last_activity DESC
+"""
+_JSON_PROJECT = (
+    "WHERE (json_extract(attributes_json, '$.project_id') = ? "
+    "OR json_extract(attributes_json, '$.project_id') IS NULL)"
+)
+_JSON_SESSION = "WHERE json_extract(attributes_json, '$.session_id') = ?"
+
+
+def _spans(count: int, sessions: int, start: int = 0) -> list[dict[str, Any]]:
+    rng = random.Random(start)
+    spans = []
+    for i in range(start, start + count):
+        trace = i // 8
+        session = trace % sessions
+        attributes: dict[str, Any] = {"session_id": f"sess-{session}"}
+        if session % 10:  # some daemon-level traces have no project
+            attributes["project_id"] = f"proj-{session % 5}"
+        spans.append(
+            {
+                "span_id": f"{i:016x}",
+                "trace_id": f"{trace:032x}",
+                "parent_span_id": None if i % 8 == 0 else f"{trace * 8:016x}",
+                "name": "bench",
+                "start_time_ns": i * 1000,
+                "end_time_ns": i * 1000 + 500,
+                "status": "ERROR" if rng.random() < 0.01 else "OK",
+                "attributes": attributes,
+            }
+        )
+    return spans
+
+
+def _time(label: str, fn: Callable[[], Any], repeat: int = 5) -> None:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    print(f"  {label:<28} {min(timings) * 1000:9.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--spans", type=int, default=1_000_000)
+    parser.add_argument("--sessions", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = LocalDatabase(Path(tmp) / "bench.db")
+        run_migrations(db)
+        storage = SpanStorage(db)
+
+        print(f"loading {args.spans} spans...")
+        for offset in range(0, args.spans, 50_000):
+            rows = _spans(min(50_000, args.spans - offset), args.sessions, offset)
+            db.executemany(
+                "INSERT INTO spans (span_id, trace_id, parent_span_id, name, kind, "
+                "start_time_ns, end_time_ns, status, status_message, attributes_json, "
+                "events_json, session_id, project_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [_span_row(s) for s in rows],
+            )
+        db.execute("ANALYZE")
+
+        session = f"sess-{args.sessions // 2 + 1}"
+        cases = [
+            (
+                "recent traces",
+                lambda: db.fetchall(_JSON_RECENT.format(where=""), (50, 0)),
+                lambda: storage.get_recent_traces(limit=50),
+            ),
+            (
+                "recent traces, project",
+                lambda: db.fetchall(_JSON_RECENT.format(where=_JSON_PROJECT), ("proj-1", 50, 0)),
+                lambda: storage.get_recent_traces(limit=50, project_id="proj-1"),
+            ),
+            (
+                "recent traces, errors",
+                lambda: db.fetchall(
+                    _JSON_RECENT.format(where="WHERE status = ?"), ("ERROR", 50, 0)
+                ),
+                lambda: storage.get_recent_traces(limit=50, status="ERROR"),
+            ),
+            (
+                "traces by session",
+                lambda: db.fetchall(_JSON_RECENT.format(where=_JSON_SESSION), (session, 50, 0)),
+                lambda: storage.get_traces_by_session(session, limit=50),
+            ),
+        ]
+        for label, old, new in cases:
+            print(label)
+            _time("json", old, repeat=2)
+            _time("indexed", new)
+
+        batches = [_spans(512, args.sessions, args.spans + i * 512) for i in range(40)]
+        print("export 40 x 512 spans")
+        start = time.perf_counter()
+        for batch in batches[:20]:
+            storage.save_spans(batch)
+        print(f"  {'save_spans (caller waits)':<28} {(time.perf_counter() - start) * 1000:9.2f} ms")
+        start = time.perf_counter()
+        for batch in batches[20:]:
+            storage.submit_spans(batch)
+        queued = time.perf_counter() - start
+        storage.flush(timeout=60.0)
+        print(
+            f"  {'submit_spans (caller waits)':<28} {queued * 1000:9.2f} ms "
+            f"(committed after {(time.perf_counter() - start) * 1000:.2f} ms)"
+        )
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Benchmark dependency cycle checks and trees on a large task DAG.
+
+Builds a DAG of --nodes tasks in a temporary database (each task blocked by up
+to --fanout random earlier tasks) and compares the per-node SQL traversal that
+TaskDependencyManager used before the in-memory graph against the graph:
+
+- batch:     add_dependencies() for all but the last --tail edges (one cycle check)
+- check sql: cycle check for each of the last --tail edges, a query per visited node
+- check mem: the same checks against the warm graph
+- add:       add_dependency() for those edges (check + insert + triggers)
+- cold:      first cycle check after invalidation (loads the project's edges)
+- tree:      get_dependency_tree() from the newest task, SQL vs graph
+
+Usage:
+    uv run python scripts/bench_task_dependency_graph.py [--nodes 5000] [--fanout 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from gobby.storage.database import LocalDatabase
+from gobby.storage.migrations import run_migrations
+from gobby.storage.projects import LocalProjectManager
+from gobby.storage.task_dependencies import TaskDependencyManager
+from gobby.storage.tasks import LocalTaskManager
+
+
+def _legacy_would_create_cycle(db: LocalDatabase, task_id: str, depends_on: str) -> bool:
+    """Pre-graph cycle check: one query per visited node."""
+    visited: set[str] = set()
+    stack = [depends_on]
+    while stack:
+        current = stack.pop()
+        if current == task_id:
+            return True
+        if current in visited:
+            continue
+        visited.add(current)
+        rows = db.fetchall(
+            "SELECT depends_on FROM task_dependencies WHERE task_id = ? AND dep_type = 'blocks'",
+            (current,),
+        )
+        stack.extend(row["depends_on"] for row in rows)
+    return False
+
+
+def _legacy_tree(db: LocalDatabase, task_id: str, max_depth: int) -> dict[str, Any]:
+    """Pre-graph dependency tree (blockers direction): one query per node."""
+    result: dict[str, Any] = {"id": task_id}
+    if max_depth <= 0:
+        result["_truncated"] = True
+        return result
+    rows = db.fetchall(
+        "SELECT depends_on FROM task_dependencies WHERE task_id = ? AND dep_type = 'blocks'",
+        (task_id,),
+    )
+    if rows:
+        result["blockers"] = [_legacy_tree(db, r["depends_on"], max_depth - 1) for r in rows]
+    return result
+
+
+def _normalized(tree: dict[str, Any]) -> dict[str, Any]:
+    """Sort children by ID (the SQL version returns them in index order)."""
+    children = sorted((_normalized(c) for c in tree.get("blockers", [])), key=lambda c: c["id"])
+    return {**tree, "blockers": children} if children else tree
+
+
+def _count_nodes(tree: dict[str, Any]) -> int:
+    return 1 + sum(_count_nodes(child) for child in tree.get("blockers", []))
+
+
+def _report(label: str, elapsed: float, count: int, unit: str) -> None:
+    per = elapsed / count * 1000 if count else 0.0
+    print(f"  {label:<9} {elapsed:8.3f} s  {count:>6} {unit:<6} {per:8.3f} ms/{unit}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--fanout", type=int, default=3)
+    parser.add_argument("--tail", type=int, default=300)
+    parser.add_argument("--tree-depth", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = LocalDatabase(Path(tmp) / "bench.db")
+        run_migrations(db)
+        project_id = LocalProjectManager(db).create(name="bench", repo_path=tmp).id
+        tasks = LocalTaskManager(db)
+        deps = TaskDependencyManager(db)
+
+        start = time.perf_counter()
+        ids = [tasks.create_task(project_id, f"task {i}").id for i in range(args.nodes)]
+        print(f"created {len(ids)} tasks in {time.perf_counter() - start:.2f} s")
+
+        edges: list[tuple[str, str, Any]] = []
+        for i in range(1, len(ids)):
+            for j in rng.sample(range(i), min(i, args.fanout)):
+                edges.append((ids[i], ids[j], "blocks"))
+        head, tail = edges[: -args.tail], edges[-args.tail :]
+        print(f"DAG: {len(ids)} nodes, {len(edges)} edges")
+
+        start = time.perf_counter()
+        deps.add_dependencies(head)
+        _report("batch", time.perf_counter() - start, len(head), "edge")
+
+        start = time.perf_counter()
+        for task_id, depends_on, _ in tail:
+            if _legacy_would_create_cycle(db, task_id, depends_on):
+                raise AssertionError("DAG edge reported as a cycle")
+        _report("check sql", time.perf_counter() - start, len(tail), "edge")
+
+        start = time.perf_counter()
+        for task_id, depends_on, _ in tail:
+            if deps._would_create_cycle(task_id, depends_on):
+                raise AssertionError("DAG edge reported as a cycle")
+        _report("check mem", time.perf_counter() - start, len(tail), "edge")
+
+        start = time.perf_counter()
+        for task_id, depends_on, dep_type in tail:
+            deps.add_dependency(task_id, depends_on, dep_type)
+        _report("add", time.perf_counter() - start, len(tail), "edge")
+
+        deps.graph.invalidate()
+        start = time.perf_counter()
+        deps._would_create_cycle(ids[0], ids[-1])
+        _report("cold", time.perf_counter() - start, 1, "check")
+
+        start = time.perf_counter()
+        sql_tree = _legacy_tree(db, ids[-1], args.tree_depth)
+        sql_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        graph_tree = deps.get_dependency_tree(ids[-1], "blockers", args.tree_depth)
+        graph_elapsed = time.perf_counter() - start
+        assert _normalized(sql_tree) == _normalized(graph_tree)
+        nodes = _count_nodes(graph_tree)
+        _report("tree sql", sql_elapsed, nodes, "node")
+        _report("tree mem", graph_elapsed, nodes, "node")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark importing a large task tree from JSONL.
+
+Writes --tasks tasks (--epics epics, each with subtasks --depth levels
+deep) to a JSONL file with children listed before their parents, imports
+it into an empty database, then re-imports it with every task moved under
+a different epic. Reports the time spent in import_from_jsonl() and in
+path_cache recomputation for each run.
+
+Usage:
+    uv run python scripts/bench_task_import.py [--tasks 10000] [--epics 50] [--depth 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from gobby.storage.database import LocalDatabase
+from gobby.storage.migrations import run_migrations
+from gobby.storage.projects import LocalProjectManager
+from gobby.storage.tasks import LocalTaskManager
+from gobby.sync.tasks import TaskSyncManager
+
+
+def _build_tasks(project_id: str, tasks: int, epics: int, depth: int) -> list[dict[str, Any]]:
+    now = "2026-01-01T00:00:00+00:00"
+    rows: list[dict[str, Any]] = []
+    chain: list[str] = []
+    for seq in range(1, tasks + 1):
+        if seq <= epics:
+            parent = None
+        else:
+            # Alternate between starting a new chain under an epic and
+            # extending the current one, up to --depth levels
+            if not chain or len(chain) >= depth or seq % 3 == 0:
+                chain = [f"task-{(seq % epics) + 1}"]
+            parent = chain[-1]
+        task_id = f"task-{seq}"
+        if parent is not None:
+            chain.append(task_id)
+        rows.append(
+            {
+                "id": task_id,
+                "title": f"Task {seq}",
+                "description": "",
+                "status": "open",
+                "created_at": now,
+                "updated_at": now,
+                "project_id": project_id,
+                "parent_id": parent,
+                "deps_on": [],
+                "seq_num": seq,
+                "path_cache": None,
+            }
+        )
+    # Children first, so no parent exists yet when its children are imported
+    rows.reverse()
+    return rows
+
+
+def _timed_import(sync: TaskSyncManager, manager: LocalTaskManager) -> tuple[float, float]:
+    path_time = 0.0
+    rebuild = manager.rebuild_project_paths
+
+    def timed_rebuild(project_id: str) -> int:
+        nonlocal path_time
+        start = time.perf_counter()
+        try:
+            return rebuild(project_id)
+        finally:
+            path_time += time.perf_counter() - start
+
+    manager.rebuild_project_paths = timed_rebuild  # type: ignore[method-assign]
+    start = time.perf_counter()
+    sync.import_from_jsonl()
+    total = time.perf_counter() - start
+    manager.rebuild_project_paths = rebuild  # type: ignore[method-assign]
+    return total, path_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--epics", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = LocalDatabase(Path(tmp) / "bench.db")
+        run_migrations(db)
+        project = LocalProjectManager(db).create(name="bench", repo_path=tmp)
+        manager = LocalTaskManager(db)
+        export_path = Path(tmp) / ".gobby" / "tasks.jsonl"
+        export_path.parent.mkdir()
+        sync = TaskSyncManager(manager, str(export_path))
+
+        rows = _build_tasks(project.id, args.tasks, args.epics, args.depth)
+        export_path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+        total, paths = _timed_import(sync, manager)
+        print(f"fresh import   {total:7.2f}s  (path_cache {paths * 1000:7.1f} ms)")
+
+        # Move every non-epic root chain under the next epic
+        later = "2027-01-01T00:00:00+00:00"
+        for row in rows:
+            row["updated_at"] = later
+            parent = row["parent_id"]
+            if parent is not None and int(parent.split("-")[1]) <= args.epics:
+                row["parent_id"] = f"task-{int(parent.split('-')[1]) % args.epics + 1}"
+        export_path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+        total, paths = _timed_import(sync, manager)
+        print(f"re-parent      {total:7.2f}s  (path_cache {paths * 1000:7.1f} ms)")
+
+        sample = manager.get_task(rows[0]["id"])
+        print(f"sample path    {sample.path_cache if sample else None}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
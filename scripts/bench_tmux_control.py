@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark tmux pane checks: per-call subprocesses vs the control-mode client.
+
+Starts --agents shell sessions on a private tmux socket and runs --ticks
+lifecycle-monitor-style ticks (trust, loop, idle and stall captures per agent):
+
+- subprocess: TmuxSessionManager.capture_pane(), one tmux process per capture
+- control:    TmuxControlClient.capture_pane() over one connection, cached
+              while a pane is quiet; one agent prints a line between ticks
+
+Then measures prompt detection latency: a prompt is printed in one pane and
+timed until the control client's listener sees it (the monitor's trigger),
+versus the expected wait for the next 30s poll tick.
+
+Usage:
+    uv run python scripts/bench_tmux_control.py [--agents 20] [--ticks 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from gobby.agents.prompt_detector import PromptDetector
+from gobby.agents.tmux.control_client import TmuxControlClient
+from gobby.agents.tmux.session_manager import TmuxSessionManager
+from gobby.config.tmux import TmuxConfig
+
+# capture sizes used per agent per tick by AgentLifecycleMonitor
+_TICK_CAPTURES = (15, 15, 15, 8)
+
+
+async def _ticks(capture, names: list[str], ticks: int, between=None) -> float:  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for name in names:
+            for lines in _TICK_CAPTURES:
+                await capture(name, lines=lines)
+        if between:
+            await between()
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--agents", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=5)
+    parser.add_argument("--prompts", type=int, default=10)
+    args = parser.parse_args()
+
+    config = TmuxConfig(socket_name=f"gobby-bench-{uuid.uuid4().hex[:8]}")
+    manager = TmuxSessionManager(config)
+    names = [f"bench-{i}" for i in range(args.agents)]
+    for name in names:
+        await manager._run("new-session", "-d", "-s", name, "-x", "120", "-y", "40", "sh")
+    client = TmuxControlClient(config)
+    try:
+        for name in names:
+            assert await client.watch(name)
+
+        async def chatter() -> None:
+            await manager.send_keys(names[0], "echo tick\n")
+            await asyncio.sleep(0.05)
+
+        calls = args.ticks * len(names) * len(_TICK_CAPTURES)
+        elapsed = await _ticks(manager.capture_pane, names, args.ticks, chatter)
+        print(f"subprocess  {elapsed:7.3f} s  {calls} captures, {calls} tmux processes")
+
+        sent_before = client.commands_sent
+        elapsed = await _ticks(client.capture_pane, names, args.ticks, chatter)
+        sent = client.commands_sent - sent_before
+        print(
+            f"control     {elapsed:7.3f} s  {calls} captures, {sent} commands, "
+            f"{client.capture_cache_hits} cache hits, 0 tmux processes"
+        )
+
+        detector = PromptDetector()
+        seen = asyncio.Event()
+
+        def listener(name: str, text: str) -> None:
+            # The typed command splits the phrase with quotes; only printf's output matches
+            if name == names[-1] and detector.detect_trust_prompt(text):
+                seen.set()
+
+        client.add_listener(listener)
+        latencies = []
+        for _ in range(args.prompts):
+            seen.clear()
+            await client.command(
+                "send-keys", "-t", names[-1], "-l", "printf 'Do you tr''ust the files?\\n'"
+            )
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            await client.command("send-keys", "-t", names[-1], "Enter")
+            await asyncio.wait_for(seen.wait(), timeout=5.0)
+            latencies.append(time.perf_counter() - start)
+        print(
+            f"detection   {statistics.median(latencies) * 1000:7.1f} ms median "
+            f"(polling: up to one 30s tick, 15s on average)"
+        )
+    finally:
+        await client.stop()
+        await manager._run("kill-server")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark paged transcript reads with and without the offset index.
+
+Writes a synthetic Claude transcript of --lines lines, archives it, and times
+reading a page near the end of the live file and of the archive:
+
+- full:    parse every line and slice (the pre-index read path)
+- indexed: TranscriptReader.get_messages() (first call builds the index)
+- warm:    the same page again with the index persisted
+- archive: the page from the chunked archive (cold cache, then warm)
+
+Usage:
+    uv run python scripts/bench_transcript_pages.py [--lines 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from gobby.sessions.transcript_archive import backup_transcript
+from gobby.sessions.transcript_reader import (
+    TranscriptReader,
+    _parse_lines_to_dicts,
+    clear_archive_cache,
+)
+
+
+def _write_transcript(path: Path, lines: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            if i % 2:
+                content = [
+                    {"type": "text", "text": f"answer {i} " + "x" * 400},
+                    {"type": "tool_use", "id": f"tu-{i}", "name": "Read", "input": {"n": i}},
+                ]
+                line = {"type": "assistant", "message": {"role": "assistant", "content": content}}
+            else:
+                line = {"type": "user", "message": {"role": "user", "content": f"question {i}"}}
+            f.write(json.dumps(line) + "\n")
+
+
+def _reader(archive_dir: Path, transcript: Path | None) -> TranscriptReader:
+    session = MagicMock()
+    session.external_id = "bench"
+    session.source = "claude"
+    session.transcript_path = str(transcript) if transcript else None
+    session_manager = MagicMock()
+    session_manager.get.return_value = session
+    return TranscriptReader(session_manager, archive_dir=str(archive_dir))
+
+
+def _timed[T](label: str, fn: Callable[[], T]) -> T:
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:<13} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        transcript = Path(tmp) / "bench.jsonl"
+        archive_dir = Path(tmp) / "archives"
+        _write_transcript(transcript, args.lines)
+        size_mb = transcript.stat().st_size / 1e6
+        print(f"transcript: {args.lines} lines, {size_mb:.1f} MB")
+
+        offset = args.lines * 3 // 2 - 2 * args.limit
+        live = _reader(archive_dir, transcript)
+
+        def full() -> list[dict]:
+            lines = transcript.read_text(encoding="utf-8").splitlines(keepends=True)
+            return _parse_lines_to_dicts(lines, "claude")[offset : offset + args.limit]
+
+        def page(reader: TranscriptReader) -> list[dict]:
+            return asyncio.run(reader.get_messages("s", limit=args.limit, offset=offset))
+
+        expected = _timed("full", full)
+        indexed = _timed("indexed", lambda: page(live))
+        assert [m["content"] for m in indexed] == [m["content"] for m in expected]
+        _timed("warm", lambda: page(live))
+
+        _timed("backup", lambda: backup_transcript("bench", str(transcript), str(archive_dir)))
+        transcript.unlink()
+        archived = _reader(archive_dir, None)
+        clear_archive_cache()
+        result = _timed("archive cold", lambda: page(archived))
+        _timed("archive warm", lambda: page(archived))
+        assert [m["content"] for m in result] == [m["content"] for m in expected]  # type: ignore[union-attr]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Benchmark memory VectorStore rebuild throughput and resume behaviour.
+
+Runs VectorStore.rebuild against embedded Qdrant (temporary directory) and a
+fake OpenAI-compatible embedding endpoint (uvicorn, in-process) that adds a
+fixed latency per request, and reports:
+
+- serial:  one embedding request per memory, one at a time (the pre-batching
+           rebuild loop)
+- batched: batched requests with bounded concurrency
+- warm:    rebuild again with unchanged content (vectors reused, no requests)
+- resume:  endpoint fails partway through; the next rebuild picks up from the
+           shadow collection instead of starting over
+
+Usage:
+    uv run python scripts/bench_vector_rebuild.py [--memories 2000] [--latency-ms 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import socket
+import tempfile
+import time
+import uuid
+from functools import partial
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+
+from gobby.memory.vectorstore import VectorStore
+from gobby.search.embeddings import clear_cache, generate_embedding, generate_embeddings
+
+MODEL = "fake-embed"
+DIM = 64
+
+
+class FakeEndpoint:
+    """State for the fake /v1/embeddings route."""
+
+    def __init__(self, latency_ms: float) -> None:
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self.texts = 0
+        self.fail_after: int | None = None
+
+    def reset(self, fail_after: int | None = None) -> None:
+        self.requests = 0
+        self.texts = 0
+        self.fail_after = fail_after
+
+
+def _vector(text: str) -> list[float]:
+    digest = hashlib.sha256(text.encode()).digest()
+    return [(digest[i % len(digest)] - 128) / 128 for i in range(DIM)]
+
+
+def _create_app(endpoint: FakeEndpoint) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/v1/embeddings")
+    async def embeddings(body: dict[str, Any]) -> dict[str, Any]:
+        if endpoint.fail_after is not None and endpoint.requests >= endpoint.fail_after:
+            # 4xx so the client fails fast instead of retrying
+            raise HTTPException(status_code=400, detail="simulated outage")
+        endpoint.requests += 1
+        texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        endpoint.texts += len(texts)
+        await asyncio.sleep(endpoint.latency)
+        return {
+            "object": "list",
+            "model": MODEL,
+            "data": [
+                {"object": "embedding", "index": i, "embedding": _vector(t)}
+                for i, t in enumerate(texts)
+            ],
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        }
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _memories(count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "id": str(uuid.uuid5(uuid.NAMESPACE_DNS, f"bench-mem-{i}")),
+            "content": f"memory {i}: " + "lorem ipsum " * 20,
+        }
+        for i in range(count)
+    ]
+
+
+async def _timed_rebuild(
+    store: VectorStore,
+    endpoint: FakeEndpoint,
+    memories: list[dict[str, str]],
+    label: str,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    clear_cache()
+    start = time.perf_counter()
+    stats = await store.rebuild(memories, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {label:<8} {elapsed:7.2f} s  {len(memories) / elapsed:9.1f} memories/s  "
+        f"requests={endpoint.requests:<5} embedded={stats['embedded']:<5} "
+        f"reused={stats['reused']:<5} resumed={stats['resumed']}"
+    )
+    return stats
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--memories", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    endpoint = FakeEndpoint(args.latency_ms)
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(_create_app(endpoint), host="127.0.0.1", port=port, log_level="warning")
+    )
+    embed_kwargs = {"model": MODEL, "api_base": f"http://127.0.0.1:{port}/v1", "api_key": "x"}
+    embed_fn = partial(generate_embedding, **embed_kwargs)
+    embed_batch_fn = partial(generate_embeddings, **embed_kwargs)
+    memories = _memories(args.memories)
+
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    print(
+        f"rebuild of {args.memories} memories, {args.latency_ms:.0f} ms/request, "
+        f"batch={args.batch_size}, concurrency={args.concurrency}"
+    )
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = VectorStore(
+                path=tmp, collection_name="memories", embedding_dim=DIM, embedding_model=MODEL
+            )
+            await store.initialize()
+            batched = {
+                "embed_fn": embed_fn,
+                "embed_batch_fn": embed_batch_fn,
+                "batch_size": args.batch_size,
+                "concurrency": args.concurrency,
+            }
+            try:
+                endpoint.reset()
+                await _timed_rebuild(
+                    store, endpoint, memories, "serial", embed_fn=embed_fn, concurrency=1
+                )
+
+                # Changed content so nothing can be reused from the serial run
+                fresh = [{**m, "content": m["content"] + " v2"} for m in memories]
+                endpoint.reset()
+                await _timed_rebuild(store, endpoint, fresh, "batched", **batched)
+
+                endpoint.reset()
+                await _timed_rebuild(store, endpoint, fresh, "warm", **batched)
+
+                # Fail halfway through, then resume
+                changed = [{**m, "content": m["content"] + " v3"} for m in memories]
+                half = max(1, args.memories // args.batch_size // 2)
+                endpoint.reset(fail_after=half)
+                try:
+                    await store.rebuild(changed, **batched)
+                except RuntimeError:
+                    pass
+                print(
+                    f"  interrupted after {endpoint.texts} embeddings; "
+                    f"live count still {await store.count()}"
+                )
+                endpoint.reset()
+                await _timed_rebuild(store, endpoint, changed, "resume", **batched)
+            finally:
+                await store.close()
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
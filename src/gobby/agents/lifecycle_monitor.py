@@ -13,6 +13,7 @@ import asyncio
 import logging
 import os
 import signal
+import time
 from typing import TYPE_CHECKING
 
 from gobby.agents.checkpoint_manager import CheckpointManager
@@ -26,6 +27,7 @@ from gobby.config.tmux import TmuxConfig
 from gobby.storage.agents import AgentRun, LocalAgentRunManager
 
 if TYPE_CHECKING:
+    from gobby.agents.tmux.control_client import TmuxControlClient
     from gobby.events.completion_registry import CompletionEventRegistry
     from gobby.hooks.session_coordinator import SessionCoordinator
     from gobby.storage.checkpoints import LocalCheckpointManager
@@ -38,6 +40,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Output-triggered prompt checks: wait for the burst to settle, and check a
+# session at most once per interval
+_PROMPT_CHECK_DEBOUNCE = 0.25
+_PROMPT_CHECK_MIN_INTERVAL = 1.0
+
 
 class AgentLifecycleMonitor:
     """Periodically checks if agent processes are still alive.
@@ -50,6 +57,11 @@ class AgentLifecycleMonitor:
     - Expires the agent's session
     - Recovers claimed tasks back to 'open'
     - Releases any associated worktrees/clones
+
+    With a :class:`TmuxControlClient`, pane captures go over its shared
+    connection (cached while a pane is quiet) instead of a subprocess per
+    check, and trust/loop prompts are checked as soon as an agent's output
+    looks like one rather than on the next tick.
     """
 
     def __init__(
@@ -66,6 +78,7 @@ class AgentLifecycleMonitor:
         checkpoint_storage: LocalCheckpointManager | None = None,
         worktree_storage: LocalWorktreeManager | None = None,
         project_manager: LocalProjectManager | None = None,
+        control_client: TmuxControlClient | None = None,
     ) -> None:
         self._agent_run_manager = agent_run_manager
         self._db = db
@@ -90,6 +103,11 @@ class AgentLifecycleMonitor:
         self._task: asyncio.Task[None] | None = None
         # In-memory tracking for inherently non-persistable state
         self._master_fds: dict[str, int] = {}
+        self._control = control_client
+        self._runs_by_tmux: dict[str, AgentRun] = {}  # refreshed every prompt check tick
+        self._prompt_lock = asyncio.Lock()  # serializes tick and output-triggered checks
+        self._prompt_tasks: dict[str, asyncio.Task[None]] = {}
+        self._last_prompt_check: dict[str, float] = {}
 
     def set_session_coordinator(self, coordinator: SessionCoordinator) -> None:
         """Inject session coordinator after construction (avoids circular init ordering)."""
@@ -175,6 +193,8 @@ class AgentLifecycleMonitor:
         if self._running:
             return
         self._running = True
+        if self._control is not None:
+            self._control.add_listener(self._on_pane_output)
         self._task = asyncio.create_task(
             self._check_loop(),
             name="agent-lifecycle-monitor",
@@ -184,6 +204,11 @@ class AgentLifecycleMonitor:
     async def stop(self) -> None:
         """Stop the monitoring loop."""
         self._running = False
+        if self._control is not None:
+            self._control.remove_listener(self._on_pane_output)
+        for prompt_task in self._prompt_tasks.values():
+            prompt_task.cancel()
+        self._prompt_tasks.clear()
         if self._task:
             self._task.cancel()
             try:
@@ -245,29 +270,35 @@ class AgentLifecycleMonitor:
             Number of trust prompts dismissed.
         """
         runs = await asyncio.to_thread(self._get_active_terminal_runs)
+        await self._track_runs(runs)
 
         handled = 0
         for run in runs:
-            if self._prompt_detector.was_dismissed(run.id):
-                continue
+            async with self._prompt_lock:
+                handled += await self._handle_trust_prompt(run)
+        return handled
 
-            tmux_name = run.tmux_session_name
-            assert tmux_name is not None  # guaranteed by filter
+    async def _handle_trust_prompt(self, run: AgentRun) -> int:
+        """Dismiss a trust prompt for one agent. Returns 1 if dismissed."""
+        if self._prompt_detector.was_dismissed(run.id):
+            return 0
 
-            try:
-                pane_output = await self._tmux.capture_pane(tmux_name, lines=15)
-                if pane_output and self._prompt_detector.detect_trust_prompt(pane_output):
-                    sent = await self._tmux.send_keys(tmux_name, PromptDetector.TRUST_DISMISS_KEYS)
-                    if sent:
-                        self._prompt_detector.mark_dismissed(run.id)
-                        logger.info(
-                            f"Auto-dismissed trust prompt for agent {run.id} (trust parent folder)",
-                        )
-                        handled += 1
-            except Exception as e:
-                logger.warning(f"Error checking trust prompt for agent {run.id}: {e}")
+        tmux_name = run.tmux_session_name
+        assert tmux_name is not None  # guaranteed by filter
 
-        return handled
+        try:
+            pane_output = await self._capture_pane(tmux_name, lines=15)
+            if pane_output and self._prompt_detector.detect_trust_prompt(pane_output):
+                sent = await self._tmux.send_keys(tmux_name, PromptDetector.TRUST_DISMISS_KEYS)
+                if sent:
+                    self._prompt_detector.mark_dismissed(run.id)
+                    logger.info(
+                        f"Auto-dismissed trust prompt for agent {run.id} (trust parent folder)",
+                    )
+                    return 1
+        except Exception as e:
+            logger.warning(f"Error checking trust prompt for agent {run.id}: {e}")
+        return 0
 
     async def check_loop_prompts(self) -> int:
         """Check for loop detection prompts and auto-dismiss them.
@@ -284,34 +315,97 @@ class AgentLifecycleMonitor:
 
         handled = 0
         for run in runs:
-            tmux_name = run.tmux_session_name
-            assert tmux_name is not None  # guaranteed by filter
+            async with self._prompt_lock:
+                handled += await self._handle_loop_prompt(run)
+        return handled
 
-            try:
-                pane_output = await self._tmux.capture_pane(tmux_name, lines=15)
-                if pane_output and self._prompt_detector.detect_loop_prompt(pane_output):
-                    count = self._loop_tracker.record_dismissal(run.id)
-
-                    if self._loop_tracker.should_escalate(run.id):
-                        logger.warning(
-                            f"Doom loop detected for agent {run.id}: "
-                            f"{count} loop prompts dismissed, escalating to kill"
-                        )
-                        await self._checkpoint_and_kill_looping_agent(run)
-                    else:
-                        sent = await self._tmux.send_keys(
-                            tmux_name, PromptDetector.LOOP_DISMISS_KEYS
+    async def _handle_loop_prompt(self, run: AgentRun) -> int:
+        """Dismiss (or escalate) a loop prompt for one agent. Returns 1 if dismissed."""
+        tmux_name = run.tmux_session_name
+        assert tmux_name is not None  # guaranteed by filter
+
+        try:
+            pane_output = await self._capture_pane(tmux_name, lines=15)
+            if pane_output and self._prompt_detector.detect_loop_prompt(pane_output):
+                count = self._loop_tracker.record_dismissal(run.id)
+
+                if self._loop_tracker.should_escalate(run.id):
+                    logger.warning(
+                        f"Doom loop detected for agent {run.id}: "
+                        f"{count} loop prompts dismissed, escalating to kill"
+                    )
+                    await self._checkpoint_and_kill_looping_agent(run)
+                else:
+                    sent = await self._tmux.send_keys(tmux_name, PromptDetector.LOOP_DISMISS_KEYS)
+                    if sent:
+                        logger.info(
+                            f"Auto-dismissed loop prompt for agent {run.id} "
+                            f"({count}/{self._loop_tracker.threshold})"
                         )
-                        if sent:
-                            logger.info(
-                                f"Auto-dismissed loop prompt for agent {run.id} "
-                                f"({count}/{self._loop_tracker.threshold})"
-                            )
-                            handled += 1
-            except Exception as e:
-                logger.warning(f"Error checking loop prompt for agent {run.id}: {e}")
+                        return 1
+        except Exception as e:
+            logger.warning(f"Error checking loop prompt for agent {run.id}: {e}")
+        return 0
 
-        return handled
+    # ------------------------------------------------------------------
+    # tmux access (control mode when available)
+    # ------------------------------------------------------------------
+
+    async def _track_runs(self, runs: list[AgentRun]) -> None:
+        """Refresh the tmux session → run map and watch new sessions via control mode."""
+        self._runs_by_tmux = {r.tmux_session_name: r for r in runs if r.tmux_session_name}
+        for name in [n for n in self._last_prompt_check if n not in self._runs_by_tmux]:
+            del self._last_prompt_check[name]
+        if self._control is None:
+            return
+        for name in self._runs_by_tmux:
+            await self._control.watch(name)
+
+    async def _capture_pane(self, session_name: str, lines: int) -> str | None:
+        """Capture pane output, over the control connection when it watches the session."""
+        if self._control is not None and self._control.is_watching(session_name):
+            output = await self._control.capture_pane(session_name, lines=lines)
+            if output is not None:
+                return output
+        return await self._tmux.capture_pane(session_name, lines=lines)
+
+    async def _has_session(self, session_name: str) -> bool:
+        if self._control is not None:
+            alive = await self._control.has_session(session_name)
+            if alive is not None:
+                return alive
+        return await self._tmux.has_session(session_name)
+
+    def _on_pane_output(self, session_name: str, text: str) -> None:
+        """Control-mode listener: schedule a prompt check after an output burst."""
+        if session_name not in self._runs_by_tmux or session_name in self._prompt_tasks:
+            return
+        elapsed = time.monotonic() - self._last_prompt_check.get(session_name, 0.0)
+        delay = max(_PROMPT_CHECK_DEBOUNCE, _PROMPT_CHECK_MIN_INTERVAL - elapsed)
+        task = asyncio.create_task(
+            self._check_prompts_after_output(session_name, delay),
+            name=f"prompt-check-{session_name}",
+        )
+        self._prompt_tasks[session_name] = task
+        task.add_done_callback(lambda _t: self._prompt_tasks.pop(session_name, None))
+
+    async def _check_prompts_after_output(self, session_name: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._last_prompt_check[session_name] = time.monotonic()
+        run = self._runs_by_tmux.get(session_name)
+        if run is None or self._control is None:
+            return
+        # Cheap prefilter on the raw output tail; the capture confirms
+        recent = self._control.recent_text(session_name)
+        trust = self._prompt_detector.detect_trust_prompt(recent)
+        loop = self._prompt_detector.detect_loop_prompt(recent)
+        if not trust and not loop:
+            return
+        async with self._prompt_lock:
+            if trust:
+                await self._handle_trust_prompt(run)
+            if loop:
+                await self._handle_loop_prompt(run)
 
     async def _cleanup_agent(
         self,
@@ -438,7 +532,7 @@ class AgentLifecycleMonitor:
 
                 # Terminal agents: check if tmux/process died
                 if reason is None and run.tmux_session_name:
-                    tmux_alive = await self._tmux.has_session(run.tmux_session_name)
+                    tmux_alive = await self._has_session(run.tmux_session_name)
                     if tmux_alive:
                         if run.pid:
                             try:
@@ -465,7 +559,7 @@ class AgentLifecycleMonitor:
                 if run.tmux_session_name and not is_success:
                     try:
                         pane_snapshot = (
-                            await self._tmux.capture_pane(run.tmux_session_name, lines=50) or ""
+                            await self._capture_pane(run.tmux_session_name, lines=50) or ""
                         )
                     except Exception as e:
                         logger.debug(f"Failed to capture pane for agent {run.id}: {e}")
@@ -614,7 +708,7 @@ class AgentLifecycleMonitor:
                 # bottom of the pane. 30 lines would include the agent's own
                 # working output (code, task descriptions) which can contain
                 # false-positive text like "rate limit" in variable names.
-                pane_output = await self._tmux.capture_pane(tmux_name, lines=8)
+                pane_output = await self._capture_pane(tmux_name, lines=8)
                 classification = self._stall_classifier.classify(
                     run.id,
                     pane_output=pane_output,
@@ -681,7 +775,7 @@ class AgentLifecycleMonitor:
                     pass  # Fall through to pane-based detection
 
         # --- Secondary: pane patterns for specific actionable signals ---
-        pane_output = await self._tmux.capture_pane(tmux_name, lines=15)
+        pane_output = await self._capture_pane(tmux_name, lines=15)
         if pane_output is None:
             if session_stale:
                 # Session is stale but can't read pane — treat as idle
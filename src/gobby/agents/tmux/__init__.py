@@ -8,6 +8,7 @@ Public API::
     from gobby.agents.tmux import (
         get_tmux_session_manager,
         get_tmux_output_reader,
+        get_tmux_control_client,
         TmuxSpawner,
         TmuxConfig,
     )
@@ -18,6 +19,7 @@ from __future__ import annotations
 import threading
 
 from gobby.agents.tmux.config import TmuxConfig
+from gobby.agents.tmux.control_client import TmuxControlClient
 from gobby.agents.tmux.errors import TmuxNotFoundError, TmuxSessionError
 from gobby.agents.tmux.output_reader import TmuxOutputReader
 from gobby.agents.tmux.pane_monitor import TmuxPaneMonitor
@@ -28,6 +30,7 @@ from gobby.agents.tmux.wsl_compat import convert_windows_path_to_wsl, needs_wsl
 
 __all__ = [
     "TmuxConfig",
+    "TmuxControlClient",
     "TmuxNotFoundError",
     "TmuxOutputReader",
     "TmuxPaneMonitor",
@@ -36,6 +39,7 @@ __all__ = [
     "TmuxSessionManager",
     "TmuxSpawner",
     "convert_windows_path_to_wsl",
+    "get_tmux_control_client",
     "get_tmux_output_reader",
     "get_tmux_pane_monitor",
     "get_tmux_session_manager",
@@ -48,6 +52,7 @@ __all__ = [
 # ---------------------------------------------------------------------------
 _session_manager: TmuxSessionManager | None = None
 _output_reader: TmuxOutputReader | None = None
+_control_client: TmuxControlClient | None = None
 _pane_monitor: TmuxPaneMonitor | None = None
 _lock = threading.Lock()
 
@@ -62,13 +67,30 @@ def get_tmux_session_manager(config: TmuxConfig | None = None) -> TmuxSessionMan
     return _session_manager
 
 
+def get_tmux_control_client(config: TmuxConfig | None = None) -> TmuxControlClient:
+    """Return the global :class:`TmuxControlClient` singleton.
+
+    The client connects lazily, on the first session it is asked to watch.
+    """
+    global _control_client
+    if _control_client is None:
+        with _lock:
+            if _control_client is None:
+                _control_client = TmuxControlClient(config)
+    return _control_client
+
+
 def get_tmux_output_reader(config: TmuxConfig | None = None) -> TmuxOutputReader:
     """Return the global :class:`TmuxOutputReader` singleton."""
     global _output_reader
     if _output_reader is None:
+        # Resolved outside _lock, which is not reentrant
+        control_client = (
+            get_tmux_control_client(config) if (config or TmuxConfig()).control_mode else None
+        )
         with _lock:
             if _output_reader is None:
-                _output_reader = TmuxOutputReader(config)
+                _output_reader = TmuxOutputReader(config, control_client=control_client)
     return _output_reader
 
 
@@ -0,0 +1,492 @@
+"""Single ``tmux -C`` control-mode client per tmux server.
+
+Replaces per-agent ``capture-pane`` subprocesses and ``pipe-pane`` FIFOs
+with one long-lived connection:
+
+- Commands (``capture-pane``, ``has-session``, ...) are written to the
+  client's stdin and their ``%begin``/``%end`` replies read back, so a query
+  costs no process spawn.
+- ``%output`` notifications are decoded into a per-pane ring buffer and fanned
+  out to listeners (the lifecycle monitor's prompt detection and the web UI
+  terminal stream).
+- Captures are cached per pane until the pane produces new output, so
+  repeated checks of a quiet agent cost nothing.
+
+A control client only receives output for panes in its attached session, so
+the client attaches to a hidden session (``CONTROL_SESSION_NAME``) and
+each watched agent window is linked into it with ``link-window``. The client
+is flagged ``ignore-size`` so linking never resizes agent panes. A window
+that outlives its agent session (linked only into the control session) is
+killed when tmux reports ``%sessions-changed``, and the control session is
+``destroy-unattached`` so it disappears with the daemon.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import inspect
+import logging
+import re
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from gobby.agents.tmux.config import TmuxConfig
+from gobby.agents.tmux.errors import TmuxSessionError
+from gobby.agents.tmux.session_manager import CONTROL_SESSION_NAME, TmuxSessionManager
+
+logger = logging.getLogger(__name__)
+
+_CONTROL_WINDOW_NAME = "_control"
+
+# Bytes of recent output kept per pane
+DEFAULT_BUFFER_BYTES = 64 * 1024
+
+# %output lines can be long; asyncio's default 64 KiB readline limit is not enough
+_READ_LIMIT = 4 * 1024 * 1024
+
+_OCTAL_ESCAPE = re.compile(rb"\\([0-7]{3})")
+
+# CSI / OSC / two-character escape sequences written by terminal UIs
+_TERMINAL_ESCAPE = re.compile(
+    r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+# Called with (session_name, text) for each %output chunk. Listeners run on the
+# reader task: they must not await commands on the client, only schedule work.
+OutputListener = Callable[[str, str], Awaitable[None] | None]
+
+
+def decode_output(data: bytes) -> bytes:
+    """Undo control-mode escaping (``\\ooo`` for control characters and backslash)."""
+    return _OCTAL_ESCAPE.sub(lambda m: bytes([int(m.group(1), 8)]), data)
+
+
+def quote_argument(arg: str) -> str:
+    """Quote one argument for the tmux command parser."""
+    if "\n" in arg or "\r" in arg:
+        raise ValueError("control-mode commands cannot contain newlines")
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+@dataclass
+class _PaneState:
+    """Output buffer and capture cache for one watched pane."""
+
+    session_name: str
+    pane_id: str
+    window_id: str
+    max_bytes: int
+    buffer: bytearray = field(default_factory=bytearray)
+    seq: int = 0  # total bytes of output seen
+    last_output: float | None = None  # time.monotonic() of the last %output
+    captures: dict[int, tuple[int, str]] = field(default_factory=dict)  # lines -> (seq, text)
+    decoder: codecs.IncrementalDecoder = field(
+        default_factory=lambda: codecs.getincrementaldecoder("utf-8")(errors="replace")
+    )
+
+    def append(self, data: bytes) -> str:
+        self.buffer += data
+        if len(self.buffer) > self.max_bytes:
+            del self.buffer[: len(self.buffer) - self.max_bytes]
+        self.seq += len(data)
+        self.last_output = time.monotonic()
+        return self.decoder.decode(data)
+
+
+@dataclass
+class _Pending:
+    future: asyncio.Future[list[str]]
+    lines: list[str] = field(default_factory=list)
+
+
+class TmuxControlClient:
+    """Long-lived control-mode connection to one tmux server.
+
+    All methods degrade gracefully: when the client can't start (tmux missing,
+    too old for ``ignore-size``), :meth:`watch` returns False and callers keep
+    using per-call subprocesses via :class:`TmuxSessionManager`.
+    """
+
+    def __init__(
+        self,
+        config: TmuxConfig | None = None,
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+    ) -> None:
+        self._config = config or TmuxConfig()
+        self._buffer_bytes = buffer_bytes
+        self._proc: asyncio.subprocess.Process | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: deque[_Pending] = deque()
+        self._current: _Pending | None = None
+        self._write_lock = asyncio.Lock()
+        self._start_lock = asyncio.Lock()
+        self._watch_lock = asyncio.Lock()
+        self._panes: dict[str, _PaneState] = {}  # pane_id -> state
+        self._sessions: dict[str, _PaneState] = {}  # session name -> state
+        self._listeners: list[OutputListener] = []
+        self._background: set[asyncio.Task[None]] = set()
+        self._start_failed_at: float | None = None
+        # Counters for benchmarks and diagnostics
+        self.commands_sent = 0
+        self.capture_cache_hits = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    def add_listener(self, listener: OutputListener) -> None:
+        """Register a listener for decoded output of watched panes."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: OutputListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> bool:
+        """Connect the control client if not already running.
+
+        Returns:
+            True if the client is running. A failed start is not retried for
+            30 seconds so callers on every tick don't respawn tmux repeatedly.
+        """
+        if self.is_running:
+            return True
+        async with self._start_lock:
+            if self.is_running:
+                return True
+            if self._start_failed_at and time.monotonic() - self._start_failed_at < 30.0:
+                return False
+            try:
+                await self._connect()
+            except Exception as e:
+                logger.info(f"tmux control mode unavailable, using per-call tmux commands: {e}")
+                self._start_failed_at = time.monotonic()
+                await self._terminate()
+                return False
+            self._start_failed_at = None
+            return True
+
+    async def _connect(self) -> None:
+        base = TmuxSessionManager(self._config)._base_args()
+        self._proc = await asyncio.create_subprocess_exec(
+            *base,
+            "-C",
+            "new-session",
+            "-A",
+            "-s",
+            CONTROL_SESSION_NAME,
+            "-n",
+            _CONTROL_WINDOW_NAME,
+            "cat",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_READ_LIMIT,
+        )
+        # The attach itself produces the first %begin/%end block
+        initial = _Pending(asyncio.get_running_loop().create_future())
+        self._pending.append(initial)
+        self._reader_task = asyncio.create_task(self._read_loop(), name="tmux-control-reader")
+        await asyncio.wait_for(initial.future, timeout=5.0)
+
+        await self.command("refresh-client", "-f", "ignore-size")
+        await self.command("set-option", "-t", CONTROL_SESSION_NAME, "destroy-unattached", "on")
+        # Drop links left behind by a previous daemon, killing orphaned windows
+        for window_id, linked, name in await self._list_control_windows():
+            if name == _CONTROL_WINDOW_NAME:
+                continue
+            if linked > 1:
+                await self.command("unlink-window", "-t", f"{CONTROL_SESSION_NAME}:{window_id}")
+            else:
+                await self.command("kill-window", "-t", window_id)
+        logger.info(f"tmux control client connected (socket={self._config.socket_name})")
+
+    async def stop(self) -> None:
+        """Disconnect; the control session and any orphaned windows go with it."""
+        if self.is_running:
+            try:
+                await self.command("kill-session", "-t", CONTROL_SESSION_NAME, timeout=2.0)
+            except (TmuxSessionError, TimeoutError):
+                pass
+        await self._terminate()
+
+    async def _terminate(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.returncode is None:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        self._fail_pending("tmux control client stopped")
+        self._panes.clear()
+        self._sessions.clear()
+
+    def _fail_pending(self, reason: str) -> None:
+        pending = [self._current] if self._current else []
+        pending.extend(self._pending)
+        self._current = None
+        self._pending.clear()
+        for entry in pending:
+            if not entry.future.done():
+                entry.future.set_exception(TmuxSessionError(reason))
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    async def command(self, *args: str, timeout: float = 5.0) -> list[str]:
+        """Run a tmux command over the control connection.
+
+        Returns:
+            The command's output lines.
+
+        Raises:
+            TmuxSessionError: If the command failed or the client is not running.
+        """
+        proc = self._proc
+        if proc is None or proc.returncode is not None or proc.stdin is None:
+            raise TmuxSessionError("tmux control client is not running")
+        line = " ".join(quote_argument(a) for a in args) + "\n"
+        entry = _Pending(asyncio.get_running_loop().create_future())
+        async with self._write_lock:
+            self._pending.append(entry)
+            proc.stdin.write(line.encode())
+            self.commands_sent += 1
+            await proc.stdin.drain()
+        return await asyncio.wait_for(entry.future, timeout=timeout)
+
+    async def _list_control_windows(self) -> list[tuple[str, int, str]]:
+        lines = await self.command(
+            "list-windows",
+            "-t",
+            CONTROL_SESSION_NAME,
+            "-F",
+            "#{window_id}\t#{window_linked_sessions}\t#{window_name}",
+        )
+        windows = []
+        for line in lines:
+            parts = line.split("\t")
+            if len(parts) == 3 and parts[1].isdigit():
+                windows.append((parts[0], int(parts[1]), parts[2]))
+        return windows
+
+    # ------------------------------------------------------------------
+    # Watching panes
+    # ------------------------------------------------------------------
+
+    def is_watching(self, session_name: str) -> bool:
+        return self.is_running and session_name in self._sessions
+
+    async def watch(self, session_name: str) -> bool:
+        """Start receiving output for *session_name*'s pane.
+
+        Returns:
+            True if the session is watched (now or already).
+        """
+        if self.is_watching(session_name):
+            return True
+        if not await self.start():
+            return False
+        async with self._watch_lock:
+            if session_name in self._sessions:
+                return True
+            try:
+                lines = await self.command(
+                    "display-message", "-p", "-t", session_name, "#{pane_id}\t#{window_id}"
+                )
+                pane_id, window_id = lines[0].split("\t")
+                await self.command(
+                    "link-window", "-d", "-s", window_id, "-t", f"{CONTROL_SESSION_NAME}:"
+                )
+            except (TmuxSessionError, TimeoutError, ValueError, IndexError) as e:
+                logger.debug(f"Could not watch tmux session '{session_name}': {e}")
+                return False
+            state = _PaneState(session_name, pane_id, window_id, self._buffer_bytes)
+            self._panes[pane_id] = state
+            self._sessions[session_name] = state
+        logger.debug(f"Watching tmux session '{session_name}' ({pane_id})")
+        return True
+
+    async def unwatch(self, session_name: str) -> None:
+        """Stop receiving output for *session_name* (the agent keeps running)."""
+        state = self._sessions.pop(session_name, None)
+        if state is None:
+            return
+        self._panes.pop(state.pane_id, None)
+        try:
+            await self.command("unlink-window", "-t", f"{CONTROL_SESSION_NAME}:{state.window_id}")
+        except (TmuxSessionError, TimeoutError):
+            pass
+
+    def _forget_window(self, window_id: str) -> None:
+        for state in [s for s in self._panes.values() if s.window_id == window_id]:
+            self._panes.pop(state.pane_id, None)
+            self._sessions.pop(state.session_name, None)
+
+    async def _reap_orphans(self) -> None:
+        """Kill linked windows whose agent session was destroyed."""
+        try:
+            for window_id, linked, name in await self._list_control_windows():
+                if name != _CONTROL_WINDOW_NAME and linked <= 1:
+                    self._forget_window(window_id)
+                    await self.command("kill-window", "-t", window_id)
+        except (TmuxSessionError, TimeoutError) as e:
+            logger.debug(f"tmux control: orphan cleanup failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    async def capture_pane(self, session_name: str, lines: int = 5) -> str | None:
+        """Capture the last *lines* of a watched pane (same output as ``capture-pane -p -J``).
+
+        Served from cache while the pane has produced no output since the
+        last capture of the same size.
+
+        Returns:
+            Captured text, or None if the session isn't watched or is gone.
+        """
+        state = self._sessions.get(session_name)
+        if state is None or not self.is_running:
+            return None
+        cached = state.captures.get(lines)
+        if cached is not None and cached[0] == state.seq:
+            self.capture_cache_hits += 1
+            return cached[1]
+        seq = state.seq
+        try:
+            output = await self.command(
+                "capture-pane", "-t", state.pane_id, "-p", "-J", f"-S-{lines}"
+            )
+        except (TmuxSessionError, TimeoutError):
+            return None
+        text = "".join(f"{line}\n" for line in output)
+        state.captures[lines] = (seq, text)
+        return text
+
+    async def has_session(self, session_name: str) -> bool | None:
+        """Check a session over the control connection; None if not running."""
+        if not self.is_running:
+            return None
+        try:
+            await self.command("has-session", "-t", session_name)
+            return True
+        except TmuxSessionError:
+            return False if self.is_running else None
+        except TimeoutError:
+            return None
+
+    def recent_output(self, session_name: str) -> bytes:
+        """Raw bytes most recently written to a watched pane (up to the buffer size)."""
+        state = self._sessions.get(session_name)
+        return bytes(state.buffer) if state else b""
+
+    def recent_text(self, session_name: str, max_bytes: int = 4096) -> str:
+        """Tail of a watched pane's output as plain text.
+
+        Escape sequences become spaces (TUIs often move the cursor instead of
+        writing spaces) and whitespace runs are collapsed, which is enough for
+        a cheap pattern prefilter before confirming with :meth:`capture_pane`.
+        """
+        state = self._sessions.get(session_name)
+        if state is None:
+            return ""
+        text = bytes(state.buffer[-max_bytes:]).decode("utf-8", errors="replace")
+        return _WHITESPACE.sub(" ", _TERMINAL_ESCAPE.sub(" ", text))
+
+    def last_output_at(self, session_name: str) -> float | None:
+        """``time.monotonic()`` of the pane's last output, if watched and seen."""
+        state = self._sessions.get(session_name)
+        return state.last_output if state else None
+
+    # ------------------------------------------------------------------
+    # Reader
+    # ------------------------------------------------------------------
+
+    async def _read_loop(self) -> None:
+        proc = self._proc
+        assert proc is not None and proc.stdout is not None
+        try:
+            while True:
+                raw = await proc.stdout.readline()
+                if not raw:
+                    break
+                await self._handle_line(raw.rstrip(b"\n"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"tmux control reader error: {e}")
+        finally:
+            self._fail_pending("tmux control client disconnected")
+            self._panes.clear()
+            self._sessions.clear()
+            if self._proc is proc:
+                logger.info("tmux control client disconnected")
+
+    async def _handle_line(self, raw: bytes) -> None:
+        if self._current is not None:
+            if raw.startswith((b"%end ", b"%error ")):
+                entry, self._current = self._current, None
+                if entry.future.done():
+                    return
+                if raw.startswith(b"%end "):
+                    entry.future.set_result(entry.lines)
+                else:
+                    entry.future.set_exception(TmuxSessionError("\n".join(entry.lines).strip()))
+            else:
+                self._current.lines.append(raw.decode("utf-8", errors="replace"))
+            return
+
+        if raw.startswith(b"%output "):
+            pane_id, _, data = raw[8:].partition(b" ")
+            state = self._panes.get(pane_id.decode())
+            if state is not None:
+                await self._dispatch(state, decode_output(data))
+        elif raw.startswith(b"%begin "):
+            if self._pending:
+                self._current = self._pending.popleft()
+            else:
+                # Reply to a command we didn't send (cannot happen); swallow it
+                self._current = _Pending(asyncio.get_running_loop().create_future())
+        elif raw.startswith(b"%sessions-changed"):
+            self._spawn(self._reap_orphans())
+        elif raw.startswith(b"%window-close ") or raw.startswith(b"%unlinked-window-close "):
+            self._forget_window(raw.split(b" ", 1)[1].decode().strip())
+        elif raw.startswith(b"%exit"):
+            logger.debug(f"tmux control client exiting: {raw.decode(errors='replace')}")
+
+    async def _dispatch(self, state: _PaneState, data: bytes) -> None:
+        text = state.append(data)
+        if not text:
+            return
+        for listener in list(self._listeners):
+            try:
+                result = listener(state.session_name, text)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"tmux output listener error for {state.session_name}: {e}")
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
@@ -1,7 +1,9 @@
-"""Stream tmux pane output to the web UI via pipe-pane and a FIFO.
+"""Stream tmux pane output to the web UI.
 
-Mirrors the :class:`PTYReaderManager` interface so the runner can wire
-both readers identically.
+Output comes from the shared :class:`TmuxControlClient` when one is
+available (no per-agent processes or polling); otherwise each agent gets a
+``pipe-pane`` into a FIFO. Mirrors the :class:`PTYReaderManager` interface
+so the runner can wire both readers identically.
 """
 
 from __future__ import annotations
@@ -14,9 +16,13 @@ import shlex
 import stat
 import tempfile
 from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
 
 from gobby.agents.tmux.config import TmuxConfig
 
+if TYPE_CHECKING:
+    from gobby.agents.tmux.control_client import TmuxControlClient
+
 logger = logging.getLogger(__name__)
 
 # Same signature as pty_reader.OutputCallback
@@ -24,9 +30,13 @@ OutputCallback = Callable[[str, str], Awaitable[None]]
 
 
 class TmuxOutputReader:
-    """Streams output from tmux panes via ``pipe-pane`` to a named FIFO.
+    """Streams output from tmux panes to the output callback.
+
+    With a control client, ``start_reader`` links the session into the
+    control client and forwards its ``%output`` notifications. Without one
+    (or if watching fails) it falls back to ``pipe-pane`` and a named FIFO.
 
-    Lifecycle per agent:
+    FIFO lifecycle per agent:
 
     1. ``start_reader(run_id, session_name)``
        - Creates ``/tmp/gobby-tmux-<session>.pipe`` FIFO.
@@ -38,8 +48,14 @@ class TmuxOutputReader:
        - Cancels the read task and unlinks the FIFO.
     """
 
-    def __init__(self, config: TmuxConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: TmuxConfig | None = None,
+        control_client: TmuxControlClient | None = None,
+    ) -> None:
         self._config = config or TmuxConfig()
+        self._control = control_client
+        self._control_runs: dict[str, str] = {}  # run_id → tmux session (control mode)
         self._output_callback: OutputCallback | None = None
         self._reader_tasks: dict[str, asyncio.Task[None]] = {}
         self._stop_events: dict[str, asyncio.Event] = {}
@@ -91,9 +107,17 @@ class TmuxOutputReader:
         Returns True if the reader was started, False if already running.
         """
         async with self._lock:
-            if run_id in self._reader_tasks:
+            if run_id in self._reader_tasks or run_id in self._control_runs:
                 return False
 
+            if self._control is not None and await self._control.watch(session_name):
+                self._control.add_listener(self._on_control_output)
+                self._control_runs[run_id] = session_name
+                logger.debug(
+                    f"Streaming tmux output for {run_id} ({session_name}) via control mode"
+                )
+                return True
+
             # Create FIFO
             fifo_dir = tempfile.gettempdir()
             socket_prefix = self._config.socket_name or "default"
@@ -144,6 +168,10 @@ class TmuxOutputReader:
     async def stop_reader(self, run_id: str) -> bool:
         """Stop streaming for a given run_id. Returns True if stopped."""
         async with self._lock:
+            if self._control_runs.pop(run_id, None) is not None:
+                logger.debug(f"Stopped tmux output reader for {run_id}")
+                return True
+
             stop_event = self._stop_events.pop(run_id, None)
             task = self._reader_tasks.pop(run_id, None)
             fifo_path = self._fifo_paths.pop(run_id, None)
@@ -183,10 +211,26 @@ class TmuxOutputReader:
     async def stop_all(self) -> None:
         """Stop all active readers."""
         async with self._lock:
-            run_ids = list(self._reader_tasks.keys())
+            run_ids = [*self._reader_tasks, *self._control_runs]
         for run_id in run_ids:
             await self.stop_reader(run_id)
 
+    # ------------------------------------------------------------------
+    # Control mode
+    # ------------------------------------------------------------------
+
+    async def _on_control_output(self, session_name: str, text: str) -> None:
+        """Forward a control-mode output chunk to every run streaming the session."""
+        if not self._output_callback:
+            return
+        for run_id, name in list(self._control_runs.items()):
+            if name != session_name:
+                continue
+            try:
+                await self._output_callback(run_id, text)
+            except Exception as e:
+                logger.warning(f"Output callback error for {run_id}: {e}")
+
     # ------------------------------------------------------------------
     # Read loop
     # ------------------------------------------------------------------
@@ -17,6 +17,9 @@ from dataclasses import dataclass, field
 from gobby.agents.tmux.config import TmuxConfig
 from gobby.agents.tmux.errors import TmuxNotFoundError, TmuxSessionError
 
+# Hidden session the control-mode client attaches to (see control_client.py)
+CONTROL_SESSION_NAME = "_gobby_control"
+
 logger = logging.getLogger(__name__)
 
 
@@ -305,6 +308,8 @@ class TmuxSessionManager:
             parts = line.split("\t")
             if len(parts) >= 2:
                 name = parts[0]
+                if name == CONTROL_SESSION_NAME:
+                    continue
                 pid_str = parts[1]
                 pid = int(pid_str) if pid_str.isdigit() else None
                 pane_id = parts[2] if len(parts) > 2 and parts[2] else None
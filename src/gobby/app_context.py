@@ -186,6 +186,7 @@ class ServiceContainer:
                 template_engine=TemplateEngine(),
                 session_manager=self.session_manager,
                 completion_registry=self.completion_registry,
+                config=self.config.pipelines,
             )
 
             # Wire event broadcasting via WebSocket
@@ -1,45 +1,108 @@
 """
 Gobby CLI entry point.
+
+Subcommands are registered by import path in COMMANDS and only imported when
+invoked (see gobby.cli._lazy). Keep this module's imports light: they are paid
+by every CLI invocation, including ``gobby --help``.
 """
 
+from typing import TYPE_CHECKING
+
 import click
 
-from gobby.config.app import load_config
+from ._lazy import CliState, LazyCommand, LazyGroup
+
+if TYPE_CHECKING:
+    from gobby.config.app import DaemonConfig
+
+# name -> (import path, one-line help shown by `gobby --help`)
+COMMANDS: dict[str, LazyCommand] = {
+    "start": LazyCommand("gobby.cli.daemon:start", "Start the Gobby daemon."),
+    "stop": LazyCommand("gobby.cli.daemon:stop", "Stop the Gobby daemon."),
+    "restart": LazyCommand(
+        "gobby.cli.daemon:restart", "Restart the Gobby daemon (stop then start)."
+    ),
+    "status": LazyCommand("gobby.cli.daemon:status", "Show Gobby daemon status and information."),
+    "mcp-server": LazyCommand(
+        "gobby.cli.mcp:mcp_server", "Run stdio MCP server for AI CLI integration."
+    ),
+    "init": LazyCommand(
+        "gobby.cli.init:init", "Initialize a new Gobby project in the current directory."
+    ),
+    "setup": LazyCommand("gobby.cli.setup:setup", "First-run setup wizard."),
+    "install": LazyCommand(
+        "gobby.cli.install:install", "Install Gobby hooks to AI coding CLIs and Git."
+    ),
+    "uninstall": LazyCommand(
+        "gobby.cli.install:uninstall", "Uninstall Gobby hooks from AI coding CLIs."
+    ),
+    "tasks": LazyCommand("gobby.cli.tasks.main:tasks", "Manage development tasks."),
+    "memory": LazyCommand("gobby.cli.memory:memory", "Manage Gobby memories."),
+    "sessions": LazyCommand("gobby.cli.sessions:sessions", "Manage Gobby sessions."),
+    "skills": LazyCommand("gobby.cli.skills:skills", "Manage Gobby skills."),
+    "agents": LazyCommand("gobby.cli.agents:agents", "Manage subagent runs."),
+    "worktrees": LazyCommand(
+        "gobby.cli.worktrees:worktrees", "Manage git worktrees for parallel development."
+    ),
+    "mcp-proxy": LazyCommand(
+        "gobby.cli.mcp_proxy:mcp_proxy", "Manage MCP proxy servers and tools."
+    ),
+    "projects": LazyCommand("gobby.cli.projects:projects", "Manage Gobby projects."),
+    "rules": LazyCommand("gobby.cli.rules:rules", "Manage Gobby rules."),
+    "workflows": LazyCommand("gobby.cli.workflows:workflows", "Manage Gobby workflows."),
+    "merge": LazyCommand(
+        "gobby.cli.merge:merge", "Manage merge operations with AI-powered conflict resolution."
+    ),
+    "pipelines": LazyCommand("gobby.cli.pipelines:pipelines", "Manage Gobby pipelines."),
+    "github": LazyCommand("gobby.cli.github:github", "GitHub integration commands."),
+    "linear": LazyCommand("gobby.cli.linear:linear", "Linear integration commands."),
+    "clones": LazyCommand("gobby.cli.clones:clones", "Manage git clones for parallel development."),
+    "cron": LazyCommand("gobby.cli.cron:cron", "Manage cron jobs."),
+    "hooks": LazyCommand(
+        "gobby.cli.extensions:hooks", "Manage hook system configuration and testing."
+    ),
+    "webhooks": LazyCommand("gobby.cli.extensions:webhooks", "Manage webhook endpoints."),
+    "ui": LazyCommand("gobby.cli.ui:ui", "Web UI management and development commands."),
+    "sync": LazyCommand(
+        "gobby.cli.sync:sync",
+        "Sync bundled content (skills, prompts, rules, agents, workflows) to the database.",
+    ),
+    "auth": LazyCommand(
+        "gobby.cli.auth:auth", "Set up or reset web UI authentication credentials."
+    ),
+    "secrets": LazyCommand(
+        "gobby.cli.secrets:secrets", "Manage encrypted secrets (API keys, tokens, etc.)."
+    ),
+    "service": LazyCommand(
+        "gobby.cli.service:service", "Manage the Gobby daemon as an OS-level service."
+    ),
+    "export": LazyCommand(
+        "gobby.cli.export_import:export_cmd", "Export resources from the current project."
+    ),
+    "import": LazyCommand(
+        "gobby.cli.export_import:import_cmd", "Import resources into the current project."
+    ),
+    "qdrant": LazyCommand("gobby.cli.qdrant:qdrant", "Manage Qdrant vector database service."),
+    "pack": LazyCommand(
+        "gobby.cli.pack:pack", "Pack all Gobby data into a portable archive for machine migration."
+    ),
+    "unpack": LazyCommand(
+        "gobby.cli.pack:unpack", "Unpack a Gobby archive to restore data on a new machine."
+    ),
+    "comms": LazyCommand(
+        "gobby.cli.communications:comms", "Manage communications channels and messages."
+    ),
+}
+
 
-from .agents import agents
-from .auth import auth
-from .clones import clones
-from .communications import comms
-from .cron import cron
-from .daemon import restart, start, status, stop
-from .export_import import export_cmd, import_cmd
-from .extensions import hooks, webhooks
-from .github import github
-from .init import init
-from .install import install, uninstall
-from .linear import linear
-from .mcp import mcp_server
-from .mcp_proxy import mcp_proxy
-from .memory import memory
-from .merge import merge
-from .pack import pack, unpack
-from .pipelines import pipelines
-from .projects import projects
-from .qdrant import qdrant
-from .rules import rules
-from .secrets import secrets
-from .service import service
-from .sessions import sessions
-from .setup import setup
-from .skills import skills
-from .sync import sync
-from .tasks import tasks
-from .ui import ui
-from .workflows import workflows
-from .worktrees import worktrees
+def load_config(config_file: str | None = None) -> "DaemonConfig":
+    """Load daemon config (imported on demand; config models are slow to import)."""
+    from gobby.config.app import load_config as _load_config
 
+    return _load_config(config_file)
 
-@click.group()
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.option(
     "--config",
     type=click.Path(exists=True),
@@ -48,48 +111,5 @@ from .worktrees import worktrees
 @click.pass_context
 def cli(ctx: click.Context, config: str | None) -> None:
     """Gobby - Local-first daemon for AI coding assistants."""
-    # Store config in context for subcommands
-    ctx.ensure_object(dict)
-    ctx.obj["config"] = load_config(config)
-
-
-# Register commands
-cli.add_command(start)
-cli.add_command(stop)
-cli.add_command(restart)
-cli.add_command(status)
-cli.add_command(mcp_server)
-cli.add_command(init)
-cli.add_command(setup)
-cli.add_command(install)
-cli.add_command(uninstall)
-cli.add_command(tasks)
-cli.add_command(memory)
-cli.add_command(sessions)
-cli.add_command(skills)
-cli.add_command(agents)
-cli.add_command(worktrees)
-cli.add_command(mcp_proxy)
-cli.add_command(projects)
-cli.add_command(rules)
-cli.add_command(workflows)
-cli.add_command(merge)
-cli.add_command(pipelines)
-cli.add_command(github)
-cli.add_command(linear)
-cli.add_command(clones)
-cli.add_command(cron)
-cli.add_command(hooks)
-cli.add_command(webhooks)
-cli.add_command(ui)
-cli.add_command(sync)
-cli.add_command(auth)
-cli.add_command(secrets)
-cli.add_command(service)
-cli.add_command(export_cmd)
-cli.add_command(import_cmd)
-
-cli.add_command(qdrant)
-cli.add_command(pack)
-cli.add_command(unpack)
-cli.add_command(comms)
+    # Subcommands read ctx.obj["config"]; it's loaded on first access
+    ctx.obj = CliState(lambda: load_config(config))
@@ -0,0 +1,94 @@
+"""
+Lazy command loading for the gobby CLI.
+
+Command modules pull in most of the daemon (storage, MCP, config models), so
+the root group only imports a subcommand's module when that subcommand is
+invoked. Top-level help is rendered from the registry's help text.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import click
+
+
+class LazyCommand(NamedTuple):
+    """Registry entry: ``"module:attribute"`` import path and one-line help."""
+
+    import_path: str
+    short_help: str
+
+
+class LazyGroup(click.Group):
+    """Click group that resolves subcommands from a static registry on demand."""
+
+    def __init__(
+        self, *args: Any, lazy_commands: dict[str, LazyCommand] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, LazyCommand] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self.load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def load_command(self, cmd_name: str) -> click.Command:
+        """Import a registered command."""
+        module_name, _, attribute = self.lazy_commands[cmd_name].import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attribute} is not a click command")
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List commands without importing the ones that haven't been loaded."""
+        commands: list[tuple[str, click.Command | None]] = []
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is None or not command.hidden:
+                commands.append((name, command))
+        if not commands:
+            return
+
+        # allow for 3 times the default spacing (as click.Group does)
+        limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+        rows = []
+        for name, command in commands:
+            if command is None:
+                # Throwaway command so truncation matches click's
+                help_text = self.lazy_commands[name].short_help
+                short_help = click.Command(name, help=help_text).get_short_help_str(limit)
+            else:
+                short_help = command.get_short_help_str(limit)
+            rows.append((name, short_help))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+class CliState(dict[str, Any]):
+    """``ctx.obj`` for the CLI: ``"config"`` is loaded on first access."""
+
+    def __init__(self, load_config: Callable[[], Any]) -> None:
+        super().__init__()
+        self._load_config = load_config
+
+    def __missing__(self, key: str) -> Any:
+        if key != "config":
+            raise KeyError(key)
+        config = self["config"] = self._load_config()
+        return config
+
+    def __contains__(self, key: object) -> bool:
+        return key == "config" or super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "config":
+            return self[key]
+        return super().get(key, default)
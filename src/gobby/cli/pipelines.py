@@ -54,6 +54,7 @@ def get_pipeline_executor() -> Any:
     Creates a lightweight executor with template rendering support.
     MCP tool steps require the daemon; use _try_daemon_run() first.
     """
+    from gobby.config.app import load_config
     from gobby.storage.database import LocalDatabase
     from gobby.storage.pipelines import LocalPipelineExecutionManager
     from gobby.workflows.pipeline_executor import PipelineExecutor
@@ -70,6 +71,7 @@ def get_pipeline_executor() -> Any:
         llm_service=None,  # Not needed for exec steps
         loader=get_workflow_loader(),
         template_engine=TemplateEngine(),
+        config=load_config().pipelines,
     )
 
 
@@ -250,6 +250,20 @@ def doctor_cmd() -> None:
     else:
         click.echo("✓ No dependency cycles")
 
+    drift = results.get("readiness_drift", [])
+    if drift:
+        issues_found = True
+        drifted = {d["task_id"] for d in drift}
+        click.echo(f"Found stale readiness state for {len(drifted)} tasks:", err=True)
+        for d in drift[:20]:
+            click.echo(
+                f"  Task {d['task_id']}: {d['field']} is {d['stored']!r}, "
+                f"expected {d['expected']!r}",
+                err=True,
+            )
+    else:
+        click.echo("✓ Task readiness in sync")
+
     if issues_found:
         click.echo("\nIssues found. Run 'gobby tasks clean' to fix fixable issues.")
         # Exit with error code if issues found
@@ -257,9 +271,11 @@ def doctor_cmd() -> None:
 
 
 @tasks.command("clean")
-@click.confirmation_option(prompt="This will remove orphaned dependencies. Are you sure?")
+@click.confirmation_option(
+    prompt="This will remove orphaned dependencies and rebuild task readiness. Are you sure?"
+)
 def clean_cmd() -> None:
-    """Fix data integrity issues (remove orphans)."""
+    """Fix data integrity issues (remove orphans, rebuild readiness)."""
     manager = get_task_manager()
     from gobby.utils.validation import TaskValidator
 
@@ -270,3 +286,6 @@ def clean_cmd() -> None:
         click.echo(f"Removed {count} orphan dependencies.")
     else:
         click.echo("No orphan dependencies found.")
+
+    rebuilt = manager.rebuild_readiness()
+    click.echo(f"Rebuilt readiness state for {rebuilt} tasks.")
@@ -61,6 +61,7 @@ class CodeIndexContext:
             asyncio.to_thread(self._storage.delete_symbols_for_project, project_id),
             asyncio.to_thread(self._storage.delete_files_for_project, project_id),
             asyncio.to_thread(self._storage.delete_content_chunks_for_project, project_id),
+            asyncio.to_thread(self._storage.delete_sync_items_for_project, project_id),
         )
 
         if self._graph is not None:
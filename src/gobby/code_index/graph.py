@@ -1,27 +1,60 @@
-"""Neo4j call/import graph operations for code symbols.
+"""Call/import graph operations for code symbols.
 
 Wraps existing Neo4jClient with code-specific node types and relationships.
-All methods return empty results if Neo4j is not available.
+Caller, callee, usage and blast-radius queries fall back to
+``LocalCodeGraph`` (built from the SQLite code index) when Neo4j is not
+configured; writes and visualization queries are Neo4j-only and return
+empty results without it.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable, Sequence
 from typing import Any
 
+from gobby.code_index.local_graph import LocalCodeGraph
+
 logger = logging.getLogger(__name__)
 
+# Deepest traversal any graph query will run
+MAX_DEPTH = 5
+
 
 class CodeGraph:
-    """Code-specific graph operations wrapping Neo4jClient."""
+    """Code-specific graph operations over Neo4j or the local SQLite graph."""
 
-    def __init__(self, neo4j_client: Any | None = None) -> None:
+    def __init__(
+        self, neo4j_client: Any | None = None, local: LocalCodeGraph | None = None
+    ) -> None:
         self._client: Any = neo4j_client
+        self._local = local
 
     @property
     def available(self) -> bool:
+        """Whether Neo4j is configured (graph writes and visualization)."""
         return self._client is not None
 
+    @property
+    def local(self) -> LocalCodeGraph | None:
+        return self._local
+
+    @property
+    def queryable(self) -> bool:
+        """Whether caller/usage/blast-radius queries have a backend."""
+        return self.available or self._local is not None
+
+    async def _query_local(
+        self, query: Callable[..., list[dict[str, Any]]], *args: Any, **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """Run a LocalCodeGraph query off the event loop (loads can hit SQLite)."""
+        try:
+            return await asyncio.to_thread(query, *args, **kwargs)
+        except Exception as e:
+            logger.debug(f"Local graph {query.__name__} failed: {e}")
+            return []
+
     async def add_relationships(
         self,
         project_id: str,
@@ -92,18 +125,134 @@ class CodeGraph:
 
         return count
 
+    async def apply_file_delta(
+        self,
+        project_id: str,
+        file_path: str,
+        *,
+        imports: Sequence[str] = (),
+        calls: Sequence[dict[str, Any]] = (),
+        contains: Sequence[dict[str, Any]] = (),
+        removed_imports: Sequence[str] = (),
+        removed_calls: Sequence[dict[str, Any]] = (),
+        removed_symbols: Sequence[str] = (),
+    ) -> int:
+        """Apply one file's edge changes with a batched write per edge type.
+
+        ``imports``/``removed_imports`` are module names; calls use the
+        ``get_calls_for_file`` shape; ``contains`` the ``add_relationships``
+        shape; ``removed_symbols`` are symbol IDs (detached with their edges).
+        Removals run first. Unlike ``add_relationships`` this raises on
+        failure so the caller can retry the delta.
+
+        Returns count of relationships written or removed.
+        """
+        if not self.available:
+            return 0
+
+        params: dict[str, Any] = {"project": project_id, "file": file_path}
+        if removed_symbols:
+            await self._client.execute_write(
+                """UNWIND $ids AS id
+                   MATCH (s:CodeSymbol {id: id, project: $project})
+                   DETACH DELETE s""",
+                {**params, "ids": list(removed_symbols)},
+            )
+        if removed_calls:
+            await self._client.execute_write(
+                """UNWIND $rows AS row
+                   MATCH (:CodeSymbol {id: row.caller_id, project: $project})
+                         -[r:CALLS {file: row.file, line: row.line}]->
+                         (:CodeSymbol {name: row.callee_name, project: $project})
+                   DELETE r""",
+                {**params, "rows": [_call_row(c) for c in removed_calls]},
+            )
+        if removed_imports:
+            await self._client.execute_write(
+                """UNWIND $modules AS module
+                   MATCH (:CodeFile {path: $file, project: $project})
+                         -[r:IMPORTS]->(:CodeModule {name: module, project: $project})
+                   DELETE r""",
+                {**params, "modules": list(removed_imports)},
+            )
+            await self._client.execute_write(
+                """MATCH (m:CodeModule {project: $project})
+                   WHERE NOT (m)<-[:IMPORTS]-()
+                   DETACH DELETE m""",
+                {"project": project_id},
+            )
+        if imports:
+            await self._client.execute_write(
+                """MERGE (f:CodeFile {path: $file, project: $project})
+                   WITH f UNWIND $modules AS module
+                   MERGE (m:CodeModule {name: module, project: $project})
+                   MERGE (f)-[:IMPORTS]->(m)""",
+                {**params, "modules": list(imports)},
+            )
+        if calls:
+            await self._client.execute_write(
+                """UNWIND $rows AS row
+                   MERGE (caller:CodeSymbol {id: row.caller_id, project: $project})
+                   MERGE (callee:CodeSymbol {name: row.callee_name, project: $project})
+                   MERGE (caller)-[:CALLS {file: row.file, line: row.line}]->(callee)""",
+                {**params, "rows": [_call_row(c) for c in calls]},
+            )
+        if contains:
+            await self._client.execute_write(
+                """MERGE (f:CodeFile {path: $file, project: $project})
+                   WITH f UNWIND $rows AS row
+                   MERGE (s:CodeSymbol {id: row.id, project: $project})
+                   SET s.name = row.name, s.kind = row.kind, s.line_start = row.line_start
+                   MERGE (f)-[:DEFINES]->(s)""",
+                {
+                    **params,
+                    "rows": [
+                        {
+                            "id": c.get("id", ""),
+                            "name": c.get("name", ""),
+                            "kind": c.get("kind", ""),
+                            "line_start": c.get("line_start", 0),
+                        }
+                        for c in contains
+                    ],
+                },
+            )
+        return (
+            len(imports)
+            + len(calls)
+            + len(contains)
+            + len(removed_imports)
+            + len(removed_calls)
+            + len(removed_symbols)
+        )
+
     async def find_callers(
-        self, symbol_name: str, project_id: str, limit: int = 20
+        self, symbol_name: str, project_id: str, limit: int = 20, depth: int = 1
     ) -> list[dict[str, Any]]:
-        """Find symbols that call the given symbol name."""
+        """Find symbols that call the given symbol name, up to ``depth`` hops away.
+
+        Returns dicts with caller_id, caller_name, file, line (of the
+        caller's own call) and distance, nearest first.
+        """
+        depth = max(1, min(depth, MAX_DEPTH))
         if not self.available:
-            return []
+            if self._local is None:
+                return []
+            return await self._query_local(
+                self._local.find_callers, symbol_name, project_id, depth=depth, limit=limit
+            )
 
         try:
             result = await self._client.execute_read(
-                """MATCH (caller:CodeSymbol)-[r:CALLS]->(callee:CodeSymbol {name: $name, project: $project})
+                f"""MATCH path = (caller:CodeSymbol)-[:CALLS*1..{depth}]->(
+                       callee:CodeSymbol {{name: $name, project: $project}})
+                   WITH caller, path ORDER BY length(path)
+                   WITH caller, head(collect(path)) AS p
                    RETURN caller.id AS caller_id, caller.name AS caller_name,
-                          r.file AS file, r.line AS line
+                          relationships(p)[0].file AS file,
+                          relationships(p)[0].line AS line,
+                          length(p) AS distance
+                   ORDER BY distance ASC, caller_name ASC
                    LIMIT $limit""",
                 {"name": symbol_name, "project": project_id, "limit": limit},
             )
@@ -112,12 +261,52 @@ class CodeGraph:
             logger.debug(f"find_callers failed: {e}")
             return []
 
+    async def find_callees(
+        self, symbol_name: str, project_id: str, limit: int = 20, depth: int = 1
+    ) -> list[dict[str, Any]]:
+        """Find symbols called by the given symbol name, up to ``depth`` hops away.
+
+        Returns dicts with callee_id, callee_name, kind, file_path, line
+        (of the call) and distance, nearest first.
+        """
+        depth = max(1, min(depth, MAX_DEPTH))
+        if not self.available:
+            if self._local is None:
+                return []
+            return await self._query_local(
+                self._local.find_callees, symbol_name, project_id, depth=depth, limit=limit
+            )
+
+        try:
+            result = await self._client.execute_read(
+                f"""MATCH path = (src:CodeSymbol {{name: $name, project: $project}})
+                       -[:CALLS*1..{depth}]->(callee:CodeSymbol)
+                   WITH callee, path ORDER BY length(path)
+                   WITH callee, head(collect(path)) AS p
+                   OPTIONAL MATCH (f:CodeFile)-[:DEFINES]->(callee)
+                   RETURN callee.id AS callee_id, callee.name AS callee_name,
+                          callee.kind AS kind, f.path AS file_path,
+                          last(relationships(p)).line AS line,
+                          length(p) AS distance
+                   ORDER BY distance ASC, callee_name ASC
+                   LIMIT $limit""",
+                {"name": symbol_name, "project": project_id, "limit": limit},
+            )
+            return [dict(record) for record in result]
+        except Exception as e:
+            logger.debug(f"find_callees failed: {e}")
+            return []
+
     async def find_usages(
         self, symbol_name: str, project_id: str, limit: int = 20
     ) -> list[dict[str, Any]]:
         """Find all usages of a symbol (callers + imports)."""
         if not self.available:
-            return []
+            if self._local is None:
+                return []
+            return await self._query_local(
+                self._local.find_usages, symbol_name, project_id, limit=limit
+            )
 
         try:
             result = await self._client.execute_read(
@@ -136,7 +325,9 @@ class CodeGraph:
     async def get_imports(self, file_path: str, project_id: str) -> list[dict[str, Any]]:
         """Get import graph for a file."""
         if not self.available:
-            return []
+            if self._local is None:
+                return []
+            return await self._query_local(self._local.get_imports, file_path, project_id)
 
         try:
             result = await self._client.execute_read(
@@ -182,13 +373,22 @@ class CodeGraph:
         Returns list of dicts with: symbol_id, symbol_name, kind, file_path,
         distance, rel_type ('call' or 'import').
         """
-        if not self.available:
+        if not self.queryable:
             return []
 
         if bool(symbol_name) == bool(file_path):
             raise ValueError("Exactly one of symbol_name or file_path must be provided")
 
-        depth = max(1, min(depth, 5))
+        depth = max(1, min(depth, MAX_DEPTH))
+        if not self.available and self._local is not None:
+            return await self._query_local(
+                self._local.find_blast_radius,
+                symbol_name,
+                file_path,
+                project_id,
+                depth=depth,
+                limit=limit,
+            )
         results: list[dict[str, Any]] = []
 
         try:
@@ -579,6 +779,8 @@ class CodeGraph:
 
     async def clear_project(self, project_id: str) -> None:
         """Remove all graph data for a project."""
+        if self._local is not None:
+            self._local.invalidate(project_id)
         if not self.available:
             return
 
@@ -619,3 +821,13 @@ class CodeGraph:
             )
         except Exception as e:
             logger.warning(f"Graph delete_file failed: {e}")
+
+
+def _call_row(call: dict[str, Any]) -> dict[str, Any]:
+    """Cypher parameters for a CALLS edge from a ``get_calls_for_file`` row."""
+    return {
+        "caller_id": call.get("caller_symbol_id", ""),
+        "callee_name": call.get("callee_name", ""),
+        "file": call.get("file_path", ""),
+        "line": call.get("line", 0),
+    }
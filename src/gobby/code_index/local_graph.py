@@ -0,0 +1,638 @@
+"""In-memory call graph over the SQLite code index.
+
+gcode writes each file's symbols, calls and imports to ``code_symbols``,
+``code_calls`` and ``code_imports``. ``LocalCodeGraph`` loads one project's
+rows into compact CSR arrays, so multi-hop caller, callee, usage and blast
+radius queries work without Neo4j.
+
+Calls are resolved by name, as in the Neo4j graph: an edge runs from the
+caller symbol to every symbol in the project with the callee's name. Both
+directions are stored CSR-style, as an offsets array plus a flat neighbour
+array. Outgoing edges are keyed by symbol index and incoming edges by
+callee name index.
+
+Staleness is detected with ``code_graph_version``, a per-project counter
+that triggers bump whenever a ``code_indexed_files`` row is inserted,
+re-indexed or deleted. On a version change only the files whose hash or
+index time changed are reloaded. Their old symbols are tombstoned, and
+their new edges go to a small overlay. Once tombstones and overlay grow
+past a fraction of the graph, the project is compacted back into CSR
+arrays from memory.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from gobby.storage.database import DatabaseProtocol
+
+logger = logging.getLogger(__name__)
+
+# Chunk size for IN (...) lookups, under SQLite's default variable limit
+_LOOKUP_CHUNK = 500
+
+# Reload the whole project instead of patching when this share of files changed
+_FULL_RELOAD_RATIO = 0.25
+
+# Compact once tombstoned symbols plus overlay edges exceed this share of the
+# graph (and at least _MIN_COMPACT entries, so small projects do not churn)
+_COMPACT_RATIO = 0.25
+_MIN_COMPACT = 1024
+
+
+class _ProjectGraph:
+    """CSR call graph and import map for one project."""
+
+    def __init__(self, version: int | None) -> None:
+        self.version = version
+        self.fingerprints: dict[str, tuple[str, str]] = {}
+
+        self.names: list[str] = []
+        self.name_index: dict[str, int] = {}
+        self.files: list[str] = []
+        self.file_index: dict[str, int] = {}
+
+        # Symbol columns, indexed by symbol number
+        self.sym_ids: list[str] = []
+        self.sym_kind: list[str | None] = []
+        self.sym_name = array("l")
+        self.sym_file = array("l")
+        self.sym_line = array("l")
+        self.alive = bytearray()
+        self.sym_index: dict[str, int] = {}
+        self.by_name: dict[int, list[int]] = {}
+        self.file_symbols: dict[int, list[int]] = {}
+        self.dead = 0
+
+        # CSR: caller symbol -> (callee name, line); callee name -> (caller, line)
+        self.out_offsets = array("l", [0])
+        self.out_names = array("l")
+        self.out_lines = array("l")
+        self.in_offsets = array("l", [0])
+        self.in_callers = array("l")
+        self.in_lines = array("l")
+
+        # Edges added since the CSR arrays were built
+        self.extra_out: dict[int, list[tuple[int, int]]] = {}
+        self.extra_in: dict[int, list[tuple[int, int]]] = {}
+        self.overlay = 0
+
+        self.imports: dict[str, list[str]] = {}
+        self.importers: dict[str, dict[str, None]] = {}
+
+    # --- construction ---
+
+    @classmethod
+    def build(
+        cls,
+        version: int | None,
+        symbols: Iterable[tuple[str, str, str | None, str, int]],
+        calls: Iterable[tuple[str, str, str, int]],
+        imports: Iterable[tuple[str, str]],
+        fingerprints: dict[str, tuple[str, str]],
+    ) -> _ProjectGraph:
+        """Build a graph from (id, name, kind, file, line) symbols and
+        (caller_id, callee_name, file, line) calls."""
+        graph = cls(version)
+        graph.fingerprints = dict(fingerprints)
+        for row in symbols:
+            graph._add_symbol(*row)
+
+        edges = [graph._resolve_call(*call) for call in calls]
+        graph._build_csr(edges)
+        for source_file, target_module in imports:
+            graph._add_import(source_file, target_module)
+        return graph
+
+    def _intern_name(self, name: str) -> int:
+        idx = self.name_index.get(name)
+        if idx is None:
+            idx = self.name_index[name] = len(self.names)
+            self.names.append(name)
+        return idx
+
+    def _intern_file(self, path: str) -> int:
+        idx = self.file_index.get(path)
+        if idx is None:
+            idx = self.file_index[path] = len(self.files)
+            self.files.append(path)
+        return idx
+
+    def _add_symbol(
+        self, symbol_id: str, name: str, kind: str | None, file_path: str, line: int
+    ) -> int:
+        idx = len(self.sym_ids)
+        name_idx = self._intern_name(name)
+        file_idx = self._intern_file(file_path)
+        self.sym_ids.append(symbol_id)
+        self.sym_kind.append(kind)
+        self.sym_name.append(name_idx)
+        self.sym_file.append(file_idx)
+        self.sym_line.append(line or 0)
+        self.alive.append(1)
+        self.sym_index[symbol_id] = idx
+        self.by_name.setdefault(name_idx, []).append(idx)
+        self.file_symbols.setdefault(file_idx, []).append(idx)
+        return idx
+
+    def _resolve_call(
+        self, caller_id: str, callee_name: str, file_path: str, line: int
+    ) -> tuple[int, int, int]:
+        caller = self.sym_index.get(caller_id)
+        if caller is None:
+            # Calls from outside any indexed symbol (e.g. module level) still
+            # count; give the caller a nameless node owned by the call's file
+            caller = self._add_symbol(caller_id, "", None, file_path, 0)
+        return caller, self._intern_name(callee_name), line or 0
+
+    def _build_csr(self, edges: list[tuple[int, int, int]]) -> None:
+        """Lay out edges as CSR arrays with two counting sorts."""
+        n_syms, n_names = len(self.sym_ids), len(self.names)
+
+        out_offsets = array("l", [0]) * (n_syms + 1)
+        in_offsets = array("l", [0]) * (n_names + 1)
+        for caller, name_idx, _ in edges:
+            out_offsets[caller + 1] += 1
+            in_offsets[name_idx + 1] += 1
+        for i in range(n_syms):
+            out_offsets[i + 1] += out_offsets[i]
+        for i in range(n_names):
+            in_offsets[i + 1] += in_offsets[i]
+
+        out_names = array("l", [0]) * len(edges)
+        out_lines = array("l", [0]) * len(edges)
+        in_callers = array("l", [0]) * len(edges)
+        in_lines = array("l", [0]) * len(edges)
+        out_fill = out_offsets[:-1]
+        in_fill = in_offsets[:-1]
+        for caller, name_idx, line in edges:
+            pos = out_fill[caller]
+            out_names[pos], out_lines[pos] = name_idx, line
+            out_fill[caller] = pos + 1
+            pos = in_fill[name_idx]
+            in_callers[pos], in_lines[pos] = caller, line
+            in_fill[name_idx] = pos + 1
+
+        self.out_offsets, self.out_names, self.out_lines = out_offsets, out_names, out_lines
+        self.in_offsets, self.in_callers, self.in_lines = in_offsets, in_callers, in_lines
+        self.extra_out.clear()
+        self.extra_in.clear()
+        self.overlay = 0
+
+    def _add_import(self, source_file: str, target_module: str) -> None:
+        self.imports.setdefault(source_file, []).append(target_module)
+        self.importers.setdefault(target_module, {})[source_file] = None
+
+    # --- incremental updates ---
+
+    def replace_files(
+        self,
+        paths: Iterable[str],
+        symbols: Iterable[tuple[str, str, str | None, str, int]],
+        calls: Iterable[tuple[str, str, str, int]],
+        imports: Iterable[tuple[str, str]],
+        fingerprints: dict[str, tuple[str, str]],
+    ) -> None:
+        """Swap the rows of ``paths`` for freshly loaded ones.
+
+        ``fingerprints`` holds the current fingerprint of every path that
+        still exists; paths missing from it were deleted.
+        """
+        for path in paths:
+            self._drop_file(path)
+            if path in fingerprints:
+                self.fingerprints[path] = fingerprints[path]
+            else:
+                self.fingerprints.pop(path, None)
+
+        for row in symbols:
+            self._add_symbol(*row)
+        for call in calls:
+            caller, name_idx, line = self._resolve_call(*call)
+            self.extra_out.setdefault(caller, []).append((name_idx, line))
+            self.extra_in.setdefault(name_idx, []).append((caller, line))
+            self.overlay += 1
+        for source_file, target_module in imports:
+            self._add_import(source_file, target_module)
+
+        size = len(self.sym_ids) + len(self.out_names)
+        if self.dead + self.overlay > max(_MIN_COMPACT, size * _COMPACT_RATIO):
+            self._compact()
+
+    def _drop_file(self, path: str) -> None:
+        file_idx = self.file_index.get(path)
+        if file_idx is not None:
+            for sym in self.file_symbols.pop(file_idx, ()):
+                self.alive[sym] = 0
+                self.dead += 1
+                symbol_id = self.sym_ids[sym]
+                if self.sym_index.get(symbol_id) == sym:
+                    del self.sym_index[symbol_id]
+                same_name = self.by_name.get(self.sym_name[sym])
+                if same_name is not None:
+                    same_name.remove(sym)
+        for module in self.imports.pop(path, ()):
+            importers = self.importers.get(module)
+            if importers is not None:
+                importers.pop(path, None)
+                if not importers:
+                    del self.importers[module]
+
+    def _compact(self) -> None:
+        """Rebuild the CSR arrays from live symbols and edges, dropping tombstones."""
+        rebuilt = _ProjectGraph.build(
+            self.version,
+            (
+                (
+                    self.sym_ids[s],
+                    self.names[self.sym_name[s]],
+                    self.sym_kind[s],
+                    self.files[self.sym_file[s]],
+                    self.sym_line[s],
+                )
+                for s in range(len(self.sym_ids))
+                if self.alive[s]
+            ),
+            (
+                (self.sym_ids[s], self.names[name_idx], self.files[self.sym_file[s]], line)
+                for s in range(len(self.sym_ids))
+                if self.alive[s]
+                for name_idx, line in self.callees(s)
+            ),
+            ((source, module) for source, modules in self.imports.items() for module in modules),
+            self.fingerprints,
+        )
+        self.__dict__.update(rebuilt.__dict__)
+        logger.debug(f"Compacted code graph: {len(self.sym_ids)} symbols")
+
+    # --- adjacency ---
+
+    def callers(self, name_idx: int) -> Iterator[tuple[int, int]]:
+        """Live (caller symbol, line) pairs calling ``name_idx``."""
+        if name_idx + 1 < len(self.in_offsets):
+            for pos in range(self.in_offsets[name_idx], self.in_offsets[name_idx + 1]):
+                caller = self.in_callers[pos]
+                if self.alive[caller]:
+                    yield caller, self.in_lines[pos]
+        for caller, line in self.extra_in.get(name_idx, ()):
+            if self.alive[caller]:
+                yield caller, line
+
+    def callees(self, sym: int) -> Iterator[tuple[int, int]]:
+        """(callee name, line) pairs called by symbol ``sym``."""
+        if sym + 1 < len(self.out_offsets):
+            for pos in range(self.out_offsets[sym], self.out_offsets[sym + 1]):
+                yield self.out_names[pos], self.out_lines[pos]
+        yield from self.extra_out.get(sym, ())
+
+    def walk_callers(self, start_names: Iterable[int], depth: int) -> dict[int, tuple[int, int]]:
+        """Breadth-first walk up the call graph.
+
+        Returns:
+            Map of caller symbol -> (distance, line of the call it makes).
+        """
+        seen_names = set(start_names)
+        frontier = list(seen_names)
+        found: dict[int, tuple[int, int]] = {}
+        for distance in range(1, depth + 1):
+            next_names: list[int] = []
+            for name_idx in frontier:
+                for caller, line in self.callers(name_idx):
+                    if caller in found:
+                        continue
+                    found[caller] = (distance, line)
+                    caller_name = self.sym_name[caller]
+                    if caller_name not in seen_names:
+                        seen_names.add(caller_name)
+                        next_names.append(caller_name)
+            if not next_names:
+                break
+            frontier = next_names
+        return found
+
+    def walk_callees(
+        self, start: Iterable[int], depth: int
+    ) -> tuple[dict[int, tuple[int, int]], dict[int, tuple[int, int]]]:
+        """Breadth-first walk down the call graph.
+
+        Returns:
+            Tuple of (callee symbol -> (distance, call line), unresolved
+            callee name -> (distance, call line)) for names that match no
+            indexed symbol, such as library functions.
+        """
+        visited = set(start)
+        frontier = list(visited)
+        found: dict[int, tuple[int, int]] = {}
+        unresolved: dict[int, tuple[int, int]] = {}
+        for distance in range(1, depth + 1):
+            next_syms: list[int] = []
+            for sym in frontier:
+                for name_idx, line in self.callees(sym):
+                    targets = self.by_name.get(name_idx)
+                    if not targets:
+                        unresolved.setdefault(name_idx, (distance, line))
+                        continue
+                    for target in targets:
+                        if target not in visited:
+                            visited.add(target)
+                            found[target] = (distance, line)
+                            next_syms.append(target)
+            if not next_syms:
+                break
+            frontier = next_syms
+        return found, unresolved
+
+    def describe(self, sym: int) -> dict[str, Any]:
+        return {
+            "symbol_id": self.sym_ids[sym],
+            "symbol_name": self.names[self.sym_name[sym]] or None,
+            "kind": self.sym_kind[sym],
+            "file_path": self.files[self.sym_file[sym]],
+            "line": self.sym_line[sym],
+        }
+
+
+class LocalCodeGraph:
+    """Call/import graph queries answered from SQLite-backed memory.
+
+    Projects load lazily on first query and refresh incrementally when
+    ``code_graph_version`` moves. Safe to share across threads.
+    """
+
+    def __init__(self, db: DatabaseProtocol) -> None:
+        self.db = db
+        self._lock = threading.RLock()
+        self._projects: dict[str, _ProjectGraph] = {}
+
+    # --- cache maintenance ---
+
+    def current_version(self, project_id: str) -> int | None:
+        """Read a project's graph version (None if the counter table is missing)."""
+        try:
+            row = self.db.fetchone(
+                "SELECT version FROM code_graph_version WHERE project_id = ?", (project_id,)
+            )
+        except Exception:
+            return None
+        return int(row["version"]) if row else 0
+
+    def invalidate(self, project_id: str | None = None) -> None:
+        """Forget a project's cached graph (or every project's)."""
+        with self._lock:
+            if project_id is None:
+                self._projects.clear()
+            else:
+                self._projects.pop(project_id, None)
+
+    def _graph(self, project_id: str) -> _ProjectGraph:
+        version = self.current_version(project_id)
+        graph = self._projects.get(project_id)
+        if graph is not None and version is not None and graph.version == version:
+            return graph
+
+        fingerprints = self._fingerprints(project_id)
+        if graph is not None and version is not None:
+            changed = [p for p, fp in fingerprints.items() if graph.fingerprints.get(p) != fp]
+            changed += [p for p in graph.fingerprints if p not in fingerprints]
+            if len(changed) <= max(1, len(fingerprints) * _FULL_RELOAD_RATIO):
+                graph.replace_files(
+                    changed,
+                    self._load_symbols(project_id, changed),
+                    self._load_calls(project_id, changed),
+                    self._load_imports(project_id, changed),
+                    {p: fingerprints[p] for p in changed if p in fingerprints},
+                )
+                graph.version = version
+                logger.debug(f"Refreshed {len(changed)} files in code graph for {project_id}")
+                return graph
+
+        graph = _ProjectGraph.build(
+            version,
+            self._load_symbols(project_id),
+            self._load_calls(project_id),
+            self._load_imports(project_id),
+            fingerprints,
+        )
+        self._projects[project_id] = graph
+        logger.debug(
+            f"Loaded code graph for {project_id}: {len(graph.sym_ids)} symbols, "
+            f"{len(graph.out_names)} calls"
+        )
+        return graph
+
+    def _fingerprints(self, project_id: str) -> dict[str, tuple[str, str]]:
+        rows = self.db.fetchall(
+            "SELECT file_path, content_hash, indexed_at FROM code_indexed_files "
+            "WHERE project_id = ?",
+            (project_id,),
+        )
+        return {r["file_path"]: (r["content_hash"], r["indexed_at"]) for r in rows}
+
+    def _select(
+        self, sql: str, file_column: str, project_id: str, paths: list[str] | None
+    ) -> Iterator[Any]:
+        """Run ``sql`` for the whole project, or for ``paths`` in chunks."""
+        if paths is None:
+            yield from self.db.fetchall(sql, (project_id,))
+            return
+        for i in range(0, len(paths), _LOOKUP_CHUNK):
+            chunk = paths[i : i + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            yield from self.db.fetchall(
+                f"{sql} AND {file_column} IN ({placeholders})",  # nosec B608
+                (project_id, *chunk),
+            )
+
+    def _load_symbols(
+        self, project_id: str, paths: list[str] | None = None
+    ) -> list[tuple[str, str, str | None, str, int]]:
+        rows = self._select(
+            "SELECT id, name, kind, file_path, line_start FROM code_symbols WHERE project_id = ?",
+            "file_path",
+            project_id,
+            paths,
+        )
+        return [(r["id"], r["name"], r["kind"], r["file_path"], r["line_start"]) for r in rows]
+
+    def _load_calls(
+        self, project_id: str, paths: list[str] | None = None
+    ) -> list[tuple[str, str, str, int]]:
+        rows = self._select(
+            "SELECT caller_symbol_id, callee_name, file_path, line FROM code_calls "
+            "WHERE project_id = ?",
+            "file_path",
+            project_id,
+            paths,
+        )
+        return [(r["caller_symbol_id"], r["callee_name"], r["file_path"], r["line"]) for r in rows]
+
+    def _load_imports(
+        self, project_id: str, paths: list[str] | None = None
+    ) -> list[tuple[str, str]]:
+        rows = self._select(
+            "SELECT source_file, target_module FROM code_imports WHERE project_id = ?",
+            "source_file",
+            project_id,
+            paths,
+        )
+        return [(r["source_file"], r["target_module"]) for r in rows]
+
+    # --- queries ---
+
+    def find_callers(
+        self, symbol_name: str, project_id: str, depth: int = 1, limit: int = 20
+    ) -> list[dict[str, Any]]:
+        """Symbols calling ``symbol_name`` within ``depth`` hops, nearest first."""
+        with self._lock:
+            graph = self._graph(project_id)
+            name_idx = graph.name_index.get(symbol_name)
+            if name_idx is None:
+                return []
+            found = graph.walk_callers((name_idx,), depth)
+            results = [
+                {
+                    "caller_id": graph.sym_ids[sym],
+                    "caller_name": graph.names[graph.sym_name[sym]] or None,
+                    "file": graph.files[graph.sym_file[sym]],
+                    "line": line,
+                    "distance": distance,
+                }
+                for sym, (distance, line) in found.items()
+            ]
+        results.sort(key=lambda r: (r["distance"], r["caller_name"] or "", r["caller_id"]))
+        return results[:limit]
+
+    def find_callees(
+        self, symbol_name: str, project_id: str, depth: int = 1, limit: int = 20
+    ) -> list[dict[str, Any]]:
+        """Symbols called by ``symbol_name`` within ``depth`` hops, nearest first.
+
+        Calls to names with no indexed symbol are reported with
+        ``callee_id`` None.
+        """
+        with self._lock:
+            graph = self._graph(project_id)
+            name_idx = graph.name_index.get(symbol_name)
+            if name_idx is None:
+                return []
+            found, unresolved = graph.walk_callees(graph.by_name.get(name_idx, ()), depth)
+            results = [
+                {
+                    "callee_id": graph.sym_ids[sym],
+                    "callee_name": graph.names[graph.sym_name[sym]],
+                    "kind": graph.sym_kind[sym],
+                    "file_path": graph.files[graph.sym_file[sym]],
+                    "line": line,
+                    "distance": distance,
+                }
+                for sym, (distance, line) in found.items()
+            ]
+            results.extend(
+                {
+                    "callee_id": None,
+                    "callee_name": graph.names[idx],
+                    "kind": None,
+                    "file_path": None,
+                    "line": line,
+                    "distance": distance,
+                }
+                for idx, (distance, line) in unresolved.items()
+            )
+        results.sort(key=lambda r: (r["distance"], r["callee_name"], r["callee_id"] or ""))
+        return results[:limit]
+
+    def find_usages(
+        self, symbol_name: str, project_id: str, limit: int = 20
+    ) -> list[dict[str, Any]]:
+        """Direct callers of ``symbol_name`` plus files importing a module of that name."""
+        with self._lock:
+            results: list[dict[str, Any]] = [
+                {
+                    "source_id": caller["caller_id"],
+                    "source_name": caller["caller_name"],
+                    "rel_type": "CALLS",
+                    "file": caller["file"],
+                    "line": caller["line"],
+                }
+                for caller in self.find_callers(symbol_name, project_id, depth=1, limit=limit)
+            ]
+            importers = self._graph(project_id).importers.get(symbol_name, {})
+            results.extend(
+                {
+                    "source_id": None,
+                    "source_name": None,
+                    "rel_type": "IMPORTS",
+                    "file": source_file,
+                    "line": None,
+                }
+                for source_file in sorted(importers)
+            )
+        return results[:limit]
+
+    def get_imports(self, file_path: str, project_id: str) -> list[dict[str, Any]]:
+        """Modules imported by a file."""
+        with self._lock:
+            modules = self._graph(project_id).imports.get(file_path, [])
+            return [{"module_name": module} for module in modules]
+
+    def find_blast_radius(
+        self,
+        symbol_name: str | None,
+        file_path: str | None,
+        project_id: str,
+        depth: int = 3,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Code affected by changing a symbol or a file, same shape as the Neo4j query.
+
+        For a symbol, walks callers up to ``depth`` hops. For a file, walks
+        callers of every symbol the file defines, then adds the other files
+        that import a module this file imports.
+        """
+        if bool(symbol_name) == bool(file_path):
+            raise ValueError("Exactly one of symbol_name or file_path must be provided")
+
+        with self._lock:
+            graph = self._graph(project_id)
+            if symbol_name:
+                name_idx = graph.name_index.get(symbol_name)
+                start = [] if name_idx is None else [name_idx]
+            else:
+                file_idx = graph.file_index.get(file_path or "")
+                defined = graph.file_symbols.get(file_idx, []) if file_idx is not None else []
+                start = list(dict.fromkeys(graph.sym_name[s] for s in defined))
+
+            calls = [
+                {**graph.describe(sym), "distance": distance, "rel_type": "call"}
+                for sym, (distance, _) in graph.walk_callers(start, depth).items()
+            ]
+            calls.sort(key=lambda r: (r["distance"], r["symbol_name"] or ""))
+            results = calls[:limit]
+
+            if file_path:
+                importers: dict[str, None] = {}
+                for module in graph.imports.get(file_path, ()):
+                    for importer in graph.importers.get(module, ()):
+                        if importer != file_path:
+                            importers[importer] = None
+                results.extend(
+                    {"file_path": importer, "distance": 1, "rel_type": "import"}
+                    for importer in sorted(importers)[:limit]
+                )
+        return results
+
+    def stats(self, project_id: str) -> dict[str, int]:
+        """Size of a project's loaded graph, for diagnostics and benchmarks."""
+        with self._lock:
+            graph = self._graph(project_id)
+            return {
+                "symbols": len(graph.sym_ids) - graph.dead,
+                "calls": len(graph.out_names) + graph.overlay,
+                "files": len(graph.fingerprints),
+                "overlay_calls": graph.overlay,
+                "tombstones": graph.dead,
+            }
@@ -1,14 +1,21 @@
 """Hybrid search for code symbols.
 
-Combines SQLite name search, Qdrant semantic search, and Neo4j graph boost
+Combines SQLite name search, Qdrant semantic search, and call-graph boost
 using Reciprocal Rank Fusion (RRF) for unified ranking.
 
 Degrades gracefully: SQLite-only if Qdrant/Neo4j unavailable.
+
+The sources are queried concurrently, symbols found only by the semantic
+or graph sources are loaded in one batch, and results are cached per
+project until the index generation moves (re-index, sync, summaries).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any
 
@@ -23,11 +30,20 @@ logger = logging.getLogger(__name__)
 RRF_K = 60
 
 
+# (project_id, query, kind, file_path, limit)
+_CacheKey = tuple[str, str, str | None, str | None, int]
+
+
 def _rrf_score(rank: int) -> float:
     """Reciprocal Rank Fusion score."""
     return 1.0 / (RRF_K + rank)
 
 
+def _copy_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy cached results so callers can't mutate the cache."""
+    return [{**r, "_sources": list(r["_sources"])} for r in results]
+
+
 class CodeSearcher:
     """Hybrid search across code symbols."""
 
@@ -44,6 +60,13 @@ class CodeSearcher:
         self._embed_fn = embed_fn
         self._graph = graph
         self._config = config
+        cache_config = config or CodeIndexConfig()
+        self._cache_ttl = cache_config.search_cache_ttl_seconds
+        self._cache_max_entries = cache_config.search_cache_max_entries
+        # (project_id, query, kind, file_path, limit) -> (generation, expires_at, results)
+        self._cache: OrderedDict[_CacheKey, tuple[int, float, list[dict[str, Any]]]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     async def search(
         self,
@@ -56,23 +79,22 @@ class CodeSearcher:
         """Hybrid search combining name, semantic, and graph sources.
 
         Returns list of dicts with symbol data + score + source info.
+        Results are cached per project until its index generation moves
+        (see CodeIndexStorage.get_index_generation) or the TTL expires.
         """
-        # Source 1: FTS5 full-text search (primary), with LIKE fallback
-        name_results = self._storage.search_symbols_fts(
-            query=query,
-            project_id=project_id,
-            kind=kind,
-            file_path=file_path,
-            limit=limit * 2,
+        key: _CacheKey = (project_id, query, kind, file_path, limit)
+        generation = self._storage.get_index_generation(project_id) if self._cache_ttl else None
+        cached = self._cache_get(key, generation)
+        if cached is not None:
+            return cached
+
+        # The three sources are independent: FTS5 (with LIKE fallback) runs on
+        # a worker thread while the query is embedded and the graph is queried
+        name_results, semantic_results, graph_ids = await asyncio.gather(
+            asyncio.to_thread(self._name_search, query, project_id, kind, file_path, limit * 2),
+            self._semantic_source(query, project_id, limit * 2),
+            self._graph_source(query, project_id),
         )
-        if not name_results:
-            name_results = self._storage.search_symbols_by_name(
-                query=query,
-                project_id=project_id,
-                kind=kind,
-                file_path=file_path,
-                limit=limit * 2,
-            )
 
         # Build score map: symbol_id -> {source: rank}
         score_map: dict[str, dict[str, int]] = {}
@@ -82,27 +104,11 @@ class CodeSearcher:
             score_map[sym.id] = {"name": rank}
             symbol_cache[sym.id] = sym
 
-        # Source 2: Qdrant semantic search (if available)
-        if self._vector_store is not None and self._embed_fn is not None:
-            try:
-                semantic_results = await self._semantic_search(query, project_id, limit * 2)
-                for rank, (sym_id, _score) in enumerate(semantic_results):
-                    if sym_id not in score_map:
-                        score_map[sym_id] = {}
-                    score_map[sym_id]["semantic"] = rank
-            except Exception as e:
-                logger.debug(f"Semantic search failed (degrading gracefully): {e}")
-
-        # Source 3: Neo4j graph boost (if available)
-        if self._graph is not None and self._graph.available:
-            try:
-                graph_ids = await self._graph_boost(query, project_id)
-                for rank, sym_id in enumerate(graph_ids):
-                    if sym_id not in score_map:
-                        score_map[sym_id] = {}
-                    score_map[sym_id]["graph"] = rank
-            except Exception as e:
-                logger.debug(f"Graph boost failed (degrading gracefully): {e}")
+        for rank, (sym_id, _score) in enumerate(semantic_results or []):
+            score_map.setdefault(sym_id, {})["semantic"] = rank
+
+        for rank, sym_id in enumerate(graph_ids or []):
+            score_map.setdefault(sym_id, {})["graph"] = rank
 
         # RRF merge
         final_scores: list[tuple[str, float]] = []
@@ -113,22 +119,104 @@ class CodeSearcher:
         # Sort by score descending
         final_scores.sort(key=lambda x: x[1], reverse=True)
 
-        # Build result list
+        # Build result list, loading symbols found only by the semantic/graph
+        # sources in one query per window (another only if some were deleted)
         results: list[dict[str, Any]] = []
-        for sym_id, score in final_scores[:limit]:
-            matched = symbol_cache.get(sym_id)
-            if matched is None:
-                matched = self._storage.get_symbol(sym_id)
-            if matched is None:
-                continue
-
-            result = matched.to_brief()
-            result["_score"] = round(score, 4)
-            result["_sources"] = list(score_map.get(sym_id, {}).keys())
-            results.append(result)
+        pos = 0
+        while len(results) < limit and pos < len(final_scores):
+            window = final_scores[pos : pos + limit - len(results)]
+            pos += len(window)
+            missing = [sym_id for sym_id, _ in window if sym_id not in symbol_cache]
+            if missing:
+                symbol_cache.update((sym.id, sym) for sym in self._storage.get_symbols(missing))
+
+            for sym_id, score in window:
+                matched = symbol_cache.get(sym_id)
+                if matched is None:
+                    continue
+
+                result = matched.to_brief()
+                result["_score"] = round(score, 4)
+                result["_sources"] = list(score_map[sym_id].keys())
+                results.append(result)
+
+        # Don't keep a degraded answer around for the whole TTL
+        if semantic_results is not None and graph_ids is not None:
+            self._cache_put(key, generation, results)
+        return results
 
+    def _name_search(
+        self,
+        query: str,
+        project_id: str,
+        kind: str | None,
+        file_path: str | None,
+        limit: int,
+    ) -> list[Symbol]:
+        """FTS5 full-text search (primary), with LIKE fallback."""
+        results = self._storage.search_symbols_fts(
+            query=query,
+            project_id=project_id,
+            kind=kind,
+            file_path=file_path,
+            limit=limit,
+        )
+        if not results:
+            results = self._storage.search_symbols_by_name(
+                query=query,
+                project_id=project_id,
+                kind=kind,
+                file_path=file_path,
+                limit=limit,
+            )
         return results
 
+    async def _semantic_source(
+        self, query: str, project_id: str, limit: int
+    ) -> list[tuple[str, float]] | None:
+        """Qdrant semantic hits, [] if unconfigured, None if the search failed."""
+        if self._vector_store is None or self._embed_fn is None:
+            return []
+        try:
+            return await self._semantic_search(query, project_id, limit)
+        except Exception as e:
+            logger.debug(f"Semantic search failed (degrading gracefully): {e}")
+            return None
+
+    async def _graph_source(self, query: str, project_id: str) -> list[str] | None:
+        """Call-graph boost IDs (Neo4j, or the local SQLite graph); None on failure."""
+        if self._graph is None or not self._graph.queryable:
+            return []
+        try:
+            return await self._graph_boost(query, project_id)
+        except Exception as e:
+            logger.debug(f"Graph boost failed (degrading gracefully): {e}")
+            return None
+
+    def _cache_get(self, key: _CacheKey, generation: int | None) -> list[dict[str, Any]] | None:
+        if generation is None:
+            return None
+        entry = self._cache.get(key)
+        if entry is not None:
+            cached_generation, expires_at, results = entry
+            if cached_generation == generation and expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return _copy_results(results)
+            del self._cache[key]
+        self.cache_misses += 1
+        return None
+
+    def _cache_put(
+        self, key: _CacheKey, generation: int | None, results: list[dict[str, Any]]
+    ) -> None:
+        if generation is None:
+            return
+        self._cache[key] = (generation, time.monotonic() + self._cache_ttl, _copy_results(results))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_max_entries:
+            self._cache.popitem(last=False)
+
     async def _semantic_search(
         self, query: str, project_id: str, limit: int
     ) -> list[tuple[str, float]]:
@@ -21,6 +21,9 @@ from gobby.storage.database import DatabaseProtocol
 
 logger = logging.getLogger(__name__)
 
+# Max bound parameters per IN (...) lookup
+_IN_CHUNK = 500
+
 
 class CodeIndexStorage:
     """SQLite storage for code symbols, indexed files, and projects."""
@@ -95,15 +98,18 @@ class CodeIndexStorage:
         return Symbol.from_row(row) if row else None
 
     def get_symbols(self, symbol_ids: list[str]) -> list[Symbol]:
-        """Batch-retrieve symbols by IDs."""
-        if not symbol_ids:
-            return []
-        placeholders = ",".join("?" for _ in symbol_ids)
-        rows = self.db.fetchall(
-            f"SELECT * FROM code_symbols WHERE id IN ({placeholders})",
-            tuple(symbol_ids),
-        )
-        return [Symbol.from_row(r) for r in rows]
+        """Batch-retrieve symbols by IDs (unordered; missing IDs are skipped)."""
+        unique = list(dict.fromkeys(symbol_ids))
+        symbols: list[Symbol] = []
+        for start in range(0, len(unique), _IN_CHUNK):
+            chunk = unique[start : start + _IN_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self.db.fetchall(
+                f"SELECT * FROM code_symbols WHERE id IN ({placeholders})",
+                tuple(chunk),
+            )
+            symbols.extend(Symbol.from_row(r) for r in rows)
+        return symbols
 
     def get_symbols_for_file(self, project_id: str, file_path: str) -> list[Symbol]:
         """Get all symbols in a file."""
@@ -405,6 +411,96 @@ class CodeIndexStorage:
             )
             return cursor.rowcount > 0
 
+    # ── Sync ledger ─────────────────────────────────────────────────
+    #
+    # What the sync worker last wrote to Qdrant ("vector": symbol id ->
+    # embedding text hash) and Neo4j ("graph": edge key -> property hash),
+    # so re-indexed files sync as a delta.
+
+    def get_sync_items(self, project_id: str, store: str, file_path: str) -> dict[str, str]:
+        """Synced item keys for a file, mapped to their hashes."""
+        rows = self.db.fetchall(
+            """SELECT item_key, item_hash FROM code_sync_items
+               WHERE project_id = ? AND store = ? AND file_path = ?""",
+            (project_id, store, file_path),
+        )
+        return {r["item_key"]: r["item_hash"] for r in rows}
+
+    def find_synced_vectors(self, project_id: str, hashes: list[str]) -> dict[str, str]:
+        """One synced point ID per embedding text hash, for reusing its vector."""
+        found: dict[str, str] = {}
+        unique = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique), _IN_CHUNK):
+            chunk = unique[start : start + _IN_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            # store is inlined so the partial hash index applies
+            rows = self.db.fetchall(
+                f"""SELECT item_hash, item_key FROM code_sync_items
+                    WHERE project_id = ? AND store = 'vector'
+                      AND item_hash IN ({placeholders})""",
+                (project_id, *chunk),
+            )
+            for r in rows:
+                found.setdefault(r["item_hash"], r["item_key"])
+        return found
+
+    def record_sync_items(
+        self,
+        project_id: str,
+        store: str,
+        file_path: str,
+        upserts: dict[str, str],
+        removed: list[str],
+        *,
+        synced_file: IndexedFile | None = None,
+    ) -> None:
+        """Apply a file's sync delta to the ledger (item key -> hash).
+
+        With ``synced_file``, also marks the store synced for that file in
+        the same transaction, if its content hash is unchanged.
+        """
+        with self.db.transaction() as conn:
+            conn.executemany(
+                "DELETE FROM code_sync_items WHERE project_id = ? AND store = ? AND item_key = ?",
+                [(project_id, store, key) for key in removed],
+            )
+            conn.executemany(
+                """INSERT INTO code_sync_items (project_id, store, item_key, file_path, item_hash)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(project_id, store, item_key) DO UPDATE SET
+                       file_path = excluded.file_path,
+                       item_hash = excluded.item_hash""",
+                [(project_id, store, key, file_path, h) for key, h in upserts.items()],
+            )
+            if synced_file is not None:
+                column = "vectors_synced" if store == "vector" else "graph_synced"
+                conn.execute(
+                    f"UPDATE code_indexed_files SET {column} = 1 WHERE id = ? AND content_hash = ?",
+                    (synced_file.id, synced_file.content_hash),
+                )
+
+    def get_orphaned_sync_files(self, project_id: str, limit: int = 50) -> list[str]:
+        """Files with synced items whose index record has since been deleted."""
+        rows = self.db.fetchall(
+            """SELECT DISTINCT s.file_path FROM code_sync_items s
+               WHERE s.project_id = ? AND NOT EXISTS (
+                   SELECT 1 FROM code_indexed_files f
+                   WHERE f.project_id = s.project_id AND f.file_path = s.file_path
+               )
+               LIMIT ?""",
+            (project_id, limit),
+        )
+        return [r["file_path"] for r in rows]
+
+    def delete_sync_items_for_project(self, project_id: str) -> int:
+        """Forget everything synced for a project. Returns count."""
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM code_sync_items WHERE project_id = ?",
+                (project_id,),
+            )
+            return cursor.rowcount
+
     # ── Imports & Calls ─────────────────────────────────────────────
 
     def upsert_imports(
@@ -438,7 +534,8 @@ class CodeIndexStorage:
         """Replace call relations for a file. Returns count inserted."""
         with self.db.transaction() as conn:
             conn.execute(
-                "DELETE FROM code_calls WHERE project_id = ? AND file_path = ?",
+                """DELETE FROM code_calls INDEXED BY idx_cc_file
+                   WHERE project_id = ? AND file_path = ?""",
                 (project_id, file_path),
             )
             if not calls:
@@ -467,8 +564,11 @@ class CodeIndexStorage:
 
     def get_calls_for_file(self, project_id: str, file_path: str) -> list[dict[str, Any]]:
         """Get call relations for a file (for graph sync)."""
+        # The UNIQUE index also leads with project_id; without the hint
+        # SQLite picks it and scans every call in the project
         rows = self.db.fetchall(
-            """SELECT caller_symbol_id, callee_name, file_path, line FROM code_calls
+            """SELECT caller_symbol_id, callee_name, file_path, line
+               FROM code_calls INDEXED BY idx_cc_file
                WHERE project_id = ? AND file_path = ?""",
             (project_id, file_path),
         )
@@ -495,7 +595,8 @@ class CodeIndexStorage:
         """Delete call relations for a file. Returns count deleted."""
         with self.db.transaction() as conn:
             cursor = conn.execute(
-                "DELETE FROM code_calls WHERE project_id = ? AND file_path = ?",
+                """DELETE FROM code_calls INDEXED BY idx_cc_file
+                   WHERE project_id = ? AND file_path = ?""",
                 (project_id, file_path),
             )
             return cursor.rowcount
@@ -612,6 +713,21 @@ class CodeIndexStorage:
         )
         return row["cnt"] if row else 0
 
+    def get_index_generation(self, project_id: str) -> int | None:
+        """Counter bumped whenever a project's search results may change.
+
+        Returns None if the counter table is missing (pre-v208 databases).
+        """
+        try:
+            row = self.db.fetchone(
+                "SELECT generation FROM code_index_generation WHERE project_id = ?",
+                (project_id,),
+            )
+        except Exception as e:
+            logger.debug(f"code_index_generation unavailable: {e}")
+            return None
+        return int(row["generation"]) if row else 0
+
     # ── Content Chunks ──────────────────────────────────────────────
 
     def upsert_content_chunks(self, chunks: list[ContentChunk]) -> int:
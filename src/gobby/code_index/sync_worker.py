@@ -3,23 +3,83 @@
 Polls SQLite for files with vectors_synced=0 or graph_synced=0 and
 syncs them to Qdrant (embeddings) and Neo4j (graph edges) in-process.
 Replaces the old subprocess-based retry mechanism in maintenance.py.
+
+Each sync is a delta against the code_sync_items ledger of what was last
+written: only symbols whose embedding text changed are embedded (symbols
+that merely moved get their old vector copied), embedding requests are
+batched across files and projects up to a token budget, and graph edges
+are added and removed individually instead of rewriting the whole file.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from gobby.code_index.graph import CodeGraph
+    from gobby.code_index.models import IndexedFile, Symbol
     from gobby.code_index.storage import CodeIndexStorage
     from gobby.config.code_index import CodeIndexConfig
     from gobby.config.persistence import EmbeddingsConfig
 
 logger = logging.getLogger(__name__)
 
+# Ledger stores (code_sync_items.store)
+VECTOR = "vector"
+GRAPH = "graph"
+
+# Rough token estimate for embedding batch budgets
+_CHARS_PER_TOKEN = 4
+
+_STAT_KEYS = (
+    "files",
+    "embedded",
+    "reused",
+    "unchanged",
+    "vectors_deleted",
+    "embed_calls",
+    "graph_written",
+    "graph_removed",
+    "orphans",
+)
+
+
+@dataclass
+class _VectorDelta:
+    """Symbols to (re)write to Qdrant for a file, and points to drop."""
+
+    collection: str
+    upserts: list[tuple[Symbol, str, str]]  # (symbol, embedding text, text hash)
+    removed: list[str]
+    unchanged: int
+    bootstrap: bool  # nothing in the ledger yet: clear the file's points first
+
+
+@dataclass
+class _GraphDelta:
+    """Ledger edge keys to add (key -> hash) and remove for a file."""
+
+    added: dict[str, str]
+    removed: list[str]
+    symbols: dict[str, Symbol]
+    bootstrap: bool  # nothing in the ledger yet: rewrite the file's edges
+
+
+@dataclass
+class _FileSync:
+    project_id: str
+    file: IndexedFile  # as re-read when planning: marks are skipped if it changes again
+    vectors: _VectorDelta | None = None
+    graph: _GraphDelta | None = None
+    errors: list[str] = field(default_factory=list)
+
 
 async def sync_worker_loop(
     storage: CodeIndexStorage,
@@ -32,9 +92,9 @@ async def sync_worker_loop(
     """Continuous worker that syncs pending files to Qdrant and Neo4j.
 
     Polls every config.sync_worker_interval_seconds (default 5s).
-    Processes up to config.sync_worker_batch_size files per poll (default 50).
-    Each file's vector and graph sync are independent — one can succeed
-    while the other fails and retries on the next poll.
+    Processes up to config.sync_worker_batch_size files per project per poll
+    (default 50). Each file's vector and graph sync are independent — one
+    can succeed while the other fails and retries on the next poll.
     """
     interval = config.sync_worker_interval_seconds
     batch_size = config.sync_worker_batch_size
@@ -91,105 +151,132 @@ async def _sync_pass(
     config: CodeIndexConfig,
     embed_model: Any | None,
     batch_size: int,
-) -> None:
-    """Single sync pass across all indexed projects."""
-    projects = storage.list_indexed_projects()
-
-    for project in projects:
+) -> dict[str, int]:
+    """Single sync pass across all indexed projects. Returns pass counters."""
+    stats = dict.fromkeys(_STAT_KEYS, 0)
+    vectors_on = config.embedding_enabled and vector_store is not None and embed_model is not None
+    graph_on = config.graph_enabled and graph is not None and graph.available
+
+    syncs: list[_FileSync] = []
+    for project in storage.list_indexed_projects():
         if not project.root_path:
             continue
 
+        await _drop_orphans(storage, vector_store, graph, config, project.id, batch_size, stats)
+
         files = storage.get_pending_sync_files(
             project.id,
             limit=batch_size,
             vectors=config.embedding_enabled,
             graph=config.graph_enabled,
         )
-        if not files:
-            continue
-
         root = Path(project.root_path)
-        synced_count = 0
-
         for file in files:
             try:
-                did_sync = await _sync_file(
-                    storage=storage,
-                    vector_store=vector_store,
-                    graph=graph,
-                    config=config,
-                    embed_model=embed_model,
-                    project_id=project.id,
-                    root=root,
-                    file=file,
-                )
-                if did_sync:
-                    synced_count += 1
+                sync = _plan_file(storage, config, project.id, root, file, vectors_on, graph_on)
             except Exception as e:
-                logger.warning(f"Sync worker: failed to sync {file.file_path}: {e}")
+                logger.warning(f"Sync worker: failed to diff {file.file_path}: {e}")
+                continue
+            if sync is not None:
+                syncs.append(sync)
 
-        if synced_count > 0:
-            logger.info(
-                f"Sync worker: processed {synced_count}/{len(files)} files for project {project.id}"
-            )
+    if not syncs:
+        return stats
 
+    vector_syncs = [(s, s.vectors) for s in syncs if s.vectors is not None]
+    if vector_syncs:
+        await _sync_vectors(storage, vector_store, embed_model, config, vector_syncs, stats)
 
-async def _sync_file(
+    for sync in syncs:
+        if sync.graph is not None and graph is not None:
+            try:
+                await _sync_graph(storage, graph, sync, sync.graph, stats)
+            except Exception as e:
+                sync.errors.append("graph")
+                logger.warning(f"Sync worker: graph sync failed for {sync.file.file_path}: {e}")
+
+    stats["files"] = sum(1 for s in syncs if not s.errors)
+    logger.info(
+        f"Sync worker: synced {stats['files']}/{len(syncs)} files "
+        f"(embedded={stats['embedded']} in {stats['embed_calls']} calls, "
+        f"reused={stats['reused']}, unchanged={stats['unchanged']}, "
+        f"graph +{stats['graph_written']}/-{stats['graph_removed']})"
+    )
+    return stats
+
+
+def _plan_file(
     storage: CodeIndexStorage,
-    vector_store: Any | None,
-    graph: CodeGraph | None,
     config: CodeIndexConfig,
-    embed_model: Any | None,
     project_id: str,
     root: Path,
-    file: Any,
-) -> bool:
-    """Sync a single file's vectors and/or graph edges. Returns True if any work done."""
+    file: IndexedFile,
+    vectors_on: bool,
+    graph_on: bool,
+) -> _FileSync | None:
+    """Diff a pending file against the ledger. None if there is nothing to do."""
     # Validate: file record still exists (not invalidated between poll and process)
     current = storage.get_file(project_id, file.file_path)
     if current is None:
-        return False
+        return None
 
     # Validate: file still exists on disk
-    full_path = root / file.file_path
-    if not full_path.exists():
-        return False
+    if not (root / file.file_path).exists():
+        return None
 
-    did_work = False
+    want_vectors = vectors_on and not current.vectors_synced
+    want_graph = graph_on and not current.graph_synced
+    if not (want_vectors or want_graph):
+        return None
 
-    # Vector sync
-    if not file.vectors_synced and config.embedding_enabled:
-        if vector_store is not None and embed_model is not None:
-            try:
-                await _sync_vectors(
-                    storage=storage,
-                    vector_store=vector_store,
-                    embed_model=embed_model,
-                    config=config,
-                    project_id=project_id,
-                    file=file,
-                )
-                storage.mark_vectors_synced(file.id)
-                did_work = True
-            except Exception as e:
-                logger.warning(f"Sync worker: vector sync failed for {file.file_path}: {e}")
+    symbols = storage.get_symbols_for_file(project_id, file.file_path)
+    sync = _FileSync(project_id=project_id, file=current)
+    if want_vectors:
+        sync.vectors = _diff_vectors(storage, config, project_id, file.file_path, symbols)
+    if want_graph:
+        sync.graph = _diff_graph(storage, project_id, file.file_path, symbols)
+    return sync
+
+
+# ── Vectors ─────────────────────────────────────────────────────────
+
+
+def _embedding_text(sym: Symbol) -> str:
+    """Text embedded for a symbol (same format as CodeIndexer._embed_symbols)."""
+    parts = [sym.qualified_name]
+    if sym.signature:
+        parts.append(sym.signature)
+    if sym.docstring:
+        parts.append(sym.docstring[:200])
+    return " ".join(parts)
 
-    # Graph sync
-    if not file.graph_synced and config.graph_enabled:
-        if graph is not None and graph.available:
-            try:
-                await _sync_graph(
-                    storage=storage,
-                    graph=graph,
-                    project_id=project_id,
-                    file=file,
-                )
-                storage.mark_graph_synced(file.id)
-                did_work = True
-            except Exception as e:
-                logger.warning(f"Sync worker: graph sync failed for {file.file_path}: {e}")
 
-    return did_work
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def _diff_vectors(
+    storage: CodeIndexStorage,
+    config: CodeIndexConfig,
+    project_id: str,
+    file_path: str,
+    symbols: list[Symbol],
+) -> _VectorDelta:
+    synced = storage.get_sync_items(project_id, VECTOR, file_path)
+    upserts = []
+    for sym in symbols:
+        text = _embedding_text(sym)
+        digest = _hash(text)
+        if synced.get(sym.id) != digest:
+            upserts.append((sym, text, digest))
+    current = {sym.id for sym in symbols}
+    return _VectorDelta(
+        collection=f"{config.qdrant_collection_prefix}{project_id}",
+        upserts=upserts,
+        removed=[key for key in synced if key not in current],
+        unchanged=len(symbols) - len(upserts),
+        bootstrap=not synced,
+    )
 
 
 async def _sync_vectors(
@@ -197,87 +284,288 @@ async def _sync_vectors(
     vector_store: Any,
     embed_model: Any,
     config: CodeIndexConfig,
-    project_id: str,
-    file: Any,
+    syncs: list[tuple[_FileSync, _VectorDelta]],
+    stats: dict[str, int],
 ) -> None:
-    """Generate embeddings and upsert to Qdrant for a file's symbols."""
-    symbols = storage.get_symbols_for_file(project_id, file.file_path)
-    if not symbols:
-        return
+    """Resolve every changed symbol's vector for the pass, then write per collection."""
+    by_collection: dict[tuple[str, str], list[tuple[_FileSync, _VectorDelta]]] = {}
+    for sync, delta in syncs:
+        by_collection.setdefault((sync.project_id, delta.collection), []).append((sync, delta))
+
+    vectors: dict[str, list[float]] = {}
+    for (project_id, collection), group in by_collection.items():
+        digests = [digest for _, delta in group for _, _, digest in delta.upserts]
+        vectors.update(await _reuse_vectors(storage, vector_store, project_id, collection, digests))
+
+    pending = [digest for _, delta in syncs for _, _, digest in delta.upserts]
+    stats["reused"] += sum(1 for digest in pending if digest in vectors)
+    texts = {
+        digest: text
+        for _, delta in syncs
+        for _, text, digest in delta.upserts
+        if digest not in vectors
+    }
+    vectors.update(await _embed_texts(embed_model, texts, config, stats))
+
+    for (project_id, collection), group in by_collection.items():
+        try:
+            await _write_vectors(
+                storage, vector_store, project_id, collection, group, vectors, stats
+            )
+        except Exception as e:
+            for sync, _ in group:
+                sync.errors.append("vectors")
+            logger.warning(f"Sync worker: vector sync failed for {collection}: {e}")
 
-    collection = f"{config.qdrant_collection_prefix}{project_id}"
 
-    # Delete old vectors for this file's symbols
+async def _reuse_vectors(
+    storage: CodeIndexStorage,
+    vector_store: Any,
+    project_id: str,
+    collection: str,
+    digests: list[str],
+) -> dict[str, list[float]]:
+    """Vectors already in Qdrant for identical embedding texts (e.g. moved symbols)."""
+    if not digests:
+        return {}
+    sources = storage.find_synced_vectors(project_id, digests)
+    if not sources:
+        return {}
     try:
-        await vector_store.delete(
-            filters={"file_path": file.file_path, "project_id": project_id},
-            collection_name=collection,
+        stored = await vector_store.get_vectors(
+            list(set(sources.values())), collection_name=collection
         )
-    except Exception:
-        pass  # Collection may not exist yet
+    except Exception as e:
+        logger.debug(f"Sync worker: vector reuse unavailable for {collection}: {e}")
+        return {}
+    return {digest: stored[point] for digest, point in sources.items() if point in stored}
+
+
+def _token_batches(
+    texts: list[tuple[str, str]], token_budget: int, max_batch: int
+) -> Iterator[list[tuple[str, str]]]:
+    """Split (hash, text) pairs into requests under the token budget and size cap."""
+    batch: list[tuple[str, str]] = []
+    tokens = 0
+    for item in texts:
+        cost = len(item[1]) // _CHARS_PER_TOKEN + 1
+        if batch and (tokens + cost > token_budget or len(batch) >= max_batch):
+            yield batch
+            batch, tokens = [], 0
+        batch.append(item)
+        tokens += cost
+    if batch:
+        yield batch
+
+
+async def _embed_texts(
+    embed_model: Any,
+    texts: dict[str, str],
+    config: CodeIndexConfig,
+    stats: dict[str, int],
+) -> dict[str, list[float]]:
+    """Embed hash -> text pairs in budgeted batches. Failed batches are left out."""
+    vectors: dict[str, list[float]] = {}
+    for batch in _token_batches(
+        list(texts.items()), config.sync_embed_token_budget, config.sync_embed_max_batch
+    ):
+        stats["embed_calls"] += 1
+        try:
+            embeddings = await embed_model.embed([text for _, text in batch])
+        except Exception as e:
+            logger.warning(f"Sync worker: embedding batch of {len(batch)} failed: {e}")
+            continue
+        for (digest, _), embedding in zip(batch, embeddings, strict=False):
+            if embedding is not None:
+                vectors[digest] = embedding
+                stats["embedded"] += 1
+    return vectors
 
-    # Build embedding texts (same format as CodeIndexer._embed_symbols)
-    texts = []
-    ids = []
-    for sym in symbols:
-        parts = [sym.qualified_name]
-        if sym.signature:
-            parts.append(sym.signature)
-        if sym.docstring:
-            parts.append(sym.docstring[:200])
-        texts.append(" ".join(parts))
-        ids.append(sym.id)
-
-    # Generate embeddings
-    embeddings = await embed_model.embed(texts)
-
-    # Build upsert items
-    items = []
-    for i, emb in enumerate(embeddings):
-        if emb is not None:
-            items.append(
-                (
-                    ids[i],
-                    emb,
-                    {
-                        "name": symbols[i].name,
-                        "kind": symbols[i].kind,
-                        "file_path": symbols[i].file_path,
-                        "project_id": project_id,
-                    },
-                )
-            )
 
+async def _write_vectors(
+    storage: CodeIndexStorage,
+    vector_store: Any,
+    project_id: str,
+    collection: str,
+    syncs: list[tuple[_FileSync, _VectorDelta]],
+    vectors: dict[str, list[float]],
+    stats: dict[str, int],
+) -> None:
+    """Upsert and delete one collection's points, then record the files as synced."""
+    ready = []
+    for sync, delta in syncs:
+        if all(digest in vectors for _, _, digest in delta.upserts):
+            ready.append((sync, delta))
+        else:
+            sync.errors.append("vectors")
+            logger.warning(f"Sync worker: missing embeddings for {sync.file.file_path}")
+
+    for sync, delta in ready:
+        if delta.bootstrap:
+            try:
+                await vector_store.delete(
+                    filters={"file_path": sync.file.file_path, "project_id": project_id},
+                    collection_name=collection,
+                )
+            except Exception:
+                pass  # Collection may not exist yet
+
+    items = [
+        (
+            sym.id,
+            vectors[digest],
+            {
+                "name": sym.name,
+                "kind": sym.kind,
+                "file_path": sym.file_path,
+                "project_id": project_id,
+            },
+        )
+        for _, delta in ready
+        for sym, _, digest in delta.upserts
+    ]
+    removed = [key for _, delta in ready for key in delta.removed]
     if items:
         await vector_store.batch_upsert(items=items, collection_name=collection)
+    if removed:
+        await vector_store.delete_many(removed, collection_name=collection)
+
+    for sync, delta in ready:
+        storage.record_sync_items(
+            project_id,
+            VECTOR,
+            sync.file.file_path,
+            {sym.id: digest for sym, _, digest in delta.upserts},
+            delta.removed,
+            synced_file=sync.file,
+        )
+        stats["unchanged"] += delta.unchanged
+        stats["vectors_deleted"] += len(delta.removed)
+
+
+# ── Graph ───────────────────────────────────────────────────────────
+
+
+def _edge_key(*parts: Any) -> str:
+    return json.dumps(parts, separators=(",", ":"))
+
+
+def _graph_items(
+    storage: CodeIndexStorage, project_id: str, file_path: str, symbols: list[Symbol]
+) -> dict[str, str]:
+    """Ledger keys (-> property hash) for every edge the file contributes."""
+    items: dict[str, str] = {}
+    for imp in storage.get_imports_for_file(project_id, file_path):
+        items[_edge_key("imports", file_path, imp["target_module"])] = ""
+    for call in storage.get_calls_for_file(project_id, file_path):
+        key = _edge_key("calls", call["caller_symbol_id"], call["callee_name"], call["line"])
+        items[key] = ""
+    for sym in symbols:
+        items[_edge_key("defines", sym.id)] = _hash(f"{sym.name}\0{sym.kind}\0{sym.line_start}")
+    return items
+
+
+def _diff_graph(
+    storage: CodeIndexStorage, project_id: str, file_path: str, symbols: list[Symbol]
+) -> _GraphDelta:
+    synced = storage.get_sync_items(project_id, GRAPH, file_path)
+    current = _graph_items(storage, project_id, file_path, symbols)
+    return _GraphDelta(
+        added={key: h for key, h in current.items() if synced.get(key) != h},
+        removed=[key for key in synced if key not in current],
+        symbols={sym.id: sym for sym in symbols},
+        bootstrap=not synced,
+    )
+
+
+def _delta_args(
+    file_path: str, added: list[str], removed: list[str], symbols: dict[str, Symbol]
+) -> dict[str, list[Any]]:
+    """CodeGraph.apply_file_delta arguments from ledger edge keys."""
+    args: dict[str, list[Any]] = {
+        "imports": [],
+        "calls": [],
+        "contains": [],
+        "removed_imports": [],
+        "removed_calls": [],
+        "removed_symbols": [],
+    }
+    for prefix, keys in (("", added), ("removed_", removed)):
+        for key in keys:
+            kind, *parts = json.loads(key)
+            if kind == "imports":
+                args[f"{prefix}imports"].append(parts[1])
+            elif kind == "calls":
+                caller_id, callee_name, line = parts
+                args[f"{prefix}calls"].append(
+                    {
+                        "caller_symbol_id": caller_id,
+                        "callee_name": callee_name,
+                        "file_path": file_path,
+                        "line": line,
+                    }
+                )
+            elif prefix:
+                args["removed_symbols"].append(parts[0])
+            else:
+                sym = symbols[parts[0]]
+                args["contains"].append(
+                    {"id": sym.id, "name": sym.name, "kind": sym.kind, "line_start": sym.line_start}
+                )
+    return args
 
 
 async def _sync_graph(
     storage: CodeIndexStorage,
     graph: CodeGraph,
-    project_id: str,
-    file: Any,
+    sync: _FileSync,
+    delta: _GraphDelta,
+    stats: dict[str, int],
 ) -> None:
-    """Write Neo4j edges for a file from SQLite import/call/symbol data."""
-    # Delete old graph data for this file
-    await graph.delete_file(file_path=file.file_path, project_id=project_id)
+    """Apply a file's edge delta to Neo4j and record it in the ledger."""
+    file_path = sync.file.file_path
+    if delta.bootstrap:
+        # Edges written before the ledger existed are unknown: start clean
+        await graph.delete_file(file_path=file_path, project_id=sync.project_id)
+
+    if delta.added or delta.removed:
+        await graph.apply_file_delta(
+            sync.project_id,
+            file_path,
+            **_delta_args(file_path, list(delta.added), delta.removed, delta.symbols),
+        )
+    storage.record_sync_items(
+        sync.project_id, GRAPH, file_path, delta.added, delta.removed, synced_file=sync.file
+    )
+    stats["graph_written"] += len(delta.added)
+    stats["graph_removed"] += len(delta.removed)
 
-    # Read relations from SQLite
-    imports = storage.get_imports_for_file(project_id, file.file_path)
-    calls = storage.get_calls_for_file(project_id, file.file_path)
-    symbols = storage.get_symbols_for_file(project_id, file.file_path)
 
-    # Build contains list (for DEFINES edges)
-    contains = [
-        {"id": sym.id, "name": sym.name, "kind": sym.kind, "line_start": sym.line_start}
-        for sym in symbols
-    ]
+# ── Deleted files ───────────────────────────────────────────────────
 
-    # Write to Neo4j
-    await graph.add_relationships(
-        project_id=project_id,
-        file_path=file.file_path,
-        imports=imports,
-        calls=calls,
-        contains=contains,
-    )
+
+async def _drop_orphans(
+    storage: CodeIndexStorage,
+    vector_store: Any | None,
+    graph: CodeGraph | None,
+    config: CodeIndexConfig,
+    project_id: str,
+    limit: int,
+    stats: dict[str, int],
+) -> None:
+    """Remove synced points and edges of files that left the index."""
+    for file_path in storage.get_orphaned_sync_files(project_id, limit=limit):
+        try:
+            points = list(storage.get_sync_items(project_id, VECTOR, file_path))
+            if points and vector_store is not None:
+                await vector_store.delete_many(
+                    points, collection_name=f"{config.qdrant_collection_prefix}{project_id}"
+                )
+            edges = list(storage.get_sync_items(project_id, GRAPH, file_path))
+            if edges and graph is not None:
+                await graph.delete_file(file_path=file_path, project_id=project_id)
+            storage.record_sync_items(project_id, VECTOR, file_path, {}, points)
+            storage.record_sync_items(project_id, GRAPH, file_path, {}, edges)
+            stats["orphans"] += 1
+        except Exception as e:
+            logger.warning(f"Sync worker: failed to drop deleted file {file_path}: {e}")
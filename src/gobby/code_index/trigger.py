@@ -4,16 +4,50 @@ Accumulates file edit notifications and coalesces them into
 batched index_changed_files() calls after a configurable delay.
 Thread-safe: accepts notifications from sync threads, schedules
 work on the asyncio event loop.
+
+When a project's debounce window closes, its files join that project's
+queued set. One dispatcher sends the queued sets to gcode one batch at a
+time, so edits that arrive while a batch is indexing merge into the next
+batch instead of starting more gcode processes. Batches go to a persistent
+GcodeWorker when one is configured and gcode supports it; otherwise each
+batch runs ``gcode index --files ...`` as its own subprocess. A batch that
+fails because gcode crashed or timed out is queued again.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+
+from gobby.code_index.worker import (
+    GcodeIndexError,
+    GcodeWorker,
+    GcodeWorkerError,
+    GcodeWorkerUnavailable,
+)
+from gobby.telemetry.instruments import dec_gauge, inc_counter, inc_gauge, observe_histogram
 
 logger = logging.getLogger(__name__)
 
+# Recent batches kept for latency stats
+_LATENCY_WINDOW = 256
+
+
+@dataclass
+class _TriggerStats:
+    batches: int = 0
+    files: int = 0
+    retried: int = 0
+    dropped: int = 0
+    fallback_batches: int = 0
+    last_error: str | None = None
+    durations: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
 
 class CodeIndexTrigger:
     """Debounced trigger for post-edit incremental code indexing.
@@ -26,15 +60,34 @@ class CodeIndexTrigger:
         self,
         loop: asyncio.AbstractEventLoop,
         debounce_seconds: float = 2.0,
+        worker: GcodeWorker | None = None,
+        max_batch_files: int = 500,
+        max_attempts: int = 3,
+        subprocess_timeout: float = 30.0,
     ) -> None:
         self._loop = loop
         self._debounce_seconds = debounce_seconds
+        self._worker = worker
+        self._max_batch_files = max_batch_files
+        self._max_attempts = max_attempts
+        # Timeout for one `gcode index --files` subprocess
+        self._subprocess_timeout = subprocess_timeout
         # Pending files grouped by project_id
         self._pending: dict[str, set[str]] = {}
         # Root path per project (same for all files in a project)
         self._root_paths: dict[str, str] = {}
         # Per-project flush timer handle
         self._flush_timers: dict[str, asyncio.TimerHandle] = {}
+        # Debounced files waiting for gcode, merged per project
+        self._queued: dict[str, set[str]] = {}
+        # Projects with queued files, in dispatch order
+        self._ready: deque[str] = deque()
+        # Consecutive failed attempts per project
+        self._attempts: dict[str, int] = {}
+        self._retry_timers: set[asyncio.TimerHandle] = set()
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._in_flight = 0
+        self._stats = _TriggerStats()
 
     def notify_file_changed(
         self,
@@ -49,6 +102,44 @@ class CodeIndexTrigger:
         """
         self._loop.call_soon_threadsafe(self._schedule_file, file_path, project_id, root_path)
 
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, batch counters and per-batch index latency."""
+        stats = self._stats
+        return {
+            "queued_files": sum(len(files) for files in self._queued.values()),
+            "queued_projects": len(self._ready),
+            "debouncing_files": sum(len(files) for files in self._pending.values()),
+            "in_flight_files": self._in_flight,
+            "batches": stats.batches,
+            "files": stats.files,
+            "retried": stats.retried,
+            "dropped": stats.dropped,
+            "fallback_batches": stats.fallback_batches,
+            "last_error": stats.last_error,
+            "batch_ms": _summarize(stats.durations),
+            "worker": self._worker.stats() if self._worker else None,
+        }
+
+    async def close(self) -> None:
+        """Cancel timers and the dispatcher and stop the worker process."""
+        for handle in [*self._flush_timers.values(), *self._retry_timers]:
+            handle.cancel()
+        self._flush_timers.clear()
+        self._retry_timers.clear()
+        if self._dispatcher and not self._dispatcher.done():
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+        queued = sum(len(files) for files in self._queued.values())
+        if queued:
+            dec_gauge("code_index_queue_depth", queued)
+        self._queued.clear()
+        self._ready.clear()
+        if self._worker:
+            await self._worker.close()
+
     def _schedule_file(self, file_path: str, project_id: str, root_path: str) -> None:
         """Schedule or reschedule indexing for a file (runs on event loop)."""
         # Cancel existing flush timer for this project
@@ -71,18 +162,111 @@ class CodeIndexTrigger:
         )
 
     async def _flush(self, project_id: str) -> None:
-        """Flush pending files for a project via gcode subprocess."""
+        """Move a project's debounced files onto the index queue."""
         files = self._pending.pop(project_id, set())
         self._flush_timers.pop(project_id, None)
-        root_path = self._root_paths.pop(project_id, None)
 
-        if not files or not root_path:
+        if not files or not self._root_paths.get(project_id):
+            return
+
+        self._enqueue(project_id, files)
+
+    def _enqueue(self, project_id: str, files: set[str] | list[str]) -> None:
+        queued = self._queued.setdefault(project_id, set())
+        before = len(queued)
+        queued.update(files)
+        if len(queued) > before:
+            inc_gauge("code_index_queue_depth", len(queued) - before)
+        if project_id not in self._ready:
+            self._ready.append(project_id)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = self._loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """Index queued batches one at a time until the queue is empty."""
+        while self._ready:
+            project_id = self._ready.popleft()
+            files = sorted(self._queued.pop(project_id, ()))
+            if not files:
+                continue
+            batch, rest = files[: self._max_batch_files], files[self._max_batch_files :]
+            if rest:
+                self._queued[project_id] = set(rest)
+                self._ready.append(project_id)
+            dec_gauge("code_index_queue_depth", len(batch))
+
+            self._in_flight = len(batch)
+            try:
+                retry = await self._index_batch(project_id, self._root_paths[project_id], batch)
+            finally:
+                self._in_flight = 0
+            if retry:
+                self._retry(project_id, batch)
+            else:
+                self._attempts.pop(project_id, None)
+
+    def _retry(self, project_id: str, batch: list[str]) -> None:
+        attempts = self._attempts.get(project_id, 0) + 1
+        if attempts >= self._max_attempts:
+            self._attempts.pop(project_id, None)
+            self._stats.dropped += len(batch)
+            logger.warning(
+                f"Dropping {len(batch)} files for project {project_id} "
+                f"after {attempts} failed index attempts"
+            )
             return
+        self._attempts[project_id] = attempts
+        self._stats.retried += 1
+
+        def _requeue() -> None:
+            self._retry_timers.discard(handle)
+            self._enqueue(project_id, batch)
+
+        # Back off so a restarting gcode isn't hammered
+        handle = self._loop.call_later(self._debounce_seconds * attempts, _requeue)
+        self._retry_timers.add(handle)
 
+    async def _index_batch(self, project_id: str, root_path: str, files: list[str]) -> bool:
+        """Index one batch. Returns True if it should be retried."""
+        start = time.monotonic()
+        retry = False
+        worker = self._worker if self._worker and self._worker.available() else None
+        use_worker = worker is not None
+        if worker is not None:
+            try:
+                indexed = await worker.index(root_path, files)
+                logger.debug(f"gcode serve indexed {indexed} files for project {project_id}")
+            except GcodeWorkerUnavailable:
+                use_worker = False
+            except GcodeWorkerError as e:
+                self._stats.last_error = str(e)
+                logger.warning(f"gcode serve failed for project {project_id}: {e}")
+                retry = True
+            except GcodeIndexError as e:
+                self._stats.last_error = str(e)
+                logger.warning(f"gcode index failed for project {project_id}: {e}")
+        if not use_worker:
+            self._stats.fallback_batches += 1
+            retry = await self._run_subprocess(project_id, root_path, files)
+
+        duration = time.monotonic() - start
+        attributes = {
+            "mode": "worker" if use_worker else "subprocess",
+            "outcome": "retry" if retry else "done",
+        }
+        self._stats.batches += 1
+        self._stats.files += len(files)
+        self._stats.durations.append(duration)
+        inc_counter("code_index_batches_total", attributes=attributes)
+        observe_histogram("code_index_batch_duration_seconds", duration, attributes=attributes)
+        return retry
+
+    async def _run_subprocess(self, project_id: str, root_path: str, files: list[str]) -> bool:
+        """Index a batch with a one-off gcode subprocess. Returns True to retry."""
         gcode_bin = Path.home() / ".gobby" / "bin" / "gcode"
         if not gcode_bin.exists():
             logger.warning("gcode not installed — skipping incremental index. Run `gobby install`.")
-            return
+            return False
 
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -95,18 +279,34 @@ class CodeIndexTrigger:
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE,
             )
-            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=self._subprocess_timeout)
             if proc.returncode == 0:
                 logger.debug(f"gcode indexed {len(files)} files for project {project_id}")
             else:
                 detail = stderr.decode().strip() if stderr else "(no stderr)"
+                self._stats.last_error = detail
                 logger.warning(f"gcode index exited {proc.returncode}: {detail}")
         except TimeoutError:
-            logger.warning("gcode index timed out after 30s")
+            self._stats.last_error = f"timed out after {self._subprocess_timeout:g}s"
+            logger.warning(f"gcode index timed out after {self._subprocess_timeout:g}s")
             try:
                 proc.kill()
                 await proc.wait()
             except ProcessLookupError:
                 pass
+            return True
         except Exception as e:
+            self._stats.last_error = str(e)
             logger.warning(f"gcode index failed: {e}")
+        return False
+
+
+def _summarize(samples: deque[float]) -> dict[str, float] | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return {
+        "last": round(samples[-1] * 1000, 2),
+        "avg": round(sum(ordered) / len(ordered) * 1000, 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+    }
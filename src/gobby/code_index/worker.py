@@ -0,0 +1,245 @@
+"""Long-lived gcode indexing process.
+
+Starting ``gcode index --files ...`` for every debounced batch reopens the
+database and reloads the tree-sitter grammars each time. GcodeWorker keeps
+one ``gcode serve --stdio`` process running instead and sends it index
+requests over stdin/stdout.
+
+Each message is a frame: a 4-byte big-endian length followed by that many
+bytes of UTF-8 JSON. The worker opens with a handshake and then sends one
+request at a time::
+
+    -> {"id": 0, "op": "hello", "protocol": 1}
+    <- {"id": 0, "ok": true, "protocol": 1}
+    -> {"id": 1, "op": "index", "root": "/repo", "files": ["src/a.py"]}
+    <- {"id": 1, "ok": true, "indexed": 1}
+    <- {"id": 1, "ok": false, "error": "..."}
+
+A gcode build without ``serve`` exits or rejects the handshake; the worker
+then reports itself unavailable (until the binary changes) and callers fall
+back to one subprocess per batch. A crashed or timed-out process is killed
+and restarted on the next request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import struct
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+
+_HEADER = struct.Struct(">I")
+# Replies are small; anything bigger means the stream is out of sync
+_MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+
+def gcode_binary() -> Path:
+    """Path of the gcode binary installed by ``gobby install``."""
+    return Path.home() / ".gobby" / "bin" / "gcode"
+
+
+class GcodeWorkerError(Exception):
+    """The worker process failed or timed out; the batch can be retried."""
+
+
+class GcodeWorkerUnavailable(GcodeWorkerError):
+    """gcode is missing or has no ``serve`` mode; use the subprocess path."""
+
+
+class GcodeIndexError(Exception):
+    """gcode processed the request but reported that indexing failed."""
+
+
+def encode_frame(message: dict[str, Any]) -> bytes:
+    payload = json.dumps(message, separators=(",", ":")).encode()
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any]:
+    """Read one frame. Raises IncompleteReadError at EOF."""
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > _MAX_FRAME_BYTES:
+        raise GcodeWorkerError(f"gcode sent a {length}-byte frame")
+    message = json.loads(await reader.readexactly(length))
+    if not isinstance(message, dict):
+        raise GcodeWorkerError("gcode sent a non-object frame")
+    return message
+
+
+class GcodeWorker:
+    """One persistent ``gcode serve --stdio`` process, one request at a time."""
+
+    def __init__(
+        self,
+        binary: Path | None = None,
+        request_timeout: float = 30.0,
+        start_timeout: float = 5.0,
+    ) -> None:
+        self._binary = binary
+        self._request_timeout = request_timeout
+        self._start_timeout = start_timeout
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+        self._next_id = 1
+        # mtime of the binary that failed the handshake; a reinstall re-probes
+        self._unsupported_mtime: float | None = None
+        self.starts = 0
+        self.restarts = 0
+
+    @property
+    def binary(self) -> Path:
+        return self._binary or gcode_binary()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    def available(self) -> bool:
+        """False when the installed gcode is known to lack ``serve``."""
+        if self._unsupported_mtime is None:
+            return True
+        try:
+            mtime = self.binary.stat().st_mtime
+        except OSError:
+            return False
+        if mtime != self._unsupported_mtime:
+            self._unsupported_mtime = None
+            return True
+        return False
+
+    async def index(self, root_path: str, files: list[str]) -> int:
+        """Index ``files`` under ``root_path``; returns the number indexed.
+
+        Raises:
+            GcodeWorkerUnavailable: gcode is missing or can't serve.
+            GcodeWorkerError: the process died or timed out (it is killed).
+            GcodeIndexError: gcode reported an error for this batch.
+        """
+        async with self._lock:
+            if not self.running:
+                await self._start()
+            request_id = self._next_id
+            self._next_id += 1
+            reply = await self._request(
+                {"id": request_id, "op": "index", "root": root_path, "files": files},
+                self._request_timeout,
+            )
+        if not reply.get("ok"):
+            raise GcodeIndexError(str(reply.get("error") or "unknown error"))
+        return int(reply.get("indexed", len(files)))
+
+    async def close(self) -> None:
+        """Stop the process: close stdin so gcode exits, then kill if it lingers."""
+        async with self._lock:
+            proc, self._proc = self._proc, None
+            if proc is None or proc.returncode is not None:
+                return
+            try:
+                if proc.stdin:
+                    proc.stdin.close()
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except (TimeoutError, OSError):
+                await _kill(proc)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "available": self.available(),
+            "pid": self._proc.pid if self.running and self._proc else None,
+            "starts": self.starts,
+            "restarts": self.restarts,
+        }
+
+    async def _start(self) -> None:
+        binary = self.binary
+        if not self.available():
+            raise GcodeWorkerUnavailable("gcode has no serve mode")
+        if not binary.exists():
+            raise GcodeWorkerUnavailable(f"gcode not installed at {binary}")
+
+        if self.starts:
+            self.restarts += 1
+        self.starts += 1
+        start = time.monotonic()
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                str(binary),
+                "serve",
+                "--stdio",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise GcodeWorkerUnavailable(f"failed to start gcode serve: {e}") from e
+
+        try:
+            reply = await self._request(
+                {"id": 0, "op": "hello", "protocol": PROTOCOL_VERSION}, self._start_timeout
+            )
+        except GcodeWorkerError as e:
+            if isinstance(e.__cause__, (asyncio.IncompleteReadError, ConnectionError)):
+                # Exited before answering: this gcode build has no serve mode
+                self._mark_unsupported(binary)
+                raise GcodeWorkerUnavailable("gcode serve exited during handshake") from e
+            raise
+        if not reply.get("ok") or reply.get("protocol") != PROTOCOL_VERSION:
+            await self._stop()
+            self._mark_unsupported(binary)
+            raise GcodeWorkerUnavailable(f"gcode serve rejected handshake: {reply}")
+        logger.debug(
+            f"gcode serve started (pid {self._proc.pid}) in "
+            f"{(time.monotonic() - start) * 1000:.0f}ms"
+        )
+
+    async def _request(self, message: dict[str, Any], timeout: float) -> dict[str, Any]:
+        proc = self._proc
+        if proc is None or proc.stdin is None or proc.stdout is None:
+            raise GcodeWorkerError("gcode serve is not running")
+        try:
+            proc.stdin.write(encode_frame(message))
+            await proc.stdin.drain()
+            reply = await asyncio.wait_for(read_frame(proc.stdout), timeout=timeout)
+        except TimeoutError as e:
+            await self._stop()
+            raise GcodeWorkerError(f"gcode serve timed out after {timeout:.0f}s") from e
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            await self._stop()
+            raise GcodeWorkerError(f"gcode serve failed: {e!r}") from e
+        except GcodeWorkerError:
+            await self._stop()
+            raise
+        if reply.get("id") != message["id"]:
+            await self._stop()
+            raise GcodeWorkerError(f"gcode serve answered {reply.get('id')}, not {message['id']}")
+        return reply
+
+    async def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            await _kill(proc)
+
+    def _mark_unsupported(self, binary: Path) -> None:
+        try:
+            self._unsupported_mtime = binary.stat().st_mtime
+        except OSError:
+            self._unsupported_mtime = 0.0
+        logger.info("gcode has no serve mode; indexing with one subprocess per batch")
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=2.0)
+    except TimeoutError:
+        logger.warning(f"gcode serve (pid {proc.pid}) did not exit after kill")
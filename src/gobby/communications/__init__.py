@@ -1,4 +1,16 @@
 # Communications manager exports
-from gobby.communications.manager import CommunicationsManager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gobby.communications.manager import CommunicationsManager
 
 __all__ = ["CommunicationsManager"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import: the manager pulls in every channel adapter (and httpx)."""
+    if name == "CommunicationsManager":
+        from gobby.communications.manager import CommunicationsManager
+
+        return CommunicationsManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
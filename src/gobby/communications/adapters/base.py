@@ -85,6 +85,23 @@ class BaseChannelAdapter(ABC):
         """
         raise NotImplementedError(f"{self.channel_type} adapter does not support file attachments")
 
+    @property
+    def supports_batching(self) -> bool:
+        """Whether send_batch delivers several messages more cheaply than one at a time.
+
+        The outbound queue hands batching adapters up to ``batch_size`` queued
+        messages per send, charged as a single rate-limit token.
+        """
+        return False
+
+    async def send_batch(self, messages: list[CommsMessage]) -> list[str | None]:
+        """Send several messages and return their platform message IDs, in order.
+
+        Default sends each message in turn. Override together with
+        ``supports_batching`` when the platform accepts many messages per call.
+        """
+        return [await self.send_message(message) for message in messages]
+
     async def poll(self) -> list[CommsMessage]:
         """Poll for new messages (default implementation returns empty list)."""
         return []
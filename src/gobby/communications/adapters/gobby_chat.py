@@ -11,6 +11,7 @@ WebSocketServer's broadcast method.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Callable
 from typing import Any
@@ -122,6 +123,14 @@ class GobbyChatAdapter(BaseChannelAdapter):
 
         return message.id
 
+    @property
+    def supports_batching(self) -> bool:
+        return True
+
+    async def send_batch(self, messages: list[CommsMessage]) -> list[str | None]:
+        """Broadcast queued messages concurrently (there is no platform rate limit)."""
+        return list(await asyncio.gather(*(self.send_message(m) for m in messages)))
+
     async def shutdown(self) -> None:
         """No-op — the WebSocket server has its own lifecycle."""
         self._broadcast = None
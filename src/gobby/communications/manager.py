@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from collections.abc import Callable
@@ -18,6 +19,7 @@ from gobby.communications.models import (
     CommsMessage,
     CommsRoutingRule,
 )
+from gobby.communications.outbox import OutboundQueue
 from gobby.communications.polling import PollingManager
 from gobby.communications.rate_limiter import TokenBucketRateLimiter
 from gobby.communications.router import MessageRouter
@@ -72,6 +74,12 @@ class CommunicationsManager:
         self._rate_limiter = TokenBucketRateLimiter.from_defaults(config.channel_defaults)
         self._router = MessageRouter(store)
         self._polling_manager = PollingManager(self)
+        self._outbox = OutboundQueue(
+            store,
+            self._rate_limiter,
+            config.channel_defaults,
+            on_delivered=self._on_outbound_delivered,
+        )
         self.event_callback: Callable[..., Any] | None = None
         self.reaction_handler: Any | None = None
 
@@ -108,6 +116,9 @@ class CommunicationsManager:
                     interval = channel.config_json.get("poll_interval")
                     self._polling_manager.start_polling(channel.name, adapter, interval)
 
+                # Deliver outbound messages, including any left pending by the last run
+                self._outbox.start_channel(channel, adapter)
+
                 logger.info(
                     f"Communications: initialized channel {channel.name!r} ({channel.channel_type})",
                 )
@@ -118,6 +129,7 @@ class CommunicationsManager:
     async def stop(self) -> None:
         """Shutdown all adapters and clear state."""
         self._polling_manager.stop_all()
+        self._outbox.stop_all()
         for name, adapter in list(self._adapters.items()):
             try:
                 await adapter.shutdown()
@@ -197,7 +209,13 @@ class CommunicationsManager:
         session_id: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> CommsMessage:
-        """Send a message to a named channel.
+        """Queue a message for delivery to a named channel.
+
+        The message is stored with status ``pending`` and handed to the
+        channel's outbound worker (see gobby.communications.outbox), which
+        applies rate limiting, retries and dead-lettering. The returned
+        message is updated in place once it is sent or fails; use
+        ``flush_outbox()`` to wait for delivery.
 
         Args:
             channel_name: Name of the channel to send to.
@@ -206,7 +224,7 @@ class CommunicationsManager:
             metadata: Optional metadata dict.
 
         Returns:
-            The CommsMessage that was sent (or failed).
+            The queued CommsMessage.
 
         Raises:
             ValueError: If the channel is not found or not active.
@@ -217,9 +235,6 @@ class CommunicationsManager:
 
         channel = self._channel_by_name[channel_name]
 
-        # Rate limit check — waits until a token is available
-        await self._rate_limiter.wait_if_needed(channel.id)
-
         # Look up thread if we have a session
         platform_thread_id = None
         if session_id:
@@ -242,30 +257,57 @@ class CommunicationsManager:
             created_at=datetime.now(UTC).isoformat(),
         )
 
-        # Send via adapter
+        # Persist before queueing so a restart can resume delivery
         try:
-            platform_message_id = await adapter.send_message(message)
-            message.platform_message_id = platform_message_id
-            message.status = "sent"
-        except Exception as e:
-            message.status = "failed"
-            message.error = str(e)
-            logger.error(f"Failed to send message to {channel_name!r}: {e}", exc_info=True)
-
-        # Store in DB
-        try:
-            self._store.create_message(message)
+            self._store.enqueue_outbound(message)
         except Exception as e:
             logger.error(f"Failed to store outbound message: {e}", exc_info=True)
 
-        # Fire event callback
+        self._outbox.submit(channel_name, message)
+        return message
+
+    async def _on_outbound_delivered(self, message: CommsMessage) -> None:
+        """Fire the event callback once a queued message is sent or dead-lettered."""
         if self.event_callback is not None:
             try:
                 await self.event_callback("comms.message_sent", message=message)
             except Exception as e:
                 logger.debug(f"Event callback error on send_message: {e}", exc_info=True)
 
-        return message
+    async def flush_outbox(self, timeout: float | None = None) -> bool:
+        """Wait until all queued outbound messages are sent or dead-lettered.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if every channel's queue drained, False on timeout.
+        """
+        return await self._outbox.flush(timeout)
+
+    def get_outbox_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-channel outbound queue depth, delivery counters and latency."""
+        return self._outbox.stats()
+
+    def retry_dead_letters(self, channel_name: str | None = None) -> int:
+        """Re-queue dead-lettered outbound messages.
+
+        Args:
+            channel_name: Limit to one channel (default: all active channels).
+
+        Returns:
+            Number of messages re-queued.
+        """
+        names = [channel_name] if channel_name else list(self._channel_by_name)
+        requeued = 0
+        for name in names:
+            channel = self._channel_by_name.get(name)
+            if channel is None:
+                raise ValueError(f"Channel {name!r} not found or not active")
+            entries = self._store.requeue_dead_letters(channel_id=channel.id)
+            self._outbox.requeue(name, entries)
+            requeued += len(entries)
+        return requeued
 
     async def send_attachment(
         self,
@@ -377,7 +419,7 @@ class CommunicationsManager:
             session_id: Optional session ID for routing rule matching.
 
         Returns:
-            List of CommsMessages sent.
+            List of CommsMessages queued, one per matching active channel.
         """
         channel_ids = await self._router.match_channels(
             event_type, project_id=project_id, session_id=session_id
@@ -385,17 +427,18 @@ class CommunicationsManager:
 
         # Build reverse map: channel_id -> channel_name for active adapters
         id_to_name: dict[str, str] = {c.id: n for n, c in self._channel_by_name.items()}
+        channel_names = [id_to_name[cid] for cid in channel_ids if cid in id_to_name]
 
+        results = await asyncio.gather(
+            *(self.send_message(name, content, session_id=session_id) for name in channel_names),
+            return_exceptions=True,
+        )
         messages: list[CommsMessage] = []
-        for channel_id in channel_ids:
-            channel_name = id_to_name.get(channel_id)
-            if channel_name is None:
-                continue
-            try:
-                msg = await self.send_message(channel_name, content, session_id=session_id)
-                messages.append(msg)
-            except Exception as e:
-                logger.error(f"send_event: failed to send to {channel_name!r}: {e}")
+        for channel_name, result in zip(channel_names, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"send_event: failed to send to {channel_name!r}: {result}")
+            else:
+                messages.append(result)
 
         return messages
 
@@ -618,6 +661,8 @@ class CommunicationsManager:
                 interval = channel_config.config_json.get("poll_interval")
                 self._polling_manager.start_polling(name, adapter, interval)
 
+            self._outbox.start_channel(channel_config, adapter)
+
             logger.info(f"Added channel {name!r} ({channel_type})")
         except Exception as e:
             logger.error(f"Failed to initialize adapter for new channel {name!r}: {e}")
@@ -633,6 +678,7 @@ class CommunicationsManager:
         adapter = self._adapters.pop(name, None)
         channel = self._channel_by_name.pop(name, None)
 
+        self._outbox.stop_channel(name)
         if adapter is not None:
             self._polling_manager.stop_polling(name)
             try:
@@ -748,6 +794,7 @@ class CommunicationsManager:
                 "supports_webhooks": adapter.supports_webhooks,
                 "supports_polling": adapter.supports_polling,
                 "is_polling": self._polling_manager.is_polling(name),
+                "outbox": self._outbox_status(channel),
             }
 
         # Channel not active — check DB
@@ -764,6 +811,15 @@ class CommunicationsManager:
             "enabled": db_channel.enabled,
         }
 
+    def _outbox_status(self, channel: ChannelConfig) -> dict[str, Any] | None:
+        status = self._outbox.channel_stats(channel.name)
+        if status is not None:
+            try:
+                status["dead_letters"] = self._store.count_outbox(channel.id)["dead"]
+            except Exception as e:
+                logger.debug(f"Failed to count dead letters for {channel.name!r}: {e}")
+        return status
+
     # --- Public store delegation methods ---
 
     def get_channel_by_name(self, name: str) -> ChannelConfig | None:
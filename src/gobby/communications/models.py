@@ -237,3 +237,26 @@ class CommsRoutingRule:
             created_at=data.get("created_at", datetime.now().isoformat()),
             updated_at=data.get("updated_at", datetime.now().isoformat()),
         )
+
+
+@dataclass
+class OutboxEntry:
+    """An outbound message waiting in (or dead-lettered from) the delivery outbox."""
+
+    message: CommsMessage
+    status: Literal["pending", "dead"] = "pending"
+    attempts: int = 0
+    last_error: str | None = None
+    next_attempt_at: str | None = None
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> OutboxEntry:
+        """Create from a comms_messages row joined with its comms_outbox columns."""
+        data = dict(row)
+        return cls(
+            message=CommsMessage.from_row(data),
+            status=data.get("outbox_status", "pending"),
+            attempts=int(data.get("attempts") or 0),
+            last_error=data.get("last_error"),
+            next_attempt_at=data.get("next_attempt_at"),
+        )
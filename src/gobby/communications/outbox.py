@@ -0,0 +1,358 @@
+"""Durable outbound delivery queue for communications channels.
+
+CommunicationsManager.send_message() stores the message together with a
+``comms_outbox`` row and returns at once. One worker per channel drains that
+channel's queue: it waits for a token from the TokenBucketRateLimiter, sends
+through the adapter (several messages per call when the adapter supports
+batching), then marks the message sent. Failed sends are retried with
+exponential backoff and dead-lettered after ``retry_count`` retries. Pending
+rows are reloaded when a channel starts, so a restart doesn't lose messages.
+
+A slow or rate-limited channel only delays its own worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from gobby.telemetry.instruments import dec_gauge, inc_counter, inc_gauge, observe_histogram
+
+if TYPE_CHECKING:
+    from gobby.communications.adapters.base import BaseChannelAdapter
+    from gobby.communications.models import ChannelConfig, CommsMessage, OutboxEntry
+    from gobby.communications.rate_limiter import TokenBucketRateLimiter
+    from gobby.config.communications import ChannelDefaults
+    from gobby.storage.communications import LocalCommunicationsStore
+
+logger = logging.getLogger(__name__)
+
+# Recent deliveries kept per channel for latency stats
+_LATENCY_WINDOW = 256
+
+
+@dataclass
+class _Pending:
+    """A message owned by a channel worker until it is sent or dead-lettered."""
+
+    message: CommsMessage
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _ChannelStats:
+    sent: int = 0
+    retried: int = 0
+    dead_lettered: int = 0
+    last_error: str | None = None
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+    send_durations: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+
+class _ChannelWorker:
+    """Delivery loop for one channel."""
+
+    def __init__(
+        self,
+        queue: OutboundQueue,
+        channel: ChannelConfig,
+        adapter: BaseChannelAdapter,
+    ) -> None:
+        self._outbox = queue
+        self.channel = channel
+        self.adapter = adapter
+        self.stats = _ChannelStats()
+        self.queue: asyncio.Queue[_Pending] = asyncio.Queue()
+        # Messages not yet sent or dead-lettered: queued, in flight or awaiting retry
+        self.outstanding = 0
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self._retry_handles: set[asyncio.TimerHandle] = set()
+        self._attributes = {"channel": channel.name}
+
+        defaults = queue.defaults
+        config = channel.config_json
+        self.retry_count = int(config.get("retry_count", defaults.retry_count))
+        self.retry_backoff = float(
+            config.get("retry_backoff_seconds", defaults.retry_backoff_seconds)
+        )
+        self.max_retry_backoff = float(
+            config.get("max_retry_backoff_seconds", defaults.max_retry_backoff_seconds)
+        )
+        self.batch_size = max(1, int(config.get("batch_size", defaults.batch_size)))
+
+        self.task = asyncio.create_task(self._run(), name=f"outbox_{channel.name}")
+
+    def submit(self, pending: _Pending, delay: float = 0.0) -> None:
+        self.outstanding += 1
+        self.idle.clear()
+        inc_gauge("comms_outbound_queue_depth", attributes=self._attributes)
+        self._schedule(pending, delay)
+
+    def stop(self) -> None:
+        for handle in self._retry_handles:
+            handle.cancel()
+        self._retry_handles.clear()
+        self.task.cancel()
+        if self.outstanding:
+            dec_gauge("comms_outbound_queue_depth", self.outstanding, attributes=self._attributes)
+        self.outstanding = 0
+        self.idle.set()
+
+    def snapshot(self) -> dict[str, Any]:
+        stats = self.stats
+        return {
+            "depth": self.outstanding,
+            "queued": self.queue.qsize(),
+            "awaiting_retry": len(self._retry_handles),
+            "sent": stats.sent,
+            "retried": stats.retried,
+            "dead_lettered": stats.dead_lettered,
+            "last_error": stats.last_error,
+            "latency_ms": _summarize(stats.latencies),
+            "send_ms": _summarize(stats.send_durations),
+        }
+
+    def _schedule(self, pending: _Pending, delay: float) -> None:
+        if delay <= 0:
+            self.queue.put_nowait(pending)
+            return
+
+        def _requeue() -> None:
+            self._retry_handles.discard(handle)
+            self.queue.put_nowait(pending)
+
+        handle = asyncio.get_running_loop().call_later(delay, _requeue)
+        self._retry_handles.add(handle)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            if self.adapter.supports_batching:
+                while len(batch) < self.batch_size and not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+            try:
+                await self._deliver(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Outbox worker error on channel {self.channel.name!r}: {e}", exc_info=True
+                )
+
+    async def _deliver(self, batch: list[_Pending]) -> None:
+        # A batch is one API call, so it costs one token
+        await self._outbox.rate_limiter.wait_if_needed(self.channel.id)
+        messages = [pending.message for pending in batch]
+        started = time.monotonic()
+        try:
+            if len(batch) == 1:
+                platform_ids: list[str | None] = [await self.adapter.send_message(messages[0])]
+            else:
+                platform_ids = await self.adapter.send_batch(messages)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # A failed batch is retried as a whole
+            for pending in batch:
+                await self._failed(pending, e)
+            return
+
+        self.stats.send_durations.append(time.monotonic() - started)
+        platform_ids = list(platform_ids)[: len(batch)]
+        platform_ids += [None] * (len(batch) - len(platform_ids))
+        for pending, platform_id in zip(batch, platform_ids, strict=True):
+            await self._sent(pending, platform_id)
+
+    async def _sent(self, pending: _Pending, platform_id: str | None) -> None:
+        message = pending.message
+        message.platform_message_id = platform_id
+        message.status = "sent"
+        message.error = None
+        try:
+            self._outbox.store.complete_outbound(message.id, platform_id)
+        except Exception as e:
+            logger.error(f"Failed to mark outbound message {message.id} sent: {e}", exc_info=True)
+
+        latency = time.monotonic() - pending.enqueued_at
+        self.stats.sent += 1
+        self.stats.latencies.append(latency)
+        inc_counter("comms_outbound_sent_total", attributes=self._attributes)
+        observe_histogram("comms_outbound_latency_seconds", latency, attributes=self._attributes)
+        await self._finish(message)
+
+    async def _failed(self, pending: _Pending, error: Exception) -> None:
+        message = pending.message
+        pending.attempts += 1
+        self.stats.last_error = str(error)
+
+        if pending.attempts > self.retry_count:
+            message.status = "failed"
+            message.error = str(error)
+            logger.error(
+                f"Dead-lettering message {message.id} on {self.channel.name!r} "
+                f"after {pending.attempts} attempts: {error}"
+            )
+            try:
+                self._outbox.store.dead_letter_outbound(message.id, pending.attempts, str(error))
+            except Exception as e:
+                logger.error(f"Failed to dead-letter message {message.id}: {e}", exc_info=True)
+            self.stats.dead_lettered += 1
+            inc_counter("comms_outbound_dead_lettered_total", attributes=self._attributes)
+            await self._finish(message)
+            return
+
+        delay = min(self.retry_backoff * (2 ** (pending.attempts - 1)), self.max_retry_backoff)
+        logger.warning(
+            f"Send to {self.channel.name!r} failed (attempt {pending.attempts}/"
+            f"{self.retry_count + 1}), retrying in {delay:.1f}s: {error}"
+        )
+        next_attempt_at = (datetime.now(UTC) + timedelta(seconds=delay)).isoformat()
+        try:
+            self._outbox.store.retry_outbound(
+                message.id, pending.attempts, str(error), next_attempt_at
+            )
+        except Exception as e:
+            logger.error(f"Failed to record retry for message {message.id}: {e}", exc_info=True)
+        self.stats.retried += 1
+        inc_counter("comms_outbound_retried_total", attributes=self._attributes)
+        self._schedule(pending, delay)
+
+    async def _finish(self, message: CommsMessage) -> None:
+        self.outstanding = max(0, self.outstanding - 1)
+        dec_gauge("comms_outbound_queue_depth", attributes=self._attributes)
+        if self.outstanding == 0:
+            self.idle.set()
+        if self._outbox.on_delivered is not None:
+            try:
+                await self._outbox.on_delivered(message)
+            except Exception as e:
+                logger.debug(f"Outbox delivery callback error: {e}", exc_info=True)
+
+
+class OutboundQueue:
+    """Per-channel delivery workers over the durable ``comms_outbox`` table."""
+
+    def __init__(
+        self,
+        store: LocalCommunicationsStore,
+        rate_limiter: TokenBucketRateLimiter,
+        defaults: ChannelDefaults,
+        on_delivered: Callable[[CommsMessage], Awaitable[None]] | None = None,
+    ) -> None:
+        """Initialize the outbound queue.
+
+        Args:
+            store: Communications store holding messages and outbox rows.
+            rate_limiter: Shared per-channel rate limiter.
+            defaults: Retry/batching defaults (overridable per channel config).
+            on_delivered: Awaited with each message once it is sent or dead-lettered.
+        """
+        self.store = store
+        self.rate_limiter = rate_limiter
+        self.defaults = defaults
+        self.on_delivered = on_delivered
+        self._workers: dict[str, _ChannelWorker] = {}
+
+    def start_channel(self, channel: ChannelConfig, adapter: BaseChannelAdapter) -> None:
+        """Start the channel's worker and resume its pending outbox entries."""
+        self.stop_channel(channel.name)
+        worker = _ChannelWorker(self, channel, adapter)
+        self._workers[channel.name] = worker
+
+        try:
+            entries: list[OutboxEntry] = list(self.store.list_outbox(channel_id=channel.id))
+        except Exception as e:
+            logger.error(f"Failed to load outbox for {channel.name!r}: {e}", exc_info=True)
+            return
+        for entry in entries:
+            worker.submit(
+                _Pending(entry.message, attempts=entry.attempts),
+                delay=_seconds_until(entry.next_attempt_at),
+            )
+        if entries:
+            logger.info(f"Resuming {len(entries)} pending outbound message(s) on {channel.name!r}")
+
+    def stop_channel(self, channel_name: str) -> None:
+        """Stop a channel's worker. Undelivered messages stay in the outbox."""
+        worker = self._workers.pop(channel_name, None)
+        if worker is not None:
+            worker.stop()
+
+    def stop_all(self) -> None:
+        """Stop every worker."""
+        for channel_name in list(self._workers):
+            self.stop_channel(channel_name)
+
+    def submit(self, channel_name: str, message: CommsMessage) -> None:
+        """Queue a stored outbound message for delivery on a started channel.
+
+        Raises:
+            ValueError: If the channel has no running worker.
+        """
+        worker = self._workers.get(channel_name)
+        if worker is None:
+            raise ValueError(f"Channel {channel_name!r} has no outbound worker")
+        worker.submit(_Pending(message))
+
+    def requeue(self, channel_name: str, entries: list[OutboxEntry]) -> None:
+        """Queue previously dead-lettered entries again."""
+        worker = self._workers.get(channel_name)
+        if worker is None:
+            return
+        for entry in entries:
+            worker.submit(_Pending(entry.message))
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every channel has delivered or dead-lettered its messages.
+
+        Returns:
+            True if all queues drained, False on timeout.
+        """
+        waits = [worker.idle.wait() for worker in self._workers.values()]
+        if not waits:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.gather(*waits), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def channel_stats(self, channel_name: str) -> dict[str, Any] | None:
+        """Queue depth, delivery counters and latency for a channel."""
+        worker = self._workers.get(channel_name)
+        return worker.snapshot() if worker is not None else None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-channel stats for every running worker."""
+        return {name: worker.snapshot() for name, worker in self._workers.items()}
+
+
+def _summarize(samples: deque[float]) -> dict[str, float] | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return {
+        "last": round(samples[-1] * 1000, 2),
+        "avg": round(sum(ordered) / len(ordered) * 1000, 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+    }
+
+
+def _seconds_until(timestamp: str | None) -> float:
+    if not timestamp:
+        return 0.0
+    try:
+        when = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return 0.0
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
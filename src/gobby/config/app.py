@@ -296,6 +296,11 @@ class DaemonConfig(BaseModel):
         default=False,
         description="Run daemon in test mode (enables test endpoints)",
     )
+    hook_socket_enabled: bool = Field(
+        default=True,
+        description="Serve hook dispatch over a Unix domain socket (~/.gobby/hooks.sock) "
+        "in addition to HTTP. The hook dispatcher falls back to HTTP when unavailable.",
+    )
     cors_origins: list[str] = Field(
         default_factory=lambda: ["http://localhost:*", "https://localhost:*"],
         description="Allowed CORS origins. Defaults to localhost only. "
@@ -307,6 +312,11 @@ class DaemonConfig(BaseModel):
         default="~/.gobby/gobby-hub.db",
         description="Path to hub database for cross-project queries.",
     )
+    database_wal_mode: bool = Field(
+        default=False,
+        description="Run the hub database in WAL journal mode with a dedicated writer thread "
+        "for queued writes. Set in bootstrap.yaml (needed before the database opens).",
+    )
     # Sub-configs
     websocket: WebSocketSettings = Field(
         default_factory=WebSocketSettings,
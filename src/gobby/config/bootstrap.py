@@ -1,7 +1,8 @@
 """Bootstrap configuration for pre-database settings.
 
 These settings are needed before the database is available:
-database_path, daemon_port, bind_host, websocket_port, ui_port, neo4j_password.
+database_path, database_wal_mode, daemon_port, bind_host, websocket_port, ui_port,
+neo4j_password.
 
 All other configuration is managed via the DB (config_store) + Pydantic defaults.
 """
@@ -27,6 +28,7 @@ class BootstrapConfig:
     """Minimal settings needed before the database is available."""
 
     database_path: str = "~/.gobby/gobby-hub.db"
+    database_wal_mode: bool = False
     daemon_port: int = 60887
     bind_host: str = "localhost"
     websocket_port: int = 60888
@@ -40,6 +42,7 @@ class BootstrapConfig:
         """
         return {
             "database_path": self.database_path,
+            "database_wal_mode": self.database_wal_mode,
             "daemon_port": self.daemon_port,
             "bind_host": self.bind_host,
             "websocket": {"port": self.websocket_port},
@@ -84,6 +87,9 @@ def load_bootstrap(path: str | None = None) -> BootstrapConfig:
 
         return BootstrapConfig(
             database_path=str(data.get("database_path", BootstrapConfig.database_path)),
+            database_wal_mode=bool(
+                data.get("database_wal_mode", BootstrapConfig.database_wal_mode)
+            ),
             daemon_port=int(data.get("daemon_port", BootstrapConfig.daemon_port)),
             bind_host=str(data.get("bind_host", BootstrapConfig.bind_host)),
             websocket_port=int(data.get("websocket_port", BootstrapConfig.websocket_port)),
@@ -14,6 +14,18 @@ class CodeIndexConfig(BaseModel):
         default=True,
         description="Auto-reindex changed files on git commit",
     )
+    persistent_indexer: bool = Field(
+        default=True,
+        description=(
+            "Index post-edit batches through a long-lived `gcode serve` process. "
+            "Falls back to one `gcode index` subprocess per batch when unsupported"
+        ),
+    )
+    index_batch_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Timeout for one post-edit index batch (persistent indexer or subprocess)",
+    )
     maintenance_interval_seconds: int = Field(
         default=300,
         description="Background reindex interval in seconds",
@@ -46,7 +58,10 @@ class CodeIndexConfig(BaseModel):
     )
     graph_enabled: bool = Field(
         default=True,
-        description="Enable Neo4j call/import graph",
+        description=(
+            "Sync the call/import graph to Neo4j when it is configured. "
+            "Graph queries fall back to the SQLite call graph without it"
+        ),
     )
     qdrant_collection_prefix: str = Field(
         default="code_symbols_",
@@ -97,6 +112,32 @@ class CodeIndexConfig(BaseModel):
         default=50,
         description="Max files to sync per poll iteration",
     )
+    sync_embed_token_budget: int = Field(
+        default=8000,
+        gt=0,
+        description=(
+            "Estimated tokens per embedding request. The sync worker batches "
+            "changed symbols across files and projects up to this budget"
+        ),
+    )
+    sync_embed_max_batch: int = Field(
+        default=256,
+        gt=0,
+        description="Max symbol texts per embedding request",
+    )
+    search_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description=(
+            "How long hybrid code search results are cached per project. "
+            "Entries are also dropped as soon as the project's index changes. 0 disables"
+        ),
+    )
+    search_cache_max_entries: int = Field(
+        default=256,
+        gt=0,
+        description="Max cached code search results across all projects",
+    )
     content_extensions: list[str] = Field(
         default=[
             ".html",
@@ -8,7 +8,27 @@ class ChannelDefaults(BaseModel):
 
     rate_limit_per_minute: int = 30
     burst: int = 5
-    retry_count: int = 3
+    retry_count: int = Field(
+        default=3,
+        ge=0,
+        description="Delivery retries for an outbound message before it is dead-lettered",
+    )
+    retry_backoff_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Initial retry delay for failed outbound sends (doubles per attempt)",
+    )
+    max_retry_backoff_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Upper bound on the outbound retry delay",
+    )
+    batch_size: int = Field(
+        default=10,
+        ge=1,
+        description="Max queued messages handed to an adapter in one send on channels "
+        "whose adapter supports batching",
+    )
     poll_interval_seconds: int = 30
     retention_days: int = 90
 
@@ -230,6 +230,23 @@ class MetricsConfig(BaseModel):
         ge=0.0,
         description="Daily budget limit in USD. Set to 0 for unlimited.",
     )
+    flush_interval_ms: int = Field(
+        default=500,
+        ge=10,
+        description="Maximum time buffered tool-call metrics and events wait before "
+        "being written to SQLite.",
+    )
+    flush_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Number of buffered metrics events that triggers an early flush.",
+    )
+    max_buffered_events: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum metrics events held in memory between flushes. "
+        "The oldest events are dropped (and counted) beyond this.",
+    )
 
     @field_validator("list_limit")
     @classmethod
@@ -4,6 +4,7 @@ LLM providers configuration module.
 Contains LLM-related Pydantic config models:
 - LLMProviderConfig: Single provider config (models, auth_mode)
 - LLMProvidersConfig: Multi-provider config (claude, codex)
+- LLMResponseCacheConfig: Opt-in cache of text/JSON generation responses
 
 Extracted from app.py using Strangler Fig pattern for code decomposition.
 """
@@ -12,7 +13,7 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
-__all__ = ["LLMProviderConfig", "LLMProvidersConfig"]
+__all__ = ["LLMProviderConfig", "LLMProvidersConfig", "LLMResponseCacheConfig"]
 
 
 class LLMProviderConfig(BaseModel):
@@ -31,6 +32,30 @@ class LLMProviderConfig(BaseModel):
         return [m.strip() for m in self.models.split(",") if m.strip()]
 
 
+class LLMResponseCacheConfig(BaseModel):
+    """Configuration for the LLM response cache.
+
+    Caches generate_text/generate_json responses keyed by provider, model,
+    system prompt, prompt and parameters. While enabled, concurrent identical
+    requests also share one in-flight call.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Reuse responses for identical LLM requests (stored in SQLite)",
+    )
+    ttl_hours: float = Field(
+        default=168.0,
+        gt=0,
+        description="Hours a cached response stays valid",
+    )
+    max_entries: int = Field(
+        default=50_000,
+        gt=0,
+        description="Maximum cached responses; least recently used entries are evicted",
+    )
+
+
 class LLMProvidersConfig(BaseModel):
     """
     Configuration for multiple LLM providers.
@@ -44,6 +69,9 @@ class LLMProvidersConfig(BaseModel):
       codex:
         models: gpt-4o-mini,gpt-5-mini,gpt-5
         auth_mode: subscription
+      response_cache:
+        enabled: true
+        ttl_hours: 168
     ```
     """
 
@@ -69,6 +97,10 @@ class LLMProvidersConfig(BaseModel):
         default=None,
         description="Codex (OpenAI) provider configuration",
     )
+    response_cache: LLMResponseCacheConfig = Field(
+        default_factory=LLMResponseCacheConfig,
+        description="Opt-in cache of LLM text/JSON responses",
+    )
 
     def get_enabled_providers(self) -> list[str]:
         """Return list of enabled provider names."""
@@ -15,3 +15,16 @@ class PipelineConfig(BaseModel):
         description="Maximum nesting depth for invoke_pipeline steps. "
         "Prevents stack overflow from recursive/circular pipelines.",
     )
+    max_parallel_steps: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Default number of steps a DAG-scheduled pipeline (steps using "
+        "needs/parallel_group) runs at once. Overridden per pipeline by max_parallel.",
+    )
+    global_max_parallel_steps: int = Field(
+        default=16,
+        ge=1,
+        le=256,
+        description="Maximum exec/prompt/mcp steps running at once across all pipelines.",
+    )
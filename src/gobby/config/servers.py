@@ -34,6 +34,12 @@ class WebSocketSettings(BaseModel):
         default=10,
         description="Pong timeout in seconds before considering connection dead",
     )
+    client_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Outbound messages buffered per client before terminal output is "
+        "coalesced and trace events are dropped",
+    )
 
     @field_validator("port")
     @classmethod
@@ -640,6 +640,19 @@ class WorkflowConfig(BaseModel):
         default=False,
         description="Debug: echo additionalContext to system_message for terminal visibility",
     )
+    mcp_call_timeout: float = Field(
+        default=15.0,
+        gt=0,
+        description="Timeout in seconds for each blocking MCP call triggered by a rule",
+    )
+    mcp_dispatch_deadline: float = Field(
+        default=20.0,
+        gt=0,
+        description=(
+            "Deadline in seconds for all blocking rule MCP calls of one hook. "
+            "Calls still running are cancelled and reported as timed out"
+        ),
+    )
 
     @field_validator("timeout")
     @classmethod
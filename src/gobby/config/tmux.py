@@ -61,3 +61,10 @@ class TmuxConfig(BaseModel):
         ge=30,
         description="Seconds before an uninitialized agent is killed as a provider failure.",
     )
+    control_mode: bool = Field(
+        default=True,
+        description=(
+            "Stream pane output and run pane captures over one tmux control-mode "
+            "client instead of per-agent pipe-pane FIFOs and capture-pane subprocesses."
+        ),
+    )
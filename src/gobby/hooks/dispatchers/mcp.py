@@ -10,15 +10,26 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from gobby.hooks.events import HookEvent
 
+# Per-call and per-hook limits for blocking rule MCP calls.  Overridden by
+# ``WorkflowConfig.mcp_call_timeout`` / ``mcp_dispatch_deadline``.
+DEFAULT_CALL_TIMEOUT = 15.0
+DEFAULT_DISPATCH_DEADLINE = 20.0
+
+# Extra time the hook thread waits on the daemon loop beyond the deadline,
+# so the deadline inside the coroutine fires first and partial results return.
+_DEADLINE_GRACE = 2.0
+
 
 def run_coro_blocking(
     coro: Any,
     loop: asyncio.AbstractEventLoop | None,
     logger: logging.Logger,
+    timeout: float = 30.0,
 ) -> Any:
     """Run a coroutine blocking, using the best available event loop strategy.
 
@@ -26,6 +37,7 @@ def run_coro_blocking(
         coro: The coroutine to run.
         loop: Captured event loop for thread-safe scheduling.
         logger: Logger for diagnostics.
+        timeout: Seconds to wait when scheduling onto ``loop``.
 
     Returns:
         The coroutine result, or None on failure.
@@ -33,7 +45,7 @@ def run_coro_blocking(
     if loop and loop.is_running():
         try:
             future = asyncio.run_coroutine_threadsafe(coro, loop)
-            return future.result(timeout=30)
+            return future.result(timeout=timeout)
         except Exception as e:
             logger.error(f"run_coro_blocking: threadsafe failed: {e}")
             return None
@@ -156,12 +168,278 @@ def format_discovery_result(dr: dict[str, Any]) -> str:
         return f"**{tool} result:**\n```json\n{json.dumps(result, indent=2, default=str)}\n```"
 
 
+@dataclass
+class _PreparedCall:
+    """An mcp_call effect with event context injected into its arguments."""
+
+    index: int
+    server: str
+    tool: str
+    arguments: dict[str, Any]
+    background: bool
+    inject_result: bool
+    block_on_failure: bool
+    block_on_success: bool
+
+    @property
+    def needs_capture(self) -> bool:
+        return self.inject_result or self.block_on_failure or self.block_on_success
+
+
+def _prepare_calls(
+    mcp_calls: list[dict[str, Any]], event: HookEvent, logger: logging.Logger
+) -> list[_PreparedCall]:
+    """Validate mcp_call dicts and inject event context into their arguments."""
+    prepared: list[_PreparedCall] = []
+    for call in mcp_calls:
+        server = call.get("server")
+        tool = call.get("tool")
+        if not server or not tool:
+            logger.warning(f"dispatch_mcp_calls: missing server or tool in {call}")
+            continue
+
+        arguments = dict(call.get("arguments") or {})
+        if "session_id" not in arguments:
+            arguments["session_id"] = event.metadata.get("_platform_session_id", "")
+        if "prompt_text" not in arguments:
+            arguments["prompt_text"] = event.data.get("prompt") if event.data else None
+        if "project_path" not in arguments:
+            arguments["project_path"] = event.metadata.get("project_path") or None
+        # Map prompt_text to query for tools that expect it (e.g., search_memories)
+        if "query" not in arguments and arguments.get("prompt_text"):
+            arguments["query"] = arguments["prompt_text"]
+
+        inject_result = call.get("inject_result", False)
+        block_on_failure = call.get("block_on_failure", False)
+        block_on_success = call.get("block_on_success", False)
+        prepared.append(
+            _PreparedCall(
+                index=len(prepared),
+                server=server,
+                tool=tool,
+                arguments=arguments,
+                # Captured results are always awaited, even if marked background
+                background=call.get("background", False)
+                and not (inject_result or block_on_failure or block_on_success),
+                inject_result=inject_result,
+                block_on_failure=block_on_failure,
+                block_on_success=block_on_success,
+            )
+        )
+    return prepared
+
+
+async def _call_tool(
+    get_proxy: Any,
+    server: str,
+    tool: str,
+    args: dict[str, Any],
+    logger: logging.Logger,
+) -> dict[str, Any] | None:
+    """Call one tool through the proxy with session and project context set."""
+    # Set project + session context for this dispatch path.
+    # Previously missing — tools called by rules got None from
+    # get_project_context() and had no session ContextVar.
+    from gobby.utils.session_context import (
+        SessionContext,
+        reset_session_context,
+        set_session_context,
+    )
+
+    session_id: str = args.get("session_id", "")
+    session_token = None
+    project_token = None
+    try:
+        if session_id:
+            session_token = set_session_context(SessionContext(session_id=session_id))
+            # Set project context from session (fixes pre-existing gap)
+            try:
+                proxy = get_proxy()
+                if proxy and hasattr(proxy, "_mcp_manager"):
+                    mgr = proxy._mcp_manager
+                    if hasattr(mgr, "session_manager") and mgr.session_manager:
+                        from gobby.utils.project_context import (
+                            set_project_context_from_session,
+                        )
+
+                        project_token = set_project_context_from_session(
+                            session_id,
+                            mgr.session_manager,
+                            mgr.session_manager.db,
+                        )
+            except Exception as ctx_err:
+                logger.debug(f"dispatch_mcp_calls: failed to set project context: {ctx_err}")
+
+        # Backfill project_path from ContextVar if not already set.
+        # The arg injection at call-site defaults to None when event
+        # metadata lacks project_path (which is always). Now that
+        # set_project_context_from_session has populated the ContextVar,
+        # we can resolve the real path.
+        if not args.get("project_path"):
+            from gobby.utils.project_context import _current_project_context
+
+            ctx = _current_project_context.get()
+            if ctx and ctx.get("project_path"):
+                args["project_path"] = ctx["project_path"]
+
+        proxy = get_proxy()
+        if not proxy:
+            logger.warning("dispatch_mcp_calls: tool_proxy_getter returned None")
+            return {"success": False, "error": "tool_proxy_getter returned None"}
+
+        # Proxy self-routing: _proxy/* calls route to ToolProxyService
+        # methods directly instead of going through call_tool dispatch
+        if server == "_proxy":
+            result = await proxy_self_call(proxy, tool, args)
+        else:
+            result = await proxy.call_tool(server, tool, args, strip_unknown=True)
+
+        if isinstance(result, dict) and result.get("success") is False:
+            logger.warning(
+                f"dispatch_mcp_calls: {server}/{tool} returned failure: {result.get('error', 'unknown')}",
+            )
+        return result
+    except Exception as exc:
+        logger.error(f"dispatch_mcp_calls: {server}/{tool} failed: {exc}", exc_info=True)
+        return {"success": False, "error": str(exc)}
+    finally:
+        if session_token is not None:
+            reset_session_context(session_token)
+        if project_token is not None:
+            from gobby.utils.project_context import reset_project_context
+
+            reset_project_context(project_token)
+
+
+def _timed_out(call: _PreparedCall, reason: str) -> dict[str, Any]:
+    return {"success": False, "error": f"{call.server}/{call.tool} {reason}", "timed_out": True}
+
+
+def _succeeded(result: Any) -> bool:
+    return isinstance(result, dict) and bool(result.get("success", False))
+
+
+async def _call_with_timeout(
+    get_proxy: Any, call: _PreparedCall, call_timeout: float, logger: logging.Logger
+) -> dict[str, Any] | None:
+    try:
+        return await asyncio.wait_for(
+            _call_tool(get_proxy, call.server, call.tool, call.arguments, logger),
+            timeout=call_timeout,
+        )
+    except TimeoutError:
+        logger.warning(
+            f"dispatch_mcp_calls: {call.server}/{call.tool} timed out after {call_timeout}s"
+        )
+        return _timed_out(call, f"timed out after {call_timeout}s")
+
+
+def _stages(calls: list[_PreparedCall]) -> list[list[_PreparedCall]]:
+    """Split blocking calls into stages that end at each block_on_failure call.
+
+    Calls within a stage run concurrently.  A failed block_on_failure call
+    stops every call after it, so later stages only start once it succeeds.
+    """
+    stages: list[list[_PreparedCall]] = [[]]
+    for call in calls:
+        stages[-1].append(call)
+        if call.block_on_failure:
+            stages.append([])
+    return [stage for stage in stages if stage]
+
+
+async def _run_blocking_calls(
+    calls: list[_PreparedCall],
+    get_proxy: Any,
+    logger: logging.Logger,
+    call_timeout: float,
+    deadline: float,
+) -> tuple[dict[int, dict[str, Any] | None], int | None]:
+    """Run blocking calls concurrently, stage by stage, under a shared deadline.
+
+    Returns:
+        Tuple of (results keyed by call index, index of the failed
+        block_on_failure call that stopped dispatch or None).  Calls still
+        running at the deadline are cancelled and get a timed-out result;
+        calls in stages that never started get one too.
+    """
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + deadline
+    results: dict[int, dict[str, Any] | None] = {}
+
+    for stage in _stages(calls):
+        remaining = expires_at - loop.time()
+        if remaining <= 0:
+            for call in stage:
+                results[call.index] = _timed_out(call, "skipped: hook deadline exceeded")
+            continue
+
+        tasks = {
+            asyncio.ensure_future(_call_with_timeout(get_proxy, call, call_timeout, logger)): call
+            for call in stage
+        }
+        done, pending = await asyncio.wait(tasks, timeout=remaining)
+        for task in pending:
+            task.cancel()
+        for task, call in tasks.items():
+            if task in done:
+                results[call.index] = task.result()
+            else:
+                logger.warning(
+                    f"dispatch_mcp_calls: {call.server}/{call.tool} cancelled at "
+                    f"{deadline}s hook deadline"
+                )
+                results[call.index] = _timed_out(call, f"missed {deadline}s hook deadline")
+
+        for call in stage:
+            if call.block_on_failure and not _succeeded(results[call.index]):
+                return results, call.index
+
+    return results, None
+
+
+def _schedule_background(
+    call: _PreparedCall,
+    get_proxy: Any,
+    loop: asyncio.AbstractEventLoop | None,
+    logger: logging.Logger,
+) -> None:
+    """Fire-and-forget a background call with error logging."""
+    server, tool = call.server, call.tool
+    coro = _call_tool(get_proxy, server, tool, call.arguments, logger)
+
+    def _log_bg_error(t: asyncio.Task[Any]) -> None:
+        if not t.cancelled() and t.exception():
+            logger.warning(
+                f"dispatch_mcp_calls: background {server}/{tool} failed: {t.exception()}"
+            )
+
+    try:
+        running_loop = asyncio.get_running_loop()
+        task = running_loop.create_task(coro)
+        task.add_done_callback(_log_bg_error)
+    except RuntimeError:
+        if loop and loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(coro, loop)
+            except Exception as e:
+                logger.warning(f"dispatch_mcp_calls: failed to schedule {server}/{tool}: {e}")
+        else:
+            try:
+                asyncio.run(coro)
+            except Exception as e:
+                logger.warning(f"dispatch_mcp_calls: background {server}/{tool} failed: {e}")
+
+
 def dispatch_mcp_calls(
     mcp_calls: list[dict[str, Any]],
     event: HookEvent,
     tool_proxy_getter: Any,
     loop: asyncio.AbstractEventLoop | None,
     logger: logging.Logger,
+    *,
+    call_timeout: float = DEFAULT_CALL_TIMEOUT,
+    deadline: float = DEFAULT_DISPATCH_DEADLINE,
 ) -> list[dict[str, Any]]:
     """Dispatch mcp_call effects from rule engine evaluation.
 
@@ -171,6 +449,12 @@ def dispatch_mcp_calls(
     and returned so that ``_evaluate_workflow_rules`` can inject context
     or block the original tool call.
 
+    Blocking calls run concurrently, each bounded by ``call_timeout``
+    and all of them by ``deadline``, so a hook waits for its slowest call
+    rather than the sum of all calls.  A ``block_on_failure`` call acts as
+    a barrier: calls after it start only once it has succeeded.  Calls
+    that miss a limit yield a failed result with ``timed_out: True``.
+
     Args:
         mcp_calls: List of mcp_call dicts from rule engine metadata.
             Each has: server, tool, arguments, background,
@@ -179,11 +463,14 @@ def dispatch_mcp_calls(
         tool_proxy_getter: Callable returning ToolProxyService (lazy getter).
         loop: Captured event loop for thread-safe scheduling.
         logger: Logger for diagnostics.
+        call_timeout: Seconds allowed for each blocking call.
+        deadline: Seconds allowed for all blocking calls of this hook.
 
     Returns:
         List of result dicts for calls that had inject_result or
-        block_on_failure set.  Each dict has keys: server, tool,
-        inject_result, block_on_failure, success, result.
+        block_on_failure set, in the order the calls were given.  Each
+        dict has keys: server, tool, inject_result, block_on_failure,
+        success, result.
     """
     if not tool_proxy_getter:
         logger.debug("dispatch_mcp_calls: no tool_proxy_getter, skipping")
@@ -193,176 +480,52 @@ def dispatch_mcp_calls(
         f"dispatch_mcp_calls: dispatching {len(mcp_calls)} calls for {event.event_type}",
     )
 
-    # Capture in local so mypy narrows past the None guard for closures
-    _get_proxy = tool_proxy_getter
-    dispatch_results: list[dict[str, Any]] = []
-
-    for call in mcp_calls:
-        server = call.get("server")
-        tool = call.get("tool")
-        arguments = dict(call.get("arguments") or {})
-        background = call.get("background", False)
-        inject_result = call.get("inject_result", False)
-        block_on_failure = call.get("block_on_failure", False)
-        block_on_success = call.get("block_on_success", False)
-        needs_capture = inject_result or block_on_failure or block_on_success
-
-        if not server or not tool:
-            logger.warning(f"dispatch_mcp_calls: missing server or tool in {call}")
-            continue
-
-        logger.info(f"dispatch_mcp_calls: {server}/{tool} (background={background})")
-
-        # Inject event context into arguments
-        if "session_id" not in arguments:
-            arguments["session_id"] = event.metadata.get("_platform_session_id", "")
-        if "prompt_text" not in arguments:
-            arguments["prompt_text"] = event.data.get("prompt") if event.data else None
-        if "project_path" not in arguments:
-            arguments["project_path"] = event.metadata.get("project_path") or None
-        # Map prompt_text to query for tools that expect it (e.g., search_memories)
-        if "query" not in arguments and arguments.get("prompt_text"):
-            arguments["query"] = arguments["prompt_text"]
-
-        # Resolve session_id for context setting (needed for both project and session ContextVars)
-        _event_session_id: str = arguments.get("session_id", "")
-
-        async def _call(
-            s: str,
-            t: str,
-            args: dict[str, Any],
-            *,
-            _sid: str = _event_session_id,
-        ) -> dict[str, Any] | None:
-            # Set project + session context for this dispatch path.
-            # Previously missing — tools called by rules got None from
-            # get_project_context() and had no session ContextVar.
-            from gobby.utils.session_context import (
-                SessionContext,
-                reset_session_context,
-                set_session_context,
-            )
+    prepared = _prepare_calls(mcp_calls, event, logger)
+    blocking = [call for call in prepared if not call.background]
+    background = [call for call in prepared if call.background]
+    for call in prepared:
+        logger.info(f"dispatch_mcp_calls: {call.server}/{call.tool} (background={call.background})")
+
+    # Background calls after a block_on_failure call only fire if it succeeds
+    first_barrier = next((c.index for c in blocking if c.block_on_failure), len(prepared))
+    for call in background:
+        if call.index < first_barrier:
+            _schedule_background(call, tool_proxy_getter, loop, logger)
+
+    results: dict[int, dict[str, Any] | None] = {}
+    stopped_at: int | None = None
+    if blocking:
+        outcome = run_coro_blocking(
+            _run_blocking_calls(blocking, tool_proxy_getter, logger, call_timeout, deadline),
+            loop,
+            logger,
+            timeout=deadline + _DEADLINE_GRACE,
+        )
+        if outcome is None:
+            logger.warning("dispatch_mcp_calls: blocking calls did not complete")
+        else:
+            results, stopped_at = outcome
+    last_index = len(prepared) if stopped_at is None else stopped_at
 
-            session_token = None
-            project_token = None
-            try:
-                if _sid:
-                    session_token = set_session_context(SessionContext(session_id=_sid))
-                    # Set project context from session (fixes pre-existing gap)
-                    try:
-                        proxy = _get_proxy()
-                        if proxy and hasattr(proxy, "_mcp_manager"):
-                            mgr = proxy._mcp_manager
-                            if hasattr(mgr, "session_manager") and mgr.session_manager:
-                                from gobby.utils.project_context import (
-                                    set_project_context_from_session,
-                                )
-
-                                project_token = set_project_context_from_session(
-                                    _sid,
-                                    mgr.session_manager,
-                                    mgr.session_manager.db,
-                                )
-                    except Exception as ctx_err:
-                        logger.debug(
-                            f"dispatch_mcp_calls: failed to set project context: {ctx_err}"
-                        )
+    for call in background:
+        if first_barrier < call.index <= last_index:
+            _schedule_background(call, tool_proxy_getter, loop, logger)
 
-                # Backfill project_path from ContextVar if not already set.
-                # The arg injection at call-site defaults to None when event
-                # metadata lacks project_path (which is always). Now that
-                # set_project_context_from_session has populated the ContextVar,
-                # we can resolve the real path.
-                if not args.get("project_path"):
-                    from gobby.utils.project_context import _current_project_context
-
-                    ctx = _current_project_context.get()
-                    if ctx and ctx.get("project_path"):
-                        args["project_path"] = ctx["project_path"]
-
-                proxy = _get_proxy()
-                if not proxy:
-                    logger.warning("dispatch_mcp_calls: tool_proxy_getter returned None")
-                    return {"success": False, "error": "tool_proxy_getter returned None"}
-
-                # Proxy self-routing: _proxy/* calls route to ToolProxyService
-                # methods directly instead of going through call_tool dispatch
-                if s == "_proxy":
-                    result = await proxy_self_call(proxy, t, args)
-                else:
-                    result = await proxy.call_tool(s, t, args, strip_unknown=True)
-
-                if isinstance(result, dict) and result.get("success") is False:
-                    logger.warning(
-                        f"dispatch_mcp_calls: {s}/{t} returned failure: {result.get('error', 'unknown')}",
-                    )
-                return result
-            except Exception as exc:
-                logger.error(f"dispatch_mcp_calls: {s}/{t} failed: {exc}", exc_info=True)
-                return {"success": False, "error": str(exc)}
-            finally:
-                if session_token is not None:
-                    reset_session_context(session_token)
-                if project_token is not None:
-                    from gobby.utils.project_context import reset_project_context
-
-                    reset_project_context(project_token)
-
-        # If we need to capture the result, always run blocking
-        if needs_capture:
-            result = run_coro_blocking(_call(server, tool, arguments), loop, logger)
-            success = isinstance(result, dict) and result.get("success", False)
-            dispatch_results.append(
-                {
-                    "server": server,
-                    "tool": tool,
-                    "inject_result": inject_result,
-                    "block_on_failure": block_on_failure,
-                    "block_on_success": block_on_success,
-                    "success": success,
-                    "result": result,
-                }
-            )
-            # If this call failed and block_on_failure is set, stop processing
-            if block_on_failure and not success:
-                break
+    dispatch_results: list[dict[str, Any]] = []
+    for call in blocking:
+        if not call.needs_capture or call.index > last_index:
             continue
-
-        coro = _call(server, tool, arguments)
-
-        if background:
-            # Fire-and-forget with error logging
-            _bg_server, _bg_tool = server, tool  # bind for closure
-
-            def _log_bg_error(
-                t: asyncio.Task[Any], s: str = _bg_server, tl: str = _bg_tool
-            ) -> None:
-                if not t.cancelled() and t.exception():
-                    logger.warning(
-                        f"dispatch_mcp_calls: background {s}/{tl} failed: {t.exception()}"
-                    )
-
-            try:
-                running_loop = asyncio.get_running_loop()
-                task = running_loop.create_task(coro)
-                task.add_done_callback(_log_bg_error)
-            except RuntimeError:
-                if loop and loop.is_running():
-                    try:
-                        asyncio.run_coroutine_threadsafe(coro, loop)
-                    except Exception as e:
-                        logger.warning(
-                            f"dispatch_mcp_calls: failed to schedule {server}/{tool}: {e}",
-                        )
-                else:
-                    try:
-                        asyncio.run(coro)
-                    except Exception as e:
-                        logger.warning(
-                            f"dispatch_mcp_calls: background {server}/{tool} failed: {e}",
-                        )
-        else:
-            # Blocking dispatch -- must await completion, not fire-and-forget
-            run_coro_blocking(coro, loop, logger)
-
+        result = results.get(call.index)
+        entry = {
+            "server": call.server,
+            "tool": call.tool,
+            "inject_result": call.inject_result,
+            "block_on_failure": call.block_on_failure,
+            "block_on_success": call.block_on_success,
+            "success": _succeeded(result),
+            "result": result,
+        }
+        if isinstance(result, dict) and result.get("timed_out"):
+            entry["timed_out"] = True
+        dispatch_results.append(entry)
     return dispatch_results
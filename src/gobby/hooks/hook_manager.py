@@ -669,8 +669,13 @@ class HookManager:
         self, mcp_calls: list[dict[str, Any]], event: HookEvent
     ) -> list[dict[str, Any]]:
         """Dispatch mcp_call effects from rule engine evaluation."""
+        limits: dict[str, float] = {}
+        workflow_config = getattr(getattr(self, "_config", None), "workflow", None)
+        if workflow_config is not None:
+            limits["call_timeout"] = workflow_config.mcp_call_timeout
+            limits["deadline"] = workflow_config.mcp_dispatch_deadline
         return _dispatch_mcp_calls_impl(
-            mcp_calls, event, self.tool_proxy_getter, self._loop, self.logger
+            mcp_calls, event, self.tool_proxy_getter, self._loop, self.logger, **limits
         )
 
     def _run_coro_blocking(self, coro: Any) -> Any:
@@ -46,6 +46,7 @@ async def dispatch_mcp_calls(
             typically ``mcp_manager.call_tool``.
         logger: Logger for diagnostics.
     """
+    blocking = []
     for call in mcp_calls:
         server = call.get("server")
         tool = call.get("tool")
@@ -65,13 +66,27 @@ async def dispatch_mcp_calls(
         if background:
             asyncio.create_task(_safe_call(call_tool_fn, server, tool, arguments, logger))
         else:
-            try:
-                await asyncio.wait_for(
-                    _safe_call(call_tool_fn, server, tool, arguments, logger),
-                    timeout=30.0,
-                )
-            except TimeoutError:
-                logger.error(f"dispatch_mcp_calls: blocking call {server}/{tool} timed out")
+            blocking.append(_blocking_call(call_tool_fn, server, tool, arguments, logger))
+
+    # Blocking calls are independent, so await them together
+    if blocking:
+        await asyncio.gather(*blocking)
+
+
+async def _blocking_call(
+    call_tool_fn: CallToolFn,
+    server: str,
+    tool: str,
+    arguments: dict[str, Any],
+    logger: logging.Logger,
+) -> None:
+    try:
+        await asyncio.wait_for(
+            _safe_call(call_tool_fn, server, tool, arguments, logger),
+            timeout=30.0,
+        )
+    except TimeoutError:
+        logger.error(f"dispatch_mcp_calls: blocking call {server}/{tool} timed out")
 
 
 async def _safe_call(
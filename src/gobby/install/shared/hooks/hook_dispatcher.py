@@ -28,16 +28,20 @@ import json
 import logging
 import os
 import signal
+import socket
+import struct
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import aiofiles
-
 # Default daemon configuration
 DEFAULT_DAEMON_PORT = 60887
 DEFAULT_BOOTSTRAP_PATH = "~/.gobby/bootstrap.yaml"
+HOOK_SOCKET_NAME = "hooks.sock"
+
+# LLM-powered hooks (pre-compact summary) need more time
+HOOK_TIMEOUT = 90.0
 
 _cached_daemon_url: str | None = None
 
@@ -142,6 +146,7 @@ async def get_daemon_url() -> str:
 
     if bootstrap_path.exists():
         try:
+            import aiofiles
             import yaml
 
             async with aiofiles.open(bootstrap_path, encoding="utf-8") as f:
@@ -347,6 +352,73 @@ def _force_kill_agent() -> None:
             pass
 
 
+# ── Unix Socket Transport ───────────────────────────────────────────────
+
+# Framing shared with gobby.servers.hook_socket: 4-byte big-endian length
+# prefix followed by a UTF-8 JSON object.
+_FRAME_HEADER = struct.Struct(">I")
+_SOCKET_CONNECT_TIMEOUT = 0.5
+
+
+class HookSocketUnavailable(Exception):
+    """The daemon is not accepting connections on the hook socket."""
+
+
+def get_hook_socket_path() -> Path:
+    """Get the daemon hook socket path ($GOBBY_HOOK_SOCKET or ~/.gobby/hooks.sock)."""
+    override = os.environ.get("GOBBY_HOOK_SOCKET")
+    if override:
+        return Path(override)
+    return Path(os.environ.get("GOBBY_HOME", Path.home() / ".gobby")) / HOOK_SOCKET_NAME
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes or raise ConnectionError."""
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 65536))
+        if not chunk:
+            raise ConnectionError("Hook socket closed mid-response")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def call_hook_socket(
+    message: dict[str, Any], socket_path: Path, timeout: float = HOOK_TIMEOUT
+) -> dict[str, Any]:
+    """Send one hook request frame over the daemon socket and return the response frame.
+
+    Uses only the standard library, so the dispatcher can skip importing
+    httpx and the separate health-check round trip: a refused connect *is*
+    the health check.
+
+    Raises:
+        HookSocketUnavailable: If the socket can't be connected (nothing sent).
+        TimeoutError: If the daemon doesn't answer within timeout.
+        ConnectionError, ValueError: If the exchange fails after connecting.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_SOCKET_CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(socket_path))
+        except OSError as e:
+            raise HookSocketUnavailable(str(e)) from e
+
+        sock.settimeout(timeout)
+        body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        sock.sendall(_FRAME_HEADER.pack(len(body)) + body)
+        (length,) = _FRAME_HEADER.unpack(_recv_exactly(sock, _FRAME_HEADER.size))
+        response = json.loads(_recv_exactly(sock, length))
+        if not isinstance(response, dict):
+            raise ValueError("Hook socket response is not a JSON object")
+        return response
+    finally:
+        sock.close()
+
+
 # ── Daemon Health Check ─────────────────────────────────────────────────
 
 
@@ -540,6 +612,141 @@ def _find_project_config(cwd: str) -> dict[str, Any] | None:
     return None
 
 
+def _setup_logger(config: CLIConfig, debug_mode: bool) -> logging.Logger:
+    """Configure logging for the dispatcher and return its logger."""
+    logger = logging.getLogger(config.logger_name)
+    if debug_mode:
+        logging.basicConfig(level=logging.DEBUG)
+    elif config.suppress_logs:
+        # Suppress all logging to stderr - prevents polluting CLI stderr reading
+        logging.basicConfig(level=logging.WARNING, handlers=[])
+    else:
+        logging.basicConfig(level=logging.INFO)
+    return logger
+
+
+def _load_input(
+    raw: str, config: CLIConfig, hook_type: str, logger: logging.Logger, debug_mode: bool
+) -> dict[str, Any] | None:
+    """Parse hook input JSON and inject terminal context. Returns None on bad JSON."""
+    try:
+        input_data: dict[str, Any] = json.loads(raw)
+    except json.JSONDecodeError as e:
+        if debug_mode:
+            logger.error(f"JSON decode error: {e}")
+        return None
+
+    # Inject terminal context for session start hooks
+    if hook_type in config.session_start_hooks:
+        input_data["terminal_context"] = get_terminal_context()
+
+    log_hook_details(logger, hook_type, input_data, debug_mode)
+    return input_data
+
+
+def _handle_hook_result(
+    result: dict[str, Any], config: CLIConfig, logger: logging.Logger, debug_mode: bool
+) -> int:
+    """Print a successful daemon response and return the exit code."""
+    if debug_mode:
+        logger.debug(f"Output data: {result}")
+
+    # Check for block/deny decision
+    if is_blocked(result):
+        # Gemini and Codex read block decisions from JSON body
+        # (non-zero exit codes are treated as "hook failed", not
+        # "tool blocked"). Output the formatted JSON and exit 0.
+        if config.source in ("gemini", "codex"):
+            print(json.dumps(result))
+            return 0
+
+        reason = extract_reason(result)
+        print(f"\n{reason.rstrip()}", file=sys.stderr)
+        return 2
+
+    # Only print output if there's something meaningful to show
+    # Empty dicts cause some CLIs to show "hook success: Success"
+    if result:
+        print(json.dumps(result))
+
+    return 0
+
+
+def _handle_daemon_error(
+    status_code: int, error_detail: Any, hook_type: str, config: CLIConfig, logger: logging.Logger
+) -> int:
+    """Report an error status from the daemon and return the exit code."""
+    logger.error(f"Daemon returned error: status={status_code}, detail={error_detail}")
+    # Fail closed for critical hooks (stop gates, session lifecycle) —
+    # if the rule engine couldn't evaluate, block rather than allow
+    if hook_type in config.critical_hooks:
+        print(
+            f"\nHook error on critical hook '{hook_type}' — blocking to fail safe. "
+            f"Detail: {error_detail}",
+            file=sys.stderr,
+        )
+        return 2
+    print(json.dumps({"status": "error", "message": f"Daemon error: {error_detail}"}))
+    return 1
+
+
+def _fail_hook(hook_type: str, config: CLIConfig, critical_message: str, message: str) -> int:
+    """Fail closed (exit 2) for critical hooks, report and continue (exit 1) otherwise."""
+    if hook_type in config.critical_hooks:
+        print(f"\n{critical_message}", file=sys.stderr)
+        return 2
+    print(json.dumps({"status": "error", "message": message}))
+    return 1
+
+
+def _dispatch_via_socket(
+    socket_path: Path,
+    message: dict[str, Any],
+    hook_type: str,
+    config: CLIConfig,
+    logger: logging.Logger,
+    debug_mode: bool,
+) -> int | None:
+    """Execute the hook over the daemon's Unix socket.
+
+    Returns:
+        Exit code, or None if the socket isn't accepting connections and the
+        caller should fall back to HTTP (nothing was sent in that case).
+    """
+    try:
+        response = call_hook_socket(message, socket_path)
+    except HookSocketUnavailable as e:
+        logger.debug(f"Hook socket unavailable ({e}), falling back to HTTP")
+        return None
+    except TimeoutError:
+        logger.error(f"Hook execution timeout: {hook_type}")
+        return _fail_hook(
+            hook_type,
+            config,
+            f"Hook timeout on critical hook '{hook_type}' — blocking to fail safe.",
+            "Hook execution timeout",
+        )
+    except Exception as e:
+        logger.error(f"Hook execution failed: {e}", exc_info=True)
+        return _fail_hook(
+            hook_type,
+            config,
+            f"Hook failure on critical hook '{hook_type}' — blocking to fail safe. Error: {e}",
+            str(e),
+        )
+
+    # Daemon answered — reset failure counter for spawned agents
+    agent_run_id = os.environ.get("GOBBY_AGENT_RUN_ID")
+    if agent_run_id:
+        _reset_daemon_failures(agent_run_id)
+
+    if response.get("status") == 200:
+        return _handle_hook_result(response.get("result") or {}, config, logger, debug_mode)
+    return _handle_daemon_error(
+        response.get("status", 500), response.get("detail"), hook_type, config, logger
+    )
+
+
 async def main() -> int:
     """Main dispatcher execution.
 
@@ -568,6 +775,37 @@ async def main() -> int:
     config = detect_cli(args)
     hook_type = args.type
     debug_mode = args.debug
+    logger = _setup_logger(config, debug_mode)
+    project_id = str(project_config["id"]) if project_config and project_config.get("id") else None
+
+    # Fast path: one framed request over the daemon's Unix socket. Skips the
+    # httpx import and the health-check round trip. Fire-and-forget hooks keep
+    # the detached curl so delivery survives the CLI exiting.
+    input_data: dict[str, Any] | None = None
+    socket_path = get_hook_socket_path()
+    if hook_type not in _FIRE_AND_FORGET_HOOKS and socket_path.exists():
+        input_data = _load_input(sys.stdin.read(), config, hook_type, logger, debug_mode)
+        if input_data is None:
+            print(json.dumps({}))
+            return config.json_error_exit_code
+
+        session_id = input_data.get("session_id")
+        exit_code = _dispatch_via_socket(
+            socket_path,
+            {
+                "hook_type": hook_type,
+                "input_data": input_data,
+                "source": _detect_source(config),
+                "project_id": project_id,
+                "session_id": str(session_id) if session_id else None,
+            },
+            hook_type,
+            config,
+            logger,
+            debug_mode,
+        )
+        if exit_code is not None:
+            return exit_code
 
     # Check if gobby daemon is running before processing hooks
     if not await check_daemon_running():
@@ -615,40 +853,21 @@ async def main() -> int:
     if agent_run_id:
         _reset_daemon_failures(agent_run_id)
 
-    # Setup logger for dispatcher
-    logger = logging.getLogger(config.logger_name)
-    if debug_mode:
-        logging.basicConfig(level=logging.DEBUG)
-    elif config.suppress_logs:
-        # Suppress all logging to stderr - prevents polluting CLI stderr reading
-        logging.basicConfig(level=logging.WARNING, handlers=[])
-    else:
-        logging.basicConfig(level=logging.INFO)
-
-    try:
+    if input_data is None:
         # Read JSON input from stdin asynchronously
         loop = asyncio.get_running_loop()
         raw = await loop.run_in_executor(None, sys.stdin.read)
-        input_data = json.loads(raw)
-
-        # Inject terminal context for session start hooks
-        if hook_type in config.session_start_hooks:
-            input_data["terminal_context"] = get_terminal_context()
-
-        log_hook_details(logger, hook_type, input_data, debug_mode)
-
-    except json.JSONDecodeError as e:
-        if debug_mode:
-            logger.error(f"JSON decode error: {e}")
-        print(json.dumps({}))
-        return config.json_error_exit_code
+        input_data = _load_input(raw, config, hook_type, logger, debug_mode)
+        if input_data is None:
+            print(json.dumps({}))
+            return config.json_error_exit_code
 
     # Build project context headers so the daemon resolves the correct project.
     # The hook dispatcher runs in the CLI's project directory, so project_config
     # (from .gobby/project.json) is correct. The daemon's CWD is NOT.
     _context_headers: dict[str, str] = {}
-    if project_config and project_config.get("id"):
-        _context_headers["X-Gobby-Project-Id"] = str(project_config["id"])
+    if project_id:
+        _context_headers["X-Gobby-Project-Id"] = project_id
     _hook_session_id = input_data.get("session_id") if isinstance(input_data, dict) else None
     if _hook_session_id:
         _context_headers["X-Gobby-Session-Id"] = str(_hook_session_id)
@@ -713,89 +932,44 @@ async def main() -> int:
                     "source": _detect_source(config),
                 },
                 headers=_context_headers,
-                timeout=90.0,  # LLM-powered hooks (pre-compact summary) need more time
+                timeout=HOOK_TIMEOUT,
             )
 
         if response.status_code == 200:
-            result = response.json()
-
-            if debug_mode:
-                logger.debug(f"Output data: {result}")
-
-            # Check for block/deny decision
-            if is_blocked(result):
-                # Gemini and Codex read block decisions from JSON body
-                # (non-zero exit codes are treated as "hook failed", not
-                # "tool blocked"). Output the formatted JSON and exit 0.
-                if config.source in ("gemini", "codex"):
-                    print(json.dumps(result))
-                    return 0
-
-                reason = extract_reason(result)
-                print(f"\n{reason.rstrip()}", file=sys.stderr)
-                return 2
-
-            # Only print output if there's something meaningful to show
-            # Empty dicts cause some CLIs to show "hook success: Success"
-            if result:
-                print(json.dumps(result))
-
-            return 0
-        else:
-            # HTTP error from daemon
-            error_detail = response.text
-            logger.error(
-                f"Daemon returned error: status={response.status_code}, detail={error_detail}"
-            )
-            # Fail closed for critical hooks (stop gates, session lifecycle) —
-            # if the rule engine couldn't evaluate, block rather than allow
-            if hook_type in config.critical_hooks:
-                print(
-                    f"\nHook error on critical hook '{hook_type}' — blocking to fail safe. "
-                    f"Detail: {error_detail}",
-                    file=sys.stderr,
-                )
-                return 2
-            print(json.dumps({"status": "error", "message": f"Daemon error: {error_detail}"}))
-            return 1
+            return _handle_hook_result(response.json(), config, logger, debug_mode)
+        # HTTP error from daemon
+        return _handle_daemon_error(response.status_code, response.text, hook_type, config, logger)
 
     except httpx.ConnectError:
         logger.error("Failed to connect to daemon (unreachable)")
         # Fail closed for critical hooks — daemon is reachable (passed check_daemon_running)
         # but connection failed, so enforcement state is unknown
-        if hook_type in config.critical_hooks:
-            print(
-                f"\nDaemon connection failed on critical hook '{hook_type}' — blocking to fail safe.",
-                file=sys.stderr,
-            )
-            return 2
-        print(json.dumps({"status": "error", "message": "Daemon unreachable"}))
-        return 1
+        return _fail_hook(
+            hook_type,
+            config,
+            f"Daemon connection failed on critical hook '{hook_type}' — blocking to fail safe.",
+            "Daemon unreachable",
+        )
 
     except httpx.TimeoutException:
         logger.error(f"Hook execution timeout: {hook_type}")
         # Fail closed for critical hooks — rule engine may have been evaluating a stop gate
-        if hook_type in config.critical_hooks:
-            print(
-                f"\nHook timeout on critical hook '{hook_type}' — blocking to fail safe.",
-                file=sys.stderr,
-            )
-            return 2
-        print(json.dumps({"status": "error", "message": "Hook execution timeout"}))
-        return 1
+        return _fail_hook(
+            hook_type,
+            config,
+            f"Hook timeout on critical hook '{hook_type}' — blocking to fail safe.",
+            "Hook execution timeout",
+        )
 
     except Exception as e:
         logger.error(f"Hook execution failed: {e}", exc_info=True)
         # Fail closed for critical hooks
-        if hook_type in config.critical_hooks:
-            print(
-                f"\nHook failure on critical hook '{hook_type}' — blocking to fail safe. "
-                f"Error: {e}",
-                file=sys.stderr,
-            )
-            return 2
-        print(json.dumps({"status": "error", "message": str(e)}))
-        return 1
+        return _fail_hook(
+            hook_type,
+            config,
+            f"Hook failure on critical hook '{hook_type}' — blocking to fail safe. Error: {e}",
+            str(e),
+        )
 
 
 if __name__ == "__main__":
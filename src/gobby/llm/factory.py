@@ -5,19 +5,24 @@ Provides factory function for creating LLMService with multi-provider support.
 """
 
 import logging
+from typing import TYPE_CHECKING
 
 from gobby.config.app import DaemonConfig
 from gobby.llm.service import LLMService
 
+if TYPE_CHECKING:
+    from gobby.storage.database import DatabaseProtocol
+
 logger = logging.getLogger(__name__)
 
 
-def create_llm_service(config: DaemonConfig) -> LLMService:
+def create_llm_service(config: DaemonConfig, db: "DatabaseProtocol | None" = None) -> LLMService:
     """
     Create an LLM service for multi-provider support.
 
     Args:
         config: Client configuration with llm_providers.
+        db: Database backing the response cache (used when enabled in config).
 
     Returns:
         LLMService instance with access to all configured providers.
@@ -31,4 +36,4 @@ def create_llm_service(config: DaemonConfig) -> LLMService:
             config.session_summary
         )
     """
-    return LLMService(config)
+    return LLMService(config, db=db)
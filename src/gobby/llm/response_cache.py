@@ -0,0 +1,230 @@
+"""
+LLM response cache and request coalescing.
+
+LLMService wraps each provider in a CachedLLMProvider when
+``llm_providers.response_cache.enabled`` is set. Text and JSON generation
+are keyed by a hash of (kind, provider, model, system prompt, prompt,
+params): a stored response is returned without calling the provider, and
+concurrent identical requests await one in-flight call. Every avoided call is
+recorded in the savings ledger under the ``llm_cache`` category.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from gobby.llm.base import AuthMode, LLMProvider
+from gobby.telemetry.instruments import inc_counter
+
+if TYPE_CHECKING:
+    from gobby.savings.tracker import SavingsTracker
+    from gobby.storage.llm_cache import LLMResponseCacheStore
+
+logger = logging.getLogger(__name__)
+
+SAVINGS_CATEGORY = "llm_cache"
+
+
+def make_cache_key(
+    kind: str,
+    provider: str,
+    model: str | None,
+    system_prompt: str | None,
+    prompt: str,
+    params: dict[str, Any] | None = None,
+) -> str:
+    """Hash everything that determines a response into a cache key."""
+    payload = json.dumps(
+        [kind, provider, model, system_prompt, prompt, params or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Persistent response cache with in-flight request coalescing."""
+
+    def __init__(
+        self,
+        store: LLMResponseCacheStore,
+        savings: SavingsTracker | None = None,
+    ) -> None:
+        self._store = store
+        self._savings = savings
+        self._inflight: dict[str, asyncio.Task[str]] = {}
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_call(
+        self,
+        cache_key: str,
+        provider: str,
+        model: str | None,
+        prompt_chars: int,
+        call: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Return the cached response for ``cache_key`` or run ``call`` once for it.
+
+        Failed calls and empty responses are not cached.
+        """
+        attributes = {"provider": provider}
+        cached = self._lookup(cache_key)
+        if cached is not None:
+            self.hits += 1
+            inc_counter("llm_cache_hits_total", attributes=attributes)
+            self._record_savings(provider, model, prompt_chars, cached)
+            return cached
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(cache_key)
+        if task is not None and task.get_loop() is loop:
+            self.coalesced += 1
+            inc_counter("llm_cache_coalesced_total", attributes=attributes)
+            response = await asyncio.shield(task)
+            self._record_savings(provider, model, prompt_chars, response)
+            return response
+
+        self.misses += 1
+        inc_counter("llm_cache_misses_total", attributes=attributes)
+        task = loop.create_task(
+            self._call_and_store(cache_key, provider, model, prompt_chars, call)
+        )
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda t: self._forget(cache_key, t))
+        # Shielded so a cancelled caller doesn't cancel the call for coalesced waiters
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters since startup."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            "in_flight": len(self._inflight),
+        }
+
+    async def _call_and_store(
+        self,
+        cache_key: str,
+        provider: str,
+        model: str | None,
+        prompt_chars: int,
+        call: Callable[[], Awaitable[str]],
+    ) -> str:
+        response = await call()
+        if response:
+            try:
+                self._store.put(cache_key, response, provider, model, prompt_chars)
+            except Exception as e:
+                logger.warning(f"Failed to store LLM response in cache: {e}")
+        return response
+
+    def _lookup(self, cache_key: str) -> str | None:
+        try:
+            cached = self._store.get(cache_key)
+        except Exception as e:
+            logger.warning(f"LLM response cache lookup failed: {e}")
+            return None
+        return cached.response if cached else None
+
+    def _forget(self, cache_key: str, task: asyncio.Task[str]) -> None:
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+
+    def _record_savings(
+        self, provider: str, model: str | None, prompt_chars: int, response: str
+    ) -> None:
+        if self._savings is None:
+            return
+        try:
+            self._savings.record(
+                category=SAVINGS_CATEGORY,
+                original_chars=prompt_chars + len(response),
+                actual_chars=0,
+                model=model,
+                metadata={"provider": provider},
+            )
+        except Exception as e:
+            logger.debug(f"Failed to record LLM cache savings: {e}")
+
+
+class CachedLLMProvider(LLMProvider):
+    """LLMProvider that serves text/JSON generation through an LLMResponseCache.
+
+    Summaries and image descriptions go straight to the wrapped provider, as
+    do provider-specific methods (e.g. ``generate_with_tools``).
+    """
+
+    def __init__(self, provider: LLMProvider, cache: LLMResponseCache) -> None:
+        self.wrapped = provider
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "wrapped":
+            raise AttributeError(name)
+        return getattr(self.wrapped, name)
+
+    @property
+    def provider_name(self) -> str:
+        return self.wrapped.provider_name
+
+    @property
+    def auth_mode(self) -> AuthMode:
+        return self.wrapped.auth_mode
+
+    async def generate_summary(
+        self, context: dict[str, Any], prompt_template: str | None = None
+    ) -> str:
+        return await self.wrapped.generate_summary(context, prompt_template=prompt_template)
+
+    async def generate_text(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        key = make_cache_key(
+            "text", self.provider_name, model, system_prompt, prompt, {"max_tokens": max_tokens}
+        )
+        return await self._cache.get_or_call(
+            key,
+            self.provider_name,
+            model,
+            len(prompt) + len(system_prompt or ""),
+            lambda: self.wrapped.generate_text(
+                prompt, system_prompt=system_prompt, model=model, max_tokens=max_tokens
+            ),
+        )
+
+    async def generate_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str | None = None,
+    ) -> dict[str, Any]:
+        async def _call() -> str:
+            result = await self.wrapped.generate_json(
+                prompt, system_prompt=system_prompt, model=model
+            )
+            return json.dumps(result)
+
+        key = make_cache_key("json", self.provider_name, model, system_prompt, prompt)
+        response = await self._cache.get_or_call(
+            key, self.provider_name, model, len(prompt) + len(system_prompt or ""), _call
+        )
+        result: dict[str, Any] = json.loads(response)
+        return result
+
+    async def describe_image(self, image_path: str, context: str | None = None) -> str:
+        return await self.wrapped.describe_image(image_path, context=context)
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
         DaemonConfig,
     )
     from gobby.llm.base import LLMProvider
+    from gobby.llm.response_cache import LLMResponseCache
+    from gobby.storage.database import DatabaseProtocol
 
 logger = logging.getLogger(__name__)
 
@@ -42,23 +44,32 @@ class LLMService:
         result = await provider.generate_summary(context, prompt_template=prompt)
     """
 
-    def __init__(self, config: "DaemonConfig"):
+    def __init__(self, config: "DaemonConfig", db: "DatabaseProtocol | None" = None):
         """
         Initialize LLM service with configuration.
 
         Args:
             config: Client configuration containing llm_providers settings.
+            db: Database for the response cache. The cache is only used when
+                ``llm_providers.response_cache.enabled`` is set and a database
+                is given.
 
         Raises:
             ValueError: If llm_providers is not configured.
         """
         self._config = config
         self._providers: dict[str, LLMProvider] = {}
+        self._cached_providers: dict[str, LLMProvider] = {}
         self._initialized_providers: set[str] = set()
+        self.response_cache: LLMResponseCache | None = None
 
         if not config.llm_providers:
             raise ValueError("llm_providers config is required for LLMService")
 
+        cache_config = config.llm_providers.response_cache
+        if cache_config.enabled and db is not None:
+            self.response_cache = self._create_response_cache(db)
+
         # Log enabled providers
         enabled = config.llm_providers.get_enabled_providers()
         logger.debug(f"LLMService initialized with providers: {enabled}")
@@ -110,12 +121,43 @@ class LLMService:
         self._initialized_providers.add(name)
         return provider
 
-    def get_provider(self, name: str) -> "LLMProvider":
+    def _create_response_cache(self, db: "DatabaseProtocol") -> "LLMResponseCache | None":
+        """Create the response cache, or None if its storage is unavailable."""
+        from gobby.llm.response_cache import LLMResponseCache
+        from gobby.savings.tracker import SavingsTracker
+        from gobby.storage.llm_cache import LLMResponseCacheStore
+        from gobby.storage.model_costs import ModelCostStore
+
+        cache_config = self._config.llm_providers.response_cache  # type: ignore[union-attr]
+        try:
+            store = LLMResponseCacheStore(
+                db, ttl_hours=cache_config.ttl_hours, max_entries=cache_config.max_entries
+            )
+        except Exception as e:
+            logger.warning(f"LLM response cache disabled: {e}")
+            return None
+        savings = SavingsTracker(db, model_costs=ModelCostStore(db))
+        logger.debug(f"LLM response cache enabled ({store.count()} entries)")
+        return LLMResponseCache(store, savings=savings)
+
+    def _with_cache(self, name: str, provider: "LLMProvider") -> "LLMProvider":
+        """Wrap a provider so text/JSON generation goes through the response cache."""
+        if self.response_cache is None:
+            return provider
+        if name not in self._cached_providers:
+            from gobby.llm.response_cache import CachedLLMProvider
+
+            self._cached_providers[name] = CachedLLMProvider(provider, self.response_cache)
+        return self._cached_providers[name]
+
+    def get_provider(self, name: str, cached: bool = True) -> "LLMProvider":
         """
         Get a provider by name.
 
         Args:
             name: Provider name (claude, codex)
+            cached: Return the response-cache wrapper when the cache is enabled.
+                Pass False when the concrete provider class is needed.
 
         Returns:
             LLMProvider instance
@@ -127,7 +169,8 @@ class LLMService:
             claude = service.get_provider("claude")
             result = await claude.generate_summary(context)
         """
-        return self._get_provider_instance(name)
+        provider = self._get_provider_instance(name)
+        return self._with_cache(name, provider) if cached else provider
 
     def get_provider_for_feature(
         self, feature_config: Any
@@ -175,7 +218,7 @@ class LLMService:
         prompt = getattr(feature_config, "prompt", None)
 
         # Get provider instance
-        provider = self._get_provider_instance(provider_name)
+        provider = self._with_cache(provider_name, self._get_provider_instance(provider_name))
 
         return provider, model, prompt
 
@@ -196,12 +239,9 @@ class LLMService:
         if not enabled:
             raise ValueError("No providers configured in llm_providers")
 
-        # Prefer Claude if available
-        if "claude" in enabled:
-            return self._get_provider_instance("claude")
-
-        # Otherwise use first available
-        return self._get_provider_instance(enabled[0])
+        # Prefer Claude if available, otherwise use first available
+        name = "claude" if "claude" in enabled else enabled[0]
+        return self._with_cache(name, self._get_provider_instance(name))
 
     @property
     def enabled_providers(self) -> list[str]:
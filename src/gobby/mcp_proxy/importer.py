@@ -181,7 +181,7 @@ class MCPServerImporter:
 
             from gobby.llm.claude import ClaudeLLMProvider
 
-            provider = self.llm_service.get_provider("claude")
+            provider = self.llm_service.get_provider("claude", cached=False)
             if not isinstance(provider, ClaudeLLMProvider):
                 raise RuntimeError("Claude provider required for tool-based import")
 
@@ -236,7 +236,7 @@ class MCPServerImporter:
 
             from gobby.llm.claude import ClaudeLLMProvider
 
-            provider = self.llm_service.get_provider("claude")
+            provider = self.llm_service.get_provider("claude", cached=False)
             if not isinstance(provider, ClaudeLLMProvider):
                 raise RuntimeError("Claude provider required for tool-based import")
 
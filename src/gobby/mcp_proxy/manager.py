@@ -26,6 +26,7 @@ from gobby.mcp_proxy.models import (
     MCPError,
     MCPServerConfig,
 )
+from gobby.mcp_proxy.schema_cache import ToolSchemaCache
 from gobby.mcp_proxy.transports.base import BaseTransportConnection
 from gobby.mcp_proxy.transports.factory import create_transport_connection
 from gobby.telemetry.tracing import create_span
@@ -99,6 +100,9 @@ class MCPClientManager:
         self.mcp_db_manager = mcp_db_manager
         self.metrics_manager = metrics_manager
 
+        # Tool schemas for argument pre-validation (memory + tools table)
+        self.schema_cache = ToolSchemaCache(mcp_db_manager)
+
         # Lazy connection settings
         self.lazy_connect = lazy_connect
         self.preconnect_servers = set(preconnect_servers or [])
@@ -237,6 +241,7 @@ class MCPClientManager:
                     logger.warning(f"Failed to list tools for {config.name}: {e}")
 
             if tool_schemas:
+                self.schema_cache.populate(config.name, tool_schemas)
                 self._cache_discovered_tools(config.name, tool_schemas)
 
         return {
@@ -262,6 +267,7 @@ class MCPClientManager:
         del self._configs[name]
         if name in self.health:
             del self.health[name]
+        self.schema_cache.invalidate(name)
 
         # Remove from database if manager is available
         if self.mcp_db_manager and effective_project_id:
@@ -475,6 +481,7 @@ class MCPClientManager:
                     self._auth_token,
                     self._token_refresh_callback,
                 )
+                connection.on_tools_changed = self._on_tools_changed
                 self._connections[config.name] = connection
 
             connection = self._connections[config.name]
@@ -752,6 +759,7 @@ class MCPClientManager:
                         for t in tools.tools
                     ]
                     results[name] = tool_list
+                    self.schema_cache.populate(name, tool_list)
                     self._cache_discovered_tools(name, tool_list)
                 else:
                     results[name] = []
@@ -784,13 +792,24 @@ class MCPClientManager:
         input_schema = tool_info.get("inputSchema", {})
         return cast(dict[str, Any], input_schema)
 
+    def _on_tools_changed(self, server_name: str) -> None:
+        """Handle a tools/list_changed notification from a server."""
+        logger.debug(f"Tool list changed on {server_name}, invalidating schema cache")
+        self.schema_cache.invalidate(server_name)
+
     async def get_tool_info(self, server_name: str, tool_name: str) -> dict[str, Any]:
-        """Get full tool info including name, description, and inputSchema."""
+        """Get full tool info including name, description, and inputSchema.
 
-        # This is an optimization. Instead of calling list_tools again,
-        # we try to fetch it. But standard MCP list_tools returns everything.
-        # So we just filter the output of list_tools.
+        Served from the schema cache when possible; only a cache miss (or a
+        server whose tool list changed) costs a tools/list round trip.
+        """
+        config = self._configs.get(server_name)
+        project_id = config.project_id if config else None
+        cached = self.schema_cache.get(server_name, tool_name, project_id)
+        if cached is not None:
+            return cached.to_tool_info()
 
+        # list_tools() refreshes the schema cache for this server
         tools = await self.list_tools(server_name)
         server_tools = tools.get(server_name, [])
 
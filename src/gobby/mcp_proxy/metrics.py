@@ -3,6 +3,12 @@
 import logging
 from typing import Any
 
+from gobby.mcp_proxy.metrics_buffer import (
+    CallKey,
+    MetricsBuffer,
+    ToolCallDelta,
+    get_metrics_buffer,
+)
 from gobby.mcp_proxy.metrics_events import MetricsEventStore
 from gobby.mcp_proxy.metrics_store import ToolMetrics, ToolMetricsStore
 from gobby.storage.database import DatabaseProtocol
@@ -19,13 +25,16 @@ class ToolMetricsManager:
     Manager for tracking tool call metrics.
 
     Refactored to a facade that dual-writes to OTel (for real-time observability)
-    and SQLite (for queryable analytics).
+    and SQLite (for queryable analytics). SQLite writes are accumulated in a
+    MetricsBuffer and flushed in batches; get_metrics() merges unflushed deltas
+    and the other queries flush before reading.
     """
 
     def __init__(
         self,
         db: DatabaseProtocol,
         event_store: MetricsEventStore | None = None,
+        buffer: MetricsBuffer | None = None,
     ):
         """
         Initialize the metrics manager.
@@ -33,9 +42,11 @@ class ToolMetricsManager:
         Args:
             db: LocalDatabase instance for persistence
             event_store: Optional MetricsEventStore for per-event recording
+            buffer: Optional MetricsBuffer (defaults to the database's shared buffer)
         """
         self.store = ToolMetricsStore(db)
-        self.event_store = event_store or MetricsEventStore(db)
+        self.buffer = buffer or get_metrics_buffer(db)
+        self.event_store = event_store or MetricsEventStore(db, buffer=self.buffer)
         self.metrics = get_telemetry_metrics()
 
     def record_call(
@@ -51,9 +62,9 @@ class ToolMetricsManager:
         Record a tool call with its metrics.
         Triple-writes to: SQLite aggregate table, event log, and OTel.
         """
-        # 1. SQLite aggregate persistence (backward compat)
+        # 1. SQLite aggregate persistence (buffered, backward compat)
         try:
-            self.store.record_call(
+            self.buffer.record_call(
                 server_name=server_name,
                 tool_name=tool_name,
                 project_id=project_id,
@@ -111,8 +122,31 @@ class ToolMetricsManager:
         Get metrics, optionally filtered by project/server/tool.
         Delegates to ToolMetricsStore.
         """
-        rows = self.store.get_metrics(project_id, server_name, tool_name)
-        tools = [ToolMetrics.from_row(row).to_dict() for row in rows]
+        rows, pending = self.buffer.read_with_pending(
+            lambda: self.store.get_metrics(project_id, server_name, tool_name),
+            project_id,
+            server_name,
+            tool_name,
+        )
+        tools = [self._merge_pending(ToolMetrics.from_row(row), pending).to_dict() for row in rows]
+        # Tools whose first calls have not been flushed yet
+        for (proj, server, tool), delta in pending.items():
+            tools.append(
+                ToolMetrics(
+                    id="",
+                    project_id=proj,
+                    server_name=server,
+                    tool_name=tool,
+                    call_count=delta.call_count,
+                    success_count=delta.success_count,
+                    failure_count=delta.failure_count,
+                    total_latency_ms=delta.total_latency_ms,
+                    avg_latency_ms=delta.total_latency_ms / delta.call_count,
+                    last_called_at=delta.last_called_at,
+                    created_at=delta.last_called_at or "",
+                    updated_at=delta.last_called_at or "",
+                ).to_dict()
+            )
 
         # Calculate aggregates
         total_calls = sum(t["call_count"] for t in tools)
@@ -134,6 +168,20 @@ class ToolMetricsManager:
             },
         }
 
+    @staticmethod
+    def _merge_pending(metrics: ToolMetrics, pending: dict[CallKey, ToolCallDelta]) -> ToolMetrics:
+        """Fold (and consume) an unflushed delta into a persisted row."""
+        delta = pending.pop((metrics.project_id, metrics.server_name, metrics.tool_name), None)
+        if delta is None:
+            return metrics
+        metrics.call_count += delta.call_count
+        metrics.success_count += delta.success_count
+        metrics.failure_count += delta.failure_count
+        metrics.total_latency_ms += delta.total_latency_ms
+        metrics.avg_latency_ms = metrics.total_latency_ms / metrics.call_count
+        metrics.last_called_at = delta.last_called_at or metrics.last_called_at
+        return metrics
+
     def get_top_tools(
         self,
         project_id: str | None = None,
@@ -144,6 +192,7 @@ class ToolMetricsManager:
         Get top tools by call count or other metrics.
         Delegates to ToolMetricsStore.
         """
+        self.buffer.flush()
         rows = self.store.get_top_tools(project_id, limit, order_by)
         return [ToolMetrics.from_row(row).to_dict() for row in rows]
 
@@ -157,6 +206,7 @@ class ToolMetricsManager:
         Get success rate for a specific tool.
         Delegates to ToolMetricsStore.
         """
+        self.buffer.flush()
         return self.store.get_tool_success_rate(server_name, tool_name, project_id)
 
     def get_failing_tools(
@@ -169,6 +219,7 @@ class ToolMetricsManager:
         Get tools with failure rate above a threshold.
         Delegates to ToolMetricsStore.
         """
+        self.buffer.flush()
         rows = self.store.get_failing_tools(project_id, threshold, limit)
         result = []
         for row in rows:
@@ -187,6 +238,7 @@ class ToolMetricsManager:
         Reset/delete metrics.
         Delegates to ToolMetricsStore.
         """
+        self.buffer.discard_calls(project_id, server_name, tool_name)
         return self.store.reset_metrics(project_id, server_name, tool_name)
 
     def aggregate_to_daily(self, retention_days: int = DEFAULT_RETENTION_DAYS) -> int:
@@ -201,6 +253,7 @@ class ToolMetricsManager:
         Aggregate and delete metrics older than the retention period.
         Delegates to ToolMetricsStore.
         """
+        self.buffer.flush()
         # First aggregate to daily table
         self.store.aggregate_to_daily(retention_days)
         # Then cleanup
@@ -263,6 +316,7 @@ class ToolMetricsManager:
         Get statistics about metrics retention.
         Delegates to ToolMetricsStore.
         """
+        self.buffer.flush()
         row = self.store.get_retention_stats()
         if row:
             return {
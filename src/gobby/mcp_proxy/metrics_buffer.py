@@ -0,0 +1,523 @@
+"""In-memory accumulator for tool call metrics and metrics events.
+
+Recording a tool call used to cost two SQLite writes (an UPSERT into
+``tool_metrics`` and an INSERT into ``metrics_events``) on the critical path of
+every proxied call, rule evaluation and skill event. ``MetricsBuffer`` keeps
+per-(project, server, tool) counter deltas plus a bounded ring of raw events in
+memory; a background task writes both in a single transaction every
+``flush_interval_ms`` or once ``flush_batch_size`` events are pending.
+
+Until ``start()`` is called (CLI commands, tests) every record is flushed
+immediately, so behaviour outside the daemon is unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+
+from gobby.storage.database import DatabaseProtocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_MS = 500
+DEFAULT_FLUSH_BATCH_SIZE = 500
+DEFAULT_MAX_PENDING_EVENTS = 10_000
+
+# One buffer per database so every store over the same DB shares it
+_buffers: weakref.WeakKeyDictionary[Any, MetricsBuffer] = weakref.WeakKeyDictionary()
+_buffers_lock = threading.Lock()
+
+_UPSERT_TOOL_METRICS = """
+    INSERT INTO tool_metrics (
+        id, project_id, server_name, tool_name,
+        call_count, success_count, failure_count,
+        total_latency_ms, avg_latency_ms,
+        last_called_at, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(project_id, server_name, tool_name) DO UPDATE SET
+        call_count = call_count + excluded.call_count,
+        success_count = success_count + excluded.success_count,
+        failure_count = failure_count + excluded.failure_count,
+        total_latency_ms = total_latency_ms + excluded.total_latency_ms,
+        avg_latency_ms = (total_latency_ms + excluded.total_latency_ms)
+            / (call_count + excluded.call_count),
+        last_called_at = excluded.last_called_at,
+        updated_at = excluded.updated_at
+"""
+
+_INSERT_EVENT = """
+    INSERT INTO metrics_events (
+        event_type, project_id, session_id, server_name,
+        name, success, latency_ms, result, metadata_json, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+CallKey = tuple[str, str, str]  # (project_id, server_name, tool_name)
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class ToolCallDelta:
+    """Unflushed counter increments for one (project, server, tool)."""
+
+    call_count: int = 0
+    success_count: int = 0
+    failure_count: int = 0
+    total_latency_ms: float = 0.0
+    last_called_at: str | None = None
+
+    def add(self, latency_ms: float, success: bool, called_at: str) -> None:
+        self.call_count += 1
+        if success:
+            self.success_count += 1
+        else:
+            self.failure_count += 1
+        self.total_latency_ms += latency_ms
+        self.last_called_at = called_at
+
+    def merge(self, other: ToolCallDelta) -> None:
+        self.call_count += other.call_count
+        self.success_count += other.success_count
+        self.failure_count += other.failure_count
+        self.total_latency_ms += other.total_latency_ms
+        if other.last_called_at and (
+            self.last_called_at is None or other.last_called_at > self.last_called_at
+        ):
+            self.last_called_at = other.last_called_at
+
+
+def _event_timestamp() -> str:
+    # Same format as the metrics_events.created_at column default
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+
+
+class MetricsBuffer:
+    """Thread-safe metrics accumulator with a background flusher."""
+
+    def __init__(
+        self,
+        db: DatabaseProtocol,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        max_pending_events: int = DEFAULT_MAX_PENDING_EVENTS,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            db: Database the buffered rows are flushed to
+            flush_interval_ms: Maximum time between background flushes
+            flush_batch_size: Pending event count that triggers an early flush
+            max_pending_events: Ring size; the oldest events are dropped beyond it
+        """
+        # Weak, so the shared per-database buffer doesn't keep its key alive
+        self._db_ref = weakref.ref(db)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._calls: dict[CallKey, ToolCallDelta] = {}
+        self._events: deque[tuple[Any, ...]] = deque()
+        self.configure(flush_interval_ms, flush_batch_size, max_pending_events)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._wake_pending = False
+        self._task: asyncio.Task[None] | None = None
+
+        # Stats
+        self._dropped_events = 0
+        self._flushed_events = 0
+        self._flushed_calls = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._rejected_rows = 0
+        self._last_flush_ms = 0.0
+
+    def configure(
+        self,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        max_pending_events: int = DEFAULT_MAX_PENDING_EVENTS,
+    ) -> None:
+        """Update flush thresholds (e.g. from daemon config)."""
+        with self._lock:
+            self.flush_interval_ms = max(1, flush_interval_ms)
+            self.flush_batch_size = max(1, flush_batch_size)
+            self.max_pending_events = max(1, max_pending_events)
+            while len(self._events) > self.max_pending_events:
+                self._events.popleft()
+
+    @property
+    def db(self) -> DatabaseProtocol:
+        db = self._db_ref()
+        if db is None:
+            raise RuntimeError("MetricsBuffer used after its database was garbage collected")
+        return db
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is active."""
+        return self._task is not None and not self._task.done()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record_call(
+        self,
+        server_name: str,
+        tool_name: str,
+        project_id: str,
+        latency_ms: float,
+        success: bool = True,
+    ) -> None:
+        """Accumulate one tool call into the per-tool counters."""
+        now = datetime.now(UTC).isoformat()
+        with self._lock:
+            delta = self._calls.get((project_id, server_name, tool_name))
+            if delta is None:
+                delta = self._calls[(project_id, server_name, tool_name)] = ToolCallDelta()
+            delta.add(latency_ms, success, now)
+        if not self.is_running:
+            self.flush()
+
+    def record_event(
+        self,
+        event_type: str,
+        name: str,
+        project_id: str | None = None,
+        session_id: str | None = None,
+        server_name: str | None = None,
+        success: bool = True,
+        latency_ms: float | None = None,
+        result: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Append one raw event to the ring, dropping the oldest if it is full."""
+        row = (
+            event_type,
+            project_id,
+            session_id,
+            server_name,
+            name,
+            1 if success else 0,
+            latency_ms,
+            result,
+            json.dumps(metadata) if metadata else None,
+            _event_timestamp(),
+        )
+        with self._lock:
+            if len(self._events) >= self.max_pending_events:
+                self._events.popleft()
+                self._dropped_events += 1
+            self._events.append(row)
+            wake = len(self._events) >= self.flush_batch_size and not self._wake_pending
+            if wake:
+                self._wake_pending = True
+        if not self.is_running:
+            self.flush()
+        elif wake:
+            self._request_flush()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def pending_calls(
+        self,
+        project_id: str | None = None,
+        server_name: str | None = None,
+        tool_name: str | None = None,
+    ) -> dict[CallKey, ToolCallDelta]:
+        """Snapshot of unflushed counter deltas matching the filters."""
+        with self._lock:
+            return {
+                key: ToolCallDelta(
+                    d.call_count,
+                    d.success_count,
+                    d.failure_count,
+                    d.total_latency_ms,
+                    d.last_called_at,
+                )
+                for key, d in self._calls.items()
+                if (project_id is None or key[0] == project_id)
+                and (server_name is None or key[1] == server_name)
+                and (tool_name is None or key[2] == tool_name)
+            }
+
+    def read_with_pending(
+        self,
+        read: Callable[[], T],
+        project_id: str | None = None,
+        server_name: str | None = None,
+        tool_name: str | None = None,
+    ) -> tuple[T, dict[CallKey, ToolCallDelta]]:
+        """Run a DB read and snapshot matching deltas with no flush in between.
+
+        Holding the flush lock guarantees every delta is either in the read's
+        result or in the returned snapshot, never both.
+        """
+        with self._flush_lock:
+            return read(), self.pending_calls(project_id, server_name, tool_name)
+
+    def read_with_pending_events(self, read: Callable[[list[tuple[Any, ...]]], T]) -> T:
+        """Run a DB read given a snapshot of unflushed events, with no flush in between.
+
+        Each event is a tuple in metrics_events column order, without ``id``.
+        As with read_with_pending, no event is both flushed and in the snapshot.
+        """
+        with self._flush_lock:
+            with self._lock:
+                events = list(self._events)
+            return read(events)
+
+    def discard_calls(
+        self,
+        project_id: str | None = None,
+        server_name: str | None = None,
+        tool_name: str | None = None,
+    ) -> None:
+        """Drop unflushed counter deltas matching the filters (metrics reset)."""
+        with self._lock:
+            for key in list(self._calls):
+                if (
+                    (project_id is None or key[0] == project_id)
+                    and (server_name is None or key[1] == server_name)
+                    and (tool_name is None or key[2] == tool_name)
+                ):
+                    del self._calls[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Buffer depth, drop and flush counters."""
+        with self._lock:
+            return {
+                "running": self.is_running,
+                "pending_events": len(self._events),
+                "pending_tools": len(self._calls),
+                "dropped_events": self._dropped_events,
+                "flushed_events": self._flushed_events,
+                "flushed_calls": self._flushed_calls,
+                "flushes": self._flushes,
+                "failed_flushes": self._failed_flushes,
+                "rejected_rows": self._rejected_rows,
+                "last_flush_ms": round(self._last_flush_ms, 3),
+            }
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Write everything pending in one transaction.
+
+        Returns:
+            Number of rows written (tool counter rows + events). On failure the
+            data is put back and 0 is returned.
+        """
+        with self._flush_lock:
+            with self._lock:
+                calls, self._calls = self._calls, {}
+                events, self._events = self._events, deque()
+                self._wake_pending = False
+            if not calls and not events:
+                return 0
+
+            now = datetime.now(UTC).isoformat()
+            call_rows = [
+                (
+                    f"tm-{uuid.uuid4().hex[:6]}",
+                    project_id,
+                    server_name,
+                    tool_name,
+                    d.call_count,
+                    d.success_count,
+                    d.failure_count,
+                    d.total_latency_ms,
+                    d.total_latency_ms / d.call_count,
+                    d.last_called_at,
+                    now,
+                    now,
+                )
+                for (project_id, server_name, tool_name), d in calls.items()
+            ]
+
+            event_rows = list(events)
+            written = len(call_rows) + len(event_rows)
+            start = time.perf_counter()
+            if getattr(self.db, "wal_mode", False):
+                written, failed = self._write_queued(call_rows, event_rows)
+                if failed:
+                    self._restore(
+                        calls if "calls" in failed else {},
+                        events if "events" in failed else deque(),
+                    )
+                    calls = {} if "calls" in failed else calls
+                    events = deque() if "events" in failed else events
+                    if not calls and not events:
+                        return 0
+            else:
+                try:
+                    with self.db.transaction() as conn:
+                        if call_rows:
+                            conn.executemany(_UPSERT_TOOL_METRICS, call_rows)
+                        if event_rows:
+                            conn.executemany(_INSERT_EVENT, event_rows)
+                except sqlite3.IntegrityError:
+                    # A bad row (e.g. unknown project_id) must not hold back the batch
+                    written = self._write_rowwise(call_rows, event_rows)
+                except Exception as e:
+                    logger.warning(f"Metrics flush failed, retrying next cycle: {e}")
+                    self._restore(calls, events)
+                    return 0
+
+            with self._lock:
+                self._flushes += 1
+                self._flushed_calls += sum(d.call_count for d in calls.values())
+                self._flushed_events += len(events)
+                self._last_flush_ms = (time.perf_counter() - start) * 1000
+            return written
+
+    def _write_queued(
+        self, call_rows: list[tuple[Any, ...]], event_rows: list[tuple[Any, ...]]
+    ) -> tuple[int, set[str]]:
+        """Write through the database's writer thread (WAL mode).
+
+        The counter upsert and the event insert are queued separately, so a
+        failure only puts back its own rows.
+
+        Returns:
+            Rows written, and which parts ("calls", "events") failed.
+        """
+        submit = self.db.submit_writemany  # type: ignore[attr-defined]
+        parts = {"calls": call_rows, "events": event_rows}
+        futures = {}
+        written = 0
+        failed: set[str] = set()
+        for part, rows in parts.items():
+            if not rows:
+                continue
+            try:
+                futures[part] = submit(
+                    _UPSERT_TOOL_METRICS if part == "calls" else _INSERT_EVENT, rows
+                )
+            except Exception as e:
+                # Writer closed (shutdown)
+                logger.warning(f"Metrics flush of {part} failed, retrying next cycle: {e}")
+                failed.add(part)
+        for part, future in futures.items():
+            try:
+                future.result()
+                written += len(parts[part])
+            except sqlite3.IntegrityError:
+                # A bad row (e.g. unknown project_id) must not hold back the batch
+                if part == "calls":
+                    written += self._write_rowwise(call_rows, [])
+                else:
+                    written += self._write_rowwise([], event_rows)
+            except Exception as e:
+                logger.warning(f"Metrics flush of {part} failed, retrying next cycle: {e}")
+                failed.add(part)
+        return written, failed
+
+    def _write_rowwise(
+        self, call_rows: list[tuple[Any, ...]], event_rows: list[tuple[Any, ...]]
+    ) -> int:
+        """Write rows one at a time, skipping (and counting) rows the schema rejects."""
+        written = 0
+        rejected = 0
+        for sql, rows in ((_UPSERT_TOOL_METRICS, call_rows), (_INSERT_EVENT, event_rows)):
+            for row in rows:
+                try:
+                    self.db.execute(sql, row)
+                    written += 1
+                except sqlite3.IntegrityError as e:
+                    rejected += 1
+                    logger.debug(f"Rejected metrics row: {e}")
+        if rejected:
+            logger.warning(f"Metrics flush rejected {rejected} row(s) violating constraints")
+        with self._lock:
+            self._rejected_rows += rejected
+        return written
+
+    def _restore(self, calls: dict[CallKey, ToolCallDelta], events: deque[tuple[Any, ...]]) -> None:
+        """Put back data from a failed flush ahead of anything recorded since."""
+        with self._lock:
+            self._failed_flushes += 1
+            for key, delta in calls.items():
+                current = self._calls.get(key)
+                if current is None:
+                    self._calls[key] = delta
+                else:
+                    delta.merge(current)
+                    self._calls[key] = delta
+            merged = events + self._events
+            overflow = len(merged) - self.max_pending_events
+            for _ in range(max(0, overflow)):
+                merged.popleft()
+            self._dropped_events += max(0, overflow)
+            self._events = merged
+
+    def _request_flush(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            # Loop closed during shutdown; stop() flushes what is left
+            pass
+
+    async def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.is_running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="metrics-flush")
+
+    async def stop(self) -> None:
+        """Stop the background flusher and flush whatever is still pending."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._loop = None
+        self._wake = None
+        await asyncio.to_thread(self.flush)
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval_ms / 1000)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"Metrics flush loop error: {e}", exc_info=True)
+
+
+def get_metrics_buffer(db: DatabaseProtocol) -> MetricsBuffer:
+    """Get the shared MetricsBuffer for a database, creating it on first use."""
+    with _buffers_lock:
+        buffer = _buffers.get(db)
+        if buffer is None:
+            buffer = _buffers[db] = MetricsBuffer(db)
+        return buffer
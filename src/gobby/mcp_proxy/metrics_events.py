@@ -5,6 +5,7 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from gobby.mcp_proxy.metrics_buffer import MetricsBuffer, get_metrics_buffer
 from gobby.storage.database import DatabaseProtocol
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,15 @@ RANGE_DELTAS: dict[str, timedelta | None] = {
     "all": None,
 }
 
+# Dashboard queries read from ``events``: stored rows plus the buffer's unflushed
+# events, which arrive as one JSON array parameter in metrics_events column order.
+_EVENTS_CTE = "WITH events AS (SELECT * FROM metrics_events)\n"
+_EVENTS_WITH_PENDING_CTE = (
+    "WITH events AS (SELECT * FROM metrics_events UNION ALL SELECT NULL, "
+    + ", ".join(f"json_extract(value, '$[{i}]')" for i in range(10))
+    + " FROM json_each(?))\n"
+)
+
 
 class MetricsEventStore:
     """
@@ -32,10 +42,24 @@ class MetricsEventStore:
     dimensions (session_id, timestamp, event_type). All dashboard queries hit
     this table directly with timestamp filters. Events older than the retention
     period are rolled into metrics_events_archive as aggregate totals.
+
+    Writes go through the database's shared MetricsBuffer; queries merge in
+    its unflushed events instead of flushing, so reads never write.
     """
 
-    def __init__(self, db: DatabaseProtocol) -> None:
+    def __init__(self, db: DatabaseProtocol, buffer: MetricsBuffer | None = None) -> None:
         self.db = db
+        self.buffer = buffer or get_metrics_buffer(db)
+
+    def _fetchall(self, sql: str, params: tuple[Any, ...] = ()) -> list[Any]:
+        """Run a query over ``events`` (stored plus buffered metrics events)."""
+
+        def read(pending: list[tuple[Any, ...]]) -> list[Any]:
+            if not pending:
+                return self.db.fetchall(_EVENTS_CTE + sql, params)
+            return self.db.fetchall(_EVENTS_WITH_PENDING_CTE + sql, (json.dumps(pending), *params))
+
+        return self.buffer.read_with_pending_events(read)
 
     def record_event(
         self,
@@ -49,30 +73,22 @@ class MetricsEventStore:
         result: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
-        """Record a raw metrics event."""
-        self.db.execute(
-            """
-            INSERT INTO metrics_events (
-                event_type, project_id, session_id, server_name,
-                name, success, latency_ms, result, metadata_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_type,
-                project_id,
-                session_id,
-                server_name,
-                name,
-                1 if success else 0,
-                latency_ms,
-                result,
-                json.dumps(metadata) if metadata else None,
-            ),
+        """Record a raw metrics event (buffered; see MetricsBuffer)."""
+        self.buffer.record_event(
+            event_type=event_type,
+            name=name,
+            project_id=project_id,
+            session_id=session_id,
+            server_name=server_name,
+            success=success,
+            latency_ms=latency_ms,
+            result=result,
+            metadata=metadata,
         )
 
     def get_session_tool_breakdown(self, session_id: str) -> list[dict[str, Any]]:
         """Get per-tool call counts and latency for a session."""
-        rows = self.db.fetchall(
+        rows = self._fetchall(
             """
             SELECT
                 server_name,
@@ -82,7 +98,7 @@ class MetricsEventStore:
                 SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) AS failure_count,
                 ROUND(AVG(latency_ms), 2) AS avg_latency_ms,
                 ROUND(SUM(latency_ms), 2) AS total_latency_ms
-            FROM metrics_events
+            FROM events
             WHERE session_id = ? AND event_type = 'tool_call'
             GROUP BY server_name, name
             ORDER BY call_count DESC
@@ -108,7 +124,7 @@ class MetricsEventStore:
             params.append(session_id)
 
         where = " AND ".join(conditions)
-        rows = self.db.fetchall(
+        rows = self._fetchall(
             f"""
             SELECT
                 name AS rule_name,
@@ -116,7 +132,7 @@ class MetricsEventStore:
                 SUM(CASE WHEN result = 'block' THEN 1 ELSE 0 END) AS block_count,
                 SUM(CASE WHEN result = 'allow' THEN 1 ELSE 0 END) AS allow_count,
                 ROUND(AVG(latency_ms), 2) AS avg_latency_ms
-            FROM metrics_events
+            FROM events
             WHERE {where}
             GROUP BY name
             ORDER BY eval_count DESC
@@ -142,14 +158,14 @@ class MetricsEventStore:
             params.append(session_id)
 
         where = " AND ".join(conditions)
-        rows = self.db.fetchall(
+        rows = self._fetchall(
             f"""
             SELECT
                 name AS skill_name,
                 event_type,
                 COUNT(*) AS count,
                 ROUND(AVG(latency_ms), 2) AS avg_latency_ms
-            FROM metrics_events
+            FROM events
             WHERE {where}
             GROUP BY name, event_type
             ORDER BY count DESC
@@ -190,9 +206,9 @@ class MetricsEventStore:
         where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         params.append(limit)
 
-        rows = self.db.fetchall(
+        rows = self._fetchall(
             f"""
-            SELECT * FROM metrics_events
+            SELECT * FROM events
             {where}
             ORDER BY created_at DESC
             LIMIT ?
@@ -248,7 +264,7 @@ class MetricsEventStore:
 
         where = " AND ".join(conditions)
 
-        rows = self.db.fetchall(
+        rows = self._fetchall(
             f"""
             SELECT
                 strftime('{bucket_fmt}', created_at) AS bucket,
@@ -258,7 +274,7 @@ class MetricsEventStore:
                 ROUND(AVG(latency_ms), 2) AS avg_latency_ms,
                 SUM(CASE WHEN result = 'block' THEN 1 ELSE 0 END) AS block_count,
                 SUM(CASE WHEN result = 'allow' THEN 1 ELSE 0 END) AS allow_count
-            FROM metrics_events
+            FROM events
             WHERE {where}
             GROUP BY bucket
             ORDER BY bucket ASC
@@ -0,0 +1,179 @@
+"""Tool schema cache for external MCP servers.
+
+Argument pre-validation needs a tool's inputSchema on every proxied call.
+Fetching it with ``tools/list`` costs a full MCP round trip (plus a DB write
+of the tool list), which is slow for stdio servers. This cache keeps schemas
+in memory, keyed by server and tool, and falls back to the on-disk ``tools``
+table before going to the network.
+
+Disk entries are cross-checked against ``tool_schema_hashes``: if the hash
+recorded for the last live schema differs from the cached schema, the disk
+entry is treated as stale and the caller refreshes from the server.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from gobby.mcp_proxy.schema_hash import SchemaHashManager, compute_schema_hash
+
+logger = logging.getLogger("gobby.mcp.schema_cache")
+
+
+@dataclass(frozen=True)
+class CachedToolSchema:
+    """A cached tool definition with its schema hash."""
+
+    server_name: str
+    name: str
+    description: str
+    input_schema: dict[str, Any]
+    schema_hash: str
+
+    def to_tool_info(self) -> dict[str, Any]:
+        """Return the tool info dict shape used by MCPClientManager.get_tool_info."""
+        result: dict[str, Any] = {"name": self.name}
+        if self.description:
+            result["description"] = self.description
+        result["inputSchema"] = self.input_schema
+        return result
+
+
+class ToolSchemaCache:
+    """In-memory tool schema cache backed by the ``tools`` table."""
+
+    def __init__(self, mcp_db_manager: Any | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            mcp_db_manager: LocalMCPManager used for the on-disk tool cache and
+                schema hash cross-checks. Without it the cache is memory-only.
+        """
+        self._mcp_db_manager = mcp_db_manager
+        self._entries: dict[str, dict[str, CachedToolSchema]] = {}
+        # Servers whose on-disk entries must not be trusted (tools/list_changed)
+        self._stale_servers: set[str] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def get(
+        self, server_name: str, tool_name: str, project_id: str | None = None
+    ) -> CachedToolSchema | None:
+        """Look up a tool schema, loading the server's disk cache on a memory miss."""
+        with self._lock:
+            server_entries = self._entries.get(server_name)
+            stale = server_name in self._stale_servers
+            if server_entries is not None:
+                entry = self._lookup(server_entries, tool_name)
+                if entry is not None:
+                    self._hits += 1
+                    return entry
+
+        if not stale and project_id and server_entries is None:
+            # Disk load runs unlocked; it may query the database
+            loaded = self._load_from_disk(server_name, project_id)
+            if loaded:
+                with self._lock:
+                    self._entries.setdefault(server_name, loaded)
+                    entry = self._lookup(loaded, tool_name)
+                    if entry is not None:
+                        self._disk_hits += 1
+                        return entry
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def populate(self, server_name: str, tools: list[dict[str, Any]]) -> None:
+        """Replace a server's entries with a fresh ``tools/list`` result."""
+        entries: dict[str, CachedToolSchema] = {}
+        for tool in tools:
+            name = tool.get("name")
+            if not name:
+                continue
+            input_schema = tool.get("inputSchema") or {}
+            entries[name] = CachedToolSchema(
+                server_name=server_name,
+                name=name,
+                description=tool.get("description") or "",
+                input_schema=input_schema,
+                schema_hash=compute_schema_hash(input_schema),
+            )
+        with self._lock:
+            self._entries[server_name] = entries
+            self._stale_servers.discard(server_name)
+
+    def invalidate(self, server_name: str | None = None) -> None:
+        """Drop cached schemas for one server (or all) and distrust their disk cache."""
+        with self._lock:
+            if server_name is None:
+                self._stale_servers.update(self._entries)
+                self._entries.clear()
+            else:
+                self._entries.pop(server_name, None)
+                self._stale_servers.add(server_name)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache hit/miss counters."""
+        with self._lock:
+            return {
+                "servers": len(self._entries),
+                "tools": sum(len(v) for v in self._entries.values()),
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+            }
+
+    @staticmethod
+    def _lookup(entries: dict[str, CachedToolSchema], tool_name: str) -> CachedToolSchema | None:
+        entry = entries.get(tool_name)
+        if entry is None:
+            # The tools table stores names lowercased
+            entry = entries.get(tool_name.lower())
+        return entry
+
+    def _load_from_disk(
+        self, server_name: str, project_id: str
+    ) -> dict[str, CachedToolSchema] | None:
+        """Load a server's tools from the DB, rejecting entries with drifted hashes."""
+        if self._mcp_db_manager is None:
+            return None
+        try:
+            tools = self._mcp_db_manager.get_cached_tools(server_name, project_id=project_id)
+            if not tools:
+                return None
+
+            known_hashes: dict[str, str] = {}
+            db = getattr(self._mcp_db_manager, "db", None)
+            if db is not None:
+                records = SchemaHashManager(db).get_hashes_for_server(server_name, project_id)
+                known_hashes = {r.tool_name.lower(): r.schema_hash for r in records}
+
+            entries: dict[str, CachedToolSchema] = {}
+            for tool in tools:
+                input_schema = tool.input_schema or {}
+                schema_hash = compute_schema_hash(input_schema)
+                expected = known_hashes.get(tool.name.lower())
+                # Empty schemas are stored as NULL, so accept either hash form
+                if expected is not None and expected not in (
+                    schema_hash,
+                    compute_schema_hash(tool.input_schema),
+                ):
+                    # Live schema changed since the tool list was cached
+                    logger.debug(f"Schema hash mismatch for {server_name}/{tool.name}, refreshing")
+                    return None
+                entries[tool.name] = CachedToolSchema(
+                    server_name=server_name,
+                    name=tool.name,
+                    description=tool.description or "",
+                    input_schema=input_schema,
+                    schema_hash=schema_hash,
+                )
+            return entries
+        except Exception as e:
+            logger.debug(f"Failed to load cached tool schemas for {server_name}: {e}")
+            return None
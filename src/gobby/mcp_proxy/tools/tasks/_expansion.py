@@ -14,6 +14,7 @@ from typing import Any
 from gobby.mcp_proxy.tools.internal import InternalToolRegistry
 from gobby.mcp_proxy.tools.tasks._context import RegistryContext
 from gobby.mcp_proxy.tools.tasks._resolution import resolve_task_id_for_mcp
+from gobby.storage.task_dependencies import DependencyType
 from gobby.storage.tasks import TaskNotFoundError
 
 logger = logging.getLogger(__name__)
@@ -443,68 +444,36 @@ def create_expansion_registry(ctx: RegistryContext) -> InternalToolRegistry:
                     pass
             return {"error": f"Expansion failed: {e}", "cleaned_up": len(created_tasks)}
 
-        # Wire dependencies between subtasks
+        # Wire dependencies between subtasks and the task hierarchy in one batch
+        # (single transaction and a single cycle check over every edge)
+        edges: list[tuple[str, str, DependencyType]] = []
         for i, subtask in enumerate(subtasks):
             depends_on = subtask.get("depends_on", [])
             for dep_idx in depends_on:
-                if 0 <= dep_idx < len(created_tasks):
-                    try:
-                        ctx.dep_manager.add_dependency(
-                            task_id=created_tasks[i].id,
-                            depends_on=created_tasks[dep_idx].id,
-                            dep_type="blocks",
-                        )
-                    except ValueError:
-                        pass  # Dependency already exists or invalid
-
-        # Wire blocking relationships for the task hierarchy
+                if 0 <= dep_idx < len(created_tasks) and dep_idx != i:
+                    edges.append((created_tasks[i].id, created_tasks[dep_idx].id, "blocks"))
+
         if phase_subepic_ids:
             # Phase subepics blocked by their children
             for phase_num, subepic_id in phase_subepic_ids.items():
                 for idx in phase_map.get(phase_num, []):
                     if idx < len(created_tasks):
-                        try:
-                            ctx.dep_manager.add_dependency(
-                                task_id=subepic_id,
-                                depends_on=created_tasks[idx].id,
-                                dep_type="blocks",
-                            )
-                        except ValueError:
-                            pass
+                        edges.append((subepic_id, created_tasks[idx].id, "blocks"))
 
             # Root epic blocked by subepics
             for subepic_id in phase_subepic_ids.values():
-                try:
-                    ctx.dep_manager.add_dependency(
-                        task_id=resolved_id,
-                        depends_on=subepic_id,
-                        dep_type="blocks",
-                    )
-                except ValueError:
-                    pass
+                edges.append((resolved_id, subepic_id, "blocks"))
 
             # Unphased tasks (phase 0) still block root epic directly
             for idx in phase_map.get(0, []):
                 if idx < len(created_tasks):
-                    try:
-                        ctx.dep_manager.add_dependency(
-                            task_id=resolved_id,
-                            depends_on=created_tasks[idx].id,
-                            dep_type="blocks",
-                        )
-                    except ValueError:
-                        pass
+                    edges.append((resolved_id, created_tasks[idx].id, "blocks"))
         else:
             # No phases — all children block root epic directly (original behavior)
             for created_task in created_tasks:
-                try:
-                    ctx.dep_manager.add_dependency(
-                        task_id=resolved_id,
-                        depends_on=created_task.id,
-                        dep_type="blocks",
-                    )
-                except ValueError:
-                    pass  # Already exists
+                edges.append((resolved_id, created_task.id, "blocks"))
+
+        ctx.dep_manager.add_dependencies(edges)
 
         # Update parent task status
         ctx.task_manager.update_task(
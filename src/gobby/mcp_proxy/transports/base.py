@@ -5,7 +5,7 @@ from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
 from typing import Any
 
-from mcp import ClientSession
+from mcp import ClientSession, types
 
 from gobby.mcp_proxy.models import ConnectionState, MCPServerConfig
 
@@ -43,6 +43,16 @@ class BaseTransportConnection:
         self._state = ConnectionState.DISCONNECTED
         self._last_health_check: datetime | None = None
         self._consecutive_failures = 0
+        # Called with the server name on notifications/tools/list_changed
+        self.on_tools_changed: Callable[[str], None] | None = None
+
+    async def _handle_message(self, message: Any) -> None:
+        """ClientSession message handler: forward tools/list_changed notifications."""
+        if not isinstance(message, types.ServerNotification):
+            return
+        if isinstance(message.root, types.ToolListChangedNotification):
+            if self.on_tools_changed is not None:
+                self.on_tools_changed(self.config.name)
 
     async def connect(self) -> Any:
         """Connect and return ClientSession. Must be implemented by subclasses."""
@@ -82,7 +82,9 @@ class HTTPTransportConnection(BaseTransportConnection):
                 self.config.url,
                 headers=self.config.headers,
             ) as (read_stream, write_stream, _):
-                self._session_context = ClientSession(read_stream, write_stream)
+                self._session_context = ClientSession(
+                    read_stream, write_stream, message_handler=self._handle_message
+                )
                 async with self._session_context as session:
                     self._session = session
                     await self._session.initialize()
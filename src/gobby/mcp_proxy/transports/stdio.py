@@ -130,7 +130,9 @@ class StdioTransportConnection(BaseTransportConnection):
             transport_entered = True
 
             # Save the context manager itself so we can call __aexit__ on it later
-            self._session_context = ClientSession(read_stream, write_stream)
+            self._session_context = ClientSession(
+                read_stream, write_stream, message_handler=self._handle_message
+            )
             self._session = await self._session_context.__aenter__()
             session_entered = True
 
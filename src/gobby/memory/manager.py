@@ -20,6 +20,7 @@ from gobby.memory.services.maintenance import (
 from gobby.memory.services.maintenance import (
     get_stats as _get_stats,
 )
+from gobby.search.vector_index import content_hash
 from gobby.storage.database import DatabaseProtocol
 from gobby.storage.memories import LocalMemoryManager, Memory
 
@@ -55,6 +56,7 @@ class MemoryManager:
         vector_store: VectorStore | None = None,
         embed_fn: Callable[..., Any] | None = None,
         *,
+        embed_batch_fn: Callable[..., Any] | None = None,
         neo4j_url: str | None = None,
         neo4j_auth: str | None = None,
         neo4j_database: str = "neo4j",
@@ -66,6 +68,7 @@ class MemoryManager:
         self._llm_service = llm_service
         self._vector_store = vector_store
         self._embed_fn = embed_fn
+        self._embed_batch_fn = embed_batch_fn
 
         # Primary storage layer — always SQLite via LocalMemoryManager
         self.storage = LocalMemoryManager(db)
@@ -164,6 +167,11 @@ class MemoryManager:
         """Get the embedding function."""
         return self._embed_fn
 
+    @property
+    def embed_batch_fn(self) -> Callable[..., Any] | None:
+        """Get the batch embedding function (list of texts per request)."""
+        return self._embed_batch_fn
+
     @property
     def llm_service(self) -> LLMService | None:
         """Get the LLM service for image description."""
@@ -214,7 +222,9 @@ class MemoryManager:
             return  # Known-unavailable, skip silently
         try:
             embedding = await self._embed_fn(content)
-            await self._vector_store.upsert(memory_id, embedding, payload or {})
+            await self._vector_store.upsert(
+                memory_id, embedding, {**(payload or {}), "content_hash": content_hash(content)}
+            )
             self._embeddings_available = True
         except Exception as e:
             if self._embeddings_available is None:
@@ -589,24 +599,23 @@ class MemoryManager:
                 else:
                     merged_ids = qdrant_ranked
 
-                # Resolve memories and apply filters
+                # Resolve memories in one query; type/tag filters run in SQL
+                hydrated = self.storage.get_memories_by_ids(
+                    merged_ids,
+                    project_id=project_id,
+                    memory_type=memory_type,
+                    tags_all=tags_all,
+                    tags_any=tags_any,
+                    tags_none=tags_none,
+                )
                 scored: list[tuple[Memory, float]] = []
                 for rank, memory_id in enumerate(merged_ids):
-                    try:
-                        mem = self.storage.get_memory(memory_id)
-                    except ValueError:
+                    mem = hydrated.get(memory_id)
+                    if mem is None:
                         continue
                     # Defense-in-depth: skip cross-project memories that leaked through graph
                     if project_id and mem.project_id and mem.project_id != project_id:
                         continue
-                    if memory_type and mem.memory_type != memory_type:
-                        continue
-                    if tags_all and not all(t in (mem.tags or []) for t in tags_all):
-                        continue
-                    if tags_any and not any(t in (mem.tags or []) for t in tags_any):
-                        continue
-                    if tags_none and any(t in (mem.tags or []) for t in tags_none):
-                        continue
 
                     # Use RRF rank as primary ordering; apply user source boost to break ties
                     base_score = 1.0 / (rank + 1)
@@ -625,19 +634,17 @@ class MemoryManager:
                     filters=filters or None,
                 )
 
+                hydrated = self.storage.get_memories_by_ids(
+                    [memory_id for memory_id, _ in results],
+                    memory_type=memory_type,
+                    tags_all=tags_all,
+                    tags_any=tags_any,
+                    tags_none=tags_none,
+                )
                 scored = []
                 for memory_id, score in results:
-                    try:
-                        mem = self.storage.get_memory(memory_id)
-                    except ValueError:
-                        continue
-                    if memory_type and mem.memory_type != memory_type:
-                        continue
-                    if tags_all and not all(t in (mem.tags or []) for t in tags_all):
-                        continue
-                    if tags_any and not any(t in (mem.tags or []) for t in tags_any):
-                        continue
-                    if tags_none and any(t in (mem.tags or []) for t in tags_none):
+                    mem = hydrated.get(memory_id)
+                    if mem is None:
                         continue
 
                     boosted = score * _USER_SOURCE_BOOST if mem.source_type == "user" else score
@@ -688,6 +695,7 @@ class MemoryManager:
         now = datetime.now(UTC)
         debounce_seconds = getattr(self.config, "access_debounce_seconds", 60)
 
+        due: list[str] = []
         for memory in memories:
             if memory.last_accessed_at:
                 try:
@@ -699,11 +707,14 @@ class MemoryManager:
                         continue
                 except (ValueError, TypeError):
                     pass
+            due.append(memory.id)
 
-            try:
-                self.storage.update_access_stats(memory.id, now.isoformat())
-            except Exception as e:
-                logger.warning(f"Failed to update access stats for {memory.id}: {e}")
+        if not due:
+            return
+        try:
+            self.storage.update_access_stats_many(due, now.isoformat())
+        except Exception as e:
+            logger.warning(f"Failed to update access stats for {len(due)} memories: {e}")
 
     async def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory from SQLite, VectorStore, and Neo4j."""
@@ -970,8 +981,9 @@ class MemoryManager:
     async def reindex_embeddings(self) -> dict[str, Any]:
         """Regenerate embeddings for all stored memories.
 
-        Uses VectorStore.rebuild() to delete and recreate the collection,
-        which handles embedding dimension changes (e.g., 1536→768) cleanly.
+        Uses VectorStore.rebuild() to build a replacement collection and swap
+        it in, which handles embedding dimension changes (e.g., 1536→768)
+        cleanly. Vectors for unchanged content from the same model are reused.
         """
         if not self._vector_store or not self._embed_fn:
             return {"success": False, "error": "Vector store or embedding function not configured"}
@@ -985,13 +997,20 @@ class MemoryManager:
         ]
 
         try:
-            await self._vector_store.rebuild(memory_dicts, self._embed_fn)
-            generated = len(memory_dicts)
+            result = await self._vector_store.rebuild(
+                memory_dicts, self._embed_fn, embed_batch_fn=self._embed_batch_fn
+            )
+            generated = result["embedded"]
         except Exception as e:
             logger.error(f"Failed to rebuild vector store: {e}")
             return {"success": False, "total_memories": total, "error": str(e)}
 
-        return {"success": True, "total_memories": total, "embeddings_generated": generated}
+        return {
+            "success": True,
+            "total_memories": total,
+            "embeddings_generated": generated,
+            "embeddings_reused": result["reused"] + result["resumed"],
+        }
 
     # =========================================================================
     # Cross-references (using VectorStore for similarity search)
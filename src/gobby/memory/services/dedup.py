@@ -13,6 +13,8 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from gobby.search.vector_index import content_hash
+
 if TYPE_CHECKING:
     from gobby.memory.vectorstore import VectorStore
     from gobby.storage.memories import LocalMemoryManager, Memory
@@ -157,6 +159,7 @@ class DedupService:
                 payload={
                     "content": content,
                     "project_id": project_id,
+                    "content_hash": content_hash(content),
                 },
             )
             self._embeddings_available = True
@@ -2,17 +2,26 @@
 
 Wraps qdrant-client with async support via asyncio.to_thread().
 Supports embedded mode (on-disk, zero Docker) or remote Qdrant server.
+
+The memory collection name may be a Qdrant alias. ``rebuild()`` builds into a
+shadow collection and repoints the alias once it is complete, so searches keep
+hitting the old index until the new one is ready.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Iterator
 from typing import Any
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
     Distance,
     FieldCondition,
     Filter,
@@ -23,8 +32,13 @@ from qdrant_client.models import (
     VectorParams,
 )
 
+from gobby.search.vector_index import content_hash
+
 logger = logging.getLogger(__name__)
 
+# Shadow collections built by rebuild() are named "<collection><suffix><ns>"
+REBUILD_SUFFIX = "__rebuild_"
+
 
 class VectorStore:
     """Async wrapper around Qdrant for memory vector storage.
@@ -37,8 +51,10 @@ class VectorStore:
         path: Directory path for embedded Qdrant storage.
         url: URL for remote Qdrant server.
         api_key: API key for remote Qdrant server.
-        collection_name: Name of the Qdrant collection.
+        collection_name: Name of the Qdrant collection (or alias).
         embedding_dim: Dimensionality of embedding vectors.
+        embedding_model: Model that produced the vectors. Stamped into point
+            payloads so rebuild() only reuses vectors from the same model.
     """
 
     def __init__(
@@ -48,13 +64,19 @@ class VectorStore:
         api_key: str | None = None,
         collection_name: str = "memories",
         embedding_dim: int = 1536,
+        embedding_model: str | None = None,
     ) -> None:
         self._path = path
         self._url = url
         self._api_key = api_key
         self._collection_name = collection_name
         self._embedding_dim = embedding_dim
+        self._embedding_model = embedding_model
         self._client: QdrantClient | None = None
+        # Shadow collection of an in-progress rebuild; live writes are mirrored to it
+        self._rebuild_collection: str | None = None
+        # IDs written or deleted by live traffic during a rebuild (rebuild won't overwrite)
+        self._rebuild_touched: set[str] = set()
 
     async def initialize(self) -> None:
         """Create the Qdrant client and ensure the collection exists."""
@@ -70,6 +92,9 @@ class VectorStore:
         client = self._client
         assert client is not None
         exists = await asyncio.to_thread(client.collection_exists, self._collection_name)
+        if not exists:
+            # The name may be an alias left by rebuild(); never shadow it with a collection
+            exists = await self._resolve_alias() is not None
         if not exists:
             await asyncio.to_thread(
                 client.create_collection,
@@ -116,13 +141,10 @@ class VectorStore:
         point = PointStruct(
             id=memory_id,
             vector=embedding,
-            payload=payload or {},
-        )
-        await asyncio.to_thread(
-            client.upsert,
-            collection_name=collection_name or self._collection_name,
-            points=[point],
+            payload=self._stamp(payload or {}, collection_name),
         )
+        for target in self._write_targets(collection_name, [memory_id]):
+            await asyncio.to_thread(client.upsert, collection_name=target, points=[point])
 
     async def search(
         self,
@@ -175,12 +197,13 @@ class VectorStore:
             collection_name: Optional collection name override.
         """
         client = self._ensure_client()
-        await asyncio.to_thread(
-            client.set_payload,
-            collection_name=collection_name or self._collection_name,
-            payload=payload,
-            points=[memory_id],
-        )
+        for target in self._write_targets(collection_name):
+            await asyncio.to_thread(
+                client.set_payload,
+                collection_name=target,
+                payload=payload,
+                points=[memory_id],
+            )
 
     async def delete(
         self,
@@ -202,11 +225,8 @@ class VectorStore:
         else:
             raise ValueError("Must provide either memory_id or filters to delete")
 
-        await asyncio.to_thread(
-            client.delete,
-            collection_name=collection_name or self._collection_name,
-            points_selector=selector,
-        )
+        for target in self._write_targets(collection_name, [memory_id] if memory_id else []):
+            await asyncio.to_thread(client.delete, collection_name=target, points_selector=selector)
 
     async def delete_many(
         self,
@@ -218,11 +238,8 @@ class VectorStore:
             return
         client = self._ensure_client()
         selector = PointIdsList(points=memory_ids)
-        await asyncio.to_thread(
-            client.delete,
-            collection_name=collection_name or self._collection_name,
-            points_selector=selector,
-        )
+        for target in self._write_targets(collection_name, memory_ids):
+            await asyncio.to_thread(client.delete, collection_name=target, points_selector=selector)
 
     async def batch_upsert(
         self,
@@ -239,14 +256,56 @@ class VectorStore:
             return
         client = self._ensure_client()
         points = [
-            PointStruct(id=memory_id, vector=embedding, payload=payload)
+            PointStruct(
+                id=memory_id, vector=embedding, payload=self._stamp(payload, collection_name)
+            )
             for memory_id, embedding, payload in items
         ]
-        await asyncio.to_thread(
-            client.upsert,
+        ids = [memory_id for memory_id, _, _ in items]
+        for target in self._write_targets(collection_name, ids):
+            await asyncio.to_thread(client.upsert, collection_name=target, points=points)
+
+    async def get_vectors(
+        self, point_ids: list[str], collection_name: str | None = None
+    ) -> dict[str, list[float]]:
+        """Stored vectors by point ID. IDs with no point are left out."""
+        if not point_ids:
+            return {}
+        client = self._ensure_client()
+        points = await asyncio.to_thread(
+            client.retrieve,
             collection_name=collection_name or self._collection_name,
-            points=points,
+            ids=point_ids,
+            with_payload=False,
+            with_vectors=True,
         )
+        return {
+            str(point.id): point.vector  # type: ignore[misc]
+            for point in points
+            if isinstance(point.vector, list)
+        }
+
+    def _is_memory_collection(self, collection_name: str | None) -> bool:
+        return collection_name is None or collection_name == self._collection_name
+
+    def _stamp(self, payload: dict[str, Any], collection_name: str | None) -> dict[str, Any]:
+        """Record the embedding model on memory points (used for vector reuse)."""
+        if self._embedding_model and (
+            self._is_memory_collection(collection_name)
+            or collection_name == self._rebuild_collection
+        ):
+            return {**payload, "embedding_model": self._embedding_model}
+        return payload
+
+    def _write_targets(
+        self, collection_name: str | None, ids: list[str] | None = None
+    ) -> list[str]:
+        """Collections a write must reach: the target, plus a rebuild shadow if one is active."""
+        if not self._is_memory_collection(collection_name) or self._rebuild_collection is None:
+            return [collection_name or self._collection_name]
+        if ids:
+            self._rebuild_touched.update(ids)
+        return [self._collection_name, self._rebuild_collection]
 
     async def ensure_collection(
         self, collection_name: str, embedding_dim: int | None = None
@@ -316,51 +375,256 @@ class VectorStore:
     async def rebuild(
         self,
         memories: list[dict[str, Any]],
-        embed_fn: Callable[[str], Awaitable[list[float]]],
-    ) -> None:
+        embed_fn: Callable[..., Awaitable[list[float]]],
+        embed_batch_fn: Callable[[list[str]], Awaitable[list[list[float]]]] | None = None,
+        batch_size: int = 64,
+        concurrency: int = 4,
+    ) -> dict[str, Any]:
         """Rebuild the collection from a list of memories.
 
-        Deletes all existing points and re-embeds from the provided memory list.
+        Points are written to a shadow collection which replaces the live one
+        (via an alias swap) only once it is complete, so the existing index
+        keeps serving searches meanwhile. Every written batch is a checkpoint:
+        an interrupted rebuild resumes from the leftover shadow collection.
+        Vectors whose ``content_hash`` (and embedding model) match the live or
+        shadow collection are reused instead of re-embedded.
 
         Args:
             memories: List of dicts with at least 'id' and 'content' keys.
                       Other keys are stored as payload.
             embed_fn: Async function that takes content text and returns embedding.
+            embed_batch_fn: Optional async function embedding a list of texts in
+                one request. Falls back to one embed_fn call per text.
+            batch_size: Memories embedded and upserted per batch.
+            concurrency: Maximum batches in flight at once.
+
+        Returns:
+            Dict with total, resumed, reused, embedded and removed counts.
         """
         client = self._ensure_client()
+        live_target = await self._resolve_alias()
+        shadow = await self._open_shadow(live_target)
+        done = await self._scroll_hashes(shadow)
+        live_exists = await asyncio.to_thread(client.collection_exists, self._collection_name)
+
+        stats: dict[str, Any] = {"total": len(memories), "resumed": 0, "reused": 0, "embedded": 0}
+        todo: list[tuple[dict[str, Any], str]] = []
+        for mem in memories:
+            digest = content_hash(mem["content"])
+            if done.get(str(mem["id"])) == digest:
+                stats["resumed"] += 1
+            else:
+                todo.append((mem, digest))
+        if stats["resumed"]:
+            logger.info(f"Resuming rebuild in '{shadow}': {stats['resumed']} vectors already built")
+
+        self._rebuild_collection = shadow
+        self._rebuild_touched = set()
+        try:
+            # Embedding requests overlap; Qdrant I/O is serialized (embedded mode
+            # is not safe for concurrent writers)
+            io_lock = asyncio.Lock()
+            batches = iter([todo[i : i + batch_size] for i in range(0, len(todo), batch_size)])
+            workers = [
+                asyncio.create_task(
+                    self._rebuild_worker(
+                        batches,
+                        shadow,
+                        self._collection_name if live_exists else None,
+                        embed_fn,
+                        embed_batch_fn,
+                        stats,
+                        io_lock,
+                    )
+                )
+                for _ in range(max(1, concurrency))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+
+            # Drop leftovers of memories deleted since an interrupted run
+            wanted = {str(mem["id"]) for mem in memories} | self._rebuild_touched
+            stale = [point_id for point_id in done if point_id not in wanted]
+            await self.delete_many(stale, collection_name=shadow)
+            stats["removed"] = len(stale)
+
+            await self._swap_in(shadow, live_target)
+        finally:
+            self._rebuild_collection = None
+            self._rebuild_touched = set()
+
+        logger.info(
+            f"Rebuilt {len(memories)} vectors in '{self._collection_name}' "
+            f"(embedded={stats['embedded']}, reused={stats['reused']}, "
+            f"resumed={stats['resumed']})"
+        )
+        return stats
+
+    async def _rebuild_worker(
+        self,
+        batches: Iterator[list[tuple[dict[str, Any], str]]],
+        shadow: str,
+        source: str | None,
+        embed_fn: Callable[..., Awaitable[list[float]]],
+        embed_batch_fn: Callable[[list[str]], Awaitable[list[list[float]]]] | None,
+        stats: dict[str, Any],
+        io_lock: asyncio.Lock,
+    ) -> None:
+        """Embed (or reuse) and upsert batches until the shared iterator is exhausted."""
+        for batch in batches:
+            async with io_lock:
+                cached = await self._cached_vectors(source, batch) if source else {}
+            missing = [(mem, digest) for mem, digest in batch if str(mem["id"]) not in cached]
+            texts = [mem["content"] for mem, _ in missing]
+            if embed_batch_fn is not None and texts:
+                fresh = await embed_batch_fn(texts)
+            else:
+                fresh = [await embed_fn(text) for text in texts]
+            vectors = dict(cached)
+            for (mem, _), vector in zip(missing, fresh, strict=True):
+                vectors[str(mem["id"])] = vector
+
+            items = [
+                (
+                    mem["id"],
+                    vectors[str(mem["id"])],
+                    {**{k: v for k, v in mem.items() if k != "id"}, "content_hash": digest},
+                )
+                for mem, digest in batch
+                if str(mem["id"]) not in self._rebuild_touched
+            ]
+            async with io_lock:
+                await self.batch_upsert(items, collection_name=shadow)
+            stats["reused"] += len(cached)
+            stats["embedded"] += len(missing)
+
+            progress = stats["resumed"] + stats["reused"] + stats["embedded"]
+            logger.debug(f"Rebuild progress: {progress}/{stats['total']} vectors")
+
+    async def _cached_vectors(
+        self, source: str, batch: list[tuple[dict[str, Any], str]]
+    ) -> dict[str, list[float]]:
+        """Existing vectors in ``source`` whose content hash and model still match."""
+        client = self._ensure_client()
+        wanted = {str(mem["id"]): digest for mem, digest in batch}
+        points = await asyncio.to_thread(
+            client.retrieve,
+            collection_name=source,
+            ids=list(wanted),
+            with_payload=["content_hash", "embedding_model"],
+            with_vectors=True,
+        )
+        cached: dict[str, list[float]] = {}
+        for point in points:
+            payload = point.payload or {}
+            vector = point.vector
+            if (
+                payload.get("content_hash") == wanted.get(str(point.id))
+                and payload.get("embedding_model") == self._embedding_model
+                and isinstance(vector, list)
+                and len(vector) == self._embedding_dim
+            ):
+                cached[str(point.id)] = vector  # type: ignore[assignment]
+        return cached
+
+    async def _resolve_alias(self) -> str | None:
+        """Collection the live name is an alias for, or None if it is not an alias."""
+        client = self._ensure_client()
+        result = await asyncio.to_thread(client.get_aliases)
+        for alias in result.aliases:
+            if alias.alias_name == self._collection_name:
+                return alias.collection_name
+        return None
+
+    async def _pending_rebuilds(self, live_target: str | None) -> list[str]:
+        """Shadow collections left behind by interrupted rebuilds, oldest first."""
+        client = self._ensure_client()
+        prefix = f"{self._collection_name}{REBUILD_SUFFIX}"
+        result = await asyncio.to_thread(client.get_collections)
+        return sorted(
+            c.name
+            for c in result.collections
+            if c.name.startswith(prefix) and c.name != live_target
+        )
+
+    async def has_pending_rebuild(self) -> bool:
+        """Whether an interrupted rebuild is waiting to be resumed."""
+        return bool(await self._pending_rebuilds(await self._resolve_alias()))
+
+    async def _open_shadow(self, live_target: str | None) -> str:
+        """Reuse the newest interrupted shadow collection, or create a fresh one."""
+        client = self._ensure_client()
+        pending = await self._pending_rebuilds(live_target)
+        for stale in pending[:-1]:
+            await asyncio.to_thread(client.delete_collection, collection_name=stale)
+        if pending:
+            shadow = pending[-1]
+            try:
+                info = await asyncio.to_thread(client.get_collection, shadow)
+                vectors_cfg = info.config.params.vectors
+                if (
+                    isinstance(vectors_cfg, VectorParams)
+                    and vectors_cfg.size == self._embedding_dim
+                ):
+                    return shadow
+            except Exception as e:
+                logger.warning(f"Could not inspect rebuild collection '{shadow}': {e}")
+            await asyncio.to_thread(client.delete_collection, collection_name=shadow)
 
-        # Delete and recreate collection for clean rebuild
-        await asyncio.to_thread(client.delete_collection, collection_name=self._collection_name)
+        shadow = f"{self._collection_name}{REBUILD_SUFFIX}{time.time_ns()}"
         await asyncio.to_thread(
             client.create_collection,
-            collection_name=self._collection_name,
+            collection_name=shadow,
             vectors_config=VectorParams(size=self._embedding_dim, distance=Distance.COSINE),
         )
+        return shadow
 
-        if not memories:
-            return
+    async def _scroll_hashes(self, collection_name: str, batch_size: int = 1000) -> dict[str, str]:
+        """Map point ID to its payload content_hash for a collection."""
+        client = self._ensure_client()
+        hashes: dict[str, str] = {}
+        offset = None
+        while True:
+            points, offset = await asyncio.to_thread(
+                client.scroll,
+                collection_name=collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=["content_hash"],
+                with_vectors=False,
+            )
+            for point in points:
+                hashes[str(point.id)] = (point.payload or {}).get("content_hash", "")
+            if offset is None:
+                return hashes
 
-        # Embed and upsert in batches (chunked to stay under Qdrant request size limit)
-        batch_size = 500
-        total = 0
-        batch: list[tuple[str, list[float], dict[str, Any]]] = []
-        for mem in memories:
-            content = mem["content"]
-            embedding = await embed_fn(content)
-            payload = {k: v for k, v in mem.items() if k not in ("id",)}
-            batch.append((mem["id"], embedding, payload))
-
-            if len(batch) >= batch_size:
-                await self.batch_upsert(batch)
-                total += len(batch)
-                logger.info(f"Rebuild progress: {total}/{len(memories)} vectors")
-                batch = []
-
-        if batch:
-            await self.batch_upsert(batch)
-            total += len(batch)
-
-        logger.info(f"Rebuilt {total} vectors in '{self._collection_name}'")
+    async def _swap_in(self, shadow: str, live_target: str | None) -> None:
+        """Point the live name at ``shadow`` and drop the collection it replaces."""
+        client = self._ensure_client()
+        operations: list[CreateAliasOperation | DeleteAliasOperation] = []
+        if live_target is not None:
+            operations.append(
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=self._collection_name))
+            )
+        elif await asyncio.to_thread(client.collection_exists, self._collection_name):
+            # Pre-alias layout: a real collection holds the name. This one-time
+            # migration leaves a brief window with no live collection.
+            await asyncio.to_thread(client.delete_collection, collection_name=self._collection_name)
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(collection_name=shadow, alias_name=self._collection_name)
+            )
+        )
+        await asyncio.to_thread(
+            client.update_collection_aliases, change_aliases_operations=operations
+        )
+        if live_target is not None and live_target != shadow:
+            await asyncio.to_thread(client.delete_collection, collection_name=live_target)
 
     async def scroll_ids(self, batch_size: int = 1000) -> list[str]:
         """Return all point IDs in the collection."""
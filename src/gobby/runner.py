@@ -29,10 +29,12 @@ if TYPE_CHECKING:
     from gobby.llm import LLMService
     from gobby.mcp_proxy.manager import MCPClientManager
     from gobby.mcp_proxy.metrics import ToolMetricsManager
+    from gobby.mcp_proxy.metrics_buffer import MetricsBuffer
     from gobby.mcp_proxy.metrics_events import MetricsEventStore
     from gobby.memory.manager import MemoryManager
     from gobby.memory.vectorstore import VectorStore
     from gobby.scheduler.scheduler import CronScheduler
+    from gobby.servers.hook_socket import HookSocketServer
     from gobby.servers.http import HTTPServer
     from gobby.servers.websocket.server import WebSocketServer
     from gobby.sessions.lifecycle import SessionLifecycleManager
@@ -120,6 +122,7 @@ class GobbyRunner:
     memory_manager: MemoryManager | None
     code_indexer: Any | None
     mcp_db_manager: LocalMCPManager
+    metrics_buffer: MetricsBuffer
     metrics_event_store: MetricsEventStore
     metrics_manager: ToolMetricsManager
     mcp_proxy: MCPClientManager
@@ -149,6 +152,7 @@ class GobbyRunner:
     # Phase 4: servers (init_servers)
     http_server: HTTPServer
     websocket_server: WebSocketServer | None
+    hook_socket_server: HookSocketServer | None
 
     def __init__(self, config_path: Path | None = None, verbose: bool = False):
         from gobby.runner_init import (
@@ -11,6 +11,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from gobby.config.tmux import TmuxConfig
     from gobby.scheduler.scheduler import CronScheduler
     from gobby.servers.websocket.server import WebSocketServer
     from gobby.workflows.pipeline_executor import PipelineExecutor
@@ -22,13 +23,15 @@ logger = logging.getLogger(__name__)
 _agent_event_callback: Any | None = None
 
 
-def setup_agent_event_broadcasting(websocket_server: WebSocketServer) -> None:
+def setup_agent_event_broadcasting(
+    websocket_server: WebSocketServer, tmux_config: TmuxConfig | None = None
+) -> None:
     """Set up WebSocket broadcasting for agent lifecycle events, PTY reading, and tmux streaming."""
     from gobby.agents.pty_reader import get_pty_reader_manager
     from gobby.agents.tmux import get_tmux_output_reader
 
     pty_manager = get_pty_reader_manager()
-    tmux_reader = get_tmux_output_reader()
+    tmux_reader = get_tmux_output_reader(tmux_config)
 
     # Set up output callbacks to broadcast via WebSocket
     async def broadcast_terminal_output(run_id: str, data: str) -> None:
@@ -21,7 +21,8 @@ from gobby.llm import create_llm_service
 from gobby.mcp_proxy.manager import MCPClientManager
 from gobby.memory.manager import MemoryManager
 from gobby.memory.vectorstore import VectorStore
-from gobby.search.embeddings import generate_embedding
+from gobby.search.embeddings import generate_embedding, generate_embeddings
+from gobby.servers.hook_socket import HookSocketServer
 from gobby.servers.http import HTTPServer
 from gobby.servers.websocket.models import WebSocketConfig
 from gobby.servers.websocket.server import WebSocketServer
@@ -128,10 +129,11 @@ def init_hub_database(config: Any) -> Any:
     # Ensure hub db directory exists
     hub_db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    hub_db = LocalDatabase(hub_db_path)
+    wal_mode = bool(getattr(config, "database_wal_mode", False))
+    hub_db = LocalDatabase(hub_db_path, wal_mode=wal_mode)
     run_migrations(hub_db)
 
-    logger.info(f"Database: {hub_db_path}")
+    logger.info(f"Database: {hub_db_path}" + (" (WAL)" if wal_mode else ""))
     return hub_db
 
 
@@ -233,16 +235,28 @@ def init_storage_and_config(runner: GobbyRunner, config_path: Path | None, verbo
     if runner.config.telemetry and runner.config.telemetry.traces_enabled:
         from gobby.telemetry.providers import add_span_storage_exporter
 
+        # Spans are exported from the span processor / DB writer threads,
+        # so broadcasts hop back onto the daemon's loop
+        try:
+            main_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            main_loop = None
+
         def _broadcast_proxy(span: dict[str, Any]) -> None:
             """Proxy for trace event broadcasting via WebSocket."""
             if hasattr(runner, "websocket_server") and runner.websocket_server:
-                try:
-                    loop = asyncio.get_running_loop()
-                    loop.create_task(runner.websocket_server.broadcast_trace_event(span))
-                except RuntimeError as e:
-                    logger.debug(f"Trace broadcast skipped (no running loop): {e}")
+                if main_loop is None or main_loop.is_closed():
+                    logger.debug("Trace broadcast skipped (no event loop)")
+                    return
+                asyncio.run_coroutine_threadsafe(
+                    runner.websocket_server.broadcast_trace_event(span), main_loop
+                )
 
-        add_span_storage_exporter(runner.span_storage, broadcast_callback=_broadcast_proxy)
+        add_span_storage_exporter(
+            runner.span_storage,
+            broadcast_callback=_broadcast_proxy,
+            config=runner.config.telemetry,
+        )
         logger.debug("Local span storage exporter wired to OTel")
 
     from gobby.utils.dev import is_dev_mode
@@ -313,7 +327,7 @@ def init_services(runner: GobbyRunner) -> None:
     # Initialize LLM Service
     runner.llm_service = None
     try:
-        runner.llm_service = create_llm_service(runner.config)
+        runner.llm_service = create_llm_service(runner.config, db=runner.database)
         logger.debug(f"LLM service initialized: {runner.llm_service.enabled_providers}")
     except Exception as e:
         logger.error(f"Failed to initialize LLM service: {e}")
@@ -330,8 +344,10 @@ def init_services(runner: GobbyRunner) -> None:
                 url=db_cfg.qdrant.url,
                 api_key=db_cfg.qdrant.api_key,
                 embedding_dim=emb_cfg.dim,
+                embedding_model=emb_cfg.model,
             )
             embed_fn: Callable[..., Any] | None = None
+            embed_batch_fn: Callable[..., Any] | None = None
             if runner.llm_service:
                 from functools import partial
 
@@ -348,6 +364,7 @@ def init_services(runner: GobbyRunner) -> None:
                     generate_embedding,
                     **_mem_embed_kwargs,
                 )
+                embed_batch_fn = partial(generate_embeddings, **_mem_embed_kwargs)
 
             runner.memory_manager = MemoryManager(
                 runner.database,
@@ -355,6 +372,7 @@ def init_services(runner: GobbyRunner) -> None:
                 llm_service=runner.llm_service,
                 vector_store=runner.vector_store,
                 embed_fn=embed_fn,
+                embed_batch_fn=embed_batch_fn,
                 neo4j_url=db_cfg.neo4j.url,
                 neo4j_auth=db_cfg.neo4j.auth,
                 neo4j_database=db_cfg.neo4j.database,
@@ -370,22 +388,28 @@ def init_services(runner: GobbyRunner) -> None:
         try:
             from gobby.code_index.context import CodeIndexContext
             from gobby.code_index.graph import CodeGraph
+            from gobby.code_index.local_graph import LocalCodeGraph
             from gobby.code_index.storage import CodeIndexStorage
 
             ci_config = runner.config.code_index
             ci_storage = CodeIndexStorage(runner.database)
-            # Share Neo4j client from memory_manager if available
+            # Share Neo4j client from memory_manager if available; without it,
+            # graph queries are answered from the SQLite call graph
             ci_neo4j = None
-            if runner.memory_manager and getattr(runner.memory_manager, "_neo4j_client", None):
+            if (
+                ci_config.graph_enabled
+                and runner.memory_manager
+                and getattr(runner.memory_manager, "_neo4j_client", None)
+            ):
                 ci_neo4j = runner.memory_manager._neo4j_client
-            ci_graph = CodeGraph(neo4j_client=ci_neo4j)
+            ci_graph = CodeGraph(neo4j_client=ci_neo4j, local=LocalCodeGraph(runner.database))
 
             ci_vector_store = runner.vector_store if ci_config.embedding_enabled else None
 
             runner.code_indexer = CodeIndexContext(
                 storage=ci_storage,
                 vector_store=ci_vector_store,
-                graph=ci_graph if ci_config.graph_enabled else None,
+                graph=ci_graph,
                 config=ci_config,
             )
 
@@ -398,12 +422,24 @@ def init_services(runner: GobbyRunner) -> None:
     runner.mcp_db_manager = LocalMCPManager(runner.database)
 
     # Tool Metrics Manager for tracking call statistics
+    from gobby.config.features import MetricsConfig
     from gobby.mcp_proxy.metrics import ToolMetricsManager
+    from gobby.mcp_proxy.metrics_buffer import get_metrics_buffer
     from gobby.mcp_proxy.metrics_events import MetricsEventStore
 
-    runner.metrics_event_store = MetricsEventStore(runner.database)
+    # Shared with every other metrics store over this database (e.g. HookManager's);
+    # started in run_daemon, flushed on shutdown
+    runner.metrics_buffer = get_metrics_buffer(runner.database)
+    metrics_config = runner.config.metrics
+    if isinstance(metrics_config, MetricsConfig):
+        runner.metrics_buffer.configure(
+            flush_interval_ms=metrics_config.flush_interval_ms,
+            flush_batch_size=metrics_config.flush_batch_size,
+            max_pending_events=metrics_config.max_buffered_events,
+        )
+    runner.metrics_event_store = MetricsEventStore(runner.database, buffer=runner.metrics_buffer)
     runner.metrics_manager = ToolMetricsManager(
-        runner.database, event_store=runner.metrics_event_store
+        runner.database, event_store=runner.metrics_event_store, buffer=runner.metrics_buffer
     )
 
     # MCPClientManager loads servers from database on init
@@ -460,6 +496,7 @@ def init_services(runner: GobbyRunner) -> None:
         runner.message_processor = SessionMessageProcessor(
             db=runner.database,
             poll_interval=runner.config.message_tracking.poll_interval,
+            archive_dir=getattr(runner.config.session_lifecycle, "transcript_archive_dir", None),
         )
 
     # Initialize Task Validator (Phase 7.1)
@@ -612,6 +649,13 @@ def init_orchestration(runner: GobbyRunner) -> None:
     from gobby.storage.agents import LocalAgentRunManager
     from gobby.storage.checkpoints import LocalCheckpointManager
 
+    tmux_config = runner.config.tmux if hasattr(runner.config, "tmux") else None
+    control_client = None
+    if tmux_config is not None and tmux_config.enabled and tmux_config.control_mode:
+        from gobby.agents.tmux import get_tmux_control_client
+
+        control_client = get_tmux_control_client(tmux_config)
+
     try:
         runner.agent_lifecycle_monitor = AgentLifecycleMonitor(
             agent_run_manager=LocalAgentRunManager(runner.database),
@@ -620,9 +664,10 @@ def init_orchestration(runner: GobbyRunner) -> None:
             clone_storage=runner.clone_storage,
             completion_registry=runner.completion_registry,
             task_manager=runner.task_manager,
-            tmux_config=runner.config.tmux if hasattr(runner.config, "tmux") else None,
+            tmux_config=tmux_config,
             checkpoint_storage=LocalCheckpointManager(runner.database),
             worktree_storage=runner.worktree_storage,
+            control_client=control_client,
         )
     except Exception as e:
         logger.warning(f"Failed to initialize AgentLifecycleMonitor: {e}")
@@ -874,6 +919,7 @@ def init_servers(runner: GobbyRunner) -> None:
             port=runner.config.websocket.port,
             ping_interval=runner.config.websocket.ping_interval,
             ping_timeout=runner.config.websocket.ping_timeout,
+            client_queue_size=runner.config.websocket.client_queue_size,
         )
         runner.websocket_server = WebSocketServer(
             config=websocket_config,
@@ -902,7 +948,10 @@ def init_servers(runner: GobbyRunner) -> None:
             setup_pipeline_event_broadcasting,
         )
 
-        setup_agent_event_broadcasting(runner.websocket_server)
+        setup_agent_event_broadcasting(
+            runner.websocket_server,
+            runner.config.tmux if hasattr(runner.config, "tmux") else None,
+        )
 
         # Register pipeline event callback for WebSocket broadcasting
         if runner.pipeline_executor:
@@ -918,3 +967,8 @@ def init_servers(runner: GobbyRunner) -> None:
                 runner.websocket_server,
                 runner.communications_manager,
             )
+
+    # Hook dispatch Unix socket (Optional) - stdlib fast path for hook_dispatcher.py
+    runner.hook_socket_server = None
+    if runner.config.hook_socket_enabled is True:
+        runner.hook_socket_server = HookSocketServer(runner.http_server.app.state)
@@ -98,18 +98,24 @@ async def _init_subsystems(runner: GobbyRunner, rebuild_vector_store: Any) -> No
                 runner.config.embeddings.dim,
             )
             qdrant_count = await runner.vector_store.count()
-            if qdrant_count == 0 and runner.memory_manager:
+            resume = await runner.vector_store.has_pending_rebuild()
+            if (qdrant_count == 0 or resume) and runner.memory_manager:
                 sqlite_memories = runner.memory_manager.storage.list_memories(limit=10000)
                 if sqlite_memories:
                     embed_fn = runner.memory_manager.embed_fn
                     if embed_fn:
                         logger.info(
-                            f"Qdrant empty, scheduling background rebuild from "
-                            f"{len(sqlite_memories)} SQLite memories..."
+                            f"Qdrant {'rebuild interrupted' if resume else 'empty'}, scheduling "
+                            f"background rebuild from {len(sqlite_memories)} SQLite memories..."
                         )
                         memory_dicts = [{"id": m.id, "content": m.content} for m in sqlite_memories]
                         runner._vector_rebuild_task = asyncio.create_task(
-                            rebuild_vector_store(runner.vector_store, memory_dicts, embed_fn),
+                            rebuild_vector_store(
+                                runner.vector_store,
+                                memory_dicts,
+                                embed_fn,
+                                runner.memory_manager.embed_batch_fn,
+                            ),
                             name="vector-store-rebuild",
                         )
                     else:
@@ -393,6 +399,14 @@ async def run_daemon(runner: GobbyRunner) -> None:
         server = uvicorn.Server(config)
         server_task = asyncio.create_task(server.serve())
 
+        hook_socket_server = getattr(runner, "hook_socket_server", None)
+        if hook_socket_server is not None:
+            await hook_socket_server.start()
+
+        metrics_buffer = getattr(runner, "metrics_buffer", None)
+        if metrics_buffer is not None:
+            await metrics_buffer.start()
+
         # Run all heavy initialization in background so HTTP stays responsive
         runner._subsystem_init_task = asyncio.create_task(
             _init_subsystems(runner, rebuild_vector_store),
@@ -419,6 +433,8 @@ async def run_daemon(runner: GobbyRunner) -> None:
 
         # Cleanup with timeouts to prevent hanging
         # Use timeout slightly longer than uvicorn's graceful shutdown to let it finish
+        if hook_socket_server is not None:
+            await hook_socket_server.stop()
         server.should_exit = True
         try:
             await asyncio.wait_for(server_task, timeout=graceful_shutdown_timeout + 5)
@@ -436,6 +452,14 @@ async def run_daemon(runner: GobbyRunner) -> None:
             except TimeoutError:
                 logger.warning("Agent lifecycle monitor shutdown timed out")
 
+        # Drop the tmux control-mode client (and its hidden session) if one connected
+        from gobby.agents.tmux import get_tmux_control_client
+
+        try:
+            await asyncio.wait_for(get_tmux_control_client().stop(), timeout=3.0)
+        except TimeoutError:
+            logger.warning("tmux control client shutdown timed out")
+
         if runner.conductor_manager:
             try:
                 from gobby.conductor.manager import ConductorManager
@@ -641,6 +665,15 @@ async def run_daemon(runner: GobbyRunner) -> None:
         except TimeoutError:
             logger.warning("MCP disconnect timed out")
 
+        # Final flush of buffered tool-call metrics and events
+        if metrics_buffer is not None:
+            try:
+                await asyncio.wait_for(metrics_buffer.stop(), timeout=5.0)
+            except TimeoutError:
+                logger.warning("Metrics buffer flush timed out")
+            except Exception as e:
+                logger.warning(f"Metrics buffer flush failed: {e}")
+
         # Clean up PID file on graceful shutdown
         cleanup_pid_file()
 
@@ -97,11 +97,12 @@ async def rebuild_vector_store(
     vector_store: VectorStore,
     memory_dicts: list[dict[str, str]],
     embed_fn: Any,
+    embed_batch_fn: Any = None,
 ) -> None:
     """Rebuild VectorStore index in the background."""
     try:
-        await vector_store.rebuild(memory_dicts, embed_fn)
-        logger.info("VectorStore rebuild complete")
+        stats = await vector_store.rebuild(memory_dicts, embed_fn, embed_batch_fn=embed_batch_fn)
+        logger.info(f"VectorStore rebuild complete: {stats}")
     except asyncio.CancelledError:
         logger.info("VectorStore rebuild cancelled")
     except Exception as e:
@@ -24,22 +24,42 @@ Unified search (async with fallback):
         print(f"Using fallback: {searcher.get_fallback_reason()}")
 """
 
-# Async backends
-from gobby.search.backends import AsyncSearchBackend, EmbeddingBackend
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Embedding utilities
-from gobby.search.embeddings import (
-    generate_embedding,
-    generate_embeddings,
-    is_embedding_available,
-)
+if TYPE_CHECKING:
+    # Async backends
+    from gobby.search.backends import AsyncSearchBackend, EmbeddingBackend
+
+    # Embedding utilities
+    from gobby.search.embeddings import (
+        generate_embedding,
+        generate_embeddings,
+        is_embedding_available,
+    )
 
-# FTS5 backend
-from gobby.search.fts5 import FTS5SearchBackend, sanitize_fts_query
-from gobby.search.models import FallbackEvent, SearchConfig, SearchMode
+    # FTS5 backend
+    from gobby.search.fts5 import FTS5SearchBackend, sanitize_fts_query
+    from gobby.search.models import FallbackEvent, SearchConfig, SearchMode
 
-# Unified search (async with fallback)
-from gobby.search.unified import UnifiedSearcher
+    # Unified search (async with fallback)
+    from gobby.search.unified import UnifiedSearcher
+
+# Exports are imported on first access so that the config models can import
+# gobby.search.models without loading the backends (numpy, litellm).
+_EXPORTS = {
+    "AsyncSearchBackend": "gobby.search.backends",
+    "EmbeddingBackend": "gobby.search.backends",
+    "generate_embedding": "gobby.search.embeddings",
+    "generate_embeddings": "gobby.search.embeddings",
+    "is_embedding_available": "gobby.search.embeddings",
+    "FTS5SearchBackend": "gobby.search.fts5",
+    "sanitize_fts_query": "gobby.search.fts5",
+    "FallbackEvent": "gobby.search.models",
+    "SearchConfig": "gobby.search.models",
+    "SearchMode": "gobby.search.models",
+    "UnifiedSearcher": "gobby.search.unified",
+}
 
 __all__ = [
     # Async backends
@@ -59,3 +79,13 @@ __all__ = [
     "generate_embeddings",
     "is_embedding_available",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of the package exports."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
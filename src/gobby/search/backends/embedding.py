@@ -1,49 +1,32 @@
 """Embedding-based search backend.
 
-This module provides embedding-based semantic search using cosine similarity.
-It stores embeddings in memory and uses LiteLLM for embedding generation.
+This module provides embedding-based semantic search. Embeddings live in an
+in-process VectorIndex and are generated via LiteLLM; an optional on-disk
+EmbeddingStore keyed by content hash lets refits and restarts skip
+re-embedding unchanged items.
 """
 
 from __future__ import annotations
 
 import logging
-import math
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from gobby.search.vector_index import EmbeddingStore, VectorIndex, content_hash
+
 if TYPE_CHECKING:
     from gobby.config.persistence import EmbeddingsConfig
 
 logger = logging.getLogger(__name__)
 
 
-def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
-    """Compute cosine similarity between two vectors.
-
-    Args:
-        vec1: First vector
-        vec2: Second vector
-
-    Returns:
-        Cosine similarity score between -1 and 1
-    """
-    if len(vec1) != len(vec2):
-        return 0.0
-
-    dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=True))
-    norm1 = math.sqrt(sum(a * a for a in vec1))
-    norm2 = math.sqrt(sum(b * b for b in vec2))
-
-    if norm1 == 0 or norm2 == 0:
-        return 0.0
-
-    return dot_product / (norm1 * norm2)
-
-
 class EmbeddingBackend:
     """Embedding-based search backend using LiteLLM.
 
     This backend generates embeddings for indexed items and uses
-    cosine similarity for search. Embeddings are stored in memory.
+    cosine similarity for search. Embeddings are stored in a NumPy
+    VectorIndex; with ``cache_path`` set they are also persisted by
+    content hash so only new or changed items are re-embedded.
 
     Supports all providers supported by LiteLLM:
     - OpenAI (text-embedding-3-small)
@@ -64,6 +47,7 @@ class EmbeddingBackend:
         model: str = "nomic-embed-text",
         api_base: str | None = None,
         api_key: str | None = None,
+        cache_path: Path | str | None = None,
     ):
         """Initialize embedding backend.
 
@@ -71,14 +55,16 @@ class EmbeddingBackend:
             model: LiteLLM model string
             api_base: Optional API base URL for custom endpoints
             api_key: Optional API key (uses env var if not set)
+            cache_path: Optional .npz file for persisting embeddings by content hash
         """
         self._model = model
         self._api_base = api_base
         self._api_key = api_key
 
         # Item storage
-        self._item_ids: list[str] = []
-        self._item_embeddings: list[list[float]] = []
+        self._index = VectorIndex()
+        self._store = EmbeddingStore(cache_path)
+        self._item_hashes: dict[str, str] = {}  # item_id -> content hash
         self._item_contents: dict[str, str] = {}  # For reindexing
         self._fitted = False
 
@@ -101,7 +87,8 @@ class EmbeddingBackend:
     async def fit_async(self, items: list[tuple[str, str]]) -> None:
         """Build or rebuild the search index.
 
-        Generates embeddings for all items and stores them in memory.
+        Only items whose content hash is not already cached are embedded;
+        everything else is served from the embedding store.
 
         Args:
             items: List of (item_id, content) tuples to index
@@ -110,39 +97,104 @@ class EmbeddingBackend:
             RuntimeError: If embedding generation fails
         """
         if not items:
-            self._item_ids = []
-            self._item_embeddings = []
-            self._item_contents = {}
-            self._fitted = False
+            self.clear()
             logger.debug("Embedding index cleared (no items)")
             return
 
-        from gobby.search.embeddings import generate_embeddings
-
-        # Store contents for potential reindexing
-        self._item_ids = [item_id for item_id, _ in items]
-        self._item_contents = dict(items)
-        contents = [content for _, content in items]
-
-        # Generate embeddings in batch
         try:
-            self._item_embeddings = await generate_embeddings(
-                texts=contents,
-                model=self._model,
-                api_base=self._api_base,
-                api_key=self._api_key,
-            )
-            self._fitted = True
-            logger.info(f"Embedding index built with {len(items)} items")
+            index = VectorIndex()
+            hashes = await self._embed_items(items, index)
         except Exception as e:
             # Clear stale state to prevent inconsistent data
-            self._item_ids = []
+            self._index = VectorIndex()
+            self._item_hashes = {}
             self._item_contents = {}
-            self._item_embeddings = []
             self._fitted = False
             logger.error(f"Failed to build embedding index: {e}")
             raise
 
+        self._index = index
+        self._item_hashes = hashes
+        self._item_contents = dict(items)
+        self._fitted = True
+
+        # Drop vectors for content that is no longer indexed
+        self._store.retain(hashes.values())
+        self._store.save()
+        logger.info(f"Embedding index built with {len(items)} items")
+
+    async def add_items_async(self, items: list[tuple[str, str]]) -> None:
+        """Add or update items in the index without refitting.
+
+        Args:
+            items: List of (item_id, content) tuples to upsert
+
+        Raises:
+            RuntimeError: If embedding generation fails
+        """
+        if not items:
+            return
+        hashes = await self._embed_items(items, self._index)
+        self._item_hashes.update(hashes)
+        self._item_contents.update(items)
+        self._fitted = True
+        self._store.save()
+
+    def remove_items(self, item_ids: list[str]) -> int:
+        """Remove items from the index by id.
+
+        Returns:
+            Number of items removed
+        """
+        for item_id in item_ids:
+            self._item_hashes.pop(item_id, None)
+            self._item_contents.pop(item_id, None)
+        removed = self._index.remove(item_ids)
+        if not self._index:
+            self._fitted = False
+        return removed
+
+    async def _embed_items(
+        self, items: list[tuple[str, str]], index: VectorIndex
+    ) -> dict[str, str]:
+        """Embed items missing from the store and upsert them into index.
+
+        Returns:
+            Content hash per item id, for the items that made it into the index
+        """
+        hashes = {item_id: content_hash(content) for item_id, content in items}
+
+        # Embed each distinct uncached content once
+        missing: dict[str, str] = {}
+        for item_id, content in items:
+            key = hashes[item_id]
+            if key not in missing and self._store.get(key) is None:
+                missing[key] = content
+
+        if missing:
+            from gobby.search.embeddings import generate_embeddings
+
+            embeddings = await generate_embeddings(
+                texts=list(missing.values()),
+                model=self._model,
+                api_base=self._api_base,
+                api_key=self._api_key,
+            )
+            if len(embeddings) < len(missing):
+                raise RuntimeError(
+                    f"Expected {len(missing)} embeddings, provider returned {len(embeddings)}"
+                )
+            for key, embedding in zip(missing, embeddings, strict=False):
+                self._store.put(key, embedding)
+            logger.debug(f"Embedded {len(missing)} new items ({len(items) - len(missing)} cached)")
+
+        vectors = {item_id: self._store.get(key) for item_id, key in hashes.items()}
+        indexed = {item_id: v for item_id, v in vectors.items() if v is not None}
+        if len(indexed) < len(vectors):
+            logger.warning(f"Skipped {len(vectors) - len(indexed)} items with no cached embedding")
+        index.upsert(list(indexed), list(indexed.values()))
+        return {item_id: hashes[item_id] for item_id in indexed}
+
     async def search_async(
         self,
         query: str,
@@ -164,7 +216,7 @@ class EmbeddingBackend:
         Raises:
             RuntimeError: If embedding generation fails
         """
-        if not self._fitted or not self._item_embeddings:
+        if not self._fitted or not self._index:
             return []
 
         from gobby.search.embeddings import generate_embedding
@@ -182,17 +234,12 @@ class EmbeddingBackend:
             logger.error(f"Failed to embed query: {e}")
             raise
 
-        # Compute similarities
-        similarities: list[tuple[str, float]] = []
-        for item_id, item_embedding in zip(self._item_ids, self._item_embeddings, strict=True):
-            similarity = _cosine_similarity(query_embedding, item_embedding)
-            if similarity > 0:
-                similarities.append((item_id, similarity))
-
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
-
-        return similarities[:top_k]
+        # One matrix-vector product + argpartition top-k
+        return [
+            (item_id, score)
+            for item_id, score in self._index.search(query_embedding, top_k)
+            if score > 0
+        ]
 
     def needs_refit(self) -> bool:
         """Check if the search index needs rebuilding."""
@@ -203,15 +250,20 @@ class EmbeddingBackend:
         return {
             "backend_type": "embedding",
             "fitted": self._fitted,
-            "item_count": len(self._item_ids),
+            "item_count": len(self._index),
             "model": self._model,
             "has_api_base": self._api_base is not None,
+            "cached_embeddings": len(self._store),
+            "persistent_cache": self._store.path is not None,
         }
 
     def clear(self) -> None:
-        """Clear the search index."""
-        self._item_ids = []
-        self._item_embeddings = []
+        """Clear the search index.
+
+        Persisted embeddings are kept so a later fit can reuse them.
+        """
+        self._index = VectorIndex()
+        self._item_hashes = {}
         self._item_contents = {}
         self._fitted = False
 
@@ -23,7 +23,9 @@ Example usage:
 from __future__ import annotations
 
 import logging
+import re
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 from gobby.search.backends import AsyncSearchBackend, EmbeddingBackend
@@ -84,6 +86,7 @@ class UnifiedSearcher:
         embedding_model: str = "nomic-embed-text",
         embedding_api_base: str | None = None,
         embedding_api_key: str | None = None,
+        embedding_cache_path: Path | str | None = None,
     ):
         """Initialize UnifiedSearcher.
 
@@ -98,6 +101,8 @@ class UnifiedSearcher:
             embedding_model: Embedding model name (from EmbeddingsConfig)
             embedding_api_base: API base URL for embedding endpoint
             embedding_api_key: API key for embedding provider
+            embedding_cache_path: .npz file for persisted embeddings. Defaults to
+                ``embedding-cache/<fts_table>-<model>.npz`` next to the database file.
         """
         self._config = config or SearchConfig()
         self._event_callback = event_callback
@@ -111,6 +116,11 @@ class UnifiedSearcher:
         self._fts_content_table = fts_content_table
         self._fts_id_column = fts_id_column
         self._fts_weights = fts_weights
+        self._embedding_cache_path = (
+            Path(embedding_cache_path)
+            if embedding_cache_path
+            else self._default_embedding_cache_path()
+        )
 
         # Initialize backends lazily
         self._keyword_backend: AsyncSearchBackend | None = None
@@ -141,6 +151,14 @@ class UnifiedSearcher:
             )
         return self._keyword_backend
 
+    def _default_embedding_cache_path(self) -> Path | None:
+        """Place the embedding cache beside the database file (None if in-memory)."""
+        db_path = getattr(self._db, "db_path", None)
+        if not isinstance(db_path, Path) or str(db_path) == ":memory:":
+            return None
+        model_slug = re.sub(r"[^A-Za-z0-9._-]+", "_", self._embedding_model)
+        return db_path.parent / "embedding-cache" / f"{self._fts_table}-{model_slug}.npz"
+
     def _get_embedding_backend(self) -> EmbeddingBackend:
         """Get or create the embedding backend."""
         if self._embedding_backend is None:
@@ -148,6 +166,7 @@ class UnifiedSearcher:
                 model=self._embedding_model,
                 api_base=self._embedding_api_base,
                 api_key=self._embedding_api_key,
+                cache_path=self._embedding_cache_path,
             )
         return self._embedding_backend
 
@@ -0,0 +1,241 @@
+"""In-process vector index for embedding search.
+
+VectorIndex keeps embeddings in a contiguous, pre-normalized float32 matrix so
+a query is scored with a single matrix-vector product and the top-k is picked
+with ``argpartition`` instead of a full sort. Items can be added, updated and
+removed by id without rebuilding the matrix.
+
+EmbeddingStore persists vectors to disk keyed by content hash, so a daemon
+restart or a refit only re-embeds items whose content actually changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+Vector = npt.NDArray[np.float32]
+
+# Initial row capacity; the matrix doubles when full
+_INITIAL_CAPACITY = 64
+
+
+def content_hash(content: str) -> str:
+    """Stable hash of item content, used as the embedding cache key."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+
+def _normalize(vectors: npt.ArrayLike) -> npt.NDArray[np.float32]:
+    """L2-normalize rows as float32. Zero vectors stay zero (score 0)."""
+    arr = np.asarray(vectors, dtype=np.float32)
+    if arr.ndim == 1:
+        arr = arr.reshape(1, -1)
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.asarray(arr / norms, dtype=np.float32)
+
+
+class VectorIndex:
+    """Cosine-similarity index over a contiguous float32 matrix."""
+
+    def __init__(self) -> None:
+        self._matrix: npt.NDArray[np.float32] = np.zeros((0, 0), dtype=np.float32)
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._rows
+
+    @property
+    def dim(self) -> int | None:
+        """Embedding dimension, or None while the index is empty."""
+        return self._matrix.shape[1] if self._ids else None
+
+    def ids(self) -> list[str]:
+        """Return indexed ids in row order."""
+        return list(self._ids)
+
+    def upsert(self, ids: Sequence[str], vectors: npt.ArrayLike) -> None:
+        """Add or replace vectors by id.
+
+        Raises:
+            ValueError: If the vector count or dimension doesn't match the index.
+        """
+        if not ids:
+            return
+        normalized = _normalize(vectors)
+        if normalized.shape[0] != len(ids):
+            raise ValueError(f"Got {len(ids)} ids but {normalized.shape[0]} vectors")
+
+        dim = normalized.shape[1]
+        if not self._ids:
+            # Empty index adopts the incoming dimension
+            self._matrix = np.zeros((max(_INITIAL_CAPACITY, len(ids)), dim), dtype=np.float32)
+        elif dim != self._matrix.shape[1]:
+            raise ValueError(f"Vector dimension {dim} does not match index {self._matrix.shape[1]}")
+
+        for item_id, vector in zip(ids, normalized, strict=True):
+            row = self._rows.get(item_id)
+            if row is None:
+                row = len(self._ids)
+                self._ensure_capacity(row + 1)
+                self._ids.append(item_id)
+                self._rows[item_id] = row
+            self._matrix[row] = vector
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Remove vectors by id (swap-with-last). Returns the number removed."""
+        removed = 0
+        for item_id in ids:
+            row = self._rows.pop(item_id, None)
+            if row is None:
+                continue
+            last = len(self._ids) - 1
+            if row != last:
+                last_id = self._ids[last]
+                self._matrix[row] = self._matrix[last]
+                self._ids[row] = last_id
+                self._rows[last_id] = row
+            self._ids.pop()
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all vectors."""
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._ids = []
+        self._rows = {}
+
+    def search(self, query: npt.ArrayLike, top_k: int = 10) -> list[tuple[str, float]]:
+        """Return the top_k (id, cosine similarity) pairs, highest first.
+
+        A query whose dimension doesn't match the index scores nothing.
+        """
+        size = len(self._ids)
+        if size == 0 or top_k <= 0:
+            return []
+        q = _normalize(query)[0]
+        if q.shape[0] != self._matrix.shape[1]:
+            return []
+
+        scores = self._matrix[:size] @ q
+        k = min(top_k, size)
+        if k < size:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._ids[i], float(scores[i])) for i in top]
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2, _INITIAL_CAPACITY)
+        grown = np.zeros((new_capacity, self._matrix.shape[1]), dtype=np.float32)
+        grown[: len(self._ids)] = self._matrix[: len(self._ids)]
+        self._matrix = grown
+
+
+class EmbeddingStore:
+    """Content-hash keyed embedding cache persisted as a single ``.npz`` file."""
+
+    def __init__(self, path: Path | str | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: File to persist vectors to. None keeps the cache in memory only.
+        """
+        self._path = Path(path) if path else None
+        self._vectors: dict[str, Vector] = {}
+        self._loaded = False
+        self._dirty = False
+
+    @property
+    def path(self) -> Path | None:
+        """Backing file, if persistent."""
+        return self._path
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._vectors)
+
+    def get(self, key: str) -> Vector | None:
+        """Get the cached vector for a content hash."""
+        self._ensure_loaded()
+        return self._vectors.get(key)
+
+    def put(self, key: str, vector: npt.ArrayLike) -> None:
+        """Cache a vector under a content hash."""
+        self._ensure_loaded()
+        self._vectors[key] = np.asarray(vector, dtype=np.float32)
+        self._dirty = True
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """Drop cached vectors whose content hash is not in keys."""
+        self._ensure_loaded()
+        keep = set(keys)
+        stale = [k for k in self._vectors if k not in keep]
+        for k in stale:
+            del self._vectors[k]
+        if stale:
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop all cached vectors (and the backing file on next save)."""
+        self._vectors = {}
+        self._loaded = True
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed (atomic replace)."""
+        if self._path is None or not self._dirty:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            keys = list(self._vectors)
+            dims = {v.shape[0] for v in self._vectors.values()}
+            if len(dims) > 1:
+                # Model changed mid-cache; keep only the most common dimension
+                dim = max(dims, key=lambda d: sum(v.shape[0] == d for v in self._vectors.values()))
+                keys = [k for k in keys if self._vectors[k].shape[0] == dim]
+            matrix = (
+                np.stack([self._vectors[k] for k in keys])
+                if keys
+                else np.zeros((0, 0), dtype=np.float32)
+            )
+            tmp = self._path.with_name(self._path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                np.savez(f, keys=np.array(keys, dtype=str), vectors=matrix)
+            os.replace(tmp, self._path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Failed to persist embedding cache to {self._path}: {e}")
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            with np.load(self._path, allow_pickle=False) as data:
+                keys = data["keys"].tolist()
+                vectors = data["vectors"].astype(np.float32, copy=False)
+            self._vectors = {k: vectors[i] for i, k in enumerate(keys)}
+            logger.debug(f"Loaded {len(keys)} cached embeddings from {self._path}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache {self._path}: {e}")
+            self._vectors = {}
@@ -72,11 +72,21 @@ def create_app(server: "HTTPServer") -> FastAPI:
         if code_indexer is not None:
             try:
                 from gobby.code_index.trigger import CodeIndexTrigger
+                from gobby.code_index.worker import GcodeWorker
 
-                hook_manager_kwargs["code_index_trigger"] = CodeIndexTrigger(
+                index_config = code_indexer.config
+                worker = (
+                    GcodeWorker(request_timeout=index_config.index_batch_timeout_seconds)
+                    if index_config.persistent_indexer
+                    else None
+                )
+                server._code_index_trigger = CodeIndexTrigger(
                     loop=asyncio.get_running_loop(),
                     debounce_seconds=2.0,
+                    worker=worker,
+                    subprocess_timeout=index_config.index_batch_timeout_seconds,
                 )
+                hook_manager_kwargs["code_index_trigger"] = server._code_index_trigger
             except Exception as e:
                 logger.warning(f"Failed to create CodeIndexTrigger: {e}")
 
@@ -304,6 +314,13 @@ def create_app(server: "HTTPServer") -> FastAPI:
         except Exception as e:
             logger.warning(f"Failed to stop TmuxPaneMonitor: {e}")
 
+        # Stop the post-edit indexer (and its gcode serve process)
+        if server._code_index_trigger is not None:
+            try:
+                await server._code_index_trigger.close()
+            except Exception as e:
+                logger.warning(f"Failed to stop CodeIndexTrigger: {e}")
+
         # Cleanup HookManager
         if hasattr(app.state, "hook_manager"):
             app.state.hook_manager.shutdown()
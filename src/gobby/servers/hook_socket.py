@@ -0,0 +1,180 @@
+"""
+Unix domain socket transport for CLI hook dispatch.
+
+The hook dispatcher runs once per CLI hook event. Over HTTP each run pays for
+importing httpx, a health-check GET and a fresh TCP handshake before the
+event is even sent. This transport lets the dispatcher talk to the daemon with
+nothing but the standard library: connect to ``~/.gobby/hooks.sock``, write
+one frame, read one frame. A failed connect doubles as the health check.
+
+Wire protocol (both directions): a 4-byte big-endian length prefix followed
+by a UTF-8 JSON object. A connection may carry several request/response pairs.
+
+Request frame::
+
+    {"hook_type": "pre-tool-use", "input_data": {...}, "source": "claude",
+     "project_id": "...", "session_id": "..."}
+
+Response frame::
+
+    {"status": 200, "result": {...}}
+    {"status": 400, "detail": "hook_type required"}
+
+``project_id`` / ``session_id`` replace the X-Gobby-Project-Id and
+X-Gobby-Session-Id headers used by the HTTP route.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Any
+
+from fastapi import HTTPException
+
+from gobby.paths import get_gobby_home
+from gobby.servers.middleware.project_context import set_project_context_from_ids
+from gobby.servers.routes.mcp.hooks import execute_hook_payload
+from gobby.utils.project_context import reset_project_context
+
+logger = logging.getLogger(__name__)
+
+HOOK_SOCKET_NAME = "hooks.sock"
+
+# Frames larger than this are rejected (hook payloads are a few KB)
+MAX_FRAME_BYTES = 32 * 1024 * 1024
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def get_hook_socket_path() -> Path:
+    """Get the hook socket path ($GOBBY_HOOK_SOCKET or ~/.gobby/hooks.sock)."""
+    override = os.environ.get("GOBBY_HOOK_SOCKET")
+    if override:
+        return Path(override)
+    return get_gobby_home() / HOOK_SOCKET_NAME
+
+
+def encode_frame(message: dict[str, Any]) -> bytes:
+    """Encode a message as a length-prefixed JSON frame."""
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """Read one frame. Returns None on a clean EOF between frames.
+
+    Raises:
+        ValueError: If the frame is oversized or not a JSON object.
+        asyncio.IncompleteReadError: If the peer disconnects mid-frame.
+    """
+    try:
+        header = await reader.readexactly(_FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+    (length,) = _FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame too large: {length} bytes")
+    message = json.loads(await reader.readexactly(length))
+    if not isinstance(message, dict):
+        raise ValueError("Frame body must be a JSON object")
+    return message
+
+
+class HookSocketServer:
+    """Serves hook execution requests over a Unix domain socket."""
+
+    def __init__(self, app_state: Any, socket_path: Path | None = None):
+        """
+        Initialize the server.
+
+        Args:
+            app_state: FastAPI app.state (hook_manager, session_manager, ...)
+            socket_path: Socket file path (defaults to ~/.gobby/hooks.sock)
+        """
+        self._app_state = app_state
+        self.socket_path = socket_path or get_hook_socket_path()
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def is_serving(self) -> bool:
+        return self._server is not None and self._server.is_serving()
+
+    async def start(self) -> bool:
+        """Bind the socket. Returns False (and logs) if it can't be bound."""
+        if not hasattr(asyncio, "start_unix_server"):
+            logger.debug("Unix sockets unavailable on this platform; hook socket disabled")
+            return False
+        try:
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            # A leftover socket from a crashed daemon blocks bind()
+            self.socket_path.unlink(missing_ok=True)
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=str(self.socket_path)
+            )
+            os.chmod(self.socket_path, 0o600)
+        except OSError as e:
+            logger.warning(f"Could not bind hook socket {self.socket_path}: {e}")
+            self._server = None
+            return False
+        logger.info(f"Hook socket listening on {self.socket_path}")
+        return True
+
+    async def stop(self) -> None:
+        """Stop accepting connections and remove the socket file."""
+        if self._server is None:
+            return
+        self._server.close()
+        try:
+            await asyncio.wait_for(self._server.wait_closed(), timeout=2.0)
+        except TimeoutError:
+            logger.warning("Hook socket shutdown timed out")
+        self._server = None
+        try:
+            self.socket_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Failed to remove hook socket {self.socket_path}: {e}")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    request = await read_frame(reader)
+                except (ValueError, asyncio.IncompleteReadError) as e:
+                    logger.debug(f"Dropping hook socket connection: {e}")
+                    return
+                if request is None:
+                    return
+                response = await self.handle_request(request)
+                writer.write(encode_frame(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        except Exception:
+            logger.error("Hook socket connection error", exc_info=True)
+        finally:
+            writer.close()
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Execute one hook request frame and build its response frame."""
+        token = set_project_context_from_ids(
+            self._app_state,
+            session_id=request.pop("session_id", None),
+            project_id=request.pop("project_id", None),
+        )
+        try:
+            result = await execute_hook_payload(request, self._app_state)
+            return {"status": 200, "result": result}
+        except HTTPException as e:
+            return {"status": e.status_code, "detail": e.detail}
+        finally:
+            if token is not None:
+                reset_project_context(token)
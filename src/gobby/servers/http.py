@@ -19,6 +19,7 @@ from gobby.telemetry.instruments import inc_counter
 
 if TYPE_CHECKING:
     from gobby.app_context import ServiceContainer
+    from gobby.code_index.trigger import CodeIndexTrigger
     from gobby.config.app import DaemonConfig
     from gobby.hooks.hook_manager import HookManager
     from gobby.llm import LLMService
@@ -72,7 +73,7 @@ class HTTPServer:
         # Create LLM service if not provided in container (fallback)
         if not services.llm_service and services.config:
             try:
-                services.llm_service = create_llm_service(services.config)
+                services.llm_service = create_llm_service(services.config, db=services.database)
                 logger.debug(
                     f"LLM service initialized with providers: {services.llm_service.enabled_providers}"
                 )
@@ -84,6 +85,7 @@ class HTTPServer:
         self._internal_manager: InternalRegistryManager | None = None
         self._tools_handler: GobbyDaemonTools | None = None
         self._hook_manager: HookManager | None = None
+        self._code_index_trigger: CodeIndexTrigger | None = None
 
         if services.mcp_manager:
             self._init_mcp_subsystems(services, port)
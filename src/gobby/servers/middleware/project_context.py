@@ -61,41 +61,58 @@ class ProjectContextMiddleware(BaseHTTPMiddleware):
 
         Returns a ContextVar token for reset, or None if no headers present.
         """
-        # Priority 1: resolve project from session
-        session_id = request.headers.get("x-gobby-session-id")
-        if session_id:
-            try:
-                session_manager = getattr(request.app.state, "session_manager", None)
-                if session_manager:
-                    token = set_project_context_from_session(
-                        session_id, session_manager, session_manager.db
+        return set_project_context_from_ids(
+            request.app.state,
+            session_id=request.headers.get("x-gobby-session-id"),
+            project_id=request.headers.get("x-gobby-project-id"),
+        )
+
+
+def set_project_context_from_ids(
+    app_state: Any,
+    session_id: str | None = None,
+    project_id: str | None = None,
+) -> contextvars.Token[Any] | None:
+    """Set the project ContextVar from a hook's session and/or project id.
+
+    Shared by ProjectContextMiddleware and the hook socket transport, which
+    carries the same ids in its request frame instead of headers.
+
+    Returns a ContextVar token for reset, or None if neither id resolves.
+    """
+    # Priority 1: resolve project from session
+    if session_id:
+        try:
+            session_manager = getattr(app_state, "session_manager", None)
+            if session_manager:
+                token = set_project_context_from_session(
+                    session_id, session_manager, session_manager.db
+                )
+                if token is not None:
+                    return token
+        except Exception as e:
+            logger.debug("Failed to set project context from session %s: %s", session_id, e)
+
+    # Priority 2: resolve project from project_id
+    if project_id:
+        try:
+            from gobby.storage.projects import LocalProjectManager
+
+            session_manager = getattr(app_state, "session_manager", None)
+            if session_manager:
+                pm = LocalProjectManager(session_manager.db)
+                project = pm.get(project_id)
+                if project:
+                    return set_project_context(
+                        {
+                            "id": project.id,
+                            "name": project.name,
+                            "project_path": project.repo_path,
+                        }
                     )
-                    if token is not None:
-                        return token
-            except Exception as e:
-                logger.debug("Failed to set project context from session %s: %s", session_id, e)
-
-        # Priority 2: resolve project from project_id header
-        project_id = request.headers.get("x-gobby-project-id")
-        if project_id:
-            try:
-                from gobby.storage.projects import LocalProjectManager
-
-                session_manager = getattr(request.app.state, "session_manager", None)
-                if session_manager:
-                    pm = LocalProjectManager(session_manager.db)
-                    project = pm.get(project_id)
-                    if project:
-                        return set_project_context(
-                            {
-                                "id": project.id,
-                                "name": project.name,
-                                "project_path": project.repo_path,
-                            }
-                        )
-            except Exception as e:
-                logger.debug("Failed to resolve project %s: %s", project_id, e)
-            # Fallback: set minimal context with just the id
-            return set_project_context({"id": project_id})
-
-        return None
+        except Exception as e:
+            logger.debug("Failed to resolve project %s: %s", project_id, e)
+        # Fallback: set minimal context with just the id
+        return set_project_context({"id": project_id})
+
+    return None
@@ -11,6 +11,8 @@ from fastapi import APIRouter
 from fastapi.responses import PlainTextResponse
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from gobby.mcp_proxy.metrics_buffer import get_metrics_buffer
+from gobby.storage.database import LocalDatabase
 from gobby.telemetry.instruments import get_all_metrics, set_gauge, update_daemon_metrics
 
 if TYPE_CHECKING:
@@ -284,6 +286,16 @@ def register_health_routes(router: APIRouter, server: "HTTPServer") -> None:
         except Exception as e:
             logger.warning(f"Failed to get savings stats: {e}")
 
+        # Get database writer queue statistics
+        database_stats: dict[str, Any] | None = None
+        db = server.services.database
+        if isinstance(db, LocalDatabase):
+            try:
+                database_stats = db.get_write_stats()
+                database_stats["metrics_buffer"] = get_metrics_buffer(db).get_stats()
+            except Exception as e:
+                logger.warning(f"Failed to get database writer stats: {e}")
+
         # Calculate response time
         response_time_ms = (time.perf_counter() - start_time) * 1000
 
@@ -309,6 +321,7 @@ def register_health_routes(router: APIRouter, server: "HTTPServer") -> None:
             "skills": skills_stats,
             "pipelines": pipeline_stats,
             "savings": savings_stats,
+            "database": database_stats,
             "response_time_ms": response_time_ms,
         }
 
@@ -329,6 +342,19 @@ def register_health_routes(router: APIRouter, server: "HTTPServer") -> None:
             # Update background task gauge
             set_gauge("background_tasks_active", float(len(server._background_tasks)))
 
+            # Update database writer queue gauges
+            db = server.services.database
+            if isinstance(db, LocalDatabase):
+                write_stats = db.get_write_stats()
+                set_gauge("db_write_queue_depth", float(write_stats["queue_depth"]))
+                set_gauge(
+                    "db_write_commit_latency_p99_ms",
+                    float(write_stats["commit_latency_ms"]["p99"]),
+                )
+                buffer_stats = get_metrics_buffer(db).get_stats()
+                set_gauge("metrics_buffer_pending_events", float(buffer_stats["pending_events"]))
+                set_gauge("metrics_buffer_dropped_events", float(buffer_stats["dropped_events"]))
+
             # Export in Prometheus format using prometheus_client integration
             return PlainTextResponse(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
@@ -1,6 +1,7 @@
 """Code index routes for Gobby HTTP server.
 
-Provides the invalidate endpoint used by gcode for full-project wipes.
+Provides the invalidate endpoint used by gcode for full-project wipes and
+stats for the post-edit indexing queue.
 """
 
 from __future__ import annotations
@@ -59,4 +60,15 @@ def create_code_index_router(server: HTTPServer) -> APIRouter:
 
         return JSONResponse(content={"status": "ok", "project_id": project_id})
 
+    @router.get("/indexer/stats")
+    async def indexer_stats() -> JSONResponse:
+        """Post-edit index queue depth, batch counters and batch latency."""
+        trigger = server._code_index_trigger
+        if trigger is None:
+            return JSONResponse(
+                status_code=503,
+                content={"error": "Code index trigger not available"},
+            )
+        return JSONResponse(content=trigger.stats())
+
     return router
@@ -166,6 +166,23 @@ def create_communications_router(server: HTTPServer) -> APIRouter:
         status = comms_manager.get_channel_status(channel.name)
         return dict(status)
 
+    @router.post("/channels/{channel_id}/outbox/retry")
+    async def retry_dead_letters(channel_id: str) -> dict[str, Any]:
+        """Re-queue a channel's dead-lettered outbound messages."""
+        comms_manager = server.services.communications_manager
+        if not comms_manager:
+            raise HTTPException(status_code=503, detail="Communications manager not available")
+
+        channel = comms_manager.get_channel(channel_id)
+        if not channel:
+            raise HTTPException(status_code=404, detail="Channel not found")
+
+        try:
+            requeued = comms_manager.retry_dead_letters(channel.name)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+        return {"status": "ok", "requeued": requeued}
+
     @router.get("/messages")
     async def list_messages(
         channel_id: str | None = None,
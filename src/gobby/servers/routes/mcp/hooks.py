@@ -58,6 +58,127 @@ def _graceful_error_response(hook_type: str, error_msg: str) -> dict[str, Any]:
     return response
 
 
+async def execute_hook_payload(payload: dict[str, Any], app_state: Any) -> dict[str, Any]:
+    """
+    Execute a CLI hook payload via the adapter for its source.
+
+    Shared by the HTTP route and the Unix socket transport
+    (see gobby.servers.hook_socket). Project context must already be set
+    by the caller.
+
+    Args:
+        payload: {"hook_type": ..., "input_data": {...}, "source": ...}
+        app_state: FastAPI app.state holding hook_manager / codex_adapter
+
+    Returns:
+        Hook execution result
+
+    Raises:
+        HTTPException: 400 for malformed payloads, 503 if HookManager is missing
+    """
+    start_time = time.perf_counter()
+    inc_counter("hooks_total")
+    hook_type: str | None = None  # Track for error handling
+
+    try:
+        hook_type = payload.get("hook_type")
+        source = payload.get("source")
+
+        if not hook_type:
+            raise HTTPException(status_code=400, detail="hook_type required")
+
+        if not source:
+            raise HTTPException(status_code=400, detail="source required")
+
+        # Get HookManager from app.state
+        if not hasattr(app_state, "hook_manager"):
+            raise HTTPException(status_code=503, detail="HookManager not initialized")
+
+        hook_manager = app_state.hook_manager
+
+        # Select adapter based on source
+        from gobby.adapters.base import BaseAdapter
+        from gobby.adapters.claude_code import ClaudeCodeAdapter
+        from gobby.adapters.codex_impl.adapter import CodexHooksAdapter
+        from gobby.adapters.gemini import GeminiAdapter
+        from gobby.hooks.events import SessionSource
+
+        if source == "claude":
+            adapter: BaseAdapter = ClaudeCodeAdapter(hook_manager=hook_manager)
+        elif source == "claude_sdk":
+            adapter = ClaudeCodeAdapter(hook_manager=hook_manager)
+            adapter.source = SessionSource.CLAUDE_SDK
+        elif source == "claude_sdk_web_chat":
+            adapter = ClaudeCodeAdapter(hook_manager=hook_manager)
+            adapter.source = SessionSource.CLAUDE_SDK_WEB_CHAT
+        elif source == "gemini":
+            adapter = GeminiAdapter(hook_manager=hook_manager)
+        elif source == "codex":
+            # Use bidirectional adapter when app-server is connected
+            codex_adapter = getattr(app_state, "codex_adapter", None)
+            if codex_adapter is not None:
+                adapter = codex_adapter
+            else:
+                adapter = CodexHooksAdapter(hook_manager=hook_manager)
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported source: {source}. Supported: claude, claude_sdk, claude_sdk_web_chat, gemini, codex",
+            )
+
+        # Execute hook via adapter
+        try:
+            result: dict[str, Any] = await asyncio.to_thread(
+                adapter.handle_native, payload, hook_manager
+            )
+
+            response_time_ms = (time.perf_counter() - start_time) * 1000
+            inc_counter("hooks_succeeded_total")
+
+            logger.debug(
+                f"Hook executed: {hook_type}",
+                extra={
+                    "hook_type": hook_type,
+                    "continue": result.get("continue"),
+                    "response_time_ms": response_time_ms,
+                },
+            )
+
+            return result
+
+        except ValueError as e:
+            # Invalid request - still return graceful response
+            inc_counter("hooks_failed_total")
+            logger.warning(
+                f"Invalid hook request: {hook_type}",
+                extra={"hook_type": hook_type, "error": str(e)},
+            )
+            return _graceful_error_response(hook_type, str(e))
+
+        except Exception as e:
+            # Hook execution error - return graceful response so tool proceeds
+            # This prevents confusing "hook failed" warnings in Claude Code
+            inc_counter("hooks_failed_total")
+            logger.error(
+                f"Hook execution failed: {hook_type}",
+                exc_info=True,
+                extra={"hook_type": hook_type},
+            )
+            return _graceful_error_response(hook_type, str(e))
+
+    except HTTPException:
+        # Re-raise 400 errors (bad request) - these are client errors
+        raise
+    except Exception as e:
+        # Outer exception - return graceful response to prevent CLI warning
+        inc_counter("hooks_failed_total")
+        logger.error("Hook endpoint error", exc_info=True)
+        if hook_type:
+            return _graceful_error_response(hook_type, str(e))
+        # Fallback: return basic success to prevent CLI hook failure
+        return {"continue": True, "decision": "approve"}
+
+
 def create_hooks_router(server: "HTTPServer") -> APIRouter:
     """
     Create hooks router with endpoints bound to server instance.
@@ -85,109 +206,17 @@ def create_hooks_router(server: "HTTPServer") -> APIRouter:
         Returns:
             Hook execution result with status
         """
-        start_time = time.perf_counter()
-        inc_counter("hooks_total")
-        hook_type: str | None = None  # Track for error handling
-
+        # Project context is set by ProjectContextMiddleware from
+        # X-Gobby-Project-Id / X-Gobby-Session-Id headers.
         try:
-            # Parse request
             payload = await request.json()
-            hook_type = payload.get("hook_type")
-            source = payload.get("source")
-
-            if not hook_type:
-                raise HTTPException(status_code=400, detail="hook_type required")
-
-            if not source:
-                raise HTTPException(status_code=400, detail="source required")
-
-            # Project context is set by ProjectContextMiddleware from
-            # X-Gobby-Project-Id / X-Gobby-Session-Id headers.
-
-            # Get HookManager from app.state
-            if not hasattr(request.app.state, "hook_manager"):
-                raise HTTPException(status_code=503, detail="HookManager not initialized")
-
-            hook_manager = request.app.state.hook_manager
-
-            # Select adapter based on source
-            from gobby.adapters.base import BaseAdapter
-            from gobby.adapters.claude_code import ClaudeCodeAdapter
-            from gobby.adapters.codex_impl.adapter import CodexHooksAdapter
-            from gobby.adapters.gemini import GeminiAdapter
-            from gobby.hooks.events import SessionSource
-
-            if source == "claude":
-                adapter: BaseAdapter = ClaudeCodeAdapter(hook_manager=hook_manager)
-            elif source == "claude_sdk":
-                adapter = ClaudeCodeAdapter(hook_manager=hook_manager)
-                adapter.source = SessionSource.CLAUDE_SDK
-            elif source == "claude_sdk_web_chat":
-                adapter = ClaudeCodeAdapter(hook_manager=hook_manager)
-                adapter.source = SessionSource.CLAUDE_SDK_WEB_CHAT
-            elif source == "gemini":
-                adapter = GeminiAdapter(hook_manager=hook_manager)
-            elif source == "codex":
-                # Use bidirectional adapter when app-server is connected
-                codex_adapter = getattr(request.app.state, "codex_adapter", None)
-                if codex_adapter is not None:
-                    adapter = codex_adapter
-                else:
-                    adapter = CodexHooksAdapter(hook_manager=hook_manager)
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported source: {source}. Supported: claude, claude_sdk, claude_sdk_web_chat, gemini, codex",
-                )
-
-            # Execute hook via adapter
-            try:
-                result = await asyncio.to_thread(adapter.handle_native, payload, hook_manager)
-
-                response_time_ms = (time.perf_counter() - start_time) * 1000
-                inc_counter("hooks_succeeded_total")
-
-                logger.debug(
-                    f"Hook executed: {hook_type}",
-                    extra={
-                        "hook_type": hook_type,
-                        "continue": result.get("continue"),
-                        "response_time_ms": response_time_ms,
-                    },
-                )
-
-                return result
-
-            except ValueError as e:
-                # Invalid request - still return graceful response
-                inc_counter("hooks_failed_total")
-                logger.warning(
-                    f"Invalid hook request: {hook_type}",
-                    extra={"hook_type": hook_type, "error": str(e)},
-                )
-                return _graceful_error_response(hook_type, str(e))
-
-            except Exception as e:
-                # Hook execution error - return graceful response so tool proceeds
-                # This prevents confusing "hook failed" warnings in Claude Code
-                inc_counter("hooks_failed_total")
-                logger.error(
-                    f"Hook execution failed: {hook_type}",
-                    exc_info=True,
-                    extra={"hook_type": hook_type},
-                )
-                return _graceful_error_response(hook_type, str(e))
-
-        except HTTPException:
-            # Re-raise 400 errors (bad request) - these are client errors
-            raise
-        except Exception as e:
-            # Outer exception - return graceful response to prevent CLI warning
+        except Exception:
+            # Unparseable body - return basic success to prevent CLI hook failure
+            inc_counter("hooks_total")
             inc_counter("hooks_failed_total")
             logger.error("Hook endpoint error", exc_info=True)
-            if hook_type:
-                return _graceful_error_response(hook_type, str(e))
-            # Fallback: return basic success to prevent CLI hook failure
             return {"continue": True, "decision": "approve"}
 
+        return await execute_hook_payload(payload, request.app.state)
+
     return router
@@ -13,6 +13,13 @@ from typing import Any
 
 from websockets.exceptions import ConnectionClosed
 
+from gobby.servers.websocket.outbound import DEFAULT_CLIENT_QUEUE_SIZE, ClientSendQueue
+from gobby.servers.websocket.subscriptions import (
+    SUBSCRIBABLE_EVENT_TYPES,
+    SubscriptionIndex,
+    parse_parametric,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,9 +27,42 @@ class BroadcastMixin:
     """Mixin providing broadcast methods for WebSocketServer.
 
     Requires ``self.clients: dict[Any, dict[str, Any]]`` on the host class.
+    Clients registered through ``_track_client`` are found via the
+    subscription index and sent to through their own outbound queue; any
+    other entries in ``clients`` fall back to a direct, per-client check.
     """
 
     clients: dict[Any, dict[str, Any]]
+    _subscription_index: SubscriptionIndex
+
+    def _get_subscription_index(self) -> SubscriptionIndex:
+        index = self.__dict__.get("_subscription_index")
+        if index is None:
+            index = self._subscription_index = SubscriptionIndex()
+        return index
+
+    def _track_client(self, websocket: Any, queue_size: int = DEFAULT_CLIENT_QUEUE_SIZE) -> None:
+        """Index a newly connected client and start its outbound writer."""
+        send_queue = ClientSendQueue(websocket, max_size=queue_size)
+        send_queue.start()
+        metadata = self.clients.setdefault(websocket, {})
+        metadata["send_queue"] = send_queue
+        self._sync_subscriptions(websocket)
+
+    async def _untrack_client(self, websocket: Any) -> None:
+        """Remove a client from the index and stop its outbound writer."""
+        self._get_subscription_index().remove(websocket)
+        metadata = self.clients.get(websocket)
+        send_queue = metadata.pop("send_queue", None) if metadata else None
+        if send_queue is not None:
+            await send_queue.close()
+
+    def _sync_subscriptions(self, websocket: Any) -> None:
+        """Re-index a client after its ``subscriptions`` set changed."""
+        if websocket in self.clients:
+            self._get_subscription_index().set_subscriptions(
+                websocket, getattr(websocket, "subscriptions", None)
+            )
 
     def _is_subscribed(self, websocket: Any, message: dict[str, Any]) -> bool:
         """Check if a client is subscribed to receive a message."""
@@ -37,30 +77,8 @@ class BroadcastMixin:
 
         msg_type = message.get("type")
 
-        # High-volume event types require explicit subscription
-        event_types = {
-            "hook_event",
-            "session_message",
-            "session_event",
-            "agent_event",
-            "agent_message",
-            "agent_command",
-            "worktree_event",
-            "autonomous_event",
-            "pipeline_event",
-            "terminal_output",
-            "tmux_session_event",
-            "canvas_event",
-            "skill_event",
-            "mcp_event",
-            "workflow_event",
-            "project_event",
-            "cron_event",
-            "trace_event",
-        }
-
         # Non-event messages pass through for any subscribed client
-        if msg_type not in event_types:
+        if msg_type not in SUBSCRIBABLE_EVENT_TYPES:
             return True
 
         # Check for message type subscription
@@ -71,13 +89,10 @@ class BroadcastMixin:
         # e.g., "session_message:session_id=abc123" matches session_message
         # events where the session_id field equals "abc123".
         for sub in subs:
-            if ":" not in sub:
+            param = parse_parametric(sub)
+            if param is None or param[0] != msg_type:
                 continue
-            sub_type, param_str = sub.split(":", 1)
-            if sub_type != msg_type or "=" not in param_str:
-                continue
-            key, value = param_str.split("=", 1)
-            if message.get(key) == value:
+            if message.get(param[1]) == param[2]:
                 return True
 
         # Special casing for hook_event granularity (subscribe by event_type)
@@ -88,27 +103,73 @@ class BroadcastMixin:
 
         return False
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
+    def _subscribers(
+        self, message: dict[str, Any], include_unsubscribed: bool = False
+    ) -> list[Any]:
+        """Connected clients that should receive a message.
+
+        With ``include_unsubscribed``, clients that never set any
+        subscriptions receive it too.
         """
-        Broadcast message to all connected clients.
+        index = self._get_subscription_index()
+        targets = index.match(message)
+        if include_unsubscribed:
+            targets.update(index.unsubscribed())
+        if len(index) < len(self.clients):
+            # Clients added without _track_client are checked individually
+            targets.update(
+                ws
+                for ws in self.clients
+                if ws not in index
+                and (
+                    self._is_subscribed(ws, message)
+                    or (include_unsubscribed and getattr(ws, "subscriptions", None) is None)
+                )
+            )
+        return [ws for ws in targets if ws in self.clients]
+
+    def get_client_send_stats(self) -> list[dict[str, Any]]:
+        """Per-client outbound queue depth, lag and drop counters."""
+        stats = []
+        for metadata in self.clients.values():
+            send_queue = metadata.get("send_queue")
+            if send_queue is not None:
+                stats.append({"id": metadata.get("id"), **send_queue.stats()})
+        return stats
+
+    async def broadcast(self, message: dict[str, Any], include_unsubscribed: bool = False) -> None:
+        """
+        Broadcast message to all subscribed clients.
 
-        Filters messages based on client subscriptions using _is_subscribed.
+        Recipients come from the subscription index, so the cost scales with
+        the number of interested clients. Tracked clients are handed the
+        message through their outbound queue and never block the caller.
 
         Args:
             message: Dictionary to serialize and send
+            include_unsubscribed: Also send to clients with no subscriptions
         """
         if not self.clients:
             return
 
+        targets = self._subscribers(message, include_unsubscribed)
+        if not targets:
+            return
+
         message_str = json.dumps(message)
         sent_count = 0
         failed_count = 0
 
-        for websocket in list(self.clients.keys()):
+        for websocket in targets:
+            metadata = self.clients.get(websocket)
+            send_queue = metadata.get("send_queue") if metadata else None
+            if send_queue is not None:
+                if send_queue.enqueue(message, message_str):
+                    sent_count += 1
+                else:
+                    failed_count += 1
+                continue
             try:
-                if not self._is_subscribed(websocket, message):
-                    continue
-
                 await websocket.send(message_str)
                 sent_count += 1
             except ConnectionClosed:
@@ -330,11 +391,14 @@ class BroadcastMixin:
         event: str,
         session_name: str,
         socket: str,
+        include_unsubscribed: bool = False,
     ) -> None:
         """Broadcast tmux session lifecycle event (created, killed).
 
         Bridges agent spawn/stop events to the tmux_session_event type
-        that the Terminals page subscribes to for auto-refresh.
+        that the Terminals page subscribes to for auto-refresh. Sessions
+        created or killed over the WebSocket also reach clients with no
+        subscriptions (``include_unsubscribed``).
         """
         message = {
             "type": "tmux_session_event",
@@ -343,7 +407,7 @@ class BroadcastMixin:
             "socket": socket,
             "timestamp": datetime.now(UTC).isoformat(),
         }
-        await self.broadcast(message)
+        await self.broadcast(message, include_unsubscribed=include_unsubscribed)
 
     async def broadcast_agent_message(
         self,
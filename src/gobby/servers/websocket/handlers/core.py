@@ -10,7 +10,7 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from gobby.mcp_proxy.manager import MCPClientManager
 
@@ -24,11 +24,16 @@ class HandlerMixin:
     - ``self.mcp_manager: MCPClientManager``
     - ``self.stop_registry: Any``
     - ``self.broadcast_autonomous_event(...)`` (from BroadcastMixin)
+    - ``self._sync_subscriptions(...)`` (from BroadcastMixin)
     """
 
     mcp_manager: MCPClientManager
     stop_registry: Any
 
+    if TYPE_CHECKING:
+
+        def _sync_subscriptions(self, websocket: Any) -> None: ...
+
     async def broadcast_autonomous_event(
         self, event: str, session_id: str, **kwargs: Any
     ) -> None: ...
@@ -172,6 +177,7 @@ class HandlerMixin:
             websocket.subscriptions = set()
 
         websocket.subscriptions.update(events)
+        self._sync_subscriptions(websocket)
         logger.debug(f"Client {websocket.user_id} subscribed to: {events}")
 
         await websocket.send(
@@ -204,6 +210,7 @@ class HandlerMixin:
         else:
             for event in events:
                 current_subscriptions.discard(event)
+        self._sync_subscriptions(websocket)
 
         logger.debug(f"Client {websocket.user_id} unsubscribed from: {events}")
 
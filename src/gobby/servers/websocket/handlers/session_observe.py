@@ -280,6 +280,7 @@ async def handle_attach_to_session(
         websocket.subscriptions = set()
     websocket.subscriptions.add(f"session_message:session_id={session_id}")
     websocket.subscriptions.add(f"hook_event:session_id={session.external_id}")
+    mixin._sync_subscriptions(websocket)
 
     # Track attached session on websocket metadata
     metadata = mixin.clients.get(websocket)
@@ -442,6 +443,7 @@ async def handle_detach_from_session(
     # Remove all parametric subscriptions for this session
     to_remove = {s for s in subs if session_id in s}
     subs -= to_remove
+    mixin._sync_subscriptions(websocket)
 
     # Clear attached session metadata
     metadata = mixin.clients.get(websocket)
@@ -38,3 +38,4 @@ class WebSocketConfig:
     ping_interval: int = 30  # seconds
     ping_timeout: int = 10  # seconds
     max_message_size: int = 5 * 1024 * 1024  # 5MB (increased for voice audio)
+    client_queue_size: int = 1000  # outbound messages buffered per client
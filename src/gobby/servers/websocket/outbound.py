@@ -0,0 +1,187 @@
+"""Per-client outbound queues for WebSocket broadcast.
+
+Each connected client gets a bounded queue drained by its own writer task, so
+a slow browser tab only delays itself instead of every other subscriber.
+Under backpressure, high-volume message types are shed first:
+
+- ``terminal_output`` is coalesced into the newest queued chunk for the same
+  ``run_id`` (data concatenated). A chunk with nothing to merge into is queued
+  like any other message, so no output is lost.
+- ``trace_event`` is dropped, oldest first.
+
+Other messages are always queued. A client whose queue grows past
+``HARD_LIMIT_FACTOR`` times its size is disconnected; the UI reconnects and
+refetches state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from websockets.exceptions import ConnectionClosed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLIENT_QUEUE_SIZE = 1000
+
+# Queue length (as a multiple of the soft size) at which a client is dropped
+HARD_LIMIT_FACTOR = 4
+
+# Message types that may be coalesced or dropped when a client falls behind
+SHEDDABLE_TYPES = frozenset({"terminal_output", "trace_event"})
+
+
+@dataclass(slots=True)
+class _Outbound:
+    msg_type: str | None
+    message: dict[str, Any]
+    payload: str
+    enqueued_at: float
+
+
+class ClientSendQueue:
+    """Bounded outbound queue with a dedicated writer task for one client."""
+
+    def __init__(self, websocket: Any, max_size: int = DEFAULT_CLIENT_QUEUE_SIZE) -> None:
+        self.websocket = websocket
+        self.max_size = max(1, max_size)
+        self._queue: deque[_Outbound] = deque()
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._close_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        # Stats
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    def start(self) -> None:
+        """Start the writer task on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="websocket-client-writer")
+
+    async def close(self) -> None:
+        """Stop the writer task and discard anything still queued."""
+        self._closed = True
+        self._queue.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def lag_ms(self) -> float:
+        """Age of the oldest queued message (0 when the queue is empty)."""
+        if not self._queue:
+            return 0.0
+        return (time.monotonic() - self._queue[0].enqueued_at) * 1000
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "queue_depth": len(self._queue),
+            "lag_ms": round(self.lag_ms(), 1),
+            "last_send_lag_ms": round(self.last_lag_ms, 1),
+            "max_send_lag_ms": round(self.max_lag_ms, 1),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+    def enqueue(self, message: dict[str, Any], payload: str) -> bool:
+        """Queue a serialized message. Returns False if it was shed or the client dropped."""
+        if self._closed:
+            return False
+        msg_type = message.get("type")
+        if len(self._queue) >= self.max_size and msg_type in SHEDDABLE_TYPES:
+            if msg_type == "terminal_output":
+                if self._coalesce(message):
+                    return True
+                # Nothing to merge into: queue it rather than lose output
+            elif not self._drop_oldest(msg_type):
+                self.dropped += 1
+                return False
+
+        self._queue.append(_Outbound(msg_type, message, payload, time.monotonic()))
+        self._ready.set()
+
+        if len(self._queue) > self.max_size * HARD_LIMIT_FACTOR:
+            logger.warning(
+                f"WebSocket client {getattr(self.websocket, 'user_id', '?')} is too slow "
+                f"({len(self._queue)} queued); disconnecting"
+            )
+            self._closed = True
+            self._queue.clear()
+            self._close_task = asyncio.create_task(self._close_slow_client())
+            return False
+        return True
+
+    def _coalesce(self, message: dict[str, Any]) -> bool:
+        """Append terminal output to a queued chunk for the same run, if any."""
+        run_id = message.get("run_id")
+        # The head may already be in flight; only merge into later entries
+        for i in range(len(self._queue) - 1, 0, -1):
+            entry = self._queue[i]
+            if entry.msg_type == "terminal_output" and entry.message.get("run_id") == run_id:
+                merged = {
+                    **entry.message,
+                    "data": f"{entry.message.get('data', '')}{message.get('data', '')}",
+                    "timestamp": message.get("timestamp", entry.message.get("timestamp")),
+                }
+                entry.message = merged
+                entry.payload = json.dumps(merged)
+                self.coalesced += 1
+                return True
+        return False
+
+    def _drop_oldest(self, msg_type: str) -> bool:
+        """Drop the oldest queued message of a type to make room. False if none."""
+        for i, entry in enumerate(self._queue):
+            if i and entry.msg_type == msg_type:
+                del self._queue[i]
+                self.dropped += 1
+                return True
+        return False
+
+    async def _close_slow_client(self) -> None:
+        try:
+            await self.websocket.close(code=1013, reason="Client too slow")
+        except Exception as e:
+            logger.debug(f"Error closing slow WebSocket client: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            entry = self._queue[0]
+            try:
+                await self.websocket.send(entry.payload)
+            except ConnectionClosed:
+                # Handler loop notices the disconnect and cleans up
+                self._closed = True
+                self._queue.clear()
+                return
+            except Exception as e:
+                logger.warning(f"Broadcast failed for client: {e}")
+            else:
+                self.sent += 1
+                lag = (time.monotonic() - entry.enqueued_at) * 1000
+                self.last_lag_ms = lag
+                self.max_lag_ms = max(self.max_lag_ms, lag)
+            if self._queue and self._queue[0] is entry:
+                self._queue.popleft()
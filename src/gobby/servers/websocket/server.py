@@ -164,6 +164,7 @@ class WebSocketServer(
             "connected_at": datetime.now(UTC),
             "remote_address": websocket.remote_address,
         }
+        self._track_client(websocket, self.config.client_queue_size)
 
         logger.debug(
             f"Client {user_id} ({client_id}) connected from {websocket.remote_address}. "
@@ -210,6 +211,7 @@ class WebSocketServer(
         finally:
             # Clean up tmux bridges owned by this client
             await self._cleanup_tmux_client(websocket)
+            await self._untrack_client(websocket)
             # Always cleanup client state (but NOT chat sessions — they persist)
             self.clients.pop(websocket, None)
             logger.debug(f"Client {client_id} cleaned up. Remaining clients: {len(self.clients)}")
@@ -408,6 +410,11 @@ class WebSocketServer(
                 "user_id": metadata["user_id"],
                 "connected_at": metadata["connected_at"].isoformat(),
                 "remote_address": str(metadata["remote_address"]),
+                **(
+                    {"send_queue": metadata["send_queue"].stats()}
+                    if "send_queue" in metadata
+                    else {}
+                ),
             }
             for metadata in self.clients.values()
         ]
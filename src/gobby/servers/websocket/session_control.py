@@ -28,6 +28,7 @@ class SessionControlMixin:
     - ``self._pending_modes: dict[str, str]``
     - ``self._cancel_active_chat(...)`` (from ChatMixin)
     - ``self._send_error(...)`` (from HandlerMixin)
+    - ``self._sync_subscriptions(...)`` (from BroadcastMixin)
     - ``self._create_chat_session(...)`` (from ChatMixin)
     """
 
@@ -45,6 +46,8 @@ class SessionControlMixin:
 
         async def _fire_session_end(self, conversation_id: str) -> None: ...
 
+        def _sync_subscriptions(self, websocket: Any) -> None: ...
+
         async def _send_error(
             self,
             websocket: Any,
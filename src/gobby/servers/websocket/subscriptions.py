@@ -0,0 +1,168 @@
+"""Subscription index for WebSocket broadcast.
+
+Maps message types and parametric ``type:key=value`` subscriptions to the
+clients holding them, so a broadcast only visits interested clients instead
+of re-evaluating every connection's subscriptions per message.
+
+The index mirrors each client's ``websocket.subscriptions`` set; code that
+mutates that set must call ``BroadcastMixin._sync_subscriptions`` afterwards.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# High-volume event types that require explicit subscription. Any other
+# message type goes to every client that has subscribed to anything.
+SUBSCRIBABLE_EVENT_TYPES: frozenset[str] = frozenset(
+    {
+        "hook_event",
+        "session_message",
+        "session_event",
+        "agent_event",
+        "agent_message",
+        "agent_command",
+        "worktree_event",
+        "autonomous_event",
+        "pipeline_event",
+        "terminal_output",
+        "tmux_session_event",
+        "canvas_event",
+        "skill_event",
+        "mcp_event",
+        "workflow_event",
+        "project_event",
+        "cron_event",
+        "trace_event",
+    }
+)
+
+ParamKey = tuple[str, str, str]  # (message type, field, value)
+
+
+def parse_parametric(sub: str) -> ParamKey | None:
+    """Parse ``"type:key=value"`` into its parts, or None if not parametric."""
+    if ":" not in sub:
+        return None
+    sub_type, param_str = sub.split(":", 1)
+    if "=" not in param_str:
+        return None
+    key, value = param_str.split("=", 1)
+    return sub_type, key, value
+
+
+class SubscriptionIndex:
+    """Reverse index from subscriptions to clients."""
+
+    def __init__(self) -> None:
+        # Every indexed client -> its current subscriptions (None = not subscribed)
+        self._clients: dict[Any, frozenset[str] | None] = {}
+        # Clients with any subscriptions at all (receive non-event messages)
+        self._subscribed: set[Any] = set()
+        # Clients that never subscribed (subscriptions is None)
+        self._unsubscribed: set[Any] = set()
+        self._wildcard: set[Any] = set()
+        # Plain names: message types, hook event_type names, anything else
+        self._by_name: dict[str, set[Any]] = {}
+        self._by_param: dict[ParamKey, set[Any]] = {}
+        # Message type -> fields with parametric subscriptions (and refcounts)
+        self._param_fields: dict[str, dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, client: Any) -> bool:
+        return client in self._clients
+
+    def set_subscriptions(self, client: Any, subscriptions: set[str] | None) -> None:
+        """Index (or re-index) a client with its current subscription set."""
+        new = frozenset(subscriptions) if subscriptions is not None else None
+        old = self._clients.get(client)
+        self._clients[client] = new
+        if new is None:
+            self._unsubscribed.add(client)
+        else:
+            self._unsubscribed.discard(client)
+        if old == new:
+            return
+
+        old_subs = old or frozenset()
+        new_subs = new or frozenset()
+        for sub in old_subs - new_subs:
+            self._unindex(client, sub)
+        for sub in new_subs - old_subs:
+            self._index(client, sub)
+
+        if new is None:
+            self._subscribed.discard(client)
+        else:
+            self._subscribed.add(client)
+
+    def remove(self, client: Any) -> None:
+        """Drop a client from the index."""
+        if client not in self._clients:
+            return
+        self.set_subscriptions(client, None)
+        self._unsubscribed.discard(client)
+        del self._clients[client]
+
+    def unsubscribed(self) -> set[Any]:
+        """Indexed clients whose ``subscriptions`` is None."""
+        return set(self._unsubscribed)
+
+    def match(self, message: dict[str, Any]) -> set[Any]:
+        """Clients that should receive a message (same rules as ``_is_subscribed``)."""
+        msg_type = message.get("type")
+        if msg_type not in SUBSCRIBABLE_EVENT_TYPES:
+            return set(self._subscribed)
+
+        targets = set(self._wildcard)
+        targets.update(self._by_name.get(msg_type, ()))
+        for field in self._param_fields.get(msg_type, ()):
+            value = message.get(field)
+            if isinstance(value, str):
+                targets.update(self._by_param.get((msg_type, field, value), ()))
+        if msg_type == "hook_event":
+            event_type = message.get("event_type")
+            if isinstance(event_type, str):
+                targets.update(self._by_name.get(event_type, ()))
+        return targets
+
+    def _index(self, client: Any, sub: str) -> None:
+        if sub == "*":
+            self._wildcard.add(client)
+            return
+        param = parse_parametric(sub)
+        if param is None:
+            self._by_name.setdefault(sub, set()).add(client)
+            return
+        self._by_param.setdefault(param, set()).add(client)
+        fields = self._param_fields.setdefault(param[0], {})
+        fields[param[1]] = fields.get(param[1], 0) + 1
+
+    def _unindex(self, client: Any, sub: str) -> None:
+        if sub == "*":
+            self._wildcard.discard(client)
+            return
+        param = parse_parametric(sub)
+        if param is None:
+            _discard(self._by_name, sub, client)
+            return
+        _discard(self._by_param, param, client)
+        fields = self._param_fields.get(param[0], {})
+        remaining = fields.get(param[1], 0) - 1
+        if remaining > 0:
+            fields[param[1]] = remaining
+        else:
+            fields.pop(param[1], None)
+            if not fields:
+                self._param_fields.pop(param[0], None)
+
+
+def _discard(index: dict[Any, set[Any]], key: Any, client: Any) -> None:
+    clients = index.get(key)
+    if clients is None:
+        return
+    clients.discard(client)
+    if not clients:
+        del index[key]
@@ -30,6 +30,8 @@ class TmuxMixin:
     Requires on the host class:
     - ``self.clients: dict[Any, dict[str, Any]]``
     - ``async self.broadcast_terminal_output(run_id, data)`` (from BroadcastMixin)
+    - ``async self.broadcast_tmux_session_event(event, session_name, socket, ...)``
+      (from BroadcastMixin)
     - ``async self._send_error(websocket, message, ...)`` (from HandlerMixin)
     """
 
@@ -40,6 +42,9 @@ class TmuxMixin:
     if TYPE_CHECKING:
 
         async def broadcast_terminal_output(self, run_id: str, data: str) -> None: ...
+        async def broadcast_tmux_session_event(
+            self, event: str, session_name: str, socket: str, include_unsubscribed: bool = False
+        ) -> None: ...
         async def _send_error(
             self, websocket: Any, message: str, request_id: str | None = None, code: str = "ERROR"
         ) -> None: ...
@@ -353,7 +358,9 @@ class TmuxMixin:
             )
 
             # Broadcast session event
-            await self._broadcast_tmux_event("session_created", info.name, socket)
+            await self.broadcast_tmux_session_event(
+                "session_created", info.name, socket, include_unsubscribed=True
+            )
 
             response: dict[str, Any] = {
                 "type": "tmux_create_result",
@@ -417,7 +424,9 @@ class TmuxMixin:
         try:
             success = await mgr.kill_session(session_name)
             if success:
-                await self._broadcast_tmux_event("session_killed", session_name, socket)
+                await self.broadcast_tmux_session_event(
+                    "session_killed", session_name, socket, include_unsubscribed=True
+                )
 
             response: dict[str, Any] = {
                 "type": "tmux_kill_result",
@@ -486,38 +495,3 @@ class TmuxMixin:
             await asyncio.wait_for(proc.wait(), timeout=5.0)
         except Exception as e:
             logger.debug(f"Failed to refresh tmux session: {e}")
-
-    # ------------------------------------------------------------------
-    # Broadcast helpers
-    # ------------------------------------------------------------------
-
-    async def _broadcast_tmux_event(self, event: str, session_name: str, socket: str) -> None:
-        """Broadcast a tmux session lifecycle event to subscribed clients."""
-        if not self.clients:
-            return
-
-        from datetime import UTC, datetime
-
-        from websockets.exceptions import ConnectionClosed
-
-        message = json.dumps(
-            {
-                "type": "tmux_session_event",
-                "event": event,
-                "session_name": session_name,
-                "socket": socket,
-                "timestamp": datetime.now(UTC).isoformat(),
-            }
-        )
-
-        for ws in list(self.clients.keys()):
-            try:
-                subs = getattr(ws, "subscriptions", None)
-                if subs is not None:
-                    if "tmux_session_event" not in subs and "*" not in subs:
-                        continue
-                await ws.send(message)
-            except ConnectionClosed:
-                pass
-            except Exception as e:
-                logger.warning(f"Tmux event broadcast failed: {e}")
@@ -347,6 +347,7 @@ class SessionLifecycleManager:
                         session.external_id,
                         session.transcript_path,
                         archive_dir,
+                        session.source,
                     )
                     if archive_path:
                         logger.debug(
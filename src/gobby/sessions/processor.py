@@ -7,6 +7,9 @@ Tracks file offsets and updates the database with new messages.
 Supports two transcript formats:
 - JSONL: Incremental line-by-line processing with byte offset tracking (Claude, Codex)
 - JSON: Full-file parsing with mtime-based change detection (Gemini native session files)
+
+Claude/Codex transcripts also get their offset index (see transcript_index)
+extended as lines are processed, so paged reads of live sessions can seek.
 """
 
 import asyncio
@@ -21,6 +24,8 @@ if TYPE_CHECKING:
     from gobby.servers.websocket.server import WebSocketServer
     from gobby.storage.sessions import LocalSessionManager
 
+from gobby.sessions.transcript_archive import get_index_dir
+from gobby.sessions.transcript_index import TranscriptIndex, load_index, save_index
 from gobby.sessions.transcript_renderer import RenderState, render_incremental
 from gobby.sessions.transcripts import get_parser
 from gobby.sessions.transcripts.base import TranscriptParser
@@ -29,6 +34,9 @@ from gobby.storage.database import DatabaseProtocol
 
 logger = logging.getLogger(__name__)
 
+# Lines parsed per call when maintaining a transcript index (checkpoint granularity)
+_INDEX_RUN_LINES = 64
+
 
 class SessionMessageProcessor:
     """
@@ -46,11 +54,13 @@ class SessionMessageProcessor:
         poll_interval: float = 2.0,
         websocket_server: "WebSocketServer | None" = None,
         session_manager: "LocalSessionManager | None" = None,
+        archive_dir: str | None = None,
     ):
         self.db = db
         self.poll_interval = poll_interval
         self.websocket_server: WebSocketServer | None = websocket_server
         self.session_manager: LocalSessionManager | None = session_manager
+        self.archive_dir = archive_dir
 
         # Track active sessions: session_id -> transcript_path
         self._active_sessions: dict[str, str] = {}
@@ -65,6 +75,9 @@ class SessionMessageProcessor:
         self._byte_offsets: dict[str, int] = {}
         self._message_indices: dict[str, int] = {}
 
+        # Transcript offset indexes for JSONL sessions with seekable parsers
+        self._indexes: dict[str, TranscriptIndex] = {}
+
         # Track render state for incremental rendering per session
         self._render_states: dict[str, RenderState] = {}
 
@@ -139,7 +152,10 @@ class SessionMessageProcessor:
             return
 
         self._active_sessions[session_id] = transcript_path
-        self._parsers[session_id] = get_parser(source, session_id=session_id)
+        parser = get_parser(source, session_id=session_id)
+        self._parsers[session_id] = parser
+        if not transcript_path.endswith(".json") and not isinstance(parser, GeminiTranscriptParser):
+            self._indexes[session_id] = load_index(transcript_path, get_index_dir(self.archive_dir))
         logger.debug(f"Registered session {session_id} for processing ({source})")
 
     async def flush_session(self, session_id: str) -> None:
@@ -162,6 +178,9 @@ class SessionMessageProcessor:
             self._stats.pop(session_id, None)
             self._byte_offsets.pop(session_id, None)
             self._message_indices.pop(session_id, None)
+            index = self._indexes.pop(session_id, None)
+            if index is not None and index.dirty:
+                save_index(index, get_index_dir(self.archive_dir))
             logger.debug(f"Unregistered session {session_id}")
         # Always clean render state (may exist even if session wasn't fully registered)
         self._render_states.pop(session_id, None)
@@ -206,27 +225,23 @@ class SessionMessageProcessor:
         last_offset = self._byte_offsets.get(session_id, 0)
         last_index = self._message_indices.get(session_id, -1)
 
-        # Read new content
-        new_lines = []
+        # Read new content as (byte offset, raw line) pairs
+        new_lines: list[tuple[int, bytes]] = []
         valid_offset = last_offset
 
         try:
             # Note: synchronous file I/O for simplicity; could use aiofiles if blocking is an issue
             # but reading incremental logs is usually fast.
-            with open(transcript_path, encoding="utf-8") as f:
+            with open(transcript_path, "rb") as f:
                 # Seek to last known position
                 f.seek(last_offset)
 
                 # Read line by line
-                while True:
-                    line = f.readline()
-                    if not line:
-                        break
-
+                for raw in f:
                     # Only process complete lines
-                    if line.endswith("\n"):
-                        new_lines.append(line)
-                        valid_offset = f.tell()
+                    if raw.endswith(b"\n"):
+                        new_lines.append((valid_offset, raw))
+                        valid_offset += len(raw)
                     else:
                         # Incomplete line (write in progress), stop reading
                         break
@@ -243,7 +258,23 @@ class SessionMessageProcessor:
         if not parser:
             return
 
-        parsed_messages = parser.parse_lines(new_lines, start_index=last_index + 1)
+        lines = [raw.decode("utf-8", errors="replace") for _, raw in new_lines]
+        index = self._indexes.get(session_id)
+        if index is None:
+            parsed_messages = parser.parse_lines(lines, start_index=last_index + 1)
+        else:
+            # Parse in short runs so the index can checkpoint between them
+            parsed_messages = []
+            for start in range(0, len(new_lines), _INDEX_RUN_LINES):
+                run = new_lines[start : start + _INDEX_RUN_LINES]
+                messages = parser.parse_lines(
+                    lines[start : start + _INDEX_RUN_LINES],
+                    start_index=last_index + 1 + len(parsed_messages),
+                )
+                index.add_lines(run[0][0], [raw for _, raw in run], len(messages))
+                parsed_messages.extend(messages)
+            if index.dirty:
+                save_index(index, get_index_dir(self.archive_dir))
 
         if not parsed_messages:
             # We read lines but found no valid messages — still update offset
@@ -255,8 +286,7 @@ class SessionMessageProcessor:
 
         # Write stats to sessions table
         if self.session_manager:
-            self.session_manager.touch(session_id)
-            self.session_manager.update_stats(
+            self.session_manager.record_transcript_stats(
                 session_id,
                 message_count=stats.get("message_count", 0),
                 turn_count=stats.get("turn_count", 0),
@@ -356,8 +386,7 @@ class SessionMessageProcessor:
 
         # Write stats and keep session alive
         if self.session_manager:
-            self.session_manager.touch(session_id)
-            self.session_manager.update_stats(
+            self.session_manager.record_transcript_stats(
                 session_id,
                 message_count=stats.get("message_count", 0),
                 turn_count=stats.get("turn_count", 0),
@@ -5,17 +5,49 @@ restored if the original file is deleted (e.g. Claude CLI cleanup).
 
 Archive path is deterministic from external_id:
     {archive_dir}/{external_id}.jsonl.gz
+
+Archives are written as a series of independently compressed gzip members of
+roughly ``ARCHIVE_CHUNK_BYTES`` of whole lines each. Standard gzip readers see
+one stream; a chunk table sidecar ({external_id}.jsonl.gz.idx) records where
+each member starts, plus the transcript's checkpoint index, so a page of an
+archived transcript is one seek and one member's decompression.
 """
 
 import gzip
+import io
+import json
 import logging
+import os
 import shutil
+import threading
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Generator, Hashable
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+from gobby.sessions.transcript_index import (
+    TranscriptIndex,
+    load_index,
+    parse_line,
+    supports_index,
+)
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_ARCHIVE_DIR = "~/.gobby/session_transcripts"
 
+# Uncompressed bytes per gzip member in an archive
+ARCHIVE_CHUNK_BYTES = 1024 * 1024
+
+# Upper bound on decompressed archive data held in memory
+ARCHIVE_CACHE_BYTES = 64 * 1024 * 1024
+
+_CHUNK_TABLE_VERSION = 1
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
 
 def get_archive_dir(override: str | None = None) -> Path:
     """Resolve and create the transcript archive directory.
@@ -31,41 +63,209 @@ def get_archive_dir(override: str | None = None) -> Path:
     return dir_path
 
 
+def get_index_dir(archive_dir: str | None = None) -> Path:
+    """Directory holding offset indexes for live transcripts (created on first save)."""
+    return Path(archive_dir or _DEFAULT_ARCHIVE_DIR).expanduser() / "index"
+
+
+class ArchiveCache:
+    """Thread-safe LRU of decompressed archive data, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int = ARCHIVE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """Cache ``value``; entries larger than the whole budget are not kept."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+archive_cache = ArchiveCache()
+
+
+@dataclass
+class ArchiveChunkTable:
+    """Chunk layout and checkpoint index of a chunked archive.
+
+    Each chunk is ``(compressed_offset, compressed_len, raw_offset, raw_len)``.
+    """
+
+    archive_path: str
+    archive_bytes: int
+    mtime_ns: int
+    chunks: list[tuple[int, int, int, int]]
+    index: TranscriptIndex
+
+    def iter_lines(self, raw_offset: int = 0) -> Generator[bytes]:
+        """Yield archived lines starting at a line-start ``raw_offset``."""
+        raw_starts = [chunk[2] for chunk in self.chunks]
+        first = max(bisect_right(raw_starts, raw_offset) - 1, 0)
+        with open(self.archive_path, "rb") as f:
+            for number in range(first, len(self.chunks)):
+                data = self._read_chunk(f, number)
+                start = raw_offset - self.chunks[number][2] if number == first else 0
+                yield from io.BytesIO(data[start:] if start > 0 else data)
+
+    def _read_chunk(self, f: io.BufferedReader, number: int) -> bytes:
+        key = (self.archive_path, self.mtime_ns, self.archive_bytes, number)
+        data = archive_cache.get(key)
+        if data is None:
+            comp_offset, comp_len, _, _ = self.chunks[number]
+            f.seek(comp_offset)
+            data = zlib.decompress(f.read(comp_len), wbits=_GZIP_WBITS)
+            archive_cache.put(key, data, len(data))
+        return data
+
+
+def chunk_table_path(archive_path: Path | str) -> Path:
+    """Path of the chunk table sidecar for an archive."""
+    return Path(f"{archive_path}.idx")
+
+
+def load_chunk_table(archive_path: Path | str) -> ArchiveChunkTable | None:
+    """Load an archive's chunk table; None for legacy or mismatched archives."""
+    try:
+        stat = os.stat(archive_path)
+        data = json.loads(chunk_table_path(archive_path).read_text())
+        if data.get("version") != _CHUNK_TABLE_VERSION or data["archive_bytes"] != stat.st_size:
+            return None
+        return ArchiveChunkTable(
+            archive_path=str(archive_path),
+            archive_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            chunks=[tuple(chunk) for chunk in data["chunks"]],  # type: ignore[misc]
+            index=TranscriptIndex.from_dict(data["index"]),
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable chunk table for {archive_path}: {e}")
+        return None
+
+
+def _write_chunked(
+    source: Path,
+    dest: Path,
+    index: TranscriptIndex,
+    parser: Any | None,
+) -> tuple[list[list[int]], int]:
+    """Copy ``source`` into ``dest`` as gzip members, extending ``index`` as lines pass."""
+    chunks: list[list[int]] = []
+    buffer: list[bytes] = []
+    buffered = 0
+    raw_offset = 0
+    comp_offset = 0
+
+    def flush(f_out: io.BufferedWriter) -> None:
+        nonlocal buffer, buffered, comp_offset
+        data = b"".join(buffer)
+        compressed = gzip.compress(data, mtime=0)
+        f_out.write(compressed)
+        chunks.append([comp_offset, len(compressed), raw_offset - len(data), len(data)])
+        comp_offset += len(compressed)
+        buffer, buffered = [], 0
+
+    with open(source, "rb") as f_in, open(dest, "wb") as f_out:
+        for line in f_in:
+            if raw_offset >= index.indexed_bytes:
+                count = len(parse_line(parser, line, index.message_count)) if parser else 0
+                index.add_lines(raw_offset, [line], count)
+            buffer.append(line)
+            buffered += len(line)
+            raw_offset += len(line)
+            if buffered >= ARCHIVE_CHUNK_BYTES:
+                flush(f_out)
+        if buffer:
+            flush(f_out)
+    return chunks, comp_offset
+
+
 def backup_transcript(
     external_id: str,
     transcript_path: str,
     archive_dir: str | None = None,
+    source: str | None = "claude",
 ) -> str | None:
     """Gzip-compress a JSONL transcript to the archive directory.
 
+    The live transcript's offset index is reused when present, so only lines
+    appended since the session processor last indexed it are parsed.
+
     Args:
         external_id: Session external ID (used as archive filename).
         transcript_path: Path to the source JSONL file.
         archive_dir: Override for archive directory.
+        source: CLI source of the transcript (selects the parser for indexing).
 
     Returns:
         Archive file path on success, None on failure.
     """
-    source = Path(transcript_path)
-    if not source.is_file():
+    source_path = Path(transcript_path)
+    if not source_path.is_file():
         logger.debug(f"Transcript source not found, skipping backup: {transcript_path}")
         return None
 
     dest_dir = get_archive_dir(archive_dir)
     dest = dest_dir / f"{external_id}.jsonl.gz"
+    table_path = chunk_table_path(dest)
 
     try:
-        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
-            shutil.copyfileobj(f_in, f_out)
-        logger.debug(f"Backed up transcript {transcript_path} -> {dest}")
+        table_path.unlink(missing_ok=True)
+        parser = None
+        if supports_index(source):
+            from gobby.sessions.transcripts import get_parser
+
+            parser = get_parser(source or "claude", session_id=external_id)
+            index = load_index(transcript_path, dest_dir / "index")
+        else:
+            index = TranscriptIndex(path=transcript_path)
+        chunks, archive_bytes = _write_chunked(source_path, dest, index, parser)
+        table = {
+            "version": _CHUNK_TABLE_VERSION,
+            "archive_bytes": archive_bytes,
+            "chunks": chunks,
+            "index": index.to_dict(),
+        }
+        table_path.write_text(json.dumps(table))
+        logger.debug(f"Backed up transcript {transcript_path} -> {dest} ({len(chunks)} chunks)")
         return str(dest)
     except Exception as e:
         logger.warning(f"Failed to backup transcript {transcript_path}: {e}")
-        # Clean up partial file
-        try:
-            dest.unlink(missing_ok=True)
-        except OSError:
-            pass
+        # Clean up partial files
+        for path in (dest, table_path):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
         return None
 
 
@@ -0,0 +1,244 @@
+"""Sparse byte-offset index for JSONL transcripts.
+
+Transcripts are append-only JSONL, so a page of messages can be read by
+seeking to a known line start instead of parsing the whole file. The index
+records a checkpoint ``(byte_offset, message_index)`` every
+``CHECKPOINT_INTERVAL`` messages; a page read seeks to the last checkpoint at
+or before the requested offset and parses forward until the page is full.
+
+The same offsets describe a chunked archive (see transcript_archive), because
+an archive is a byte-identical copy of the transcript.
+
+Only parsers whose message indices are a running count over stateless lines
+(Claude, Codex) can be read from the middle of a file; Gemini transcripts keep
+parser state across lines and are always read whole.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gobby.sessions.transcripts.base import ParsedMessage, TranscriptParser
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1
+
+# Messages between checkpoints: bounds the parse work before a page starts
+CHECKPOINT_INTERVAL = 256
+
+# Transcripts smaller than this are cheap to read whole; don't persist an index
+MIN_PERSISTED_BYTES = 1024 * 1024
+
+
+def supports_index(source: str | None) -> bool:
+    """Whether transcripts from a CLI source can be read from a checkpoint."""
+    return source != "gemini"
+
+
+def _hash_line(line: bytes) -> str:
+    return hashlib.sha1(line, usedforsecurity=False).hexdigest()
+
+
+@dataclass
+class TranscriptIndex:
+    """Checkpointed line offsets for one append-only JSONL transcript.
+
+    ``line_count`` counts non-empty complete lines (the historical
+    ``count_messages`` semantics); ``message_count`` counts parsed messages.
+    """
+
+    path: str
+    first_line_hash: str | None = None
+    indexed_bytes: int = 0
+    line_count: int = 0
+    message_count: int = 0
+    checkpoints: list[tuple[int, int]] = field(default_factory=list)
+    _saved_checkpoints: int = field(default=0, repr=False, compare=False)
+
+    @property
+    def dirty(self) -> bool:
+        """True when checkpoints were added since the last save/load."""
+        return len(self.checkpoints) != self._saved_checkpoints
+
+    def add_lines(self, offset: int, lines: list[bytes], message_count: int) -> None:
+        """Record a run of complete lines starting at ``offset``.
+
+        ``message_count`` is the number of messages the run parsed to; a
+        checkpoint can only land on the run's first line. Runs starting before
+        ``indexed_bytes`` are already indexed and ignored, so callers can replay
+        a transcript from the start against a loaded index.
+        """
+        if offset != self.indexed_bytes or not lines:
+            return
+        if offset == 0:
+            self.first_line_hash = _hash_line(lines[0])
+        if message_count and (
+            not self.checkpoints
+            or self.message_count - self.checkpoints[-1][1] >= CHECKPOINT_INTERVAL
+        ):
+            self.checkpoints.append((offset, self.message_count))
+        self.indexed_bytes = offset + sum(len(line) for line in lines)
+        self.message_count += message_count
+        self.line_count += sum(1 for line in lines if line.strip())
+
+    def locate(self, message_index: int) -> tuple[int, int]:
+        """Return ``(byte_offset, first_message_index)`` to start reading at.
+
+        The returned checkpoint is the last one at or before ``message_index``.
+        """
+        pos = bisect_right(self.checkpoints, message_index, key=lambda cp: cp[1])
+        if pos == 0:
+            return 0, 0
+        return self.checkpoints[pos - 1]
+
+    def extend(self, parser: TranscriptParser) -> bool:
+        """Index complete lines appended to the transcript since the last call.
+
+        Returns:
+            True if anything new was indexed.
+        """
+        before = self.indexed_bytes
+        with open(self.path, "rb") as f:
+            f.seek(self.indexed_bytes)
+            offset = self.indexed_bytes
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self.add_lines(offset, [line], len(parse_line(parser, line, self.message_count)))
+                offset += len(line)
+        return self.indexed_bytes != before
+
+    def is_valid(self) -> bool:
+        """Check the transcript still starts with the indexed first line."""
+        if not self.indexed_bytes:
+            return True
+        try:
+            if os.path.getsize(self.path) < self.indexed_bytes:
+                return False
+            with open(self.path, "rb") as f:
+                return _hash_line(f.readline()) == self.first_line_hash
+        except OSError:
+            return False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _FORMAT_VERSION,
+            "path": self.path,
+            "first_line_hash": self.first_line_hash,
+            "indexed_bytes": self.indexed_bytes,
+            "line_count": self.line_count,
+            "message_count": self.message_count,
+            "checkpoints": self.checkpoints,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TranscriptIndex:
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported transcript index version: {data.get('version')}")
+        checkpoints = [(int(o), int(m)) for o, m in data["checkpoints"]]
+        return cls(
+            path=data["path"],
+            first_line_hash=data["first_line_hash"],
+            indexed_bytes=data["indexed_bytes"],
+            line_count=data["line_count"],
+            message_count=data["message_count"],
+            checkpoints=checkpoints,
+            _saved_checkpoints=len(checkpoints),
+        )
+
+
+def parse_line(
+    parser: TranscriptParser, line: bytes | str, start_index: int
+) -> list[ParsedMessage]:
+    """Parse a single transcript line with message indices from ``start_index``."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
+    return parser.parse_lines([line], start_index=start_index)
+
+
+def _sidecar_path(index_dir: Path, transcript_path: str) -> Path:
+    digest = hashlib.sha1(
+        os.path.abspath(transcript_path).encode(), usedforsecurity=False
+    ).hexdigest()
+    return index_dir / f"{digest[:24]}.json"
+
+
+def load_index(transcript_path: str, index_dir: Path) -> TranscriptIndex:
+    """Load the persisted index for a live transcript, or start a fresh one.
+
+    A stale index (transcript truncated or replaced) is discarded.
+    """
+    sidecar = _sidecar_path(index_dir, transcript_path)
+    try:
+        index = TranscriptIndex.from_dict(json.loads(sidecar.read_text()))
+    except FileNotFoundError:
+        return TranscriptIndex(path=transcript_path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable transcript index {sidecar}: {e}")
+        return TranscriptIndex(path=transcript_path)
+    if index.path != transcript_path or not index.is_valid():
+        return TranscriptIndex(path=transcript_path)
+    return index
+
+
+def save_index(index: TranscriptIndex, index_dir: Path) -> None:
+    """Persist a live transcript's index, once the transcript is big enough to need it."""
+    if index.indexed_bytes < MIN_PERSISTED_BYTES:
+        return
+    sidecar = _sidecar_path(index_dir, index.path)
+    tmp = sidecar.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        index_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(index.to_dict()))
+        os.replace(tmp, sidecar)
+        index._saved_checkpoints = len(index.checkpoints)
+    except OSError as e:
+        logger.debug(f"Failed to save transcript index {sidecar}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def read_page(
+    lines: Iterable[bytes | str],
+    parser: TranscriptParser,
+    start_index: int,
+    skip: int,
+    limit: int,
+    role: str | None = None,
+) -> list[ParsedMessage]:
+    """Parse lines until ``limit`` matching messages follow ``skip`` matching ones.
+
+    Args:
+        lines: Transcript lines beginning at the message ``start_index``.
+        parser: Parser for the transcript's source.
+        start_index: Index of the first message in ``lines``.
+        skip: Matching messages to discard before the page starts.
+        limit: Page size.
+        role: Only count and return messages with this role.
+    """
+    page: list[ParsedMessage] = []
+    if limit <= 0:
+        return page
+    next_index = start_index
+    for line in lines:
+        messages = parse_line(parser, line, next_index)
+        next_index += len(messages)
+        for msg in messages:
+            if role and msg.role != role:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            page.append(msg)
+            if len(page) >= limit:
+                return page
+    return page
@@ -3,20 +3,38 @@
 Reads from the live transcript file on disk (active/paused sessions).
 Supports both JSONL (Claude, Codex) and native JSON (Gemini) formats.
 If no transcript exists (cleaned up after expiry), falls back to the gzip archive.
+
+Message pages of large Claude/Codex transcripts are read by seeking to the
+nearest checkpoint of the transcript's offset index (see transcript_index), and
+pages of chunked archives decompress only the gzip members they span.
 """
 
 from __future__ import annotations
 
 import asyncio
-import functools
 import gzip
 import json
 import logging
 import os
 import zlib
+from contextlib import closing
 from typing import TYPE_CHECKING, Any
 
-from gobby.sessions.transcript_archive import get_archive_dir
+from gobby.sessions.transcript_archive import (
+    ArchiveChunkTable,
+    archive_cache,
+    get_archive_dir,
+    get_index_dir,
+    load_chunk_table,
+)
+from gobby.sessions.transcript_index import (
+    MIN_PERSISTED_BYTES,
+    TranscriptIndex,
+    load_index,
+    read_page,
+    save_index,
+    supports_index,
+)
 
 if TYPE_CHECKING:
     from gobby.sessions.transcript_renderer import RenderedMessage
@@ -32,24 +50,30 @@ from gobby.sessions.transcript_renderer import render_transcript
 
 logger = logging.getLogger(__name__)
 
-# LRU-cached decompression to avoid repeated gzip reads within a session
-_ARCHIVE_CACHE_SIZE = 32
-
 
-@functools.lru_cache(maxsize=_ARCHIVE_CACHE_SIZE)
 def _decompress_archive(archive_path: str) -> list[str]:
     """Decompress a gzip archive and return lines.
 
-    Cached so repeated reads of the same archive don't re-decompress.
-    Handles truncated archives gracefully by returning what was read.
+    Cached in the byte-bounded archive cache so repeated reads of the same
+    archive don't re-decompress. Handles truncated archives gracefully by
+    returning what was read.
     """
+    stat = os.stat(archive_path)
+    key = (archive_path, stat.st_mtime_ns, stat.st_size, None)
+    cached: list[str] | None = archive_cache.get(key)
+    if cached is not None:
+        return cached
+
     lines = []
+    size = 0
     try:
         with gzip.open(archive_path, "rt", encoding="utf-8") as f:
             for line in f:
                 lines.append(line)
+                size += len(line)
     except (EOFError, gzip.BadGzipFile, zlib.error) as e:
         logger.warning(f"Truncated or malformed gzip archive {archive_path}: {e}")
+    archive_cache.put(key, lines, size)
     return lines
 
 
@@ -129,6 +153,14 @@ def _is_json_session_file(path: str) -> bool:
     return path.endswith(".json")
 
 
+def _page_to_dicts(parsed: list[ParsedMessage], session_id: str) -> list[dict[str, Any]]:
+    """Convert one page of ParsedMessages to dicts tagged with the session ID."""
+    messages = _parsed_to_dicts(parsed)
+    for msg in messages:
+        msg["session_id"] = session_id
+    return messages
+
+
 class TranscriptReader:
     """Unified read layer: live transcript first, gzip archive fallback.
 
@@ -226,14 +258,21 @@ class TranscriptReader:
             return 0
 
         transcript_path = getattr(session, "transcript_path", None)
+        source = session.source or "claude"
         if transcript_path and os.path.isfile(transcript_path):
             try:
                 if _is_json_session_file(transcript_path):
                     # JSON session file: parse to count messages
                     data = await asyncio.to_thread(self._read_json_file, transcript_path)
-                    source = session.source or "claude"
                     parsed = _parse_json_session(data, source, session_id=session_id)
                     return len(parsed)
+                elif (
+                    supports_index(source)
+                    and os.path.getsize(transcript_path) >= MIN_PERSISTED_BYTES
+                ):
+                    return await asyncio.to_thread(
+                        self._count_indexed_lines, transcript_path, source, session_id
+                    )
                 else:
                     lines = await asyncio.to_thread(self._read_jsonl_lines, transcript_path)
                     return sum(1 for line in lines if line.strip())
@@ -247,6 +286,9 @@ class TranscriptReader:
             archive_dir = get_archive_dir(self._archive_dir)
             archive_path = archive_dir / f"{session.external_id}.jsonl.gz"
             if archive_path.is_file():
+                table = await asyncio.to_thread(load_chunk_table, archive_path)
+                if table is not None:
+                    return table.index.line_count
                 lines = await asyncio.to_thread(_decompress_archive, str(archive_path))
                 return sum(1 for line in lines if line.strip())
 
@@ -320,6 +362,12 @@ class TranscriptReader:
         source = session.source or "claude"
 
         try:
+            table = await asyncio.to_thread(load_chunk_table, archive_path)
+            if table is not None and supports_index(source):
+                parsed = await asyncio.to_thread(
+                    self._read_archive_page, table, source, session_id, limit, offset, role
+                )
+                return _page_to_dicts(parsed, session_id)
             lines = await asyncio.to_thread(_decompress_archive, str(archive_path))
             all_messages = _parse_lines_to_dicts(lines, source, session_id=session_id)
         except Exception as e:
@@ -363,6 +411,11 @@ class TranscriptReader:
                 data = await asyncio.to_thread(self._read_json_file, transcript_path)
                 parsed = _parse_json_session(data, source, session_id=session_id)
                 all_messages = _parsed_to_dicts(parsed)
+            elif supports_index(source):
+                parsed = await asyncio.to_thread(
+                    self._read_file_page, transcript_path, source, session_id, limit, offset, role
+                )
+                return _page_to_dicts(parsed, session_id)
             else:
                 lines = await asyncio.to_thread(self._read_jsonl_lines, transcript_path)
                 all_messages = _parse_lines_to_dicts(lines, source, session_id=session_id)
@@ -381,6 +434,60 @@ class TranscriptReader:
         # Apply pagination
         return all_messages[offset : offset + limit]
 
+    def _live_index(self, path: str, parser: TranscriptParser) -> TranscriptIndex:
+        """Load a live transcript's offset index and index any new lines. Runs in a thread."""
+        index_dir = get_index_dir(self._archive_dir)
+        index = load_index(path, index_dir)
+        index.extend(parser)
+        if index.dirty:
+            save_index(index, index_dir)
+        return index
+
+    def _read_file_page(
+        self,
+        path: str,
+        source: str,
+        session_id: str,
+        limit: int,
+        offset: int,
+        role: str | None,
+    ) -> list[ParsedMessage]:
+        """Read one page of a JSONL transcript. Runs in a thread.
+
+        Unfiltered pages of large transcripts start at the nearest indexed
+        checkpoint; otherwise the file is streamed from the start. Either way
+        reading stops as soon as the page is full.
+        """
+        parser = _get_parser(source, session_id=session_id)
+        start, start_index = 0, 0
+        if not role and os.path.getsize(path) >= MIN_PERSISTED_BYTES:
+            start, start_index = self._live_index(path, parser).locate(offset)
+        with open(path, "rb") as f:
+            f.seek(start)
+            return read_page(f, parser, start_index, offset - start_index, limit, role)
+
+    def _count_indexed_lines(self, path: str, source: str, session_id: str) -> int:
+        """Count non-empty lines of a large JSONL transcript via its index. Runs in a thread."""
+        index = self._live_index(path, _get_parser(source, session_id=session_id))
+        with open(path, "rb") as f:
+            f.seek(index.indexed_bytes)
+            return index.line_count + sum(1 for line in f if line.strip())
+
+    @staticmethod
+    def _read_archive_page(
+        table: ArchiveChunkTable,
+        source: str,
+        session_id: str,
+        limit: int,
+        offset: int,
+        role: str | None,
+    ) -> list[ParsedMessage]:
+        """Read one page of a chunked archive. Runs in a thread."""
+        parser = _get_parser(source, session_id=session_id)
+        start, start_index = (0, 0) if role else table.index.locate(offset)
+        with closing(table.iter_lines(start)) as lines:
+            return read_page(lines, parser, start_index, offset - start_index, limit, role)
+
     @staticmethod
     def _read_jsonl_lines(path: str) -> list[str]:
         """Read lines from a JSONL file. Runs in a thread."""
@@ -396,8 +503,9 @@ class TranscriptReader:
 
 
 def clear_archive_cache() -> None:
-    """Clear the LRU cache for decompressed archives.
+    """Clear the cache of decompressed archive data.
 
-    Useful after writing new archives to ensure fresh reads.
+    Entries are keyed by archive mtime and size, so rewritten archives are
+    never served stale; this only releases memory (and isolates tests).
     """
-    _decompress_archive.cache_clear()
+    archive_cache.clear()
@@ -1,14 +1,34 @@
-"""Local storage layer for Gobby daemon."""
+"""Local storage layer for Gobby daemon.
 
-from gobby.storage.communications import LocalCommunicationsStore
-from gobby.storage.database import LocalDatabase
-from gobby.storage.inter_session_messages import InterSessionMessageManager
-from gobby.storage.mcp import LocalMCPManager
-from gobby.storage.migrations import run_migrations
-from gobby.storage.projects import LocalProjectManager
-from gobby.storage.sessions import LocalSessionManager
-from gobby.storage.task_dependencies import TaskDependencyManager
-from gobby.storage.tasks import LocalTaskManager
+Exports are imported on first access so that importing one storage module
+(e.g. ``gobby.storage.database``) doesn't load every manager.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gobby.storage.communications import LocalCommunicationsStore
+    from gobby.storage.database import LocalDatabase
+    from gobby.storage.inter_session_messages import InterSessionMessageManager
+    from gobby.storage.mcp import LocalMCPManager
+    from gobby.storage.migrations import run_migrations
+    from gobby.storage.projects import LocalProjectManager
+    from gobby.storage.sessions import LocalSessionManager
+    from gobby.storage.task_dependencies import TaskDependencyManager
+    from gobby.storage.tasks import LocalTaskManager
+
+_EXPORTS = {
+    "InterSessionMessageManager": "gobby.storage.inter_session_messages",
+    "LocalCommunicationsStore": "gobby.storage.communications",
+    "LocalDatabase": "gobby.storage.database",
+    "LocalMCPManager": "gobby.storage.mcp",
+    "LocalProjectManager": "gobby.storage.projects",
+    "LocalSessionManager": "gobby.storage.sessions",
+    "LocalTaskManager": "gobby.storage.tasks",
+    "TaskDependencyManager": "gobby.storage.task_dependencies",
+    "run_migrations": "gobby.storage.migrations",
+}
 
 __all__ = [
     "InterSessionMessageManager",
@@ -21,3 +41,13 @@ __all__ = [
     "TaskDependencyManager",
     "run_migrations",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of the package exports."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
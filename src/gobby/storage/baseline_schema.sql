@@ -415,11 +415,20 @@ CREATE TABLE memories (
     media TEXT,
     graph_processed INTEGER DEFAULT 1,
     created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL
+    updated_at TEXT NOT NULL,
+    content_hash TEXT
 );
 CREATE INDEX idx_memories_project ON memories(project_id);
 CREATE INDEX idx_memories_type ON memories(memory_type);
 CREATE INDEX idx_memories_graph_pending ON memories(graph_processed) WHERE graph_processed = 0;
+CREATE UNIQUE INDEX idx_memories_content_hash ON memories(content_hash);
+
+CREATE TABLE memory_tags (
+    memory_id TEXT NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (memory_id, tag)
+);
+CREATE INDEX idx_memory_tags_tag ON memory_tags(tag, memory_id);
 
 CREATE TABLE session_memories (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
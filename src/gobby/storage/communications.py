@@ -13,6 +13,7 @@ from gobby.communications.models import (
     CommsIdentity,
     CommsMessage,
     CommsRoutingRule,
+    OutboxEntry,
 )
 from gobby.storage.database import DatabaseProtocol
 from gobby.utils.id import generate_prefixed_id
@@ -106,10 +107,12 @@ class LocalCommunicationsStore:
     def delete_channel(self, channel_id: str) -> None:
         """Delete a channel and all related records in a single transaction.
 
-        Cascades to: comms_attachments, comms_messages, comms_identities,
-        comms_routing_rules.
+        Cascades to: comms_attachments, comms_outbox, comms_messages,
+        comms_identities, comms_routing_rules.
         """
         with self.db.transaction() as conn:
+            conn.execute("DELETE FROM comms_outbox WHERE channel_id = ?", (channel_id,))
+
             # Delete attachments for channel's messages via subquery
             conn.execute(
                 "DELETE FROM comms_attachments WHERE message_id IN "
@@ -324,6 +327,142 @@ class LocalCommunicationsStore:
                 (status, error, message_id),
             )
 
+    # --- Outbox ---
+
+    def enqueue_outbound(self, message: CommsMessage) -> CommsMessage:
+        """Store a pending outbound message and its outbox entry atomically."""
+        if not message.id:
+            message.id = generate_prefixed_id("cm")
+
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO comms_messages (
+                    id, channel_id, identity_id, direction, content, content_type,
+                    platform_message_id, platform_thread_id, session_id, status,
+                    error, metadata_json, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    message.id,
+                    message.channel_id,
+                    message.identity_id,
+                    message.direction,
+                    message.content,
+                    message.content_type,
+                    message.platform_message_id,
+                    message.platform_thread_id,
+                    message.session_id,
+                    message.status,
+                    message.error,
+                    json.dumps(message.metadata_json),
+                    message.created_at,
+                ),
+            )
+            conn.execute(
+                "INSERT INTO comms_outbox (message_id, channel_id) VALUES (?, ?)",
+                (message.id, message.channel_id),
+            )
+        return message
+
+    def list_outbox(
+        self,
+        channel_id: str | None = None,
+        status: str = "pending",
+        limit: int | None = None,
+    ) -> list[OutboxEntry]:
+        """List outbox entries (oldest first) with their messages."""
+        sql = """
+            SELECT m.*, o.status AS outbox_status, o.attempts, o.last_error, o.next_attempt_at
+            FROM comms_outbox o
+            JOIN comms_messages m ON m.id = o.message_id
+            WHERE o.status = ?
+        """
+        params: list[Any] = [status]
+        if channel_id:
+            sql += " AND o.channel_id = ?"
+            params.append(channel_id)
+        sql += " ORDER BY o.created_at, m.created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        rows = self.db.fetchall(sql, tuple(params))
+        return [OutboxEntry.from_row(dict(row)) for row in rows]
+
+    def count_outbox(self, channel_id: str | None = None) -> dict[str, int]:
+        """Count outbox entries by status."""
+        sql = "SELECT status, COUNT(*) AS n FROM comms_outbox"
+        params: tuple[Any, ...] = ()
+        if channel_id:
+            sql += " WHERE channel_id = ?"
+            params = (channel_id,)
+        sql += " GROUP BY status"
+        counts = {"pending": 0, "dead": 0}
+        for row in self.db.fetchall(sql, params):
+            counts[row["status"]] = row["n"]
+        return counts
+
+    def complete_outbound(self, message_id: str, platform_message_id: str | None) -> None:
+        """Mark an outbound message sent and remove it from the outbox."""
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE comms_messages SET status = 'sent', error = NULL, "
+                "platform_message_id = ? WHERE id = ?",
+                (platform_message_id, message_id),
+            )
+            conn.execute("DELETE FROM comms_outbox WHERE message_id = ?", (message_id,))
+
+    def retry_outbound(
+        self, message_id: str, attempts: int, error: str, next_attempt_at: str
+    ) -> None:
+        """Record a failed delivery attempt that will be retried."""
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE comms_outbox SET attempts = ?, last_error = ?, next_attempt_at = ?, "
+                "updated_at = datetime('now') WHERE message_id = ?",
+                (attempts, error, next_attempt_at, message_id),
+            )
+
+    def dead_letter_outbound(self, message_id: str, attempts: int, error: str) -> None:
+        """Give up on an outbound message: dead-letter it and mark the message failed."""
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE comms_outbox SET status = 'dead', attempts = ?, last_error = ?, "
+                "next_attempt_at = NULL, updated_at = datetime('now') WHERE message_id = ?",
+                (attempts, error, message_id),
+            )
+            conn.execute(
+                "UPDATE comms_messages SET status = 'failed', error = ? WHERE id = ?",
+                (error, message_id),
+            )
+
+    def requeue_dead_letters(self, channel_id: str | None = None) -> list[OutboxEntry]:
+        """Move dead-lettered messages back to pending with a fresh attempt count."""
+        entries = self.list_outbox(channel_id=channel_id, status="dead")
+        if not entries:
+            return []
+        ids = [entry.message.id for entry in entries]
+        placeholders = ",".join("?" * len(ids))
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE comms_outbox SET status = 'pending', attempts = 0, "
+                "next_attempt_at = NULL, updated_at = datetime('now') "
+                f"WHERE message_id IN ({placeholders})",  # nosec B608
+                ids,
+            )
+            conn.execute(
+                "UPDATE comms_messages SET status = 'pending', error = NULL "
+                f"WHERE id IN ({placeholders})",  # nosec B608
+                ids,
+            )
+        for entry in entries:
+            entry.status = "pending"
+            entry.attempts = 0
+            entry.message.status = "pending"
+            entry.message.error = None
+        return entries
+
     # --- Routing Rules ---
 
     def create_routing_rule(self, rule: CommsRoutingRule) -> CommsRoutingRule:
@@ -15,12 +15,16 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from gobby.storage.database import DatabaseProtocol
+from gobby.storage.workflow_definitions import bump_rule_generation
 
 if TYPE_CHECKING:
     from gobby.storage.secrets import SecretStore
 
 logger = logging.getLogger(__name__)
 
+# Keys under this prefix affect rule evaluation (e.g. rules.enforcement_enabled)
+_RULE_KEY_PREFIX = "rules."
+
 # Suffixes that indicate a key holds a secret value
 _SECRET_SUFFIXES = (
     "_api_key",
@@ -92,6 +96,8 @@ class ConfigStore:
                    updated_at = excluded.updated_at""",
             (key, json_value, source, now),
         )
+        if key.startswith(_RULE_KEY_PREFIX):
+            bump_rule_generation()
 
     def set_many(self, entries: dict[str, Any], source: str = "user") -> int:
         """Bulk upsert config entries. Returns count of entries written."""
@@ -109,16 +115,21 @@ class ConfigStore:
                 (key, json_value, source, now),
             )
             count += 1
+        if any(key.startswith(_RULE_KEY_PREFIX) for key in entries):
+            bump_rule_generation()
         return count
 
     def delete(self, key: str) -> bool:
         """Delete a single key. Returns True if it existed."""
         cursor = self.db.execute("DELETE FROM config_store WHERE key = ?", (key,))
+        if key.startswith(_RULE_KEY_PREFIX):
+            bump_rule_generation()
         return bool(cursor.rowcount and cursor.rowcount > 0)
 
     def delete_all(self) -> int:
         """Delete all config entries. Returns count deleted."""
         cursor = self.db.execute("DELETE FROM config_store")
+        bump_rule_generation()
         return cursor.rowcount or 0
 
     def list_keys(self, prefix: str | None = None) -> list[str]:
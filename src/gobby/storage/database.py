@@ -10,11 +10,14 @@ import sqlite3
 import threading
 import weakref
 from collections.abc import Iterator
+from concurrent.futures import Future
 from contextlib import AbstractContextManager, contextmanager
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any, Protocol, cast, runtime_checkable
 
+from gobby.storage.write_queue import DatabaseWriter, WriteResult
+
 # Register custom datetime adapters/converters (required since Python 3.12)
 # See: https://docs.python.org/3/library/sqlite3.html#default-adapters-and-converters-deprecated
 
@@ -109,6 +112,10 @@ class DatabaseProtocol(Protocol):
         """
         ...
 
+    def defer_write(self, sql: str, params: tuple[Any, ...] = ()) -> None:
+        """Execute a write without waiting for it to commit, where supported."""
+        ...
+
     def close(self) -> None:
         """Close database connection."""
         ...
@@ -130,20 +137,34 @@ def _default_db_path() -> Path:
 # Used by safe_update to prevent SQL injection via column/table names
 _SQL_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# How long a connection waits on a locked database before raising (WAL mode)
+_WAL_BUSY_TIMEOUT_MS = 5000
+
+
+def _log_deferred_failure(future: Future[WriteResult]) -> None:
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"Deferred write failed: {error}")
+
 
 class LocalDatabase:
     """
     SQLite database manager with connection pooling.
 
     Thread-safe connection management using thread-local storage.
+
+    With ``wal_mode=True`` the database runs in WAL journal mode so readers
+    never block the writer, and fire-and-forget writes can be routed through
+    a dedicated writer thread via :meth:`submit_write` (group-committed).
     """
 
-    def __init__(self, db_path: Path | str | None = None):
+    def __init__(self, db_path: Path | str | None = None, *, wal_mode: bool = False):
         """
         Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file. Defaults to ~/.gobby/gobby-hub.db
+            wal_mode: Enable WAL journal mode (opt-in; default is DELETE mode).
         """
         # SAFETY SWITCH: During tests, prevent any access to the production database.
         # Catches both db_path=None (default) and explicit paths that resolve to production.
@@ -168,10 +189,14 @@ class LocalDatabase:
                         )
 
         self.db_path = Path(db_path) if db_path else _default_db_path()
+        self.wal_mode = wal_mode
         self._local = threading.local()
         # Track all connections for proper cleanup across threads
         self._all_connections: set[sqlite3.Connection] = set()
         self._connections_lock = threading.Lock()
+        # Dedicated writer thread, started lazily on first submit_write()
+        self._writer: DatabaseWriter | None = None
+        self._writer_lock = threading.Lock()
         self._ensure_directory()
 
         # Register atexit cleanup using weak reference to avoid preventing GC
@@ -183,28 +208,59 @@ class LocalDatabase:
         """Create database directory if it doesn't exist."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new configured connection (not tracked or thread-bound)."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,  # Autocommit mode
+        )
+        conn.row_factory = sqlite3.Row
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Last-resort safety: if test somehow connects to production DB, block writes
+        if os.environ.get("GOBBY_TEST_PROTECT") == "1":
+            if self.db_path.resolve() == _PRODUCTION_DB_PATH:
+                conn.execute("PRAGMA query_only = ON")
+        if self.wal_mode:
+            # WAL is persistent in the file; synchronous=NORMAL is durable
+            # across application crashes and avoids an fsync per commit.
+            conn.execute(f"PRAGMA busy_timeout = {_WAL_BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        # Otherwise use default DELETE journal mode (more reliable than WAL for dual-write)
+        return conn
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         if not hasattr(self._local, "connection") or self._local.connection is None:
-            conn = sqlite3.connect(
-                str(self.db_path),
-                check_same_thread=False,
-                isolation_level=None,  # Autocommit mode
-            )
-            conn.row_factory = sqlite3.Row
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON")
-            # Last-resort safety: if test somehow connects to production DB, block writes
-            if os.environ.get("GOBBY_TEST_PROTECT") == "1":
-                if self.db_path.resolve() == _PRODUCTION_DB_PATH:
-                    conn.execute("PRAGMA query_only = ON")
-            # Use default DELETE journal mode (more reliable than WAL for dual-write)
+            conn = self._open_connection()
             self._local.connection = conn
             # Track for cleanup in close()
             with self._connections_lock:
                 self._all_connections.add(conn)
         return cast(sqlite3.Connection, self._local.connection)
 
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """Get the connection fetchone/fetchall should read through.
+
+        In WAL mode each thread also gets a ``query_only`` reader connection,
+        so plain reads never take the write lock or queue behind a writer.
+        Reads inside an open transaction stay on the thread's read/write
+        connection so they see its uncommitted changes.
+        """
+        conn = self._get_connection()
+        if not self.wal_mode or conn.in_transaction:
+            return conn
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            reader = self._open_connection()
+            reader.execute("PRAGMA query_only = ON")
+            self._local.reader = reader
+            with self._connections_lock:
+                self._all_connections.add(reader)
+        return cast(sqlite3.Connection, reader)
+
     @property
     def connection(self) -> sqlite3.Connection:
         """Get current thread's database connection."""
@@ -220,7 +276,7 @@ class LocalDatabase:
 
     def fetchone(self, sql: str, params: tuple[Any, ...] = ()) -> sqlite3.Row | None:
         """Execute query and fetch one row."""
-        cursor = self.execute(sql, params)
+        cursor = self._get_read_connection().execute(sql, params)
         try:
             return cast(sqlite3.Row | None, cursor.fetchone())
         finally:
@@ -228,7 +284,7 @@ class LocalDatabase:
 
     def fetchall(self, sql: str, params: tuple[Any, ...] = ()) -> list[sqlite3.Row]:
         """Execute query and fetch all rows."""
-        cursor = self.execute(sql, params)
+        cursor = self._get_read_connection().execute(sql, params)
         try:
             return cursor.fetchall()
         finally:
@@ -330,6 +386,72 @@ class LocalDatabase:
             conn.execute("ROLLBACK")
             raise
 
+    # ------------------------------------------------------------------
+    # Single-writer queue
+    # ------------------------------------------------------------------
+
+    def _get_writer(self) -> DatabaseWriter:
+        """Get (and lazily start) the dedicated writer thread."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = DatabaseWriter(self._open_connection)
+                self._writer.start()
+            return self._writer
+
+    def submit_write(self, sql: str, params: tuple[Any, ...] = ()) -> Future[WriteResult]:
+        """Queue a write on the dedicated writer thread.
+
+        The statement is group-committed with other queued writes; the
+        returned future resolves after its batch commits. Use for writes
+        that don't need read-your-own-write consistency on the hot path
+        (metrics, spans, audit rows).
+        """
+        return self._get_writer().submit(sql, params)
+
+    def submit_writemany(self, sql: str, params_list: list[tuple[Any, ...]]) -> Future[WriteResult]:
+        """Queue an ``executemany`` write on the dedicated writer thread."""
+        return self._get_writer().submit_many(sql, params_list)
+
+    def defer_write(self, sql: str, params: tuple[Any, ...] = ()) -> None:
+        """Write without waiting for the commit when the writer queue is in use.
+
+        In WAL mode the statement is queued on the writer thread and a failure
+        is only logged; otherwise it runs synchronously on this thread. Use for
+        hot-path bookkeeping (activity timestamps, stats) that no caller reads
+        back immediately.
+        """
+        if not self.wal_mode:
+            self.execute(sql, params)
+            return
+        self.submit_write(sql, params).add_done_callback(_log_deferred_failure)
+
+    def flush_writes(self, timeout: float | None = None) -> bool:
+        """Wait until all queued writes have committed.
+
+        Returns:
+            True if the queue drained within ``timeout`` (or no writer is running).
+        """
+        writer = self._writer
+        if writer is None:
+            return True
+        return writer.flush(timeout)
+
+    def get_write_stats(self) -> dict[str, Any]:
+        """Return writer queue depth and commit latency metrics."""
+        writer = self._writer
+        if writer is None:
+            return {
+                "wal_mode": self.wal_mode,
+                "running": False,
+                "queue_depth": 0,
+                "batches_committed": 0,
+                "statements_committed": 0,
+                "statements_failed": 0,
+                "avg_batch_size": 0.0,
+                "commit_latency_ms": {"p50": 0.0, "p99": 0.0, "max": 0.0},
+            }
+        return {"wal_mode": self.wal_mode, **writer.get_stats()}
+
     def close(self) -> None:
         """Close all database connections and clean up managers.
 
@@ -337,6 +459,12 @@ class LocalDatabase:
         at interpreter shutdown, atexit handler is used instead of __del__ to
         avoid lock acquisition issues during GC.
         """
+        # Drain and stop the writer thread before closing reader connections
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
         # Close all connections from all threads
         with self._connections_lock:
             for conn in self._all_connections:
@@ -346,9 +474,11 @@ class LocalDatabase:
                     logger.debug(f"Connection close failed: {e}")
             self._all_connections.clear()
 
-        # Clear thread-local reference
+        # Clear thread-local references
         if hasattr(self._local, "connection"):
             self._local.connection = None
+        if hasattr(self._local, "reader"):
+            self._local.reader = None
 
     def _cleanup_at_exit(self) -> None:
         """Atexit handler for safe cleanup during interpreter shutdown.
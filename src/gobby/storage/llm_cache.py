@@ -0,0 +1,107 @@
+"""Storage manager for the LLM response cache."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from gobby.storage.database import DatabaseProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    """A stored LLM response."""
+
+    response: str
+    provider: str
+    model: str | None
+    prompt_chars: int
+
+
+class LLMResponseCacheStore:
+    """Manages the llm_response_cache table.
+
+    Entries expire ``ttl_hours`` after they were written and the table is kept
+    to ``max_entries`` rows by evicting the least recently used ones.
+    """
+
+    def __init__(self, db: DatabaseProtocol, ttl_hours: float, max_entries: int) -> None:
+        self.db = db
+        self.ttl_hours = ttl_hours
+        self.max_entries = max_entries
+        row = self.db.fetchone("SELECT COUNT(*) AS count FROM llm_response_cache")
+        self._count = row["count"] if row else 0
+
+    def _ttl_modifier(self) -> str:
+        return f"-{self.ttl_hours * 3600:.0f} seconds"
+
+    def get(self, cache_key: str) -> CachedResponse | None:
+        """Return a live entry and mark it used, or None."""
+        row = self.db.fetchone(
+            "SELECT response, provider, model, prompt_chars FROM llm_response_cache "
+            "WHERE cache_key = ? AND created_at > datetime('now', ?)",
+            (cache_key, self._ttl_modifier()),
+        )
+        if row is None:
+            return None
+        self.db.execute(
+            "UPDATE llm_response_cache SET hit_count = hit_count + 1, "
+            "last_used_at = datetime('now') WHERE cache_key = ?",
+            (cache_key,),
+        )
+        return CachedResponse(row["response"], row["provider"], row["model"], row["prompt_chars"])
+
+    def put(
+        self,
+        cache_key: str,
+        response: str,
+        provider: str,
+        model: str | None,
+        prompt_chars: int,
+    ) -> None:
+        """Store a response, replacing any previous (possibly expired) entry."""
+        self.db.execute(
+            "INSERT OR REPLACE INTO llm_response_cache "
+            "(cache_key, provider, model, response, prompt_chars) VALUES (?, ?, ?, ?, ?)",
+            (cache_key, provider, model, response, prompt_chars),
+        )
+        # Upper bound (replacements are counted too); prune() recounts exactly
+        self._count += 1
+        if self._count > self.max_entries:
+            self.prune()
+
+    def prune(self) -> int:
+        """Drop expired entries, then least recently used ones beyond the bound."""
+        with self.db.transaction() as conn:
+            removed = conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at <= datetime('now', ?)",
+                (self._ttl_modifier(),),
+            ).rowcount
+            count = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+            # Evict down to 90% so a full cache doesn't prune on every insert
+            excess = count - int(self.max_entries * 0.9)
+            if count > self.max_entries and excess > 0:
+                removed += conn.execute(
+                    "DELETE FROM llm_response_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM llm_response_cache "
+                    "ORDER BY last_used_at ASC LIMIT ?)",
+                    (excess,),
+                ).rowcount
+                count -= excess
+        self._count = count
+        if removed:
+            logger.debug(f"Pruned {removed} LLM response cache entries")
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry."""
+        cursor = self.db.execute("DELETE FROM llm_response_cache")
+        self._count = 0
+        return cursor.rowcount
+
+    def count(self) -> int:
+        """Return the number of stored entries (including expired ones)."""
+        row = self.db.fetchone("SELECT COUNT(*) AS count FROM llm_response_cache")
+        return row["count"] if row else 0
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import sqlite3
@@ -8,6 +9,7 @@ from datetime import UTC, datetime
 from typing import Any, Literal
 
 from gobby.memory.protocol import MediaAttachment
+from gobby.search.fts5 import sanitize_fts_query
 from gobby.storage.database import DatabaseProtocol
 
 # Stable namespace for deterministic memory UUIDs (uuid5)
@@ -21,6 +23,51 @@ logger = logging.getLogger(__name__)
 # Sentinel for distinguishing "not provided" from explicit None
 _UNSET: Any = object()
 
+# Max IDs per IN (...) query, well under SQLite's bound-parameter limit
+_ID_BATCH_SIZE = 500
+
+
+def compute_content_hash(content: str) -> str:
+    """Hash normalized memory content for the content_hash dedup index."""
+    return hashlib.sha256(content.strip().encode("utf-8")).hexdigest()
+
+
+def _tag_filter_clause(
+    tags_all: list[str] | None = None,
+    tags_any: list[str] | None = None,
+    tags_none: list[str] | None = None,
+) -> tuple[str, list[Any]]:
+    """
+    Build SQL conditions for tag filters using the memory_tags index.
+
+    Args:
+        tags_all: Memory must have ALL of these tags
+        tags_any: Memory must have at least ONE of these tags
+        tags_none: Memory must have NONE of these tags
+
+    Returns:
+        Tuple of (SQL fragment starting with " AND", params)
+    """
+    clause = ""
+    params: list[Any] = []
+    for tag in dict.fromkeys(tags_all or []):
+        clause += " AND memories.id IN (SELECT memory_id FROM memory_tags WHERE tag = ?)"
+        params.append(tag)
+    if tags_any:
+        placeholders = ",".join("?" * len(tags_any))
+        clause += (
+            f" AND memories.id IN (SELECT memory_id FROM memory_tags WHERE tag IN ({placeholders}))"
+        )
+        params.extend(tags_any)
+    if tags_none:
+        placeholders = ",".join("?" * len(tags_none))
+        clause += (
+            " AND memories.id NOT IN "
+            f"(SELECT memory_id FROM memory_tags WHERE tag IN ({placeholders}))"
+        )
+        params.extend(tags_none)
+    return clause, params
+
 
 @dataclass
 class MemoryCrossRef:
@@ -142,10 +189,15 @@ class LocalMemoryManager:
         # This aligns with content_exists() which checks globally
         memory_id = str(uuid.uuid5(MEMORY_UUID_NAMESPACE, normalized_content))
 
+        content_hash = compute_content_hash(normalized_content)
+
         # Check if memory already exists to avoid duplicate insert errors
-        existing_row = self.db.fetchone("SELECT * FROM memories WHERE id = ?", (memory_id,))
+        existing_row = self.db.fetchone(
+            "SELECT * FROM memories WHERE id = ? OR content_hash = ? LIMIT 1",
+            (memory_id, content_hash),
+        )
         if existing_row:
-            return self.get_memory(memory_id)
+            return Memory.from_row(existing_row)
 
         # source_id proximity dedup: if the same session created a very similar
         # memory within the last 60 seconds, treat it as a duplicate
@@ -168,8 +220,8 @@ class LocalMemoryManager:
                 INSERT INTO memories (
                     id, project_id, memory_type, content, source_type,
                     source_session_id, access_count, tags,
-                    media, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)
+                    media, created_at, updated_at, content_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?, ?)
                 """,
                 (
                     memory_id,
@@ -182,6 +234,7 @@ class LocalMemoryManager:
                     media,
                     now,
                     now,
+                    content_hash,
                 ),
             )
 
@@ -232,13 +285,12 @@ class LocalMemoryManager:
         Returns:
             True if a memory with identical content exists
         """
-        # Global deduplication: check by content directly, ignoring project_id
+        # Global deduplication: check by content hash, ignoring project_id
         # This fixes the duplicate issue where same content + different project_id
         # would create different memory IDs
-        normalized_content = content.strip()
         row = self.db.fetchone(
-            "SELECT 1 FROM memories WHERE content = ? LIMIT 1",
-            (normalized_content,),
+            "SELECT 1 FROM memories WHERE content_hash = ?",
+            (compute_content_hash(content),),
         )
         return row is not None
 
@@ -255,11 +307,10 @@ class LocalMemoryManager:
         Returns:
             The Memory object if found, None otherwise
         """
-        # Global lookup: find by content directly, ignoring project_id
-        normalized_content = content.strip()
+        # Global lookup: find by content hash, ignoring project_id
         row = self.db.fetchone(
-            "SELECT * FROM memories WHERE content = ? LIMIT 1",
-            (normalized_content,),
+            "SELECT * FROM memories WHERE content_hash = ?",
+            (compute_content_hash(content),),
         )
         if row:
             return Memory.from_row(row)
@@ -278,6 +329,14 @@ class LocalMemoryManager:
         if content is not None:
             updates.append("content = ?")
             params.append(content)
+            # Leave the hash NULL if another memory already owns this content
+            content_hash = compute_content_hash(content)
+            updates.append(
+                "content_hash = CASE WHEN EXISTS "
+                "(SELECT 1 FROM memories WHERE content_hash = ? AND id != ?) "
+                "THEN NULL ELSE ? END"
+            )
+            params.extend([content_hash, memory_id, content_hash])
         if tags is not None:
             updates.append("tags = ?")
             params.append(json.dumps(tags))
@@ -403,19 +462,67 @@ class LocalMemoryManager:
             query += " AND memory_type = ?"
             params.append(memory_type)
 
-        # Fetch more results to allow for tag filtering
-        fetch_limit = limit * 3 if (tags_all or tags_any or tags_none) else limit
+        tag_clause, tag_params = _tag_filter_clause(tags_all, tags_any, tags_none)
+        query += tag_clause
+        params.extend(tag_params)
+
         query += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
-        params.extend([fetch_limit, offset])
+        params.extend([limit, offset])
 
         rows = self.db.fetchall(query, tuple(params))
-        memories = [Memory.from_row(row) for row in rows]
+        return [Memory.from_row(row) for row in rows]
 
-        # Apply tag filters
-        if tags_all or tags_any or tags_none:
-            memories = self._filter_by_tags(memories, tags_all, tags_any, tags_none)
+    def get_memories_by_ids(
+        self,
+        memory_ids: list[str],
+        project_id: str | None = None,
+        memory_type: str | None = None,
+        tags_all: list[str] | None = None,
+        tags_any: list[str] | None = None,
+        tags_none: list[str] | None = None,
+    ) -> dict[str, Memory]:
+        """
+        Fetch many memories at once, applying filters in SQL.
 
-        return memories[:limit]
+        Used to hydrate vector search candidates without a query per ID.
+        IDs that don't exist or don't match the filters are absent from
+        the result, so callers can keep their own ranking order.
+
+        Args:
+            memory_ids: Memory IDs to fetch
+            project_id: Only include memories in this project or global ones
+            memory_type: Filter by memory type
+            tags_all: Memory must have ALL of these tags
+            tags_any: Memory must have at least ONE of these tags
+            tags_none: Memory must have NONE of these tags
+
+        Returns:
+            Dict of memory ID to Memory
+        """
+        filter_sql = ""
+        filter_params: list[Any] = []
+        if project_id:
+            filter_sql += " AND (project_id = ? OR project_id IS NULL)"
+            filter_params.append(project_id)
+        if memory_type:
+            filter_sql += " AND memory_type = ?"
+            filter_params.append(memory_type)
+        tag_clause, tag_params = _tag_filter_clause(tags_all, tags_any, tags_none)
+        filter_sql += tag_clause
+        filter_params.extend(tag_params)
+
+        unique_ids = list(dict.fromkeys(memory_ids))
+        result: dict[str, Memory] = {}
+        for start in range(0, len(unique_ids), _ID_BATCH_SIZE):
+            batch = unique_ids[start : start + _ID_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.db.fetchall(
+                f"SELECT * FROM memories WHERE id IN ({placeholders}){filter_sql}",  # nosec B608
+                (*batch, *filter_params),
+            )
+            for row in rows:
+                result[row["id"]] = Memory.from_row(row)
+        return result
 
     def update_access_stats(self, memory_id: str, accessed_at: str) -> None:
         """
@@ -436,6 +543,27 @@ class LocalMemoryManager:
                 (accessed_at, memory_id),
             )
 
+    def update_access_stats_many(self, memory_ids: list[str], accessed_at: str) -> None:
+        """
+        Update access stats for several memories in a single transaction.
+
+        Args:
+            memory_ids: Memory IDs to update
+            accessed_at: ISO format timestamp of access
+        """
+        if not memory_ids:
+            return
+        with self.db.transaction() as conn:
+            conn.executemany(
+                """
+                UPDATE memories
+                SET access_count = access_count + 1,
+                    last_accessed_at = ?
+                WHERE id = ?
+                """,
+                [(accessed_at, memory_id) for memory_id in memory_ids],
+            )
+
     def search_memories(
         self,
         query_text: str,
@@ -448,6 +576,10 @@ class LocalMemoryManager:
         """
         Search memories by content with optional tag filtering.
 
+        Uses the memories_fts index ranked by BM25. Falls back to a substring
+        scan when the keyword search finds nothing, so punctuation-only or
+        partial-word queries still match.
+
         Args:
             query_text: Text to search for in memory content
             project_id: Optional project ID to filter by
@@ -459,70 +591,41 @@ class LocalMemoryManager:
         Returns:
             List of matching memories
         """
-        # Escape LIKE wildcards in query_text
-        escaped_query = query_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        sql = "SELECT * FROM memories WHERE content LIKE ? ESCAPE '\\'"
-        params: list[Any] = [f"%{escaped_query}%"]
-
+        filter_sql = ""
+        filter_params: list[Any] = []
         if project_id:
-            sql += " AND (project_id = ? OR project_id IS NULL)"
-            params.append(project_id)
-
-        # Fetch more results than needed to allow for tag filtering
-        fetch_limit = limit * 3 if (tags_all or tags_any or tags_none) else limit
-        sql += " ORDER BY updated_at DESC LIMIT ?"
-        params.append(fetch_limit)
-
-        rows = self.db.fetchall(sql, tuple(params))
-        memories = [Memory.from_row(row) for row in rows]
-
-        # Apply tag filters in Python
-        if tags_all or tags_any or tags_none:
-            memories = self._filter_by_tags(memories, tags_all, tags_any, tags_none)
-
-        return memories[:limit]
-
-    def _filter_by_tags(
-        self,
-        memories: list[Memory],
-        tags_all: list[str] | None = None,
-        tags_any: list[str] | None = None,
-        tags_none: list[str] | None = None,
-    ) -> list[Memory]:
-        """
-        Filter memories by tag criteria.
-
-        Args:
-            memories: List of memories to filter
-            tags_all: Memory must have ALL of these tags
-            tags_any: Memory must have at least ONE of these tags
-            tags_none: Memory must have NONE of these tags
-
-        Returns:
-            Filtered list of memories
-        """
-        result = []
-        for memory in memories:
-            memory_tags = set(memory.tags) if memory.tags else set()
-
-            # Check tags_all: memory must have ALL specified tags
-            if tags_all:
-                if not set(tags_all).issubset(memory_tags):
-                    continue
-
-            # Check tags_any: memory must have at least ONE specified tag
-            if tags_any:
-                if not memory_tags.intersection(tags_any):
-                    continue
-
-            # Check tags_none: memory must have NONE of the specified tags
-            if tags_none:
-                if memory_tags.intersection(tags_none):
-                    continue
-
-            result.append(memory)
+            filter_sql += " AND (memories.project_id = ? OR memories.project_id IS NULL)"
+            filter_params.append(project_id)
+        tag_clause, tag_params = _tag_filter_clause(tags_all, tags_any, tags_none)
+        filter_sql += tag_clause
+        filter_params.extend(tag_params)
+
+        fts_query = sanitize_fts_query(query_text)
+        if fts_query:
+            try:
+                rows = self.db.fetchall(
+                    f"""
+                    SELECT memories.* FROM memories_fts
+                    JOIN memories ON memories.rowid = memories_fts.rowid
+                    WHERE memories_fts MATCH ?{filter_sql}
+                    ORDER BY bm25(memories_fts), memories.updated_at DESC
+                    LIMIT ?
+                    """,  # nosec B608
+                    (fts_query, *filter_params, limit),
+                )
+                if rows:
+                    return [Memory.from_row(row) for row in rows]
+            except sqlite3.OperationalError as e:
+                logger.debug(f"FTS5 memory search failed, using substring scan: {e}")
 
-        return result
+        # Escape LIKE wildcards in query_text
+        escaped_query = query_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        rows = self.db.fetchall(
+            f"SELECT * FROM memories WHERE content LIKE ? ESCAPE '\\'{filter_sql}"  # nosec B608
+            " ORDER BY updated_at DESC LIMIT ?",
+            (f"%{escaped_query}%", *filter_params, limit),
+        )
+        return [Memory.from_row(row) for row in rows]
 
     # --- Cross-reference methods ---
 
@@ -35,7 +35,7 @@ MigrationAction = str | Callable[[LocalDatabase], None]
 # Baseline version - the schema state that is applied for new databases directly.
 # Must be bumped when BASELINE_SCHEMA is updated with columns from new migrations,
 # so that fresh databases don't re-run migrations already baked into the baseline.
-BASELINE_VERSION = 199
+BASELINE_VERSION = 200
 
 # Minimum migration version - databases older than this cannot be upgraded
 # because legacy migrations (pre-v171) have been removed.
@@ -161,7 +161,8 @@ def _setup_tasks_fts(db: LocalDatabase) -> None:
             VALUES ('delete', old.rowid, old.title, old.description, old.labels, old.task_type, old.category);
         END;
 
-        CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE ON tasks BEGIN
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+        AFTER UPDATE OF title, description, labels, task_type, category ON tasks BEGIN
             INSERT INTO tasks_fts(tasks_fts, rowid, title, description, labels, task_type, category)
             VALUES ('delete', old.rowid, old.title, old.description, old.labels, old.task_type, old.category);
             INSERT INTO tasks_fts(rowid, title, description, labels, task_type, category)
@@ -201,6 +202,242 @@ def _setup_skills_fts(db: LocalDatabase) -> None:
     """)
 
 
+def _setup_memories_fts(db: LocalDatabase) -> None:
+    """Create FTS5 virtual table and triggers for memory keyword search.
+
+    Content-synced with the memories table, following the tasks_fts pattern.
+    """
+    conn = db.connection
+    conn.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+            content,
+            content='memories', content_rowid='rowid'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN
+            INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN
+            INSERT INTO memories_fts(memories_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS memories_fts_au AFTER UPDATE OF content ON memories BEGIN
+            INSERT INTO memories_fts(memories_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+            INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content);
+        END;
+
+        INSERT OR IGNORE INTO memories_fts(rowid, content)
+        SELECT rowid, content FROM memories;
+    """)
+
+
+def _setup_memory_tags_sync(db: LocalDatabase) -> None:
+    """Create triggers mirroring the memories.tags JSON list into memory_tags.
+
+    Tags stay authoritative in memories.tags; memory_tags is a normalized,
+    indexed copy so tag predicates can run in SQL.
+    """
+    conn = db.connection
+    conn.executescript("""
+        CREATE TRIGGER IF NOT EXISTS memory_tags_ai AFTER INSERT ON memories BEGIN
+            INSERT OR IGNORE INTO memory_tags(memory_id, tag)
+            SELECT new.id, value FROM json_each(new.tags);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS memory_tags_ad AFTER DELETE ON memories BEGIN
+            DELETE FROM memory_tags WHERE memory_id = old.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS memory_tags_au AFTER UPDATE OF tags ON memories BEGIN
+            DELETE FROM memory_tags WHERE memory_id = old.id;
+            INSERT OR IGNORE INTO memory_tags(memory_id, tag)
+            SELECT new.id, value FROM json_each(new.tags);
+        END;
+
+        INSERT OR IGNORE INTO memory_tags(memory_id, tag)
+        SELECT m.id, j.value FROM memories m, json_each(m.tags) j
+        WHERE m.tags IS NOT NULL;
+    """)
+
+
+def _add_memory_indexes(db: LocalDatabase) -> None:
+    """Add memory content hashes, the memory_tags table and memories_fts.
+
+    Hashes are computed in Python (SQLite has no sha256). When several rows
+    share normalized content (possible after update_memory), only the oldest
+    keeps the hash so the unique index can be created.
+    """
+    from gobby.storage.memories import compute_content_hash
+
+    conn = db.connection
+    conn.executescript("""
+        ALTER TABLE memories ADD COLUMN content_hash TEXT;
+
+        CREATE TABLE IF NOT EXISTS memory_tags (
+            memory_id TEXT NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (memory_id, tag)
+        );
+        CREATE INDEX IF NOT EXISTS idx_memory_tags_tag ON memory_tags(tag, memory_id);
+    """)
+
+    seen: set[str] = set()
+    updates: list[tuple[str, str]] = []
+    for row in db.fetchall("SELECT id, content FROM memories ORDER BY created_at, id"):
+        content_hash = compute_content_hash(row["content"])
+        if content_hash in seen:
+            continue
+        seen.add(content_hash)
+        updates.append((content_hash, row["id"]))
+    with db.transaction() as tx:
+        tx.executemany("UPDATE memories SET content_hash = ? WHERE id = ?", updates)
+
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_memories_content_hash ON memories(content_hash)"
+    )
+    _setup_memory_tags_sync(db)
+    _setup_memories_fts(db)
+
+
+def _add_task_readiness(db: LocalDatabase) -> None:
+    """Add the trigger-maintained task_readiness table and backfill it."""
+    from gobby.storage.tasks._readiness import rebuild_task_readiness, setup_task_readiness
+
+    setup_task_readiness(db)
+    rebuild_task_readiness(db)
+
+
+def _add_task_dependency_version(db: LocalDatabase) -> None:
+    """Add the trigger-maintained version counter behind the dependency graph cache."""
+    db.connection.executescript("""
+        CREATE TABLE IF NOT EXISTS task_dependency_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO task_dependency_version (id, version) VALUES (1, 0);
+
+        CREATE TRIGGER IF NOT EXISTS task_dependency_version_ai
+        AFTER INSERT ON task_dependencies WHEN new.dep_type = 'blocks' BEGIN
+            UPDATE task_dependency_version SET version = version + 1 WHERE id = 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_dependency_version_ad
+        AFTER DELETE ON task_dependencies WHEN old.dep_type = 'blocks' BEGIN
+            UPDATE task_dependency_version SET version = version + 1 WHERE id = 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_dependency_version_au
+        AFTER UPDATE ON task_dependencies BEGIN
+            UPDATE task_dependency_version SET version = version + 1 WHERE id = 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_dependency_version_project
+        AFTER UPDATE OF project_id ON tasks WHEN old.project_id IS NOT new.project_id BEGIN
+            UPDATE task_dependency_version SET version = version + 1 WHERE id = 1;
+        END;
+    """)
+
+
+def _add_code_graph_version(db: LocalDatabase) -> None:
+    """Add the per-project version counter behind the SQLite call graph cache.
+
+    The triggers avoid INSERT OR IGNORE: code_indexed_files is written with
+    an upsert, and the outer statement's conflict handling overrides the
+    OR IGNORE of statements its triggers run.
+    """
+    db.connection.executescript("""
+        CREATE TABLE IF NOT EXISTS code_graph_version (
+            project_id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        );
+
+        CREATE TRIGGER IF NOT EXISTS code_graph_version_ai
+        AFTER INSERT ON code_indexed_files BEGIN
+            INSERT INTO code_graph_version (project_id, version)
+                SELECT new.project_id, 0 WHERE NOT EXISTS (
+                    SELECT 1 FROM code_graph_version WHERE project_id = new.project_id
+                );
+            UPDATE code_graph_version SET version = version + 1
+                WHERE project_id = new.project_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS code_graph_version_au
+        AFTER UPDATE OF content_hash, indexed_at ON code_indexed_files BEGIN
+            INSERT INTO code_graph_version (project_id, version)
+                SELECT new.project_id, 0 WHERE NOT EXISTS (
+                    SELECT 1 FROM code_graph_version WHERE project_id = new.project_id
+                );
+            UPDATE code_graph_version SET version = version + 1
+                WHERE project_id = new.project_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS code_graph_version_ad
+        AFTER DELETE ON code_indexed_files BEGIN
+            UPDATE code_graph_version SET version = version + 1
+                WHERE project_id = old.project_id;
+        END;
+    """)
+
+
+def _add_code_index_generation(db: LocalDatabase) -> None:
+    """Add the per-project generation counter behind the code search cache.
+
+    Bumped by anything that can change a search result: a file being
+    (re)indexed or deleted, the sync worker marking its vectors or graph
+    edges synced, and symbol summaries. Rows are never deleted, so a
+    generation is never reused for a project.
+    """
+    bump = """
+            INSERT INTO code_index_generation (project_id, generation)
+                SELECT {row}.project_id, 0 WHERE NOT EXISTS (
+                    SELECT 1 FROM code_index_generation WHERE project_id = {row}.project_id
+                );
+            UPDATE code_index_generation SET generation = generation + 1
+                WHERE project_id = {row}.project_id;
+    """
+    db.connection.executescript(f"""
+        CREATE TABLE IF NOT EXISTS code_index_generation (
+            project_id TEXT PRIMARY KEY,
+            generation INTEGER NOT NULL
+        );
+
+        CREATE TRIGGER IF NOT EXISTS code_index_generation_files_ai
+        AFTER INSERT ON code_indexed_files BEGIN {bump.format(row="new")} END;
+
+        CREATE TRIGGER IF NOT EXISTS code_index_generation_files_au
+        AFTER UPDATE OF content_hash, indexed_at, vectors_synced, graph_synced
+        ON code_indexed_files BEGIN {bump.format(row="new")} END;
+
+        CREATE TRIGGER IF NOT EXISTS code_index_generation_files_ad
+        AFTER DELETE ON code_indexed_files BEGIN {bump.format(row="old")} END;
+
+        CREATE TRIGGER IF NOT EXISTS code_index_generation_summary
+        AFTER UPDATE OF summary ON code_symbols BEGIN {bump.format(row="new")} END;
+    """)
+
+
+def _narrow_tasks_fts_update_trigger(db: LocalDatabase) -> None:
+    """Only re-index a task in FTS5 when one of its indexed columns changes.
+
+    The old trigger fired on every UPDATE, so bulk writes to unindexed
+    columns (path_cache, status, updated_at) rewrote the FTS row each time.
+    """
+    db.connection.executescript("""
+        DROP TRIGGER IF EXISTS tasks_fts_au;
+
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+        AFTER UPDATE OF title, description, labels, task_type, category ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, description, labels, task_type, category)
+            VALUES ('delete', old.rowid, old.title, old.description, old.labels, old.task_type, old.category);
+            INSERT INTO tasks_fts(rowid, title, description, labels, task_type, category)
+            VALUES (new.rowid, new.title, new.description, new.labels, new.task_type, new.category);
+        END;
+    """)
+
+
 def _setup_fts_tables(db: LocalDatabase) -> None:
     """Set up FTS5 tables for both tasks and skills."""
     _setup_tasks_fts(db)
@@ -696,6 +933,109 @@ MIGRATIONS: list[tuple[int, str, MigrationAction]] = [
         ALTER TABLE completion_subscribers DROP COLUMN subscribed_at;
         """,
     ),
+    (
+        200,
+        "Add memory content_hash, memory_tags table and memories_fts",
+        _add_memory_indexes,
+    ),
+    (
+        201,
+        "Add task_readiness table maintained by triggers",
+        _add_task_readiness,
+    ),
+    (
+        202,
+        "Add task_dependency_version counter for the in-memory dependency graph",
+        _add_task_dependency_version,
+    ),
+    (
+        203,
+        "Promote span session_id/project_id to indexed columns for trace-list queries",
+        """
+        ALTER TABLE spans ADD COLUMN session_id TEXT;
+        ALTER TABLE spans ADD COLUMN project_id TEXT;
+
+        UPDATE spans SET
+            session_id = json_extract(attributes_json, '$.session_id'),
+            project_id = json_extract(attributes_json, '$.project_id')
+        WHERE json_valid(attributes_json);
+
+        DROP INDEX IF EXISTS idx_spans_trace_id;
+        CREATE INDEX IF NOT EXISTS idx_spans_trace_start ON spans(trace_id, start_time_ns);
+        CREATE INDEX IF NOT EXISTS idx_spans_session
+            ON spans(session_id, start_time_ns, trace_id);
+        CREATE INDEX IF NOT EXISTS idx_spans_project ON spans(project_id, start_time_ns);
+        CREATE INDEX IF NOT EXISTS idx_spans_status ON spans(status, start_time_ns);
+        """,
+    ),
+    (
+        204,
+        "Add llm_response_cache table for the opt-in LLM response cache",
+        """
+        CREATE TABLE IF NOT EXISTS llm_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            provider TEXT NOT NULL,
+            model TEXT,
+            response TEXT NOT NULL,
+            prompt_chars INTEGER NOT NULL DEFAULT 0,
+            hit_count INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            last_used_at TEXT NOT NULL DEFAULT (datetime('now'))
+        );
+        CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_used
+            ON llm_response_cache(last_used_at);
+        """,
+    ),
+    (
+        205,
+        "Add comms_outbox table for durable outbound message delivery",
+        """
+        CREATE TABLE IF NOT EXISTS comms_outbox (
+            message_id TEXT PRIMARY KEY REFERENCES comms_messages(id) ON DELETE CASCADE,
+            channel_id TEXT NOT NULL REFERENCES comms_channels(id) ON DELETE CASCADE,
+            status TEXT NOT NULL DEFAULT 'pending' CHECK(status IN ('pending', 'dead')),
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            next_attempt_at TEXT,
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        );
+        CREATE INDEX IF NOT EXISTS idx_comms_outbox_channel_status
+            ON comms_outbox(channel_id, status, created_at);
+        """,
+    ),
+    (
+        206,
+        "Add code_graph_version counter for the SQLite call graph",
+        _add_code_graph_version,
+    ),
+    (
+        207,
+        "Add code_sync_items ledger for incremental vector/graph sync",
+        """
+        CREATE TABLE IF NOT EXISTS code_sync_items (
+            project_id TEXT NOT NULL,
+            store TEXT NOT NULL CHECK(store IN ('vector', 'graph')),
+            item_key TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            item_hash TEXT NOT NULL,
+            PRIMARY KEY (project_id, store, item_key)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_csi_file ON code_sync_items(project_id, store, file_path);
+        CREATE INDEX IF NOT EXISTS idx_csi_vector_hash ON code_sync_items(project_id, item_hash)
+            WHERE store = 'vector';
+        """,
+    ),
+    (
+        208,
+        "Add code_index_generation counter for the code search cache",
+        _add_code_index_generation,
+    ),
+    (
+        209,
+        "Limit the tasks_fts update trigger to indexed columns",
+        _narrow_tasks_fts_update_trigger,
+    ),
 ]
 
 
@@ -730,6 +1070,8 @@ def _apply_baseline(db: LocalDatabase) -> None:
     _setup_code_content_fts(db)
     _setup_tasks_fts(db)
     _setup_skills_fts(db)
+    _setup_memories_fts(db)
+    _setup_memory_tags_sync(db)
 
     logger.info(f"Baseline schema applied, now at version {BASELINE_VERSION}")
 
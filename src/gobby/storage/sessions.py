@@ -341,7 +341,7 @@ class LocalSessionManager:
         is still alive.
         """
         now = datetime.now(UTC).isoformat()
-        self.db.execute(
+        self.db.defer_write(
             "UPDATE sessions SET updated_at = ? WHERE id = ?",
             (now, session_id),
         )
@@ -581,6 +581,39 @@ class LocalSessionManager:
         self.db.safe_update("sessions", values, "id = ?", (session_id,))
         return self.get(session_id)
 
+    def record_transcript_stats(
+        self,
+        session_id: str,
+        message_count: int,
+        turn_count: int,
+        tool_call_count: int,
+        last_assistant_content: str | None = None,
+    ) -> None:
+        """Store transcript stats and refresh updated_at without reading back.
+
+        Called by the transcript processor on every poll, so the write is
+        deferred to the database's writer queue when one is in use.
+        """
+        self.db.defer_write(
+            """
+            UPDATE sessions SET
+                message_count = ?,
+                turn_count = ?,
+                tool_call_count = ?,
+                last_assistant_content = COALESCE(?, last_assistant_content),
+                updated_at = ?
+            WHERE id = ?
+            """,
+            (
+                message_count,
+                turn_count,
+                tool_call_count,
+                last_assistant_content,
+                datetime.now(UTC).isoformat(),
+                session_id,
+            ),
+        )
+
     def recalculate_stats(self, session_id: str) -> Session | None:
         """Recalculate session stats from session_messages table.
 
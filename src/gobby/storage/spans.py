@@ -1,14 +1,50 @@
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+from collections.abc import Generator
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from gobby.storage.database import DatabaseProtocol
+    from gobby.storage.write_queue import WriteResult
 
 logger = logging.getLogger(__name__)
 
+# (start_time_ns, trace_id) rows, newest first
+_SpanStream = Generator[tuple[int, str]]
+
+_INSERT_SQL = """
+INSERT INTO spans (
+    span_id, trace_id, parent_span_id, name, kind,
+    start_time_ns, end_time_ns, status, status_message,
+    attributes_json, events_json, session_id, project_id
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _span_row(s: dict[str, Any]) -> tuple[Any, ...]:
+    attributes = s.get("attributes") or {}
+    session_id = attributes.get("session_id")
+    project_id = attributes.get("project_id")
+    return (
+        s["span_id"],
+        s["trace_id"],
+        s.get("parent_span_id"),
+        s["name"],
+        s.get("kind"),
+        s["start_time_ns"],
+        s.get("end_time_ns"),
+        s.get("status"),
+        s.get("status_message"),
+        json.dumps(attributes),
+        json.dumps(s.get("events", [])),
+        str(session_id) if session_id is not None else None,
+        str(project_id) if project_id is not None else None,
+    )
+
 
 class SpanStorage:
     """Storage manager for OpenTelemetry spans in SQLite."""
@@ -25,38 +61,32 @@ class SpanStorage:
         if not spans:
             return
 
-        query = """
-        INSERT INTO spans (
-            span_id, trace_id, parent_span_id, name, kind,
-            start_time_ns, end_time_ns, status, status_message,
-            attributes_json, events_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        rows = []
-        for s in spans:
-            rows.append(
-                (
-                    s["span_id"],
-                    s["trace_id"],
-                    s.get("parent_span_id"),
-                    s["name"],
-                    s.get("kind"),
-                    s["start_time_ns"],
-                    s.get("end_time_ns"),
-                    s.get("status"),
-                    s.get("status_message"),
-                    json.dumps(s.get("attributes", {})),
-                    json.dumps(s.get("events", [])),
-                )
-            )
-
         try:
-            self.db.executemany(query, rows)
+            self.db.executemany(_INSERT_SQL, [_span_row(s) for s in spans])
         except Exception as e:
             logger.error(f"Failed to save spans: {e}")
             raise
 
+    def submit_spans(self, spans: list[dict[str, Any]]) -> Future[WriteResult] | None:
+        """Queue a batch insert on the database's writer thread.
+
+        The insert is group-committed with other queued writes; the returned
+        future resolves once it has committed. Databases without a writer
+        queue are written synchronously and None is returned.
+        """
+        if not spans:
+            return None
+        submit = getattr(self.db, "submit_writemany", None)
+        if submit is None:
+            self.save_spans(spans)
+            return None
+        return submit(_INSERT_SQL, [_span_row(s) for s in spans])  # type: ignore[no-any-return]
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for queued span writes to commit."""
+        flush_writes = getattr(self.db, "flush_writes", None)
+        return bool(flush_writes(timeout)) if flush_writes is not None else True
+
     def get_trace(self, trace_id: str) -> list[dict[str, Any]]:
         """Retrieve all spans for a trace, ordered by start time."""
         query = "SELECT * FROM spans WHERE trace_id = ? ORDER BY start_time_ns ASC"
@@ -71,86 +101,89 @@ class SpanStorage:
         status: str | None = None,
     ) -> list[dict[str, Any]]:
         """Retrieve recent traces, represented by their root (earliest) span."""
-        conditions: list[str] = []
-        params: list[Any] = []
+        status_filter = " AND status = ?" if status else ""
+        status_params: tuple[Any, ...] = (status,) if status else ()
 
         if project_id:
-            conditions.append(
-                "(json_extract(attributes_json, '$.project_id') = ? "
-                "OR json_extract(attributes_json, '$.project_id') IS NULL)"
-            )
-            params.append(project_id)
-        if status:
-            conditions.append("status = ?")
-            params.append(status)
-
-        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-        # Using a single query with ROW_NUMBER() to get the root span per trace_id
-        # and joining it with the max start_time_ns for ordering.
-        query = f"""
-        WITH TraceLastActivity AS (
-            SELECT trace_id, MAX(start_time_ns) as last_activity
-            FROM spans
-            {where}
-            GROUP BY trace_id
-            ORDER BY last_activity DESC
-            LIMIT ? OFFSET ?
-        ),
-        RootSpans AS (
-            SELECT *,
-                   ROW_NUMBER() OVER(PARTITION BY trace_id ORDER BY start_time_ns ASC) as rn
-            FROM spans
-            WHERE trace_id IN (SELECT trace_id FROM TraceLastActivity)
-        )
-        SELECT r.*
-        FROM RootSpans r
-        JOIN TraceLastActivity tla ON r.trace_id = tla.trace_id
-        WHERE r.rn = 1
-        ORDER BY tla.last_activity DESC
-        """
-        params.extend([limit, offset])
-        rows = self.db.fetchall(query, tuple(params))
-        return [self._row_to_dict(row) for row in rows]
+            # Spans without a project (daemon-level work) show up under every project
+            streams = [
+                self._newest_spans(f"project_id = ?{status_filter}", (project_id, *status_params)),
+                self._newest_spans(f"project_id IS NULL{status_filter}", status_params),
+            ]
+        elif status:
+            streams = [self._newest_spans("status = ?", status_params)]
+        else:
+            streams = [self._newest_spans("1", ())]
+
+        return self._root_spans(self._latest_trace_ids(streams, limit, offset))
 
     def get_traces_by_session(
         self, session_id: str, limit: int = 50, offset: int = 0
     ) -> list[dict[str, Any]]:
-        """Retrieve traces that have a matching session_id in their attributes."""
-        query = """
-        WITH SessionTraces AS (
-            SELECT trace_id, MAX(start_time_ns) as last_activity
-            FROM spans
-            WHERE json_extract(attributes_json, '$.session_id') = ?
-            GROUP BY trace_id
-            ORDER BY last_activity DESC
-            LIMIT ? OFFSET ?
-        ),
-        RootSpans AS (
-            SELECT *,
-                   ROW_NUMBER() OVER(PARTITION BY trace_id ORDER BY start_time_ns ASC) as rn
-            FROM spans
-            WHERE trace_id IN (SELECT trace_id FROM SessionTraces)
-        )
-        SELECT r.*
-        FROM RootSpans r
-        JOIN SessionTraces st ON r.trace_id = st.trace_id
-        WHERE r.rn = 1
-        ORDER BY st.last_activity DESC
-        """
-        rows = self.db.fetchall(query, (session_id, limit, offset))
-        return [self._row_to_dict(row) for row in rows]
+        """Retrieve traces that have spans tagged with ``session_id``."""
+        streams = [self._newest_spans("session_id = ?", (session_id,))]
+        return self._root_spans(self._latest_trace_ids(streams, limit, offset))
 
     def get_trace_count_by_session(self, session_id: str) -> int:
         """Get the total number of distinct traces for a session."""
-        query = """
-        SELECT COUNT(DISTINCT trace_id) as count
-        FROM spans
-        WHERE json_extract(attributes_json, '$.session_id') = ?
-        """
+        query = "SELECT COUNT(DISTINCT trace_id) as count FROM spans WHERE session_id = ?"
         row = self.db.fetchone(query, (session_id,))
         return row["count"] if row else 0
 
+    def _newest_spans(self, where: str, params: tuple[Any, ...]) -> _SpanStream:
+        """Yield ``(start_time_ns, trace_id)`` of matching spans, newest first.
+
+        Each ``where`` is an equality on an indexed column ending in
+        ``start_time_ns``, so rows stream off the index without a sort.
+        """
+        cursor = self.db.execute(
+            f"SELECT start_time_ns, trace_id FROM spans WHERE {where} ORDER BY start_time_ns DESC",
+            params,
+        )
+        try:
+            for row in cursor:
+                yield row[0], row[1]
+        finally:
+            cursor.close()
+
+    def _latest_trace_ids(self, streams: list[_SpanStream], limit: int, offset: int) -> list[str]:
+        """Trace IDs ordered by most recent matching span, newest first.
+
+        A trace's first appearance in a newest-first walk is its latest
+        activity, so the walk stops after ``limit + offset`` distinct traces
+        instead of grouping every span in the table.
+        """
+        wanted = limit + offset
+        seen: dict[str, None] = {}
+        try:
+            if wanted > 0:
+                for _, trace_id in heapq.merge(*streams, key=lambda r: r[0], reverse=True):
+                    seen.setdefault(trace_id)
+                    if len(seen) >= wanted:
+                        break
+        finally:
+            for stream in streams:
+                stream.close()
+        return list(seen)[offset:]
+
+    def _root_spans(self, trace_ids: list[str]) -> list[dict[str, Any]]:
+        """Fetch the earliest span of each trace, in ``trace_ids`` order."""
+        if not trace_ids:
+            return []
+        query = """
+        SELECT * FROM spans WHERE span_id IN (
+            SELECT (
+                SELECT span_id FROM spans
+                WHERE trace_id = t.value
+                ORDER BY start_time_ns ASC
+                LIMIT 1
+            )
+            FROM json_each(?) t
+        )
+        """
+        rows = {row["trace_id"]: row for row in self.db.fetchall(query, (json.dumps(trace_ids),))}
+        return [self._row_to_dict(rows[tid]) for tid in trace_ids if tid in rows]
+
     def delete_old_spans(self, retention_days: int = 7) -> int:
         """Delete spans older than the specified retention period."""
         query = "DELETE FROM spans WHERE created_at < datetime('now', ?)"
@@ -1,10 +1,12 @@
 import logging
 import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Literal
 
 from gobby.storage.database import DatabaseProtocol
+from gobby.storage.task_dependency_graph import DependencyGraph, get_dependency_graph
 
 logger = logging.getLogger(__name__)
 
@@ -50,42 +52,98 @@ class TaskDependencyManager:
     def __init__(self, db: DatabaseProtocol):
         self.db = db
 
+    @property
+    def graph(self) -> DependencyGraph:
+        """In-memory blocks graph shared by every manager on this database."""
+        return get_dependency_graph(self.db)
+
     def add_dependency(
         self, task_id: str, depends_on: str, dep_type: DependencyType = "blocks"
     ) -> TaskDependency:
         """Add a dependency."""
-        if task_id == depends_on:
-            raise ValueError("Task cannot depend on itself")
+        return self.add_dependencies([(task_id, depends_on, dep_type)], skip_existing=False)[0]
 
-        # For 'blocks', prevent cycles
-        if dep_type == "blocks" and self._would_create_cycle(task_id, depends_on):
-            raise DependencyCycleError(
-                f"Adding dependency {task_id} blocks {depends_on} would create a cycle"
-            )
+    def add_dependencies(
+        self,
+        edges: Iterable[tuple[str, str, DependencyType]],
+        skip_existing: bool = True,
+    ) -> list[TaskDependency]:
+        """Add several dependencies in one transaction with a single cycle check.
 
-        now = datetime.now(UTC).isoformat()
+        The batch is all-or-nothing: if any 'blocks' edge would close a cycle
+        (with existing edges or other edges in the batch), nothing is written.
 
-        with self.db.transaction() as conn:
-            cursor = conn.execute(
-                "INSERT INTO task_dependencies (task_id, depends_on, dep_type, created_at) VALUES (?, ?, ?, ?)",
-                (task_id, depends_on, dep_type, now),
-            )
-            dep_id = cursor.lastrowid
+        Args:
+            edges: (task_id, depends_on, dep_type) tuples
+            skip_existing: Silently skip edges that already exist instead of
+                raising sqlite3.IntegrityError
 
-            if dep_id is None:
-                raise ValueError("Failed to retrieve dependency ID")
+        Returns:
+            The dependencies that were created, in input order.
 
-            return TaskDependency(dep_id, task_id, depends_on, dep_type, now)
+        Raises:
+            ValueError: If an edge points a task at itself
+            DependencyCycleError: If the 'blocks' edges would create a cycle
+        """
+        edges = list(dict.fromkeys(edges))
+        for task_id, depends_on, _ in edges:
+            if task_id == depends_on:
+                raise ValueError("Task cannot depend on itself")
+        if not edges:
+            return []
+
+        blocks = [(t, d) for t, d, dep_type in edges if dep_type == "blocks"]
+        graph = self.graph
+        now = datetime.now(UTC).isoformat()
+        verb = "INSERT OR IGNORE" if skip_existing else "INSERT"
+        created: list[TaskDependency] = []
+
+        # IMMEDIATE so the cycle check and the insert see the same graph
+        with self.db.transaction_immediate() as conn:
+            cycle = graph.find_cycle(blocks)
+            if cycle:
+                raise DependencyCycleError(
+                    f"Adding dependency {cycle[0]} blocks {cycle[1]} would create a cycle: "
+                    + " -> ".join(cycle)
+                )
+
+            before = graph.current_version()
+            for task_id, depends_on, dep_type in edges:
+                cursor = conn.execute(
+                    f"{verb} INTO task_dependencies (task_id, depends_on, dep_type, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (task_id, depends_on, dep_type, now),
+                )
+                if cursor.rowcount == 0:
+                    continue
+                dep_id = cursor.lastrowid
+                if dep_id is None:
+                    raise ValueError("Failed to retrieve dependency ID")
+                created.append(TaskDependency(dep_id, task_id, depends_on, dep_type, now))
+            after = graph.current_version()
+
+        graph.apply_write(
+            before,
+            after,
+            added=[(d.task_id, d.depends_on) for d in created if d.dep_type == "blocks"],
+        )
+        return created
 
     def remove_dependency(self, task_id: str, depends_on: str) -> bool:
         """Remove a dependency."""
-        with self.db.transaction() as conn:
+        graph = self.graph
+        with self.db.transaction_immediate() as conn:
+            before = graph.current_version()
             cursor = conn.execute(
                 "DELETE FROM task_dependencies WHERE task_id = ? AND depends_on = ?",
                 (task_id, depends_on),
             )
             deleted: bool = cursor.rowcount > 0
-            return deleted
+            after = graph.current_version()
+
+        if deleted:
+            graph.apply_write(before, after, removed=[(task_id, depends_on)])
+        return deleted
 
     def get_blockers(self, task_id: str) -> list[TaskDependency]:
         """Get tasks that block this task (task_id depends on X)."""
@@ -116,26 +174,22 @@ class TaskDependencyManager:
         Check if adding edge task_id -> depends_on creates a cycle.
         This implies exists path depends_on -> ... -> task_id.
         """
-        visited = set()
-        stack = [depends_on]
+        return self.graph.find_path(depends_on, task_id) is not None
 
-        while stack:
-            current = stack.pop()
-            if current == task_id:
-                return True
+    def get_transitive_blockers(self, task_id: str) -> list[str]:
+        """IDs of every task this task depends on, directly or transitively."""
+        return self.graph.transitive_blockers(task_id)
 
-            if current in visited:
-                continue
-            visited.add(current)
+    def topological_order(self, task_ids: Iterable[str]) -> list[str]:
+        """Order task IDs so each task comes after everything that blocks it.
 
-            deps = self.db.fetchall(
-                "SELECT depends_on FROM task_dependencies WHERE task_id = ? AND dep_type = 'blocks'",
-                (current,),
-            )
-            for row in deps:
-                stack.append(row["depends_on"])
-
-        return False
+        Raises:
+            DependencyCycleError: If some of the tasks sit on a cycle
+        """
+        order, cyclic = self.graph.topological_order(task_ids)
+        if cyclic:
+            raise DependencyCycleError(f"Dependency cycle involving: {', '.join(cyclic)}")
+        return order
 
     def get_dependency_tree(
         self,
@@ -150,35 +204,7 @@ class TaskDependencyManager:
           - blocking: tasks that depend on task_id (downstream)
           - both: both
         """
-        result: dict[str, Any] = {"id": task_id}
-
-        if max_depth <= 0:
-            result["_truncated"] = True
-            return result
-
-        if direction in ("blockers", "both"):
-            blockers = self.get_blockers(task_id)
-            if blockers:
-                result["blockers"] = [
-                    self.get_dependency_tree(
-                        b.depends_on, direction="blockers", max_depth=max_depth - 1
-                    )
-                    for b in blockers
-                ]
-
-        if direction in ("blocking", "both"):
-            blocking = self.get_blocking(task_id)
-            if blocking:
-                # blocking contains deps where depends_on = task_id. The other end is task_id.
-                # Use b.task_id (the task that is blocked).
-                result["blocking"] = [
-                    self.get_dependency_tree(
-                        b.task_id, direction="blocking", max_depth=max_depth - 1
-                    )
-                    for b in blocking
-                ]
-
-        return result
+        return self.graph.dependency_tree(task_id, direction=direction, max_depth=max_depth)
 
     def check_cycles(self) -> list[list[str]]:
         """Detect all cycles in 'blocks' dependencies. Returns list of cycles (list of task IDs)."""
@@ -0,0 +1,403 @@
+"""In-memory index of task ``blocks`` dependencies.
+
+Cycle checks and dependency trees used to walk ``task_dependencies`` with one
+query per visited node. ``DependencyGraph`` keeps the adjacency in memory
+instead, loading one project's edges (including edges that cross into other
+projects) the first time a traversal reaches one of its tasks.
+
+Staleness is detected with ``task_dependency_version``, a single-row counter
+bumped by triggers whenever a ``blocks`` edge is inserted, updated or deleted
+(including cascades from task deletes) or a task moves project. Every graph
+operation compares it against the version the cache was built from and drops
+the cache on mismatch, so writes from other connections, processes or raw SQL
+are never missed. ``TaskDependencyManager`` patches the cache in place for its
+own writes so the common path never reloads.
+"""
+
+import heapq
+import logging
+import threading
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
+
+from gobby.storage.database import DatabaseProtocol
+
+logger = logging.getLogger(__name__)
+
+# Project key for IDs that do not belong to any task; never loaded
+_NO_PROJECT = ""
+
+# Chunk size for IN (...) lookups, under SQLite's default variable limit
+_LOOKUP_CHUNK = 500
+
+
+class DependencyGraph:
+    """Lazily loaded, version-checked adjacency of ``blocks`` dependencies.
+
+    Edges point from a task to the tasks it depends on (its blockers).
+    Use ``get_dependency_graph`` to get the shared instance for a database.
+    """
+
+    def __init__(self, db: DatabaseProtocol):
+        # Weak, so the shared per-database cache doesn't keep its key alive
+        self._db_ref = weakref.ref(db)
+        self._lock = threading.RLock()
+        self._version: int | None = None
+        # Insertion-ordered sets: task -> blockers, task -> tasks it blocks
+        self._blockers: dict[str, dict[str, None]] = {}
+        self._blocking: dict[str, dict[str, None]] = {}
+        self._project_of: dict[str, str] = {}
+        self._loaded: set[str] = {_NO_PROJECT}
+
+    @property
+    def db(self) -> DatabaseProtocol:
+        db = self._db_ref()
+        if db is None:
+            raise RuntimeError("DependencyGraph used after its database was garbage collected")
+        return db
+
+    # --- cache maintenance ---
+
+    def current_version(self) -> int | None:
+        """Read the dependency version counter (None if the table is missing)."""
+        try:
+            row = self.db.fetchone("SELECT version FROM task_dependency_version WHERE id = 1")
+        except Exception:
+            return None
+        return int(row["version"]) if row else None
+
+    def _clear(self) -> None:
+        self._blockers.clear()
+        self._blocking.clear()
+        self._project_of.clear()
+        self._loaded = {_NO_PROJECT}
+
+    def _sync(self) -> None:
+        """Drop cached edges if anything changed since they were loaded."""
+        version = self.current_version()
+        if version is None or version != self._version:
+            self._clear()
+        self._version = version
+
+    def invalidate(self) -> None:
+        """Forget all cached edges."""
+        with self._lock:
+            self._clear()
+            self._version = None
+
+    def apply_write(
+        self,
+        before: int | None,
+        after: int | None,
+        added: Iterable[tuple[str, str]] = (),
+        removed: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """Patch the cache with edges written by the caller.
+
+        Args:
+            before: Version read inside the write transaction before writing
+            after: Version read inside the write transaction after writing
+            added: (task_id, depends_on) edges inserted
+            removed: (task_id, depends_on) edges deleted
+        """
+        with self._lock:
+            if after is not None and self._version == after:
+                return  # Already reloaded by someone who saw the commit
+            if before is None or after is None or self._version != before:
+                self._clear()
+                self._version = None
+                return
+            for task_id, depends_on in added:
+                self._add_edge(task_id, depends_on)
+            for task_id, depends_on in removed:
+                self._blockers.get(task_id, {}).pop(depends_on, None)
+                self._blocking.get(depends_on, {}).pop(task_id, None)
+            self._version = after
+
+    def _add_edge(self, task_id: str, depends_on: str) -> None:
+        self._blockers.setdefault(task_id, {})[depends_on] = None
+        self._blocking.setdefault(depends_on, {})[task_id] = None
+
+    def _ensure(self, task_ids: Iterable[str]) -> None:
+        """Make sure the edges of every given task are loaded."""
+        ids = list(dict.fromkeys(task_ids))
+        unknown = [t for t in ids if t not in self._project_of]
+        for i in range(0, len(unknown), _LOOKUP_CHUNK):
+            chunk = unknown[i : i + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.fetchall(
+                f"SELECT id, project_id FROM tasks WHERE id IN ({placeholders})",  # nosec B608
+                tuple(chunk),
+            )
+            for row in rows:
+                self._project_of[row["id"]] = row["project_id"] or _NO_PROJECT
+            for task_id in chunk:
+                self._project_of.setdefault(task_id, _NO_PROJECT)
+
+        for task_id in ids:
+            project_id = self._project_of[task_id]
+            if project_id not in self._loaded:
+                self._load_project(project_id)
+
+    def _load_project(self, project_id: str) -> None:
+        """Load every blocks edge with at least one endpoint in the project."""
+        rows = self.db.fetchall(
+            """SELECT d.id, d.task_id, d.depends_on,
+                      t.project_id AS task_project, b.project_id AS blocker_project
+               FROM tasks t
+               JOIN task_dependencies d ON d.task_id = t.id AND d.dep_type = 'blocks'
+               JOIN tasks b ON b.id = d.depends_on
+               WHERE t.project_id = ?
+               UNION
+               SELECT d.id, d.task_id, d.depends_on,
+                      t.project_id AS task_project, b.project_id AS blocker_project
+               FROM tasks b
+               JOIN task_dependencies d ON d.depends_on = b.id AND d.dep_type = 'blocks'
+               JOIN tasks t ON t.id = d.task_id
+               WHERE b.project_id = ?
+               ORDER BY 1""",
+            (project_id, project_id),
+        )
+        for row in rows:
+            self._add_edge(row["task_id"], row["depends_on"])
+            self._project_of[row["task_id"]] = row["task_project"] or _NO_PROJECT
+            self._project_of[row["depends_on"]] = row["blocker_project"] or _NO_PROJECT
+        self._loaded.add(project_id)
+        logger.debug(f"Loaded {len(rows)} dependency edges for project {project_id}")
+
+    def _blockers_of(self, task_id: str) -> list[str]:
+        if self._project_of.get(task_id) not in self._loaded:
+            self._ensure((task_id,))
+        return list(self._blockers.get(task_id, ()))
+
+    def _blocking_of(self, task_id: str) -> list[str]:
+        if self._project_of.get(task_id) not in self._loaded:
+            self._ensure((task_id,))
+        return list(self._blocking.get(task_id, ()))
+
+    # --- queries ---
+
+    def blockers(self, task_id: str) -> list[str]:
+        """IDs of the tasks ``task_id`` directly depends on."""
+        with self._lock:
+            self._sync()
+            return self._blockers_of(task_id)
+
+    def blocking(self, task_id: str) -> list[str]:
+        """IDs of the tasks that directly depend on ``task_id``."""
+        with self._lock:
+            self._sync()
+            return self._blocking_of(task_id)
+
+    def find_path(self, start: str, goal: str) -> list[str] | None:
+        """Shortest blocker path from ``start`` to ``goal``, or None."""
+        with self._lock:
+            self._sync()
+            return self._find_path(start, goal, self._blockers_of)
+
+    @staticmethod
+    def _find_path(
+        start: str, goal: str, neighbors: Callable[[str], list[str]]
+    ) -> list[str] | None:
+        came_from: dict[str, str | None] = {start: None}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            if current == goal:
+                path = [current]
+                while (prev := came_from[path[-1]]) is not None:
+                    path.append(prev)
+                return path[::-1]
+            for nxt in neighbors(current):
+                if nxt not in came_from:
+                    came_from[nxt] = current
+                    queue.append(nxt)
+        return None
+
+    def find_cycle(self, edges: Iterable[tuple[str, str]]) -> list[str] | None:
+        """Check whether adding ``edges`` would close a cycle.
+
+        Runs one strongly-connected-components pass over the existing graph
+        plus every new edge, so a batch costs a single traversal however many
+        edges it has. Cycles that already exist and do not involve a new edge
+        are ignored, matching the single-edge check.
+
+        Returns:
+            The cycle as a list of task IDs (first == last), or None.
+        """
+        new_edges = list(edges)
+        if not new_edges:
+            return None
+        extra: dict[str, list[str]] = {}
+        for task_id, depends_on in new_edges:
+            extra.setdefault(task_id, []).append(depends_on)
+
+        with self._lock:
+            self._sync()
+            self._ensure(n for edge in new_edges for n in edge)
+
+            def neighbors(node: str) -> list[str]:
+                return self._blockers_of(node) + extra.get(node, [])
+
+            # A new edge closes a cycle iff its blocker can reach back to its
+            # task, so only what the blockers reach needs visiting
+            component = _strongly_connected((d for _, d in new_edges), neighbors)
+            for task_id, depends_on in new_edges:
+                if component.get(task_id, -1) == component[depends_on]:
+                    path = self._find_path(depends_on, task_id, neighbors)
+                    if path is not None:
+                        return [task_id, *path]
+            return None
+
+    def transitive_blockers(self, task_id: str) -> list[str]:
+        """Every task ``task_id`` depends on, directly or not, nearest first."""
+        with self._lock:
+            self._sync()
+            seen: dict[str, None] = {task_id: None}
+            queue = deque([task_id])
+            while queue:
+                for blocker in self._blockers_of(queue.popleft()):
+                    if blocker not in seen:
+                        seen[blocker] = None
+                        queue.append(blocker)
+            del seen[task_id]
+            return list(seen)
+
+    def topological_order(self, task_ids: Iterable[str]) -> tuple[list[str], list[str]]:
+        """Order tasks so every task comes after its (transitive) blockers.
+
+        Ties keep the input order.
+
+        Returns:
+            (ordered, cyclic): the ordered task IDs, and the IDs that could not
+            be placed because they sit on or behind a cycle.
+        """
+        requested = list(dict.fromkeys(task_ids))
+        with self._lock:
+            self._sync()
+            # Close over blockers so indirect constraints are respected
+            nodes: dict[str, None] = dict.fromkeys(requested)
+            queue = deque(requested)
+            while queue:
+                for blocker in self._blockers_of(queue.popleft()):
+                    if blocker not in nodes:
+                        nodes[blocker] = None
+                        queue.append(blocker)
+
+            rank = {node: i for i, node in enumerate(nodes)}
+            remaining = {node: len(self._blockers.get(node, ())) for node in nodes}
+            ready = [(rank[n], n) for n, count in remaining.items() if count == 0]
+            heapq.heapify(ready)
+            order: list[str] = []
+            while ready:
+                _, node = heapq.heappop(ready)
+                order.append(node)
+                for dependent in self._blocking.get(node, ()):
+                    if dependent in remaining:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            heapq.heappush(ready, (rank[dependent], dependent))
+
+        placed = set(order)
+        wanted = set(requested)
+        return (
+            [n for n in order if n in wanted],
+            [n for n in requested if n not in placed],
+        )
+
+    def dependency_tree(
+        self,
+        task_id: str,
+        direction: Literal["blockers", "blocking", "both"] = "both",
+        max_depth: int = 10,
+    ) -> dict[str, Any]:
+        """Nested blockers/blocking tree, same shape as the SQL-backed version."""
+        with self._lock:
+            self._sync()
+            return self._tree(task_id, direction, max_depth)
+
+    def _tree(
+        self,
+        task_id: str,
+        direction: Literal["blockers", "blocking", "both"],
+        max_depth: int,
+    ) -> dict[str, Any]:
+        result: dict[str, Any] = {"id": task_id}
+
+        if max_depth <= 0:
+            result["_truncated"] = True
+            return result
+
+        if direction in ("blockers", "both"):
+            blockers = self._blockers_of(task_id)
+            if blockers:
+                result["blockers"] = [self._tree(b, "blockers", max_depth - 1) for b in blockers]
+
+        if direction in ("blocking", "both"):
+            blocking = self._blocking_of(task_id)
+            if blocking:
+                result["blocking"] = [self._tree(b, "blocking", max_depth - 1) for b in blocking]
+
+        return result
+
+
+def _strongly_connected(
+    roots: Iterable[str], neighbors: Callable[[str], list[str]]
+) -> dict[str, int]:
+    """Iterative Tarjan: map every node reachable from ``roots`` to a component ID."""
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    component: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+
+    for root in roots:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(neighbors(root)))]
+        while work:
+            node, children = work[-1]
+            descended = False
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(neighbors(child))))
+                    descended = True
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            if descended:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component[member] = index[node]
+                    if member == node:
+                        break
+    return component
+
+
+_graphs: "weakref.WeakKeyDictionary[Any, DependencyGraph]" = weakref.WeakKeyDictionary()
+_graphs_lock = threading.Lock()
+
+
+def get_dependency_graph(db: DatabaseProtocol) -> DependencyGraph:
+    """Get the dependency graph shared by every manager on ``db``."""
+    with _graphs_lock:
+        graph = _graphs.get(db)
+        if graph is None:
+            graph = DependencyGraph(db)
+            _graphs[db] = graph
+        return graph
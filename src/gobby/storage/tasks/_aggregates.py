@@ -84,37 +84,16 @@ def count_ready_tasks(
     Returns:
         Count of ready tasks
     """
-    # Uses the same descendant-aware predicate as list_ready_tasks.
-    # The is_descendant_of check uses a recursive CTE to walk up the blocker's
-    # ancestor chain and check if the blocked task (t.id) appears anywhere.
+    # Blocker counts are materialized in task_readiness (see _readiness.py)
     query = """
-    SELECT COUNT(*) as count FROM tasks t
-    WHERE t.status = 'open'
-    AND NOT EXISTS (
-        SELECT 1 FROM task_dependencies d
-        JOIN tasks blocker ON d.depends_on = blocker.id
-        WHERE d.task_id = t.id
-          AND d.dep_type = 'blocks'
-          AND blocker.status NOT IN ('closed', 'review_approved', 'needs_review')
-          -- Exclude ancestor blocked by any descendant (completion block, not work block)
-          -- Check if t.id appears anywhere in blocker's ancestor chain
-          AND NOT EXISTS (
-              WITH RECURSIVE ancestors AS (
-                  SELECT blocker.parent_task_id AS ancestor_id
-                  UNION ALL
-                  SELECT p.parent_task_id
-                  FROM tasks p
-                  JOIN ancestors a ON p.id = a.ancestor_id
-                  WHERE p.parent_task_id IS NOT NULL
-              )
-              SELECT 1 FROM ancestors WHERE ancestor_id = t.id
-          )
-    )
+    SELECT COUNT(*) as count FROM task_readiness r
+    JOIN tasks t ON t.id = r.task_id
+    WHERE t.status = 'open' AND r.open_blockers = 0
     """
     params: list[Any] = []
 
     if project_id:
-        query += " AND t.project_id = ?"
+        query += " AND r.project_id = ?"
         params.append(project_id)
 
     result = db.fetchone(query, tuple(params))
@@ -166,37 +145,16 @@ def count_blocked_tasks(
     Returns:
         Count of blocked tasks
     """
-    # Uses the same descendant-aware predicate as list_ready_tasks.
-    # The is_descendant_of check uses a recursive CTE to walk up the blocker's
-    # ancestor chain and check if the blocked task (t.id) appears anywhere.
+    # Blocker counts are materialized in task_readiness (see _readiness.py)
     query = """
-    SELECT COUNT(*) as count FROM tasks t
-    WHERE t.status = 'open'
-    AND EXISTS (
-        SELECT 1 FROM task_dependencies d
-        JOIN tasks blocker ON d.depends_on = blocker.id
-        WHERE d.task_id = t.id
-          AND d.dep_type = 'blocks'
-          AND blocker.status NOT IN ('closed', 'review_approved', 'needs_review')
-          -- Exclude ancestor blocked by any descendant (completion block, not work block)
-          -- Check if t.id appears anywhere in blocker's ancestor chain
-          AND NOT EXISTS (
-              WITH RECURSIVE ancestors AS (
-                  SELECT blocker.parent_task_id AS ancestor_id
-                  UNION ALL
-                  SELECT p.parent_task_id
-                  FROM tasks p
-                  JOIN ancestors a ON p.id = a.ancestor_id
-                  WHERE p.parent_task_id IS NOT NULL
-              )
-              SELECT 1 FROM ancestors WHERE ancestor_id = t.id
-          )
-    )
+    SELECT COUNT(*) as count FROM task_readiness r
+    JOIN tasks t ON t.id = r.task_id
+    WHERE t.status = 'open' AND r.open_blockers > 0
     """
     params: list[Any] = []
 
     if project_id:
-        query += " AND t.project_id = ?"
+        query += " AND r.project_id = ?"
         params.append(project_id)
 
     result = db.fetchone(query, tuple(params))
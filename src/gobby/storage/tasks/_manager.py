@@ -70,6 +70,7 @@ from gobby.storage.tasks._models import (
 from gobby.storage.tasks._ordering import order_tasks_hierarchically
 from gobby.storage.tasks._path_cache import (
     compute_path_cache,
+    rebuild_project_paths,
     update_descendant_paths,
     update_path_cache,
 )
@@ -82,6 +83,7 @@ from gobby.storage.tasks._queries import (
 from gobby.storage.tasks._queries import (
     list_tasks as _list_tasks,
 )
+from gobby.storage.tasks._readiness import rebuild_task_readiness, verify_task_readiness
 from gobby.storage.tasks._search import TaskFTS5Searcher
 
 logger = logging.getLogger(__name__)
@@ -160,6 +162,20 @@ class LocalTaskManager:
         """
         return update_descendant_paths(self.db, task_id)
 
+    def rebuild_project_paths(self, project_id: str) -> int:
+        """Recompute path_cache for every task in a project in one pass.
+
+        Use this after bulk changes to a project's task tree, such as a
+        JSONL import. Leaves updated_at untouched.
+
+        Args:
+            project_id: The project to recompute
+
+        Returns:
+            Number of tasks whose path_cache changed
+        """
+        return rebuild_project_paths(self.db, project_id)
+
     def create_task(
         self,
         project_id: str,
@@ -730,3 +746,21 @@ class LocalTaskManager:
         """
         searcher = self._ensure_searcher()
         return searcher.reindex()
+
+    def rebuild_readiness(self) -> int:
+        """Recompute materialized task readiness from scratch.
+
+        Normally triggers keep task_readiness in sync. Use this for repair.
+
+        Returns:
+            Number of tasks recomputed
+        """
+        return rebuild_task_readiness(self.db)
+
+    def verify_readiness(self) -> list[dict[str, Any]]:
+        """Compare materialized task readiness against a fresh computation.
+
+        Returns:
+            List of drift entries (task_id, field, stored, expected); empty if in sync
+        """
+        return verify_task_readiness(self.db)
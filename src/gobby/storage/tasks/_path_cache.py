@@ -2,6 +2,11 @@
 
 This module provides functions for computing and updating task path caches,
 which represent the hierarchical position of a task as a dotted seq_num path.
+
+Paths are computed with recursive CTEs: one query walks a task's ancestors,
+and one query computes every path in a subtree or a whole project, so
+re-parenting an epic or importing a task tree costs a single read plus one
+batched write rather than a query per task per level.
 """
 
 import logging
@@ -11,6 +16,54 @@ from gobby.storage.database import DatabaseProtocol
 
 logger = logging.getLogger(__name__)
 
+# Safety limit to prevent infinite loops on parent cycles (levels per path)
+MAX_PATH_DEPTH = 100
+
+# ?1 is the task (or project) ID and ?2 the depth limit in every query below.
+
+# Walks up from a task. The chain is complete only if its last row has no
+# parent; it stops early at a missing task or a NULL seq_num.
+_ANCESTORS_CTE = """
+    ancestors(id, parent_id, path, depth) AS (
+        SELECT id, parent_task_id, CAST(seq_num AS TEXT), 1
+        FROM tasks WHERE id = ?1 AND seq_num IS NOT NULL
+        UNION ALL
+        SELECT t.id, t.parent_task_id, t.seq_num || '.' || a.path, a.depth + 1
+        FROM tasks t JOIN ancestors a ON t.id = a.parent_id
+        WHERE t.seq_num IS NOT NULL AND a.depth < ?2
+    )
+"""
+
+# Extends paths down from the rows of `roots(id, path, depth)`. Tasks under
+# a NULL seq_num get no path, like their ancestor.
+_DESCENDANTS_CTE = """
+    tree(id, path, depth) AS (
+        SELECT id, path, depth FROM roots
+        UNION ALL
+        SELECT t.id, tree.path || '.' || t.seq_num, tree.depth + 1
+        FROM tasks t JOIN tree ON t.parent_task_id = tree.id
+        WHERE t.seq_num IS NOT NULL AND tree.depth < ?2
+    )
+"""
+
+_SUBTREE_PATHS_SQL = f"""
+    WITH RECURSIVE {_ANCESTORS_CTE},
+    roots(id, path, depth) AS (
+        SELECT ?1, path, depth FROM ancestors WHERE parent_id IS NULL
+    ),
+    {_DESCENDANTS_CTE}
+    SELECT id, path FROM tree
+"""
+
+_PROJECT_PATHS_SQL = f"""
+    WITH RECURSIVE roots(id, path, depth) AS (
+        SELECT id, CAST(seq_num AS TEXT), 1 FROM tasks
+        WHERE project_id = ?1 AND parent_task_id IS NULL AND seq_num IS NOT NULL
+    ),
+    {_DESCENDANTS_CTE}
+    SELECT id, path FROM tree
+"""
+
 
 def compute_path_cache(db: DatabaseProtocol, task_id: str) -> str | None:
     """Compute the hierarchical path for a task.
@@ -26,39 +79,70 @@ def compute_path_cache(db: DatabaseProtocol, task_id: str) -> str | None:
         Dotted path string (e.g., '1.3.47'), or None if task not found
         or any task in the chain is missing a seq_num.
     """
-    # Build path by walking up parent chain
-    path_parts: list[str] = []
-    current_id: str | None = task_id
-
-    # Safety limit to prevent infinite loops (max 100 levels deep)
-    max_depth = 100
-    depth = 0
-
-    while current_id and depth < max_depth:
-        row = db.fetchone(
-            "SELECT seq_num, parent_task_id FROM tasks WHERE id = ?",
-            (current_id,),
-        )
-        if not row:
-            # Task not found
-            return None
+    row = db.fetchone(
+        f"""WITH RECURSIVE {_ANCESTORS_CTE}
+            SELECT path, parent_id, depth FROM ancestors ORDER BY depth DESC LIMIT 1""",
+        (task_id, MAX_PATH_DEPTH),
+    )
+    if not row:
+        # Task not found, or its seq_num is not yet assigned
+        return None
+    if row["parent_id"] is not None:
+        if row["depth"] >= MAX_PATH_DEPTH:
+            logger.warning(
+                f"Task {task_id} exceeded max depth ({MAX_PATH_DEPTH}) when computing path"
+            )
+        # An ancestor is missing or has no seq_num
+        return None
+    return str(row["path"])
 
-        seq_num = row["seq_num"]
-        if seq_num is None:
-            # seq_num not yet assigned
-            return None
 
-        path_parts.append(str(seq_num))
-        current_id = row["parent_task_id"]
-        depth += 1
+def compute_subtree_paths(db: DatabaseProtocol, task_id: str) -> dict[str, str]:
+    """Compute paths for a task and all its descendants in one query.
 
-    if depth >= max_depth:
-        logger.warning(f"Task {task_id} exceeded max depth ({max_depth}) when computing path")
-        return None
+    Returns:
+        task ID -> path for every task whose path could be computed (none
+        if the task's own path can't be).
+    """
+    rows = db.fetchall(_SUBTREE_PATHS_SQL, (task_id, MAX_PATH_DEPTH))
+    return {r["id"]: r["path"] for r in rows}
+
+
+def compute_project_paths(db: DatabaseProtocol, project_id: str) -> dict[str, str]:
+    """Compute paths for every task in a project reachable from a root task."""
+    rows = db.fetchall(_PROJECT_PATHS_SQL, (project_id, MAX_PATH_DEPTH))
+    return {r["id"]: r["path"] for r in rows}
+
+
+def write_path_caches(
+    db: DatabaseProtocol, paths: dict[str, str], touch_updated_at: bool = True
+) -> int:
+    """Store computed paths in one transaction, skipping rows already up to date.
+
+    Args:
+        db: Database protocol instance
+        paths: task ID -> path
+        touch_updated_at: Also set updated_at on rows whose path changed
 
-    # Reverse to get root-to-leaf order
-    path_parts.reverse()
-    return ".".join(path_parts)
+    Returns:
+        Number of rows whose path_cache changed
+    """
+    if not paths:
+        return 0
+    with db.transaction() as conn:
+        if touch_updated_at:
+            now = datetime.now(UTC).isoformat()
+            cursor = conn.executemany(
+                """UPDATE tasks SET path_cache = ?, updated_at = ?
+                   WHERE id = ? AND path_cache IS NOT ?""",
+                [(path, now, task_id, path) for task_id, path in paths.items()],
+            )
+        else:
+            cursor = conn.executemany(
+                "UPDATE tasks SET path_cache = ? WHERE id = ? AND path_cache IS NOT ?",
+                [(path, task_id, path) for task_id, path in paths.items()],
+            )
+        return cursor.rowcount
 
 
 def update_path_cache(db: DatabaseProtocol, task_id: str) -> str | None:
@@ -91,20 +175,24 @@ def update_descendant_paths(db: DatabaseProtocol, task_id: str) -> int:
         task_id: The root task ID to start updating from
 
     Returns:
-        Number of tasks updated
+        Number of tasks whose path could be computed
     """
-    updated_count = 0
+    paths = compute_subtree_paths(db, task_id)
+    write_path_caches(db, paths)
+    return len(paths)
 
-    # Update the task itself
-    if update_path_cache(db, task_id):
-        updated_count += 1
 
-    # Find and update all descendants (recursive)
-    children = db.fetchall(
-        "SELECT id FROM tasks WHERE parent_task_id = ?",
-        (task_id,),
-    )
-    for child in children:
-        updated_count += update_descendant_paths(db, child["id"])
+def rebuild_project_paths(
+    db: DatabaseProtocol, project_id: str, touch_updated_at: bool = False
+) -> int:
+    """Recompute path_cache for a whole project, e.g. after a bulk import.
+
+    Args:
+        db: Database protocol instance
+        project_id: Project whose task tree to recompute
+        touch_updated_at: Also set updated_at on rows whose path changed
 
-    return updated_count
+    Returns:
+        Number of rows whose path_cache changed
+    """
+    return write_path_caches(db, compute_project_paths(db, project_id), touch_updated_at)
@@ -140,70 +140,20 @@ def list_ready_tasks(
     tree structures. We fetch all ready tasks, order them hierarchically,
     then return the first N tasks in tree traversal order.
     """
-    # Use recursive CTE to find tasks with ready parent chains
+    # Readiness is materialized in task_readiness (see _readiness.py), so this
+    # is an index scan on (project_id, is_ready, priority, created_at)
     query = """
-    WITH RECURSIVE ready_tasks AS (
-        -- Base case: open/in_progress tasks with no parent and no external blocking deps
-        SELECT t.id FROM tasks t
-        WHERE t.status IN ('open', 'in_progress')
-        AND t.parent_task_id IS NULL
-        AND NOT EXISTS (
-            SELECT 1 FROM task_dependencies d
-            JOIN tasks blocker ON d.depends_on = blocker.id
-            WHERE d.task_id = t.id
-              AND d.dep_type = 'blocks'
-              AND blocker.status NOT IN ('closed', 'review_approved', 'needs_review')
-              -- Exclude ancestor blocked by any descendant (completion block, not work block)
-              AND NOT EXISTS (
-                  WITH RECURSIVE ancestors AS (
-                      SELECT blocker.parent_task_id AS ancestor_id
-                      UNION ALL
-                      SELECT p.parent_task_id
-                      FROM tasks p
-                      JOIN ancestors a ON p.id = a.ancestor_id
-                      WHERE p.parent_task_id IS NOT NULL
-                  )
-                  SELECT 1 FROM ancestors WHERE ancestor_id = t.id
-              )
-        )
-
-        UNION ALL
-
-        -- Recursive case: open/in_progress tasks whose parent is ready and no external blocking deps
-        SELECT t.id FROM tasks t
-        JOIN ready_tasks rt ON t.parent_task_id = rt.id
-        WHERE t.status IN ('open', 'in_progress')
-        AND NOT EXISTS (
-            SELECT 1 FROM task_dependencies d
-            JOIN tasks blocker ON d.depends_on = blocker.id
-            WHERE d.task_id = t.id
-              AND d.dep_type = 'blocks'
-              AND blocker.status NOT IN ('closed', 'review_approved', 'needs_review')
-              -- Exclude ancestor blocked by any descendant (completion block, not work block)
-              AND NOT EXISTS (
-                  WITH RECURSIVE ancestors AS (
-                      SELECT blocker.parent_task_id AS ancestor_id
-                      UNION ALL
-                      SELECT p.parent_task_id
-                      FROM tasks p
-                      JOIN ancestors a ON p.id = a.ancestor_id
-                      WHERE p.parent_task_id IS NOT NULL
-                  )
-                  SELECT 1 FROM ancestors WHERE ancestor_id = t.id
-              )
-        )
-    )
-    SELECT t.* FROM tasks t
-    JOIN ready_tasks rt ON t.id = rt.id
-    WHERE 1=1
+    SELECT t.* FROM task_readiness r
+    JOIN tasks t ON t.id = r.task_id
+    WHERE r.is_ready = 1
     """
     params: list[Any] = []
 
     if project_id:
-        query += " AND t.project_id = ?"
+        query += " AND r.project_id = ?"
         params.append(project_id)
     if priority:
-        query += " AND t.priority = ?"
+        query += " AND r.priority = ?"
         params.append(priority)
     if task_type:
         query += " AND t.task_type = ?"
@@ -216,9 +166,7 @@ def list_ready_tasks(
         params.append(parent_task_id)
 
     # Fetch all matching tasks (no SQL limit) so we can order hierarchically first
-    internal_limit = 1000
-    query += " ORDER BY t.priority ASC, t.created_at ASC LIMIT ?"
-    params.append(internal_limit)
+    query += " ORDER BY r.priority ASC, r.created_at ASC"
 
     rows = db.fetchall(query, tuple(params))
     tasks = [Task.from_row(row) for row in rows]
@@ -247,41 +195,21 @@ def list_blocked_tasks(
     tree structures.
     """
     query = """
-    SELECT t.* FROM tasks t
-    WHERE t.status = 'open'
-    AND EXISTS (
-        SELECT 1 FROM task_dependencies d
-        JOIN tasks blocker ON d.depends_on = blocker.id
-        WHERE d.task_id = t.id
-          AND d.dep_type = 'blocks'
-          AND blocker.status NOT IN ('closed', 'review_approved', 'needs_review')
-          -- Exclude ancestor blocked by any descendant (completion block, not work block)
-          AND NOT EXISTS (
-              WITH RECURSIVE ancestors AS (
-                  SELECT blocker.parent_task_id AS ancestor_id
-                  UNION ALL
-                  SELECT p.parent_task_id
-                  FROM tasks p
-                  JOIN ancestors a ON p.id = a.ancestor_id
-                  WHERE p.parent_task_id IS NOT NULL
-              )
-              SELECT 1 FROM ancestors WHERE ancestor_id = t.id
-          )
-    )
+    SELECT t.* FROM task_readiness r
+    JOIN tasks t ON t.id = r.task_id
+    WHERE t.status = 'open' AND r.open_blockers > 0
     """
     params: list[Any] = []
 
     if project_id:
-        query += " AND t.project_id = ?"
+        query += " AND r.project_id = ?"
         params.append(project_id)
     if parent_task_id:
         query += " AND t.parent_task_id = ?"
         params.append(parent_task_id)
 
     # Fetch all matching tasks (no SQL limit) so we can order hierarchically first
-    internal_limit = 1000
-    query += " ORDER BY t.priority ASC, t.created_at ASC LIMIT ?"
-    params.append(internal_limit)
+    query += " ORDER BY r.priority ASC, r.created_at ASC"
 
     rows = db.fetchall(query, tuple(params))
     tasks = [Task.from_row(row) for row in rows]
@@ -0,0 +1,321 @@
+"""Materialized task readiness.
+
+The ``task_readiness`` table holds one row per task with:
+
+- ``open_blockers``: unresolved external ``blocks`` dependencies (a task
+  blocked by its own descendant is a completion block, not a work block, and
+  is not counted)
+- ``ancestor_blocked``: 1 if the parent (or any task above it) is not ready
+- ``is_ready``: open/in_progress, no open blockers and no blocked ancestor
+
+Triggers on ``tasks``, ``task_dependencies`` and ``task_readiness`` keep the
+rows current inside the writing transaction, so ready/blocked queries become
+index scans on ``(project_id, is_ready, priority, created_at)`` instead of a
+recursive walk over every open task. ``rebuild_task_readiness`` recomputes
+the table from scratch; ``verify_task_readiness`` reports drift.
+"""
+
+import logging
+from typing import Any
+
+from gobby.storage.database import DatabaseProtocol
+
+logger = logging.getLogger(__name__)
+
+# Blockers in these statuses no longer block their dependents
+RESOLVED_STATUSES = ("closed", "review_approved", "needs_review")
+
+# Statuses that can appear in the ready queue
+ACTIVE_STATUSES = ("open", "in_progress")
+
+_RESOLVED_SQL = "('closed', 'review_approved', 'needs_review')"
+_ACTIVE_SQL = "('open', 'in_progress')"
+
+
+def _open_blockers_sql(task: str) -> str:
+    """Correlated subquery counting unresolved external blockers of ``task``."""
+    return f"""(
+        SELECT COUNT(*) FROM task_dependencies d
+        JOIN tasks b ON b.id = d.depends_on
+        WHERE d.task_id = {task}
+          AND d.dep_type = 'blocks'
+          AND b.status NOT IN {_RESOLVED_SQL}
+          AND {task} NOT IN (
+              SELECT id FROM (
+                  WITH RECURSIVE anc(id) AS (
+                      SELECT b.parent_task_id
+                      UNION
+                      SELECT p.parent_task_id FROM tasks p JOIN anc ON p.id = anc.id
+                      WHERE p.parent_task_id IS NOT NULL
+                  )
+                  SELECT id FROM anc WHERE id IS NOT NULL
+              )
+          )
+    )"""
+
+
+def _recompute_subtree_sql(root: str) -> str:
+    """Statements recomputing is_ready/ancestor_blocked for ``root`` and its descendants.
+
+    The root starts from its parent's stored readiness; every change to a
+    task's own readiness inputs re-runs this for that task, so stored parent
+    values are correct by the time the trigger finishes.
+    """
+    return f"""
+        INSERT OR REPLACE INTO task_readiness_work (task_id, parent_ready, ready)
+        SELECT id, parent_ready, ready FROM (
+            WITH RECURSIVE sub(id, parent_ready, ready) AS (
+                SELECT id, parent_ready, parent_ready AND ok FROM (
+                    SELECT t.id AS id,
+                        COALESCE(
+                            (SELECT p.is_ready FROM task_readiness p
+                             WHERE p.task_id = t.parent_task_id), 1
+                        ) AS parent_ready,
+                        (COALESCE(t.status, '') IN {_ACTIVE_SQL} AND r.open_blockers = 0) AS ok
+                    FROM tasks t JOIN task_readiness r ON r.task_id = t.id
+                    WHERE t.id = {root}
+                )
+                UNION
+                SELECT c.id, sub.ready,
+                    sub.ready AND COALESCE(c.status, '') IN {_ACTIVE_SQL} AND r.open_blockers = 0
+                FROM sub
+                JOIN tasks c ON c.parent_task_id = sub.id
+                JOIN task_readiness r ON r.task_id = c.id
+            )
+            SELECT id, parent_ready, ready FROM sub
+        );
+        UPDATE task_readiness SET
+            is_ready = (SELECT w.ready FROM task_readiness_work w
+                        WHERE w.task_id = task_readiness.task_id),
+            ancestor_blocked = (SELECT NOT w.parent_ready FROM task_readiness_work w
+                                WHERE w.task_id = task_readiness.task_id)
+        WHERE task_id IN (SELECT task_id FROM task_readiness_work);
+        DELETE FROM task_readiness_work;
+    """
+
+
+def _ancestors_sql(task: str) -> str:
+    """``task`` itself plus all of its ancestors."""
+    return f"""
+        SELECT id FROM (
+            WITH RECURSIVE anc(id) AS (
+                SELECT {task}
+                UNION
+                SELECT p.parent_task_id FROM tasks p JOIN anc ON p.id = anc.id
+                WHERE p.parent_task_id IS NOT NULL
+            )
+            SELECT id FROM anc WHERE id IS NOT NULL
+        )
+    """
+
+
+def setup_task_readiness(db: DatabaseProtocol) -> None:
+    """Create the task_readiness tables and the triggers that maintain them."""
+    recount = f"open_blockers = {_open_blockers_sql('task_readiness.task_id')}"
+    db.connection.executescript(f"""
+        CREATE TABLE IF NOT EXISTS task_readiness (
+            task_id TEXT PRIMARY KEY REFERENCES tasks(id) ON DELETE CASCADE,
+            project_id TEXT NOT NULL,
+            priority INTEGER,
+            created_at TEXT,
+            open_blockers INTEGER NOT NULL DEFAULT 0,
+            ancestor_blocked INTEGER NOT NULL DEFAULT 0,
+            is_ready INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_task_readiness_ready
+            ON task_readiness(project_id, is_ready, priority, created_at);
+        CREATE INDEX IF NOT EXISTS idx_task_readiness_ready_all
+            ON task_readiness(is_ready, priority, created_at);
+
+        -- Scratch rows for subtree recomputation; always empty between statements
+        CREATE TABLE IF NOT EXISTS task_readiness_work (
+            task_id TEXT PRIMARY KEY,
+            parent_ready INTEGER NOT NULL,
+            ready INTEGER NOT NULL
+        );
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_task_ai AFTER INSERT ON tasks BEGIN
+            INSERT OR REPLACE INTO task_readiness (task_id, project_id, priority, created_at)
+            VALUES (new.id, new.project_id, new.priority, new.created_at);
+            UPDATE task_readiness SET {recount} WHERE task_id = new.id;
+            {_recompute_subtree_sql("new.id")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_task_status AFTER UPDATE OF status ON tasks
+        WHEN old.status IS NOT new.status BEGIN
+            UPDATE task_readiness SET {recount}
+            WHERE task_id IN (
+                SELECT task_id FROM task_dependencies
+                WHERE depends_on = new.id AND dep_type = 'blocks'
+            );
+            {_recompute_subtree_sql("new.id")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_task_parent
+        AFTER UPDATE OF parent_task_id ON tasks
+        WHEN old.parent_task_id IS NOT new.parent_task_id BEGIN
+            -- Old and new ancestors may have gained or lost descendant blockers
+            UPDATE task_readiness SET {recount}
+            WHERE task_id IN ({_ancestors_sql("old.parent_task_id")})
+               OR task_id IN ({_ancestors_sql("new.parent_task_id")});
+            {_recompute_subtree_sql("new.id")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_task_fields
+        AFTER UPDATE OF project_id, priority, created_at ON tasks BEGIN
+            UPDATE task_readiness
+            SET project_id = new.project_id, priority = new.priority, created_at = new.created_at
+            WHERE task_id = new.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_dep_ai AFTER INSERT ON task_dependencies
+        WHEN new.dep_type = 'blocks' BEGIN
+            UPDATE task_readiness SET {recount} WHERE task_id = new.task_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_dep_ad AFTER DELETE ON task_dependencies
+        WHEN old.dep_type = 'blocks' BEGIN
+            UPDATE task_readiness SET {recount} WHERE task_id = old.task_id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_dep_au AFTER UPDATE ON task_dependencies
+        BEGIN
+            UPDATE task_readiness SET {recount} WHERE task_id IN (old.task_id, new.task_id);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS task_readiness_blockers
+        AFTER UPDATE OF open_blockers ON task_readiness
+        WHEN old.open_blockers IS NOT new.open_blockers BEGIN
+            {_recompute_subtree_sql("new.task_id")}
+        END;
+    """)
+
+
+def compute_task_readiness(db: DatabaseProtocol) -> dict[str, dict[str, Any]]:
+    """Compute readiness for every task from the source tables.
+
+    Returns:
+        Mapping of task ID to a dict with project_id, priority, created_at,
+        open_blockers, ancestor_blocked and is_ready.
+    """
+    rows = db.fetchall(
+        f"""SELECT t.id, t.parent_task_id, t.status, t.project_id, t.priority, t.created_at,
+                   {_open_blockers_sql("t.id")} AS open_blockers
+            FROM tasks t"""  # nosec B608
+    )
+    tasks = {row["id"]: row for row in rows}
+    ready: dict[str, bool] = {}
+
+    def is_ready(task_id: str) -> bool:
+        # Walk up to the first task with a known answer, then fill in on the way down
+        chain: list[str] = []
+        current: str | None = task_id
+        while (
+            current is not None
+            and current in tasks
+            and current not in ready
+            and current not in chain
+        ):
+            chain.append(current)
+            current = tasks[current]["parent_task_id"]
+        if current is None:
+            parent_ready = True
+        elif current in chain:
+            # Parent cycle: nothing on it can be ready
+            parent_ready = False
+        else:
+            parent_ready = ready.get(current, True)
+        for tid in reversed(chain):
+            row = tasks[tid]
+            parent_ready = (
+                parent_ready and row["status"] in ACTIVE_STATUSES and row["open_blockers"] == 0
+            )
+            ready[tid] = parent_ready
+        return ready[task_id]
+
+    result: dict[str, dict[str, Any]] = {}
+    for task_id, row in tasks.items():
+        parent_id = row["parent_task_id"]
+        parent_ready = is_ready(parent_id) if parent_id in tasks else True
+        result[task_id] = {
+            "project_id": row["project_id"],
+            "priority": row["priority"],
+            "created_at": row["created_at"],
+            "open_blockers": row["open_blockers"],
+            "ancestor_blocked": int(not parent_ready),
+            "is_ready": int(is_ready(task_id)),
+        }
+    return result
+
+
+def rebuild_task_readiness(db: DatabaseProtocol) -> int:
+    """Recompute the task_readiness table from scratch.
+
+    Returns:
+        Number of tasks written
+    """
+    readiness = compute_task_readiness(db)
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM task_readiness")
+        conn.execute("DELETE FROM task_readiness_work")
+        conn.executemany(
+            """INSERT INTO task_readiness (
+                   task_id, project_id, priority, created_at,
+                   open_blockers, ancestor_blocked, is_ready
+               ) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    task_id,
+                    r["project_id"],
+                    r["priority"],
+                    r["created_at"],
+                    r["open_blockers"],
+                    r["ancestor_blocked"],
+                    r["is_ready"],
+                )
+                for task_id, r in readiness.items()
+            ],
+        )
+    logger.debug(f"Rebuilt task readiness for {len(readiness)} tasks")
+    return len(readiness)
+
+
+def verify_task_readiness(db: DatabaseProtocol) -> list[dict[str, Any]]:
+    """Compare stored readiness against a fresh computation.
+
+    Returns:
+        One dict per drifted task: task_id, field, stored and expected values.
+        ``field`` is "row" when the task has no row (or the row has no task).
+    """
+    expected = compute_task_readiness(db)
+    stored = {row["task_id"]: row for row in db.fetchall("SELECT * FROM task_readiness")}
+    fields = (
+        "project_id",
+        "priority",
+        "created_at",
+        "open_blockers",
+        "ancestor_blocked",
+        "is_ready",
+    )
+
+    drift: list[dict[str, Any]] = []
+    for task_id, want in expected.items():
+        row = stored.get(task_id)
+        if row is None:
+            drift.append(
+                {"task_id": task_id, "field": "row", "stored": None, "expected": "present"}
+            )
+            continue
+        for field in fields:
+            if row[field] != want[field]:
+                drift.append(
+                    {
+                        "task_id": task_id,
+                        "field": field,
+                        "stored": row[field],
+                        "expected": want[field],
+                    }
+                )
+    for task_id in stored.keys() - expected.keys():
+        drift.append({"task_id": task_id, "field": "row", "stored": "present", "expected": None})
+    return drift
@@ -3,6 +3,7 @@
 import hashlib
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from sqlite3 import Row
@@ -15,6 +16,25 @@ logger = logging.getLogger(__name__)
 
 DefinitionSource = Literal["installed", "agent", "project", "custom"]
 
+# Process-wide rule generation counter. Bumped on every write that can change
+# rule evaluation (definition writes, rule syncs, overrides, enforcement toggle)
+# so compiled rule caches know when to rebuild.
+_rule_generation = 0
+_rule_generation_lock = threading.Lock()
+
+
+def get_rule_generation() -> int:
+    """Return the current rule generation."""
+    return _rule_generation
+
+
+def bump_rule_generation() -> int:
+    """Invalidate compiled rule caches. Returns the new generation."""
+    global _rule_generation
+    with _rule_generation_lock:
+        _rule_generation += 1
+        return _rule_generation
+
 
 def compute_definition_hash(definition_json: str) -> str:
     """Compute a SHA-256 hash of a definition JSON string.
@@ -151,6 +171,7 @@ class LocalWorkflowDefinitionManager:
                 ),
             )
 
+        bump_rule_generation()
         return self.get(definition_id)
 
     def get(self, definition_id: str, include_deleted: bool = False) -> WorkflowDefinitionRow:
@@ -201,6 +222,7 @@ class LocalWorkflowDefinitionManager:
 
         values["updated_at"] = datetime.now(UTC).isoformat()
         self.db.safe_update("workflow_definitions", values, "id = ?", (definition_id,))
+        bump_rule_generation()
         return self.get(definition_id)
 
     def delete(self, definition_id: str) -> bool:
@@ -211,13 +233,17 @@ class LocalWorkflowDefinitionManager:
                 "UPDATE workflow_definitions SET deleted_at = ?, updated_at = ? WHERE id = ? AND deleted_at IS NULL",
                 (now, now, definition_id),
             )
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+        bump_rule_generation()
+        return deleted
 
     def hard_delete(self, definition_id: str) -> bool:
         """Permanently delete a workflow definition from the database."""
         with self.db.transaction() as conn:
             cursor = conn.execute("DELETE FROM workflow_definitions WHERE id = ?", (definition_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+        bump_rule_generation()
+        return deleted
 
     def restore(self, definition_id: str) -> WorkflowDefinitionRow:
         """Restore a soft-deleted workflow definition."""
@@ -229,6 +255,7 @@ class LocalWorkflowDefinitionManager:
             )
             if cursor.rowcount == 0:
                 raise ValueError(f"Workflow definition {definition_id} not found or not deleted")
+        bump_rule_generation()
         return self.get(definition_id)
 
     def purge_deleted(self, older_than_days: int = 30) -> int:
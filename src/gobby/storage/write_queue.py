@@ -0,0 +1,357 @@
+"""Single-writer queue for SQLite.
+
+A dedicated thread owns one write connection and drains an ordered queue of
+statements, committing them in batches (group commit). Callers get a
+``concurrent.futures.Future`` per statement that resolves once the batch
+containing it has committed.
+
+Each statement runs inside its own SAVEPOINT so a failing statement only
+fails its own future; the rest of the batch still commits. If the writer
+thread dies, every queued and in-flight future fails with the error and the
+next write starts a new thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Defaults tuned for hook-path writes: small batches commit quickly,
+# a large backlog is still bounded so producers feel back-pressure.
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_QUEUE = 10_000
+
+# Number of recent commit latencies kept for percentile reporting
+_LATENCY_WINDOW = 512
+
+# How long a producer waits on a full queue before re-checking the writer
+_ENQUEUE_WAIT_S = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class WriteResult:
+    """Outcome of a queued write statement."""
+
+    rowcount: int
+    lastrowid: int | None
+
+
+@dataclass(slots=True)
+class _WriteOp:
+    """A queued write. ``sql`` of None is a flush barrier."""
+
+    sql: str | None
+    params: list[tuple[Any, ...]]
+    many: bool
+    future: Future[WriteResult]
+
+
+class DatabaseWriter:
+    """Background thread that serializes and group-commits SQLite writes."""
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        name: str = "gobby-db-writer",
+    ) -> None:
+        """
+        Initialize the writer (does not start the thread).
+
+        Args:
+            connect: Factory returning a new autocommit connection for the writer thread.
+            max_batch: Maximum number of queued operations committed per transaction.
+            max_queue: Maximum queued operations before ``submit`` blocks (back-pressure).
+            name: Thread name.
+        """
+        self._connect = connect
+        self._max_batch = max(1, max_batch)
+        self._queue: queue.Queue[_WriteOp | None] = queue.Queue(maxsize=max_queue)
+        self._name = name
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        # Serializes enqueueing with the writer thread's shutdown, so no op is
+        # queued after a dead thread's final drain
+        self._enqueue_lock = threading.Lock()
+        self._in_flight: list[_WriteOp] = []
+        self._closed = False
+
+        # Stats
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._statements = 0
+        self._failed = 0
+        self._latencies_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._max_latency_ms = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the writer thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the writer thread if it is not already running."""
+        with self._start_lock:
+            if self._closed:
+                raise RuntimeError("DatabaseWriter is closed")
+            if self.is_running:
+                return
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def submit(self, sql: str, params: tuple[Any, ...] = ()) -> Future[WriteResult]:
+        """Queue a single write statement."""
+        return self._enqueue(_WriteOp(sql, [params], False, Future()))
+
+    def submit_many(self, sql: str, params_list: list[tuple[Any, ...]]) -> Future[WriteResult]:
+        """Queue a statement executed once per parameter set (``executemany``)."""
+        return self._enqueue(_WriteOp(sql, list(params_list), True, Future()))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything queued before this call has been processed.
+
+        Writes that failed, including those failed because the writer thread
+        died, report it through their own futures.
+
+        Returns:
+            True if the queue drained within ``timeout``, False otherwise.
+        """
+        if not self.is_running:
+            return True
+        try:
+            barrier = self._enqueue(_WriteOp(None, [], False, Future()))
+        except RuntimeError:
+            # Closed concurrently; close() drains the queue
+            return True
+        try:
+            barrier.result(timeout=timeout)
+            return True
+        except TimeoutError:
+            return False
+        except Exception as e:
+            logger.warning(f"DatabaseWriter flush interrupted: {e}")
+            return False
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Drain pending writes and stop the writer thread."""
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            logger.warning("DatabaseWriter did not stop within timeout")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth and commit latency statistics."""
+        with self._stats_lock:
+            latencies = sorted(self._latencies_ms)
+            batches = self._batches
+            statements = self._statements
+            failed = self._failed
+            max_latency = self._max_latency_ms
+
+        def _pct(p: float) -> float:
+            if not latencies:
+                return 0.0
+            idx = min(len(latencies) - 1, int(round(p * (len(latencies) - 1))))
+            return round(latencies[idx], 3)
+
+        return {
+            "running": self.is_running,
+            "queue_depth": self._queue.qsize(),
+            "batches_committed": batches,
+            "statements_committed": statements,
+            "statements_failed": failed,
+            "avg_batch_size": round(statements / batches, 2) if batches else 0.0,
+            "commit_latency_ms": {
+                "p50": _pct(0.50),
+                "p99": _pct(0.99),
+                "max": round(max_latency, 3),
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, op: _WriteOp) -> Future[WriteResult]:
+        while True:
+            with self._enqueue_lock:
+                if self._closed:
+                    raise RuntimeError("DatabaseWriter is closed")
+                if not self.is_running:
+                    self.start()
+                try:
+                    self._queue.put(op, timeout=_ENQUEUE_WAIT_S)
+                    return op.future
+                except queue.Full:
+                    # Back-pressure: release the lock so a dying writer can drain
+                    pass
+
+    def _run(self) -> None:
+        conn: sqlite3.Connection | None = None
+        error: BaseException = RuntimeError("DatabaseWriter thread stopped")
+        try:
+            conn = self._connect()
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    self._drain_remaining(conn)
+                    return
+                batch = [first]
+                stop = False
+                while len(batch) < self._max_batch:
+                    try:
+                        op = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if op is None:
+                        stop = True
+                        break
+                    batch.append(op)
+                self._commit_batch(conn, batch)
+                if stop:
+                    self._drain_remaining(conn)
+                    return
+        except BaseException as e:
+            error = e
+            logger.error(f"DatabaseWriter thread crashed: {e}", exc_info=True)
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.debug(f"Writer connection close failed: {e}")
+            self._fail_outstanding(error)
+
+    def _fail_outstanding(self, error: BaseException) -> None:
+        """Fail in-flight and queued writes so no caller waits on a dead thread."""
+        self._fail_batch(self._in_flight, error)
+        self._in_flight = []
+        # Drain once unlocked so producers blocked on a full queue can finish,
+        # then again under the lock before marking the thread gone
+        self._fail_batch(self._take_queued(), error)
+        with self._enqueue_lock:
+            self._fail_batch(self._take_queued(), error)
+            if self._thread is threading.current_thread():
+                self._thread = None
+
+    def _take_queued(self) -> list[_WriteOp]:
+        ops: list[_WriteOp] = []
+        while True:
+            try:
+                op = self._queue.get_nowait()
+            except queue.Empty:
+                return ops
+            if op is not None:
+                ops.append(op)
+
+    def _fail_batch(self, batch: list[_WriteOp], error: BaseException) -> None:
+        """Fail every unresolved write in a batch; flush barriers just resolve."""
+        failed = 0
+        for op in batch:
+            if op.future.done():
+                continue
+            if op.sql is None:
+                op.future.set_result(WriteResult(rowcount=0, lastrowid=None))
+            else:
+                op.future.set_exception(error)
+                failed += 1
+        if failed:
+            with self._stats_lock:
+                self._failed += failed
+
+    def _drain_remaining(self, conn: sqlite3.Connection) -> None:
+        """Commit anything still queued after the stop sentinel."""
+        batch: list[_WriteOp] = []
+        while True:
+            try:
+                op = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if op is not None:
+                batch.append(op)
+            if len(batch) >= self._max_batch:
+                self._commit_batch(conn, batch)
+                batch = []
+        if batch:
+            self._commit_batch(conn, batch)
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: list[_WriteOp]) -> None:
+        results: list[tuple[_WriteOp, WriteResult | BaseException]] = []
+        self._in_flight = batch
+        start = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            logger.error(f"DatabaseWriter could not begin a batch: {e}")
+            self._fail_batch(batch, e)
+            self._in_flight = []
+            return
+
+        for op in batch:
+            if op.sql is None:
+                results.append((op, WriteResult(rowcount=0, lastrowid=None)))
+                continue
+            try:
+                conn.execute("SAVEPOINT gobby_write")
+                if op.many:
+                    cursor = conn.executemany(op.sql, op.params)
+                else:
+                    cursor = conn.execute(op.sql, op.params[0])
+                results.append((op, WriteResult(cursor.rowcount, cursor.lastrowid)))
+                cursor.close()
+                conn.execute("RELEASE SAVEPOINT gobby_write")
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK TO SAVEPOINT gobby_write")
+                conn.execute("RELEASE SAVEPOINT gobby_write")
+                results.append((op, e))
+
+        try:
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"DatabaseWriter batch commit failed: {e}")
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            self._fail_batch(batch, e)
+            self._in_flight = []
+            return
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        committed = 0
+        failed = 0
+        for op, outcome in results:
+            if isinstance(outcome, BaseException):
+                failed += 1
+                op.future.set_exception(outcome)
+            else:
+                if op.sql is not None:
+                    committed += 1
+                op.future.set_result(outcome)
+        self._in_flight = []
+
+        with self._stats_lock:
+            self._batches += 1
+            self._statements += committed
+            self._failed += failed
+            self._latencies_ms.append(elapsed_ms)
+            self._max_latency_ms = max(self._max_latency_ms, elapsed_ms)
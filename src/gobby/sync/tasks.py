@@ -256,6 +256,8 @@ class TaskSyncManager:
                     occupied_seq_nums.setdefault(pid, set()).add(sn)
                     max_seq_tracker[pid] = max(max_seq_tracker.get(pid, 0), sn)
             batch_claimed: dict[str | None, set[int]] = {}
+            # Projects whose task tree changed and needs path_cache recomputed
+            touched_projects: set[str] = set()
 
             # Temporarily disable foreign keys to allow inserting child tasks
             # before their parents (JSONL order may not be parent-first)
@@ -377,6 +379,9 @@ class TaskSyncManager:
                                 ),
                             }
 
+                            if synced_values["project_id"]:
+                                touched_projects.add(synced_values["project_id"])
+
                             if not existing_row:
                                 # New task — preserve JSONL seq_num if available
                                 # and not already occupied; assign fresh only on collision
@@ -398,23 +403,9 @@ class TaskSyncManager:
                                     max_seq_tracker.get(task_project_id, 0), final_seq
                                 )
 
-                                # Rebuild path_cache from the final seq_num
-                                parent_id = synced_values.get("parent_task_id")
-                                path_parts: list[str] = [str(final_seq)]
-                                current_parent = parent_id
-                                max_depth = 100
-                                depth = 0
-                                while current_parent and depth < max_depth:
-                                    parent_row = conn.execute(
-                                        "SELECT seq_num, parent_task_id FROM tasks WHERE id = ?",
-                                        (current_parent,),
-                                    ).fetchone()
-                                    if not parent_row or parent_row["seq_num"] is None:
-                                        break
-                                    path_parts.insert(0, str(parent_row["seq_num"]))
-                                    current_parent = parent_row["parent_task_id"]
-                                    depth += 1
-                                synced_values["path_cache"] = ".".join(path_parts)
+                                # Provisional; the whole tree is recomputed after
+                                # the batch, once every parent row exists
+                                synced_values["path_cache"] = str(final_seq)
 
                                 # INSERT with all synced fields
                                 columns = ", ".join(["id"] + list(synced_values.keys()))
@@ -457,6 +448,11 @@ class TaskSyncManager:
                             (task_id, depends_on, datetime.now(UTC).isoformat()),
                         )
 
+                # Phase 3: Recompute path_cache for every touched project in
+                # one pass, rather than walking parents per imported task
+                for touched_project in sorted(touched_projects):
+                    self.task_manager.rebuild_project_paths(touched_project)
+
                 logger.info(
                     f"Import complete: {imported_count} imported, "
                     f"{updated_count} updated, {skipped_count} skipped"
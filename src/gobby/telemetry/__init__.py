@@ -7,34 +7,31 @@ Replaces legacy utils/logging.py and utils/metrics.py modules.
 
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import TYPE_CHECKING
-
-from opentelemetry import metrics, trace
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-
-from gobby.telemetry.context import extract_from_env, inject_into_env
-from gobby.telemetry.instruments import (
-    dec_gauge,
-    get_telemetry_metrics,
-    inc_counter,
-    inc_gauge,
-    observe_histogram,
-    set_gauge,
-)
-from gobby.telemetry.providers import (
-    get_logger_provider,
-    get_meter_provider,
-    get_tracer_provider,
-    shutdown_providers,
-)
-from gobby.telemetry.tracing import (
-    add_span_attributes,
-    create_span,
-    current_span,
-    record_exception,
-    traced,
-)
+from typing import TYPE_CHECKING, Any
+
+# Re-exports are imported on first access: gobby.telemetry.config is imported
+# by the config models, which shouldn't pull in the OpenTelemetry SDK.
+_EXPORTS = {
+    "extract_from_env": "gobby.telemetry.context",
+    "inject_into_env": "gobby.telemetry.context",
+    "dec_gauge": "gobby.telemetry.instruments",
+    "get_telemetry_metrics": "gobby.telemetry.instruments",
+    "inc_counter": "gobby.telemetry.instruments",
+    "inc_gauge": "gobby.telemetry.instruments",
+    "observe_histogram": "gobby.telemetry.instruments",
+    "set_gauge": "gobby.telemetry.instruments",
+    "get_logger_provider": "gobby.telemetry.providers",
+    "get_meter_provider": "gobby.telemetry.providers",
+    "get_tracer_provider": "gobby.telemetry.providers",
+    "shutdown_providers": "gobby.telemetry.providers",
+    "add_span_attributes": "gobby.telemetry.tracing",
+    "create_span": "gobby.telemetry.tracing",
+    "current_span": "gobby.telemetry.tracing",
+    "record_exception": "gobby.telemetry.tracing",
+    "traced": "gobby.telemetry.tracing",
+}
 
 __all__ = [
     "init_telemetry",
@@ -61,6 +58,38 @@ if TYPE_CHECKING:
     from opentelemetry.trace import Tracer
 
     from gobby.telemetry.config import TelemetrySettings
+    from gobby.telemetry.context import extract_from_env, inject_into_env
+    from gobby.telemetry.instruments import (
+        dec_gauge,
+        get_telemetry_metrics,
+        inc_counter,
+        inc_gauge,
+        observe_histogram,
+        set_gauge,
+    )
+    from gobby.telemetry.providers import (
+        get_logger_provider,
+        get_meter_provider,
+        get_tracer_provider,
+        shutdown_providers,
+    )
+    from gobby.telemetry.tracing import (
+        add_span_attributes,
+        create_span,
+        current_span,
+        record_exception,
+        traced,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of the re-exported helpers."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 def init_telemetry(config: TelemetrySettings) -> None:
@@ -70,6 +99,15 @@ def init_telemetry(config: TelemetrySettings) -> None:
     Args:
         config: TelemetrySettings instance.
     """
+    from opentelemetry import metrics, trace
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
+    from gobby.telemetry.providers import (
+        get_logger_provider,
+        get_meter_provider,
+        get_tracer_provider,
+    )
+
     # 0. LLM instrumentors (must run before LLM client instantiation)
     if config.llm_tracing.enabled:
         try:
@@ -111,6 +149,8 @@ def get_tracer(name: str, version: str | None = None) -> Tracer:
     Returns:
         Tracer instance.
     """
+    from opentelemetry import trace
+
     return trace.get_tracer(name, version or "")
 
 
@@ -125,6 +165,8 @@ def get_meter(name: str, version: str | None = None) -> Meter:
     Returns:
         Meter instance.
     """
+    from opentelemetry import metrics
+
     return metrics.get_meter(name, version or "")
 
 
@@ -132,6 +174,10 @@ def shutdown_telemetry() -> None:
     """
     Shutdown telemetry and clear cache.
     """
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
+    from gobby.telemetry.providers import shutdown_providers
+
     # Uninstrument logging bridge
     LoggingInstrumentor().uninstrument()
 
@@ -110,6 +110,18 @@ class TelemetrySettings(BaseModel):
         default=1.0,
         description="Trace sampling rate (0.0 to 1.0)",
     )
+    trace_tail_sample_rate: float = Field(
+        default=1.0,
+        description=(
+            "Fraction of completed traces kept in local storage (0.0 to 1.0). "
+            "Error traces and slow traces are always kept."
+        ),
+    )
+    trace_slow_threshold_ms: int = Field(
+        default=2000,
+        gt=0,
+        description="Traces at least this long (ms) are always kept by tail sampling",
+    )
     trace_retention_days: int = Field(
         default=7,
         gt=0,
@@ -142,10 +154,10 @@ class TelemetrySettings(BaseModel):
             raise ValueError("Value must be positive")
         return v
 
-    @field_validator("trace_sample_rate")
+    @field_validator("trace_sample_rate", "trace_tail_sample_rate")
     @classmethod
     def validate_sample_rate(cls, v: float) -> float:
         """Validate sample rate is between 0.0 and 1.0."""
         if not (0.0 <= v <= 1.0):
-            raise ValueError("trace_sample_rate must be between 0.0 and 1.0")
+            raise ValueError("Sample rates must be between 0.0 and 1.0")
         return v
@@ -160,6 +160,76 @@ class TelemetryMetrics:
             "Total number of background tasks that failed",
         )
 
+        # LLM response cache metrics
+        self._register_counter(
+            "llm_cache_hits_total",
+            "LLM requests answered from the response cache",
+        )
+        self._register_counter(
+            "llm_cache_misses_total",
+            "LLM requests sent to the provider by the response cache",
+        )
+        self._register_counter(
+            "llm_cache_coalesced_total",
+            "LLM requests that shared an identical in-flight request",
+        )
+
+        # Communications outbound queue metrics (labelled by channel)
+        self._register_counter(
+            "comms_outbound_sent_total",
+            "Outbound channel messages delivered",
+        )
+        self._register_counter(
+            "comms_outbound_retried_total",
+            "Outbound channel send attempts that failed and were scheduled for retry",
+        )
+        self._register_counter(
+            "comms_outbound_dead_lettered_total",
+            "Outbound channel messages dead-lettered after exhausting retries",
+        )
+        self._register_up_down_counter(
+            "comms_outbound_queue_depth",
+            "Outbound channel messages waiting for delivery",
+        )
+        self._register_histogram(
+            "comms_outbound_latency_seconds",
+            "Time from enqueue to delivery of outbound channel messages",
+        )
+
+        # Incremental code index batches (labelled by mode and outcome)
+        self._register_counter(
+            "code_index_batches_total",
+            "Debounced file batches sent to gcode for incremental indexing",
+        )
+        self._register_up_down_counter(
+            "code_index_queue_depth",
+            "Edited files queued for incremental indexing",
+        )
+        self._register_histogram(
+            "code_index_batch_duration_seconds",
+            "Time gcode took to index one batch of edited files",
+        )
+
+        # Database writer queue metrics (refreshed on /metrics scrape)
+        self._register_up_down_counter(
+            "db_write_queue_depth",
+            "Number of writes waiting on the database writer thread",
+        )
+        self._register_up_down_counter(
+            "db_write_commit_latency_p99_ms",
+            "p99 group-commit latency of the database writer in milliseconds",
+        )
+
+        # Metrics buffer (refreshed on /metrics scrape)
+        self._register_up_down_counter(
+            "metrics_buffer_pending_events",
+            "Metrics events buffered in memory awaiting flush",
+        )
+        self._register_up_down_counter(
+            "metrics_buffer_dropped_events",
+            "Metrics events dropped because the buffer was full",
+        )
+
         # Daemon health metrics (using ObservableGauges)
         self._meter.create_observable_gauge(
             "daemon_uptime_seconds",
@@ -53,15 +53,25 @@ def get_tracer_provider(config: TelemetrySettings) -> TracerProvider:
 def add_span_storage_exporter(
     storage: SpanStorage,
     broadcast_callback: Callable[[dict[str, Any]], Any] | None = None,
+    config: TelemetrySettings | None = None,
 ) -> None:
     """Add GobbySpanExporter to the global TracerProvider."""
     global _TRACER_PROVIDER
     if _TRACER_PROVIDER is not None:
         from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
+        from gobby.telemetry.sampling import TailSampler
         from gobby.telemetry.span_store import GobbySpanExporter
 
-        exporter = GobbySpanExporter(storage, broadcast_callback=broadcast_callback)
+        sampler = None
+        if config is not None and config.trace_tail_sample_rate < 1.0:
+            sampler = TailSampler(
+                sample_rate=config.trace_tail_sample_rate,
+                slow_threshold_ms=config.trace_slow_threshold_ms,
+            )
+        exporter = GobbySpanExporter(
+            storage, broadcast_callback=broadcast_callback, sampler=sampler
+        )
         _TRACER_PROVIDER.add_span_processor(BatchSpanProcessor(exporter))
 
 
@@ -0,0 +1,133 @@
+"""
+Tail sampling for locally stored traces.
+
+Head sampling (``trace_sample_rate``) decides when a trace starts, before
+anything is known about it. Tail sampling runs in the span store exporter
+after spans end: spans are held per trace until the trace's root span
+arrives (or the trace has waited too long), then the whole trace is kept or
+dropped. Error traces and slow traces are always kept; ordinary traces are
+kept at ``sample_rate``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+# How long an incomplete trace waits for its root span before being decided
+DEFAULT_DECISION_WAIT_SECONDS = 30.0
+
+# Bounds on buffered spans and remembered decisions (for late spans)
+DEFAULT_MAX_PENDING_SPANS = 20_000
+_MAX_DECISIONS = 10_000
+
+
+@dataclass
+class _PendingTrace:
+    first_seen: float
+    spans: list[dict[str, Any]] = field(default_factory=list)
+    complete: bool = False
+
+
+class TailSampler:
+    """Buffers spans per trace and keeps error, slow, or sampled traces.
+
+    Thread-safe: ``offer`` is called from the span processor's export thread.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        slow_threshold_ms: float = 2000.0,
+        decision_wait_seconds: float = DEFAULT_DECISION_WAIT_SECONDS,
+        max_pending_spans: int = DEFAULT_MAX_PENDING_SPANS,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.slow_threshold_ns = int(slow_threshold_ms * 1_000_000)
+        self.decision_wait_seconds = decision_wait_seconds
+        self.max_pending_spans = max_pending_spans
+        self._pending: OrderedDict[str, _PendingTrace] = OrderedDict()
+        self._pending_spans = 0
+        self._decisions: OrderedDict[str, bool] = OrderedDict()
+        self._lock = threading.Lock()
+        # Counters
+        self.traces_kept = 0
+        self.traces_dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any trace can be dropped (otherwise spans pass straight through)."""
+        return self.sample_rate < 1.0
+
+    def offer(self, spans: list[dict[str, Any]], now: float | None = None) -> list[dict[str, Any]]:
+        """Add ended spans; return the spans to store now.
+
+        Returned spans belong to traces decided "keep" by this call or by an
+        earlier one (spans that end after their trace's root).
+        """
+        if not self.enabled:
+            return spans
+        now = time.monotonic() if now is None else now
+        ready: list[dict[str, Any]] = []
+        with self._lock:
+            for span in spans:
+                trace_id = span["trace_id"]
+                decision = self._decisions.get(trace_id)
+                if decision is not None:
+                    if decision or span.get("status") == "ERROR":
+                        ready.append(span)
+                    continue
+                pending = self._pending.get(trace_id)
+                if pending is None:
+                    pending = self._pending[trace_id] = _PendingTrace(first_seen=now)
+                pending.spans.append(span)
+                self._pending_spans += 1
+                if span.get("parent_span_id") is None:
+                    pending.complete = True
+
+            for trace_id in [t for t, p in self._pending.items() if p.complete]:
+                ready.extend(self._decide(trace_id))
+            # Pending traces are in arrival order: expire and evict from the front
+            while self._pending:
+                trace_id, pending = next(iter(self._pending.items()))
+                overdue = now - pending.first_seen >= self.decision_wait_seconds
+                if not overdue and self._pending_spans <= self.max_pending_spans:
+                    break
+                ready.extend(self._decide(trace_id))
+        return ready
+
+    def flush(self) -> list[dict[str, Any]]:
+        """Decide every pending trace (shutdown/force flush); return spans to store."""
+        ready: list[dict[str, Any]] = []
+        with self._lock:
+            for trace_id in list(self._pending):
+                ready.extend(self._decide(trace_id))
+        return ready
+
+    def should_keep(self, spans: list[dict[str, Any]]) -> bool:
+        """Decide one trace from the spans seen so far."""
+        if any(s.get("status") == "ERROR" for s in spans):
+            return True
+        starts = [s["start_time_ns"] for s in spans if s.get("start_time_ns") is not None]
+        ends = [s["end_time_ns"] for s in spans if s.get("end_time_ns") is not None]
+        if starts and ends and max(ends) - min(starts) >= self.slow_threshold_ns:
+            return True
+        # Deterministic per trace; uses the high 64 bits so it's independent of
+        # the head sampler (TraceIdRatioBased uses the low 64 bits)
+        return int(spans[0]["trace_id"][:16], 16) < self.sample_rate * 2**64
+
+    def _decide(self, trace_id: str) -> list[dict[str, Any]]:
+        pending = self._pending.pop(trace_id)
+        self._pending_spans -= len(pending.spans)
+        keep = self.should_keep(pending.spans)
+        self._decisions[trace_id] = keep
+        if len(self._decisions) > _MAX_DECISIONS:
+            self._decisions.popitem(last=False)
+        if keep:
+            self.traces_kept += 1
+            return pending.spans
+        self.traces_dropped += 1
+        return []
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Sequence
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any
 
 from opentelemetry.sdk.trace import ReadableSpan
@@ -10,6 +11,7 @@ from opentelemetry.trace import SpanKind
 
 if TYPE_CHECKING:
     from gobby.storage.spans import SpanStorage
+    from gobby.telemetry.sampling import TailSampler
 
 logger = logging.getLogger(__name__)
 
@@ -18,46 +20,91 @@ class GobbySpanExporter(SpanExporter):
     """
     Custom OpenTelemetry SpanExporter that persists spans to SQLite and
     broadcasts trace events via WebSocket.
+
+    Spans are queued on the database's writer thread (group-committed with
+    other background writes) so the span processor never waits on SQLite.
+    Each exported batch broadcasts one ``trace_event`` per trace once its
+    spans have committed. An optional :class:`TailSampler` drops ordinary
+    traces while keeping error and slow ones.
     """
 
     def __init__(
         self,
         storage: SpanStorage,
         broadcast_callback: Callable[[dict[str, Any]], Any] | None = None,
+        sampler: TailSampler | None = None,
     ) -> None:
         self.storage = storage
         self.broadcast_callback = broadcast_callback
+        self.sampler = sampler
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
-        """Export spans to storage and broadcast."""
+        """Queue spans for storage and broadcast them once written."""
         try:
             span_dicts = [self._span_to_dict(span) for span in spans]
-            self.storage.save_spans(span_dicts)
-
-            if self.broadcast_callback:
-                for span_dict in span_dicts:
-                    # We broadcast each span as a trace_event
-                    # Real-time UI can then append it to the trace tree
-                    self.broadcast_callback(
-                        {
-                            "type": "trace_event",
-                            "span": span_dict,
-                            "trace_id": span_dict["trace_id"],
-                        }
-                    )
-
+            if self.sampler is not None:
+                span_dicts = self.sampler.offer(span_dicts)
+            self._write(span_dicts)
             return SpanExportResult.SUCCESS
         except Exception:
             logger.error("Error exporting spans", exc_info=True)
             return SpanExportResult.FAILURE
 
     def shutdown(self) -> None:
-        """Shutdown the exporter."""
-        pass
+        """Shutdown the exporter, storing any traces still awaiting a sampling decision."""
+        self.force_flush()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        """Force flush spans."""
-        return True
+        """Decide pending traces and wait for queued span writes to commit."""
+        try:
+            if self.sampler is not None:
+                self._write(self.sampler.flush())
+            return self.storage.flush(timeout_millis / 1000)
+        except Exception:
+            logger.error("Error flushing spans", exc_info=True)
+            return False
+
+    def _write(self, span_dicts: list[dict[str, Any]]) -> None:
+        if not span_dicts:
+            return
+        future = self.storage.submit_spans(span_dicts)
+        if not self.broadcast_callback:
+            return
+        events = self._trace_events(span_dicts)
+        if future is None:
+            self._broadcast(events)
+        else:
+            future.add_done_callback(lambda f: self._on_written(f, events))
+
+    def _on_written(self, future: Future[Any], events: list[dict[str, Any]]) -> None:
+        if future.exception() is not None:
+            logger.error(f"Failed to save spans: {future.exception()}")
+            return
+        self._broadcast(events)
+
+    def _broadcast(self, events: list[dict[str, Any]]) -> None:
+        assert self.broadcast_callback is not None
+        for event in events:
+            try:
+                self.broadcast_callback(event)
+            except Exception as e:
+                logger.debug(f"Trace event broadcast failed: {e}")
+
+    @staticmethod
+    def _trace_events(span_dicts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Coalesce a batch into one ``trace_event`` per trace (latest span attached)."""
+        by_trace: dict[str, list[dict[str, Any]]] = {}
+        for span_dict in span_dicts:
+            by_trace.setdefault(span_dict["trace_id"], []).append(span_dict)
+        return [
+            {
+                "type": "trace_event",
+                "span": max(trace_spans, key=lambda s: s["start_time_ns"] or 0),
+                "trace_id": trace_id,
+                "span_count": len(trace_spans),
+            }
+            for trace_id, trace_spans in by_trace.items()
+        ]
 
     def _span_to_dict(self, span: ReadableSpan) -> dict[str, Any]:
         """Convert OTel ReadableSpan to a dictionary for storage."""
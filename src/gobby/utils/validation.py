@@ -53,6 +53,12 @@ class TaskValidator:
         cycles: list[list[str]] = dep_manager.check_cycles()
         return cycles
 
+    def check_readiness(self) -> list[dict[str, Any]]:
+        """
+        Check materialized task readiness against the task and dependency tables.
+        """
+        return self.task_manager.verify_readiness()
+
     def clean_orphans(self) -> int:
         """
         Remove orphaned dependencies.
@@ -76,4 +82,5 @@ class TaskValidator:
             "orphan_dependencies": self.check_orphan_dependencies(),
             "invalid_projects": self.check_invalid_projects(),
             "cycles": self.check_cycles(),
+            "readiness_drift": self.check_readiness(),
         }
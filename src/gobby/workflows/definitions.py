@@ -471,6 +471,10 @@ class PipelineStep(BaseModel):
     tools: list[str] = Field(default_factory=list)  # Tool restrictions for prompt steps
     input: str | None = None  # Explicit input reference (e.g., $prev_step.output)
 
+    # Scheduling (setting either on any step enables DAG-parallel execution)
+    needs: list[str] | None = None  # Step IDs this step waits for
+    parallel_group: str | None = None  # Consecutive steps in a group run concurrently
+
     def model_post_init(self, __context: Any) -> None:
         """Validate that exactly one execution type is specified."""
         exec_types = [
@@ -499,6 +503,8 @@ class PipelineDefinition(BaseModel):
     """Definition for a pipeline workflow with typed data flow between steps.
 
     Pipelines execute steps sequentially with explicit data flow via $step.output references.
+    Steps that declare ``needs`` or ``parallel_group`` are scheduled as a DAG instead
+    (see gobby.workflows.pipeline.scheduler).
     """
 
     name: str
@@ -528,6 +534,9 @@ class PipelineDefinition(BaseModel):
     # Resume execution after daemon restart (opt-in, steps must be idempotent)
     resume_on_restart: bool = False
 
+    # Max steps running at once for DAG-scheduled pipelines (None = config default)
+    max_parallel: int | None = Field(default=None, ge=1)
+
     @field_validator("steps", mode="after")
     @classmethod
     def validate_steps(cls, v: list[PipelineStep]) -> list[PipelineStep]:
@@ -541,6 +550,11 @@ class PipelineDefinition(BaseModel):
             duplicates = [id for id in ids if ids.count(id) > 1]
             raise ValueError(f"Pipeline step IDs must be unique. Duplicates: {set(duplicates)}")
 
+        # Reject unknown `needs` and dependency cycles at parse time
+        from gobby.workflows.pipeline.scheduler import build_step_dependencies
+
+        build_step_dependencies(v)
+
         return v
 
     def get_step(self, step_id: str) -> PipelineStep | None:
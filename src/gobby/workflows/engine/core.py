@@ -16,7 +16,6 @@ from opentelemetry.trace import Status, StatusCode
 
 from gobby.hooks.event_handlers._tool import EDIT_TOOLS
 from gobby.hooks.events import HookEvent, HookEventType, HookResponse
-from gobby.storage.config_store import ConfigStore
 from gobby.storage.database import DatabaseProtocol
 from gobby.storage.workflow_definitions import (
     LocalWorkflowDefinitionManager,
@@ -30,6 +29,7 @@ from gobby.workflows.definitions import (
 )
 from gobby.workflows.engine.effects import EffectsMixin
 from gobby.workflows.engine.enforcement import EnforcementMixin
+from gobby.workflows.engine.rule_index import CompiledRuleIndex, compile_rule_index
 from gobby.workflows.engine.templating import TemplatingMixin
 from gobby.workflows.state_manager import WorkflowInstanceManager
 
@@ -90,6 +90,7 @@ class RuleEngine(EffectsMixin, TemplatingMixin, EnforcementMixin):
         self.instance_manager = WorkflowInstanceManager(db)
         self._skill_manager = skill_manager
         self._event_store = metrics_event_store
+        self._rule_index: CompiledRuleIndex | None = None
 
     async def evaluate(
         self,
@@ -119,8 +120,7 @@ class RuleEngine(EffectsMixin, TemplatingMixin, EnforcementMixin):
                     return HookResponse(decision="allow")
 
                 # Check global enforcement toggle
-                config_store = ConfigStore(self.db)
-                if config_store.get("rules.enforcement_enabled") is False:
+                if not self._get_rule_index().enforcement_enabled:
                     return HookResponse(decision="allow")
 
                 # Collect mcp_call effects from hardcoded rules and DB rules.
@@ -187,18 +187,16 @@ class RuleEngine(EffectsMixin, TemplatingMixin, EnforcementMixin):
                         f"STOP gate diagnostics: session_id={session_id}, auto_task_ref={variables.get('auto_task_ref')!r}, stop_attempts={variables['stop_attempts']}, task_claimed={variables.get('task_claimed')}, claimed_tasks={variables.get('claimed_tasks')}, errors_resolved={variables.get('errors_resolved')}, error_triage_blocks={variables.get('error_triage_blocks', 0)}, edit_write_pending={variables.get('edit_write_pending')}, tool_block_pending={variables.get('tool_block_pending')}",
                     )
 
-                # 1. Load enabled rules for this event, sorted by priority
-                rules = self._load_rules(rule_event)
+                # 1. Load enabled rules for this event in scope for the agent,
+                #    sorted by priority (served from the compiled rule index)
+                agent_type = variables.get("_agent_type")
+                rules = self._load_rules(rule_event, agent_type)
 
                 # 2. Apply session overrides
                 overrides = self._load_session_overrides(session_id)
                 rules = self._apply_overrides(rules, overrides)
 
-                # 3. Filter by agent_scope
-                agent_type = variables.get("_agent_type")
-                rules = self._filter_by_agent_scope(rules, agent_type)
-
-                # 4. Filter by active rules (selector-based)
+                # 3. Filter by active rules (selector-based)
                 rules = self._filter_by_active_rules(rules, variables)
 
                 if span.is_recording():
@@ -520,30 +518,32 @@ class RuleEngine(EffectsMixin, TemplatingMixin, EnforcementMixin):
                     span.set_status(Status(StatusCode.ERROR, str(e)))
                 raise
 
+    def _get_rule_index(self) -> CompiledRuleIndex:
+        """Return the compiled rule index, rebuilding it if stale."""
+        index = self._rule_index
+        if index is None or not index.is_current():
+            index = compile_rule_index(self.db, self.definition_manager)
+            self._rule_index = index
+        return index
+
     def _load_rules(
-        self, rule_event: RuleEvent
+        self, rule_event: RuleEvent, agent_type: str | None = None
     ) -> list[tuple[WorkflowDefinitionRow, RuleDefinitionBody]]:
-        """Load enabled rules matching the event type, sorted by priority."""
-        rows = self.definition_manager.list_rules_by_event(
-            event=rule_event.value,
-            enabled=True,
-        )
-        result: list[tuple[WorkflowDefinitionRow, RuleDefinitionBody]] = []
-        for row in rows:
-            try:
-                body = RuleDefinitionBody.model_validate_json(row.definition_json)
-                result.append((row, body))
-            except Exception as e:
-                logger.warning(f"Failed to parse rule {row.name}: {e}")
-        return result
+        """Load enabled rules matching the event type and agent scope, sorted by priority."""
+        return self._get_rule_index().rules_for_scope(rule_event, agent_type)
 
     def _load_session_overrides(self, session_id: str) -> dict[str, bool]:
-        """Load session-scoped rule overrides."""
-        rows = self.db.fetchall(
-            "SELECT rule_name, enabled FROM rule_overrides WHERE session_id = ?",
-            (session_id,),
-        )
-        return {row["rule_name"]: bool(row["enabled"]) for row in rows}
+        """Load session-scoped rule overrides (cached on the rule index)."""
+        index = self._get_rule_index()
+        overrides = index.get_overrides(session_id)
+        if overrides is None:
+            rows = self.db.fetchall(
+                "SELECT rule_name, enabled FROM rule_overrides WHERE session_id = ?",
+                (session_id,),
+            )
+            overrides = {row["rule_name"]: bool(row["enabled"]) for row in rows}
+            index.set_overrides(session_id, overrides)
+        return overrides
 
     def _apply_overrides(
         self,
@@ -559,27 +559,6 @@ class RuleEngine(EffectsMixin, TemplatingMixin, EnforcementMixin):
             if overrides.get(row.name, True)  # Default to enabled if no override
         ]
 
-    def _filter_by_agent_scope(
-        self,
-        rules: list[tuple[WorkflowDefinitionRow, RuleDefinitionBody]],
-        agent_type: str | None,
-    ) -> list[tuple[WorkflowDefinitionRow, RuleDefinitionBody]]:
-        """Filter rules by agent_scope.
-
-        - Rules with no agent_scope (None) are global — always included.
-        - Rules with agent_scope require _agent_type to be in the list.
-        - If no _agent_type is set, only global rules are included.
-        """
-        return [
-            (row, body)
-            for row, body in rules
-            if body.agent_scope is None
-            or (
-                agent_type is not None
-                and ("*" in body.agent_scope or agent_type in body.agent_scope)
-            )
-        ]
-
     def _filter_by_active_rules(
         self,
         rules: list[tuple[WorkflowDefinitionRow, RuleDefinitionBody]],
@@ -0,0 +1,136 @@
+"""Compiled, versioned rule-set cache for RuleEngine.
+
+Rule definitions change rarely but are evaluated on every hook event. The
+index loads all enabled rules once, validates their bodies, pre-parses their
+``when`` conditions and groups them by ``RuleEvent``, so evaluation becomes a
+dictionary lookup instead of SQL + JSON validation + ``ast.parse`` per event.
+
+The index is tagged with the process-wide rule generation (see
+``gobby.storage.workflow_definitions.bump_rule_generation``) and rebuilt when
+the generation moves. A short TTL also forces a rebuild so writes made by other
+processes (e.g. the CLI writing the database directly) are picked up.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from gobby.storage.config_store import ConfigStore
+from gobby.storage.database import DatabaseProtocol
+from gobby.storage.workflow_definitions import (
+    LocalWorkflowDefinitionManager,
+    WorkflowDefinitionRow,
+    get_rule_generation,
+)
+from gobby.workflows.definitions import RuleDefinitionBody, RuleEvent
+from gobby.workflows.safe_evaluator import parse_expression
+
+logger = logging.getLogger(__name__)
+
+# Max age of a compiled index before it is rebuilt regardless of generation.
+RULE_INDEX_TTL_SECONDS = 5.0
+
+RuleEntry = tuple[WorkflowDefinitionRow, RuleDefinitionBody]
+
+
+@dataclass
+class CompiledRuleIndex:
+    """Validated rules grouped by event, plus per-scope and per-session caches."""
+
+    generation: int
+    built_at: float
+    enforcement_enabled: bool
+    by_event: dict[RuleEvent, list[RuleEntry]]
+    _scoped: dict[tuple[RuleEvent, str | None], list[RuleEntry]] = field(default_factory=dict)
+    _overrides: dict[str, dict[str, bool]] = field(default_factory=dict)
+
+    def is_current(self, now: float | None = None) -> bool:
+        """Whether the index still matches the rule generation and TTL."""
+        if self.generation != get_rule_generation():
+            return False
+        now = time.monotonic() if now is None else now
+        return now - self.built_at < RULE_INDEX_TTL_SECONDS
+
+    def rules_for(self, event: RuleEvent) -> list[RuleEntry]:
+        """Enabled rules for an event, sorted by priority then name."""
+        return self.by_event.get(event, [])
+
+    def rules_for_scope(self, event: RuleEvent, agent_type: str | None) -> list[RuleEntry]:
+        """Rules for an event filtered by agent_scope (memoized per agent type).
+
+        - Rules with no agent_scope (None) are global — always included.
+        - Rules with agent_scope require agent_type to be in the list.
+        - If no agent_type is set, only global rules are included.
+        """
+        key = (event, agent_type)
+        cached = self._scoped.get(key)
+        if cached is None:
+            cached = [
+                (row, body)
+                for row, body in self.rules_for(event)
+                if body.agent_scope is None
+                or (
+                    agent_type is not None
+                    and ("*" in body.agent_scope or agent_type in body.agent_scope)
+                )
+            ]
+            self._scoped[key] = cached
+        return cached
+
+    def get_overrides(self, session_id: str) -> dict[str, bool] | None:
+        """Cached session overrides, or None if not loaded yet."""
+        return self._overrides.get(session_id)
+
+    def set_overrides(self, session_id: str, overrides: dict[str, bool]) -> None:
+        """Cache session overrides for the lifetime of this index."""
+        self._overrides[session_id] = overrides
+
+
+def compile_rule_index(
+    db: DatabaseProtocol,
+    definition_manager: LocalWorkflowDefinitionManager | None = None,
+) -> CompiledRuleIndex:
+    """Load, validate and pre-parse all enabled rules into a CompiledRuleIndex."""
+    # Read the generation first so a concurrent write invalidates what we build
+    generation = get_rule_generation()
+    manager = definition_manager or LocalWorkflowDefinitionManager(db)
+
+    rows = manager.list_all(workflow_type="rule", enabled=True)
+    rows.sort(key=lambda r: (r.priority, r.name))
+
+    by_event: dict[RuleEvent, list[RuleEntry]] = {}
+    for row in rows:
+        try:
+            body = RuleDefinitionBody.model_validate_json(row.definition_json)
+        except Exception as e:
+            logger.warning(f"Failed to parse rule {row.name}: {e}")
+            continue
+        _precompile_conditions(row.name, body)
+        by_event.setdefault(body.event, []).append((row, body))
+
+    enforcement_enabled = ConfigStore(db).get("rules.enforcement_enabled") is not False
+
+    return CompiledRuleIndex(
+        generation=generation,
+        built_at=time.monotonic(),
+        enforcement_enabled=enforcement_enabled,
+        by_event=by_event,
+    )
+
+
+def _precompile_conditions(rule_name: str, body: RuleDefinitionBody) -> None:
+    """Warm the expression cache with a rule's conditions.
+
+    Invalid expressions are left for evaluation time, where the fail-open /
+    fail-closed policy for the effect type applies.
+    """
+    conditions = [body.when] + [effect.when for effect in body.resolved_effects]
+    for condition in conditions:
+        if not condition:
+            continue
+        try:
+            parse_expression(condition)
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Rule {rule_name} has an unparseable condition: {e}")
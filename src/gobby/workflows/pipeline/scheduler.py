@@ -0,0 +1,196 @@
+"""Dependency graph and concurrent scheduling for pipeline steps.
+
+Pipelines without ``needs`` or ``parallel_group`` run strictly in order, as
+they always have: each step depends on the one before it. Once any step
+declares either field, the pipeline is scheduled as a DAG:
+
+- A step with ``needs`` depends on exactly those steps.
+- A step without ``needs`` depends on the previous block in list order, where
+  a block is a run of consecutive steps sharing the same ``parallel_group``
+  (a step without a group is a block of one). Steps in a block run together.
+- Any step also depends on earlier steps it references via ``$step.output``,
+  ``steps.step`` or ``${{ step.output }}``.
+
+Ready steps run concurrently up to a per-pipeline limit. A step that pauses
+(approval gate) blocks only its own descendants; the rest of the graph keeps
+running until nothing else is ready.
+
+Each step runs in its own task. Context variables set by a step are carried
+forward to the steps that depend on it (a step with several dependencies sees
+the context of whichever finished last), but never back to the caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import re
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# $step.output / steps.step / step.output (inside ${{ }} or Jinja2 blocks)
+_STEP_REF_PATTERN = re.compile(
+    r"(?:\$|\bsteps\.)([A-Za-z_][A-Za-z0-9_]*)\b|\b([A-Za-z_][A-Za-z0-9_]*)\.output\b"
+)
+
+# Step fields that can reference other steps' outputs
+_REFERENCE_FIELDS = ("exec", "prompt", "invoke_pipeline", "mcp", "wait", "condition", "input")
+
+
+def is_dag_scheduled(steps: Sequence[Any]) -> bool:
+    """Whether any step opts into DAG scheduling via needs or parallel_group."""
+    return any(
+        getattr(s, "needs", None) is not None or getattr(s, "parallel_group", None) for s in steps
+    )
+
+
+def _referenced_step_ids(step: Any) -> set[str]:
+    """Collect step ids referenced from a step's templated fields."""
+    refs: set[str] = set()
+    for field in _REFERENCE_FIELDS:
+        value = getattr(step, field, None)
+        if value is None:
+            continue
+        if hasattr(value, "model_dump"):
+            value = value.model_dump()
+        for match in _STEP_REF_PATTERN.finditer(str(value)):
+            refs.add(match.group(1) or match.group(2))
+    return refs
+
+
+def build_step_dependencies(steps: Sequence[Any]) -> dict[str, set[str]]:
+    """Build the step dependency map (step id -> ids it waits for).
+
+    Raises:
+        ValueError: If ``needs`` names an unknown step or the graph has a cycle.
+    """
+    ids = [s.id for s in steps]
+    if not is_dag_scheduled(steps):
+        return {step_id: ({ids[i - 1]} if i else set()) for i, step_id in enumerate(ids)}
+
+    known = set(ids)
+    deps: dict[str, set[str]] = {}
+    prev_block: list[str] = []
+    block: list[str] = []
+    block_group: str | None = None
+    earlier: set[str] = set()
+
+    for step in steps:
+        group = getattr(step, "parallel_group", None)
+        if not (group and group == block_group):
+            # Start a new block
+            prev_block, block, block_group = block, [], group
+
+        needs = getattr(step, "needs", None)
+        if needs is not None:
+            unknown = [n for n in needs if n not in known]
+            if unknown:
+                raise ValueError(f"Step '{step.id}' needs unknown step(s): {unknown}")
+            if step.id in needs:
+                raise ValueError(f"Step '{step.id}' cannot need itself")
+            step_deps = set(needs)
+        else:
+            step_deps = set(prev_block)
+
+        # Output references only count toward earlier steps: a reference to a
+        # later step has always resolved to None under sequential execution.
+        step_deps |= _referenced_step_ids(step) & earlier
+        deps[step.id] = step_deps
+        block.append(step.id)
+        earlier.add(step.id)
+
+    _check_acyclic(ids, deps)
+    return deps
+
+
+def _check_acyclic(ids: Sequence[str], deps: dict[str, set[str]]) -> None:
+    remaining = {i: set(deps[i]) for i in ids}
+    while remaining:
+        ready = [i for i, d in remaining.items() if not d]
+        if not ready:
+            raise ValueError(f"Pipeline step dependencies form a cycle: {sorted(remaining)}")
+        for i in ready:
+            del remaining[i]
+        for d in remaining.values():
+            d.difference_update(ready)
+
+
+async def run_step_graph(
+    order: Sequence[str],
+    deps: dict[str, set[str]],
+    run_step: Callable[[str], Coroutine[Any, Any, None]],
+    max_parallel: int,
+    pause_exceptions: tuple[type[BaseException], ...] = (),
+) -> None:
+    """Run steps as their dependencies complete, at most max_parallel at a time.
+
+    Ready steps start in definition order. When a step raises one of
+    pause_exceptions its descendants are held back and the first such exception
+    is re-raised once nothing else can run. Any other exception stops new steps
+    from starting, waits for in-flight steps, then propagates.
+
+    Each step starts in a copy of the context its latest-finishing dependency
+    ended with, so context variables flow down the graph as they did when steps
+    ran inline.
+    """
+    waiting = list(order)
+    done: set[str] = set()
+    paused: set[str] = set()
+    running: dict[asyncio.Task[None], str] = {}
+    contexts: dict[str, contextvars.Context] = {}  # finished step -> its context, in finish order
+    blocked: set[str] = set()
+    pause_error: BaseException | None = None
+    error: BaseException | None = None
+
+    try:
+        while True:
+            if error is None:
+                for step_id in list(waiting):
+                    if len(running) >= max_parallel:
+                        break
+                    if deps[step_id] & (paused | blocked):
+                        # Downstream of a paused step: hold back this branch
+                        waiting.remove(step_id)
+                        blocked.add(step_id)
+                    elif deps[step_id] <= done:
+                        waiting.remove(step_id)
+                        parent = next(
+                            (c for s, c in reversed(contexts.items()) if s in deps[step_id]), None
+                        )
+                        task: asyncio.Task[None] = asyncio.create_task(
+                            run_step(step_id), context=parent.copy() if parent else None
+                        )
+                        running[task] = step_id
+
+            if not running:
+                break
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                step_id = running.pop(task)
+                exc = task.exception()
+                if exc is None:
+                    done.add(step_id)
+                    contexts[step_id] = task.get_context()
+                elif pause_exceptions and isinstance(exc, pause_exceptions):
+                    paused.add(step_id)
+                    if pause_error is None:
+                        pause_error = exc
+                elif error is None:
+                    error = exc
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    if error is not None:
+        raise error
+    if pause_error is not None:
+        raise pause_error
+    if waiting:
+        # Unreachable for validated graphs; guards against a silent partial run
+        raise RuntimeError(f"Pipeline steps never became ready: {waiting}")
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
+import weakref
 from typing import TYPE_CHECKING, Any, cast
 
 from opentelemetry.trace import Status, StatusCode
 
+from gobby.config.pipelines import PipelineConfig
 from gobby.telemetry.tracing import create_span
 from gobby.workflows.pipeline.gatekeeper import ApprovalManager
 from gobby.workflows.pipeline.handlers import (
@@ -17,6 +20,7 @@ from gobby.workflows.pipeline.handlers import (
     execute_prompt_step,
 )
 from gobby.workflows.pipeline.renderer import StepRenderer
+from gobby.workflows.pipeline.scheduler import build_step_dependencies, run_step_graph
 from gobby.workflows.pipeline_state import (
     ApprovalRequired,
     ExecutionStatus,
@@ -28,7 +32,7 @@ from gobby.workflows.pipeline_state import (
 if TYPE_CHECKING:
     from gobby.storage.database import DatabaseProtocol
     from gobby.storage.pipelines import LocalPipelineExecutionManager
-    from gobby.workflows.definitions import PipelineDefinition
+    from gobby.workflows.definitions import PipelineDefinition, PipelineStep
     from gobby.workflows.templates import TemplateEngine
 
 logger = logging.getLogger(__name__)
@@ -37,6 +41,22 @@ logger = logging.getLogger(__name__)
 # Type alias for event callback
 PipelineEventCallback = Any  # Callable[[str, str, dict], Awaitable[None]]
 
+# Slots shared by every pipeline on an event loop, capping concurrent
+# exec/prompt/mcp steps daemon-wide (PipelineConfig.global_max_parallel_steps).
+# Stored with the limit they were built for so a config change takes effect.
+_global_step_slots: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[int, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_global_step_slots(limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    entry = _global_step_slots.get(loop)
+    if entry is None or entry[0] != limit:
+        # Steps already holding the old semaphore release it as they finish
+        entry = _global_step_slots[loop] = (limit, asyncio.Semaphore(limit))
+    return entry[1]
+
 
 def _coerce_rendered_value(value: Any) -> Any:
     """Coerce Jinja2-rendered string values back to native Python types.
@@ -69,7 +89,7 @@ class PipelineExecutor:
 
     Handles:
     - Creating and tracking execution records
-    - Iterating through steps in order
+    - Running steps in order, or as a DAG when steps declare needs/parallel_group
     - Building context with inputs and step outputs
     - Executing exec commands, prompts, and nested pipelines
     - Webhook notifications
@@ -88,6 +108,7 @@ class PipelineExecutor:
         tool_proxy_getter: Any | None = None,
         session_manager: Any | None = None,
         completion_registry: Any | None = None,
+        config: PipelineConfig | None = None,
     ):
         """Initialize the pipeline executor.
 
@@ -103,6 +124,8 @@ class PipelineExecutor:
             tool_proxy_getter: Optional callable returning ToolProxyService for MCP steps
             session_manager: Optional LocalSessionManager for session creation
             completion_registry: Optional CompletionEventRegistry for wait steps
+            config: Daemon pipeline settings (nesting and parallelism limits).
+                Defaults to PipelineConfig() when not provided.
         """
         self.db = db
         self.execution_manager = execution_manager
@@ -113,6 +136,7 @@ class PipelineExecutor:
         self.tool_proxy_getter = tool_proxy_getter
         self.session_manager = session_manager
         self.completion_registry = completion_registry
+        self.config = config or PipelineConfig()
 
         self.renderer = StepRenderer(template_engine)
         self.approval_manager = ApprovalManager(
@@ -242,8 +266,6 @@ class PipelineExecutor:
         if execution_id:
             span_attrs["execution_id"] = execution_id
 
-        # Track current step for error handling
-        current_step_execution: StepExecution | None = None
         execution: PipelineExecution | None = None
         caller_session_id: str | None = session_id
         pipeline_session_id: str | None = session_id
@@ -251,13 +273,9 @@ class PipelineExecutor:
         with create_span("pipeline.execute", attributes=span_attrs) as span:
             try:
                 # 0. Enforce nesting depth limit and cycle detection
-                depth_limit = 10
-                try:
-                    from gobby.config.pipelines import PipelineConfig
-
-                    depth_limit = PipelineConfig().nesting_depth_limit
-                except (ImportError, ValueError):
-                    pass
+                depth_limit = self.config.nesting_depth_limit
+                max_parallel_steps = self.config.max_parallel_steps
+                global_max_parallel_steps = self.config.global_max_parallel_steps
 
                 if _depth > depth_limit:
                     raise RuntimeError(
@@ -413,146 +431,30 @@ class PipelineExecutor:
                     steps = self.execution_manager.get_steps_for_execution(execution_id)
                     existing_steps = {s.step_id: s for s in steps}
 
-                # 4. Iterate through steps in order
-                for step in pipeline.steps:
-                    # Check for existing execution
-                    step_execution = existing_steps.get(step.id)
-
-                    if step_execution:
-                        # If completed, load output into context and skip
-                        if step_execution.status == StepStatus.COMPLETED:
-                            logger.info(f"Skipping completed step {step.id}")
-                            output = None
-                            if step_execution.output_json:
-                                try:
-                                    output = json.loads(step_execution.output_json)
-                                except json.JSONDecodeError:
-                                    output = step_execution.output_json
-                            context["steps"][step.id] = {"output": output}
-                            continue
-
-                        # If skipped, just skip (but register in context so downstream
-                        # conditions like ``steps.X.output`` resolve to None instead
-                        # of raising a KeyError / attribute error).
-                        if step_execution.status == StepStatus.SKIPPED:
-                            logger.info(f"Skipping previously skipped step {step.id}")
-                            context["steps"][step.id] = {"output": None}
-                            continue
-
-                        # If waiting approval, check if we should check gate again
-                        # If we are resuming, it might have been approved
-                        if step_execution.status == StepStatus.WAITING_APPROVAL:
-                            # If the step is still marked as waiting approval in DB,
-                            # checking the gate will just re-raise ApprovalRequired.
-                            # If it was approved, status should be COMPLETED.
-                            # So we can just proceed to check/execute.
-                            pass
-
-                    # Create new step execution if not exists
-                    if not step_execution:
-                        step_execution = self.execution_manager.create_step_execution(
-                            execution_id=execution.id,
-                            step_id=step.id,
-                            input_json=json.dumps(
-                                {k: v for k, v in context.items() if not k.startswith("_")}
-                            )
-                            if context
-                            else None,
-                        )
-
-                    # Check if step should run based on condition
-                    if not self.renderer.should_run_step(step, context):
-                        # Skip this step
-                        self.execution_manager.update_step_execution(
-                            step_execution_id=step_execution.id,
-                            status=StepStatus.SKIPPED,
-                        )
-                        logger.info(f"Skipping step {step.id}: condition not met")
-
-                        # Emit step_skipped event
-                        await self._emit_event(
-                            "step_skipped",
-                            execution.id,
-                            step_id=step.id,
-                            step_name=getattr(step, "name", step.id),
-                            reason="condition not met",
-                        )
-                        # Register skipped step in context so downstream conditions
-                        # like ``steps.X.output`` resolve to None instead of erroring.
-                        context["steps"][step.id] = {"output": None}
-                        current_step_execution = None
-                        continue
-
-                    # Update step status to RUNNING
-                    self.execution_manager.update_step_execution(
-                        step_execution_id=step_execution.id,
-                        status=StepStatus.RUNNING,
-                    )
-                    step_execution.status = StepStatus.RUNNING
-                    current_step_execution = step_execution
-
-                    # Emit step_started event
-                    await self._emit_event(
-                        "step_started",
-                        execution.id,
-                        step_id=step.id,
-                        step_name=getattr(step, "name", step.id),
-                    )
-
-                    # Check for approval gate
-                    await self.approval_manager.check_approval_gate(
-                        step, execution, step_execution, pipeline
+                # 4. Run steps as their dependencies complete. Without needs /
+                # parallel_group each step depends on the previous one (sequential).
+                running_execution = execution
+                steps_by_id = {step.id: step for step in pipeline.steps}
+                step_slots = _get_global_step_slots(global_max_parallel_steps)
+
+                async def run_step(step_id: str) -> None:
+                    await self._run_step(
+                        steps_by_id[step_id],
+                        running_execution,
+                        pipeline,
+                        context,
+                        project_id,
+                        existing_steps,
+                        step_slots,
                     )
 
-                    # Execute the step
-                    step_output = await self._execute_step(step, context, project_id)
-
-                    # Detect exec step failures from non-zero exit codes
-                    if isinstance(step_output, dict) and step_output.get("exit_code", 0) != 0:
-                        error_msg = (
-                            step_output.get("stderr")
-                            or step_output.get("stdout")
-                            or "Unknown error"
-                        )
-                        context["steps"][step.id] = {"output": step_output}
-                        self.execution_manager.update_step_execution(
-                            step_execution_id=step_execution.id,
-                            status=StepStatus.FAILED,
-                            output_json=json.dumps(step_output),
-                            error=f"Exit code {step_output['exit_code']}: {error_msg}",
-                        )
-                        raise RuntimeError(
-                            f"Step '{step.id}' failed with exit code {step_output['exit_code']}"
-                        )
-
-                    # For exec steps with JSON stdout, merge parsed data into output
-                    if isinstance(step_output, dict) and "stdout" in step_output:
-                        try:
-                            parsed = json.loads(step_output["stdout"].strip())
-                            if isinstance(parsed, dict):
-                                step_output.update(parsed)
-                        except (json.JSONDecodeError, ValueError):
-                            pass
-
-                    # Store step output in context for subsequent steps
-                    context["steps"][step.id] = {"output": step_output}
-
-                    # Update step with output and mark completed
-                    self.execution_manager.update_step_execution(
-                        step_execution_id=step_execution.id,
-                        status=StepStatus.COMPLETED,
-                        output_json=json.dumps(step_output) if step_output is not None else None,
-                    )
-                    current_step_execution = None
-
-                    # Emit step_completed event
-                    await self._emit_event(
-                        "step_completed",
-                        execution.id,
-                        step_id=step.id,
-                        step_name=getattr(step, "name", step.id),
-                        output=step_output,
-                    )
+                await run_step_graph(
+                    list(steps_by_id),
+                    build_step_dependencies(pipeline.steps),
+                    run_step,
+                    max_parallel=pipeline.max_parallel or max_parallel_steps,
+                    pause_exceptions=(ApprovalRequired,),
+                )
 
                 # 5. Safety net — verify no steps failed before marking completed
                 failed_steps = self.execution_manager.get_failed_steps(execution.id)
@@ -612,23 +514,6 @@ class PipelineExecutor:
                 if execution:
                     logger.error(f"Pipeline execution failed: {e}", exc_info=True)
 
-                    # Mark the currently-running step as FAILED
-                    if (
-                        current_step_execution
-                        and current_step_execution.status == StepStatus.RUNNING
-                    ):
-                        try:
-                            self.execution_manager.update_step_execution(
-                                step_execution_id=current_step_execution.id,
-                                status=StepStatus.FAILED,
-                                error=str(e),
-                            )
-                        except Exception:
-                            logger.error(
-                                f"Failed to mark step {current_step_execution.id} as failed",
-                                exc_info=True,
-                            )
-
                     try:
                         failed = self.execution_manager.update_execution_status(
                             execution_id=execution.id,
@@ -660,6 +545,171 @@ class PipelineExecutor:
                     self._close_pipeline_session(pipeline_session_id, caller_session_id)
                 raise
 
+    async def _run_step(
+        self,
+        step: PipelineStep,
+        execution: PipelineExecution,
+        pipeline: PipelineDefinition,
+        context: dict[str, Any],
+        project_id: str,
+        existing_steps: dict[str, StepExecution],
+        step_slots: asyncio.Semaphore,
+    ) -> None:
+        """Run one step: resume/skip bookkeeping, approval gate, execution, output.
+
+        Raises:
+            ApprovalRequired: If the step's approval gate pauses it
+            RuntimeError: If the step fails (the step record is marked FAILED)
+        """
+        # Check for existing execution
+        step_execution = existing_steps.get(step.id)
+
+        if step_execution:
+            # If completed, load output into context and skip
+            if step_execution.status == StepStatus.COMPLETED:
+                logger.info(f"Skipping completed step {step.id}")
+                output = None
+                if step_execution.output_json:
+                    try:
+                        output = json.loads(step_execution.output_json)
+                    except json.JSONDecodeError:
+                        output = step_execution.output_json
+                context["steps"][step.id] = {"output": output}
+                return
+
+            # If skipped, just skip (but register in context so downstream
+            # conditions like ``steps.X.output`` resolve to None instead
+            # of raising a KeyError / attribute error).
+            if step_execution.status == StepStatus.SKIPPED:
+                logger.info(f"Skipping previously skipped step {step.id}")
+                context["steps"][step.id] = {"output": None}
+                return
+
+            # A step still WAITING_APPROVAL in the DB re-checks its gate below
+            # (raising ApprovalRequired again); an approved one is COMPLETED.
+
+        # Create new step execution if not exists
+        if not step_execution:
+            step_execution = self.execution_manager.create_step_execution(
+                execution_id=execution.id,
+                step_id=step.id,
+                input_json=json.dumps({k: v for k, v in context.items() if not k.startswith("_")})
+                if context
+                else None,
+            )
+
+        # Check if step should run based on condition
+        if not self.renderer.should_run_step(step, context):
+            # Skip this step
+            self.execution_manager.update_step_execution(
+                step_execution_id=step_execution.id,
+                status=StepStatus.SKIPPED,
+            )
+            logger.info(f"Skipping step {step.id}: condition not met")
+
+            # Emit step_skipped event
+            await self._emit_event(
+                "step_skipped",
+                execution.id,
+                step_id=step.id,
+                step_name=getattr(step, "name", step.id),
+                reason="condition not met",
+            )
+            # Register skipped step in context so downstream conditions
+            # like ``steps.X.output`` resolve to None instead of erroring.
+            context["steps"][step.id] = {"output": None}
+            return
+
+        # Update step status to RUNNING
+        self.execution_manager.update_step_execution(
+            step_execution_id=step_execution.id,
+            status=StepStatus.RUNNING,
+        )
+        step_execution.status = StepStatus.RUNNING
+
+        try:
+            # Emit step_started event
+            await self._emit_event(
+                "step_started",
+                execution.id,
+                step_id=step.id,
+                step_name=getattr(step, "name", step.id),
+            )
+
+            # Check for approval gate
+            await self.approval_manager.check_approval_gate(
+                step, execution, step_execution, pipeline
+            )
+
+            # Execute the step. Nested pipelines and waits only block on other
+            # work, so they don't hold a global slot (avoids nesting deadlock).
+            if step.invoke_pipeline or step.wait:
+                step_output = await self._execute_step(step, context, project_id)
+            else:
+                async with step_slots:
+                    step_output = await self._execute_step(step, context, project_id)
+
+            # Detect exec step failures from non-zero exit codes
+            if isinstance(step_output, dict) and step_output.get("exit_code", 0) != 0:
+                error_msg = (
+                    step_output.get("stderr") or step_output.get("stdout") or "Unknown error"
+                )
+                context["steps"][step.id] = {"output": step_output}
+                self.execution_manager.update_step_execution(
+                    step_execution_id=step_execution.id,
+                    status=StepStatus.FAILED,
+                    output_json=json.dumps(step_output),
+                    error=f"Exit code {step_output['exit_code']}: {error_msg}",
+                )
+                raise RuntimeError(
+                    f"Step '{step.id}' failed with exit code {step_output['exit_code']}"
+                )
+        except ApprovalRequired:
+            raise
+        except Exception as e:
+            # Mark the running step as FAILED
+            if step_execution.status == StepStatus.RUNNING:
+                try:
+                    self.execution_manager.update_step_execution(
+                        step_execution_id=step_execution.id,
+                        status=StepStatus.FAILED,
+                        error=str(e),
+                    )
+                except Exception:
+                    logger.error(
+                        f"Failed to mark step {step_execution.id} as failed",
+                        exc_info=True,
+                    )
+            raise
+
+        # For exec steps with JSON stdout, merge parsed data into output
+        if isinstance(step_output, dict) and "stdout" in step_output:
+            try:
+                parsed = json.loads(step_output["stdout"].strip())
+                if isinstance(parsed, dict):
+                    step_output.update(parsed)
+            except (json.JSONDecodeError, ValueError):
+                pass
+
+        # Store step output in context for subsequent steps
+        context["steps"][step.id] = {"output": step_output}
+
+        # Update step with output and mark completed
+        self.execution_manager.update_step_execution(
+            step_execution_id=step_execution.id,
+            status=StepStatus.COMPLETED,
+            output_json=json.dumps(step_output) if step_output is not None else None,
+        )
+
+        # Emit step_completed event
+        await self._emit_event(
+            "step_completed",
+            execution.id,
+            step_id=step.id,
+            step_name=getattr(step, "name", step.id),
+            output=step_output,
+        )
+
     async def _execute_step(
         self,
         step: Any,  # PipelineStep
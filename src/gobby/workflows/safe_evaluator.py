@@ -7,16 +7,28 @@ and lazy boolean evaluation for deferred computation.
 from __future__ import annotations
 
 import ast
+import functools
 import logging
 import operator
 from collections.abc import Callable, Iterator
 from typing import Any
 
-__all__ = ["LazyBool", "SafeExpressionEvaluator", "build_condition_helpers"]
+__all__ = ["LazyBool", "SafeExpressionEvaluator", "build_condition_helpers", "parse_expression"]
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=2048)
+def parse_expression(expr: str) -> ast.Expression:
+    """Parse an expression into an AST, memoized by source text.
+
+    Rule and transition conditions are a small, stable set of strings that are
+    evaluated on every hook event, so parsing each one once avoids repeated
+    ``ast.parse`` work. The returned tree is shared and must not be mutated.
+    """
+    return ast.parse(SafeExpressionEvaluator._normalize_expr(expr), mode="eval")
+
+
 class LazyBool:
     """Lazy boolean that defers computation until first access.
 
@@ -89,16 +101,14 @@ class SafeExpressionEvaluator(ast.NodeVisitor):
     def evaluate(self, expr: str) -> bool:
         """Evaluate expression and return boolean result."""
         try:
-            tree = ast.parse(self._normalize_expr(expr), mode="eval")
-            return bool(self.visit(tree.body))
+            return bool(self.visit(parse_expression(expr).body))
         except Exception as e:
             raise ValueError(f"Invalid expression: {e}") from e
 
     def evaluate_value(self, expr: str) -> Any:
         """Evaluate expression and return the raw value (not coerced to bool)."""
         try:
-            tree = ast.parse(self._normalize_expr(expr), mode="eval")
-            return self.visit(tree.body)
+            return self.visit(parse_expression(expr).body)
         except Exception as e:
             raise ValueError(f"Invalid expression: {e}") from e
 
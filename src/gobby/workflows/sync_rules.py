@@ -15,7 +15,10 @@ import yaml
 from pydantic import ValidationError
 
 from gobby.storage.database import DatabaseProtocol
-from gobby.storage.workflow_definitions import LocalWorkflowDefinitionManager
+from gobby.storage.workflow_definitions import (
+    LocalWorkflowDefinitionManager,
+    bump_rule_generation,
+)
 from gobby.workflows.definitions import RuleDefinitionBody
 
 logger = logging.getLogger(__name__)
@@ -63,6 +66,7 @@ def sync_bundled_rules(
         "       OR json_extract(definition_json, '$.effects') IS NOT NULL)",
     ).rowcount
     if repaired:
+        bump_rule_generation()
         logger.info(f"Repaired {repaired} rows with incorrect workflow_type (should be 'rule')")
 
     result: dict[str, Any] = {
@@ -0,0 +1,216 @@
+"""Tests for the tmux control-mode client."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gobby.agents.lifecycle_monitor import AgentLifecycleMonitor
+from gobby.agents.tmux.config import TmuxConfig
+from gobby.agents.tmux.control_client import (
+    TmuxControlClient,
+    _PaneState,
+    _Pending,
+    decode_output,
+    quote_argument,
+)
+from gobby.agents.tmux.errors import TmuxSessionError
+from gobby.agents.tmux.output_reader import TmuxOutputReader
+from gobby.agents.tmux.session_manager import TmuxSessionManager
+from gobby.storage.agents import AgentRun
+
+pytestmark = pytest.mark.unit
+
+
+def _watched_client(session_name: str = "agent-1", pane_id: str = "%3") -> TmuxControlClient:
+    client = TmuxControlClient(buffer_bytes=64)
+    state = _PaneState(session_name, pane_id, "@2", client._buffer_bytes)
+    client._panes[pane_id] = state
+    client._sessions[session_name] = state
+    return client
+
+
+def test_decode_output_and_quoting() -> None:
+    assert decode_output(rb"a\015\012b\134c") == b"a\r\nb\\c"
+    assert quote_argument("it's") == "'it'\\''s'"
+    with pytest.raises(ValueError):
+        quote_argument("a\nb")
+
+
+@pytest.mark.asyncio
+async def test_output_fills_ring_buffer_and_notifies_listeners() -> None:
+    client = _watched_client()
+    received: list[tuple[str, str]] = []
+    async_listener = AsyncMock()
+    client.add_listener(lambda name, text: received.append((name, text)))
+    client.add_listener(async_listener)
+
+    await client._handle_line(rb"%output %3 \033[1mDo you trust\033[0m\015\012")
+    await client._handle_line(b"%output %9 other pane")
+    # A multi-byte character split across notifications decodes once complete
+    await client._handle_line(b"%output %3 \xe2\x9d")
+    await client._handle_line(b"%output %3 \xaf the files" + b"x" * 80)
+
+    assert received[0] == ("agent-1", "\x1b[1mDo you trust\x1b[0m\r\n")
+    assert received[1][1].startswith("❯ the files")
+    assert async_listener.await_count == 2
+    assert len(client.recent_output("agent-1")) == 64
+    assert client._sessions["agent-1"].seq > 64
+    assert client.last_output_at("agent-1") is not None
+
+
+def test_recent_text_strips_escape_sequences() -> None:
+    client = _watched_client()
+    client._sessions["agent-1"].buffer += b"\x1b[2KDo\x1b[1Cyou\x1b]0;title\x07 trust\r\n"
+    assert client.recent_text("agent-1") == " Do you trust "
+
+
+@pytest.mark.asyncio
+async def test_replies_resolve_commands_in_order() -> None:
+    client = TmuxControlClient()
+    loop = asyncio.get_running_loop()
+    first, second = _Pending(loop.create_future()), _Pending(loop.create_future())
+    client._pending.extend([first, second])
+
+    for line in (
+        b"%begin 1 10 1",
+        b"line one",
+        b"%output %1 interleaved",
+        b"%end 1 10 1",
+        b"%begin 1 11 1",
+        b"can't find session",
+        b"%error 1 11 1",
+    ):
+        await client._handle_line(line)
+
+    assert first.future.result() == ["line one", "%output %1 interleaved"]
+    with pytest.raises(TmuxSessionError, match="can't find session"):
+        second.future.result()
+
+
+@pytest.mark.asyncio
+async def test_capture_is_cached_until_new_output() -> None:
+    client = _watched_client()
+    client._proc = MagicMock(returncode=None)
+    with patch.object(client, "command", AsyncMock(return_value=["$ ls", "file"])) as command:
+        assert await client.capture_pane("agent-1", lines=5) == "$ ls\nfile\n"
+        assert await client.capture_pane("agent-1", lines=5) == "$ ls\nfile\n"
+        assert command.await_count == 1
+        assert client.capture_cache_hits == 1
+
+        await client._handle_line(b"%output %3 more")
+        await client.capture_pane("agent-1", lines=5)
+        assert command.await_count == 2
+        await client.capture_pane("agent-1", lines=15)  # different size, separate entry
+        assert command.await_count == 3
+
+    assert await client.capture_pane("not-watched") is None
+
+
+@pytest.mark.asyncio
+async def test_window_close_forgets_pane() -> None:
+    client = _watched_client()
+    client._proc = MagicMock(returncode=None)
+    await client._handle_line(b"%unlinked-window-close @2")
+    assert not client.is_watching("agent-1")
+    assert client._panes == {}
+
+
+@pytest.mark.asyncio
+async def test_output_reader_streams_via_control_client() -> None:
+    client = _watched_client()
+    client.watch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+    reader = TmuxOutputReader(control_client=client)
+    callback = AsyncMock()
+    reader.set_output_callback(callback)
+
+    assert await reader.start_reader("run-1", "agent-1") is True
+    assert await reader.start_reader("run-1", "agent-1") is False
+    await client._handle_line(b"%output %3 hello")
+    callback.assert_awaited_once_with("run-1", "hello")
+    assert reader._reader_tasks == {}  # no FIFO loop
+
+    assert await reader.stop_reader("run-1") is True
+    await client._handle_line(b"%output %3 ignored")
+    assert callback.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_monitor_checks_prompt_on_output() -> None:
+    client = _watched_client()
+    client._proc = MagicMock(returncode=None)
+    client.watch = AsyncMock(return_value=True)  # type: ignore[method-assign]
+    client.capture_pane = AsyncMock(return_value="working...\n")  # type: ignore[method-assign]
+    run = AgentRun(
+        id="run-1",
+        parent_session_id="p",
+        provider="claude",
+        prompt="x",
+        status="running",
+        created_at="2024-01-01T00:00:00",
+        updated_at="2024-01-01T00:00:00",
+        tmux_session_name="agent-1",
+    )
+    manager = MagicMock()
+    manager.list_active.return_value = [run]
+    monitor = AgentLifecycleMonitor(
+        agent_run_manager=manager, db=MagicMock(), control_client=client
+    )
+    client.add_listener(monitor._on_pane_output)
+    await monitor.check_trust_prompts()  # registers the run; nothing to dismiss yet
+
+    with (
+        patch("gobby.agents.lifecycle_monitor._PROMPT_CHECK_MIN_INTERVAL", 0.0),
+        patch("gobby.agents.lifecycle_monitor._PROMPT_CHECK_DEBOUNCE", 0.0),
+        patch.object(monitor._tmux, "send_keys", AsyncMock(return_value=True)) as send_keys,
+    ):
+        client.capture_pane.return_value = "Do you trust the files in this folder?\n"
+        await client._handle_line(b"%output %3 Do you trust the files in this folder?")
+        await asyncio.gather(*monitor._prompt_tasks.values())
+
+    send_keys.assert_awaited_once_with("agent-1", "\n")
+    assert monitor._prompt_detector.was_dismissed("run-1")
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed")
+@pytest.mark.asyncio
+async def test_real_tmux_server() -> None:
+    config = TmuxConfig(socket_name=f"gobby-test-{uuid.uuid4().hex[:8]}")
+    manager = TmuxSessionManager(config)
+    rc, _, _ = await manager._run(
+        "new-session", "-d", "-s", "agent-1", "-x", "80", "-y", "20", "sh"
+    )
+    assert rc == 0
+    client = TmuxControlClient(config)
+    output: list[str] = []
+    client.add_listener(lambda _name, text: output.append(text))
+    try:
+        assert await client.watch("agent-1")
+        assert [s.name for s in await manager.list_sessions()] == ["agent-1"]
+
+        await manager.send_keys("agent-1", "echo control-$((40 + 2))\n")
+        for _ in range(50):
+            if "control-42" in "".join(output):
+                break
+            await asyncio.sleep(0.05)
+        assert "control-42" in client.recent_text("agent-1")
+
+        captured = await client.capture_pane("agent-1", lines=5)
+        assert captured == await manager.capture_pane("agent-1", lines=5)
+        assert await client.has_session("agent-1") is True
+        assert await client.has_session("missing") is False
+
+        await manager._run("kill-session", "-t", "agent-1")
+        for _ in range(50):
+            if not client.is_watching("agent-1"):
+                break
+            await asyncio.sleep(0.05)
+        assert not client.is_watching("agent-1")
+    finally:
+        await client.stop()
+        await manager._run("kill-server")
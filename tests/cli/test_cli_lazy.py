@@ -0,0 +1,111 @@
+"""Tests for lazy subcommand loading in the root CLI group."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from gobby.cli import COMMANDS, cli
+from gobby.cli._lazy import CliState, LazyCommand, LazyGroup
+
+pytestmark = pytest.mark.unit
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run(args: list[str]) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter that can import gobby from the source tree."""
+    paths = [str(REPO_ROOT / "src"), os.environ.get("PYTHONPATH", "")]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in paths if p)}
+    return subprocess.run(  # nosec B603
+        [sys.executable, *args], capture_output=True, text=True, check=False, env=env
+    )
+
+
+@pytest.mark.parametrize("name", sorted(COMMANDS))
+def test_registry_entry_matches_command(name: str) -> None:
+    """Each registry entry resolves to a command whose help matches the registry."""
+    command = LazyGroup(lazy_commands=COMMANDS).load_command(name)
+    assert command.get_short_help_str(200) == COMMANDS[name].short_help
+
+
+def test_help_lists_commands_without_importing_them() -> None:
+    code = (
+        "import sys; sys.argv = ['gobby', '--help']\n"
+        "from gobby.cli import cli\n"
+        "try:\n"
+        "    cli()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = [m for m in ('gobby.cli.tasks', 'gobby.config.app', 'gobby.storage.database')"
+        " if m in sys.modules]\n"
+        "print('HEAVY', heavy)\n"
+    )
+    result = _run(["-c", code])
+    assert result.returncode == 0, result.stderr
+    assert "HEAVY []" in result.stdout
+    for name in COMMANDS:
+        assert f"  {name} " in result.stdout
+
+
+def test_subcommand_help_does_not_load_config() -> None:
+    with patch("gobby.cli.load_config") as mock_load:
+        result = CliRunner().invoke(cli, ["tasks", "--help"])
+    assert result.exit_code == 0
+    assert "Manage development tasks." in result.output
+    mock_load.assert_not_called()
+
+
+def test_config_loaded_on_first_access() -> None:
+    calls: list[int] = []
+    state = CliState(lambda: calls.append(1) or "config")
+    assert calls == []
+    assert "config" in state
+    assert "other" not in state
+    assert calls == []
+    assert state["config"] == "config"
+    assert state.get("config") == "config"
+    assert calls == [1]
+    assert state.get("other") is None
+    with pytest.raises(KeyError):
+        state["other"]
+
+
+def test_skills_command_reads_lazy_config() -> None:
+    """Subcommands that check ``"config" in ctx.obj`` see the lazily loaded config."""
+    from gobby.config.app import DaemonConfig
+
+    with (
+        patch("gobby.cli.load_config", return_value=DaemonConfig()),
+        patch("gobby.utils.daemon_client.DaemonClient.check_health", return_value=(False, None)),
+    ):
+        result = CliRunner().invoke(cli, ["skills", "search", "foo"])
+    assert "Configuration not initialized" not in result.output
+    assert "Daemon not running" in result.output
+
+
+def test_registry_entry_must_be_a_command() -> None:
+    group = LazyGroup(lazy_commands={"bad": LazyCommand("gobby.cli:COMMANDS", "Bad.")})
+    with pytest.raises(TypeError, match="not a click command"):
+        group.get_command(click.Context(group), "bad")
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not os.environ.get("GOBBY_RUN_BENCHMARKS"),
+    reason="wall-clock benchmark; set GOBBY_RUN_BENCHMARKS=1 to run",
+)
+def test_import_time_within_budget() -> None:
+    """The CLI startup benchmark passes (budgets doubled for noisy CI machines).
+
+    Opt-in because timings are unreliable under parallel runs; the module
+    checks above cover what gets imported.
+    """
+    script = REPO_ROOT / "scripts" / "bench_cli_importtime.py"
+    result = _run([str(script), "--repeat", "3", "--scale", "2"])
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,209 @@
+"""Tests for the SQLite-backed in-memory call graph."""
+
+from __future__ import annotations
+
+import pytest
+
+from gobby.code_index import local_graph
+from gobby.code_index.graph import CodeGraph
+from gobby.code_index.local_graph import LocalCodeGraph
+from gobby.code_index.models import CallRelation, ImportRelation, IndexedFile, Symbol
+from gobby.code_index.storage import CodeIndexStorage
+
+pytestmark = pytest.mark.unit
+
+PROJECT = "proj-1"
+
+
+def _index_file(
+    storage: CodeIndexStorage,
+    file_path: str,
+    functions: dict[str, list[str]],
+    imports: list[str] = (),  # type: ignore[assignment]
+    content_hash: str = "v1",
+) -> dict[str, str]:
+    """Index a file defining ``functions`` (name -> names it calls), like gcode does."""
+    symbols = [
+        Symbol(
+            id=Symbol.make_id(PROJECT, file_path, name, "function", line * 100),
+            project_id=PROJECT,
+            file_path=file_path,
+            name=name,
+            qualified_name=name,
+            kind="function",
+            language="python",
+            byte_start=line * 100,
+            byte_end=line * 100 + 50,
+            line_start=line * 10,
+            line_end=line * 10 + 5,
+        )
+        for line, name in enumerate(functions, start=1)
+    ]
+    ids = {s.name: s.id for s in symbols}
+    storage.delete_symbols_for_file(PROJECT, file_path)
+    storage.upsert_symbols(symbols)
+    storage.upsert_calls(
+        PROJECT,
+        file_path,
+        [
+            CallRelation(ids[caller], callee, file_path, symbol.line_start + 1 + i)
+            for symbol in symbols
+            for caller in [symbol.name]
+            for i, callee in enumerate(functions[caller])
+        ],
+    )
+    storage.upsert_imports(PROJECT, file_path, [ImportRelation(file_path, m) for m in imports])
+    storage.upsert_file(
+        IndexedFile(
+            id=IndexedFile.make_id(PROJECT, file_path),
+            project_id=PROJECT,
+            file_path=file_path,
+            language="python",
+            content_hash=content_hash,
+        )
+    )
+    return ids
+
+
+@pytest.fixture
+def indexed(code_storage: CodeIndexStorage) -> CodeIndexStorage:
+    """main -> handle -> (validate, save); save -> write; cli -> main."""
+    _index_file(code_storage, "app.py", {"main": ["handle"], "handle": ["validate", "save"]})
+    _index_file(
+        code_storage, "db.py", {"save": ["write", "print"], "write": []}, imports=["sqlite3"]
+    )
+    _index_file(code_storage, "check.py", {"validate": []}, imports=["sqlite3", "re"])
+    _index_file(code_storage, "cli.py", {"cli": ["main"]})
+    return code_storage
+
+
+def test_multi_hop_callers_with_depth_limit(indexed: CodeIndexStorage) -> None:
+    graph = LocalCodeGraph(indexed.db)
+
+    direct = graph.find_callers("write", PROJECT)
+    assert [(r["caller_name"], r["distance"], r["file"]) for r in direct] == [("save", 1, "db.py")]
+
+    chain = graph.find_callers("write", PROJECT, depth=5)
+    assert [(r["caller_name"], r["distance"]) for r in chain] == [
+        ("save", 1),
+        ("handle", 2),
+        ("main", 3),
+        ("cli", 4),
+    ]
+    assert [r["caller_name"] for r in graph.find_callers("write", PROJECT, depth=2)] == [
+        "save",
+        "handle",
+    ]
+    assert graph.find_callers("missing", PROJECT) == []
+
+
+def test_callees_include_unresolved_names(indexed: CodeIndexStorage) -> None:
+    graph = LocalCodeGraph(indexed.db)
+
+    callees = graph.find_callees("handle", PROJECT, depth=2)
+
+    assert [(r["callee_name"], r["distance"]) for r in callees] == [
+        ("save", 1),
+        ("validate", 1),
+        ("print", 2),
+        ("write", 2),
+    ]
+    by_name = {r["callee_name"]: r for r in callees}
+    assert by_name["print"]["callee_id"] is None
+    assert by_name["write"]["file_path"] == "db.py"
+
+
+def test_usages_and_blast_radius(indexed: CodeIndexStorage) -> None:
+    graph = LocalCodeGraph(indexed.db)
+
+    usages = graph.find_usages("sqlite3", PROJECT)
+    assert [(u["rel_type"], u["file"]) for u in usages] == [
+        ("IMPORTS", "check.py"),
+        ("IMPORTS", "db.py"),
+    ]
+
+    radius = graph.find_blast_radius("validate", None, PROJECT, depth=3)
+    assert [(r["symbol_name"], r["distance"], r["file_path"]) for r in radius] == [
+        ("handle", 1, "app.py"),
+        ("main", 2, "app.py"),
+        ("cli", 3, "cli.py"),
+    ]
+
+    by_file = graph.find_blast_radius(None, "db.py", PROJECT, depth=1)
+    assert {(r.get("symbol_name"), r["rel_type"]) for r in by_file} == {
+        ("handle", "call"),
+        ("save", "call"),
+        (None, "import"),
+    }
+    assert [r["file_path"] for r in by_file if r["rel_type"] == "import"] == ["check.py"]
+
+    with pytest.raises(ValueError, match="Exactly one"):
+        graph.find_blast_radius("validate", "db.py", PROJECT)
+
+
+def test_reindexed_file_is_patched_incrementally(indexed: CodeIndexStorage) -> None:
+    graph = LocalCodeGraph(indexed.db)
+    assert graph.find_callers("write", PROJECT) != []
+
+    # save no longer writes; a new flush() does
+    _index_file(
+        indexed, "db.py", {"save": ["flush"], "flush": ["write"], "write": []}, content_hash="v2"
+    )
+
+    callers = graph.find_callers("write", PROJECT, depth=3)
+    assert [(r["caller_name"], r["distance"]) for r in callers] == [
+        ("flush", 1),
+        ("save", 2),
+        ("handle", 3),
+    ]
+    stats = graph.stats(PROJECT)
+    assert stats["tombstones"] == 2  # old save/write symbols, not a full reload
+    assert stats["overlay_calls"] == 2
+    # Callers elsewhere resolve to the re-indexed symbol by name
+    assert graph.find_callers("save", PROJECT)[0]["caller_name"] == "handle"
+
+
+def test_deleted_file_drops_out(indexed: CodeIndexStorage) -> None:
+    graph = LocalCodeGraph(indexed.db)
+    assert graph.find_callers("main", PROJECT)
+
+    indexed.delete_symbols_for_file(PROJECT, "cli.py")
+    indexed.delete_calls_for_file(PROJECT, "cli.py")
+    indexed.delete_file(PROJECT, "cli.py")
+
+    assert graph.find_callers("main", PROJECT) == []
+
+
+def test_compaction_rebuilds_csr(
+    indexed: CodeIndexStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(local_graph, "_MIN_COMPACT", 0)
+    monkeypatch.setattr(local_graph, "_COMPACT_RATIO", 0.0)
+    monkeypatch.setattr(local_graph, "_FULL_RELOAD_RATIO", 1.0)
+    graph = LocalCodeGraph(indexed.db)
+    graph.find_callers("write", PROJECT)
+
+    _index_file(indexed, "db.py", {"save": ["write"], "write": []}, content_hash="v2")
+
+    stats = graph.stats(PROJECT)
+    assert stats["tombstones"] == 0
+    assert stats["overlay_calls"] == 0
+    assert [r["caller_name"] for r in graph.find_callers("write", PROJECT, depth=2)] == [
+        "save",
+        "handle",
+    ]
+
+
+async def test_code_graph_falls_back_to_local(indexed: CodeIndexStorage) -> None:
+    graph = CodeGraph(local=LocalCodeGraph(indexed.db))
+    assert not graph.available
+    assert graph.queryable
+
+    callers = await graph.find_callers("validate", PROJECT, depth=2)
+    assert [r["caller_name"] for r in callers] == ["handle", "main"]
+    imports = await graph.get_imports("check.py", PROJECT)
+    assert sorted(i["module_name"] for i in imports) == ["re", "sqlite3"]
+    radius = await graph.find_blast_radius("write", None, PROJECT, depth=50)
+    assert [r["distance"] for r in radius] == [1, 2, 3, 4]
+
+    assert await CodeGraph().find_callers("validate", PROJECT) == []
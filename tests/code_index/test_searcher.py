@@ -0,0 +1,217 @@
+"""Tests for hybrid code search."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from gobby.code_index.models import IndexedFile, Symbol
+from gobby.code_index.searcher import CodeSearcher
+from gobby.code_index.storage import CodeIndexStorage
+from gobby.config.code_index import CodeIndexConfig
+
+pytestmark = pytest.mark.unit
+
+
+@dataclass
+class _Hit:
+    id: str
+    score: float
+
+
+class FakeVectorStore:
+    def __init__(self, ids: list[str]) -> None:
+        self.ids = ids
+        self.searches = 0
+        self.fail = False
+
+    async def search(
+        self, query_embedding: list[float], collection_name: str, limit: int
+    ) -> list[_Hit]:
+        self.searches += 1
+        if self.fail:
+            raise ConnectionError("qdrant down")
+        return [_Hit(i, 1.0 - n / 100) for n, i in enumerate(self.ids[:limit])]
+
+
+async def _embed(text: str, is_query: bool = False) -> list[float]:
+    return [0.1, 0.2]
+
+
+def _add_file(storage: CodeIndexStorage, path: str, names: list[str], rev: str = "v1") -> None:
+    storage.upsert_symbols(
+        [
+            Symbol(
+                id=Symbol.make_id("p1", path, name, "function", i * 100),
+                project_id="p1",
+                file_path=path,
+                name=name,
+                qualified_name=name,
+                kind="function",
+                language="python",
+                byte_start=i * 100,
+                byte_end=i * 100 + 50,
+                line_start=i * 10 + 1,
+                line_end=i * 10 + 5,
+            )
+            for i, name in enumerate(names)
+        ]
+    )
+    storage.upsert_file(
+        IndexedFile(
+            id=IndexedFile.make_id("p1", path),
+            project_id="p1",
+            file_path=path,
+            language="python",
+            content_hash=f"{path}-{rev}",
+        )
+    )
+
+
+def _id(path: str, name: str, i: int) -> str:
+    return Symbol.make_id("p1", path, name, "function", i * 100)
+
+
+@pytest.fixture
+def storage(code_storage: CodeIndexStorage) -> CodeIndexStorage:
+    _add_file(code_storage, "auth.py", ["parse_token", "refresh_session", "logout"])
+    _add_file(code_storage, "db.py", ["connect", "parse_row"])
+    return code_storage
+
+
+async def test_semantic_hits_are_hydrated_in_batches(
+    storage: CodeIndexStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = FakeVectorStore(
+        [_id("auth.py", "refresh_session", 1), "gone", _id("db.py", "connect", 0)]
+    )
+    searcher = CodeSearcher(storage, vector_store=store, embed_fn=_embed)
+    lookups: list[list[str]] = []
+    get_symbols = storage.get_symbols
+    monkeypatch.setattr(storage, "get_symbols", lambda ids: lookups.append(ids) or get_symbols(ids))
+    monkeypatch.setattr(storage, "get_symbol", lambda _id: pytest.fail("per-symbol lookup"))
+
+    results = await searcher.search("parse", "p1", limit=4)
+
+    # "gone" was deleted from the index, so one more lookup fills its slot
+    assert lookups == [store.ids[:2], store.ids[2:]]
+    assert {r["name"]: r["_sources"] for r in results} == {
+        "parse_token": ["name"],
+        "parse_row": ["name"],
+        "refresh_session": ["semantic"],
+        "connect": ["semantic"],
+    }
+
+
+async def test_results_are_cached_until_the_index_changes(storage: CodeIndexStorage) -> None:
+    store = FakeVectorStore([_id("auth.py", "logout", 2)])
+    searcher = CodeSearcher(storage, vector_store=store, embed_fn=_embed)
+
+    first = await searcher.search("parse", "p1")
+    first[0]["name"] = "mutated by caller"
+    second = await searcher.search("parse", "p1")
+    assert store.searches == 1
+    assert second[0]["name"] != "mutated by caller"
+    assert (searcher.cache_hits, searcher.cache_misses) == (1, 1)
+
+    # gcode re-indexes a file
+    _add_file(storage, "db.py", ["connect", "parse_row", "parse_rows"], rev="v2")
+    assert "parse_rows" in [r["name"] for r in await searcher.search("parse", "p1")]
+    assert store.searches == 2
+
+    # the sync worker marks a file's vectors synced
+    file = storage.get_file("p1", "auth.py")
+    assert file is not None
+    storage.record_sync_items("p1", "vector", "auth.py", {}, [], synced_file=file)
+    await searcher.search("parse", "p1")
+    assert store.searches == 3
+
+    # summaries change what to_brief() returns
+    storage.update_symbol_summary(_id("auth.py", "parse_token", 0), "Decode a bearer token")
+    results = await searcher.search("parse", "p1")
+    assert store.searches == 4
+    assert "Decode a bearer token" in [r.get("summary") for r in results]
+
+    # other queries and other projects are cached separately
+    await searcher.search("parse", "p1", limit=5)
+    await searcher.search("parse", "p2")
+    assert store.searches == 6
+
+
+async def test_cache_expires_and_can_be_disabled(storage: CodeIndexStorage) -> None:
+    store = FakeVectorStore([])
+    searcher = CodeSearcher(
+        storage,
+        vector_store=store,
+        embed_fn=_embed,
+        config=CodeIndexConfig(search_cache_ttl_seconds=0.05, search_cache_max_entries=1),
+    )
+    await searcher.search("parse", "p1")
+    await searcher.search("connect", "p1")  # evicts "parse"
+    await searcher.search("parse", "p1")
+    assert store.searches == 3
+    await asyncio.sleep(0.06)
+    await searcher.search("parse", "p1")
+    assert store.searches == 4
+
+    uncached = CodeSearcher(
+        storage,
+        vector_store=store,
+        embed_fn=_embed,
+        config=CodeIndexConfig(search_cache_ttl_seconds=0),
+    )
+    await uncached.search("parse", "p1")
+    await uncached.search("parse", "p1")
+    assert store.searches == 6
+
+
+async def test_degraded_results_are_not_cached(storage: CodeIndexStorage) -> None:
+    store = FakeVectorStore([_id("auth.py", "logout", 2)])
+    store.fail = True
+    searcher = CodeSearcher(storage, vector_store=store, embed_fn=_embed)
+
+    results = await searcher.search("parse", "p1")
+    assert {r["name"] for r in results} == {"parse_token", "parse_row"}
+
+    store.fail = False
+    results = await searcher.search("parse", "p1")
+    assert "logout" in [r["name"] for r in results]
+
+
+async def test_sources_are_queried_concurrently(storage: CodeIndexStorage) -> None:
+    embedding_started = asyncio.Event()
+    graph_started = asyncio.Event()
+
+    async def embed(text: str, is_query: bool = False) -> list[float]:
+        embedding_started.set()
+        await asyncio.wait_for(graph_started.wait(), timeout=1)
+        return [0.1]
+
+    class Graph:
+        queryable = True
+
+        async def find_callers(self, name: str, project_id: str, limit: int) -> list[Any]:
+            graph_started.set()
+            await asyncio.wait_for(embedding_started.wait(), timeout=1)
+            return [{"caller_id": _id("auth.py", "logout", 2)}]
+
+        async def find_usages(self, name: str, project_id: str, limit: int) -> list[Any]:
+            return []
+
+    searcher = CodeSearcher(
+        storage,
+        vector_store=FakeVectorStore([_id("db.py", "connect", 0)]),
+        embed_fn=embed,
+        graph=Graph(),  # type: ignore[arg-type]
+    )
+    results = await searcher.search("parse", "p1")
+
+    assert {r["name"]: r["_sources"] for r in results} == {
+        "parse_token": ["name"],
+        "parse_row": ["name"],
+        "connect": ["semantic"],
+        "logout": ["graph"],
+    }
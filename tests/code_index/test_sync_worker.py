@@ -0,0 +1,282 @@
+"""Tests for the incremental code index sync worker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gobby.code_index.graph import CodeGraph
+from gobby.code_index.models import (
+    CallRelation,
+    ImportRelation,
+    IndexedFile,
+    IndexedProject,
+    Symbol,
+)
+from gobby.code_index.storage import CodeIndexStorage
+from gobby.code_index.sync_worker import _sync_pass, _token_batches
+from gobby.config.code_index import CodeIndexConfig
+
+pytestmark = pytest.mark.unit
+
+
+class FakeVectorStore:
+    """In-memory stand-in for VectorStore's point operations."""
+
+    def __init__(self) -> None:
+        self.points: dict[str, tuple[list[float], dict[str, Any]]] = {}
+        self.upserts = 0
+
+    async def batch_upsert(self, items: list[Any], collection_name: str | None = None) -> None:
+        self.upserts += len(items)
+        for point_id, vector, payload in items:
+            self.points[point_id] = (vector, payload)
+
+    async def get_vectors(
+        self, point_ids: list[str], collection_name: str | None = None
+    ) -> dict[str, list[float]]:
+        return {pid: self.points[pid][0] for pid in point_ids if pid in self.points}
+
+    async def delete(self, filters: dict[str, Any], collection_name: str | None = None) -> None:
+        for pid, (_, payload) in list(self.points.items()):
+            if all(payload.get(k) == v for k, v in filters.items()):
+                del self.points[pid]
+
+    async def delete_many(self, ids: list[str], collection_name: str | None = None) -> None:
+        for pid in ids:
+            self.points.pop(pid, None)
+
+
+class FakeEmbedder:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls: list[list[str]] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        if self.fail:
+            raise RuntimeError("rate limited")
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+class FakeNeo4j:
+    def __init__(self) -> None:
+        self.writes: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute_write(self, query: str, params: dict[str, Any]) -> list[Any]:
+        self.writes.append((" ".join(query.split()), params))
+        return []
+
+
+def _index_file(
+    storage: CodeIndexStorage,
+    root: Path,
+    project_id: str,
+    file_path: str,
+    functions: dict[str, str],
+    calls: dict[str, list[str]] | None = None,
+    imports: list[str] = (),  # type: ignore[assignment]
+    revision: str = "v1",
+) -> dict[str, str]:
+    """Write a file's symbols (name -> docstring) the way gcode does."""
+    (root / file_path).parent.mkdir(parents=True, exist_ok=True)
+    (root / file_path).write_text("")
+    symbols = []
+    offset = 0
+    for line, (name, doc) in enumerate(functions.items(), start=1):
+        symbols.append(
+            Symbol(
+                id=Symbol.make_id(project_id, file_path, name, "function", offset),
+                project_id=project_id,
+                file_path=file_path,
+                name=name,
+                qualified_name=name,
+                kind="function",
+                language="python",
+                byte_start=offset,
+                byte_end=offset + 40 + len(doc),
+                line_start=line * 10,
+                line_end=line * 10 + 5,
+                docstring=doc,
+            )
+        )
+        offset += 50 + len(doc)
+    ids = {s.name: s.id for s in symbols}
+    storage.delete_symbols_for_file(project_id, file_path)
+    storage.upsert_symbols(symbols)
+    storage.upsert_calls(
+        project_id,
+        file_path,
+        [
+            CallRelation(ids[caller], callee, file_path, i + 1)
+            for caller, callees in (calls or {}).items()
+            for i, callee in enumerate(callees)
+        ],
+    )
+    storage.upsert_imports(project_id, file_path, [ImportRelation(file_path, m) for m in imports])
+    storage.upsert_file(
+        IndexedFile(
+            id=IndexedFile.make_id(project_id, file_path),
+            project_id=project_id,
+            file_path=file_path,
+            language="python",
+            content_hash=f"{file_path}-{revision}",
+        )
+    )
+    return ids
+
+
+@pytest.fixture
+def project(code_storage: CodeIndexStorage, tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    code_storage.upsert_project_stats(IndexedProject(id="p1", root_path=str(root)))
+    return root
+
+
+async def _run(
+    storage: CodeIndexStorage,
+    store: FakeVectorStore | None = None,
+    embedder: FakeEmbedder | None = None,
+    graph: CodeGraph | None = None,
+    **config: Any,
+) -> dict[str, int]:
+    return await _sync_pass(
+        storage=storage,
+        vector_store=store,
+        graph=graph,
+        config=CodeIndexConfig(**{"graph_enabled": graph is not None, **config}),
+        embed_model=embedder,
+        batch_size=50,
+    )
+
+
+async def test_only_changed_symbols_are_embedded(
+    code_storage: CodeIndexStorage, project: Path
+) -> None:
+    store, embedder = FakeVectorStore(), FakeEmbedder()
+    funcs = {f"fn{i}": f"does thing {i}" for i in range(10)}
+    _index_file(code_storage, project, "p1", "big.py", funcs)
+
+    stats = await _run(code_storage, store, embedder)
+    assert stats["embedded"] == 10
+    assert len(store.points) == 10
+    assert code_storage.get_file("p1", "big.py").vectors_synced == 1
+
+    # Editing fn2's docstring shifts every later symbol's byte offset (and ID)
+    funcs["fn2"] = "does something quite different now"
+    ids = _index_file(code_storage, project, "p1", "big.py", funcs, revision="v2")
+
+    stats = await _run(code_storage, store, embedder)
+    assert [len(c) for c in embedder.calls] == [10, 1]
+    assert embedder.calls[1] == ["fn2 does something quite different now"]
+    assert stats["reused"] == 7  # fn3..fn9 moved: vectors copied, not re-embedded
+    assert stats["unchanged"] == 2
+    assert set(store.points) == set(ids.values())
+    assert code_storage.get_file("p1", "big.py").vectors_synced == 1
+
+
+async def test_embedding_batches_span_files_and_projects(
+    code_storage: CodeIndexStorage, project: Path, tmp_path: Path
+) -> None:
+    other = tmp_path / "other"
+    other.mkdir()
+    code_storage.upsert_project_stats(IndexedProject(id="p2", root_path=str(other)))
+    for i in range(4):
+        _index_file(code_storage, project, "p1", f"a{i}.py", {f"a{i}": "x" * 40})
+        _index_file(code_storage, other, "p2", f"b{i}.py", {f"b{i}": "y" * 40})
+
+    store, embedder = FakeVectorStore(), FakeEmbedder()
+    # ~12 tokens per text: three texts per request
+    stats = await _run(code_storage, store, embedder, sync_embed_token_budget=40)
+
+    assert stats["embed_calls"] == 3
+    assert [len(c) for c in embedder.calls] == [3, 3, 2]
+    assert stats["files"] == 8
+
+
+def test_token_batches_respect_budget_and_size() -> None:
+    texts = [(str(i), "a" * 36) for i in range(5)]  # 10 tokens each
+    assert [len(b) for b in _token_batches(texts, 25, 100)] == [2, 2, 1]
+    assert [len(b) for b in _token_batches(texts, 1000, 4)] == [4, 1]
+    assert [len(b) for b in _token_batches([("x", "a" * 400)], 10, 4)] == [1]
+
+
+async def test_failed_embedding_leaves_file_pending(
+    code_storage: CodeIndexStorage, project: Path
+) -> None:
+    _index_file(code_storage, project, "p1", "a.py", {"f": "doc"})
+    store = FakeVectorStore()
+
+    stats = await _run(code_storage, store, FakeEmbedder(fail=True))
+    assert stats["files"] == 0
+    assert code_storage.get_file("p1", "a.py").vectors_synced == 0
+    assert code_storage.get_sync_items("p1", "vector", "a.py") == {}
+
+    await _run(code_storage, store, FakeEmbedder())
+    assert code_storage.get_file("p1", "a.py").vectors_synced == 1
+
+
+async def test_graph_sync_writes_only_the_delta(
+    code_storage: CodeIndexStorage, project: Path
+) -> None:
+    neo4j = FakeNeo4j()
+    graph = CodeGraph(neo4j_client=neo4j)
+    funcs = {"main": "", "helper": ""}
+    _index_file(
+        code_storage,
+        project,
+        "p1",
+        "app.py",
+        funcs,
+        calls={"main": ["helper", "print"]},
+        imports=["os", "json"],
+    )
+
+    stats = await _run(code_storage, graph=graph, embedding_enabled=False)
+    assert stats["graph_written"] == 6  # 2 imports, 2 calls, 2 defines
+    assert code_storage.get_file("p1", "app.py").graph_synced == 1
+    neo4j.writes.clear()
+
+    # main stops calling print and json is no longer imported
+    _index_file(
+        code_storage,
+        project,
+        "p1",
+        "app.py",
+        funcs,
+        calls={"main": ["helper"]},
+        imports=["os"],
+        revision="v2",
+    )
+    stats = await _run(code_storage, graph=graph, embedding_enabled=False)
+
+    assert (stats["graph_written"], stats["graph_removed"]) == (0, 2)
+    removed_calls = [p["rows"] for q, p in neo4j.writes if "DELETE r" in q and "CALLS" in q]
+    assert [[r["callee_name"] for r in rows] for rows in removed_calls] == [["print"]]
+    removed_imports = [p["modules"] for q, p in neo4j.writes if "IMPORTS" in q and "DELETE r" in q]
+    assert removed_imports == [["json"]]
+    assert not any("MERGE" in q for q, _ in neo4j.writes)
+
+
+async def test_deleted_file_points_and_edges_are_dropped(
+    code_storage: CodeIndexStorage, project: Path
+) -> None:
+    neo4j = FakeNeo4j()
+    store = FakeVectorStore()
+    _index_file(code_storage, project, "p1", "gone.py", {"f": "doc", "g": "doc"})
+    _index_file(code_storage, project, "p1", "kept.py", {"h": "doc"})
+    await _run(code_storage, store, FakeEmbedder(), graph=CodeGraph(neo4j_client=neo4j))
+    assert len(store.points) == 3
+
+    code_storage.delete_symbols_for_file("p1", "gone.py")
+    code_storage.delete_file("p1", "gone.py")
+    neo4j.writes.clear()
+    stats = await _run(code_storage, store, FakeEmbedder(), graph=CodeGraph(neo4j_client=neo4j))
+
+    assert stats["orphans"] == 1
+    assert [p["file_path"] for _, (_, p) in store.points.items()] == ["kept.py"]
+    assert any(p.get("file_path") == "gone.py" for _, p in neo4j.writes)
+    assert code_storage.get_orphaned_sync_files("p1") == []
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from gobby.code_index.trigger import CodeIndexTrigger
+from gobby.code_index.worker import GcodeWorkerError, GcodeWorkerUnavailable
 
 pytestmark = pytest.mark.unit
 
@@ -221,3 +222,147 @@ async def test_empty_flush_is_noop(trigger: CodeIndexTrigger, tmp_path: Path) ->
     with patch("asyncio.create_subprocess_exec") as mock_exec:
         await trigger._flush("nonexistent-project")
         mock_exec.assert_not_called()
+
+
+# ── Persistent worker ────────────────────────────────────────────────
+
+
+class FakeWorker:
+    """Stands in for GcodeWorker; ``gate`` holds each batch until set."""
+
+    def __init__(self, errors: list[Exception] | None = None) -> None:
+        self.batches: list[tuple[str, list[str]]] = []
+        self.errors = errors or []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.closed = False
+
+    def available(self) -> bool:
+        return True
+
+    async def index(self, root_path: str, files: list[str]) -> int:
+        self.batches.append((root_path, files))
+        await self.gate.wait()
+        if self.errors:
+            raise self.errors.pop(0)
+        return len(files)
+
+    def stats(self) -> dict[str, object]:
+        return {"running": True}
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_edits_during_a_batch_merge_into_the_next() -> None:
+    """Only one batch is in flight; later debounced files queue up and merge."""
+    worker = FakeWorker()
+    worker.gate.clear()
+    trigger = CodeIndexTrigger(
+        loop=asyncio.get_running_loop(), debounce_seconds=0.02, worker=worker
+    )
+
+    with patch("asyncio.create_subprocess_exec") as mock_exec:
+        trigger._schedule_file("/src/a.py", "proj-1", "/repo")
+        await asyncio.sleep(0.05)
+        assert len(worker.batches) == 1
+        assert trigger.stats()["in_flight_files"] == 1
+
+        trigger._schedule_file("/src/b.py", "proj-1", "/repo")
+        trigger._schedule_file("/other/x.py", "proj-2", "/other")
+        await asyncio.sleep(0.05)
+        trigger._schedule_file("/src/c.py", "proj-1", "/repo")
+        trigger._schedule_file("/src/a.py", "proj-1", "/repo")
+        await asyncio.sleep(0.05)
+        stats = trigger.stats()
+        assert (stats["queued_files"], stats["queued_projects"]) == (4, 2)
+        assert len(worker.batches) == 1
+
+        worker.gate.set()
+        await asyncio.sleep(0.02)
+        mock_exec.assert_not_called()
+
+    assert worker.batches == [
+        ("/repo", ["/src/a.py"]),
+        ("/repo", ["/src/a.py", "/src/b.py", "/src/c.py"]),
+        ("/other", ["/other/x.py"]),
+    ]
+    stats = trigger.stats()
+    assert (stats["batches"], stats["queued_files"], stats["fallback_batches"]) == (3, 0, 0)
+    assert stats["batch_ms"] is not None
+    await trigger.close()
+    assert worker.closed
+
+
+@pytest.mark.asyncio
+async def test_unavailable_worker_falls_back_to_subprocess(tmp_path: Path) -> None:
+    worker = FakeWorker(errors=[GcodeWorkerUnavailable("no serve mode")])
+    trigger = CodeIndexTrigger(
+        loop=asyncio.get_running_loop(), debounce_seconds=0.02, worker=worker
+    )
+
+    with (
+        patch("gobby.code_index.trigger.Path.home", return_value=tmp_path),
+        patch("asyncio.create_subprocess_exec", return_value=_make_mock_proc()) as mock_exec,
+    ):
+        gcode_bin = tmp_path / ".gobby" / "bin" / "gcode"
+        gcode_bin.parent.mkdir(parents=True, exist_ok=True)
+        gcode_bin.touch()
+
+        trigger._schedule_file("/src/foo.py", "proj-1", "/repo")
+        await asyncio.sleep(0.06)
+
+        mock_exec.assert_called_once()
+        assert "/src/foo.py" in mock_exec.call_args[0]
+    assert trigger.stats()["fallback_batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_then_dropped() -> None:
+    worker = FakeWorker(errors=[GcodeWorkerError("crashed")] * 3)
+    trigger = CodeIndexTrigger(
+        loop=asyncio.get_running_loop(),
+        debounce_seconds=0.01,
+        worker=worker,
+        max_attempts=3,
+    )
+
+    trigger._schedule_file("/src/a.py", "proj-1", "/repo")
+    await asyncio.sleep(0.15)
+
+    assert [files for _, files in worker.batches] == [["/src/a.py"]] * 3
+    stats = trigger.stats()
+    assert (stats["retried"], stats["dropped"], stats["last_error"]) == (2, 1, "crashed")
+    assert stats["queued_files"] == 0
+
+    # The next edit starts fresh
+    trigger._schedule_file("/src/c.py", "proj-1", "/repo")
+    await asyncio.sleep(0.05)
+    assert worker.batches[-1] == ("/repo", ["/src/c.py"])
+
+
+@pytest.mark.asyncio
+async def test_subprocess_uses_configured_timeout(tmp_path: Path) -> None:
+    trigger = CodeIndexTrigger(loop=asyncio.get_running_loop(), subprocess_timeout=0.05)
+    proc = _make_mock_proc()
+
+    async def hang() -> tuple[bytes, bytes]:
+        await asyncio.sleep(10)
+        return b"", b""
+
+    proc.communicate = hang
+    proc.kill = MagicMock()
+
+    with (
+        patch("gobby.code_index.trigger.Path.home", return_value=tmp_path),
+        patch("asyncio.create_subprocess_exec", return_value=proc),
+    ):
+        gcode_bin = tmp_path / ".gobby" / "bin" / "gcode"
+        gcode_bin.parent.mkdir(parents=True, exist_ok=True)
+        gcode_bin.touch()
+
+        assert await trigger._run_subprocess("proj-1", "/repo", ["/src/a.py"]) is True
+
+    proc.kill.assert_called_once()
+    assert trigger.stats()["last_error"] == "timed out after 0.05s"
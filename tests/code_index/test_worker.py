@@ -0,0 +1,149 @@
+"""Tests for the persistent gcode indexing worker."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from gobby.code_index.worker import (
+    GcodeIndexError,
+    GcodeWorker,
+    GcodeWorkerError,
+    GcodeWorkerUnavailable,
+    encode_frame,
+    read_frame,
+)
+
+pytestmark = pytest.mark.unit
+
+# Speaks the serve protocol; FAKE_GCODE_MODE picks a failure to simulate
+FAKE_GCODE = f"""#!{sys.executable}
+import json, os, struct, sys, time
+
+mode = os.environ.get("FAKE_GCODE_MODE", "ok")
+if sys.argv[1:] != ["serve", "--stdio"] or mode == "no-serve":
+    sys.stderr.write("error: unrecognized subcommand\\n")
+    sys.exit(2)
+log = os.environ["FAKE_GCODE_LOG"]
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+
+
+def read():
+    header = stdin.read(4)
+    if len(header) < 4:
+        return None
+    return json.loads(stdin.read(struct.unpack(">I", header)[0]))
+
+
+def write(message):
+    data = json.dumps(message).encode()
+    stdout.write(struct.pack(">I", len(data)) + data)
+    stdout.flush()
+
+
+while (request := read()) is not None:
+    if request["op"] == "hello":
+        write({{"id": request["id"], "ok": True, "protocol": 1}})
+        continue
+    with open(log, "a") as f:
+        f.write(json.dumps({{"pid": os.getpid(), "files": request["files"]}}) + "\\n")
+    if mode == "hang":
+        time.sleep(60)
+    if mode == "crash-once" and not os.path.exists(log + ".crashed"):
+        open(log + ".crashed", "w").close()
+        sys.exit(1)
+    if "bad.py" in request["files"]:
+        write({{"id": request["id"], "ok": False, "error": "parse failed"}})
+        continue
+    write({{"id": request["id"], "ok": True, "indexed": len(request["files"])}})
+"""
+
+
+@pytest.fixture
+def gcode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    binary = tmp_path / "gcode"
+    binary.write_text(FAKE_GCODE)
+    binary.chmod(0o755)
+    monkeypatch.setenv("FAKE_GCODE_LOG", str(tmp_path / "requests.log"))
+    return binary
+
+
+def _requests(gcode: Path) -> list[dict[str, object]]:
+    log = gcode.parent / "requests.log"
+    return [json.loads(line) for line in log.read_text().splitlines()] if log.exists() else []
+
+
+async def test_frames_round_trip() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(encode_frame({"id": 3, "files": ["ä.py"]}) + encode_frame({"id": 4}))
+    reader.feed_eof()
+    assert await read_frame(reader) == {"id": 3, "files": ["ä.py"]}
+    assert await read_frame(reader) == {"id": 4}
+    with pytest.raises(asyncio.IncompleteReadError):
+        await read_frame(reader)
+
+
+async def test_one_process_serves_every_batch(gcode: Path) -> None:
+    worker = GcodeWorker(binary=gcode)
+    try:
+        assert await worker.index("/repo", ["a.py", "b.py"]) == 2
+        assert await worker.index("/repo", ["c.py"]) == 1
+        with pytest.raises(GcodeIndexError, match="parse failed"):
+            await worker.index("/repo", ["bad.py"])
+        assert await worker.index("/repo", ["d.py"]) == 1
+    finally:
+        await worker.close()
+
+    requests = _requests(gcode)
+    assert [r["files"] for r in requests] == [["a.py", "b.py"], ["c.py"], ["bad.py"], ["d.py"]]
+    assert len({r["pid"] for r in requests}) == 1
+    assert (worker.starts, worker.restarts) == (1, 0)
+    assert not worker.running
+
+
+async def test_gcode_without_serve_is_unavailable(
+    gcode: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_GCODE_MODE", "no-serve")
+    worker = GcodeWorker(binary=gcode)
+
+    with pytest.raises(GcodeWorkerUnavailable):
+        await worker.index("/repo", ["a.py"])
+    assert not worker.available()
+    with pytest.raises(GcodeWorkerUnavailable):
+        await worker.index("/repo", ["a.py"])
+    assert worker.starts == 1  # not probed again until the binary changes
+
+    monkeypatch.setenv("FAKE_GCODE_MODE", "ok")
+    gcode.write_text(FAKE_GCODE + "\n")
+    assert worker.available()
+    assert await worker.index("/repo", ["a.py"]) == 1
+    await worker.close()
+
+
+async def test_crashed_process_is_restarted(gcode: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FAKE_GCODE_MODE", "crash-once")
+    worker = GcodeWorker(binary=gcode)
+
+    with pytest.raises(GcodeWorkerError) as exc_info:
+        await worker.index("/repo", ["a.py"])
+    assert not isinstance(exc_info.value, GcodeWorkerUnavailable)
+    assert await worker.index("/repo", ["a.py"]) == 1
+    assert worker.restarts == 1
+    await worker.close()
+
+
+async def test_timed_out_request_kills_the_process(
+    gcode: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_GCODE_MODE", "hang")
+    worker = GcodeWorker(binary=gcode, request_timeout=0.3)
+
+    with pytest.raises(GcodeWorkerError, match="timed out"):
+        await worker.index("/repo", ["a.py"])
+    assert not worker.running
+    assert worker.available()
@@ -133,7 +133,7 @@ async def test_stop_shuts_down_all_adapters():
 
 @pytest.mark.asyncio
 async def test_send_message_success():
-    """send_message() sends and stores message, returns CommsMessage."""
+    """send_message() queues and stores the message; the worker delivers it."""
     channel = make_channel()
     store = make_store([channel])
     manager = CommunicationsManager(make_config(), store, make_secret_store(), MagicMock())
@@ -148,10 +148,14 @@ async def test_send_message_success():
 
     assert msg.content == "Hello!"
     assert msg.direction == "outbound"
+    assert msg.status == "pending"
+    store.enqueue_outbound.assert_called_once_with(msg)
+
+    assert await manager.flush_outbox(timeout=5)
     assert msg.status == "sent"
     assert msg.platform_message_id == "platform-msg-id-1"
     mock_adapter.send_message.assert_called_once()
-    store.create_message.assert_called_once()
+    store.complete_outbound.assert_called_once_with(msg.id, "platform-msg-id-1")
 
 
 @pytest.mark.asyncio
@@ -166,8 +170,8 @@ async def test_send_message_unknown_channel_raises():
 
 @pytest.mark.asyncio
 async def test_send_message_adapter_failure_marks_failed():
-    """send_message() marks message failed if adapter raises."""
-    channel = make_channel()
+    """A message whose retries are exhausted is dead-lettered and marked failed."""
+    channel = make_channel(config_json={"retry_count": 1, "retry_backoff_seconds": 0.01})
     store = make_store([channel])
     manager = CommunicationsManager(make_config(), store, make_secret_store(), MagicMock())
 
@@ -179,10 +183,14 @@ async def test_send_message_adapter_failure_marks_failed():
         await manager.start()
 
     msg = await manager.send_message("test-channel", "Hello!")
+    assert await manager.flush_outbox(timeout=5)
 
     assert msg.status == "failed"
     assert "network error" in (msg.error or "")
-    store.create_message.assert_called_once()
+    assert mock_adapter.send_message.call_count == 2
+    store.retry_outbound.assert_called_once()
+    store.dead_letter_outbound.assert_called_once_with(msg.id, 2, "network error")
+    assert manager.get_outbox_stats()["test-channel"]["dead_lettered"] == 1
 
 
 @pytest.mark.asyncio
@@ -205,6 +213,7 @@ async def test_send_message_fires_event_callback():
 
     manager.event_callback = cb
     await manager.send_message("test-channel", "Hello!")
+    await manager.flush_outbox(timeout=5)
 
     assert len(callback_events) == 1
     assert callback_events[0][0] == "comms.message_sent"
@@ -628,6 +637,7 @@ async def test_send_message_propagates_thread_id():
     manager._thread_manager.track_thread("test-channel", "session-123", "thread-456")
 
     msg = await manager.send_message("test-channel", "Hello reply", session_id="session-123")
+    await manager.flush_outbox(timeout=5)
 
     assert msg.platform_thread_id == "thread-456"
     assert msg.status == "sent"
@@ -0,0 +1,236 @@
+"""Tests for the durable outbound queue."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gobby.communications.manager import CommunicationsManager
+from gobby.communications.models import ChannelConfig, CommsMessage
+from gobby.communications.outbox import OutboundQueue
+from gobby.communications.rate_limiter import TokenBucketRateLimiter
+from gobby.config.communications import ChannelDefaults, CommunicationsConfig
+from gobby.storage.communications import LocalCommunicationsStore
+from gobby.storage.database import LocalDatabase
+
+pytestmark = pytest.mark.unit
+
+
+class FakeAdapter:
+    """Records sends; optionally slow, failing or batching."""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0, batching: bool = False) -> None:
+        self.delay = delay
+        self.failures = failures
+        self.supports_batching = batching
+        self.sent: list[str] = []
+        self.batches: list[list[str]] = []
+
+    async def send_message(self, message: CommsMessage) -> str | None:
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("platform unavailable")
+        self.sent.append(message.content)
+        return f"p-{message.content}"
+
+    async def send_batch(self, messages: list[CommsMessage]) -> list[str | None]:
+        self.batches.append([m.content for m in messages])
+        return [await self.send_message(m) for m in messages]
+
+
+@pytest.fixture
+def store(temp_db: LocalDatabase) -> LocalCommunicationsStore:
+    return LocalCommunicationsStore(temp_db)
+
+
+def _channel(store: LocalCommunicationsStore, name: str, **config: Any) -> ChannelConfig:
+    return store.create_channel(
+        ChannelConfig(
+            id="",
+            channel_type="test",
+            name=name,
+            enabled=True,
+            config_json=config,
+            created_at="2024-01-01T00:00:00",
+            updated_at="2024-01-01T00:00:00",
+        )
+    )
+
+
+def _enqueue(store: LocalCommunicationsStore, channel: ChannelConfig, content: str) -> CommsMessage:
+    return store.enqueue_outbound(
+        CommsMessage(
+            id="",
+            channel_id=channel.id,
+            direction="outbound",
+            content=content,
+            status="pending",
+            created_at=f"2024-01-01T00:00:{len(content):02d}",
+        )
+    )
+
+
+def _queue(store: LocalCommunicationsStore, **defaults: Any) -> OutboundQueue:
+    defaults = {"rate_limit_per_minute": 6000, "burst": 100, **defaults}
+    channel_defaults = ChannelDefaults(**defaults)
+    return OutboundQueue(
+        store, TokenBucketRateLimiter.from_defaults(channel_defaults), channel_defaults
+    )
+
+
+async def test_pending_messages_survive_restart(store: LocalCommunicationsStore) -> None:
+    channel = _channel(store, "slack")
+    first = _queue(store)
+    first.start_channel(channel, FakeAdapter(delay=10))
+    for content in ("one", "two"):
+        first.submit("slack", _enqueue(store, channel, content))
+    await asyncio.sleep(0.01)
+    first.stop_all()  # daemon stops mid-delivery
+
+    assert store.count_outbox(channel.id) == {"pending": 2, "dead": 0}
+
+    adapter = FakeAdapter()
+    second = _queue(store)
+    second.start_channel(channel, adapter)
+    assert await second.flush(timeout=5)
+    second.stop_all()
+
+    assert sorted(adapter.sent) == ["one", "two"]
+    assert store.count_outbox(channel.id) == {"pending": 0, "dead": 0}
+    stored = store.list_messages(channel_id=channel.id)
+    assert {m.status for m in stored} == {"sent"}
+    assert {m.platform_message_id for m in stored} == {"p-one", "p-two"}
+
+
+async def test_slow_channel_does_not_delay_others(store: LocalCommunicationsStore) -> None:
+    slow_channel, fast_channel = _channel(store, "slow"), _channel(store, "fast")
+    queue = _queue(store)
+    slow, fast = FakeAdapter(delay=5), FakeAdapter()
+    queue.start_channel(slow_channel, slow)
+    queue.start_channel(fast_channel, fast)
+
+    queue.submit("slow", _enqueue(store, slow_channel, "blocked"))
+    message = _enqueue(store, fast_channel, "quick")
+    queue.submit("fast", message)
+    await asyncio.wait_for(_until(lambda: message.status == "sent"), timeout=1)
+
+    assert fast.sent == ["quick"]
+    assert queue.channel_stats("slow")["depth"] == 1
+    assert queue.channel_stats("fast")["latency_ms"]["last"] < 1000
+    queue.stop_all()
+
+
+async def test_batching_adapter_gets_queued_messages_together(
+    store: LocalCommunicationsStore,
+) -> None:
+    channel = _channel(store, "chat")
+    queue = _queue(store, batch_size=3)
+    adapter = FakeAdapter(batching=True)
+    queue.start_channel(channel, adapter)
+    for content in ("a", "b", "c", "d"):
+        queue.submit("chat", _enqueue(store, channel, content))
+
+    assert await queue.flush(timeout=5)
+    assert adapter.batches == [["a", "b", "c"]]  # the leftover goes through send_message
+    assert adapter.sent == ["a", "b", "c", "d"]
+    assert queue.channel_stats("chat")["sent"] == 4
+    queue.stop_all()
+
+
+async def test_failed_send_retried_with_backoff(store: LocalCommunicationsStore) -> None:
+    channel = _channel(store, "flaky")
+    queue = _queue(store, retry_backoff_seconds=0.01)
+    adapter = FakeAdapter(failures=2)
+    queue.start_channel(channel, adapter)
+    message = _enqueue(store, channel, "hello")
+    queue.submit("flaky", message)
+
+    assert await queue.flush(timeout=5)
+    assert message.status == "sent"
+    assert adapter.sent == ["hello"]
+    stats = queue.channel_stats("flaky")
+    assert stats["retried"] == 2
+    assert stats["dead_lettered"] == 0
+    queue.stop_all()
+
+
+async def test_exhausted_retries_dead_letter_and_requeue(store: LocalCommunicationsStore) -> None:
+    channel = _channel(store, "down", retry_count=1, retry_backoff_seconds=0.01)
+    queue = _queue(store)
+    adapter = FakeAdapter(failures=2)
+    queue.start_channel(channel, adapter)
+    message = _enqueue(store, channel, "lost")
+    queue.submit("down", message)
+
+    assert await queue.flush(timeout=5)
+    assert message.status == "failed"
+    [dead] = store.list_outbox(channel_id=channel.id, status="dead")
+    assert dead.attempts == 2
+    assert dead.last_error == "platform unavailable"
+    assert store.get_message(message.id).status == "failed"
+
+    queue.requeue("down", store.requeue_dead_letters(channel_id=channel.id))
+    assert await queue.flush(timeout=5)
+    assert adapter.sent == ["lost"]
+    assert store.get_message(message.id).status == "sent"
+    assert store.count_outbox() == {"pending": 0, "dead": 0}
+    queue.stop_all()
+
+
+async def test_send_event_fans_out_without_waiting_for_delivery() -> None:
+    channels = [
+        ChannelConfig(
+            id=f"chan-{i}",
+            channel_type="test",
+            name=f"ch{i}",
+            enabled=True,
+            config_json={},
+            created_at="2024-01-01T00:00:00",
+            updated_at="2024-01-01T00:00:00",
+        )
+        for i in range(3)
+    ]
+    store = MagicMock()
+    store.list_channels.return_value = channels
+    store.list_outbox.return_value = []
+    config = CommunicationsConfig(
+        enabled=True, channel_defaults=ChannelDefaults(rate_limit_per_minute=6000, burst=100)
+    )
+    manager = CommunicationsManager(config, store, MagicMock(), MagicMock())
+
+    adapter = MagicMock(supports_polling=False, supports_batching=False)
+    adapter.initialize = AsyncMock()
+    adapter.shutdown = AsyncMock()
+
+    async def slow_send(message: CommsMessage) -> str:
+        await asyncio.sleep(0.2)
+        return "ok"
+
+    adapter.send_message = slow_send
+    with patch(
+        "gobby.communications.manager.get_adapter_class",
+        return_value=MagicMock(return_value=adapter),
+    ):
+        await manager.start()
+    manager._router.match_channels = AsyncMock(return_value=[c.id for c in channels])  # type: ignore[method-assign]
+
+    started = time.monotonic()
+    messages = await manager.send_event("task.created", "done")
+    assert time.monotonic() - started < 0.1
+    assert [m.status for m in messages] == ["pending"] * 3
+
+    assert await manager.flush_outbox(timeout=5)
+    assert time.monotonic() - started < 0.5  # channels deliver concurrently
+    assert [m.status for m in messages] == ["sent"] * 3
+    assert manager.get_channel_status("ch0")["outbox"]["sent"] == 1
+    await manager.stop()
+
+
+async def _until(predicate: Any) -> None:
+    while not predicate():
+        await asyncio.sleep(0.005)
@@ -216,6 +216,7 @@ def protect_production_resources(
         "GOBBY_LOGGING_MCP_SERVER": str(safe_log_mcp_server),
         "GOBBY_LOGGING_MCP_CLIENT": str(safe_log_mcp_client),
         "GOBBY_HOOKS_DIR": str(safe_hooks_dir),
+        "GOBBY_HOOK_SOCKET": str(temp_dir / "hooks.sock"),
     }
 
     with patch.dict(os.environ, env_vars):
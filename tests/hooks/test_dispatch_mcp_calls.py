@@ -1,6 +1,7 @@
 """Tests for HookManager._dispatch_mcp_calls method."""
 
 import asyncio
+import time
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
@@ -322,3 +323,115 @@ class TestDispatchMcpCallsProxyNone:
         await asyncio.sleep(0.05)
 
         stub.logger.warning.assert_called()
+
+
+class SlowProxy:
+    """Proxy whose call_tool sleeps per tool, recording call order."""
+
+    def __init__(self, delays: dict[str, float], fail: frozenset[str] = frozenset()) -> None:
+        self.delays = delays
+        self.fail = fail
+        self.started: list[str] = []
+
+    async def call_tool(self, server: str, tool: str, args: dict, **kwargs: object) -> dict:
+        self.started.append(tool)
+        await asyncio.sleep(self.delays.get(tool, 0))
+        if tool in self.fail:
+            return {"success": False, "error": "boom"}
+        return {"success": True, "tool": tool}
+
+
+def _capture(tool: str, **flags: bool) -> dict:
+    return {"server": "s", "tool": tool, "arguments": {}, "inject_result": True, **flags}
+
+
+class TestDispatchMcpCallsConcurrency:
+    """Blocking calls run concurrently under per-call and per-hook limits."""
+
+    def test_blocking_calls_run_concurrently_in_call_order(self) -> None:
+        from gobby.hooks.dispatchers.mcp import dispatch_mcp_calls
+
+        proxy = SlowProxy({"a": 0.3, "b": 0.2, "c": 0.1})
+        start = time.monotonic()
+        results = dispatch_mcp_calls(
+            [_capture("a"), _capture("b"), _capture("c")],
+            _make_event(),
+            lambda: proxy,
+            None,
+            MagicMock(),
+        )
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5  # ~max(delays), not their 0.6s sum
+        assert [r["tool"] for r in results] == ["a", "b", "c"]
+        assert all(r["success"] for r in results)
+
+    def test_deadline_returns_partial_results(self) -> None:
+        from gobby.hooks.dispatchers.mcp import dispatch_mcp_calls
+
+        proxy = SlowProxy({"slow": 5, "fast": 0})
+        start = time.monotonic()
+        results = dispatch_mcp_calls(
+            [_capture("slow"), _capture("fast")],
+            _make_event(),
+            lambda: proxy,
+            None,
+            MagicMock(),
+            deadline=0.2,
+        )
+
+        assert time.monotonic() - start < 1
+        assert [r["tool"] for r in results] == ["slow", "fast"]
+        assert results[0]["success"] is False
+        assert results[0]["timed_out"] is True
+        assert "hook deadline" in results[0]["result"]["error"]
+        assert results[1]["success"] is True
+        assert "timed_out" not in results[1]
+
+    def test_per_call_timeout(self) -> None:
+        from gobby.hooks.dispatchers.mcp import dispatch_mcp_calls
+
+        proxy = SlowProxy({"slow": 5})
+        results = dispatch_mcp_calls(
+            [_capture("slow"), _capture("fast")],
+            _make_event(),
+            lambda: proxy,
+            None,
+            MagicMock(),
+            call_timeout=0.1,
+        )
+
+        assert results[0]["timed_out"] is True
+        assert "timed out after 0.1s" in results[0]["result"]["error"]
+        assert results[1]["success"] is True
+
+    def test_block_on_failure_is_a_barrier(self) -> None:
+        from gobby.hooks.dispatchers.mcp import dispatch_mcp_calls
+
+        proxy = SlowProxy({"gate": 0.1}, fail=frozenset({"gate"}))
+        results = dispatch_mcp_calls(
+            [
+                _capture("before"),
+                _capture("gate", block_on_failure=True),
+                _capture("after"),
+                {"server": "s", "tool": "after_bg", "arguments": {}, "background": True},
+            ],
+            _make_event(),
+            lambda: proxy,
+            None,
+            MagicMock(),
+        )
+
+        assert [r["tool"] for r in results] == ["before", "gate"]
+        assert proxy.started == ["before", "gate"]
+
+    def test_limits_come_from_workflow_config(self) -> None:
+        from gobby.config.tasks import WorkflowConfig
+
+        proxy = SlowProxy({"slow": 5})
+        stub = _make_hook_manager_stub(tool_proxy_getter=lambda: proxy, loop=None)
+        stub._config = MagicMock(workflow=WorkflowConfig(mcp_dispatch_deadline=0.1))
+
+        [result] = stub._dispatch_mcp_calls([_capture("slow")], _make_event())
+
+        assert result["timed_out"] is True
@@ -377,3 +377,104 @@ class TestAgentDaemonFailureTracking:
         assert exit_code == 0
         # Counter should be reset — next failure starts at 1
         assert hook_dispatcher._track_daemon_failure("test-reset") == 1
+
+
+class TestSocketFastPath:
+    """Hooks go over the daemon's Unix socket when it is listening, else HTTP."""
+
+    @pytest.fixture()
+    def socket_path(self, temp_dir: Path) -> Iterator[Path]:
+        path = temp_dir / "hooks.sock"
+        with patch.dict(os.environ, {"GOBBY_HOOK_SOCKET": str(path)}):
+            yield path
+
+    def test_unavailable_when_nothing_listening(self, socket_path: Path) -> None:
+        with pytest.raises(hook_dispatcher.HookSocketUnavailable):
+            hook_dispatcher.call_hook_socket({"hook_type": "stop"}, socket_path)
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_with_daemon_framing(self, socket_path: Path) -> None:
+        """The stdlib client speaks the same framing as gobby.servers.hook_socket."""
+        import asyncio
+
+        from gobby.servers.hook_socket import encode_frame, read_frame
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            request = await read_frame(reader)
+            writer.write(encode_frame({"status": 200, "result": {"echo": request}}))
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=str(socket_path))
+        try:
+            message = {"hook_type": "stop", "input_data": {"prompt": "ü" * 70000}}
+            response = await asyncio.to_thread(
+                hook_dispatcher.call_hook_socket, message, socket_path
+            )
+        finally:
+            server.close()
+
+        assert response == {"status": 200, "result": {"echo": message}}
+
+    @pytest.mark.asyncio
+    async def test_socket_skips_health_check_and_http(
+        self, socket_path: Path, _patch_stdin, _patch_args
+    ) -> None:
+        socket_path.touch()
+        call = MagicMock(return_value={"status": 200, "result": {"decision": "block"}})
+        health = AsyncMock(return_value=True)
+
+        with (
+            patch.object(hook_dispatcher, "call_hook_socket", call),
+            patch.object(hook_dispatcher, "check_daemon_running", health),
+            patch.object(hook_dispatcher, "_find_project_config", return_value={"id": "p1"}),
+            patch("httpx.AsyncClient") as http_client,
+        ):
+            exit_code = await hook_dispatcher.main()
+
+        assert exit_code == 2
+        message = call.call_args.args[0]
+        assert message["project_id"] == "p1"
+        assert message["input_data"]["prompt"] == "test"
+        health.assert_not_awaited()
+        http_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_socket_error_status_fails_closed_for_critical_hook(
+        self, socket_path: Path, _patch_stdin, _patch_args
+    ) -> None:
+        socket_path.touch()
+        call = MagicMock(return_value={"status": 503, "detail": "HookManager not initialized"})
+        with patch.object(hook_dispatcher, "call_hook_socket", call):
+            exit_code = await hook_dispatcher.main()
+
+        assert exit_code == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_http_when_socket_refuses(
+        self, socket_path: Path, _patch_daemon_running, _patch_stdin, _patch_args
+    ) -> None:
+        socket_path.touch()  # stale file, nothing listening
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"continue": True}
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client),
+            patch.object(
+                hook_dispatcher,
+                "get_daemon_url",
+                new_callable=AsyncMock,
+                return_value="http://localhost:60887",
+            ),
+        ):
+            exit_code = await hook_dispatcher.main()
+
+        assert exit_code == 0
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert payload["input_data"]["prompt"] == "test"
@@ -0,0 +1,215 @@
+"""Tests for the LLM response cache and request coalescing."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from gobby.code_index.models import Symbol
+from gobby.code_index.summarizer import SymbolSummarizer
+from gobby.config.app import DaemonConfig
+from gobby.config.code_index import CodeIndexConfig
+from gobby.config.llm_providers import (
+    LLMProviderConfig,
+    LLMProvidersConfig,
+    LLMResponseCacheConfig,
+)
+from gobby.llm.base import LLMProvider
+from gobby.llm.response_cache import CachedLLMProvider, LLMResponseCache, make_cache_key
+from gobby.llm.service import LLMService
+from gobby.savings.tracker import SavingsTracker
+from gobby.storage.llm_cache import LLMResponseCacheStore
+
+pytestmark = pytest.mark.unit
+
+
+class StubProvider(LLMProvider):
+    """Provider that counts calls and answers after an optional delay."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: list[tuple[str, Any]] = []
+        self.delay = delay
+        self.fail = False
+
+    @property
+    def provider_name(self) -> str:
+        return "claude"
+
+    async def generate_summary(
+        self, context: dict[str, Any], prompt_template: str | None = None
+    ) -> str:
+        self.calls.append(("summary", context))
+        return "summary"
+
+    async def generate_text(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        self.calls.append(("text", prompt))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return f"answer to {prompt}" if prompt else ""
+
+    async def generate_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str | None = None,
+    ) -> dict[str, Any]:
+        self.calls.append(("json", prompt))
+        return {"prompt": prompt, "entities": [1, 2]}
+
+    async def describe_image(self, image_path: str, context: str | None = None) -> str:
+        self.calls.append(("image", image_path))
+        return "an image"
+
+
+@pytest.fixture
+def store(temp_db) -> LLMResponseCacheStore:
+    return LLMResponseCacheStore(temp_db, ttl_hours=1, max_entries=100)
+
+
+@pytest.fixture
+def stub() -> StubProvider:
+    return StubProvider()
+
+
+@pytest.fixture
+def cached(stub, store, temp_db) -> CachedLLMProvider:
+    cache = LLMResponseCache(store, savings=SavingsTracker(temp_db))
+    return CachedLLMProvider(stub, cache)
+
+
+def test_cache_key_covers_every_input() -> None:
+    base = make_cache_key("text", "claude", "haiku", "sys", "prompt", {"max_tokens": 10})
+    assert base == make_cache_key("text", "claude", "haiku", "sys", "prompt", {"max_tokens": 10})
+    variants = [
+        make_cache_key("json", "claude", "haiku", "sys", "prompt", {"max_tokens": 10}),
+        make_cache_key("text", "codex", "haiku", "sys", "prompt", {"max_tokens": 10}),
+        make_cache_key("text", "claude", "sonnet", "sys", "prompt", {"max_tokens": 10}),
+        make_cache_key("text", "claude", "haiku", None, "prompt", {"max_tokens": 10}),
+        make_cache_key("text", "claude", "haiku", "sys", "prompt!", {"max_tokens": 10}),
+        make_cache_key("text", "claude", "haiku", "sys", "prompt", {"max_tokens": 20}),
+    ]
+    assert base not in variants
+
+
+async def test_repeated_request_served_from_cache(cached, stub, temp_db) -> None:
+    first = await cached.generate_text("hello", model="haiku")
+    second = await cached.generate_text("hello", model="haiku")
+    assert first == second == "answer to hello"
+    assert len(stub.calls) == 1
+
+    await cached.generate_text("hello", model="sonnet")
+    assert len(stub.calls) == 2
+    assert cached._cache.stats()["hits"] == 1
+
+    row = temp_db.fetchone("SELECT category, tokens_saved FROM savings_ledger")
+    assert row["category"] == "llm_cache"
+    assert row["tokens_saved"] > 0
+
+
+async def test_json_responses_cached(cached, stub) -> None:
+    first = await cached.generate_json("extract")
+    second = await cached.generate_json("extract")
+    assert first == second == {"prompt": "extract", "entities": [1, 2]}
+    assert stub.calls == [("json", "extract")]
+
+
+async def test_concurrent_identical_requests_coalesced(cached, stub) -> None:
+    stub.delay = 0.05
+    results = await asyncio.gather(*(cached.generate_text("same") for _ in range(5)))
+    assert results == ["answer to same"] * 5
+    assert len(stub.calls) == 1
+    assert cached._cache.stats()["coalesced"] == 4
+    assert cached._cache.stats()["in_flight"] == 0
+
+
+async def test_failures_and_empty_responses_not_cached(cached, stub) -> None:
+    stub.fail = True
+    with pytest.raises(RuntimeError):
+        await cached.generate_text("flaky")
+    stub.fail = False
+    assert await cached.generate_text("flaky") == "answer to flaky"
+
+    await cached.generate_text("")
+    await cached.generate_text("")
+    assert [c for c in stub.calls if c == ("text", "")] == [("text", ""), ("text", "")]
+
+
+async def test_expired_entries_are_refetched(cached, stub, temp_db) -> None:
+    await cached.generate_text("old")
+    temp_db.execute("UPDATE llm_response_cache SET created_at = datetime('now', '-2 hours')")
+    await cached.generate_text("old")
+    assert len(stub.calls) == 2
+
+
+async def test_uncached_methods_pass_through(cached, stub) -> None:
+    assert await cached.generate_summary({"turns": []}) == "summary"
+    assert await cached.describe_image("/tmp/x.png") == "an image"
+    assert [c[0] for c in stub.calls] == ["summary", "image"]
+    assert cached.delay == 0.0  # provider-specific attributes are delegated
+
+
+def test_store_evicts_least_recently_used(temp_db) -> None:
+    store = LLMResponseCacheStore(temp_db, ttl_hours=1, max_entries=10)
+    for i in range(10):
+        store.put(f"k{i}", f"v{i}", "claude", None, 1)
+    temp_db.execute("UPDATE llm_response_cache SET last_used_at = datetime('now', '-1 hour')")
+    assert store.get("k0") is not None  # refreshes last_used_at
+
+    store.put("k10", "v10", "claude", None, 1)
+    assert store.count() == 9
+    assert store.get("k0") is not None
+    assert store.get("k10") is not None
+    assert sum(store.get(f"k{i}") is None for i in range(1, 10)) == 2
+
+
+async def test_resummarizing_unchanged_symbols_makes_no_llm_calls(temp_db, stub) -> None:
+    config = DaemonConfig(
+        llm_providers=LLMProvidersConfig(
+            claude=LLMProviderConfig(models="haiku"),
+            response_cache=LLMResponseCacheConfig(enabled=True),
+        )
+    )
+    service = LLMService(config, db=temp_db)
+    service._providers["claude"] = stub
+    summarizer = SymbolSummarizer(service, CodeIndexConfig())
+    symbols = [
+        Symbol(
+            id=f"sym-{i}",
+            project_id="p",
+            file_path="a.py",
+            name=f"fn{i}",
+            qualified_name=f"fn{i}",
+            kind="function",
+            language="python",
+            byte_start=0,
+            byte_end=10,
+            line_start=1,
+            line_end=2,
+        )
+        for i in range(3)
+    ]
+
+    first = await summarizer.summarize_batch(symbols, lambda s: f"def {s.name}(): pass")
+    calls = len(stub.calls)
+    second = await summarizer.summarize_batch(symbols, lambda s: f"def {s.name}(): pass")
+    assert first == second
+    assert calls == 3
+    assert len(stub.calls) == calls
+    assert service.get_provider("claude", cached=False) is stub
+
+
+def test_cache_disabled_by_default(temp_db, stub) -> None:
+    config = DaemonConfig(
+        llm_providers=LLMProvidersConfig(claude=LLMProviderConfig(models="haiku"))
+    )
+    service = LLMService(config, db=temp_db)
+    service._providers["claude"] = stub
+    assert service.response_cache is None
+    assert service.get_provider("claude") is stub
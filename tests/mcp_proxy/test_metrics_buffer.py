@@ -0,0 +1,229 @@
+"""Tests for the in-memory metrics buffer (mcp_proxy/metrics_buffer.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from gobby.mcp_proxy.metrics import ToolMetricsManager
+from gobby.mcp_proxy.metrics_buffer import MetricsBuffer, _buffers, get_metrics_buffer
+from gobby.mcp_proxy.metrics_events import MetricsEventStore
+
+if TYPE_CHECKING:
+    from gobby.storage.database import LocalDatabase
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db(temp_db: LocalDatabase) -> LocalDatabase:
+    temp_db.execute(
+        """INSERT INTO projects (id, name, repo_path, created_at, updated_at)
+           VALUES ('proj-1', 'p1', '/tmp/p1', datetime('now'), datetime('now'))"""
+    )
+    return temp_db
+
+
+@pytest.fixture
+async def buffer(db: LocalDatabase):
+    # Long interval so only explicit flushes / batch triggers write
+    buf = MetricsBuffer(db, flush_interval_ms=60_000, flush_batch_size=1000)
+    await buf.start()
+    yield buf
+    await buf.stop()
+
+
+def _count(db: LocalDatabase, table: str) -> int:
+    row = db.fetchone(f"SELECT COUNT(*) AS n FROM {table}")  # nosec B608
+    return row["n"] if row else 0
+
+
+def test_shared_buffer_per_database(db: LocalDatabase) -> None:
+    manager = ToolMetricsManager(db)
+    assert get_metrics_buffer(db) is manager.buffer
+    assert MetricsEventStore(db).buffer is manager.buffer
+
+
+def test_shared_buffer_does_not_keep_database_alive() -> None:
+    class _Db:
+        pass
+
+    db = _Db()
+    buffer = get_metrics_buffer(db)  # type: ignore[arg-type]
+    assert buffer.db is db
+    size = len(_buffers)
+
+    del db
+    gc.collect()
+    assert len(_buffers) == size - 1
+    with pytest.raises(RuntimeError, match="garbage collected"):
+        _ = buffer.db
+
+
+def test_writes_through_when_not_started(db: LocalDatabase) -> None:
+    buf = MetricsBuffer(db)
+    buf.record_call("s1", "t1", "proj-1", 10.0)
+    buf.record_event("rule_eval", "r1", result="block")
+
+    assert _count(db, "tool_metrics") == 1
+    assert _count(db, "metrics_events") == 1
+    assert buf.get_stats()["pending_events"] == 0
+
+
+@pytest.mark.asyncio
+async def test_accumulates_and_flushes_in_one_transaction(
+    db: LocalDatabase, buffer: MetricsBuffer
+) -> None:
+    for i in range(3):
+        buffer.record_call("s1", "t1", "proj-1", 10.0 * (i + 1), success=i != 1)
+        buffer.record_event("tool_call", "t1", project_id="proj-1", server_name="s1")
+    assert _count(db, "tool_metrics") == 0
+
+    with patch.object(db, "transaction", wraps=db.transaction) as txn:
+        written = await asyncio.to_thread(buffer.flush)
+
+    assert txn.call_count == 1
+    assert written == 4  # one aggregated counter row + three events
+    row = db.fetchone("SELECT * FROM tool_metrics")
+    assert (row["call_count"], row["success_count"], row["failure_count"]) == (3, 2, 1)
+    assert row["total_latency_ms"] == 60.0
+    assert row["avg_latency_ms"] == 20.0
+
+    # A second flush upserts onto the existing row
+    buffer.record_call("s1", "t1", "proj-1", 40.0)
+    buffer.flush()
+    row = db.fetchone("SELECT * FROM tool_metrics")
+    assert row["call_count"] == 4
+    assert row["avg_latency_ms"] == 25.0
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_background_flush(db: LocalDatabase) -> None:
+    buf = MetricsBuffer(db, flush_interval_ms=60_000, flush_batch_size=5)
+    await buf.start()
+    try:
+        for _ in range(5):
+            buf.record_event("skill_use", "sk")
+        for _ in range(100):
+            if _count(db, "metrics_events") == 5:
+                break
+            await asyncio.sleep(0.01)
+        assert _count(db, "metrics_events") == 5
+    finally:
+        await buf.stop()
+
+
+@pytest.mark.asyncio
+async def test_ring_drops_oldest_events(db: LocalDatabase) -> None:
+    buf = MetricsBuffer(db, flush_interval_ms=60_000, flush_batch_size=100, max_pending_events=3)
+    await buf.start()
+    try:
+        for i in range(5):
+            buf.record_event("rule_eval", f"r{i}")
+        assert buf.get_stats()["dropped_events"] == 2
+    finally:
+        await buf.stop()
+
+    names = [r["name"] for r in db.fetchall("SELECT name FROM metrics_events ORDER BY id")]
+    assert names == ["r2", "r3", "r4"]
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending(db: LocalDatabase, buffer: MetricsBuffer) -> None:
+    buffer.record_call("s1", "t1", "proj-1", 5.0)
+    buffer.record_event("tool_call", "t1")
+    await buffer.stop()
+
+    assert _count(db, "tool_metrics") == 1
+    assert _count(db, "metrics_events") == 1
+    assert not buffer.is_running
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_data(db: LocalDatabase, buffer: MetricsBuffer) -> None:
+    buffer.record_call("s1", "t1", "proj-1", 5.0)
+    buffer.record_event("tool_call", "t1")
+
+    with patch.object(db, "transaction", side_effect=RuntimeError("locked")):
+        assert buffer.flush() == 0
+    buffer.record_call("s1", "t1", "proj-1", 5.0)
+
+    assert buffer.get_stats()["failed_flushes"] == 1
+    assert buffer.flush() == 2
+    assert db.fetchone("SELECT call_count FROM tool_metrics")["call_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reads_include_unflushed(db: LocalDatabase, buffer: MetricsBuffer) -> None:
+    manager = ToolMetricsManager(db, buffer=buffer)
+    manager.record_call("s1", "t1", "proj-1", 10.0)
+    buffer.flush()
+    manager.record_call("s1", "t1", "proj-1", 30.0, success=False)
+    manager.record_call("s1", "t2", "proj-1", 5.0, session_id="sess-1")
+
+    metrics = manager.get_metrics(project_id="proj-1")
+    by_tool = {t["tool_name"]: t for t in metrics["tools"]}
+    assert by_tool["t1"]["call_count"] == 2
+    assert by_tool["t1"]["failure_count"] == 1
+    assert by_tool["t1"]["avg_latency_ms"] == 20.0
+    assert by_tool["t2"]["call_count"] == 1
+    assert metrics["summary"]["total_calls"] == 3
+    # Merged reads don't flush
+    assert buffer.get_stats()["pending_tools"] == 2
+
+    # Event queries flush first so they see the latest events
+    breakdown = manager.event_store.get_session_tool_breakdown("sess-1")
+    assert breakdown[0]["call_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reset_discards_unflushed(db: LocalDatabase, buffer: MetricsBuffer) -> None:
+    manager = ToolMetricsManager(db, buffer=buffer)
+    manager.record_call("s1", "t1", "proj-1", 10.0)
+    manager.reset_metrics(project_id="proj-1")
+    buffer.flush()
+
+    assert manager.get_metrics()["tools"] == []
+
+
+@pytest.mark.asyncio
+async def test_rejected_row_does_not_block_batch(db: LocalDatabase, buffer: MetricsBuffer) -> None:
+    buffer.record_call("s1", "t1", "no-such-project", 5.0)
+    buffer.record_event("tool_call", "t1")
+
+    assert buffer.flush() == 1
+    assert _count(db, "metrics_events") == 1
+    assert buffer.get_stats()["rejected_rows"] == 1
+    assert buffer.get_stats()["pending_tools"] == 0
+
+
+@pytest.mark.asyncio
+async def test_wal_flush_goes_through_writer_queue(db: LocalDatabase) -> None:
+    db.wal_mode = True
+    buffer = MetricsBuffer(db, flush_interval_ms=60_000)
+    await buffer.start()
+    buffer.record_call("s1", "t1", "proj-1", 5.0)
+    buffer.record_call("s1", "t1", "no-such-project", 5.0)
+    buffer.record_event("tool_call", "t1")
+
+    with patch.object(db, "transaction", side_effect=AssertionError("caller-thread write")):
+        assert buffer.flush() == 2
+    stats = db.get_write_stats()
+    assert stats["statements_committed"] == 1  # the events insert
+    assert stats["statements_failed"] == 1  # the upsert, then written row by row
+    assert buffer.get_stats()["rejected_rows"] == 1
+    assert db.fetchone("SELECT call_count FROM tool_metrics")["call_count"] == 1
+    assert _count(db, "metrics_events") == 1
+
+    # A failed part is put back on its own
+    db.submit_writemany = lambda sql, rows: (_ for _ in ()).throw(RuntimeError("locked"))
+    buffer.record_event("tool_call", "t2")
+    assert buffer.flush() == 0
+    assert buffer.get_stats()["pending_events"] == 1
+    del db.submit_writemany
+    assert buffer.flush() == 1
+    await buffer.stop()
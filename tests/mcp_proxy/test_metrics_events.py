@@ -2,6 +2,7 @@
 
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
@@ -397,3 +398,32 @@ class TestMCPTools:
         assert result["success"] is True
         assert result["bucket_size"] == "minute"
         assert len(result["buckets"]) >= 1
+
+
+class TestPendingEvents:
+    @pytest.mark.asyncio
+    async def test_queries_include_unflushed_events_without_flushing(
+        self, temp_db: "LocalDatabase"
+    ) -> None:
+        from gobby.mcp_proxy.metrics_buffer import MetricsBuffer
+
+        buffer = MetricsBuffer(temp_db, flush_interval_ms=60_000)
+        await buffer.start()
+        store = MetricsEventStore(temp_db, buffer=buffer)
+        store.record_event("tool_call", "flushed", session_id="s1", latency_ms=10.0)
+        buffer.flush()
+        store.record_event("tool_call", "pending", session_id="s1", latency_ms=30.0)
+
+        with patch.object(buffer, "flush", side_effect=AssertionError("read flushed")):
+            names = [e["name"] for e in store.query_events(event_type="tool_call")]
+            breakdown = store.get_session_tool_breakdown("s1")
+            buckets = store.get_timeseries("tool_call", range_key="1h")["buckets"]
+
+        assert sorted(names) == ["flushed", "pending"]
+        assert {row["tool_name"]: row["total_latency_ms"] for row in breakdown} == {
+            "flushed": 10.0,
+            "pending": 30.0,
+        }
+        assert sum(b["call_count"] for b in buckets) == 2
+        assert buffer.get_stats()["pending_events"] == 1
+        await buffer.stop()
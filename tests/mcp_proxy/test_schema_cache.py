@@ -0,0 +1,189 @@
+"""Tests for mcp_proxy/schema_cache.py."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gobby.mcp_proxy.manager import MCPClientManager
+from gobby.mcp_proxy.models import ConnectionState, MCPConnectionHealth, MCPServerConfig
+from gobby.mcp_proxy.schema_cache import ToolSchemaCache
+from gobby.mcp_proxy.schema_hash import SchemaHashRecord, compute_schema_hash
+from gobby.storage.mcp import Tool
+
+pytestmark = pytest.mark.unit
+
+SCHEMA: dict[str, Any] = {"type": "object", "properties": {"arg": {"type": "string"}}}
+
+
+def _tool(name: str, schema: dict[str, Any] | None) -> Tool:
+    return Tool(
+        id=f"id-{name}",
+        mcp_server_id="srv-1",
+        name=name,
+        description="desc",
+        input_schema=schema,
+        created_at="",
+        updated_at="",
+    )
+
+
+def _hash_record(tool_name: str, schema_hash: str) -> SchemaHashRecord:
+    return SchemaHashRecord(
+        id=1,
+        server_name="srv",
+        tool_name=tool_name,
+        project_id="proj",
+        schema_hash=schema_hash,
+        last_verified_at="",
+        created_at="",
+        updated_at="",
+    )
+
+
+# --- ToolSchemaCache ---
+
+
+def test_populate_then_get_hits_memory() -> None:
+    cache = ToolSchemaCache()
+    cache.populate("srv", [{"name": "Echo", "description": "d", "inputSchema": SCHEMA}])
+
+    entry = cache.get("srv", "Echo")
+    assert entry is not None
+    assert entry.input_schema == SCHEMA
+    assert entry.schema_hash == compute_schema_hash(SCHEMA)
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_get_unknown_tool_is_miss() -> None:
+    cache = ToolSchemaCache()
+    cache.populate("srv", [{"name": "echo", "inputSchema": SCHEMA}])
+    assert cache.get("srv", "other") is None
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_get_loads_from_disk_when_hashes_match() -> None:
+    db_manager = MagicMock()
+    db_manager.get_cached_tools.return_value = [_tool("echo", SCHEMA)]
+    cache = ToolSchemaCache(db_manager)
+
+    with patch("gobby.mcp_proxy.schema_cache.SchemaHashManager") as hash_cls:
+        hash_cls.return_value.get_hashes_for_server.return_value = [
+            _hash_record("echo", compute_schema_hash(SCHEMA))
+        ]
+        entry = cache.get("srv", "Echo", project_id="proj")
+
+    assert entry is not None
+    assert entry.input_schema == SCHEMA
+    assert cache.get_stats()["disk_hits"] == 1
+
+    # Second lookup is served from memory
+    assert cache.get("srv", "echo", project_id="proj") is not None
+    db_manager.get_cached_tools.assert_called_once()
+
+
+def test_disk_entry_rejected_on_hash_mismatch() -> None:
+    db_manager = MagicMock()
+    db_manager.get_cached_tools.return_value = [_tool("echo", SCHEMA)]
+    cache = ToolSchemaCache(db_manager)
+
+    with patch("gobby.mcp_proxy.schema_cache.SchemaHashManager") as hash_cls:
+        hash_cls.return_value.get_hashes_for_server.return_value = [
+            _hash_record("echo", "0000000000000000")
+        ]
+        assert cache.get("srv", "echo", project_id="proj") is None
+
+
+def test_invalidate_skips_disk_until_repopulated() -> None:
+    db_manager = MagicMock()
+    db_manager.db = None
+    db_manager.get_cached_tools.return_value = [_tool("echo", SCHEMA)]
+    cache = ToolSchemaCache(db_manager)
+    cache.populate("srv", [{"name": "echo", "inputSchema": SCHEMA}])
+
+    cache.invalidate("srv")
+    assert cache.get("srv", "echo", project_id="proj") is None
+    db_manager.get_cached_tools.assert_not_called()
+
+    cache.populate("srv", [{"name": "echo", "inputSchema": SCHEMA}])
+    assert cache.get("srv", "echo", project_id="proj") is not None
+
+
+# --- MCPClientManager integration ---
+
+
+def _manager() -> MCPClientManager:
+    config = MCPServerConfig(
+        name="test-server",
+        project_id="test-project",
+        transport="http",
+        url="http://localhost:8001",
+    )
+    manager = MCPClientManager(server_configs=[config])
+    manager.health[config.name] = MCPConnectionHealth(
+        name=config.name, state=ConnectionState.CONNECTED
+    )
+    return manager
+
+
+def _session(*schemas: dict[str, Any]) -> MagicMock:
+    """A client session whose successive tools/list calls return ``schemas``."""
+    results = [
+        SimpleNamespace(
+            tools=[SimpleNamespace(name="test-tool", description="", inputSchema=schema)]
+        )
+        for schema in schemas
+    ]
+    session = MagicMock()
+    session.list_tools = AsyncMock(side_effect=results)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_get_tool_info_lists_tools_once() -> None:
+    manager = _manager()
+    session = _session(SCHEMA)
+
+    with patch.object(manager, "get_client_session", AsyncMock(return_value=session)):
+        for _ in range(3):
+            assert await manager.get_tool_input_schema("test-server", "test-tool") == SCHEMA
+
+    session.list_tools.assert_awaited_once()
+    assert manager.schema_cache.get_stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_tools_changed_notification_forces_refresh() -> None:
+    manager = _manager()
+    new_schema: dict[str, Any] = {"type": "object", "properties": {"other": {}}}
+    session = _session(SCHEMA, new_schema)
+
+    with patch.object(manager, "get_client_session", AsyncMock(return_value=session)):
+        assert await manager.get_tool_input_schema("test-server", "test-tool") == SCHEMA
+        manager._on_tools_changed("test-server")
+        assert await manager.get_tool_input_schema("test-server", "test-tool") == new_schema
+
+    assert session.list_tools.await_count == 2
+
+
+def test_counters_are_exact_under_concurrency() -> None:
+    cache = ToolSchemaCache()
+    cache.populate("srv", [{"name": "echo", "inputSchema": SCHEMA}])
+
+    def lookups() -> None:
+        for _ in range(2000):
+            cache.get("srv", "echo")
+            cache.get("srv", "missing")
+
+    threads = [threading.Thread(target=lookups) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (16000, 16000)
@@ -491,7 +491,7 @@ class TestEdgeCases:
         memory.id = "mm-test"
         memory.last_accessed_at = None
 
-        with patch.object(manager.storage, "update_access_stats") as mock_update:
+        with patch.object(manager.storage, "update_access_stats_many") as mock_update:
             mock_update.side_effect = Exception("Database error")
 
             manager._update_access_stats([memory])
@@ -822,7 +822,7 @@ class TestReindexEmbeddings:
 
         mock_vs = MagicMock()
         mock_vs.upsert = AsyncMock()
-        mock_vs.rebuild = AsyncMock()
+        mock_vs.rebuild = AsyncMock(return_value={"embedded": 2, "reused": 0, "resumed": 0})
         mock_embed = AsyncMock(return_value=[0.1, 0.2])
         manager = MemoryManager(
             db=db, config=memory_config, vector_store=mock_vs, embed_fn=mock_embed
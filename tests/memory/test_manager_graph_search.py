@@ -234,8 +234,10 @@ class TestSearchMemoriesGraphIntegration:
         manager._kg_service.find_related_memory_ids = AsyncMock(return_value=[])
 
         # Mock storage
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: _mock_memory(mid, f"content of {mid}")
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: _mock_memory(mid, f"content of {mid}") for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test query", limit=10)
@@ -269,8 +271,10 @@ class TestSearchMemoriesGraphIntegration:
             side_effect=Exception("Neo4j down")
         )
 
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: _mock_memory(mid, f"content of {mid}")
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: _mock_memory(mid, f"content of {mid}") for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test query", limit=10)
@@ -296,8 +300,10 @@ class TestSearchMemoriesGraphIntegration:
         )
 
         vs.search = AsyncMock(return_value=[("mem-1", 0.9)])
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: _mock_memory(mid, f"content of {mid}")
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: _mock_memory(mid, f"content of {mid}") for mid in ids
+            }
         )
 
         # Mock the kg_service method to verify it's not called
@@ -323,8 +329,10 @@ class TestSearchMemoriesGraphIntegration:
         )
 
         vs.search = AsyncMock(return_value=[("mem-1", 0.8)])
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: _mock_memory(mid, f"content of {mid}")
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: _mock_memory(mid, f"content of {mid}") for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test query", limit=10)
@@ -357,8 +365,10 @@ class TestSearchMemoriesGraphIntegration:
         system_mem = _mock_memory("mem-1", "system content")
         system_mem.source_type = "session"
 
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: user_mem if mid == "mem-2" else system_mem
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: user_mem if mid == "mem-2" else system_mem for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test", limit=10)
@@ -431,8 +441,8 @@ class TestGraphSearchProjectIdScoping:
         mem_b = _mock_memory("mem-2", "content B")
         mem_b.project_id = "proj-B"
 
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: mem_a if mid == "mem-1" else mem_b
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {mid: mem_a if mid == "mem-1" else mem_b for mid in ids}
         )
 
         result = await manager.search_memories(query="test", project_id="proj-A", limit=10)
@@ -465,8 +475,10 @@ class TestGraphSearchProjectIdScoping:
         mem_global = _mock_memory("mem-2", "global content")
         mem_global.project_id = None  # Global memory
 
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: mem_a if mid == "mem-1" else mem_global
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: mem_a if mid == "mem-1" else mem_global for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test", project_id="proj-A", limit=10)
@@ -553,8 +565,10 @@ class TestTemporalDecayIntegration:
         mem_recent = _mock_memory("mem-recent", "recent content", updated_at=recent.isoformat())
         mem_old = _mock_memory("mem-old", "old content", updated_at=old.isoformat())
 
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: mem_recent if mid == "mem-recent" else mem_old
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: mem_recent if mid == "mem-recent" else mem_old for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test", limit=10)
@@ -585,8 +599,10 @@ class TestTemporalDecayIntegration:
         mem_recent = _mock_memory("mem-recent", "recent content", updated_at=recent.isoformat())
         mem_old = _mock_memory("mem-old", "old content", updated_at=old.isoformat())
 
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: mem_recent if mid == "mem-recent" else mem_old
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: mem_recent if mid == "mem-recent" else mem_old for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test", limit=10)
@@ -616,8 +632,10 @@ class TestTemporalDecayIntegration:
         mem_recent = _mock_memory("mem-recent", "recent", updated_at=now.isoformat())
         mem_old = _mock_memory("mem-old", "old", updated_at=old.isoformat())
 
-        manager.storage.get_memory = MagicMock(
-            side_effect=lambda mid: mem_recent if mid == "mem-recent" else mem_old
+        manager.storage.get_memories_by_ids = MagicMock(
+            side_effect=lambda ids, **_: {
+                mid: mem_recent if mid == "mem-recent" else mem_old for mid in ids
+            }
         )
 
         result = await manager.search_memories(query="test", limit=10)
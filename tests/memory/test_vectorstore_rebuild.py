@@ -0,0 +1,170 @@
+"""Tests for VectorStore.rebuild(): shadow collection swap, resume, and vector reuse."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from gobby.memory.vectorstore import REBUILD_SUFFIX, VectorStore
+from gobby.search.vector_index import content_hash
+
+pytestmark = pytest.mark.unit
+
+
+def _mem(n: int, content: str | None = None) -> dict[str, str]:
+    return {"id": str(uuid.uuid5(uuid.NAMESPACE_DNS, f"mem-{n}")), "content": content or f"m{n}"}
+
+
+class FakeEmbedder:
+    """Deterministic embedder that records every text it was asked to embed."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.texts: list[str] = []
+        self.batch_calls = 0
+        self.fail_after = fail_after
+
+    def _vector(self, text: str) -> list[float]:
+        if self.fail_after is not None and len(self.texts) >= self.fail_after:
+            raise RuntimeError("embedding endpoint down")
+        self.texts.append(text)
+        return [float(len(text)), 1.0, 0.5, 0.25]
+
+    async def embed(self, text: str) -> list[float]:
+        return self._vector(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batch_calls += 1
+        return [self._vector(t) for t in texts]
+
+
+@pytest.fixture
+async def store(tmp_path) -> AsyncGenerator[VectorStore]:
+    vs = VectorStore(
+        path=str(tmp_path / "qdrant"),
+        collection_name="test_memories",
+        embedding_dim=4,
+        embedding_model="fake-embed",
+    )
+    await vs.initialize()
+    yield vs
+    await vs.close()
+
+
+async def _collections(vs: VectorStore) -> list[str]:
+    client = vs._ensure_client()
+    return sorted(c.name for c in client.get_collections().collections)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_swaps_alias_and_drops_old_collection(store: VectorStore) -> None:
+    embedder = FakeEmbedder()
+    memories = [_mem(i) for i in range(10)]
+
+    stats = await store.rebuild(memories, embedder.embed, embed_batch_fn=embedder.embed_batch)
+
+    assert stats["embedded"] == 10
+    assert await store.count() == 10
+    live = await store._resolve_alias()
+    assert live is not None and live.startswith(f"test_memories{REBUILD_SUFFIX}")
+    assert await _collections(store) == [live]
+    # Default batch size puts all ten texts in one request
+    assert embedder.batch_calls == 1
+
+    # A second rebuild replaces the aliased collection and drops the old one
+    await store.rebuild(memories[:5], embedder.embed)
+    assert await store.count() == 5
+    assert await _collections(store) == [await store._resolve_alias()]
+    assert live not in await _collections(store)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_memories_are_not_reembedded(store: VectorStore) -> None:
+    embedder = FakeEmbedder()
+    memories = [_mem(i) for i in range(6)]
+    await store.rebuild(memories, embedder.embed)
+    embedder.texts.clear()
+
+    memories[0] = _mem(0, content="changed")
+    stats = await store.rebuild(memories, embedder.embed, batch_size=4)
+
+    assert embedder.texts == ["changed"]
+    assert (stats["embedded"], stats["reused"]) == (1, 5)
+
+
+@pytest.mark.asyncio
+async def test_vectors_from_another_model_are_not_reused(store: VectorStore) -> None:
+    memory = _mem(1)
+    await store.upsert(
+        memory["id"], [1.0, 0.0, 0.0, 0.0], {"content_hash": content_hash(memory["content"])}
+    )
+    store._embedding_model = "other-model"
+    embedder = FakeEmbedder()
+
+    stats = await store.rebuild([memory], embedder.embed)
+
+    assert stats["embedded"] == 1
+    assert embedder.texts == [memory["content"]]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_rebuild_keeps_live_index_and_resumes(store: VectorStore) -> None:
+    old = [_mem(100 + i) for i in range(3)]
+    for mem in old:
+        await store.upsert(mem["id"], [1.0, 0.0, 0.0, 0.0], {})
+
+    memories = [_mem(i) for i in range(20)]
+    failing = FakeEmbedder(fail_after=8)
+    with pytest.raises(RuntimeError, match="endpoint down"):
+        await store.rebuild(memories, failing.embed, batch_size=4, concurrency=1)
+
+    # Search still served by the untouched live collection
+    assert await store.count() == 3
+    assert await store.has_pending_rebuild()
+
+    embedder = FakeEmbedder()
+    stats = await store.rebuild(memories, embedder.embed, batch_size=4, concurrency=2)
+
+    assert stats["resumed"] == 8
+    assert stats["embedded"] == 12
+    assert sorted(embedder.texts) == sorted(m["content"] for m in memories[8:])
+    assert await store.count() == 20
+    assert not await store.has_pending_rebuild()
+
+
+@pytest.mark.asyncio
+async def test_writes_during_rebuild_reach_the_new_collection(store: VectorStore) -> None:
+    added = _mem(99)
+    removed = _mem(1)
+
+    async def embed(text: str) -> list[float]:
+        if text == "m0":
+            # Live traffic while the rebuild is running
+            await store.upsert(added["id"], [0.0, 1.0, 0.0, 0.0], {"content": "m99"})
+            await store.delete(memory_id=removed["id"])
+        return [1.0, 0.0, 0.0, 0.0]
+
+    await store.rebuild([_mem(0), removed, _mem(2)], embed, batch_size=1, concurrency=1)
+
+    ids = set(await store.scroll_ids())
+    assert added["id"] in ids
+    assert removed["id"] not in ids
+    assert store._rebuild_collection is None
+
+
+@pytest.mark.asyncio
+async def test_initialize_does_not_shadow_alias(tmp_path) -> None:
+    path = str(tmp_path / "qdrant")
+    first = VectorStore(path=path, collection_name="mems", embedding_dim=4)
+    await first.initialize()
+    await first.rebuild([_mem(1)], FakeEmbedder().embed)
+    await first.close()
+
+    second = VectorStore(path=path, collection_name="mems", embedding_dim=4)
+    await second.initialize()
+    try:
+        assert await second._resolve_alias() is not None
+        assert await second.count() == 1
+    finally:
+        await second.close()
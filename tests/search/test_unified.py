@@ -454,10 +454,10 @@ class TestEmbeddingBackend:
     def test_clear(self) -> None:
         """Test clear resets state."""
         backend = EmbeddingBackend()
-        backend._item_ids = ["id1", "id2"]
+        backend._index.upsert(["id1", "id2"], [[1.0, 0.0], [0.0, 1.0]])
         backend._fitted = True
 
         backend.clear()
 
-        assert backend._item_ids == []
+        assert len(backend._index) == 0
         assert not backend._fitted
@@ -0,0 +1,152 @@
+"""Tests for the NumPy vector index and persisted embedding store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from gobby.search.backends.embedding import EmbeddingBackend
+from gobby.search.vector_index import EmbeddingStore, VectorIndex, content_hash
+
+pytestmark = pytest.mark.unit
+
+
+class TestVectorIndex:
+    def test_search_ranks_by_cosine_similarity(self) -> None:
+        index = VectorIndex()
+        index.upsert(["a", "b", "c"], [[1.0, 0.0], [0.6, 0.8], [0.0, 1.0]])
+
+        results = index.search([2.0, 0.0], top_k=2)
+
+        assert [item_id for item_id, _ in results] == ["a", "b"]
+        assert results[0][1] == pytest.approx(1.0)
+        assert results[1][1] == pytest.approx(0.6)
+
+    def test_top_k_larger_than_index(self) -> None:
+        index = VectorIndex()
+        index.upsert(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        assert len(index.search([1.0, 1.0], top_k=10)) == 2
+
+    def test_upsert_replaces_existing_vector(self) -> None:
+        index = VectorIndex()
+        index.upsert(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        index.upsert(["a"], [[0.0, 1.0]])
+
+        assert len(index) == 2
+        assert index.search([0.0, 1.0], top_k=2)[1][1] == pytest.approx(1.0)
+
+    def test_remove_swaps_last_row(self) -> None:
+        index = VectorIndex()
+        index.upsert(["a", "b", "c"], [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]])
+
+        assert index.remove(["a", "missing"]) == 1
+        assert "a" not in index
+        assert sorted(index.ids()) == ["b", "c"]
+        assert index.search([0.0, 1.0], top_k=1)[0][0] == "b"
+
+    def test_grows_past_initial_capacity(self) -> None:
+        index = VectorIndex()
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(200, 8))
+        index.upsert([f"id{i}" for i in range(200)], vectors)
+
+        assert len(index) == 200
+        assert index.search(vectors[123], top_k=1)[0][0] == "id123"
+
+    def test_dimension_mismatch(self) -> None:
+        index = VectorIndex()
+        index.upsert(["a"], [[1.0, 0.0]])
+        with pytest.raises(ValueError):
+            index.upsert(["b"], [[1.0, 0.0, 0.0]])
+        assert index.search([1.0, 0.0, 0.0]) == []
+
+
+class TestEmbeddingStore:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "vectors.npz"
+        store = EmbeddingStore(path)
+        store.put(content_hash("hello"), [0.1, 0.2])
+        store.save()
+
+        reloaded = EmbeddingStore(path)
+        vector = reloaded.get(content_hash("hello"))
+        assert vector is not None
+        assert vector.tolist() == pytest.approx([0.1, 0.2])
+
+    def test_retain_drops_stale_keys(self, tmp_path: Path) -> None:
+        store = EmbeddingStore(tmp_path / "vectors.npz")
+        store.put("keep", [1.0])
+        store.put("drop", [2.0])
+        store.retain(["keep"])
+        assert store.get("drop") is None
+        assert len(store) == 1
+
+
+class TestEmbeddingBackendIncremental:
+    @pytest.mark.asyncio
+    async def test_refit_only_embeds_changed_content(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "skills.npz"
+
+        async def fake_embeddings(texts: list[str], **_: object) -> list[list[float]]:
+            return [[float(len(t)), 1.0] for t in texts]
+
+        mock = AsyncMock(side_effect=fake_embeddings)
+        with patch("gobby.search.embeddings.generate_embeddings", mock):
+            backend = EmbeddingBackend(cache_path=cache_path)
+            await backend.fit_async([("a", "alpha"), ("b", "beta")])
+            assert mock.await_args.kwargs["texts"] == ["alpha", "beta"]
+
+            # A new backend (e.g. after restart) reuses persisted vectors
+            restarted = EmbeddingBackend(cache_path=cache_path)
+            await restarted.fit_async([("a", "alpha"), ("b", "beta v2")])
+
+        assert mock.await_count == 2
+        assert mock.await_args.kwargs["texts"] == ["beta v2"]
+        assert restarted.get_stats()["item_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_add_and_remove_items(self) -> None:
+        with (
+            patch(
+                "gobby.search.embeddings.generate_embeddings",
+                new_callable=AsyncMock,
+                side_effect=[[[1.0, 0.0]], [[0.0, 1.0]]],
+            ),
+            patch(
+                "gobby.search.embeddings.generate_embedding",
+                new_callable=AsyncMock,
+                return_value=[0.0, 1.0],
+            ),
+        ):
+            backend = EmbeddingBackend()
+            await backend.fit_async([("a", "first")])
+            await backend.add_items_async([("b", "second")])
+
+            results = await backend.search_async("query", top_k=5)
+            assert [item_id for item_id, _ in results] == ["b"]
+
+            assert backend.remove_items(["b"]) == 1
+            assert await backend.search_async("query", top_k=5) == []
+            assert backend.get_item_contents() == {"a": "first"}
+
+    @pytest.mark.asyncio
+    async def test_items_without_a_stored_vector_are_skipped(self) -> None:
+        with patch(
+            "gobby.search.embeddings.generate_embeddings",
+            new_callable=AsyncMock,
+            return_value=[[1.0, 0.0], [0.0, 1.0]],
+        ):
+            backend = EmbeddingBackend()
+            real_get = backend._store.get
+            missing_key = content_hash("second")
+            with patch.object(
+                backend._store,
+                "get",
+                side_effect=lambda key: None if key == missing_key else real_get(key),
+            ):
+                await backend.fit_async([("a", "first"), ("b", "second")])
+
+        assert backend.get_stats()["item_count"] == 1
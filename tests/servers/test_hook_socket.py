@@ -0,0 +1,145 @@
+"""Tests for the Unix socket hook transport (servers/hook_socket.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from gobby.servers.hook_socket import (
+    MAX_FRAME_BYTES,
+    HookSocketServer,
+    encode_frame,
+    get_hook_socket_path,
+    read_frame,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def server(temp_dir: Path) -> AsyncIterator[HookSocketServer]:
+    srv = HookSocketServer(MagicMock(), socket_path=temp_dir / "hooks.sock")
+    assert await srv.start()
+    yield srv
+    await srv.stop()
+
+
+async def _roundtrip(path: Path, *messages: dict[str, Any]) -> list[dict[str, Any] | None]:
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    try:
+        responses = []
+        for message in messages:
+            writer.write(encode_frame(message))
+            await writer.drain()
+            responses.append(await read_frame(reader))
+        return responses
+    finally:
+        writer.close()
+
+
+def _reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+# --- Framing ---
+
+
+@pytest.mark.asyncio
+async def test_frame_roundtrip() -> None:
+    message = {"hook_type": "pre-tool-use", "input_data": {"x": "ü"}}
+    assert await read_frame(_reader(encode_frame(message))) == message
+
+
+@pytest.mark.asyncio
+async def test_read_frame_clean_eof_returns_none() -> None:
+    assert await read_frame(_reader(b"")) is None
+
+
+@pytest.mark.asyncio
+async def test_read_frame_rejects_oversized_and_non_object() -> None:
+    with pytest.raises(ValueError, match="too large"):
+        await read_frame(_reader(struct.pack(">I", MAX_FRAME_BYTES + 1)))
+
+    body = json.dumps([1, 2]).encode()
+    with pytest.raises(ValueError, match="JSON object"):
+        await read_frame(_reader(struct.pack(">I", len(body)) + body))
+
+
+def test_socket_path_env_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GOBBY_HOOK_SOCKET", "/tmp/custom.sock")
+    assert get_hook_socket_path() == Path("/tmp/custom.sock")
+
+
+# --- Server ---
+
+
+@pytest.mark.asyncio
+async def test_executes_hooks_over_one_connection(server: HookSocketServer) -> None:
+    execute = AsyncMock(side_effect=[{"continue": True}, {"decision": "block"}])
+    with patch("gobby.servers.hook_socket.execute_hook_payload", execute):
+        responses = await _roundtrip(
+            server.socket_path,
+            {"hook_type": "pre-tool-use", "input_data": {}, "source": "claude"},
+            {"hook_type": "stop", "input_data": {}, "source": "claude"},
+        )
+
+    assert responses == [
+        {"status": 200, "result": {"continue": True}},
+        {"status": 200, "result": {"decision": "block"}},
+    ]
+    assert execute.await_args_list[0].args[0]["hook_type"] == "pre-tool-use"
+
+
+@pytest.mark.asyncio
+async def test_http_exception_becomes_status_frame(server: HookSocketServer) -> None:
+    execute = AsyncMock(side_effect=HTTPException(status_code=400, detail="source required"))
+    with patch("gobby.servers.hook_socket.execute_hook_payload", execute):
+        (response,) = await _roundtrip(server.socket_path, {"hook_type": "stop"})
+
+    assert response == {"status": 400, "detail": "source required"}
+
+
+@pytest.mark.asyncio
+async def test_context_ids_set_and_stripped(server: HookSocketServer) -> None:
+    execute = AsyncMock(return_value={})
+    with (
+        patch("gobby.servers.hook_socket.execute_hook_payload", execute),
+        patch(
+            "gobby.servers.hook_socket.set_project_context_from_ids", return_value=None
+        ) as set_ctx,
+    ):
+        await _roundtrip(
+            server.socket_path,
+            {"hook_type": "stop", "source": "claude", "project_id": "p1", "session_id": "s1"},
+        )
+
+    set_ctx.assert_called_once()
+    assert set_ctx.call_args.kwargs == {"session_id": "s1", "project_id": "p1"}
+    payload = execute.await_args.args[0]
+    assert "project_id" not in payload and "session_id" not in payload
+
+
+@pytest.mark.asyncio
+async def test_start_replaces_stale_socket_and_stop_removes_it(temp_dir: Path) -> None:
+    path = temp_dir / "hooks.sock"
+    path.write_text("stale")
+    srv = HookSocketServer(MagicMock(), socket_path=path)
+
+    assert await srv.start()
+    assert srv.is_serving
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    await srv.stop()
+    assert not srv.is_serving
+    assert not path.exists()
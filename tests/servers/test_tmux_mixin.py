@@ -225,6 +225,49 @@ class TestTmuxCreateSession:
         assert results[0]["session_name"] == "new-session"
         assert results[0]["pane_pid"] == 42
 
+    @pytest.mark.asyncio
+    async def test_create_event_goes_to_indexed_and_unsubscribed_clients(
+        self, server: WebSocketServer
+    ) -> None:
+        import asyncio
+
+        from gobby.agents.tmux.session_manager import TmuxSessionInfo
+
+        watcher, other, idle = MockWebSocket(), MockWebSocket(), MockWebSocket()
+        watcher.subscriptions = {"tmux_session_event"}
+        other.subscriptions = {"session_message"}
+        idle.subscriptions = None  # type: ignore[assignment]
+        for i, ws in enumerate((watcher, other, idle)):
+            server.clients[ws] = {"id": f"c{i}", "user_id": "test"}
+            server._track_client(ws)
+
+        with (
+            patch.object(server._tmux_mgr_default, "is_available", return_value=True),
+            patch.object(
+                server._tmux_mgr_default,
+                "create_session",
+                new_callable=AsyncMock,
+                return_value=TmuxSessionInfo(name="new-session", pane_pid=42),
+            ),
+            patch.object(server, "_is_subscribed", side_effect=AssertionError("client scan")),
+        ):
+            await server._handle_tmux_create_session(
+                other, {"request_id": "r1", "name": "new-session"}
+            )
+            await asyncio.sleep(0.01)
+
+        events = watcher.messages_of_type("tmux_session_event")
+        assert [(e["event"], e["session_name"]) for e in events] == [
+            ("session_created", "new-session")
+        ]
+        assert other.messages_of_type("tmux_session_event") == []
+        # Clients that never subscribed still see tmux lifecycle events
+        assert len(idle.messages_of_type("tmux_session_event")) == 1
+        # Delivered through the client's send queue, not a direct send
+        assert server.clients[watcher]["send_queue"].stats()["sent"] == 1
+        for ws in (watcher, other, idle):
+            await server._untrack_client(ws)
+
 
 class TestTmuxKillSession:
     """Test _handle_tmux_kill_session handler."""
@@ -0,0 +1,222 @@
+"""Tests for the WebSocket subscription index and per-client send queues."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from websockets.exceptions import ConnectionClosed
+
+from gobby.servers.websocket.broadcast import BroadcastMixin
+from gobby.servers.websocket.outbound import ClientSendQueue
+from gobby.servers.websocket.subscriptions import SubscriptionIndex
+
+pytestmark = pytest.mark.unit
+
+
+class FakeBroadcaster(BroadcastMixin):
+    def __init__(self) -> None:
+        self.clients: dict[Any, dict[str, Any]] = {}
+
+
+def _ws(subscriptions: set[str] | None = None) -> MagicMock:
+    ws = MagicMock()
+    ws.subscriptions = subscriptions
+    ws.send = AsyncMock()
+    ws.close = AsyncMock()
+    return ws
+
+
+def _msg(msg_type: str, **fields: Any) -> dict[str, Any]:
+    return {"type": msg_type, **fields}
+
+
+# --- SubscriptionIndex ---
+
+
+@pytest.mark.parametrize(
+    ("subs", "message", "expected"),
+    [
+        (None, _msg("task_event"), False),
+        (set(), _msg("task_event"), True),
+        ({"*"}, _msg("trace_event"), True),
+        ({"session_event"}, _msg("session_event"), True),
+        ({"session_event"}, _msg("agent_event"), False),
+        ({"session_message:session_id=a"}, _msg("session_message", session_id="a"), True),
+        ({"session_message:session_id=a"}, _msg("session_message", session_id="b"), False),
+        ({"agent_event:run_id=r1"}, _msg("session_event", run_id="r1"), False),
+        ({"before_tool"}, _msg("hook_event", event_type="before_tool"), True),
+        ({"session_event:noequals"}, _msg("session_event", session_id="x"), False),
+    ],
+)
+def test_index_matches_is_subscribed(
+    subs: set[str] | None, message: dict[str, Any], expected: bool
+) -> None:
+    ws = _ws(subs)
+    index = SubscriptionIndex()
+    index.set_subscriptions(ws, subs)
+
+    assert (ws in index.match(message)) is expected
+    assert FakeBroadcaster()._is_subscribed(ws, message) is expected
+
+
+def test_index_updates_on_resubscribe_and_remove() -> None:
+    ws = _ws()
+    index = SubscriptionIndex()
+    index.set_subscriptions(ws, {"terminal_output:run_id=r1", "trace_event"})
+    index.set_subscriptions(ws, {"terminal_output:run_id=r2"})
+
+    assert index.match(_msg("terminal_output", run_id="r1")) == set()
+    assert index.match(_msg("terminal_output", run_id="r2")) == {ws}
+    assert index.match(_msg("trace_event")) == set()
+
+    index.remove(ws)
+    assert len(index) == 0
+    assert index.match(_msg("terminal_output", run_id="r2")) == set()
+
+
+def test_match_only_visits_interested_clients() -> None:
+    index = SubscriptionIndex()
+    interested = _ws({"session_message:session_id=s1"})
+    index.set_subscriptions(interested, interested.subscriptions)
+    for i in range(500):
+        other = _ws({f"session_message:session_id=other-{i}"})
+        index.set_subscriptions(other, other.subscriptions)
+
+    assert index.match(_msg("session_message", session_id="s1")) == {interested}
+
+
+# --- Broadcast through tracked clients ---
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_block_others() -> None:
+    b = FakeBroadcaster()
+    slow_release = asyncio.Event()
+
+    async def slow_send(_: str) -> None:
+        await slow_release.wait()
+
+    slow = _ws({"terminal_output"})
+    slow.send = AsyncMock(side_effect=slow_send)
+    fast = _ws({"terminal_output"})
+    for ws in (slow, fast):
+        b.clients[ws] = {"id": str(id(ws))}
+        b._track_client(ws)
+
+    for i in range(3):
+        await asyncio.wait_for(b.broadcast_terminal_output("run-1", f"chunk{i}"), timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert fast.send.await_count == 3
+    assert slow.send.await_count == 1  # stuck on the first message
+
+    slow_release.set()
+    await asyncio.sleep(0.01)
+    assert slow.send.await_count == 3
+
+    for ws in (slow, fast):
+        await b._untrack_client(ws)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_handlers_keep_index_in_sync() -> None:
+    b = FakeBroadcaster()
+    ws = _ws(None)
+    b.clients[ws] = {}
+    b._track_client(ws)
+
+    ws.subscriptions = {"pipeline_event"}
+    b._sync_subscriptions(ws)
+    await b.broadcast(_msg("pipeline_event", execution_id="pe-1"))
+    await asyncio.sleep(0)
+    assert ws.send.await_count == 1
+
+    ws.subscriptions.clear()
+    b._sync_subscriptions(ws)
+    await b.broadcast(_msg("pipeline_event", execution_id="pe-1"))
+    await asyncio.sleep(0)
+    assert ws.send.await_count == 1
+
+    stats = b.get_client_send_stats()
+    assert stats[0]["sent"] == 1
+    await b._untrack_client(ws)
+
+
+# --- ClientSendQueue backpressure ---
+
+
+def _stalled_queue(max_size: int) -> tuple[ClientSendQueue, MagicMock]:
+    """A queue whose writer is not running, so entries accumulate."""
+    ws = _ws()
+    return ClientSendQueue(ws, max_size=max_size), ws
+
+
+def _enqueue(queue: ClientSendQueue, message: dict[str, Any]) -> bool:
+    return queue.enqueue(message, json.dumps(message))
+
+
+@pytest.mark.asyncio
+async def test_terminal_output_coalesces_under_backpressure() -> None:
+    queue, _ = _stalled_queue(max_size=2)
+    _enqueue(queue, _msg("terminal_output", run_id="r1", data="a"))
+    _enqueue(queue, _msg("terminal_output", run_id="r1", data="b"))
+    assert _enqueue(queue, _msg("terminal_output", run_id="r1", data="c"))
+
+    assert queue.depth == 2
+    assert queue.coalesced == 1
+    assert json.loads(queue._queue[-1].payload)["data"] == "bc"
+
+
+@pytest.mark.asyncio
+async def test_terminal_output_without_a_merge_target_is_queued() -> None:
+    queue, _ = _stalled_queue(max_size=2)
+    _enqueue(queue, _msg("task_event"))
+    _enqueue(queue, _msg("terminal_output", run_id="r1", data="a"))
+    assert _enqueue(queue, _msg("terminal_output", run_id="r2", data="b"))
+
+    assert queue.depth == 3
+    assert (queue.coalesced, queue.dropped) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_trace_events_dropped_oldest_first() -> None:
+    queue, _ = _stalled_queue(max_size=3)
+    for i in range(5):
+        _enqueue(queue, _msg("trace_event", trace_id=str(i)))
+
+    assert queue.depth == 3
+    assert queue.dropped == 2
+    assert [json.loads(e.payload)["trace_id"] for e in queue._queue] == ["0", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_other_messages_queue_until_hard_limit() -> None:
+    queue, ws = _stalled_queue(max_size=2)
+    for i in range(8):
+        assert _enqueue(queue, _msg("session_event", n=i))
+    assert not _enqueue(queue, _msg("session_event", n=8))
+    await asyncio.sleep(0)
+
+    ws.close.assert_awaited_once()
+    assert not _enqueue(queue, _msg("session_event", n=9))
+
+
+@pytest.mark.asyncio
+async def test_writer_stops_on_connection_closed_and_reports_lag() -> None:
+    ws = _ws()
+    ws.send = AsyncMock(side_effect=[None, ConnectionClosed(None, None)])
+    queue = ClientSendQueue(ws)
+    queue.start()
+    _enqueue(queue, _msg("task_event"))
+    _enqueue(queue, _msg("task_event"))
+    await asyncio.sleep(0.01)
+
+    assert queue.sent == 1
+    assert queue.stats()["queue_depth"] == 0
+    assert queue.stats()["max_send_lag_ms"] >= 0
+    assert not _enqueue(queue, _msg("task_event"))
+    await queue.close()
@@ -0,0 +1,231 @@
+"""Tests for transcript offset indexes and chunked archives."""
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from gobby.sessions import transcript_archive, transcript_index, transcript_reader
+from gobby.sessions.processor import SessionMessageProcessor
+from gobby.sessions.transcript_archive import (
+    ArchiveCache,
+    archive_cache,
+    backup_transcript,
+    get_index_dir,
+    load_chunk_table,
+)
+from gobby.sessions.transcript_index import TranscriptIndex, load_index
+from gobby.sessions.transcript_reader import TranscriptReader, clear_archive_cache
+from gobby.sessions.transcripts.claude import ClaudeTranscriptParser
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _small_thresholds(monkeypatch):
+    """Shrink the index/chunk thresholds so small transcripts exercise them."""
+    monkeypatch.setattr(transcript_index, "CHECKPOINT_INTERVAL", 8)
+    monkeypatch.setattr(transcript_index, "MIN_PERSISTED_BYTES", 1)
+    monkeypatch.setattr(transcript_reader, "MIN_PERSISTED_BYTES", 1)
+    monkeypatch.setattr(transcript_archive, "ARCHIVE_CHUNK_BYTES", 2048)
+    clear_archive_cache()
+    yield
+    clear_archive_cache()
+
+
+def _line(i: int) -> dict:
+    if i % 3 == 0:
+        return {"type": "user", "message": {"role": "user", "content": f"question {i}"}}
+    # Assistant lines expand to two messages (text + tool_use)
+    return {
+        "type": "assistant",
+        "message": {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"answer {i}"},
+                {"type": "tool_use", "id": f"tu-{i}", "name": "Read", "input": {"n": i}},
+            ],
+        },
+    }
+
+
+def _append(path: Path, start: int, count: int) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(start, start + count):
+            f.write(json.dumps(_line(i)) + "\n")
+
+
+def _full_parse(path: Path) -> list[tuple[int, str, object]]:
+    lines = path.read_text().splitlines(keepends=True)
+    return [(m.index, m.role, m.content) for m in ClaudeTranscriptParser().parse_lines(lines)]
+
+
+def _keys(messages: list[dict]) -> list[tuple[int, str, object]]:
+    return [(m["message_index"], m["role"], m["content"]) for m in messages]
+
+
+def _reader(archive_dir: Path, transcript: Path | None, external_id: str = "ext-1"):
+    session = MagicMock()
+    session.external_id = external_id
+    session.source = "claude"
+    session.transcript_path = str(transcript) if transcript else None
+    session_manager = MagicMock()
+    session_manager.get.return_value = session
+    return TranscriptReader(session_manager, archive_dir=str(archive_dir))
+
+
+class TestLiveTranscriptPages:
+    @pytest.mark.asyncio
+    async def test_pages_match_full_parse(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        _append(transcript, 0, 120)
+        expected = _full_parse(transcript)
+        reader = _reader(tmp_path / "archives", transcript)
+
+        for offset in (0, 7, 8, 63, 150, len(expected) - 3, len(expected) + 5):
+            page = await reader.get_messages("sess-1", limit=10, offset=offset)
+            assert _keys(page) == expected[offset : offset + 10]
+
+        users = [m for m in expected if m[1] == "user"]
+        page = await reader.get_messages("sess-1", limit=5, offset=12, role="user")
+        assert _keys(page) == users[12:17]
+        assert await reader.count_messages("sess-1") == 120
+
+    @pytest.mark.asyncio
+    async def test_index_extends_on_append(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        archive_dir = tmp_path / "archives"
+        _append(transcript, 0, 40)
+        reader = _reader(archive_dir, transcript)
+        await reader.get_messages("sess-1", limit=5, offset=20)
+
+        index = load_index(str(transcript), get_index_dir(str(archive_dir)))
+        assert index.indexed_bytes == transcript.stat().st_size
+        assert len(index.checkpoints) > 1
+
+        _append(transcript, 40, 40)
+        expected = _full_parse(transcript)
+        page = await reader.get_messages("sess-1", limit=10, offset=len(expected) - 10)
+        assert _keys(page) == expected[-10:]
+        index = load_index(str(transcript), get_index_dir(str(archive_dir)))
+        assert index.message_count == len(expected)
+
+    @pytest.mark.asyncio
+    async def test_replaced_transcript_discards_index(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        archive_dir = tmp_path / "archives"
+        _append(transcript, 0, 60)
+        reader = _reader(archive_dir, transcript)
+        await reader.get_messages("sess-1", limit=5, offset=50)
+
+        transcript.write_text("")
+        _append(transcript, 1, 60)  # same size class, different first line
+        expected = _full_parse(transcript)
+        page = await reader.get_messages("sess-1", limit=10, offset=50)
+        assert _keys(page) == expected[50:60]
+
+
+class TestChunkedArchive:
+    def test_archive_is_plain_gzip_with_chunk_table(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        _append(transcript, 0, 200)
+
+        archive = backup_transcript("ext-1", str(transcript), str(tmp_path / "archives"))
+        assert archive is not None
+
+        with gzip.open(archive, "rb") as f:
+            assert f.read() == transcript.read_bytes()
+        table = load_chunk_table(archive)
+        assert table is not None
+        assert len(table.chunks) > 3
+        assert table.index.line_count == 200
+        assert b"".join(table.iter_lines()) == transcript.read_bytes()
+
+    def test_backup_reuses_live_index(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        archive_dir = tmp_path / "archives"
+        _append(transcript, 0, 50)
+        index = TranscriptIndex(path=str(transcript))
+        index.extend(ClaudeTranscriptParser())
+        transcript_index.save_index(index, get_index_dir(str(archive_dir)))
+
+        parse_lines = MagicMock(wraps=ClaudeTranscriptParser.parse_lines)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(ClaudeTranscriptParser, "parse_lines", parse_lines)
+            archive = backup_transcript("ext-1", str(transcript), str(archive_dir))
+        table = load_chunk_table(archive)
+
+        parse_lines.assert_not_called()
+        assert table.index.checkpoints == index.checkpoints
+
+    @pytest.mark.asyncio
+    async def test_archive_pages_decompress_only_needed_chunks(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        archive_dir = tmp_path / "archives"
+        _append(transcript, 0, 200)
+        expected = _full_parse(transcript)
+        backup_transcript("ext-1", str(transcript), str(archive_dir))
+        reader = _reader(archive_dir, None)
+
+        page = await reader.get_messages("sess-1", limit=10, offset=len(expected) - 20)
+        assert _keys(page) == expected[-20:-10]
+        table = load_chunk_table(archive_dir / "ext-1.jsonl.gz")
+        assert 0 < archive_cache.size_bytes <= 2 * transcript_archive.ARCHIVE_CHUNK_BYTES
+        assert archive_cache.size_bytes < table.chunks[-1][2]
+
+        page = await reader.get_messages("sess-1", limit=7, offset=3, role="assistant")
+        assert _keys(page) == [m for m in expected if m[1] == "assistant"][3:10]
+        assert await reader.count_messages("sess-1") == 200
+
+    @pytest.mark.asyncio
+    async def test_stale_chunk_table_falls_back_to_full_read(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        archive_dir = tmp_path / "archives"
+        _append(transcript, 0, 30)
+        archive = Path(backup_transcript("ext-1", str(transcript), str(archive_dir)))
+
+        # Rewritten by something unaware of the chunk table
+        with gzip.open(archive, "wb") as f:
+            f.write(json.dumps(_line(0)).encode() + b"\n")
+        assert load_chunk_table(archive) is None
+
+        page = await _reader(archive_dir, None).get_messages("sess-1", limit=50)
+        assert _keys(page) == [(0, "user", "question 0")]
+
+
+def test_archive_cache_bounded_by_bytes() -> None:
+    cache = ArchiveCache(max_bytes=100)
+    cache.put("a", b"a", 40)
+    cache.put("b", b"b", 40)
+    cache.get("a")
+    cache.put("c", b"c", 40)
+
+    assert cache.get("b") is None  # least recently used
+    assert cache.get("a") == b"a" and cache.get("c") == b"c"
+    assert cache.size_bytes == 80
+
+    cache.put("huge", b"x", 500)
+    assert cache.get("huge") is None
+    assert cache.size_bytes == 80
+
+
+@pytest.mark.asyncio
+async def test_processor_builds_index_incrementally(tmp_path: Path) -> None:
+    transcript = tmp_path / "t.jsonl"
+    archive_dir = str(tmp_path / "archives")
+    _append(transcript, 0, 100)
+    processor = SessionMessageProcessor(MagicMock(), archive_dir=archive_dir)
+    processor.register_session("sess-1", str(transcript))
+
+    await processor._process_session("sess-1", str(transcript))
+    _append(transcript, 100, 100)
+    await processor._process_session("sess-1", str(transcript))
+
+    built = processor._indexes["sess-1"]
+    saved = load_index(str(transcript), get_index_dir(archive_dir))
+    assert built.message_count == len(_full_parse(transcript))
+    assert built.indexed_bytes == transcript.stat().st_size
+    assert saved.checkpoints == built.checkpoints
+    assert built.checkpoints[-1][1] > 100
@@ -98,3 +98,70 @@ def test_get_span_count(span_storage):
     assert span_storage.get_span_count() == 0
     span_storage.save_span({"span_id": "s1", "trace_id": "t1", "name": "n1", "start_time_ns": 100})
     assert span_storage.get_span_count() == 1
+
+
+def test_get_recent_traces_filters_and_pages(span_storage):
+    def span(span_id, trace_id, start, project=None, status="OK"):
+        attributes = {"project_id": project} if project else {}
+        return {
+            "span_id": span_id,
+            "trace_id": trace_id,
+            "name": span_id,
+            "start_time_ns": start,
+            "status": status,
+            "attributes": attributes,
+        }
+
+    span_storage.save_spans(
+        [
+            span("a1", "ta", 100, project="p1"),
+            span("b1", "tb", 200, project="p2"),
+            span("c1", "tc", 300),  # daemon-level, no project
+            span("a2", "ta", 400, project="p1", status="ERROR"),
+        ]
+    )
+
+    # Ordered by latest activity, represented by the earliest span
+    recent = span_storage.get_recent_traces()
+    assert [(t["trace_id"], t["span_id"]) for t in recent] == [
+        ("ta", "a1"),
+        ("tc", "c1"),
+        ("tb", "b1"),
+    ]
+    assert [t["trace_id"] for t in span_storage.get_recent_traces(limit=1, offset=1)] == ["tc"]
+    assert [t["trace_id"] for t in span_storage.get_recent_traces(project_id="p1")] == [
+        "ta",
+        "tc",
+    ]
+    assert [t["trace_id"] for t in span_storage.get_recent_traces(status="ERROR")] == ["ta"]
+    assert span_storage.get_recent_traces(limit=0) == []
+
+
+def test_session_column_and_count(span_storage, temp_db):
+    span_storage.save_spans(
+        [
+            {
+                "span_id": f"s{i}",
+                "trace_id": f"t{i % 2}",
+                "name": "n",
+                "start_time_ns": i,
+                "attributes": {"session_id": "sess1"},
+            }
+            for i in range(4)
+        ]
+    )
+    row = temp_db.fetchone("SELECT session_id FROM spans WHERE span_id = 's0'")
+    assert row["session_id"] == "sess1"
+    assert span_storage.get_trace_count_by_session("sess1") == 2
+    assert [t["trace_id"] for t in span_storage.get_traces_by_session("sess1")] == ["t1", "t0"]
+
+
+def test_submit_spans_commits_on_writer_thread(span_storage):
+    future = span_storage.submit_spans(
+        [{"span_id": "s1", "trace_id": "t1", "name": "n1", "start_time_ns": 100}]
+    )
+    assert future is not None
+    assert span_storage.flush(timeout=5.0)
+    future.result(timeout=1.0)
+    assert span_storage.get_span_count() == 1
+    assert span_storage.submit_spans([]) is None
@@ -7,10 +7,32 @@ from pathlib import Path
 import pytest
 
 from gobby.storage.database import LocalDatabase
+from gobby.storage.write_queue import DatabaseWriter
 
 # Mark all tests in this module as integration tests
 pytestmark = pytest.mark.integration
 
+_LOCKED = sqlite3.OperationalError("database is locked")
+
+
+class _ScriptedConnection:
+    """Autocommit connection that raises a scripted error for given statements."""
+
+    def __init__(self, path: Path, errors: dict[str, BaseException]) -> None:
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._errors = errors
+
+    def execute(self, sql: str, *args: object) -> sqlite3.Cursor:
+        if sql in self._errors:
+            raise self._errors[sql]
+        return self._conn.execute(sql, *args)
+
+    def executemany(self, sql: str, *args: object) -> sqlite3.Cursor:
+        return self._conn.executemany(sql, *args)
+
+    def close(self) -> None:
+        self._conn.close()
+
 
 class TestLocalDatabase:
     """Tests for LocalDatabase class."""
@@ -153,3 +175,183 @@ class TestLocalDatabase:
         """Test that foreign keys are enabled."""
         row = temp_db.fetchone("PRAGMA foreign_keys")
         assert row[0] == 1
+
+
+class TestWriteQueue:
+    """Tests for WAL mode and the dedicated writer thread."""
+
+    def test_wal_mode_enabled(self, temp_dir: Path) -> None:
+        """Test that wal_mode switches the journal mode to WAL."""
+        db = LocalDatabase(temp_dir / "wal.db", wal_mode=True)
+        row = db.fetchone("PRAGMA journal_mode")
+        assert row[0] == "wal"
+        db.close()
+
+    def test_default_journal_mode_is_delete(self, temp_dir: Path) -> None:
+        """Test that WAL is opt-in."""
+        db = LocalDatabase(temp_dir / "default.db")
+        row = db.fetchone("PRAGMA journal_mode")
+        assert row[0] == "delete"
+        db.close()
+
+    def test_submit_write_commits_and_returns_result(self, temp_dir: Path) -> None:
+        """Test queued writes commit and resolve with rowcount/lastrowid."""
+        db = LocalDatabase(temp_dir / "queue.db", wal_mode=True)
+        db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+
+        result = db.submit_write("INSERT INTO items (name) VALUES (?)", ("one",)).result(5)
+        assert result.rowcount == 1
+        assert result.lastrowid == 1
+
+        many = db.submit_writemany(
+            "INSERT INTO items (name) VALUES (?)", [("two",), ("three",)]
+        ).result(5)
+        assert many.rowcount == 2
+
+        rows = db.fetchall("SELECT name FROM items ORDER BY id")
+        assert [r["name"] for r in rows] == ["one", "two", "three"]
+        db.close()
+
+    def test_failed_statement_does_not_fail_batch(self, temp_dir: Path) -> None:
+        """Test a failing statement only fails its own future."""
+        db = LocalDatabase(temp_dir / "batch.db", wal_mode=True)
+        db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+
+        futures = [
+            db.submit_write("INSERT INTO items (id, name) VALUES (?, ?)", (1, "a")),
+            db.submit_write("INSERT INTO items (id, name) VALUES (?, ?)", (1, "dup")),
+            db.submit_write("INSERT INTO items (id, name) VALUES (?, ?)", (2, "b")),
+        ]
+        assert futures[0].result(5).rowcount == 1
+        with pytest.raises(sqlite3.IntegrityError):
+            futures[1].result(5)
+        assert futures[2].result(5).rowcount == 1
+
+        rows = db.fetchall("SELECT name FROM items ORDER BY id")
+        assert [r["name"] for r in rows] == ["a", "b"]
+        db.close()
+
+    def test_writes_preserve_order_across_threads(self, temp_dir: Path) -> None:
+        """Test concurrent producers are serialized without lock errors."""
+        db = LocalDatabase(temp_dir / "order.db", wal_mode=True)
+        db.execute("CREATE TABLE items (thread INTEGER, seq INTEGER)")
+
+        def producer(thread_id: int) -> None:
+            for seq in range(50):
+                db.submit_write("INSERT INTO items VALUES (?, ?)", (thread_id, seq))
+
+        threads = [threading.Thread(target=producer, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert db.flush_writes(timeout=5)
+
+        for thread_id in range(4):
+            rows = db.fetchall(
+                "SELECT seq FROM items WHERE thread = ? ORDER BY rowid", (thread_id,)
+            )
+            assert [r["seq"] for r in rows] == list(range(50))
+        db.close()
+
+    def test_write_stats(self, temp_dir: Path) -> None:
+        """Test queue depth and commit latency metrics are reported."""
+        db = LocalDatabase(temp_dir / "stats.db", wal_mode=True)
+        assert db.get_write_stats()["running"] is False
+
+        db.execute("CREATE TABLE items (id INTEGER)")
+        db.submit_write("INSERT INTO items VALUES (1)").result(5)
+
+        stats = db.get_write_stats()
+        assert stats["wal_mode"] is True
+        assert stats["running"] is True
+        assert stats["queue_depth"] == 0
+        assert stats["statements_committed"] == 1
+        assert stats["batches_committed"] >= 1
+        assert stats["commit_latency_ms"]["max"] >= 0
+        db.close()
+
+    def test_close_drains_pending_writes(self, temp_dir: Path) -> None:
+        """Test close() commits queued writes before stopping the writer."""
+        db_path = temp_dir / "drain.db"
+        db = LocalDatabase(db_path, wal_mode=True)
+        db.execute("CREATE TABLE items (id INTEGER)")
+        for i in range(100):
+            db.submit_write("INSERT INTO items VALUES (?)", (i,))
+        db.close()
+
+        reopened = LocalDatabase(db_path)
+        row = reopened.fetchone("SELECT COUNT(*) AS n FROM items")
+        assert row["n"] == 100
+        reopened.close()
+
+    def test_failed_begin_fails_jobs_not_flush(self, temp_dir: Path) -> None:
+        """Test a batch that cannot BEGIN fails its writes while flush() still returns."""
+        conn = _ScriptedConnection(temp_dir / "begin.db", {"BEGIN IMMEDIATE": _LOCKED})
+        writer = DatabaseWriter(lambda: conn)
+
+        future = writer.submit("CREATE TABLE items (id INTEGER)")
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            future.result(5)
+        assert writer.flush(timeout=5)
+        assert writer.get_stats()["statements_failed"] == 1
+        writer.close()
+
+    def test_writer_crash_fails_outstanding_writes(self, temp_dir: Path) -> None:
+        """Test a dying writer thread resolves every future and the next write restarts it."""
+        path = temp_dir / "crash.db"
+        connections = iter(
+            [
+                _ScriptedConnection(path, {"SAVEPOINT gobby_write": RuntimeError("boom")}),
+                _ScriptedConnection(path, {}),
+            ]
+        )
+        writer = DatabaseWriter(lambda: next(connections))
+
+        futures = [writer.submit("CREATE TABLE items (id INTEGER)") for _ in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result(5)
+        assert writer.flush(timeout=5)
+
+        assert writer.submit("CREATE TABLE items (id INTEGER)").result(5).rowcount == -1
+        assert writer.is_running
+        writer.close()
+
+    def test_reads_use_query_only_connection_in_wal_mode(self, temp_dir: Path) -> None:
+        """Test plain reads go through a separate read-only connection."""
+        db = LocalDatabase(temp_dir / "reader.db", wal_mode=True)
+        db.execute("CREATE TABLE items (id INTEGER)")
+        db.execute("INSERT INTO items VALUES (1)")
+
+        assert db.fetchone("PRAGMA query_only")[0] == 1
+        assert db.execute("PRAGMA query_only").fetchone()[0] == 0
+        assert db.fetchone("SELECT COUNT(*) AS n FROM items")["n"] == 1
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            db.fetchall("INSERT INTO items VALUES (2) RETURNING id")
+
+        # Reads inside a transaction see its uncommitted writes
+        with db.transaction():
+            db.execute("INSERT INTO items VALUES (2)")
+            assert db.fetchone("SELECT COUNT(*) AS n FROM items")["n"] == 2
+        db.close()
+
+    def test_default_mode_reads_share_the_write_connection(self, temp_db) -> None:
+        """Test DELETE-mode databases keep a single connection per thread."""
+        assert temp_db.fetchone("PRAGMA query_only")[0] == 0
+
+    def test_defer_write(self, temp_dir: Path, temp_db) -> None:
+        """Test defer_write queues in WAL mode and writes inline otherwise."""
+        temp_db.execute("CREATE TABLE items (id INTEGER)")
+        temp_db.defer_write("INSERT INTO items VALUES (1)")
+        assert temp_db.get_write_stats()["running"] is False
+        assert temp_db.fetchone("SELECT COUNT(*) AS n FROM items")["n"] == 1
+
+        db = LocalDatabase(temp_dir / "defer.db", wal_mode=True)
+        db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        db.defer_write("INSERT INTO items VALUES (1)")
+        db.defer_write("INSERT INTO items VALUES (1)")  # fails, only logged
+        assert db.flush_writes(timeout=5)
+        stats = db.get_write_stats()
+        assert (stats["statements_committed"], stats["statements_failed"]) == (1, 1)
+        db.close()
@@ -414,3 +414,95 @@ def test_list_memories_combined_filters(memory_manager, db) -> None:
     results = memory_manager.list_memories(project_id="proj-combo", memory_type="fact")
     assert len(results) == 2
     assert all(r.memory_type == "fact" for r in results)
+
+
+def test_list_memories_tag_filters_in_sql(memory_manager) -> None:
+    """Tag filters apply before LIMIT, so a full page is returned."""
+    for i in range(5):
+        memory_manager.create_memory(content=f"Untagged {i}")
+    tagged = memory_manager.create_memory(content="Tagged", tags=["a", "b"])
+    memory_manager.create_memory(content="Only a", tags=["a"])
+
+    assert [m.id for m in memory_manager.list_memories(tags_all=["a", "b"], limit=1)] == [tagged.id]
+    assert len(memory_manager.list_memories(tags_any=["b", "z"])) == 1
+    assert len(memory_manager.list_memories(tags_none=["a"])) == 5
+
+
+def test_get_memories_by_ids(memory_manager, db) -> None:
+    db.execute("INSERT INTO projects (id, name) VALUES ('proj-ids', 'Ids Project')")
+    fact = memory_manager.create_memory(content="Fact", tags=["keep"])
+    pref = memory_manager.create_memory(content="Pref", memory_type="preference")
+    other = memory_manager.create_memory(content="Other project", project_id="proj-ids")
+
+    ids = [pref.id, "missing", fact.id, other.id, fact.id]
+    assert set(memory_manager.get_memories_by_ids(ids)) == {fact.id, pref.id, other.id}
+    assert set(memory_manager.get_memories_by_ids(ids, memory_type="fact")) == {
+        fact.id,
+        other.id,
+    }
+    assert set(memory_manager.get_memories_by_ids(ids, tags_all=["keep"])) == {fact.id}
+    assert memory_manager.get_memories_by_ids([]) == {}
+
+
+def test_update_access_stats_many(memory_manager) -> None:
+    first = memory_manager.create_memory(content="First")
+    second = memory_manager.create_memory(content="Second")
+
+    memory_manager.update_access_stats_many([first.id, second.id], "2026-01-01T00:00:00+00:00")
+
+    for memory_id in (first.id, second.id):
+        memory = memory_manager.get_memory(memory_id)
+        assert memory.access_count == 1
+        assert memory.last_accessed_at == "2026-01-01T00:00:00+00:00"
+
+
+def test_memory_tags_follow_memory_writes(memory_manager, db) -> None:
+    memory = memory_manager.create_memory(content="Tagged memory", tags=["a", "b"])
+
+    def tags() -> list[str]:
+        rows = db.fetchall(
+            "SELECT tag FROM memory_tags WHERE memory_id = ? ORDER BY tag", (memory.id,)
+        )
+        return [r["tag"] for r in rows]
+
+    assert tags() == ["a", "b"]
+    memory_manager.update_memory(memory.id, tags=["c"])
+    assert tags() == ["c"]
+    memory_manager.delete_memory(memory.id)
+    assert tags() == []
+
+
+def test_search_memories_ranks_by_bm25(memory_manager) -> None:
+    memory_manager.create_memory(content="Database migration notes")
+    best = memory_manager.create_memory(content="migration migration: run migration scripts")
+
+    results = memory_manager.search_memories(query_text="migration")
+    assert [r.id for r in results][0] == best.id
+    assert len(results) == 2
+
+
+def test_search_memories_fts_follows_updates(memory_manager) -> None:
+    memory = memory_manager.create_memory(content="Original wording")
+    memory_manager.update_memory(memory.id, content="Replacement phrasing")
+
+    assert memory_manager.search_memories(query_text="wording") == []
+    assert [r.id for r in memory_manager.search_memories(query_text="phrasing")] == [memory.id]
+
+
+def test_content_hash_dedup(memory_manager) -> None:
+    memory = memory_manager.create_memory(content="Dedup me")
+
+    assert memory_manager.content_exists("  Dedup me  ")
+    assert memory_manager.get_memory_by_content("Dedup me\n").id == memory.id
+    assert not memory_manager.content_exists("Something else")
+
+
+def test_update_to_existing_content_keeps_hash_unique(memory_manager) -> None:
+    first = memory_manager.create_memory(content="First content")
+    second = memory_manager.create_memory(content="Second content")
+
+    # Would violate the unique content_hash index if the hash were copied
+    memory_manager.update_memory(second.id, content="First content")
+
+    assert memory_manager.get_memory_by_content("First content").id == first.id
+    assert memory_manager.create_memory(content="First content").id == first.id
@@ -4,9 +4,12 @@ from unittest.mock import patch
 import pytest
 
 from gobby.storage.database import LocalDatabase
+from gobby.storage.memories import compute_content_hash
 from gobby.storage.migrations import (
     BASELINE_VERSION,
     MIGRATIONS,
+    _add_memory_indexes,
+    _run_migration_list,
     get_current_version,
     run_migrations,
 )
@@ -92,3 +95,80 @@ def test_get_current_version_error(tmp_path) -> None:
     # Mock execute to raise exception even if table exists logic was reached
     with patch.object(db, "fetchone", side_effect=sqlite3.OperationalError("Boom")):
         assert get_current_version(db) == 0
+
+
+def test_add_memory_indexes_backfills_existing_rows(tmp_path) -> None:
+    """v200 hashes content, mirrors tags and indexes content for existing memories."""
+    db = LocalDatabase(tmp_path / "memory_indexes.db")
+    run_migrations(db)
+    # Roll memories back to the pre-v200 shape
+    db.connection.executescript("""
+        DROP TRIGGER memory_tags_ai;
+        DROP TRIGGER memory_tags_ad;
+        DROP TRIGGER memory_tags_au;
+        DROP TRIGGER memories_fts_ai;
+        DROP TRIGGER memories_fts_ad;
+        DROP TRIGGER memories_fts_au;
+        DROP TABLE memories_fts;
+        DROP TABLE memory_tags;
+        DROP INDEX idx_memories_content_hash;
+        ALTER TABLE memories DROP COLUMN content_hash;
+    """)
+    insert = (
+        "INSERT INTO memories (id, memory_type, content, tags, created_at, updated_at) "
+        "VALUES (?, 'fact', ?, ?, ?, ?)"
+    )
+    db.execute(insert, ("m-1", "Shared content", '["a", "b"]', "2026-01-01", "2026-01-01"))
+    db.execute(insert, ("m-2", "Shared content ", None, "2026-01-02", "2026-01-02"))
+
+    _add_memory_indexes(db)
+
+    hashes = {
+        r["id"]: r["content_hash"] for r in db.fetchall("SELECT id, content_hash FROM memories")
+    }
+    # Only the oldest duplicate keeps the hash, so the unique index holds
+    assert hashes == {"m-1": compute_content_hash("Shared content"), "m-2": None}
+    tags = db.fetchall("SELECT tag FROM memory_tags WHERE memory_id = 'm-1' ORDER BY tag")
+    assert [r["tag"] for r in tags] == ["a", "b"]
+    fts = db.fetchall("SELECT rowid FROM memories_fts WHERE memories_fts MATCH 'shared'")
+    assert len(fts) == 2
+
+
+def test_span_columns_backfilled_from_attributes(tmp_path) -> None:
+    """v203 copies session_id/project_id out of attributes_json into indexed columns."""
+    db = LocalDatabase(tmp_path / "spans.db")
+    run_migrations(db)
+    # Roll spans back to the pre-v203 shape
+    db.connection.executescript("""
+        DROP INDEX idx_spans_trace_start;
+        DROP INDEX idx_spans_session;
+        DROP INDEX idx_spans_project;
+        DROP INDEX idx_spans_status;
+        ALTER TABLE spans DROP COLUMN session_id;
+        ALTER TABLE spans DROP COLUMN project_id;
+        CREATE INDEX idx_spans_trace_id ON spans(trace_id);
+        DELETE FROM schema_version WHERE version >= 203;
+    """)
+    insert = (
+        "INSERT INTO spans (span_id, trace_id, name, start_time_ns, attributes_json) "
+        "VALUES (?, 't1', 'n', 0, ?)"
+    )
+    db.execute(insert, ("s1", '{"session_id": "sess-1", "project_id": "proj-1"}'))
+    db.execute(insert, ("s2", "{}"))
+    db.execute(insert, ("s3", "not json"))
+
+    _run_migration_list(db, 202, [m for m in MIGRATIONS if m[0] == 203])
+
+    rows = db.fetchall("SELECT span_id, session_id, project_id FROM spans ORDER BY span_id")
+    assert [tuple(r) for r in rows] == [
+        ("s1", "sess-1", "proj-1"),
+        ("s2", None, None),
+        ("s3", None, None),
+    ]
+    plan = db.fetchall(
+        "EXPLAIN QUERY PLAN SELECT start_time_ns, trace_id FROM spans "
+        "WHERE session_id = ? ORDER BY start_time_ns DESC",
+        ("sess-1",),
+    )
+    assert any("idx_spans_session" in r["detail"] for r in plan)
+    assert not any("TEMP B-TREE" in r["detail"] for r in plan)
@@ -297,6 +297,27 @@ class TestLocalSessionManager:
         assert row["tool_call_count"] == 3
         assert row["last_assistant_content"] == "Testing stats update."
 
+    def test_record_transcript_stats(
+        self,
+        session_manager: LocalSessionManager,
+        sample_project: dict,
+    ) -> None:
+        """Test transcript stats are stored and empty content is not overwritten."""
+        session = session_manager.register(
+            external_id="stats-record-test",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+        session_manager.record_transcript_stats(session.id, 4, 2, 1, "First reply.")
+        session_manager.record_transcript_stats(session.id, 6, 3, 1)
+
+        stored = session_manager.get(session.id)
+        assert stored is not None
+        assert (stored.message_count, stored.turn_count, stored.tool_call_count) == (6, 3, 1)
+        assert stored.last_assistant_content == "First reply."
+        assert stored.updated_at >= session.updated_at
+
     @pytest.mark.unit
     def test_update_model(
         self,
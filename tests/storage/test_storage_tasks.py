@@ -1450,6 +1450,48 @@ class TestPathCacheComputation:
         child_row = temp_db.fetchone("SELECT path_cache FROM tasks WHERE id = ?", (child.id,))
         assert child_row["path_cache"] is None
 
+    def test_reparent_updates_subtree_paths(self, task_manager, project_id, temp_db) -> None:
+        """Test re-parenting a task rewrites the paths of its whole subtree."""
+        epic_a = task_manager.create_task(project_id=project_id, title="Epic A")
+        epic_b = task_manager.create_task(project_id=project_id, title="Epic B")
+        child = task_manager.create_task(
+            project_id=project_id, title="Child", parent_task_id=epic_a.id
+        )
+        grandchild = task_manager.create_task(
+            project_id=project_id, title="Grandchild", parent_task_id=child.id
+        )
+        assert task_manager.get_task(grandchild.id).path_cache == "1.3.4"
+        before = temp_db.fetchone("SELECT updated_at FROM tasks WHERE id = ?", (epic_b.id,))
+
+        task_manager.update_task(child.id, parent_task_id=epic_b.id)
+
+        assert task_manager.get_task(child.id).path_cache == "2.3"
+        assert task_manager.get_task(grandchild.id).path_cache == "2.3.4"
+        # Tasks outside the subtree are left alone
+        after = temp_db.fetchone("SELECT updated_at FROM tasks WHERE id = ?", (epic_b.id,))
+        assert after["updated_at"] == before["updated_at"]
+
+    def test_rebuild_project_paths(self, task_manager, project_id, temp_db) -> None:
+        """Test rebuild_project_paths fixes stale paths without touching updated_at."""
+        root = task_manager.create_task(project_id=project_id, title="Root")
+        child = task_manager.create_task(
+            project_id=project_id, title="Child", parent_task_id=root.id
+        )
+        other = task_manager.create_task(project_id=project_id, title="Other")
+        temp_db.execute(
+            "UPDATE tasks SET path_cache = 'stale' WHERE id IN (?, ?)", (child.id, other.id)
+        )
+        before = temp_db.fetchone("SELECT updated_at FROM tasks WHERE id = ?", (child.id,))
+
+        assert task_manager.rebuild_project_paths(project_id) == 2
+        assert task_manager.get_task(child.id).path_cache == "1.2"
+        assert task_manager.get_task(other.id).path_cache == "3"
+        after = temp_db.fetchone("SELECT updated_at FROM tasks WHERE id = ?", (child.id,))
+        assert after["updated_at"] == before["updated_at"]
+
+        # Nothing left to change
+        assert task_manager.rebuild_project_paths(project_id) == 0
+
     def test_to_dict_includes_seq_num_and_path_cache(self, task_manager, project_id) -> None:
         """Test that to_dict() includes seq_num and path_cache fields."""
         task = task_manager.create_task(project_id=project_id, title="Task")
@@ -0,0 +1,191 @@
+"""Tests for the in-memory dependency graph (storage/task_dependency_graph.py)."""
+
+import gc
+from datetime import UTC, datetime
+
+import pytest
+
+from gobby.storage.task_dependencies import DependencyCycleError, TaskDependencyManager
+from gobby.storage.task_dependency_graph import _graphs, get_dependency_graph
+from gobby.storage.tasks import LocalTaskManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def task_manager(temp_db):
+    return LocalTaskManager(temp_db)
+
+
+@pytest.fixture
+def dep_manager(temp_db):
+    return TaskDependencyManager(temp_db)
+
+
+@pytest.fixture
+def project_id(sample_project):
+    return sample_project["id"]
+
+
+def _chain(task_manager, dep_manager, project_id, n: int) -> list[str]:
+    """Create tasks T0..Tn-1 where each task depends on the previous one."""
+    ids = [task_manager.create_task(project_id, f"T{i}").id for i in range(n)]
+    dep_manager.add_dependencies([(ids[i], ids[i - 1], "blocks") for i in range(1, n)])
+    return ids
+
+
+def _raw_insert(db, task_id: str, depends_on: str) -> None:
+    with db.transaction() as conn:
+        conn.execute(
+            "INSERT INTO task_dependencies (task_id, depends_on, dep_type, created_at) "
+            "VALUES (?, ?, 'blocks', ?)",
+            (task_id, depends_on, datetime.now(UTC).isoformat()),
+        )
+
+
+def test_warm_graph_answers_without_dependency_queries(
+    temp_db, task_manager, dep_manager, project_id
+) -> None:
+    ids = _chain(task_manager, dep_manager, project_id, 50)
+    dep_manager.get_dependency_tree(ids[-1])  # warm
+
+    statements: list[str] = []
+    temp_db.connection.set_trace_callback(statements.append)
+    try:
+        assert dep_manager._would_create_cycle(ids[0], ids[-1])
+        tree = dep_manager.get_dependency_tree(ids[-1], direction="blockers", max_depth=100)
+        assert len(dep_manager.get_transitive_blockers(ids[-1])) == 49
+    finally:
+        temp_db.connection.set_trace_callback(None)
+
+    assert tree["blockers"][0]["id"] == ids[-2]
+    # Only the version check runs
+    assert statements
+    assert not [s for s in statements if "task_dependencies" in s]
+
+
+def test_manager_writes_patch_shared_graph(task_manager, project_id, temp_db) -> None:
+    a, b, c = (task_manager.create_task(project_id, t).id for t in "ABC")
+    first = TaskDependencyManager(temp_db)
+    second = TaskDependencyManager(temp_db)
+    assert first.graph is second.graph
+
+    first.add_dependency(a, b)
+    second.add_dependency(b, c)
+    with pytest.raises(DependencyCycleError):
+        first.add_dependency(c, a)
+
+    second.remove_dependency(b, c)
+    first.add_dependency(c, a)
+    assert first.get_transitive_blockers(c) == [a, b]
+
+
+def test_raw_sql_write_invalidates_cache(task_manager, dep_manager, project_id, temp_db) -> None:
+    a, b, c = (task_manager.create_task(project_id, t).id for t in "ABC")
+    dep_manager.add_dependency(a, b)
+    assert not dep_manager._would_create_cycle(c, a)
+
+    # Bypass the manager entirely, as sync import does
+    _raw_insert(temp_db, b, c)
+    assert dep_manager._would_create_cycle(c, a)
+
+    # Cascading deletes bump the version too
+    task_manager.delete_task(b, unlink=True)
+    assert not dep_manager._would_create_cycle(c, a)
+    assert dep_manager.get_dependency_tree(a) == {"id": a}
+
+
+def test_cross_project_cycle_detected(
+    task_manager, dep_manager, project_id, project_manager
+) -> None:
+    other = project_manager.create(name="other", repo_path="/tmp/other").id
+    a = task_manager.create_task(project_id, "A").id
+    x = task_manager.create_task(other, "X").id
+    y = task_manager.create_task(other, "Y").id
+    dep_manager.add_dependency(a, x)
+    dep_manager.add_dependency(x, y)
+
+    with pytest.raises(DependencyCycleError):
+        dep_manager.add_dependency(y, a)
+    assert dep_manager.get_dependency_tree(y, direction="blocking")["blocking"][0]["id"] == x
+
+
+class TestAddDependencies:
+    def test_cycle_inside_batch_writes_nothing(self, task_manager, dep_manager, project_id):
+        a, b, c = (task_manager.create_task(project_id, t).id for t in "ABC")
+
+        with pytest.raises(DependencyCycleError, match="would create a cycle"):
+            dep_manager.add_dependencies([(a, b, "blocks"), (b, c, "blocks"), (c, a, "blocks")])
+
+        assert dep_manager.get_blockers(a) == []
+        assert dep_manager.get_dependency_tree(a) == {"id": a}
+
+    def test_cycle_through_existing_edges(self, task_manager, dep_manager, project_id):
+        ids = _chain(task_manager, dep_manager, project_id, 5)
+        extra = task_manager.create_task(project_id, "extra").id
+
+        with pytest.raises(DependencyCycleError):
+            dep_manager.add_dependencies([(extra, ids[0], "blocks"), (ids[0], ids[4], "blocks")])
+
+    def test_existing_cycle_elsewhere_does_not_block_batch(
+        self, task_manager, dep_manager, project_id, temp_db
+    ):
+        a, b, c = (task_manager.create_task(project_id, t).id for t in "ABC")
+        dep_manager.add_dependency(a, b)
+        _raw_insert(temp_db, b, a)  # corrupt: a <-> b
+
+        assert len(dep_manager.add_dependencies([(c, a, "blocks")])) == 1
+
+    def test_skips_existing_and_duplicate_edges(self, task_manager, dep_manager, project_id):
+        a, b, c = (task_manager.create_task(project_id, t).id for t in "ABC")
+        dep_manager.add_dependency(a, b)
+
+        created = dep_manager.add_dependencies(
+            [(a, b, "blocks"), (a, c, "blocks"), (a, c, "blocks"), (a, c, "related")]
+        )
+
+        assert [(d.depends_on, d.dep_type) for d in created] == [(c, "blocks"), (c, "related")]
+        assert dep_manager.graph.blockers(a) == [b, c]
+
+    def test_self_edge_rejected(self, task_manager, dep_manager, project_id):
+        a = task_manager.create_task(project_id, "A").id
+        with pytest.raises(ValueError, match="itself"):
+            dep_manager.add_dependencies([(a, a, "blocks")])
+
+
+def test_topological_order_respects_transitive_blockers(
+    task_manager, dep_manager, project_id
+) -> None:
+    a, b, c, d = (task_manager.create_task(project_id, t).id for t in "ABCD")
+    # d -> c -> b -> a (each depends on the next)
+    dep_manager.add_dependencies([(d, c, "blocks"), (c, b, "blocks"), (b, a, "blocks")])
+
+    # b is not requested but still orders d after a
+    assert dep_manager.topological_order([d, a]) == [a, d]
+    assert dep_manager.topological_order([d, c, b, a]) == [a, b, c, d]
+
+
+def test_topological_order_reports_cycles(task_manager, dep_manager, project_id, temp_db) -> None:
+    a, b, c = (task_manager.create_task(project_id, t).id for t in "ABC")
+    dep_manager.add_dependency(a, b)
+    _raw_insert(temp_db, b, a)
+
+    with pytest.raises(DependencyCycleError, match="cycle"):
+        dep_manager.topological_order([a, b, c])
+
+
+def test_shared_graph_does_not_keep_database_alive() -> None:
+    class _Db:
+        pass
+
+    db = _Db()
+    graph = get_dependency_graph(db)  # type: ignore[arg-type]
+    assert graph.db is db
+    assert get_dependency_graph(db) is graph  # type: ignore[arg-type]
+    size = len(_graphs)
+
+    del db
+    gc.collect()
+    assert len(_graphs) == size - 1
+    with pytest.raises(RuntimeError, match="garbage collected"):
+        _ = graph.db
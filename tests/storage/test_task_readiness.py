@@ -0,0 +1,178 @@
+"""Tests for trigger-maintained task readiness (storage/tasks/_readiness.py)."""
+
+import random
+import sqlite3
+
+import pytest
+
+from gobby.storage.task_dependencies import DependencyCycleError, TaskDependencyManager
+from gobby.storage.tasks import LocalTaskManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def task_manager(temp_db):
+    return LocalTaskManager(temp_db)
+
+
+@pytest.fixture
+def dep_manager(temp_db):
+    return TaskDependencyManager(temp_db)
+
+
+@pytest.fixture
+def project_id(sample_project):
+    return sample_project["id"]
+
+
+def _is_ancestor_or_self(task_manager: LocalTaskManager, ancestor: str, task_id: str) -> bool:
+    current: str | None = task_id
+    while current:
+        if current == ancestor:
+            return True
+        current = task_manager.get_task(current).parent_task_id
+    return False
+
+
+def _ready_ids(task_manager: LocalTaskManager, project_id: str) -> set[str]:
+    return {t.id for t in task_manager.list_ready_tasks(project_id=project_id, limit=0)}
+
+
+class TestReadinessMaintenance:
+    def test_blocker_close_and_reopen(self, task_manager, dep_manager, project_id) -> None:
+        a = task_manager.create_task(project_id, "A")
+        b = task_manager.create_task(project_id, "B")
+        dep_manager.add_dependency(a.id, b.id)
+        assert _ready_ids(task_manager, project_id) == {b.id}
+
+        task_manager.close_task(b.id, force=True)
+        assert _ready_ids(task_manager, project_id) == {a.id}
+
+        task_manager.reopen_task(b.id)
+        assert _ready_ids(task_manager, project_id) == {b.id}
+        assert task_manager.verify_readiness() == []
+
+    def test_blocked_parent_hides_subtree(self, task_manager, dep_manager, project_id) -> None:
+        epic = task_manager.create_task(project_id, "Epic")
+        child = task_manager.create_task(project_id, "Child", parent_task_id=epic.id)
+        grandchild = task_manager.create_task(project_id, "GC", parent_task_id=child.id)
+        blocker = task_manager.create_task(project_id, "Blocker")
+        assert {epic.id, child.id, grandchild.id} <= _ready_ids(task_manager, project_id)
+
+        dep_manager.add_dependency(epic.id, blocker.id)
+        assert _ready_ids(task_manager, project_id) == {blocker.id}
+        row = task_manager.db.fetchone(
+            "SELECT * FROM task_readiness WHERE task_id = ?", (grandchild.id,)
+        )
+        assert (row["open_blockers"], row["ancestor_blocked"], row["is_ready"]) == (0, 1, 0)
+
+        dep_manager.remove_dependency(epic.id, blocker.id)
+        assert grandchild.id in _ready_ids(task_manager, project_id)
+        assert task_manager.verify_readiness() == []
+
+    def test_descendant_blocker_is_not_a_work_block(
+        self, task_manager, dep_manager, project_id
+    ) -> None:
+        epic = task_manager.create_task(project_id, "Epic")
+        child = task_manager.create_task(project_id, "Child", parent_task_id=epic.id)
+        dep_manager.add_dependency(epic.id, child.id)
+
+        assert {epic.id, child.id} <= _ready_ids(task_manager, project_id)
+        assert task_manager.count_blocked_tasks(project_id=project_id) == 0
+
+    def test_reparent_updates_descendant_blocks(
+        self, task_manager, dep_manager, project_id
+    ) -> None:
+        epic = task_manager.create_task(project_id, "Epic")
+        other = task_manager.create_task(project_id, "Other")
+        task = task_manager.create_task(project_id, "Task", parent_task_id=epic.id)
+        dep_manager.add_dependency(epic.id, task.id)
+        assert epic.id in _ready_ids(task_manager, project_id)
+
+        # Task is no longer epic's descendant, so it now blocks epic
+        task_manager.update_task(task.id, parent_task_id=other.id)
+        ready = _ready_ids(task_manager, project_id)
+        assert epic.id not in ready
+        assert task.id in ready
+        assert task_manager.verify_readiness() == []
+
+    def test_closed_parent_hides_children(self, task_manager, project_id) -> None:
+        parent = task_manager.create_task(project_id, "Parent")
+        child = task_manager.create_task(project_id, "Child", parent_task_id=parent.id)
+        task_manager.update_task(parent.id, status="closed")
+        assert child.id not in _ready_ids(task_manager, project_id)
+
+        task_manager.update_task(parent.id, status="in_progress")
+        assert child.id in _ready_ids(task_manager, project_id)
+
+    def test_delete_blocker_unblocks(self, task_manager, dep_manager, project_id) -> None:
+        a = task_manager.create_task(project_id, "A")
+        b = task_manager.create_task(project_id, "B")
+        dep_manager.add_dependency(a.id, b.id)
+
+        task_manager.delete_task(b.id, unlink=True)
+        assert _ready_ids(task_manager, project_id) == {a.id}
+        assert task_manager.verify_readiness() == []
+
+
+def test_random_mutations_match_full_recompute(task_manager, dep_manager, project_id) -> None:
+    rng = random.Random(7)
+    ids: list[str] = []
+    for i in range(40):
+        parent = rng.choice(ids) if ids and rng.random() < 0.6 else None
+        ids.append(task_manager.create_task(project_id, f"T{i}", parent_task_id=parent).id)
+
+    statuses = ["open", "in_progress", "closed", "needs_review", "review_approved", "escalated"]
+    for _ in range(300):
+        op = rng.random()
+        a, b = rng.sample(ids, 2)
+        if op < 0.35:
+            try:
+                dep_manager.add_dependency(a, b)
+            except (DependencyCycleError, ValueError, sqlite3.IntegrityError):
+                pass
+        elif op < 0.55:
+            dep_manager.remove_dependency(a, b)
+        elif op < 0.85:
+            task_manager.update_task(a, status=rng.choice(statuses))
+        elif not _is_ancestor_or_self(task_manager, a, b):
+            task_manager.update_task(a, parent_task_id=rng.choice([None, b]))
+
+    assert task_manager.verify_readiness() == []
+
+
+def test_rebuild_repairs_drift(task_manager, project_id) -> None:
+    task = task_manager.create_task(project_id, "T")
+    task_manager.db.execute("UPDATE task_readiness SET is_ready = 0 WHERE task_id = ?", (task.id,))
+    task_manager.db.execute("DELETE FROM task_readiness WHERE task_id != ?", (task.id,))
+
+    drift = task_manager.verify_readiness()
+    assert {"task_id": task.id, "field": "is_ready", "stored": 0, "expected": 1} in drift
+
+    assert task_manager.rebuild_readiness() >= 1
+    assert task_manager.verify_readiness() == []
+    assert task.id in _ready_ids(task_manager, project_id)
+
+
+def test_ready_query_uses_readiness_index(task_manager, project_id) -> None:
+    plan = task_manager.db.fetchall(
+        """EXPLAIN QUERY PLAN
+           SELECT t.* FROM task_readiness r JOIN tasks t ON t.id = r.task_id
+           WHERE r.is_ready = 1 AND r.project_id = ?
+           ORDER BY r.priority ASC, r.created_at ASC""",
+        (project_id,),
+    )
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_task_readiness_ready" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_blocked_list_is_not_capped(task_manager, dep_manager, project_id) -> None:
+    blocker = task_manager.create_task(project_id, "Blocker")
+    for i in range(1001):
+        task = task_manager.create_task(project_id, f"T{i}")
+        dep_manager.add_dependency(task.id, blocker.id)
+
+    blocked = task_manager.list_blocked_tasks(project_id=project_id, limit=0)
+    assert len(blocked) == 1001
@@ -231,6 +231,20 @@ class TestTaskSearch:
         results2 = manager.search_tasks("authentication", project_id=project_id)
         assert len(results1) == len(results2)
 
+    def test_search_follows_indexed_column_updates(self, db_with_tasks) -> None:
+        """Test FTS follows title edits but ignores unindexed column writes."""
+        db, manager, project_id = db_with_tasks
+        task, _ = manager.search_tasks("authentication", project_id=project_id)[0]
+
+        manager.update_task(task.id, title="Rotate signing keys")
+        results = manager.search_tasks("signing", project_id=project_id)
+        assert [t.id for t, _ in results] == [task.id]
+
+        changes = db.fetchone("SELECT total_changes() AS n")["n"]
+        db.execute("UPDATE tasks SET path_cache = 'x' WHERE id = ?", (task.id,))
+        # One row changed, and no tasks_fts rows were rewritten for it
+        assert db.fetchone("SELECT total_changes() AS n")["n"] == changes + 1
+
 
 class TestTaskFTS5Searcher:
     """Tests for the TaskFTS5Searcher class."""
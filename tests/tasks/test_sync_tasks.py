@@ -1200,3 +1200,66 @@ class TestImportSeqNumPreservation:
         assert c.seq_num == 51
         assert p.path_cache == "50"
         assert c.path_cache == "50.51"
+
+    @pytest.mark.integration
+    def test_path_cache_when_child_precedes_parent(
+        self, sync_manager, task_manager, sample_project
+    ) -> None:
+        """Children listed before their parents still get full paths."""
+        now = "2023-01-02T00:00:00+00:00"
+
+        def row(task_id: str, seq: int, parent_id: str | None) -> dict:
+            return {
+                "id": task_id,
+                "title": task_id,
+                "description": "Desc",
+                "status": "open",
+                "created_at": now,
+                "updated_at": now,
+                "project_id": sample_project["id"],
+                "parent_id": parent_id,
+                "deps_on": [],
+                "seq_num": seq,
+                "path_cache": None,
+            }
+
+        sync_manager.export_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(sync_manager.export_path, "w") as f:
+            f.write(json.dumps(row("task-gc", 12, "task-mid")) + "\n")
+            f.write(json.dumps(row("task-mid", 11, "task-top")) + "\n")
+            f.write(json.dumps(row("task-top", 10, None)) + "\n")
+
+        sync_manager.import_from_jsonl()
+
+        assert task_manager.get_task("task-top").path_cache == "10"
+        assert task_manager.get_task("task-mid").path_cache == "10.11"
+        assert task_manager.get_task("task-gc").path_cache == "10.11.12"
+
+    @pytest.mark.integration
+    def test_reparented_task_path_is_recomputed(
+        self, sync_manager, task_manager, sample_project
+    ) -> None:
+        """An existing task moved under a new parent gets its new path, not the JSONL one."""
+        project_id = sample_project["id"]
+        epic = task_manager.create_task(project_id, "Epic")
+        task = task_manager.create_task(project_id, "Task")
+        sub = task_manager.create_task(project_id, "Sub", parent_task_id=task.id)
+
+        data = task_manager.get_task(task.id).to_dict()
+        data.update(
+            parent_id=epic.id,
+            deps_on=[],
+            path_cache=task.path_cache,  # stale: exported before the move
+            updated_at="2099-01-01T00:00:00+00:00",
+        )
+        sync_manager.export_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(sync_manager.export_path, "w") as f:
+            f.write(json.dumps(data) + "\n")
+
+        sync_manager.import_from_jsonl()
+
+        assert task_manager.get_task(task.id).path_cache == f"{epic.seq_num}.{task.seq_num}"
+        assert (
+            task_manager.get_task(sub.id).path_cache
+            == f"{epic.seq_num}.{task.seq_num}.{sub.seq_num}"
+        )
@@ -0,0 +1,77 @@
+"""Tests for tail sampling of locally stored traces."""
+
+import pytest
+
+from gobby.telemetry.sampling import TailSampler
+
+pytestmark = pytest.mark.unit
+
+
+def _span(trace_id: str, span_id: str, parent: str | None = None, **kwargs):
+    return {
+        "trace_id": trace_id,
+        "span_id": span_id,
+        "parent_span_id": parent,
+        "start_time_ns": kwargs.get("start", 0),
+        "end_time_ns": kwargs.get("end", 1_000_000),
+        "status": kwargs.get("status", "OK"),
+    }
+
+
+def _trace_id(high: int) -> str:
+    return f"{high:016x}" + "0" * 16
+
+
+def test_disabled_sampler_passes_spans_through() -> None:
+    sampler = TailSampler(sample_rate=1.0)
+    spans = [_span("t", "a", parent="root")]
+    assert sampler.offer(spans) is spans
+    assert not sampler.enabled
+
+
+def test_trace_held_until_root_arrives() -> None:
+    sampler = TailSampler(sample_rate=0.0)
+    slow = _trace_id(1)
+    assert sampler.offer([_span(slow, "child", parent="root")], now=0.0) == []
+    kept = sampler.offer([_span(slow, "root", start=0, end=3_000_000_000)], now=1.0)
+    assert [s["span_id"] for s in kept] == ["child", "root"]
+    assert sampler.traces_kept == 1
+
+
+def test_error_and_slow_traces_always_kept() -> None:
+    sampler = TailSampler(sample_rate=0.0, slow_threshold_ms=500)
+    ordinary, failed, slow = _trace_id(1), _trace_id(2), _trace_id(3)
+    kept = sampler.offer(
+        [
+            _span(ordinary, "o"),
+            _span(failed, "c", parent="f", status="ERROR"),
+            _span(failed, "f"),
+            _span(slow, "s", end=600_000_000),
+        ]
+    )
+    assert {s["span_id"] for s in kept} == {"c", "f", "s"}
+    assert sampler.traces_dropped == 1
+
+
+def test_sample_rate_is_deterministic_per_trace() -> None:
+    sampler = TailSampler(sample_rate=0.5)
+    low, high = _trace_id(1), _trace_id(2**64 - 1)
+    assert sampler.offer([_span(low, "a")]) != []
+    assert sampler.offer([_span(high, "b")]) == []
+    # Late spans follow the trace's decision
+    assert sampler.offer([_span(low, "late", parent="a")]) != []
+    assert sampler.offer([_span(high, "late", parent="b")]) == []
+
+
+def test_overdue_and_overflowing_traces_are_decided() -> None:
+    sampler = TailSampler(sample_rate=0.0, decision_wait_seconds=10, max_pending_spans=2)
+    failed = _trace_id(1)
+    assert sampler.offer([_span(failed, "x", parent="r", status="ERROR")], now=0.0) == []
+    # Root never arrives: decided once the wait expires
+    assert [s["span_id"] for s in sampler.offer([], now=11.0)] == ["x"]
+
+    sampler.offer([_span(_trace_id(2), "a", parent="r"), _span(_trace_id(3), "b", parent="r")])
+    sampler.offer([_span(_trace_id(4), "c", parent="r")])
+    assert sampler.traces_dropped == 1  # oldest evicted to stay within the bound
+    assert sampler.flush() == []
+    assert sampler.traces_dropped == 3
@@ -1,9 +1,11 @@
+from concurrent.futures import Future
 from unittest.mock import MagicMock
 
 import pytest
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.trace import SpanContext, SpanKind, Status, StatusCode
 
+from gobby.telemetry.sampling import TailSampler
 from gobby.telemetry.span_store import GobbySpanExporter
 
 
@@ -34,8 +36,8 @@ def test_export_spans(exporter, mock_storage):
 
     exporter.export([span])
 
-    assert mock_storage.save_spans.called
-    saved_spans = mock_storage.save_spans.call_args[0][0]
+    assert mock_storage.submit_spans.called
+    saved_spans = mock_storage.submit_spans.call_args[0][0]
     assert len(saved_spans) == 1
     assert saved_spans[0]["span_id"] == "1234567812345678"
     assert saved_spans[0]["trace_id"] == "12345678123456781234567812345678"
@@ -45,6 +47,7 @@ def test_export_spans(exporter, mock_storage):
 
 
 def test_broadcast_callback(mock_storage):
+    mock_storage.submit_spans.return_value = None  # written synchronously
     callback = MagicMock()
     exporter = GobbySpanExporter(mock_storage, broadcast_callback=callback)
 
@@ -65,3 +68,61 @@ def test_broadcast_callback(mock_storage):
     event = callback.call_args[0][0]
     assert event["type"] == "trace_event"
     assert event["trace_id"] == "00000000000000000000000000000001"
+
+
+def _span(trace_id: int, span_id: int, parent: int | None = None, error: bool = False):
+    span = MagicMock(spec=ReadableSpan)
+    span.name = f"span-{span_id}"
+    span.context = SpanContext(trace_id=trace_id, span_id=span_id, is_remote=False)
+    span.parent = (
+        SpanContext(trace_id=trace_id, span_id=parent, is_remote=False) if parent else None
+    )
+    span.kind = SpanKind.INTERNAL
+    span.start_time = 100 * span_id
+    span.end_time = 100 * span_id + 50
+    span.status = Status(status_code=StatusCode.ERROR if error else StatusCode.OK)
+    span.attributes = {}
+    span.events = []
+    return span
+
+
+def test_broadcast_coalesced_per_trace_after_commit(mock_storage):
+    written: Future = Future()
+    mock_storage.submit_spans.return_value = written
+    callback = MagicMock()
+    exporter = GobbySpanExporter(mock_storage, broadcast_callback=callback)
+
+    exporter.export([_span(1, 1), _span(1, 2, parent=1), _span(1, 3, parent=1), _span(2, 4)])
+    callback.assert_not_called()  # not visible to readers yet
+
+    written.set_result(None)
+    events = {e["trace_id"][-1]: e for e in (c.args[0] for c in callback.call_args_list)}
+    assert sorted(events) == ["1", "2"]
+    assert events["1"]["span_count"] == 3
+    assert events["1"]["span"]["span_id"] == f"{3:016x}"
+
+
+def test_failed_write_is_not_broadcast(mock_storage):
+    written: Future = Future()
+    mock_storage.submit_spans.return_value = written
+    callback = MagicMock()
+    exporter = GobbySpanExporter(mock_storage, broadcast_callback=callback)
+
+    exporter.export([_span(1, 1)])
+    written.set_exception(RuntimeError("disk full"))
+    callback.assert_not_called()
+
+
+def test_tail_sampler_drops_ordinary_traces_and_flushes_pending(mock_storage):
+    mock_storage.submit_spans.return_value = None
+    exporter = GobbySpanExporter(mock_storage, sampler=TailSampler(sample_rate=0.0))
+
+    exporter.export([_span(1, 2, parent=1), _span(1, 1)])  # complete, ordinary: dropped
+    exporter.export([_span(2, 4, parent=3, error=True), _span(2, 3)])  # error: kept
+    exporter.export([_span(3, 6, parent=5, error=True)])  # root not ended yet
+    stored = [s["span_id"] for c in mock_storage.submit_spans.call_args_list for s in c.args[0]]
+    assert stored == [f"{4:016x}", f"{3:016x}"]
+
+    assert exporter.force_flush()
+    assert mock_storage.submit_spans.call_args.args[0][0]["span_id"] == f"{6:016x}"
+    mock_storage.flush.assert_called_once_with(30.0)
@@ -0,0 +1,291 @@
+"""Tests for DAG-parallel pipeline step scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gobby.config.pipelines import PipelineConfig
+from gobby.storage.pipelines import LocalPipelineExecutionManager
+from gobby.workflows.definitions import PipelineApproval, PipelineDefinition, PipelineStep
+from gobby.workflows.pipeline.scheduler import build_step_dependencies, run_step_graph
+from gobby.workflows.pipeline_executor import PipelineExecutor, _get_global_step_slots
+from gobby.workflows.pipeline_state import ApprovalRequired, ExecutionStatus, StepStatus
+
+if TYPE_CHECKING:
+    from gobby.storage.database import LocalDatabase
+
+pytestmark = pytest.mark.unit
+
+PROJECT_ID = "test-project"
+
+
+def _step(step_id: str, **kwargs: Any) -> PipelineStep:
+    kwargs.setdefault("exec", f"echo {step_id}")
+    return PipelineStep(id=step_id, **kwargs)
+
+
+# --- Dependency graph ---
+
+
+def test_plain_pipeline_stays_sequential() -> None:
+    deps = build_step_dependencies([_step("a"), _step("b"), _step("c")])
+    assert deps == {"a": set(), "b": {"a"}, "c": {"b"}}
+
+
+def test_parallel_group_forms_a_block() -> None:
+    deps = build_step_dependencies(
+        [
+            _step("setup"),
+            _step("lint", parallel_group="checks"),
+            _step("test", parallel_group="checks"),
+            _step("types", parallel_group="checks"),
+            _step("report"),
+        ]
+    )
+    assert deps["lint"] == deps["test"] == deps["types"] == {"setup"}
+    assert deps["report"] == {"lint", "test", "types"}
+
+
+def test_needs_and_output_references() -> None:
+    deps = build_step_dependencies(
+        [
+            _step("a", needs=[]),
+            _step("b", needs=[]),
+            _step("c", needs=["a"], prompt=None, exec="echo ${{ b.output.x }} $a.output"),
+            _step("d", needs=[], condition="steps.c.output"),
+        ]
+    )
+    assert deps == {"a": set(), "b": set(), "c": {"a", "b"}, "d": {"c"}}
+
+
+def test_references_to_later_steps_are_ignored() -> None:
+    deps = build_step_dependencies([_step("a", needs=[], exec="echo $b.output"), _step("b")])
+    assert deps["a"] == set()
+
+
+def test_unknown_needs_and_cycles_rejected_at_parse_time() -> None:
+    with pytest.raises(ValueError, match="unknown step"):
+        PipelineDefinition(name="p", steps=[_step("a", needs=["missing"])])
+
+    with pytest.raises(ValueError, match="cycle"):
+        PipelineDefinition(name="p", steps=[_step("a", needs=["b"]), _step("b", needs=["a"])])
+
+
+# --- run_step_graph ---
+
+
+@pytest.mark.asyncio
+async def test_run_step_graph_respects_deps_and_limit() -> None:
+    deps = {"a": set(), "b": set(), "c": set(), "d": {"a", "b", "c"}}
+    started: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def run(step_id: str) -> None:
+        nonlocal in_flight, peak
+        started.append(step_id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await run_step_graph(list(deps), deps, run, max_parallel=2)
+
+    assert peak == 2
+    assert started[-1] == "d"
+
+
+@pytest.mark.asyncio
+async def test_pause_blocks_only_its_branch() -> None:
+    deps = {"gate": set(), "after_gate": {"gate"}, "other": set(), "after_other": {"other"}}
+    ran: list[str] = []
+
+    async def run(step_id: str) -> None:
+        if step_id == "gate":
+            raise ApprovalRequired("pe-1", "gate", "tok", "approve?")
+        ran.append(step_id)
+
+    with pytest.raises(ApprovalRequired):
+        await run_step_graph(list(deps), deps, run, 4, pause_exceptions=(ApprovalRequired,))
+
+    assert sorted(ran) == ["after_other", "other"]
+
+
+@pytest.mark.asyncio
+async def test_failure_stops_new_steps_but_finishes_in_flight() -> None:
+    deps = {"slow": set(), "bad": set(), "next": {"bad"}}
+    finished: list[str] = []
+
+    async def run(step_id: str) -> None:
+        if step_id == "bad":
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.01)
+        finished.append(step_id)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await run_step_graph(list(deps), deps, run, 4)
+
+    assert finished == ["slow"]
+
+
+_trail: contextvars.ContextVar[tuple[str, ...]] = contextvars.ContextVar("_trail", default=())
+
+
+@pytest.mark.asyncio
+async def test_context_flows_from_dependencies_to_dependents() -> None:
+    deps = {"a": set(), "b": {"a"}, "side": set(), "c": {"b"}}
+    seen: dict[str, tuple[str, ...]] = {}
+
+    async def run(step_id: str) -> None:
+        seen[step_id] = _trail.get()
+        _trail.set((*_trail.get(), step_id))
+
+    await run_step_graph(list(deps), deps, run, 4)
+
+    assert seen == {"a": (), "b": ("a",), "side": (), "c": ("a", "b")}
+    assert _trail.get() == ()
+
+
+@pytest.mark.asyncio
+async def test_global_step_slots_follow_the_configured_limit() -> None:
+    slots = _get_global_step_slots(2)
+    assert _get_global_step_slots(2) is slots
+
+    resized = _get_global_step_slots(5)
+    assert resized is not slots
+    for _ in range(5):
+        await resized.acquire()
+    assert resized.locked()
+
+
+# --- PipelineExecutor integration ---
+
+
+@pytest.fixture
+def exec_manager(temp_db: LocalDatabase) -> LocalPipelineExecutionManager:
+    temp_db.execute(
+        """INSERT OR IGNORE INTO projects (id, name, repo_path, created_at, updated_at)
+           VALUES (?, ?, ?, datetime('now'), datetime('now'))""",
+        (PROJECT_ID, "test-project", "/tmp/test"),
+    )
+    return LocalPipelineExecutionManager(temp_db, PROJECT_ID)
+
+
+@pytest.fixture
+def executor(temp_db: LocalDatabase, exec_manager: LocalPipelineExecutionManager):
+    return PipelineExecutor(db=temp_db, execution_manager=exec_manager, llm_service=MagicMock())
+
+
+def _ci_pipeline(**step_kwargs: Any) -> PipelineDefinition:
+    return PipelineDefinition(
+        name="ci",
+        steps=[
+            _step("lint", parallel_group="checks"),
+            _step("test", parallel_group="checks", **step_kwargs),
+            _step("types", parallel_group="checks"),
+            _step("report", exec="echo $lint.output"),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_executor_runs_group_concurrently(executor, exec_manager) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def fake_exec(command: str, context: dict[str, Any]) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return {"stdout": command, "stderr": "", "exit_code": 0}
+
+    with patch("gobby.workflows.pipeline_executor.execute_exec_step", fake_exec):
+        execution = await executor.execute(_ci_pipeline(), inputs={}, project_id=PROJECT_ID)
+
+    assert execution.status == ExecutionStatus.COMPLETED
+    assert peak == 3
+    steps = {s.step_id: s for s in exec_manager.get_steps_for_execution(execution.id)}
+    assert all(s.status == StepStatus.COMPLETED for s in steps.values())
+
+
+@pytest.mark.asyncio
+async def test_executor_uses_configured_parallel_limit(temp_db, exec_manager) -> None:
+    executor = PipelineExecutor(
+        db=temp_db,
+        execution_manager=exec_manager,
+        llm_service=MagicMock(),
+        config=PipelineConfig(max_parallel_steps=1),
+    )
+    in_flight = 0
+    peak = 0
+
+    async def fake_exec(command: str, context: dict[str, Any]) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"stdout": command, "stderr": "", "exit_code": 0}
+
+    with patch("gobby.workflows.pipeline_executor.execute_exec_step", fake_exec):
+        execution = await executor.execute(_ci_pipeline(), inputs={}, project_id=PROJECT_ID)
+
+    assert execution.status == ExecutionStatus.COMPLETED
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_approval_pauses_branch_then_resumes(executor, exec_manager) -> None:
+    pipeline = _ci_pipeline(approval=PipelineApproval(required=True))
+    ran: list[str] = []
+
+    async def fake_exec(command: str, context: dict[str, Any]) -> dict[str, Any]:
+        ran.append(command)
+        return {"stdout": command, "stderr": "", "exit_code": 0}
+
+    with patch("gobby.workflows.pipeline_executor.execute_exec_step", fake_exec):
+        with pytest.raises(ApprovalRequired) as exc_info:
+            await executor.execute(pipeline, inputs={}, project_id=PROJECT_ID)
+
+        # Sibling branches ran; the join step waits on the gated branch
+        assert sorted(ran) == ["echo lint", "echo types"]
+        execution_id = exc_info.value.execution_id
+        statuses = {s.step_id: s.status for s in exec_manager.get_steps_for_execution(execution_id)}
+        assert statuses == {
+            "lint": StepStatus.COMPLETED,
+            "test": StepStatus.WAITING_APPROVAL,
+            "types": StepStatus.COMPLETED,
+        }
+
+        await executor.approval_manager.approve_step(exc_info.value.token)
+        execution = await executor.execute(
+            pipeline, inputs={}, project_id=PROJECT_ID, execution_id=execution_id
+        )
+
+    assert execution.status == ExecutionStatus.COMPLETED
+    # Completed siblings were not re-run on resume
+    assert sorted(ran) == ["echo $lint.output", "echo lint", "echo types"]
+
+
+@pytest.mark.asyncio
+async def test_executor_failure_marks_step_and_execution_failed(executor, exec_manager) -> None:
+    async def fake_exec(command: str, context: dict[str, Any]) -> dict[str, Any]:
+        code = 1 if command == "echo test" else 0
+        return {"stdout": "", "stderr": "nope", "exit_code": code}
+
+    with patch("gobby.workflows.pipeline_executor.execute_exec_step", fake_exec):
+        with pytest.raises(RuntimeError, match="'test' failed"):
+            await executor.execute(_ci_pipeline(), inputs={}, project_id=PROJECT_ID)
+
+    (execution,) = exec_manager.list_executions()
+    assert execution.status == ExecutionStatus.FAILED
+    statuses = {s.step_id: s.status for s in exec_manager.get_steps_for_execution(execution.id)}
+    assert statuses["test"] == StepStatus.FAILED
+    assert "report" not in statuses
@@ -2281,3 +2281,113 @@ class TestLoadSkillEffect:
         assert response.decision == "allow"
         assert variables["plan_mode"] is True
         assert "Plan skill content" in (response.context or "")
+
+
+class TestCompiledRuleIndex:
+    """Tests for the compiled, generation-invalidated rule index."""
+
+    @pytest.mark.asyncio
+    async def test_rules_loaded_once_across_evaluations(
+        self, db: LocalDatabase, manager: LocalWorkflowDefinitionManager
+    ) -> None:
+        """Repeated evaluations reuse the compiled index instead of re-querying."""
+        from unittest.mock import patch
+
+        _insert_rule(
+            manager,
+            "observe-rule",
+            RuleDefinitionBody(
+                event=RuleEvent.BEFORE_TOOL,
+                when="event.data.get('tool_name') == 'Bash'",
+                effects=[RuleEffect(type="set_variable", variable="seen", value=True)],
+            ),
+        )
+
+        engine = RuleEngine(db)
+        event = _make_event(HookEventType.BEFORE_TOOL, data={"tool_name": "Bash"})
+        with patch.object(
+            engine.definition_manager, "list_all", wraps=engine.definition_manager.list_all
+        ) as list_all:
+            for _ in range(3):
+                variables: dict[str, Any] = {}
+                await engine.evaluate(event, session_id="sess-1", variables=variables)
+                assert variables["seen"] is True
+
+        assert list_all.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rule_write_invalidates_index(
+        self, db: LocalDatabase, manager: LocalWorkflowDefinitionManager
+    ) -> None:
+        """Creating or toggling a rule is visible to an existing engine."""
+        engine = RuleEngine(db)
+        event = _make_event(HookEventType.BEFORE_TOOL, data={"tool_name": "Edit"})
+
+        response = await engine.evaluate(event, session_id="sess-1", variables={})
+        assert response.decision == "allow"
+
+        rule_id = _insert_rule(
+            manager,
+            "block-edit",
+            RuleDefinitionBody(
+                event=RuleEvent.BEFORE_TOOL,
+                effects=[RuleEffect(type="block", reason="no edits")],
+            ),
+        )
+        response = await engine.evaluate(event, session_id="sess-1", variables={})
+        assert response.decision == "block"
+
+        manager.update(rule_id, enabled=False)
+        response = await engine.evaluate(event, session_id="sess-1", variables={})
+        assert response.decision == "allow"
+
+    @pytest.mark.asyncio
+    async def test_enforcement_toggle_invalidates_index(
+        self, db: LocalDatabase, manager: LocalWorkflowDefinitionManager
+    ) -> None:
+        """Flipping rules.enforcement_enabled applies to an existing engine."""
+        from gobby.storage.config_store import ConfigStore
+
+        _insert_rule(
+            manager,
+            "block-edit",
+            RuleDefinitionBody(
+                event=RuleEvent.BEFORE_TOOL,
+                effects=[RuleEffect(type="block", reason="no edits")],
+            ),
+        )
+        engine = RuleEngine(db)
+        event = _make_event(HookEventType.BEFORE_TOOL, data={"tool_name": "Edit"})
+        assert (await engine.evaluate(event, session_id="s", variables={})).decision == "block"
+
+        config_store = ConfigStore(db)
+        config_store.set("rules.enforcement_enabled", False)
+        try:
+            response = await engine.evaluate(event, session_id="s", variables={})
+            assert response.decision == "allow"
+        finally:
+            config_store.set("rules.enforcement_enabled", None)
+
+    def test_conditions_are_preparsed(
+        self, db: LocalDatabase, manager: LocalWorkflowDefinitionManager
+    ) -> None:
+        """Compiling the index warms the expression AST cache."""
+        from gobby.workflows.engine.rule_index import compile_rule_index
+        from gobby.workflows.safe_evaluator import parse_expression
+
+        condition = "variables.get('compiled_index_probe') == 42"
+        _insert_rule(
+            manager,
+            "probe",
+            RuleDefinitionBody(
+                event=RuleEvent.STOP,
+                when=condition,
+                effects=[RuleEffect(type="block", reason="probe")],
+            ),
+        )
+
+        hits_before = parse_expression.cache_info().hits
+        index = compile_rule_index(db)
+        assert [row.name for row, _ in index.rules_for(RuleEvent.STOP)] == ["probe"]
+        parse_expression(condition)
+        assert parse_expression.cache_info().hits == hits_before + 1
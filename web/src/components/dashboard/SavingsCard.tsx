@@ -17,6 +17,7 @@ const CATEGORY_LABELS: Record<string, string> = {
   compression: 'Compression',
   code_index: 'Code Index',
   discovery: 'Discovery',
+  llm_cache: 'LLM Cache',
 }
 
 interface Props {